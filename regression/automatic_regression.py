@@ -50,6 +50,7 @@ modules = [
     'scripts/cnbeta/cnbeta.py',
     'scripts/concorde/concorde.py',
     'scripts/DC_10_noise/DC_10_noise.py',
+    'scripts/noise_optimization/noise_loop_comparison.py',
     'scripts/ducted_fan/ducted_fan_network.py',
     'scripts/ducted_fan/battery_ducted_fan_network.py',
     'scripts/ducted_fan/serial_hybrid_ducted_fan_network.py',
@@ -71,6 +72,7 @@ modules = [
     'scripts/motor/motor_test.py',
     'scripts/multifidelity/optimize_mf.py',
     'scripts/noise_optimization/Noise_Test.py',
+    'scripts/noise_optimization/noise_footprint.py',
     'scripts/optimization_packages/optimization_packages.py',
     'scripts/payload_range/payload_range.py',
     'scripts/plots/plot_test.py',
@@ -82,7 +84,8 @@ modules = [
     'scripts/scramjet_network/scramjet_network.py',
     'scripts/rocket_network/Rocketdyne_F1.py',
     'scripts/rocket_network/Rocketdyne_J2.py',
-    'scripts/segments/segment_test.py',
+    'scripts/segments/segment_test.py',
+    'scripts/segments/solver_jacobian_test.py',
     'scripts/slipstream/slipstream_test.py',
     'scripts/solar_network/solar_network.py',
     'scripts/solar_network/solar_low_fidelity_network.py',
@@ -99,7 +102,21 @@ modules = [
     'scripts/weights/weights.py',
     'scripts/electric_performance/propeller_single_point.py',
     'scripts/electric_performance/electric_V_h_diagram.py',
-    'scripts/electric_performance/electric_payload_range.py'
+    'scripts/electric_performance/electric_payload_range.py',
+    'scripts/benchmarks/state_benchmark.py',
+    'scripts/benchmarks/data_benchmark.py',
+    'scripts/benchmarks/frozen_conditions_benchmark.py',
+    'scripts/benchmarks/vlm_benchmark.py',
+    'scripts/benchmarks/nexus_benchmark.py',
+    'scripts/benchmarks/atmosphere_benchmark.py',
+    'scripts/benchmarks/units_benchmark.py',
+    'scripts/benchmarks/import_benchmark.py',
+    'scripts/benchmarks/training_cache_benchmark.py',
+    'scripts/benchmarks/propulsor_surrogate_benchmark.py',
+    'scripts/benchmarks/process_profiler_benchmark.py',
+    'scripts/benchmarks/wake_induced_velocity_benchmark.py',
+    'scripts/benchmarks/hierarchical_vlm_benchmark.py',
+    'scripts/benchmarks/archive_benchmark.py'
 ]
 
 # ----------------------------------------------------------------------
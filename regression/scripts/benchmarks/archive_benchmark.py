@@ -0,0 +1,145 @@
+# archive_benchmark.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" times the binary archive of mission results against the JSON archive, for a whole mission and for one leaf
+    out of many archived runs
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Data
+from SUAVE.Input_Output.SUAVE import archive, load, archive_binary, load_binary
+
+import numpy as np
+import tempfile
+import time
+import os
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    results = build_results(n_segments=6,n_points=64,n_sections=400)
+
+    with tempfile.TemporaryDirectory() as directory:
+
+        json_file       = os.path.join(directory,'results.res')
+        binary_file     = os.path.join(directory,'results.npz')
+        compressed_file = os.path.join(directory,'results_compressed.npz')
+
+        # the binary archives load the same structure as the JSON one
+        timing = Data()
+        timing.archive_json   = best_time(lambda: archive(results,json_file))
+        timing.archive_binary = best_time(lambda: archive_binary(results,binary_file))
+        timing.archive_zip    = best_time(lambda: archive_binary(results,compressed_file,compress=True))
+        timing.load_json      = best_time(lambda: load(json_file))
+        timing.load_binary    = best_time(lambda: load_binary(binary_file))
+        timing.load_zip       = best_time(lambda: load_binary(compressed_file))
+
+        reference = load(json_file)
+        for mmap_mode in ['c','r',None]:
+            compare(reference,load_binary(binary_file,mmap_mode=mmap_mode))
+        compare(reference,load_binary(compressed_file))
+
+        # the maps are copy on write, the archive stays as it was
+        mapped = load_binary(binary_file)
+        mapped.segments.segment_0.conditions.weights.total_mass[0] = 0.
+        assert load_binary(binary_file).segments.segment_0.conditions.weights.total_mass[0] != 0.
+
+        # one leaf of every segment, out of many archived runs
+        keys  = 'segments.*.conditions.weights.total_mass'
+        masses = load_binary(binary_file,keys=keys)
+        assert list(masses.keys()) == ['segments']
+        for tag, segment in masses.segments.items():
+            assert list(segment.conditions.keys()) == ['weights']
+            assert np.all(segment.conditions.weights.total_mass == results.segments[tag].conditions.weights.total_mass)
+
+        n_runs = 20
+        timing.leaf_json   = best_time(lambda: [load(json_file).segments.segment_0.conditions.weights.total_mass[-1,0] \
+                                                for i in range(n_runs)],trials=1)
+        timing.leaf_binary = best_time(lambda: [load_binary(binary_file,keys=keys).segments.segment_0.conditions.weights.total_mass[-1,0] \
+                                                for i in range(n_runs)],trials=1)
+
+        sizes = Data()
+        sizes.json       = os.path.getsize(json_file)
+        sizes.binary     = os.path.getsize(binary_file)
+        sizes.compressed = os.path.getsize(compressed_file)
+
+    print('Archive size [MB]: JSON %.1f, binary %.1f, compressed %.1f' % (sizes.json/1e6,sizes.binary/1e6,sizes.compressed/1e6))
+    print('%-40s %12s %12s %12s %12s' % ('operation','JSON [s]','binary [s]','zip [s]','speedup'))
+    print('%-40s %12.4f %12.4f %12.4f %12.1f' % ('archive',timing.archive_json,timing.archive_binary,timing.archive_zip,timing.archive_json/timing.archive_binary))
+    print('%-40s %12.4f %12.4f %12.4f %12.1f' % ('load',timing.load_json,timing.load_binary,timing.load_zip,timing.load_json/timing.load_binary))
+    print('%-40s %12.4f %12.4f %12s %12.1f' % ('total_mass of ' + str(n_runs) + ' runs',timing.leaf_json,timing.leaf_binary,'',timing.leaf_json/timing.leaf_binary))
+
+    assert sizes.binary < sizes.json
+
+    return
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+def build_results(n_segments,n_points,n_sections):
+    """ results shaped like the ones of a mission, with the sectional distributions of the VLM"""
+
+    results = Data()
+    results.segments = Data()
+
+    for i in range(n_segments):
+        segment = Data()
+        segment.tag = 'segment_' + str(i)
+
+        conditions = Data()
+        conditions.frames  = Data()
+        conditions.frames.inertial = Data()
+        conditions.frames.inertial.time            = np.linspace(0.,600.,n_points)[:,None] + 600.*i
+        conditions.frames.inertial.position_vector = np.random.rand(n_points,3)
+        conditions.weights = Data()
+        conditions.weights.total_mass              = np.linspace(79000.,78000.,n_points)[:,None] - 1000.*i
+        conditions.aerodynamics = Data()
+        conditions.aerodynamics.angle_of_attack    = np.random.rand(n_points,1)
+        conditions.aerodynamics.lift_breakdown     = Data()
+        conditions.aerodynamics.lift_breakdown.inviscid_wings_sectional = np.random.rand(n_points,n_sections)
+        conditions.aerodynamics.drag_breakdown     = Data()
+        conditions.aerodynamics.drag_breakdown.induced = Data()
+        conditions.aerodynamics.drag_breakdown.induced.wings_sectional  = np.random.rand(n_points,n_sections)
+        conditions.aerodynamics.drag_breakdown.induced.efficiency_factor = 0.85
+        segment.conditions = conditions
+
+        results.segments[segment.tag] = segment
+
+    return results
+
+def compare(reference,data):
+
+    assert type(reference) == type(data)
+    if isinstance(reference,np.ndarray):
+        assert reference.shape == data.shape and reference.dtype == data.dtype
+        assert np.all(reference == data)
+    elif hasattr(reference,'keys'):
+        assert list(reference.keys()) == list(data.keys())
+        for key in reference.keys():
+            compare(reference[key],data[key])
+    else:
+        assert reference == data
+
+    return
+
+def best_time(function,trials=3):
+
+    timing = np.inf
+    for trial in range(trials):
+        tic = time.perf_counter()
+        function()
+        timing = min(timing,time.perf_counter() - tic)
+
+    return timing
+
+if __name__ == '__main__':
+    main()
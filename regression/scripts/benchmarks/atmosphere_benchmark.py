@@ -0,0 +1,133 @@
+# atmosphere_benchmark.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" times the US Standard 1976 atmosphere for 16, 1,000 and 1,000,000 altitudes with the loop over the breaks,
+    the layer lookup and the lookup table"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units
+from SUAVE.Core.Arrays import atleast_2d_col
+
+import numpy as np
+import time
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    atmosphere = SUAVE.Analyses.Atmospheric.US_Standard_1976()
+    tabulated  = SUAVE.Analyses.Atmospheric.US_Standard_1976()
+    tabulated.tabulated = True
+
+    # the breaks themselves, and the altitudes on both sides of them
+    z_breaks = atmosphere.breaks.altitude*(1 + atmosphere.breaks.altitude/atmosphere.planet.mean_radius)
+    z_check  = np.hstack([z_breaks,z_breaks[1:-1]*(1.+1e-9),z_breaks[1:-1]*(1.-1e-9),np.linspace(-1.99,84.,10001)*Units.km])
+
+    # the layer lookup matches the loop over the breaks
+    for delta_isa in [0.,15.]:
+        data      = atmosphere.compute_values(z_check,delta_isa)
+        reference = loop_values(atmosphere,z_check,delta_isa)
+        for key in ['pressure','temperature','density','speed_of_sound','dynamic_viscosity']:
+            assert np.all(data[key] == reference[key])
+
+    # the table is within its tolerance
+    reference = loop_values(atmosphere,z_check)
+    data      = tabulated.compute_values(z_check)
+    p_err     = np.max(np.abs(data.pressure/reference.pressure - 1.))
+    T_err     = np.max(np.abs(data.temperature/reference.temperature - 1.))
+    print('Table of ' + str(len(tabulated.table.altitude)) + ' altitudes, pressure error ' + str(p_err) + ', temperature error ' + str(T_err))
+    assert p_err < 2.*tabulated.table_tolerance
+    assert T_err < 1e-12
+
+    # the table and the layers follow the tolerance and the breaks
+    n_nodes = len(tabulated.table.altitude)
+    tabulated.table_tolerance = 1e-6
+    tabulated.compute_values(z_check)
+    assert len(tabulated.table.altitude) < n_nodes
+    tabulated.table_tolerance = 1e-8
+    for model in [atmosphere,tabulated]:
+        model.breaks.temperature[1] += 10.
+        data      = model.compute_values(0.)
+        reference = loop_values(model,0.)
+        model.breaks.temperature[1] -= 10.
+        assert np.isclose(data.temperature[0,0],reference.temperature[0,0],rtol=1e-12)
+        assert data.temperature[0,0] > model.compute_values(0.).temperature[0,0] + 1.
+    assert len(tabulated.compute_values(z_check).pressure) == len(z_check)
+    assert len(tabulated.table.altitude) == n_nodes
+
+    # timing
+    print('Computing the atmosphere [milliseconds]')
+    print('%-12s %12s %12s %12s' % ('altitudes','loop','layers','table'))
+    for n in [16,1000,1000000]:
+        z       = np.linspace(0.,80.,n)*Units.km
+        repeats = max(1,int(10000/n))
+        times   = []
+        for function in [lambda z: loop_values(atmosphere,z),atmosphere.compute_values,tabulated.compute_values]:
+            tic = time.perf_counter()
+            for i in range(repeats):
+                function(z)
+            times.append((time.perf_counter() - tic)/repeats*1e3)
+        print('%-12i %12.3f %12.3f %12.3f' % (n,times[0],times[1],times[2]))
+
+    return
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+def loop_values(atmosphere,altitude,temperature_deviation=0.0,var_gamma=False):
+    """ the previous compute_values of the US Standard 1976 atmosphere, a loop over the breaks """
+
+    zs        = atleast_2d_col(altitude)
+    gas       = atmosphere.fluid_properties
+    grav      = atmosphere.planet.sea_level_gravity
+    Rad       = atmosphere.planet.mean_radius
+    R         = gas.gas_specific_constant
+    delta_isa = temperature_deviation
+    breaks    = atmosphere.breaks
+
+    zs = zs/(1 + zs/Rad)
+    zs[zs < breaks.altitude[0]]  = breaks.altitude[0]
+    zs[zs > breaks.altitude[-1]] = breaks.altitude[-1]
+
+    zeros = np.zeros_like(zs)
+    p     = zeros * 0.0
+    z0    = zeros * 0.0
+    T0    = zeros * 0.0
+    p0    = zeros * 0.0
+    alpha = zeros * 0.0
+
+    for i in range( len(breaks.altitude)-1 ):
+        i_inside = (zs >= breaks.altitude[i]) & (zs <= breaks.altitude[i+1])
+        z0[ i_inside ]    = breaks.altitude[i]
+        T0[ i_inside ]    = breaks.temperature[i]
+        p0[ i_inside ]    = breaks.pressure[i]
+        alpha[ i_inside ] = -(breaks.temperature[i+1] - breaks.temperature[i])/ \
+                             (breaks.altitude[i+1]    - breaks.altitude[i])
+
+    dz = zs-z0
+    i_isoth = (alpha == 0.)
+    i_adiab = (alpha != 0.)
+    p[i_isoth] = p0[i_isoth] * np.exp(-1.*dz[i_isoth]*grav/(R*T0[i_isoth]))
+    p[i_adiab] = p0[i_adiab] * ( (1.-alpha[i_adiab]*dz[i_adiab]/T0[i_adiab]) **(1.*grav/(alpha[i_adiab]*R)) )
+
+    T = T0 - dz*alpha + delta_isa
+
+    atmo_data = SUAVE.Analyses.Mission.Segments.Conditions.Conditions()
+    atmo_data.pressure          = p
+    atmo_data.temperature       = T
+    atmo_data.density           = gas.compute_density(T,p)
+    atmo_data.speed_of_sound    = gas.compute_speed_of_sound(T,p,var_gamma)
+    atmo_data.dynamic_viscosity = gas.compute_absolute_viscosity(T)
+
+    return atmo_data
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,150 @@
+# data_benchmark.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" times attribute get and set on Data against the exception based access it replaced"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Data
+from SUAVE.Analyses.Mission.Segments.Conditions import Conditions
+
+import numpy as np
+import time
+
+dictgetitem  = dict.__getitem__
+objgetattrib = object.__getattribute__
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    # the access has to behave the same as before
+    for klass in [Data,Conditions]:
+        new = build(klass)
+        old = build(type('Reference_' + klass.__name__,(Reference,klass),{}))
+        compare(new,old)
+
+    timing_new = time_access(build(Conditions))
+    timing_old = time_access(build(type('Reference_Conditions',(Reference,Conditions),{})))
+
+    print('Attribute access [nanoseconds per operation]')
+    print('%-12s %12s %12s %12s' % ('operation','exception','fast path','speedup'))
+    for key in timing_new.keys():
+        print('%-12s %12.1f %12.1f %12.2f' % (key,timing_old[key],timing_new[key],timing_old[key]/timing_new[key]))
+
+    return
+
+# ----------------------------------------------------------------------
+#   Reference
+# ----------------------------------------------------------------------
+
+class Reference(Data):
+    """ The attribute access of Data before the fast path, for comparison"""
+
+    def __getattribute__(self, k):
+        try:
+            return dictgetitem(self,k)
+        except:
+            return objgetattrib(self,k)
+
+    def __setattr__(self, k, v):
+        try:
+            objgetattrib(self, k)
+        except:
+            self[k] = v
+        else:
+            object.__setattr__(self, k, v)
+
+    def __delattr__(self, k):
+        try:
+            objgetattrib(self, k)
+        except:
+            del self[k]
+        else:
+            object.__delattr__(self, k)
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+def build(klass):
+
+    data = klass()
+    data.tag = 'data'
+    data.a   = np.ones((4,1))
+    data.b   = klass()
+    data.b.c = 1.
+    return data
+
+def compare(new,old):
+
+    # keys
+    assert new.a is not None and np.all(new.a == old.a)
+    assert new.b.c == old.b.c
+
+    # methods and class attributes
+    assert new.pack_array().tolist() == old.pack_array().tolist()
+    assert new.__class__ is not old.__class__
+    assert type(new.keys) is type(old.keys)
+
+    # new keys end up in the dict
+    new.d = 2.
+    old.d = 2.
+    assert new['d'] == old['d']
+
+    # a key can shadow a method for get
+    new['typestring'] = 3.
+    old['typestring'] = 3.
+    assert new.typestring == old.typestring
+
+    # deleting keys and missing attributes
+    del new.d
+    del old.d
+    assert 'd' not in new and 'd' not in old
+    for data in [new,old]:
+        try:
+            data.not_there
+        except AttributeError:
+            pass
+        else:
+            raise AssertionError('missing attribute did not raise')
+
+    return
+
+def time_access(data,repeats=200000,trials=3):
+
+    timing = Data(get_key=np.inf,get_method=np.inf,set_key=np.inf,set_new=np.inf)
+
+    # best of a few trials, to keep other processes out of the numbers
+    for trial in range(trials):
+        tic = time.perf_counter()
+        for i in range(repeats):
+            data.a
+        timing.get_key = min(timing.get_key,(time.perf_counter() - tic)/repeats*1e9)
+
+        tic = time.perf_counter()
+        for i in range(repeats):
+            data.pack_array
+        timing.get_method = min(timing.get_method,(time.perf_counter() - tic)/repeats*1e9)
+
+        tic = time.perf_counter()
+        for i in range(repeats):
+            data.a = None
+        timing.set_key = min(timing.set_key,(time.perf_counter() - tic)/repeats*1e9)
+
+        tic = time.perf_counter()
+        for i in range(repeats):
+            data.e = None
+            del data['e']
+        timing.set_new = min(timing.set_new,(time.perf_counter() - tic)/repeats*1e9)
+
+    return timing
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+# frozen_conditions_benchmark.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" times the B737 regression mission with and without frozen conditions while solving, and checks the conditions
+    are regular Data again after the solve"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units, Data
+from SUAVE.Analyses.Mission.Segments.Conditions import Conditions
+
+import numpy as np
+import time
+
+import sys
+sys.path.append('../Vehicles')
+sys.path.append('../B737')
+
+import mission_B737
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    configs, analyses = mission_B737.full_setup()
+    mission_B737.simple_sizing(configs, analyses)
+    configs.finalize()
+    analyses.finalize()
+    mission = analyses.missions.base
+
+    # regular conditions
+    results = mission.evaluate()
+    truth   = Data()
+    for segment in results.segments:
+        truth[segment.tag] = Data(keys     = list(segment.conditions.keys()),
+                                  throttle = segment.conditions.propulsion.throttle.copy(),
+                                  mass     = segment.conditions.weights.total_mass.copy())
+    timing_default = time_access(mission)
+
+    # frozen conditions
+    for segment in mission.segments:
+        segment.state.numerics.freeze_conditions = True
+    results = mission.evaluate()
+    timing_frozen = time_access(mission)
+
+    print('Reading and writing the conditions [microseconds]')
+    print('%-12s %12s %12s' % ('segment','default','frozen'))
+    for tag in timing_default.keys():
+        print('%-12s %12.2f %12.2f' % (tag,timing_default[tag],timing_frozen[tag]))
+
+    # the conditions are regular Data again after the solve, with the same answer
+    for segment in results.segments:
+        assert segment.converged
+        assert type(segment.state.conditions) is Conditions
+        assert segment.conditions is segment.state.conditions
+        assert list(segment.conditions.keys()) == truth[segment.tag]['keys']
+
+        error_throttle = np.max(np.abs(segment.conditions.propulsion.throttle - truth[segment.tag].throttle))
+        error_mass     = np.max(np.abs((segment.conditions.weights.total_mass - truth[segment.tag].mass)/truth[segment.tag].mass))
+        print(segment.tag + ' throttle error: ' + str(error_throttle) + ', mass error: ' + str(error_mass))
+        assert error_throttle < 1e-6
+        assert error_mass     < 1e-6
+
+    # a solver that raises after the conditions are frozen still leaves them as regular Data
+    segment = mission.segments[0]
+    segment.settings.root_finder = failing_root_finder
+    try:
+        mission.evaluate()
+    except RuntimeError:
+        pass
+    else:
+        raise AssertionError('the root finder did not raise')
+    assert type(segment.state.conditions) is Conditions
+    assert segment.conditions is segment.state.conditions
+
+    return
+
+def failing_root_finder(iterate,unknowns,args,**options):
+    """ iterates once, which freezes the conditions, and fails"""
+
+    iterate(unknowns,args)
+
+    raise RuntimeError('root finder failure')
+
+# ----------------------------------------------------------------------
+#   Timing
+# ----------------------------------------------------------------------
+
+def time_access(mission,repeats=20000):
+    """ the kind of reads and writes the segment update functions do every iteration"""
+
+    timing = Data()
+    for segment in mission.segments:
+        frozen     = segment.state.numerics.freeze_conditions
+        conditions = segment.state.conditions.freeze() if frozen else segment.state.conditions
+
+        tic = time.perf_counter()
+        for i in range(repeats):
+            v     = conditions.frames.inertial.velocity_vector
+            alt   = conditions.freestream.altitude
+            aoa   = conditions.aerodynamics.angle_of_attack
+            conditions.aerodynamics.angle_of_attack = aoa
+            conditions.frames.inertial.velocity_vector = v
+            conditions.freestream.altitude = alt
+        timing[segment.tag] = (time.perf_counter() - tic)/repeats*1e6
+
+        if frozen:
+            conditions.unfreeze()
+
+    return timing
+
+if __name__ == '__main__':
+    main()
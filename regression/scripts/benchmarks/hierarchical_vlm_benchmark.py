@@ -0,0 +1,108 @@
+# hierarchical_vlm_benchmark.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" measures the time and memory of the iterative vortex lattice solve with the tree of horseshoe vortices against
+    the dense influence matrices on the B737 as the lattice grows, and checks that both give the same coefficients"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+from SUAVE.Core import Units, Data
+from SUAVE.Analyses.Aerodynamics.Vortex_Lattice import Vortex_Lattice
+from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.VLM import VLM
+from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.hierarchical_vortex_lattice import get_hierarchical_influence
+
+import numpy as np
+import time
+import tracemalloc
+
+import sys
+sys.path.append('../Vehicles')
+
+from Boeing_737 import vehicle_setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    vehicle    = vehicle_setup()
+    conditions = setup_conditions()
+
+    # the tree without far groups is the dense lattice solved iteratively, on a lattice that spans several
+    # blocks of the preconditioner so that the iterations are not a direct solve
+    truth    = VLM(conditions,setup_settings(20,6,None),vehicle)
+    settings = setup_settings(20,6,0,0.)
+    results  = VLM(conditions,settings,vehicle)
+    assert len(get_hierarchical_influence(vehicle.vortex_distribution,settings,0.3).blocks) > 1
+    for i, name in enumerate(['CL','CDi','CM']):
+        error = np.max(np.abs(results[i] - truth[i]))/np.max(np.abs(truth[i]))
+        print(name + ' relative error without far groups: ' + str(error))
+        assert error < 1e-6
+
+    # time, memory and error by size, the dense matrices only for the sizes that fit
+    print('Vortex lattice of the B737, ' + str(len(conditions.freestream.mach_number)) + ' conditions')
+    print('%8s %12s %12s %12s %12s %12s' % ('panels','dense [s]','[MB]','tree [s]','[MB]','CL error'))
+    for n_sw, n_cw in [(20,6),(40,10),(60,12)]:
+        if n_sw <= 40:
+            time_dense, peak_dense, truth = measure(conditions,setup_settings(n_sw,n_cw,None),vehicle)
+        else:
+            time_dense, peak_dense, truth = np.nan, np.nan, None
+        time_tree, peak_tree, results = measure(conditions,setup_settings(n_sw,n_cw,0),vehicle)
+
+        error = np.nan
+        if truth is not None:
+            error = np.max(np.abs(results[0] - truth[0]))/np.max(np.abs(truth[0]))
+            assert error < 1e-3
+            assert peak_tree < peak_dense
+        print('%8i %12.3f %12.1f %12.3f %12.1f %12.2e' % (vehicle.vortex_distribution.n_cp,time_dense,peak_dense/1e6,
+                                                        time_tree,peak_tree/1e6,error))
+
+    return
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+def setup_settings(n_sw,n_cw,threshold,opening_angle=0.2):
+
+    settings = Vortex_Lattice().settings
+    settings.number_spanwise_vortices  = n_sw
+    settings.number_chordwise_vortices = n_cw
+    settings.propeller_wake_model      = False
+    settings.cache_influence_matrices  = False
+    settings.iterative_solve_threshold = threshold
+    settings.tree_opening_angle        = opening_angle
+
+    return settings
+
+def setup_conditions():
+
+    AoA  = np.array([[-2.],[4.],[8.]])*Units.deg
+    Mach = np.array([[0.3],[0.3],[0.7]])
+
+    conditions                              = Data()
+    conditions.aerodynamics                 = Data()
+    conditions.freestream                   = Data()
+    conditions.aerodynamics.angle_of_attack = AoA
+    conditions.freestream.mach_number       = Mach
+    conditions.freestream.velocity          = np.zeros_like(Mach)
+
+    return conditions
+
+def measure(conditions,settings,vehicle):
+
+    tracemalloc.start()
+    tic     = time.perf_counter()
+    results = VLM(conditions,settings,vehicle)
+    toc     = time.perf_counter() - tic
+    peak    = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return toc, peak, results
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+# import_benchmark.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" times importing SUAVE in fresh processes, and checks that the packages are only imported when they are used"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+import subprocess
+import sys
+import os
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    # import SUAVE on its own does not import any of the packages
+    modules = imported_modules('import SUAVE')
+    assert modules == ['SUAVE']
+
+    # a vehicle does not need the plotting and surrogate packages
+    modules = imported_modules('import SUAVE; SUAVE.Vehicle()')
+    assert 'SUAVE.Components' in modules
+    assert not 'SUAVE.Plots' in modules
+    assert not 'SUAVE.Optimization' in modules
+    assert not 'matplotlib' in modules
+    assert not 'sklearn' in modules
+
+    # the packages still load on first access
+    modules = imported_modules('import SUAVE; SUAVE.Plots; SUAVE.Optimization.Nexus()')
+    assert 'SUAVE.Plots' in modules
+    assert 'SUAVE.Optimization' in modules
+
+    # timing, the fastest of a few fresh processes
+    statements = ['import SUAVE',
+                  'import SUAVE; SUAVE.Vehicle()',
+                  'import SUAVE; from SUAVE.Core import Units; Units.ft',
+                  'import SUAVE; SUAVE.Vehicle(); SUAVE.Plots; SUAVE.Optimization']
+    print('Importing SUAVE in a fresh process [milliseconds]')
+    for statement in statements:
+        times = [import_time(statement) for i in range(3)]
+        print('%-70s %10.1f' % (statement,np.min(times)))
+
+    return
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+def run(code):
+    """ runs code in a fresh python process with the same path as this one, returns its output """
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(sys.path)
+    return subprocess.check_output([sys.executable,'-c',code],env=env).decode()
+
+def imported_modules(statement):
+    """ the SUAVE packages and the heavy third party packages imported by a statement """
+    code = statement + '\nimport sys\nprint(" ".join(sys.modules))'
+    modules = run(code).split()
+    return [m for m in modules if m.count('.') <= 1 and (m.startswith('SUAVE') or m in ['matplotlib','sklearn'])]
+
+def import_time(statement):
+    """ the time to run a statement in a fresh process, without the interpreter startup """
+    code = 'import time\ntic = time.perf_counter()\n' + statement + '\nprint((time.perf_counter() - tic)*1e3)'
+    return float(run(code).split()[-1])
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,140 @@
+# nexus_benchmark.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" times setting the inputs and retrieving the constraints of a nexus with hundreds of constraints, with the
+    compiled aliases against matching names and eval on every call"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units, Data
+from SUAVE.Optimization import Nexus
+from SUAVE.Optimization import helper_functions as help_fun
+
+import numpy as np
+import time
+from copy import deepcopy
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    nexus   = setup()
+    problem = nexus.optimization_problem
+    aliases = problem.aliases
+    inputs  = problem.inputs
+    const   = problem.constraints
+    x       = np.linspace(1.,2.,len(inputs))
+
+    # the inputs land in the same places, wildcards included
+    nexus.unpack_inputs(x)
+    compiled_inputs = input_values(nexus)
+    help_fun.set_values(nexus,inputs,help_fun.convert_values(inputs)*2.,aliases)
+    help_fun.set_values(nexus,inputs,help_fun.convert_values(inputs),aliases)
+    assert input_values(nexus) == compiled_inputs
+    for config in nexus.vehicle_configurations:
+        assert config.wings.main_wing.origin[0][0] == x[-1]
+        assert config.wings.main_wing.areas.reference == x[0]
+
+    # and the same values come back
+    values          = help_fun.get_values(nexus,const,aliases)
+    compiled_values = help_fun.get_compiled_values(nexus,nexus.compile_aliases(const))
+    assert np.all(values == compiled_values)
+
+    # a configuration added later is set through the wildcards too
+    config     = deepcopy(nexus.vehicle_configurations.base)
+    config.tag = 'takeoff'
+    config.wings.main_wing.areas.reference = 0.
+    nexus.vehicle_configurations.append(config)
+    nexus.unpack_inputs(2.*x)
+    for config in nexus.vehicle_configurations:
+        assert config.wings.main_wing.areas.reference == 2.*x[0]
+        assert config.wings.main_wing.origin[0][0] == 2.*x[-1]
+    nexus.vehicle_configurations.pop('takeoff')
+    nexus.unpack_inputs(x)
+    assert input_values(nexus) == compiled_inputs
+
+    # timing
+    repeats = 20
+    tic = time.perf_counter()
+    for i in range(repeats):
+        converted = help_fun.convert_values(help_fun.scale_input_values(inputs,x))
+        help_fun.set_values(nexus,inputs,converted,aliases)
+        help_fun.get_values(nexus,const,aliases)
+    time_eval = (time.perf_counter() - tic)/repeats*1e3
+
+    tic = time.perf_counter()
+    for i in range(repeats):
+        nexus.unpack_inputs(x)
+        help_fun.get_compiled_values(nexus,nexus.compile_aliases(const))
+    time_compiled = (time.perf_counter() - tic)/repeats*1e3
+
+    print('Setting ' + str(len(inputs)) + ' inputs and retrieving ' + str(len(const)) + ' constraints [milliseconds]')
+    print('%-12s %12.3f' % ('eval',time_eval))
+    print('%-12s %12.3f' % ('compiled',time_compiled))
+
+    return
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+def setup(number_of_constraints=500,number_of_inputs=20):
+
+    nexus   = Nexus()
+    problem = Data()
+    nexus.optimization_problem = problem
+
+    # three configurations for the wildcards
+    vehicle = SUAVE.Vehicle()
+    wing    = SUAVE.Components.Wings.Main_Wing()
+    wing.tag = 'main_wing'
+    vehicle.append_component(wing)
+    configs = SUAVE.Components.Configs.Config.Container()
+    for tag in ['base','cruise','landing']:
+        config     = SUAVE.Components.Configs.Config(vehicle)
+        config.tag = tag
+        configs.append(config)
+    nexus.vehicle_configurations = configs
+
+    inputs  = []
+    aliases = []
+    for ii in range(number_of_inputs):
+        inputs.append([ 'x' + str(ii), 1., (0.,10.), 1., 1*Units.less])
+        aliases.append([ 'x' + str(ii), 'summary.inputs.x' + str(ii) ])
+    aliases[0]  = [ 'x0', 'vehicle_configurations.*.wings.main_wing.areas.reference' ]
+    aliases[-1] = [ 'x' + str(number_of_inputs-1), [ 'vehicle_configurations.*.wings.main_wing.origin[0][0]',
+                                                     'summary.inputs.x' + str(number_of_inputs-1) ] ]
+    problem.inputs = np.array(inputs,dtype=object)
+
+    constraints = []
+    nexus.summary.inputs = Data()
+    for ii in range(number_of_constraints):
+        constraints.append([ 'c' + str(ii), '<', 1., 1., 1*Units.less])
+        aliases.append([ 'c' + str(ii), 'summary.c' + str(ii) ])
+        nexus.summary['c' + str(ii)] = float(ii)
+    constraints[0] = [ 'span', '>', 1., 1., 1*Units.less]
+    aliases.append([ 'span', 'vehicle_configurations.base.wings.main_wing.origin[0][0]' ])
+    problem.constraints = np.array(constraints,dtype=object)
+    problem.objective   = np.array([[ 'c1', 1., 1*Units.less]],dtype=object)
+    problem.aliases     = aliases
+
+    return nexus
+
+def input_values(nexus):
+
+    values = []
+    for config in nexus.vehicle_configurations:
+        values.append(config.wings.main_wing.areas.reference)
+        values.append(config.wings.main_wing.origin[0][0])
+    values.extend(list(nexus.summary.inputs.values()))
+
+    return values
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,137 @@
+# process_profiler_benchmark.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" profiles the processes of the B737 regression mission, and times the mission with and without the profiler"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Analyses import Process, Process_Profiler
+
+import numpy as np
+import tracemalloc
+import contextlib
+import tempfile
+import io
+import json
+import time
+import os
+
+import sys
+sys.path.append('../Vehicles')
+sys.path.append('../B737')
+
+import mission_B737
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    configs, analyses = mission_B737.full_setup()
+    mission_B737.simple_sizing(configs, analyses)
+    configs.finalize()
+    analyses.finalize()
+    mission = analyses.missions.base
+
+    # the first evaluation also sets up the segments
+    mission.evaluate()
+
+    tic = time.perf_counter()
+    mission.evaluate()
+    time_default = time.perf_counter() - tic
+
+    profiler = Process_Profiler()
+    tic = time.perf_counter()
+    with profiler:
+        results = mission.evaluate()
+    time_profiled = time.perf_counter() - tic
+
+    memory_profiler = Process_Profiler(track_memory=True)
+    tic = time.perf_counter()
+    with memory_profiler:
+        mission.evaluate()
+    time_memory = time.perf_counter() - tic
+
+    print(memory_profiler.summary(20))
+    print('\nMission time [s]')
+    print('%-28s %8.3f' % ('without the profiler',time_default))
+    print('%-28s %8.3f' % ('with the profiler',time_profiled))
+    print('%-28s %8.3f' % ('with the memory tracked',time_memory))
+
+    # the profiler is only used while it is started
+    assert Process.profiler is None
+
+    # the whole mission is one path, and the steps of a segment are under the segment
+    records = profiler.results()
+    assert records[0]['path'] == 'the_mission.process'
+    assert 0. < records[0]['cumulative_time'] <= time_profiled
+    assert all([0. <= record['self_time'] <= record['cumulative_time'] for record in records])
+    cruise  = [record for record in records if record['path'].endswith('converge_root.cruise.process.iterate.conditions.aerodynamics')]
+    assert len(cruise) == 1
+    assert cruise[0]['calls'] > 1
+    assert memory_profiler.results()[0]['allocated'] > 0
+
+    # the self times add up to the cumulative time of the mission
+    total_self = np.sum([record['self_time'] for record in records])
+    assert abs(total_self - records[0]['cumulative_time']) < 1e-6*records[0]['cumulative_time'] + 1e-9*len(records)
+
+    # the time of every step is the time of the aerodynamics of all the segments and iterations
+    totals = profiler.step_totals()
+    print('\nStep       calls  cumulative [s]')
+    for step in ['aerodynamics','propulsion','stability','weights','differentials']:
+        print('%-12s %6i %14.4f' % (step,totals[step]['calls'],totals[step]['cumulative_time']))
+    aerodynamics = [record for record in records if record['path'].endswith('iterate.conditions.aerodynamics')]
+    assert totals['aerodynamics']['calls'] == np.sum([record['calls'] for record in aerodynamics])
+
+    # JSON and collapsed stacks
+    handle,filename = tempfile.mkstemp()
+    os.close(handle)
+    profiler.write_json(filename)
+    with open(filename) as f:
+        assert json.load(f) == records
+    profiler.write_stacks(filename)
+    with open(filename) as f:
+        stacks = [line.rsplit(' ',1) for line in f.read().splitlines()]
+    os.remove(filename)
+    paths = [stack[0] for stack in stacks]
+    assert 'the_mission.process' in paths
+    assert 'the_mission.process;converge;cruise.process' in paths
+    assert abs(np.sum([int(stack[1]) for stack in stacks])*1e-6 - total_self) < 1e-6*len(stacks)
+
+    # tracing that was started before the profiler is left running
+    tracemalloc.start()
+    with Process_Profiler(track_memory=True):
+        mission.evaluate()
+    assert tracemalloc.is_tracing()
+    tracemalloc.stop()
+
+    # the verbose printout is the same with the profiler
+    process = Process()
+    process.verbose = True
+    process.first   = lambda x: x
+    process.second  = lambda x: x
+    printouts = []
+    for profiled in [False,True]:
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            if profiled:
+                with Process_Profiler():
+                    process(1.)
+            else:
+                process(1.)
+        printouts.append(output.getvalue())
+    assert printouts[1] == printouts[0] != ''
+
+    # the answer is the same
+    for segment in results.segments:
+        assert segment.converged
+
+    return
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,120 @@
+# propulsor_surrogate_benchmark.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" times evaluating the engine deck surrogate of a Propulsor_Surrogate on gridded decks of a growing size, with the
+    gaussian process and with the grid interpolation, and checks the thrust against the model of the deck"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Components.Energy.Networks.Propulsor_Surrogate import Propulsor_Surrogate
+from SUAVE.Core import Data
+
+import numpy as np
+import tempfile
+import time
+import os
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    # the conditions of a mission segment
+    n     = 64
+    state = Data()
+    state.conditions = Data()
+    state.conditions.freestream = Data()
+    state.conditions.propulsion = Data()
+    state.conditions.freestream.altitude    = np.linspace(0.,10000.,n)[:,None]
+    state.conditions.freestream.mach_number = np.linspace(0.2,0.8,n)[:,None]
+    state.conditions.propulsion.throttle    = np.linspace(0.3,1.,n)[:,None]
+
+    print('Evaluating the thrust at ' + str(n) + ' points [milliseconds]')
+    print('%-12s %12s %12s %12s' % ('deck size','gaussian','grid','grid_cubic'))
+    errors = Data()
+    for points in [4,8,16,32]:
+        filename = write_deck(points)
+        row      = []
+        error    = []
+        for surrogate_type in ['gaussian','grid','grid_cubic']:
+            if surrogate_type == 'gaussian' and points > 8:
+                row.append(np.nan)
+                error.append(np.nan)
+                continue
+            propulsion = Propulsor_Surrogate()
+            propulsion.input_file        = filename
+            propulsion.number_of_engines = 2.
+            propulsion.surrogate_type    = surrogate_type
+            propulsion.build_surrogate()
+            row.append(evaluation_time(propulsion,state))
+            error.append(thrust_error(propulsion,state))
+        os.remove(filename)
+        errors[str(points)] = error
+        print('%-12i %12.3f %12.3f %12.3f' % (points**3,row[0],row[1],row[2]))
+
+    print('Largest relative error of the thrust')
+    print('%-12s %12s %12s %12s' % ('deck size','gaussian','grid','grid_cubic'))
+    for points in [4,8,16,32]:
+        error = errors[str(points)]
+        print('%-12i %12.2e %12.2e %12.2e' % (points**3,error[0],error[1],error[2]))
+
+    # every surrogate follows the deck, and the grid interpolation converges with the size of the deck
+    for error in errors.values():
+        assert np.nanmax(error) < 0.03
+    for i in [1,2]:
+        assert errors['32'][i] < errors['16'][i] < errors['8'][i] < errors['4'][i]
+        assert errors['32'][i] < 5e-4
+
+    return
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+def write_deck(points):
+    """ writes a deck on a full altitude, Mach and throttle grid to a temporary file """
+
+    altitudes = np.linspace(0.,12000.,points)
+    machs     = np.linspace(0.,0.9,points)
+    throttles = np.linspace(0.,1.,points)
+    alt,mach,eta = [x.ravel() for x in np.meshgrid(altitudes,machs,throttles,indexing='ij')]
+    thrust    = (5000. + 15000.*eta)*np.exp(-alt/9000.)*(1. - 0.3*mach*mach)
+    sfc       = 1.4e-5 + 0.2e-5*mach + 0.1e-5*eta*eta
+    deck      = np.vstack([alt,mach,eta,thrust,sfc]).T
+
+    handle,filename = tempfile.mkstemp(suffix='.csv')
+    os.close(handle)
+    np.savetxt(filename,deck,delimiter=',',header='Altitude(m),Mach,Throttle,Thrust(N),SFC(kg/N/s)',comments='')
+
+    return filename
+
+def thrust_error(propulsion,state):
+    """ the largest relative error of the thrust against the model the deck was written from """
+
+    alt  = state.conditions.freestream.altitude
+    mach = state.conditions.freestream.mach_number
+    eta  = state.conditions.propulsion.throttle
+    F    = propulsion.number_of_engines*(5000. + 15000.*eta)*np.exp(-alt/9000.)*(1. - 0.3*mach*mach)
+
+    results = propulsion.evaluate_thrust(state)
+
+    return np.max(np.abs(results.thrust_force_vector[:,0:1]/F - 1.))
+
+def evaluation_time(propulsion,state):
+    """ the fastest of a few evaluations of the thrust """
+
+    times = []
+    for i in range(20):
+        tic = time.perf_counter()
+        propulsion.evaluate_thrust(state)
+        times.append((time.perf_counter() - tic)*1e3)
+
+    return np.min(times)
+
+if __name__ == '__main__':
+    main()
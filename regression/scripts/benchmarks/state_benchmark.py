@@ -0,0 +1,170 @@
+# state_benchmark.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" times the state bookkeeping of the B737 regression mission, with and without the contiguous state buffer"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units, Data
+from SUAVE.Methods.Missions.Segments import expand_state
+from SUAVE.Analyses.Mission.Segments.Conditions import Conditions
+from SUAVE.Analyses.Mission.Segments.Segment import Segment, Container
+
+import numpy as np
+import time
+
+import sys
+sys.path.append('../Vehicles')
+sys.path.append('../B737')
+
+import mission_B737
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    configs, analyses = mission_B737.full_setup()
+    mission_B737.simple_sizing(configs, analyses)
+    configs.finalize()
+    analyses.finalize()
+    mission = analyses.missions.base
+
+    # default storage
+    results = mission.evaluate()
+    throttle_truth = [segment.conditions.propulsion.throttle.copy() for segment in results.segments]
+    timing_default = time_bookkeeping(mission)
+
+    # contiguous storage
+    for segment in mission.segments:
+        segment.state.numerics.contiguous_state = True
+    results = mission.evaluate()
+    timing_contiguous = time_bookkeeping(mission)
+
+    print('Per iteration state bookkeeping [microseconds]')
+    print('%-12s %12s %12s %12s %12s' % ('segment','unpack','unpack cont.','pack','pack cont.'))
+    for tag in timing_default.keys():
+        a = timing_default[tag]
+        b = timing_contiguous[tag]
+        print('%-12s %12.2f %12.2f %12.2f %12.2f' % (tag,a.unpack,b.unpack,a.pack,b.pack))
+    print('expand_state, whole mission [microseconds]: %.2f default, %.2f contiguous' % \
+          (sum([t.expand for t in timing_default.values()]),sum([t.expand for t in timing_contiguous.values()])))
+
+    # the storage must not change the solution
+    for segment, truth in zip(results.segments, throttle_truth):
+        assert segment.converged
+        error = np.max(np.abs(segment.conditions.propulsion.throttle - truth))
+        print(segment.tag + ' throttle error: ' + str(error))
+        assert error < 1e-6
+
+    contiguous_run_check()
+    merged_state_check()
+
+    return
+
+def contiguous_run_check():
+    """ the contiguous run is looked for once, also when there is none, until an array is replaced """
+
+    conditions = Conditions()
+    conditions.a = np.zeros((1,2))
+    conditions.b = Conditions()
+    conditions.b.c = np.zeros((1,1))
+    conditions.expand_rows(4,contiguous=True)
+    run = conditions.contiguous_run()
+    assert run is not None and len(run) == 12
+
+    # an array outside of the buffer, the walk is not repeated
+    view = conditions.b.c
+    conditions.b.c = np.ones((4,1))
+    assert conditions.contiguous_run() is None
+    layout = conditions._layout
+    assert conditions.contiguous_run() is None
+    assert conditions._layout is layout
+    assert np.all(conditions.pack_array()[8:] == 1.)
+
+    # putting the view back finds the run again
+    conditions.b.c = view
+    assert conditions.contiguous_run() is not None
+    assert conditions._layout is not layout
+    conditions.unpack_array(np.arange(12.))
+    assert np.all(conditions.b.c[:,0] == [8.,9.,10.,11.])
+
+def merged_state_check():
+    """ the merged state that is updated in place equals a full merge and owns its arrays, also after the sub segment
+    layouts change """
+
+    container = Container()
+    for i,rows in enumerate([3,4,2]):
+        segment = Segment()
+        segment.tag = 'segment_%i' % i
+        segment.state.unknowns.x   = np.zeros((rows,1))
+        segment.state.conditions.a = np.zeros((rows,2))
+        segment.state.conditions.b = Conditions()
+        segment.state.conditions.b.c = np.zeros((rows,1))
+        container.segments.append(segment)
+
+    def check(merged):
+        full = container.merged()
+        for name in ['unknowns.x','conditions.a','conditions.b.c']:
+            assert np.all(merged.deep_get(name) == full.deep_get(name))
+            for segment in container.segments:
+                assert not np.shares_memory(merged.deep_get(name),segment.state.deep_get(name))
+
+    merged = container.merged(reuse=True)
+    check(merged)
+
+    # same layout, the arrays of the last merge are updated
+    for i,segment in enumerate(container.segments):
+        segment.state.unknowns.x[:]     = i + 1.
+        segment.state.conditions.a[:]   = np.arange(2.)*i
+        segment.state.conditions.b.c[:] = -i
+    assert container.merged(reuse=True) is merged
+    check(merged)
+
+    # a sub segment with more rows is merged again
+    segment = container.segments.segment_1
+    segment.state.unknowns.x     = np.ones((6,1))*7.
+    segment.state.conditions.a   = np.ones((6,2))*8.
+    segment.state.conditions.b.c = np.ones((6,1))*9.
+    merged_new = container.merged(reuse=True)
+    assert merged_new is not merged
+    assert merged_new.unknowns.x.shape[0] == 11
+    check(merged_new)
+
+# ----------------------------------------------------------------------
+#   Timing
+# ----------------------------------------------------------------------
+
+def time_bookkeeping(mission,repeats=2000):
+
+    timing = Data()
+    for segment in mission.segments:
+        state = segment.state
+        x     = state.unknowns.pack_array()
+
+        tic = time.perf_counter()
+        for i in range(repeats):
+            state.unknowns.unpack_array(x)
+        unpack = (time.perf_counter() - tic)/repeats
+
+        tic = time.perf_counter()
+        for i in range(repeats):
+            state.residuals.pack_array()
+        pack = (time.perf_counter() - tic)/repeats
+
+        tic = time.perf_counter()
+        for i in range(repeats//20):
+            expand_state(segment)
+        expand = (time.perf_counter() - tic)/(repeats//20)
+
+        timing[segment.tag] = Data(unpack=unpack*1e6, pack=pack*1e6, expand=expand*1e6)
+
+    return timing
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,134 @@
+# training_cache_benchmark.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" times initializing the vortex lattice and lifting line surrogates of a Boeing 737 with and without the
+    training cache, and checks that the reloaded training gives the same surrogates"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units, Data
+from SUAVE.Methods.Utilities.surrogate_training_cache import training_fingerprint, load_training, save_training
+
+import numpy as np
+import tempfile
+import shutil
+import time
+import os
+import sys
+
+sys.path.append('../Vehicles')
+from Boeing_737 import vehicle_setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    directory = tempfile.mkdtemp()
+
+    try:
+        print('Initializing the surrogates [seconds]')
+        print('%-16s %12s %12s %12s' % ('','no cache','miss','hit'))
+        timings = Data()
+        for lift_model in [SUAVE.Analyses.Aerodynamics.Vortex_Lattice,SUAVE.Analyses.Aerodynamics.Lifting_Line]:
+            times   = []
+            results = []
+            for cache in [None,directory,directory]:
+                tic          = time.perf_counter()
+                aerodynamics = setup(lift_model,cache)
+                times.append(time.perf_counter() - tic)
+                results.append(evaluate(aerodynamics))
+            print('%-16s %12.3f %12.3f %12.3f' % (lift_model.__name__,times[0],times[1],times[2]))
+            timings[lift_model.__name__] = times
+
+            # the reloaded training gives the same surrogates as sampling it again
+            assert np.all(results[1] == results[0])
+            assert np.all(results[2] == results[0])
+
+        # the vortex lattice training is the one worth keeping
+        assert timings.Vortex_Lattice[2] < timings.Vortex_Lattice[0]
+
+        # one file for each lift model
+        assert len(os.listdir(directory)) == 2
+
+        # a different vehicle is a different fingerprint
+        vehicle   = vehicle_setup()
+        settings  = Data(number_of_stations = 100)
+        training  = Data(angle_of_attack = np.array([0.,1.]))
+        reference = training_fingerprint('Lifting_Line',vehicle,settings,[training.angle_of_attack])
+        assert reference == training_fingerprint('Lifting_Line',vehicle_setup(),settings,[training.angle_of_attack])
+        vehicle.wings.main_wing.spans.projected *= 1.01
+        assert reference != training_fingerprint('Lifting_Line',vehicle,settings,[training.angle_of_attack])
+        assert reference != training_fingerprint('Lifting_Line',vehicle_setup(),settings,[training.angle_of_attack*2.])
+
+        # the least recently used training is evicted first
+        training.lift_coefficient = np.zeros(1000)
+        size = 1000*8*2.5
+        for fingerprint in ['a','b','c']:
+            save_training(directory,fingerprint,training,size + 2e4)
+        assert sorted(os.listdir(directory))[:3] == ['a.npz','b.npz','c.npz']
+        shutil.rmtree(directory)
+        for fingerprint in ['a','b']:
+            save_training(directory,fingerprint,training,size)
+        os.utime(os.path.join(directory,'a.npz'),(0,0))
+        save_training(directory,'c',training,size)
+        assert sorted(os.listdir(directory)) == ['b.npz','c.npz']
+        assert load_training(directory,'b',Data())
+        assert not load_training(directory,'a',Data())
+        assert not load_training(None,'b',Data())
+
+    finally:
+        shutil.rmtree(directory,ignore_errors=True)
+
+    return
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+def setup(lift_model,directory):
+    """ a Fidelity Zero aerodynamics analysis of a Boeing 737 with the given lift model, initialized """
+
+    vehicle = vehicle_setup()
+    for wing in vehicle.wings:
+        wing.areas.wetted   = 2.0 * wing.areas.reference
+        wing.areas.exposed  = 0.8 * wing.areas.wetted
+        wing.areas.affected = 0.6 * wing.areas.wetted
+
+    aerodynamics = SUAVE.Analyses.Aerodynamics.Fidelity_Zero()
+    aerodynamics.process.compute.lift.inviscid_wings = lift_model()
+    aerodynamics.process.compute.lift.inviscid_wings.settings.training_cache_directory = directory
+    aerodynamics.geometry = vehicle
+    aerodynamics.initialize()
+
+    return aerodynamics
+
+def evaluate(aerodynamics):
+    """ the lift and drag coefficients of the surrogates over a few conditions """
+
+    n     = 7
+    state = SUAVE.Analyses.Mission.Segments.Conditions.State()
+    state.conditions = SUAVE.Analyses.Mission.Segments.Conditions.Aerodynamics()
+    state.expand_rows(n)
+
+    conditions = state.conditions
+    conditions.aerodynamics.angle_of_attack = np.linspace(-2.,8.,n)[:,None] * Units.deg
+    conditions.freestream.mach_number       = np.linspace(0.1,0.8,n)[:,None]
+    conditions.freestream.density           = np.ones((n,1))
+    conditions.freestream.dynamic_viscosity = np.ones((n,1)) * 1.8e-5
+    conditions.freestream.temperature       = np.ones((n,1)) * 250.
+    conditions.freestream.pressure          = np.ones((n,1)) * 5e4
+    conditions.freestream.reynolds_number   = np.ones((n,1)) * 2e7
+    conditions.freestream.velocity          = conditions.freestream.mach_number * 320.
+
+    results = aerodynamics.evaluate(state)
+
+    return np.hstack([results.lift.total,results.drag.total])
+
+if __name__ == '__main__':
+    main()
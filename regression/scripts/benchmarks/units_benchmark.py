@@ -0,0 +1,80 @@
+# units_benchmark.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" times converting values with the cached conversion factors of Units against going through Pint on every
+    conversion"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+from SUAVE.Core import Units
+from SUAVE.Plugins.pint import UnitRegistry
+
+import numpy as np
+import time
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    names       = ['ft','feet','deg','km','lbs','knots','nmi','kts','rpm','Wh','less','slug','horsepower']
+    expressions = ['miles/hour','slug/ft**3','lb/hp/hr','m/s/s','ft/s**2']
+    values      = [3.7, np.linspace(-10.,1000.,101)]
+
+    # the cached factors convert like Pint, in both directions
+    for value in values:
+        for name in names:
+            check(value*getattr(Units,name), value*pint_unit(name))
+            check(value/getattr(Units,name), value/pint_unit(name))
+        for expression in expressions:
+            check(value*Units[expression], value*pint_expression(expression))
+            check(value/Units[expression], value/pint_expression(expression))
+        check(value*Units.kg/Units.m**3, value*(pint_unit('kg')/pint_unit('m')**3))
+        check(value/(Units.force_pound/Units.ft**2), value/(pint_unit('force_pound')/pint_unit('ft')**2))
+
+    # units with an offset still go through Pint
+    assert np.isclose(100.*Units.degF, 310.92777777, rtol=1e-9)
+    assert np.isclose((100.*Units.degF)/Units.degF, 100., rtol=1e-9)
+    assert np.isclose(25.*Units.degC, 298.15, rtol=1e-12)
+
+    # timing
+    repeats = 2000
+    print('Cost of one conversion [microseconds]')
+    print('%-12s %12s %12s' % ('','pint','cached'))
+    for label, value in zip(['scalar','array'],values):
+        tic = time.perf_counter()
+        for i in range(repeats):
+            value*pint_unit('ft')
+            value/pint_unit('knots')
+        time_pint = (time.perf_counter() - tic)/repeats/2*1e6
+
+        tic = time.perf_counter()
+        for i in range(repeats):
+            value*Units.ft
+            value/Units.knots
+        time_cached = (time.perf_counter() - tic)/repeats/2*1e6
+        print('%-12s %12.3f %12.3f' % (label,time_pint,time_cached))
+
+    return
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+def pint_unit(name):
+    """ the Pint quantity of a unit, as Units returned before the conversion factors were cached """
+    return UnitRegistry.__getattr__(Units,name)
+
+def pint_expression(expression):
+    """ the Pint quantity of a unit expression """
+    return UnitRegistry.__getitem__(Units,expression)
+
+def check(value,pint_value):
+    assert np.allclose(value, pint_value, rtol=1e-15, atol=0.)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,152 @@
+# vlm_benchmark.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" times the vortex lattice training sweep of the B737 with and without the cached influence matrices, and
+    checks the memory of the sweep in blocks"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units, Data
+from SUAVE.Analyses.Aerodynamics.Vortex_Lattice import Vortex_Lattice, calculate_VLM
+from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.compute_wing_induced_velocity import compute_wing_induced_velocity
+
+import numpy as np
+import time
+import tracemalloc
+
+import sys
+sys.path.append('../Vehicles')
+
+from Boeing_737 import vehicle_setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    vehicle = vehicle_setup()
+
+    # without the cache, the default
+    settings = setup_settings()
+    tic      = time.perf_counter()
+    truth    = calculate_VLM(training_conditions(settings),settings,vehicle)
+    time_uncached = time.perf_counter() - tic
+
+    # with the cache, the second sweep only solves
+    settings = setup_settings()
+    settings.cache_influence_matrices = True
+    tic      = time.perf_counter()
+    calculate_VLM(training_conditions(settings),settings,vehicle)
+    time_first = time.perf_counter() - tic
+    tic      = time.perf_counter()
+    results  = calculate_VLM(training_conditions(settings),settings,vehicle)
+    time_cached = time.perf_counter() - tic
+
+    print('Vortex lattice training sweep [seconds]')
+    print('%-12s %12.3f' % ('no cache',time_uncached))
+    print('%-12s %12.3f' % ('first',time_first))
+    print('%-12s %12.3f' % ('cached',time_cached))
+
+    # the cache must not change the answer
+    for i in [0,1,4,5,6]:
+        error = np.max(np.abs(results[i] - truth[i]))
+        print('output ' + str(i) + ' error: ' + str(error))
+        assert error < 1e-12
+    assert len(settings.influence_cache.matrices) == len(Vortex_Lattice().training.Mach)
+
+    # the influence matrices are the ones of the induced velocity tensors
+    check_influence(vehicle,settings)
+
+    # a change in the geometry starts over
+    fingerprint = settings.influence_cache.fingerprint
+    vehicle.wings.main_wing.spans.projected = 1.01*vehicle.wings.main_wing.spans.projected
+    calculate_VLM(training_conditions(settings),settings,vehicle)
+    assert settings.influence_cache.fingerprint != fingerprint
+
+    # the cache stays under its size
+    settings.influence_cache_size = 2*sum([v.nbytes for v in settings.influence_cache.matrices[0.5].values()])
+    settings.influence_cache      = Data()
+    results = calculate_VLM(training_conditions(settings),settings,vehicle)
+    assert len(settings.influence_cache.matrices) == 2
+    assert settings.influence_cache.size <= settings.influence_cache_size
+
+    # a small memory budget solves in blocks, with the same answer and a fraction of the memory
+    peak_full,  results_full  = memory_peak(vehicle,None)
+    peak_small, results_small = memory_peak(vehicle,2e6)
+    print('Peak memory of the training sweep [MB]: %.1f without a budget, %.1f with a 2 MB budget' % (peak_full/1e6,peak_small/1e6))
+    for i in [0,1,4,5,6]:
+        error = np.max(np.abs(results_small[i] - results_full[i]))
+        print('output ' + str(i) + ' blocked error: ' + str(error))
+        assert error < 1e-12
+    assert peak_small < peak_full/5
+
+    return
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+def setup_settings():
+
+    settings = Vortex_Lattice().settings
+    settings.propeller_wake_model = False
+
+    return settings
+
+def training_conditions(settings):
+
+    training = Vortex_Lattice().training
+    AoA      = training.angle_of_attack
+    Mach     = training.Mach
+
+    conditions                              = Data()
+    conditions.aerodynamics                 = Data()
+    conditions.freestream                   = Data()
+    conditions.aerodynamics.angle_of_attack = np.atleast_2d(np.tile(AoA,len(Mach)).T.flatten()).T
+    conditions.freestream.mach_number       = np.atleast_2d(np.tile(Mach,len(AoA)).flatten()).T
+    conditions.freestream.velocity          = np.zeros_like(conditions.freestream.mach_number)
+
+    return conditions
+
+def memory_peak(vehicle,budget):
+
+    settings = setup_settings()
+    settings.memory_budget = budget
+    conditions = training_conditions(settings)
+
+    tracemalloc.start()
+    results = calculate_VLM(conditions,settings,vehicle)
+    peak    = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return peak, results
+
+def check_influence(vehicle,settings):
+
+    VD   = vehicle.vortex_distribution
+    n_sw = settings.number_spanwise_vortices
+    n_cw = settings.number_chordwise_vortices
+    aoa  = np.array([[-2.],[8.]])*Units.deg
+    mach = np.array([[0.5],[0.5]])
+
+    C_mn, DW_mn = compute_wing_induced_velocity(VD,n_sw,n_cw,aoa,mach)
+    influence   = settings.influence_cache.matrices[0.5]
+
+    for i in range(len(aoa)):
+        sin_aoa = np.sin(aoa[i,0])
+        cos_aoa = np.cos(aoa[i,0])
+        error_u = np.max(np.abs(np.sum(C_mn[i,:,:,0],axis=1) - (influence.u_0 + sin_aoa*influence.u_sin)))
+        error_w = np.max(np.abs(np.sum(DW_mn[i,:,:,2],axis=1) - (influence.w_0 + cos_aoa*influence.w_cos)))
+        print('induced velocity errors: ' + str(error_u) + ', ' + str(error_w))
+        assert error_u < 1e-10
+        assert error_w < 1e-10
+
+    return
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,182 @@
+# wake_induced_velocity_benchmark.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" times the velocity induced by propeller wakes on the control points of a wing, and checks the tiled
+    kernel and the tree of the wake segments against the repeated arrays of the vortex function at small sizes"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+from SUAVE.Core import Data
+from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.compute_wake_induced_velocity import compute_wake_induced_velocity
+from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.compute_wing_induced_velocity import vortex_segment
+
+import numpy as np
+import time
+import tracemalloc
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    # the tiled kernel gives the velocities of the repeated arrays
+    WD, VD = wake_setup(number_of_conditions=3,number_of_time_steps=10,number_of_control_points=60)
+    truth  = repeated_wake_induced_velocity(WD,VD,3)
+    for tile_size in [1,100,2**15,10**9]:
+        V_ind = compute_wake_induced_velocity(WD,VD,3,tile_size)
+        error = np.max(np.abs(V_ind - truth))/np.max(np.abs(truth))
+        print('tile size ' + str(tile_size) + ' relative error: ' + str(error))
+        assert error < 1e-10
+
+    # the tree of the wake segments gives the same velocities, to second order in the far groups
+    for opening_angle, tolerance in [(0.,1e-10),(0.2,1e-3)]:
+        V_ind = compute_wake_induced_velocity(WD,VD,3,opening_angle=opening_angle)
+        error = np.max(np.abs(V_ind - truth))/np.max(np.abs(truth))
+        print('opening angle ' + str(opening_angle) + ' relative error: ' + str(error))
+        assert error < tolerance
+
+    # the vortex segments give the velocities of the vortex function
+    X, Y, Z = np.random.RandomState(1).rand(3,4,5,1)
+    COEF, _ = vortex(X,Y,Z,0.,0.,0.,1.,2.,3.)
+    error   = np.max(np.abs(vortex_segment(X,Y,Z,0.,0.,0.,1.,2.,3.) - np.moveaxis(COEF,0,-1)))
+    print('vortex segment error: ' + str(error))
+    assert error < 1e-12
+
+    # time and memory by size, the repeated arrays only for the sizes that fit
+    print('Wake induced velocity, 4 conditions')
+    print('%12s %14s %16s %12s %16s %12s' % ('wake panels','control points','repeated [s]','[MB]','tiled [s]','[MB]'))
+    for time_steps, control_points in [(5,100),(10,250),(20,500),(40,1000),(80,1000)]:
+        WD, VD = wake_setup(4,time_steps,control_points)
+        if time_steps <= 20:
+            time_repeated, peak_repeated = measure(repeated_wake_induced_velocity,WD,VD)
+        else:
+            time_repeated, peak_repeated = np.nan, np.nan
+        time_tiled, peak_tiled = measure(compute_wake_induced_velocity,WD,VD)
+        print('%12i %14i %16.3f %12.1f %16.3f %12.1f' % (WD.XA1.shape[1],VD.n_cp,time_repeated,peak_repeated/1e6,
+                                                         time_tiled,peak_tiled/1e6))
+
+        # the memory of the tiles does not grow with the wake
+        assert peak_tiled < 20e6
+
+    return
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+def wake_setup(number_of_conditions,number_of_time_steps,number_of_control_points):
+    """ helical wakes of two three bladed propellers ahead of a wing of control points """
+
+    m        = number_of_conditions
+    B        = 3
+    r        = np.linspace(0.2,1.0,9)
+    t        = np.linspace(0.,0.2,number_of_time_steps)
+    omega    = 150.
+    V        = 50.
+    origins  = [-3.,3.]
+
+    X = []
+    Y = []
+    Z = []
+    for y_prop in origins:
+        for blade in range(B):
+            angle = omega*t[:,None] + 2*np.pi*blade/B
+            X.append(np.tile((V*t)[:,None],(1,len(r))))
+            Y.append(y_prop + r[None,:]*np.cos(angle))
+            Z.append(r[None,:]*np.sin(angle))
+    X = np.array(X)
+    Y = np.array(Y)
+    Z = np.array(Z)
+
+    # panels between two time steps and two radial stations
+    WD     = Data()
+    shape  = (m,1)
+    for name, P in zip(['X','Y','Z'],[X,Y,Z]):
+        WD[name + 'A1'] = np.tile(P[:,:-1,:-1].flatten(),shape)
+        WD[name + 'B1'] = np.tile(P[:,:-1,1:].flatten(),shape)
+        WD[name + 'B2'] = np.tile(P[:,1:,1:].flatten(),shape)
+        WD[name + 'A2'] = np.tile(P[:,1:,:-1].flatten(),shape)
+    WD.GAMMA = np.random.RandomState(0).rand(m,WD.XA1.shape[1])
+
+    # control points on a wing behind the propellers
+    n_span = number_of_control_points//10
+    XC, YC = np.meshgrid(np.linspace(1.,2.,10),np.linspace(-6.,6.,n_span))
+    VD     = Data()
+    VD.XC  = XC.flatten()
+    VD.YC  = YC.flatten()
+    VD.ZC  = np.zeros_like(VD.XC) + 0.1
+    VD.n_cp = len(VD.XC)
+
+    return WD, VD
+
+def repeated_wake_induced_velocity(WD,VD,cpts):
+    """ the velocities with every array repeated to the full size, as the vortex function needs them """
+
+    num_v_cpts = len(WD.XA1[0,:])
+    num_w_cpts = VD.n_cp
+    ones       = np.ones((cpts,1,1))
+
+    W = Data()
+    for key in ['XA1','YA1','ZA1','XA2','YA2','ZA2','XB1','YB1','ZB1','XB2','YB2','ZB2','GAMMA']:
+        W[key] = np.repeat(np.atleast_3d(WD[key]), num_w_cpts , axis = 2)
+
+    XC = np.repeat(np.atleast_2d(VD.XC*ones), num_v_cpts , axis = 1)
+    YC = np.repeat(np.atleast_2d(VD.YC*ones), num_v_cpts , axis = 1)
+    ZC = np.repeat(np.atleast_2d(VD.ZC*ones), num_v_cpts , axis = 1)
+
+    V_ind = 0.
+    for P1, P2 in [('A1','B1'),('B1','B2'),('B2','A2'),('A2','A1')]:
+        _, res = vortex(XC, YC, ZC, W['X'+P1], W['Y'+P1], W['Z'+P1], W['X'+P2], W['Y'+P2], W['Z'+P2], W.GAMMA)
+        V_ind  = V_ind + np.transpose(res,axes=[1,2,3,0])
+
+    return np.sum(V_ind, axis = 1)
+
+def vortex(X,Y,Z,X1,Y1,Z1,X2,Y2,Z2, GAMMA = 1):
+    """ the velocity induced on control points by segments of horseshoe vortices, on arrays of the same shape,
+        the previous kernel of the VLM """
+
+    X_X1  = X-X1
+    X_X2  = X-X2
+    X2_X1 = X2-X1
+
+    Y_Y1  = Y-Y1
+    Y_Y2  = Y-Y2
+    Y2_Y1 = Y2-Y1
+
+    Z_Z1  = Z-Z1
+    Z_Z2  = Z-Z2
+    Z2_Z1 = Z2-Z1
+
+    R1R2X  = Y_Y1*Z_Z2 - Z_Z1*Y_Y2
+    R1R2Y  = Z_Z1*X_X2 - X_X1*Z_Z2
+    R1R2Z  = X_X1*Y_Y2 - Y_Y1*X_X2
+    SQUARE = np.square(R1R2X) + np.square(R1R2Y) + np.square(R1R2Z)
+    SQUARE[SQUARE==0] = 1e-12
+    R1     = np.sqrt(np.square(X_X1) + np.square(Y_Y1) + np.square(Z_Z1))
+    R2     = np.sqrt(np.square(X_X2) + np.square(Y_Y2) + np.square(Z_Z2))
+    R0R1   = X2_X1*X_X1 + Y2_Y1*Y_Y1 + Z2_Z1*Z_Z1
+    R0R2   = X2_X1*X_X2 + Y2_Y1*Y_Y2 + Z2_Z1*Z_Z2
+    RVEC   = np.array([R1R2X,R1R2Y,R1R2Z])
+    COEF   = (1/(4*np.pi))*(RVEC/SQUARE) * (R0R1/R1 - R0R2/R2)
+    V_IND  = GAMMA * COEF
+
+    return COEF , V_IND
+
+def measure(function,WD,VD):
+    """ the time and the peak memory of a function """
+
+    tracemalloc.start()
+    tic  = time.perf_counter()
+    function(WD,VD,WD.XA1.shape[0])
+    toc  = time.perf_counter() - tic
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return toc, peak
+
+if __name__ == '__main__':
+    main()
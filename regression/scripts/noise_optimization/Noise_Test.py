@@ -2,6 +2,7 @@
 #
 # Created:  Nov 2015, Carlos / Tarik
 # Modified: Nov 2016, T. MacDonald
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #   Imports
@@ -45,7 +46,7 @@ def main():
     noise_cumulative_margin = objectives[0]
     
     actual = Data()    
-    actual.noise_cumulative_margin = 21.000025956549678
+    actual.noise_cumulative_margin = 13.586220717146944
 
     error = Data()
     error.noise_cumulative_margin = abs(actual.noise_cumulative_margin - noise_cumulative_margin)/actual.noise_cumulative_margin
@@ -2,6 +2,7 @@
 # 
 # Created:  Nov 2015, Carlos / Tarik
 # Modified: Jun 2016, T. MacDonald
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------        
 #   Imports
@@ -519,7 +520,7 @@ def noise_sideline_init(nexus):
     n_points   = np.ceil(results.sideline_initialization.segments.climb.conditions.frames.inertial.time[-1] /0.5 +1)
 
     nexus.npoints_sideline_sign=np.sign(n_points)
-    nexus.missions.sideline_takeoff.segments.climb.state.numerics.number_control_points = np.minimum(200, np.abs(n_points))  
+    nexus.missions.sideline_takeoff.segments.climb.state.numerics.number_control_points = int(np.minimum(200, np.abs(n_points)))  
 
     
     return nexus
@@ -535,7 +536,7 @@ def noise_takeoff_init(nexus):
     n_points   = np.ceil(results.takeoff_initialization.segments.climb.conditions.frames.inertial.time[-1] /0.5 +1)
     nexus.npoints_takeoff_sign=np.sign(n_points)
 
-    nexus.missions.takeoff.segments.climb.state.numerics.number_control_points = np.minimum(200, np.abs(n_points))
+    nexus.missions.takeoff.segments.climb.state.numerics.number_control_points = int(np.minimum(200, np.abs(n_points)))
     
 
     return nexus
@@ -0,0 +1 @@
+{"segments": {"descent": {"conditions": {"tag": "aerodynamic_conditions", "frames": {"inertial": {"position_vector": [[0.0, 0.0, -224.87111713216484], [0.6023626075919802, 0.0, -224.83954864557782], [2.4090875896552033, 0.0, -224.74486220149268], [5.419086642620088, 0.0, -224.58711483548277], [9.630546655606194, 0.0, -224.3664015686628], [15.040930802580599, 0.0, -224.08285535045172], [21.646980070438058, 0.0, -223.73664697848895], [29.44471522211815, 0.0, -223.3279849957521], [38.42943919353929, 0.0, -222.8571155649388], [48.5957399229435, 0.0, -222.32432232018718], [59.937493610912284, 0.0, -221.72992619622548], [72.44786840912117, 0.0, -221.07428523505286], [86.11932853558272, 0.0, -220.35779437026832], [100.94363881392749, 0.0, -219.58088518917754], [116.91186963395883, 0.0, -218.74402567282067], [134.01440233052307, 0.0, -217.84771991407817], [152.24093497742706, 0.0, -216.89250781402404], [171.5804885929398, 0.0, -215.87896475670973], [192.02141375311405, 0.0, -214.80770126257414], [213.55139760897057, 0.0, -213.679362620689], [236.15747130329072, 0.0, -212.49462850006088], [259.82601778257856, 0.0, -211.254212540224], [284.5427799994569, 0.0, -209.9588619213704], [310.2928695005874, 0.0, -208.60935691427665], [337.06077539491076, 0.0, -207.2065104102977], [364.8303736968342, 0.0, -205.7511674317118], [393.58493703871136, 0.0, -204.24420462271044], [423.3071447467893, 0.0, -202.68652972134083], [453.9790932745274, 0.0, -201.0790810127183], [485.582306987033, 0.0, -199.42282676383857], [518.0977492900837, 0.0, -197.71876464032982], [551.5058340970686, 0.0, -195.96792110549626], [585.786437626907, 0.0, -194.171350802015], [620.9189105258689, 0.0, -192.33013591665883], [656.8820903059654, 0.0, -190.44538552842718], [693.6543140924495, 0.0, -188.51823494047858], [731.2134316727117, 0.0, -186.54984499626636], [769.53681883875, 0.0, -184.54140138029015], [808.6013910151363, 0.0, -182.49411390388366], [848.3836171643129, 0.0, -180.40921577646958], [888.8595339607988, 0.0, -178.2879628627206], [930.0047602258101, 0.0, -176.13163292607317], [971.794511613562, 0.0, -173.94152485905073], [1014.2036155404377, 0.0, -171.71895790085952], [1057.206526348011, 0.0, -169.46527084272793], [1100.7773406907936, 0.0, -167.18182122146902], [1144.8898131394421, 0.0, -164.869984501751], [1189.517371990027, 0.0, -162.53115324756862], [1234.6331352698264, 0.0, -160.16673628341493], [1280.2099269300306, 0.0, -157.77815784565786], [1326.2202932155672, 0.0, -155.36685672463358], [1372.6365192022245, 0.0, -152.9342853979731], [1419.4306454910825, 0.0, -150.48190915568387], [1466.574485050211, 0.0, -148.01120521751398], [1514.0396401934795, 0.0, -145.52366184313024], [1561.7975196862692, 0.0, -143.0207774356461], [1609.8193559677518, 0.0, -140.50405963903978], [1658.0762224794062, 0.0, -137.97502443000587], [1706.5390510892844, 0.0, -135.43519520478745], [1755.1786496015764, 0.0, -132.88610186153957], [1803.9657193408868, 0.0, -130.32927987877542], [1852.8708728006739, 0.0, -127.76626939045167], [1901.8646513451715, 0.0, -125.19861425824938], [1950.9175429541851, 0.0, -122.62786114160934], [2000.000000000009, 0.0, -120.05555856608244], [2049.082457045834, 0.0, -117.48325599055552], [2098.1353486548455, 0.0, -114.91250287391547], [2147.129127199345, 0.0, -112.3448477417132], [2196.0342806591316, 0.0, -109.78183725338944], [2244.821350398443, 0.0, -107.22501527062528], [2293.4609489107324, 0.0, -104.6759219273774], [2341.9237775206125, 0.0, -102.136092702159], [2390.1806440322653, 0.0, -99.60705749312507], [2438.20248031375, 0.0, -97.09033969651875], [2485.960359806538, 0.0, -94.58745528903464], [2533.425514949807, 0.0, -92.09991191465087], [2580.5693545089334, 0.0, -89.62920797648101], [2627.3634807977924, 0.0, -87.17683173419175], [2673.7797067844494, 0.0, -84.74426040753127], [2719.7900730699857, 0.0, -82.33295928650699], [2765.3668647301884, 0.0, -79.94438084874994], [2810.482628009988, 0.0, -77.57996388459622], [2855.1101868605724, 0.0, -75.24113263041389], [2899.2226593092223, 0.0, -72.9292959106958], [2942.7934736520037, 0.0, -70.64584628943692], [2985.796384459577, 0.0, -68.39215923130536], [3028.205488386451, 0.0, -66.16959227311412], [3069.995239774202, 0.0, -63.97948420609171], [3111.1404660392136, 0.0, -61.823154269444274], [3151.6163828357007, 0.0, -59.70190135569524], [3191.3986089848763, 0.0, -57.61700322828122], [3230.4631811612658, 0.0, -55.569715751874696], [3268.786568327302, 0.0, -53.56127213589849], [3306.345685907567, 0.0, -51.5928821916863], [3343.11790969405, 0.0, -49.66573160373767], [3379.081089474148, 0.0, -47.78098121550599], [3414.2135623731087, 0.0, -45.93976633014984], [3448.4941659029473, 0.0, -44.14319602666862], [3481.9022507099307, 0.0, -42.392352491835084], [3514.4176930129825, 0.0, -40.68829036832628], [3546.0209067254864, 0.0, -39.03203611944656], [3576.6928552532263, 0.0, -37.42458741082402], [3606.415062961306, 0.0, -35.86691250945441], [3635.169626303184, 0.0, -34.359949700453086], [3662.9392246051048, 0.0, -32.90460672186714], [3689.7071304994306, 0.0, -31.501760217888204], [3715.457220000559, 0.0, -30.152255210794465], [3740.173982217437, 0.0, -28.85690459194086], [3763.8425286967263, 0.0, -27.616488632103966], [3786.4486023910504, 0.0, -26.431754511475873], [3807.9785862469066, 0.0, -25.303415869590708], [3828.4195114070826, 0.0, -24.232152375455115], [3847.759065022592, 0.0, -23.218609318140807], [3865.9855976694985, 0.0, -22.26339721808671], [3883.088130366063, 0.0, -21.36709145934421], [3899.0563611860953, 0.0, -20.530231942987314], [3913.8806714644397, 0.0, -19.753322761896527], [3927.5521315909036, 0.0, -19.036831897111995], [3940.062506389111, 0.0, -18.381190935939372], [3951.404260077081, 0.0, -17.78679481197767], [3961.5705608064836, 0.0, -17.254001567226055], [3970.5552847779063, 0.0, -16.783132136412775], [3978.3530199295874, 0.0, -16.3744701536759], [3984.959069197446, 0.0, -16.0282617817131], [3990.3694533444177, 0.0, -15.74471556350207], [3994.580913357411, 0.0, -15.524002296682085], [3997.5909124103814, 0.0, -15.36625493067217], [3999.3976373924406, 0.0, -15.271568486587029], [4000.0000000000327, 0.0, -15.240000000000009]], "velocity_vector": [[62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477], [62.954010595260456, 0.0, 3.2992798922586477]], "acceleration_vector": [[-1.0795808691455022e-12, 0.0, -7.09432512735475e-14], [-1.092903545441004e-12, 0.0, -2.2565282975506307e-14], [1.4075407506197735e-12, 0.0, 3.774758283725532e-14], [-6.892264536872972e-13, 0.0, -3.207156762385921e-14], [1.3167245072054357e-13, 0.0, 1.8512968935624485e-14], [1.056932319443149e-13, 0.0, 2.8171909249863347e-15], [2.682298827494378e-13, 0.0, 1.712519015484304e-14], [-1.1102230246251565e-14, 0.0, -3.622102617839573e-15], [6.927791673660977e-14, 0.0, 4.579669976578771e-16], [-7.838174553853605e-14, 0.0, -3.885780586188048e-15], [-1.4921397450962104e-13, 0.0, -4.53109771925142e-15], [-1.3322676295501878e-15, 0.0, -1.3530843112619095e-15], [-2.930988785010413e-14, 0.0, -1.0130785099704553e-15], [-3.175237850427948e-14, 0.0, -1.2351231148954867e-15], [-4.440892098500626e-14, 0.0, -4.288236432614667e-15], [-2.353672812205332e-14, 0.0, 6.938893903907228e-17], [-3.774758283725532e-14, 0.0, -2.789435349370706e-15], [-2.7977620220553945e-14, 0.0, 1.6792123247455493e-15], [-4.1744385725905886e-14, 0.0, -8.187894806610529e-16], [6.838973831690964e-14, 0.0, 1.6653345369377348e-15], [7.593925488436071e-14, 0.0, 5.051514762044462e-15], [-6.972200594645983e-14, 0.0, -2.886579864025407e-15], [4.529709940470639e-14, 0.0, 1.609823385706477e-15], [4.440892098500626e-15, 0.0, -1.249000902703301e-16], [-2.220446049250313e-16, 0.0, -3.7470027081099033e-16], [2.2426505097428162e-14, 0.0, 1.124100812432971e-15], [-2.1760371282653068e-14, 0.0, -1.2073675392798577e-15], [3.042011087472929e-14, 0.0, -7.91033905045424e-16], [-2.7533531010703882e-14, 0.0, -6.938893903907228e-16], [-3.375077994860476e-14, 0.0, -2.7755575615628914e-15], [-7.771561172376096e-15, 0.0, 7.216449660063518e-16], [-7.105427357601002e-15, 0.0, -4.0245584642661925e-16], [3.530509218307998e-14, 0.0, 1.790234627208065e-15], [-1.5987211554602254e-14, 0.0, -9.159339953157541e-16], [-2.3314683517128287e-14, 0.0, 2.914335439641036e-16], [1.0658141036401503e-14, 0.0, -4.996003610813204e-16], [1.3766765505351941e-14, 0.0, 7.077671781985373e-16], [1.709743457922741e-14, 0.0, 8.604228440844963e-16], [1.1546319456101628e-14, 0.0, 3.608224830031759e-16], [-1.2212453270876722e-14, 0.0, -3.885780586188048e-16], [-2.3314683517128287e-14, 0.0, -5.551115123125783e-16], [2.4424906541753444e-14, 0.0, 1.27675647831893e-15], [-2.4868995751603507e-14, 0.0, -1.5126788710517758e-15], [-4.218847493575595e-14, 0.0, -2.3869795029440866e-15], [-3.1086244689504383e-15, 0.0, 2.914335439641036e-16], [6.661338147750939e-15, 0.0, 8.326672684688674e-17], [-1.7763568394002505e-14, 0.0, -7.216449660063518e-16], [1.687538997430238e-14, 0.0, 4.163336342344337e-16], [1.3766765505351941e-14, 0.0, 6.661338147750939e-16], [2.042810365310288e-14, 0.0, 7.216449660063518e-16], [1.7763568394002505e-15, 0.0, 2.7755575615628914e-16], [-3.9968028886505635e-15, 0.0, -2.7755575615628914e-16], [1.509903313490213e-14, 0.0, 1.7208456881689926e-15], [1.4654943925052066e-14, 0.0, 3.885780586188048e-16], [-1.0658141036401503e-14, 0.0, -1.1657341758564144e-15], [2.220446049250313e-14, 0.0, 1.1102230246251565e-15], [-1.0658141036401503e-14, 0.0, -2.7755575615628914e-16], [8.881784197001252e-16, 0.0, 6.106226635438361e-16], [0.0, 0.0, 5.551115123125783e-16], [5.329070518200751e-15, 0.0, -1.3877787807814457e-15], [7.105427357601002e-15, 0.0, 1.3322676295501878e-15], [4.263256414560601e-14, 0.0, 1.2212453270876722e-15], [1.7763568394002505e-14, 0.0, -2.220446049250313e-16], [-7.105427357601002e-15, 0.0, -4.440892098500626e-16], [1.4210854715202004e-14, 0.0, 1.3322676295501878e-15], [1.4210854715202004e-14, 0.0, 2.220446049250313e-16], [-1.5987211554602254e-14, 0.0, -9.992007221626409e-16], [-8.881784197001252e-15, 0.0, -1.1102230246251565e-16], [-1.2434497875801753e-14, 0.0, -1.4432899320127035e-15], [2.842170943040401e-14, 0.0, 2.4424906541753444e-15], [-7.105427357601002e-15, 0.0, -5.551115123125783e-17], [2.398081733190338e-14, 0.0, 6.106226635438361e-16], [6.217248937900877e-15, 0.0, 8.604228440844963e-16], [5.329070518200751e-15, 0.0, -6.661338147750939e-16], [-1.4654943925052066e-14, 0.0, 3.3306690738754696e-16], [-1.3322676295501878e-15, 0.0, 4.996003610813204e-16], [5.551115123125783e-14, 0.0, 2.0539125955565396e-15], [-4.618527782440651e-14, 0.0, -1.6375789613221059e-15], [7.549516567451064e-15, 0.0, 6.106226635438361e-16], [8.881784197001252e-15, 0.0, 4.440892098500626e-16], [1.7319479184152442e-14, 0.0, 1.2490009027033011e-15], [2.4868995751603507e-14, 0.0, 5.273559366969494e-16], [-1.199040866595169e-14, 0.0, -5.828670879282072e-16], [-9.769962616701378e-15, 0.0, 2.0816681711721685e-16], [-1.4654943925052066e-14, 0.0, -7.355227538141662e-16], [1.1324274851176597e-14, 0.0, 4.163336342344337e-16], [1.1102230246251565e-14, 0.0, 1.1102230246251565e-15], [-1.2878587085651816e-14, 0.0, 1.0547118733938987e-15], [1.3322676295501878e-14, 0.0, 1.0547118733938987e-15], [-2.9531932455029164e-14, 0.0, -1.9567680809018384e-15], [-5.773159728050814e-15, 0.0, -1.3877787807814457e-17], [6.661338147750939e-16, 0.0, -6.106226635438361e-16], [-2.042810365310288e-14, 0.0, -7.771561172376096e-16], [-1.9984014443252818e-14, 0.0, -1.8318679906315083e-15], [4.796163466380676e-14, 0.0, 4.996003610813204e-16], [-4.884981308350689e-15, 0.0, 0.0], [-2.5757174171303632e-14, 0.0, -1.304512053934559e-15], [-9.103828801926284e-15, 0.0, -5.967448757360216e-16], [1.199040866595169e-14, 0.0, 1.2628786905111156e-15], [1.9095836023552692e-14, 0.0, 9.43689570931383e-16], [3.375077994860476e-14, 0.0, 1.1102230246251565e-15], [-2.55351295663786e-14, 0.0, -1.942890293094024e-16], [-5.1958437552457326e-14, 0.0, -2.2620794126737565e-15], [5.46229728115577e-14, 0.0, 2.275957200481571e-15], [1.6209256159527285e-14, 0.0, 1.4988010832439613e-15], [-1.0658141036401503e-14, 0.0, -1.5265566588595902e-16], [2.531308496145357e-14, 0.0, 2.6506574712925612e-15], [-3.375077994860476e-14, 0.0, -9.43689570931383e-16], [-7.127631818093505e-14, 0.0, -6.300515664747763e-15], [-4.6851411639181606e-14, 0.0, -2.067790383364354e-15], [5.1514348342607263e-14, 0.0, 3.5041414214731503e-15], [3.3306690738754696e-14, 0.0, -1.4710455076283324e-15], [7.993605777301127e-15, 0.0, 6.38378239159465e-16], [-3.9968028886505635e-15, 0.0, 3.3306690738754696e-16], [-1.3322676295501878e-15, 0.0, 1.790234627208065e-15], [-5.1514348342607263e-14, 0.0, -2.366162821232365e-15], [5.773159728050814e-14, 0.0, 4.066191827689636e-15], [-1.1501910535116622e-13, 0.0, -4.1147640850169864e-15], [-4.218847493575595e-14, 0.0, -4.8155923693116165e-15], [-8.459899447643693e-14, 0.0, -1.3877787807814457e-17], [5.750955267558311e-14, 0.0, 3.2404634531246757e-15], [8.548717289613705e-14, 0.0, 5.176414852314792e-15], [2.6201263381153694e-14, 0.0, -4.9682480351975755e-15], [-1.7319479184152442e-14, 0.0, -5.662137425588298e-15], [-2.6978419498391304e-14, 0.0, -3.400058012914542e-16], [-4.518607710224387e-14, 0.0, -1.607047828144914e-14], [-9.947598300641403e-14, 0.0, 3.054501096499962e-14], [-4.878319970202938e-13, 0.0, -2.3175905639050143e-14], [-4.121147867408581e-13, 0.0, 2.2648549702353193e-13]], "gravity_force_vector": [[0.0, 0.0, 393459.5832637455], [0.0, 0.0, 393459.5704050941], [0.0, 0.0, 393459.53183734306], [0.0, 0.0, 393459.46758509433], [0.0, 0.0, 393459.37768933113], [0.0, 0.0, 393459.26220738806], [0.0, 0.0, 393459.12121290766], [0.0, 0.0, 393458.9547957866], [0.0, 0.0, 393458.76306210994], [0.0, 0.0, 393458.5461340713], [0.0, 0.0, 393458.30414988456], [0.0, 0.0, 393458.0372636804], [0.0, 0.0, 393457.745645394], [0.0, 0.0, 393457.4294806397], [0.0, 0.0, 393457.08897057443], [0.0, 0.0, 393456.7243317508], [0.0, 0.0, 393456.33579595835], [0.0, 0.0, 393455.92361005355], [0.0, 0.0, 393455.48803578044], [0.0, 0.0, 393455.02934957907], [0.0, 0.0, 393454.5478423854], [0.0, 0.0, 393454.0438194194], [0.0, 0.0, 393453.51759996446], [0.0, 0.0, 393452.9695171357], [0.0, 0.0, 393452.3999176411], [0.0, 0.0, 393451.8091615314], [0.0, 0.0, 393451.1976219414], [0.0, 0.0, 393450.5656848235], [0.0, 0.0, 393449.91374867206], [0.0, 0.0, 393449.2422242394], [0.0, 0.0, 393448.55153424526], [0.0, 0.0, 393447.84211307636], [0.0, 0.0, 393447.114406481], [0.0, 0.0, 393446.3688712556], [0.0, 0.0, 393445.6059749239], [0.0, 0.0, 393444.8261954116], [0.0, 0.0, 393444.03002071235], [0.0, 0.0, 393443.21794855065], [0.0, 0.0, 393442.39048603753], [0.0, 0.0, 393441.54814932134], [0.0, 0.0, 393440.69146323425], [0.0, 0.0, 393439.8209609336], [0.0, 0.0, 393438.9371835398], [0.0, 0.0, 393438.0406797693], [0.0, 0.0, 393437.13200556533], [0.0, 0.0, 393436.2117237238], [0.0, 0.0, 393435.2804035178], [0.0, 0.0, 393434.3386203187], [0.0, 0.0, 393433.3869552147], [0.0, 0.0, 393432.4259946282], [0.0, 0.0, 393431.456329931], [0.0, 0.0, 393430.4785570577], [0.0, 0.0, 393429.4932761192], [0.0, 0.0, 393428.50109101436], [0.0, 0.0, 393427.50260904164], [0.0, 0.0, 393426.4984405107], [0.0, 0.0, 393425.48919835343], [0.0, 0.0, 393424.4754977365], [0.0, 0.0, 393423.457955673], [0.0, 0.0, 393422.437190637], [0.0, 0.0, 393421.4138221775], [0.0, 0.0, 393420.38847053476], [0.0, 0.0, 393419.3617562582], [0.0, 0.0, 393418.33429982635], [0.0, 0.0, 393417.3067212684], [0.0, 0.0, 393416.2796397893], [0.0, 0.0, 393415.25367339636], [0.0, 0.0, 393414.22943852964], [0.0, 0.0, 393413.2075496946], [0.0, 0.0, 393412.1886190992], [0.0, 0.0, 393411.1732562929], [0.0, 0.0, 393410.1620678109], [0.0, 0.0, 393409.1556568219], [0.0, 0.0, 393408.15462277853], [0.0, 0.0, 393407.1595610744], [0.0, 0.0, 393406.1710627035], [0.0, 0.0, 393405.1897139251], [0.0, 0.0, 393404.2160959331], [0.0, 0.0, 393403.25078453094], [0.0, 0.0, 393402.2943498099], [0.0, 0.0, 393401.347355834], [0.0, 0.0, 393400.4103603293], [0.0, 0.0, 393399.4839143795], [0.0, 0.0, 393398.5685621251], [0.0, 0.0, 393397.6648404709], [0.0, 0.0, 393396.7732787961], [0.0, 0.0, 393395.89439867256], [0.0, 0.0, 393395.0287135875], [0.0, 0.0, 393394.17672867264], [0.0, 0.0, 393393.3389404394], [0.0, 0.0, 393392.5158365195], [0.0, 0.0, 393391.7078954123], [0.0, 0.0, 393390.91558623844], [0.0, 0.0, 393390.13936849823], [0.0, 0.0, 393389.379691839], [0.0, 0.0, 393388.63699582504], [0.0, 0.0, 393387.91170971794], [0.0, 0.0, 393387.2042522596], [0.0, 0.0, 393386.5150314644], [0.0, 0.0, 393385.844444416], [0.0, 0.0, 393385.1928770711], [0.0, 0.0, 393384.56070407043], [0.0, 0.0, 393383.9482885547], [0.0, 0.0, 393383.3559819882], [0.0, 0.0, 393382.78412398853], [0.0, 0.0, 393382.2330421626], [0.0, 0.0, 393381.7030519492], [0.0, 0.0, 393381.19445646816], [0.0, 0.0, 393380.70754637657], [0.0, 0.0, 393380.24259972945], [0.0, 0.0, 393379.79988185], [0.0, 0.0, 393379.3796452034], [0.0, 0.0, 393378.9821292791], [0.0, 0.0, 393378.6075604781], [0.0, 0.0, 393378.2561520083], [0.0, 0.0, 393377.92810378433], [0.0, 0.0, 393377.6236023359], [0.0, 0.0, 393377.34282072086], [0.0, 0.0, 393377.08591844566], [0.0, 0.0, 393376.8530413921], [0.0, 0.0, 393376.64432175027], [0.0, 0.0, 393376.4598779577], [0.0, 0.0, 393376.2998146457], [0.0, 0.0, 393376.16422259103], [0.0, 0.0, 393376.053178675], [0.0, 0.0, 393375.96674584824], [0.0, 0.0, 393375.9049731021], [0.0, 0.0, 393375.8678954461], [0.0, 0.0, 393375.8555338923]], "total_force_vector": [[1.9576982595026493e-06, 0.0, -1.4289631508290768e-05], [1.958920620381832e-06, 0.0, -1.4284509234130383e-05], [2.0524348656181246e-06, 0.0, -1.4264427591115236e-05], [1.965101546375081e-06, 0.0, -1.4246965292841196e-05], [1.9841572793666273e-06, 0.0, -1.4200166333466768e-05], [1.9697818061104044e-06, 0.0, -1.4168617781251669e-05], [1.9628732843557373e-06, 0.0, -1.4098593965172768e-05], [1.926313416333869e-06, 0.0, -1.405196962878108e-05], [1.9180370145477355e-06, 0.0, -1.3957498595118523e-05], [1.894202796393074e-06, 0.0, -1.3876822777092457e-05], [1.8624505173647776e-06, 0.0, -1.3774028047919273e-05], [1.8423270375933498e-06, 0.0, -1.367158256471157e-05], [1.8113241821993142e-06, 0.0, -1.3543758541345596e-05], [1.782518666004762e-06, 0.0, -1.3427343219518661e-05], [1.7411894077667966e-06, 0.0, -1.3289565686136484e-05], [1.7092843336286023e-06, 0.0, -1.3149110600352287e-05], [1.6666344890836626e-06, 0.0, -1.2998876627534628e-05], [1.6259800759144127e-06, 0.0, -1.2833974324166775e-05], [1.5869209164520726e-06, 0.0, -1.2661388609558344e-05], [1.5447803889401257e-06, 0.0, -1.2481003068387508e-05], [1.4964480214985088e-06, 0.0, -1.2285949196666479e-05], [1.445663656340912e-06, 0.0, -1.2102187611162663e-05], [1.403872374794446e-06, 0.0, -1.187669113278389e-05], [1.3525968824978918e-06, 0.0, -1.1679832823574543e-05], [1.2992441043024883e-06, 0.0, -1.1460331734269857e-05], [1.25024416774977e-06, 0.0, -1.1224299669265747e-05], [1.1881038517458364e-06, 0.0, -1.099688233807683e-05], [1.127156792790629e-06, 0.0, -1.0743213351815939e-05], [1.0731255315477028e-06, 0.0, -1.050956780090928e-05], [1.0170333553105593e-06, 0.0, -1.0233372449874878e-05], [9.617579053156078e-07, 0.0, -9.973184205591679e-06], [9.048599167726934e-07, 0.0, -9.701470844447613e-06], [8.522201824234799e-07, 0.0, -9.441457223147154e-06], [7.88819306762889e-07, 0.0, -9.153562132269144e-06], [7.258040568558499e-07, 0.0, -8.868752047419548e-06], [6.703321560053155e-07, 0.0, -8.582253940403461e-06], [6.113223207648844e-07, 0.0, -8.275324944406748e-06], [5.519577825907618e-07, 0.0, -7.966882549226284e-06], [4.98950612382032e-07, 0.0, -7.666647434234619e-06], [4.3930231186095625e-07, 0.0, -7.367983926087618e-06], [3.809054760495201e-07, 0.0, -7.04923877492547e-06], [3.2285242923535407e-07, 0.0, -6.726884748786688e-06], [2.6297857402823865e-07, 0.0, -6.417336408048868e-06], [2.112028596457094e-07, 0.0, -6.0808961279690266e-06], [1.5935620467644185e-07, 0.0, -5.764595698565245e-06], [9.807445167098194e-08, 0.0, -5.43397618457675e-06], [4.979847290087491e-08, 0.0, -5.096138920634985e-06], [-6.601112545467913e-09, 0.0, -4.780711606144905e-06], [-5.665606295224279e-08, 0.0, -4.442466888576746e-06], [-1.0212897905148566e-07, 0.0, -4.099856596440077e-06], [-1.5029218047857285e-07, 0.0, -3.7658028304576874e-06], [-1.926073309732601e-07, 0.0, -3.4213881008327007e-06], [-2.4697692424524575e-07, 0.0, -3.094784915447235e-06], [-2.829401637427509e-07, 0.0, -2.7445494197309017e-06], [-3.3133983379229903e-07, 0.0, -2.411194145679474e-06], [-3.721470420714468e-07, 0.0, -2.0720763131976128e-06], [-4.067405825480819e-07, 0.0, -1.722655724734068e-06], [-4.42763848695904e-07, 0.0, -1.3867393136024475e-06], [-4.780777089763433e-07, 0.0, -1.0511139407753944e-06], [-5.121728463564068e-07, 0.0, -7.182825356721878e-07], [-5.458896339405328e-07, 0.0, -3.8190046325325966e-07], [-5.743277142755687e-07, 0.0, -4.575122147798538e-08], [-6.037062121322379e-07, 0.0, 2.8597423806786537e-07], [-6.26223481958732e-07, 0.0, 6.11587893217802e-07], [-6.542431947309524e-07, 0.0, 9.412760846316814e-07], [-6.720620149280876e-07, 0.0, 1.2706732377409935e-06], [-6.998780008871108e-07, 0.0, 1.5842379070818424e-06], [-7.123471732484177e-07, 0.0, 1.91893195733428e-06], [-7.317103154491633e-07, 0.0, 2.226035576313734e-06], [-7.445669325534254e-07, 0.0, 2.5445478968322277e-06], [-7.564358384115621e-07, 0.0, 2.8628273867070675e-06], [-7.697726687183604e-07, 0.0, 3.1666713766753674e-06], [-7.771141099510714e-07, 0.0, 3.475986886769533e-06], [-7.865928637329489e-07, 0.0, 3.7727877497673035e-06], [-7.900871423771605e-07, 0.0, 4.072557203471661e-06], [-7.996040949365124e-07, 0.0, 4.364992491900921e-06], [-7.993530743988231e-07, 0.0, 4.6513741835951805e-06], [-8.012648322619498e-07, 0.0, 4.945555701851845e-06], [-8.015558705665171e-07, 0.0, 5.222915206104517e-06], [-7.986436685314402e-07, 0.0, 5.502370186150074e-06], [-7.923426892375574e-07, 0.0, 5.7729193940758705e-06], [-7.882536010583863e-07, 0.0, 6.039626896381378e-06], [-7.85190422902815e-07, 0.0, 6.298534572124481e-06], [-7.729577191639692e-07, 0.0, 6.557384040206671e-06], [-7.726102921878919e-07, 0.0, 6.8041845224797726e-06], [-7.564831321360543e-07, 0.0, 7.0593087002635e-06], [-7.404978532576934e-07, 0.0, 7.300521247088909e-06], [-7.381513569271192e-07, 0.0, 7.531722076237202e-06], [-7.209710020106286e-07, 0.0, 7.764785550534725e-06], [-7.050075510051101e-07, 0.0, 8.001341484487057e-06], [-6.941118044778705e-07, 0.0, 8.2197948358953e-06], [-6.715545168844983e-07, 0.0, 8.436152711510658e-06], [-6.591435521841049e-07, 0.0, 8.651113603264093e-06], [-6.468253559432924e-07, 0.0, 8.846400305628777e-06], [-6.293576007010415e-07, 0.0, 9.049195796251297e-06], [-6.142272468423471e-07, 0.0, 9.24849882721901e-06], [-5.946967576164752e-07, 0.0, 9.432958904653788e-06], [-5.716319719795138e-07, 0.0, 9.625451639294624e-06], [-5.500369297806174e-07, 0.0, 9.800016414374113e-06], [-5.365109245758504e-07, 0.0, 9.970797691494226e-06], [-5.133424565428868e-07, 0.0, 1.0128132998943329e-05], [-5.007914296584204e-07, 0.0, 1.0284478776156902e-05], [-4.769190127262846e-07, 0.0, 1.0447576642036438e-05], [-4.5343949750531465e-07, 0.0, 1.0596297215670347e-05], [-4.4105945562478155e-07, 0.0, 1.0738265700638294e-05], [-4.174471541773528e-07, 0.0, 1.0879128240048885e-05], [-4.0239137888420373e-07, 0.0, 1.0998803190886974e-05], [-3.8453072193078697e-07, 0.0, 1.1135765817016363e-05], [-3.719069354701787e-07, 0.0, 1.1252646800130606e-05], [-3.553886926965788e-07, 0.0, 1.1362775694578886e-05], [-3.2929347071330994e-07, 0.0, 1.1469004675745964e-05], [-3.2023308449424803e-07, 0.0, 1.156982034444809e-05], [-3.014538378920406e-07, 0.0, 1.1670694220811129e-05], [-2.895067154895514e-07, 0.0, 1.1752941645681858e-05], [-2.73919795290567e-07, 0.0, 1.1842988897114992e-05], [-2.598753781057894e-07, 0.0, 1.1923315469175577e-05], [-2.499455149518326e-07, 0.0, 1.199403777718544e-05], [-2.4113796825986356e-07, 0.0, 1.2066331692039967e-05], [-2.2815220290794969e-07, 0.0, 1.2115691788494587e-05], [-2.203305484727025e-07, 0.0, 1.2178439646959305e-05], [-2.0238803699612617e-07, 0.0, 1.2226752005517483e-05], [-1.9316757970955223e-07, 0.0, 1.2268952559679747e-05], [-1.8833816284313798e-07, 0.0, 1.2310571037232876e-05], [-1.853713911259547e-07, 0.0, 1.2343283742666245e-05], [-1.819371391320601e-07, 0.0, 1.2365344446152449e-05], [-1.8620630726218224e-07, 0.0, 1.238298136740923e-05], [-1.8483115127310157e-07, 0.0, 1.240079291164875e-05], [-1.9747676560655236e-07, 0.0, 1.2408476322889328e-05], [-1.902826625155285e-07, 0.0, 1.2418197002261877e-05]], "time": [[0.0], [0.00956829599728237], [0.038267420405405754], [0.08608008594495468], [0.15297749205403643], [0.2389193422366723], [0.34385386833587644], [0.4677178617168903], [0.6104367113416677], [0.7719244487117971], [0.9520837996527062], [1.1508062429079762], [1.3679720755085025], [1.6034504848770776], [1.8570996276250058], [2.1287667149932465], [2.4182881048866602], [2.7254894004458694], [3.0501855550974315], [3.392180984018953], [3.7512696819520848], [4.127235347292383], [4.519851512381309], [4.9288816799218775], [5.3540794654357855], [5.795188745676207], [6.251943812906863], [6.7240695349544275], [7.211281520937859], [7.713286292574826], [8.229781460962064], [8.760455908723134], [9.304989977413904], [9.863055660072831], [10.434316798800106], [11.01842928724658], [11.615041277890594], [12.223793393977742], [12.844318945995994], [13.476244152555772], [14.119188365541838], [14.77276429940153], [15.436578264431066], [16.11023040391951], [16.793314935007515], [17.485420393115735], [18.186129879795686], [18.895021313853814], [19.611667685597393], [20.335637314049226], [21.0664941069761], [21.803797823574442], [22.547104339654958], [23.295965915166356], [24.049931463897295], [24.808546825193822], [25.571355037528722], [26.337896613758133], [27.107709817899384], [27.88033094326344], [28.65529459177457], [29.432133954308664], [30.21038109188162], [30.989567217518303], [31.76922297863227], [32.548878739746236], [33.32806486538293], [34.10631200295588], [34.88315136548998], [35.658115014001105], [36.430736139365166], [37.20054934350641], [37.967090919735824], [38.72989913207073], [39.48851449336725], [40.242480042098194], [40.991341617609585], [41.7346481336901], [42.47195185028845], [43.20280864321533], [43.92677827166715], [44.64342464341073], [45.352316077468856], [46.05302556414882], [46.745131022257034], [47.428215553345034], [48.10186769283348], [48.76568165786301], [49.4192575917227], [50.062201804708785], [50.69412701126855], [51.314652563286806], [51.923404679373945], [52.52001667001797], [53.104129158464445], [53.67539029719172], [54.23345597985064], [54.777990048541405], [55.30866449630248], [55.82515966468972], [56.32716443632669], [56.814376422310126], [57.286502144357684], [57.743257211588336], [58.18436649182877], [58.60956427734267], [59.018594444883234], [59.41121060997216], [59.78717627531246], [60.14626497324559], [60.48826040216712], [60.81295655681868], [61.120157852377886], [61.4096792422713], [61.68134632963954], [61.93499547238747], [62.170473881756045], [62.387639714356574], [62.586362157611845], [62.76652150855275], [62.92800924592288], [63.07072809554766], [63.19459208892868], [63.29952661502788], [63.38546846521051], [63.45236587131959], [63.500178536859146], [63.528877661267266], [63.53844595726455]]}, "body": {"inertial_rotations": [[0.0, 0.130528028950854, 0.0], [0.0, 0.1305274053889881, 0.0], [0.0, 0.13052553509270978, 0.0], [0.0, 0.13052241922975918, 0.0], [0.0, 0.13051805974539687, 0.0], [0.0, 0.1305124593611942, 0.0], [0.0, 0.130505621573029, 0.0], [0.0, 0.1304975506488089, 0.0], [0.0, 0.13048825162539518, 0.0], [0.0, 0.1304777303052898, 0.0], [0.0, 0.1304659932525202, 0.0], [0.0, 0.13045304778821346, 0.0], [0.0, 0.13043890198552144, 0.0], [0.0, 0.13042356466413585, 0.0], [0.0, 0.13040704538418105, 0.0], [0.0, 0.1303893544397282, 0.0], [0.0, 0.1303705028517197, 0.0], [0.0, 0.13035050236044915, 0.0], [0.0, 0.13032936541755785, 0.0], [0.0, 0.1303071051775358, 0.0], [0.0, 0.13028373548876812, 0.0], [0.0, 0.13025927088413802, 0.0], [0.0, 0.13023372657110463, 0.0], [0.0, 0.13020711842149874, 0.0], [0.0, 0.13017946296065067, 0.0], [0.0, 0.1301507773563173, 0.0], [0.0, 0.1301210794070809, 0.0], [0.0, 0.13009038753031818, 0.0], [0.0, 0.13005872074989647, 0.0], [0.0, 0.1300260986833097, 0.0], [0.0, 0.12999254152865966, 0.0], [0.0, 0.12995807005105073, 0.0], [0.0, 0.12992270556881222, 0.0], [0.0, 0.12988646993925304, 0.0], [0.0, 0.1298493855442144, 0.0], [0.0, 0.12981147527518866, 0.0], [0.0, 0.12977276251820025, 0.0], [0.0, 0.1297332711384102, 0.0], [0.0, 0.12969302546439404, 0.0], [0.0, 0.12965205027217694, 0.0], [0.0, 0.12961037076901735, 0.0], [0.0, 0.1295680125769819, 0.0], [0.0, 0.12952500171624567, 0.0], [0.0, 0.1294813645881701, 0.0], [0.0, 0.12943712795828555, 0.0], [0.0, 0.1293923189389238, 0.0], [0.0, 0.12934696497182754, 0.0], [0.0, 0.1293010938105312, 0.0], [0.0, 0.12925473350254693, 0.0], [0.0, 0.12920791237154403, 0.0], [0.0, 0.12916065899929874, 0.0], [0.0, 0.12911300220755623, 0.0], [0.0, 0.12906497103985823, 0.0], [0.0, 0.12901659474317906, 0.0], [0.0, 0.12896790274964376, 0.0], [0.0, 0.12891892465802382, 0.0], [0.0, 0.12886969021531747, 0.0], [0.0, 0.12882022929825793, 0.0], [0.0, 0.1287705718947642, 0.0], [0.0, 0.12872074808544923, 0.0], [0.0, 0.12867078802509396, 0.0], [0.0, 0.12862072192416094, 0.0], [0.0, 0.12857058003032704, 0.0], [0.0, 0.12852039261005724, 0.0], [0.0, 0.12847018993023354, 0.0], [0.0, 0.12842000223986166, 0.0], [0.0, 0.12836985975184567, 0.0], [0.0, 0.1283197926248092, 0.0], [0.0, 0.12826983094512942, 0.0], [0.0, 0.12822000470890801, 0.0], [0.0, 0.12817034380422895, 0.0], [0.0, 0.12812087799344438, 0.0], [0.0, 0.12807163689560597, 0.0], [0.0, 0.12802264996910254, 0.0], [0.0, 0.12797394649437563, 0.0], [0.0, 0.12792555555687515, 0.0], [0.0, 0.12787750603013448, 0.0], [0.0, 0.12782982655905376, 0.0], [0.0, 0.12778254554339852, 0.0], [0.0, 0.1277356911214303, 0.0], [0.0, 0.1276892911538289, 0.0], [0.0, 0.12764337320776573, 0.0], [0.0, 0.12759796454123817, 0.0], [0.0, 0.12755309208761142, 0.0], [0.0, 0.12750878244042646, 0.0], [0.0, 0.127465061838403, 0.0], [0.0, 0.12742195615076832, 0.0], [0.0, 0.12737949086276115, 0.0], [0.0, 0.12733769106144302, 0.0], [0.0, 0.12729658142178701, 0.0], [0.0, 0.12725618619302753, 0.0], [0.0, 0.1272165291852569, 0.0], [0.0, 0.12717763375636842, 0.0], [0.0, 0.12713952279925397, 0.0], [0.0, 0.1271022187292706, 0.0], [0.0, 0.1270657434720774, 0.0], [0.0, 0.1270301184517118, 0.0], [0.0, 0.1269953645789788, 0.0], [0.0, 0.12696150224020752, 0.0], [0.0, 0.12692855128623617, 0.0], [0.0, 0.12689653102179063, 0.0], [0.0, 0.12686546019513592, 0.0], [0.0, 0.12683535698807727, 0.0], [0.0, 0.1268062390063001, 0.0], [0.0, 0.12677812326999058, 0.0], [0.0, 0.12675102620483455, 0.0], [0.0, 0.12672496363335517, 0.0], [0.0, 0.12669995076652457, 0.0], [0.0, 0.12667600219583489, 0.0], [0.0, 0.12665313188557223, 0.0], [0.0, 0.12663135316553648, 0.0], [0.0, 0.12661067872407036, 0.0], [0.0, 0.1265911206014298, 0.0], [0.0, 0.12657269018353337, 0.0], [0.0, 0.1265553981960044, 0.0], [0.0, 0.12653925469865057, 0.0], [0.0, 0.12652426908021808, 0.0], [0.0, 0.12651045005353587, 0.0], [0.0, 0.1264978056510353, 0.0], [0.0, 0.12648634322055735, 0.0], [0.0, 0.1264760694216232, 0.0], [0.0, 0.12646699022195826, 0.0], [0.0, 0.12645911089443598, 0.0], [0.0, 0.12645243601437428, 0.0], [0.0, 0.126446969457175, 0.0], [0.0, 0.1264427143963325, 0.0], [0.0, 0.1264396733018091, 0.0], [0.0, 0.12643784793877752, 0.0], [0.0, 0.12643723936669118, 0.0]], "transform_to_inertial": [[[0.9914933049066967, 0.0, 0.13015769790986625], [0.0, 1.0, 0.0], [-0.13015769790986625, 0.0, 0.9914933049066967]], [[0.991493386067881, 0.0, 0.13015707965242573], [0.0, 1.0, 0.0], [-0.13015707965242573, 0.0, 0.991493386067881]], [[0.9914936294984485, 0.0, 0.13015522526580814], [0.0, 1.0, 0.0], [-0.13015522526580814, 0.0, 0.9914936294984485]], [[0.9914940350394797, 0.0, 0.13015213590691044], [0.0, 1.0, 0.0], [-0.13015213590691044, 0.0, 0.9914940350394797]], [[0.9914946024262592, 0.0, 0.13014781350293259], [0.0, 1.0, 0.0], [-0.13014781350293259, 0.0, 0.9914946024262592]], [[0.9914953312884692, 0.0, 0.13014226075018318], [0.0, 1.0, 0.0], [-0.13014226075018318, 0.0, 0.9914953312884692]], [[0.9914962211505007, 0.0, 0.13013548111209866], [0.0, 1.0, 0.0], [-0.13013548111209866, 0.0, 0.9914962211505007]], [[0.9914972714318142, 0.0, 0.13012747881699482], [0.0, 1.0, 0.0], [-0.13012747881699482, 0.0, 0.9914972714318142]], [[0.9914984814474181, 0.0, 0.1301182588550271], [0.0, 1.0, 0.0], [-0.1301182588550271, 0.0, 0.9914984814474181]], [[0.9914998504083925, 0.0, 0.13010782697491804], [0.0, 1.0, 0.0], [-0.13010782697491804, 0.0, 0.9914998504083925]], [[0.9915013774225298, 0.0, 0.13009618967989128], [0.0, 1.0, 0.0], [-0.13009618967989128, 0.0, 0.9915013774225298]], [[0.9915030614950292, 0.0, 0.13008335422329906], [0.0, 1.0, 0.0], [-0.13008335422329906, 0.0, 0.9915030614950292]], [[0.9915049015292898, 0.0, 0.13006932860360798], [0.0, 1.0, 0.0], [-0.13006932860360798, 0.0, 0.9915049015292898]], [[0.9915068963277673, 0.0, 0.1300541215589801], [0.0, 1.0, 0.0], [-0.1300541215589801, 0.0, 0.9915068963277673]], [[0.9915090445929261, 0.0, 0.1300377425612383], [0.0, 1.0, 0.0], [-0.1300377425612383, 0.0, 0.9915090445929261]], [[0.9915113449282503, 0.0, 0.13002020180945792], [0.0, 1.0, 0.0], [-0.13002020180945792, 0.0, 0.9915113449282503]], [[0.9915137958393446, 0.0, 0.1300015102229752], [0.0, 1.0, 0.0], [-0.1300015102229752, 0.0, 0.9915137958393446]], [[0.9915163957351024, 0.0, 0.12998167943395664], [0.0, 1.0, 0.0], [-0.12998167943395664, 0.0, 0.9915163957351024]], [[0.9915191429289472, 0.0, 0.12996072177948978], [0.0, 1.0, 0.0], [-0.12996072177948978, 0.0, 0.9915191429289472]], [[0.9915220356401493, 0.0, 0.1299386502931846], [0.0, 1.0, 0.0], [-0.1299386502931846, 0.0, 0.9915220356401493]], [[0.9915250719952091, 0.0, 0.129915478696325], [0.0, 1.0, 0.0], [-0.129915478696325, 0.0, 0.9915250719952091]], [[0.9915282500293082, 0.0, 0.12989122138858192], [0.0, 1.0, 0.0], [-0.12989122138858192, 0.0, 0.9915282500293082]], [[0.9915315676878353, 0.0, 0.1298658934382067], [0.0, 1.0, 0.0], [-0.1298658934382067, 0.0, 0.9915315676878353]], [[0.9915350228279572, 0.0, 0.12983951057194568], [0.0, 1.0, 0.0], [-0.12983951057194568, 0.0, 0.9915350228279572]], [[0.9915386132202828, 0.0, 0.12981208916429365], [0.0, 1.0, 0.0], [-0.12981208916429365, 0.0, 0.9915386132202828]], [[0.991542336550559, 0.0, 0.12978364622654862], [0.0, 1.0, 0.0], [-0.12978364622654862, 0.0, 0.991542336550559]], [[0.9915461904214414, 0.0, 0.1297541993953438], [0.0, 1.0, 0.0], [-0.1297541993953438, 0.0, 0.9915461904214414]], [[0.9915501723543242, 0.0, 0.12972376692075396], [0.0, 1.0, 0.0], [-0.12972376692075396, 0.0, 0.9915501723543242]], [[0.9915542797912102, 0.0, 0.12969236765413164], [0.0, 1.0, 0.0], [-0.12969236765413164, 0.0, 0.9915542797912102]], [[0.9915585100966572, 0.0, 0.12966002103538837], [0.0, 1.0, 0.0], [-0.12966002103538837, 0.0, 0.9915585100966572]], [[0.9915628605597457, 0.0, 0.12962674708012278], [0.0, 1.0, 0.0], [-0.12962674708012278, 0.0, 0.9915628605597457]], [[0.9915673283961258, 0.0, 0.1295925663661673], [0.0, 1.0, 0.0], [-0.1295925663661673, 0.0, 0.9915673283961258]], [[0.9915719107500862, 0.0, 0.12955750001996402], [0.0, 1.0, 0.0], [-0.12955750001996402, 0.0, 0.9915719107500862]], [[0.9915766046966853, 0.0, 0.1295215697024768], [0.0, 1.0, 0.0], [-0.1295215697024768, 0.0, 0.9915766046966853]], [[0.991581407243907, 0.0, 0.12948479759490317], [0.0, 1.0, 0.0], [-0.12948479759490317, 0.0, 0.991581407243907]], [[0.9915863153348727, 0.0, 0.1294472063839556], [0.0, 1.0, 0.0], [-0.1294472063839556, 0.0, 0.9915863153348727]], [[0.9915913258500809, 0.0, 0.12940881924690678], [0.0, 1.0, 0.0], [-0.12940881924690678, 0.0, 0.9915913258500809]], [[0.9915964356096811, 0.0, 0.1293696598363603], [0.0, 1.0, 0.0], [-0.1293696598363603, 0.0, 0.9915964356096811]], [[0.9916016413757855, 0.0, 0.129329752264697], [0.0, 1.0, 0.0], [-0.129329752264697, 0.0, 0.9916016413757855]], [[0.9916069398548096, 0.0, 0.12928912108828006], [0.0, 1.0, 0.0], [-0.12928912108828006, 0.0, 0.9916069398548096]], [[0.9916123276998386, 0.0, 0.12924779129140998], [0.0, 1.0, 0.0], [-0.12924779129140998, 0.0, 0.9916123276998386]], [[0.9916178015130171, 0.0, 0.12920578827007184], [0.0, 1.0, 0.0], [-0.12920578827007184, 0.0, 0.9916178015130171]], [[0.9916233578479672, 0.0, 0.12916313781540945], [0.0, 1.0, 0.0], [-0.12916313781540945, 0.0, 0.9916233578479672]], [[0.9916289932122287, 0.0, 0.1291198660969779], [0.0, 1.0, 0.0], [-0.1291198660969779, 0.0, 0.9916289932122287]], [[0.991634704069705, 0.0, 0.12907599964590066], [0.0, 1.0, 0.0], [-0.12907599964590066, 0.0, 0.991634704069705]], [[0.9916404868431443, 0.0, 0.1290315653376786], [0.0, 1.0, 0.0], [-0.1290315653376786, 0.0, 0.9916404868431443]], [[0.9916463379166176, 0.0, 0.1289865903749746], [0.0, 1.0, 0.0], [-0.1289865903749746, 0.0, 0.9916463379166176]], [[0.9916522536380147, 0.0, 0.1289411022701706], [0.0, 1.0, 0.0], [-0.1289411022701706, 0.0, 0.9916522536380147]], [[0.9916582303215573, 0.0, 0.12889512882772997], [0.0, 1.0, 0.0], [-0.12889512882772997, 0.0, 0.9916582303215573]], [[0.991664264250302, 0.0, 0.1288486981265518], [0.0, 1.0, 0.0], [-0.1288486981265518, 0.0, 0.991664264250302]], [[0.9916703516786614, 0.0, 0.12880183850209637], [0.0, 1.0, 0.0], [-0.12880183850209637, 0.0, 0.9916703516786614]], [[0.9916764888349267, 0.0, 0.12875457852842165], [0.0, 1.0, 0.0], [-0.12875457852842165, 0.0, 0.9916764888349267]], [[0.9916826719237821, 0.0, 0.12870694700018462], [0.0, 1.0, 0.0], [-0.12870694700018462, 0.0, 0.9916826719237821]], [[0.9916888971288318, 0.0, 0.1286589729144505], [0.0, 1.0, 0.0], [-0.1286589729144505, 0.0, 0.9916888971288318]], [[0.991695160615104, 0.0, 0.1286106854525821], [0.0, 1.0, 0.0], [-0.1286106854525821, 0.0, 0.991695160615104]], [[0.9917014585315712, 0.0, 0.12856211396190678], [0.0, 1.0, 0.0], [-0.12856211396190678, 0.0, 0.9917014585315712]], [[0.9917077870136455, 0.0, 0.1285132879374654], [0.0, 1.0, 0.0], [-0.1285132879374654, 0.0, 0.9917077870136455]], [[0.9917141421856704, 0.0, 0.1284642370036883], [0.0, 1.0, 0.0], [-0.1284642370036883, 0.0, 0.9917141421856704]], [[0.9917205201634063, 0.0, 0.12841499089601233], [0.0, 1.0, 0.0], [-0.12841499089601233, 0.0, 0.9917205201634063]], [[0.9917269170564937, 0.0, 0.12836557944255295], [0.0, 1.0, 0.0], [-0.12836557944255295, 0.0, 0.9917269170564937]], [[0.9917333289709086, 0.0, 0.12831603254574075], [0.0, 1.0, 0.0], [-0.12831603254574075, 0.0, 0.9917333289709086]], [[0.9917397520113961, 0.0, 0.12826638016399516], [0.0, 1.0, 0.0], [-0.12826638016399516, 0.0, 0.9917397520113961]], [[0.9917461822838893, 0.0, 0.12821665229341553], [0.0, 1.0, 0.0], [-0.12821665229341553, 0.0, 0.9917461822838893]], [[0.991752615897907, 0.0, 0.12816687894951057], [0.0, 1.0, 0.0], [-0.12816687894951057, 0.0, 0.991752615897907]], [[0.9917590489689306, 0.0, 0.12811709014898118], [0.0, 1.0, 0.0], [-0.12811709014898118, 0.0, 0.9917590489689306]], [[0.9917654776207563, 0.0, 0.12806731589157797], [0.0, 1.0, 0.0], [-0.12806731589157797, 0.0, 0.9917654776207563]], [[0.9917718979878233, 0.0, 0.1280175861420247], [0.0, 1.0, 0.0], [-0.1280175861420247, 0.0, 0.9917718979878233]], [[0.991778306217523, 0.0, 0.12796793081198574], [0.0, 1.0, 0.0], [-0.12796793081198574, 0.0, 0.991778306217523]], [[0.9917846984724655, 0.0, 0.12791837974224293], [0.0, 1.0, 0.0], [-0.12791837974224293, 0.0, 0.9917846984724655]], [[0.9917910709327399, 0.0, 0.127868962684808], [0.0, 1.0, 0.0], [-0.127868962684808, 0.0, 0.9917910709327399]], [[0.9917974197981243, 0.0, 0.12781970928531755], [0.0, 1.0, 0.0], [-0.12781970928531755, 0.0, 0.9917974197981243]], [[0.9918037412902779, 0.0, 0.1277706490654543], [0.0, 1.0, 0.0], [-0.1277706490654543, 0.0, 0.9918037412902779]], [[0.9918100316549007, 0.0, 0.12772181140551084], [0.0, 1.0, 0.0], [-0.12772181140551084, 0.0, 0.9918100316549007]], [[0.9918162871638537, 0.0, 0.127673225527156], [0.0, 1.0, 0.0], [-0.127673225527156, 0.0, 0.9918162871638537]], [[0.9918225041172558, 0.0, 0.12762492047627721], [0.0, 1.0, 0.0], [-0.12762492047627721, 0.0, 0.9918225041172558]], [[0.9918286788455368, 0.0, 0.12757692510605909], [0.0, 1.0, 0.0], [-0.12757692510605909, 0.0, 0.9918286788455368]], [[0.9918348077114632, 0.0, 0.127529268060179], [0.0, 1.0, 0.0], [-0.127529268060179, 0.0, 0.9918348077114632]], [[0.9918408871121244, 0.0, 0.12748197775620762], [0.0, 1.0, 0.0], [-0.12748197775620762, 0.0, 0.9918408871121244]], [[0.9918469134808807, 0.0, 0.1274350823692214], [0.0, 1.0, 0.0], [-0.1274350823692214, 0.0, 0.9918469134808807]], [[0.9918528832892824, 0.0, 0.12738860981554484], [0.0, 1.0, 0.0], [-0.12738860981554484, 0.0, 0.9918528832892824]], [[0.9918587930489402, 0.0, 0.12734258773678028], [0.0, 1.0, 0.0], [-0.12734258773678028, 0.0, 0.9918587930489402]], [[0.9918646393133672, 0.0, 0.12729704348398654], [0.0, 1.0, 0.0], [-0.12729704348398654, 0.0, 0.9918646393133672]], [[0.9918704186797765, 0.0, 0.1272520041021151], [0.0, 1.0, 0.0], [-0.1272520041021151, 0.0, 0.9918704186797765]], [[0.9918761277908437, 0.0, 0.12720749631465075], [0.0, 1.0, 0.0], [-0.12720749631465075, 0.0, 0.9918761277908437]], [[0.9918817633364254, 0.0, 0.12716354650851544], [0.0, 1.0, 0.0], [-0.12716354650851544, 0.0, 0.9918817633364254]], [[0.9918873220552459, 0.0, 0.12712018071916412], [0.0, 1.0, 0.0], [-0.12712018071916412, 0.0, 0.9918873220552459]], [[0.9918928007365333, 0.0, 0.12707742461600302], [0.0, 1.0, 0.0], [-0.12707742461600302, 0.0, 0.9918928007365333]], [[0.9918981962216267, 0.0, 0.12703530348798076], [0.0, 1.0, 0.0], [-0.12703530348798076, 0.0, 0.9918981962216267]], [[0.9919035054055374, 0.0, 0.12699384222948343], [0.0, 1.0, 0.0], [-0.12699384222948343, 0.0, 0.9919035054055374]], [[0.9919087252384688, 0.0, 0.12695306532650422], [0.0, 1.0, 0.0], [-0.12695306532650422, 0.0, 0.9919087252384688]], [[0.9919138527272974, 0.0, 0.1269129968430712], [0.0, 1.0, 0.0], [-0.1269129968430712, 0.0, 0.9919138527272974]], [[0.9919188849370174, 0.0, 0.12687366040791942], [0.0, 1.0, 0.0], [-0.12687366040791942, 0.0, 0.9919188849370174]], [[0.9919238189921379, 0.0, 0.12683507920150627], [0.0, 1.0, 0.0], [-0.12683507920150627, 0.0, 0.9919238189921379]], [[0.9919286520780434, 0.0, 0.12679727594327853], [0.0, 1.0, 0.0], [-0.12679727594327853, 0.0, 0.9919286520780434]], [[0.991933381442317, 0.0, 0.12676027287920633], [0.0, 1.0, 0.0], [-0.12676027287920633, 0.0, 0.991933381442317]], [[0.991938004396015, 0.0, 0.126724091769684], [0.0, 1.0, 0.0], [-0.126724091769684, 0.0, 0.991938004396015]], [[0.9919425183149091, 0.0, 0.12668875387766798], [0.0, 1.0, 0.0], [-0.12668875387766798, 0.0, 0.9919425183149091]], [[0.9919469206406873, 0.0, 0.12665427995712564], [0.0, 1.0, 0.0], [-0.12665427995712564, 0.0, 0.9919469206406873]], [[0.9919512088821093, 0.0, 0.1266206902418476], [0.0, 1.0, 0.0], [-0.1266206902418476, 0.0, 0.9919512088821093]], [[0.9919553806161314, 0.0, 0.12658800443448764], [0.0, 1.0, 0.0], [-0.12658800443448764, 0.0, 0.9919553806161314]], [[0.9919594334889837, 0.0, 0.1265562416959924], [0.0, 1.0, 0.0], [-0.1265562416959924, 0.0, 0.9919594334889837]], [[0.991963365217214, 0.0, 0.12652542063530245], [0.0, 1.0, 0.0], [-0.12652542063530245, 0.0, 0.991963365217214]], [[0.9919671735886888, 0.0, 0.12649555929940037], [0.0, 1.0, 0.0], [-0.12649555929940037, 0.0, 0.9919671735886888]], [[0.9919708564635558, 0.0, 0.12646667516369525], [0.0, 1.0, 0.0], [-0.12646667516369525, 0.0, 0.9919708564635558]], [[0.9919744117751723, 0.0, 0.12643878512268628], [0.0, 1.0, 0.0], [-0.12643878512268628, 0.0, 0.9919744117751723]], [[0.9919778375309916, 0.0, 0.1264119054810017], [0.0, 1.0, 0.0], [-0.1264119054810017, 0.0, 0.9919778375309916]], [[0.9919811318134094, 0.0, 0.12638605194477487], [0.0, 1.0, 0.0], [-0.12638605194477487, 0.0, 0.9919811318134094]], [[0.9919842927805823, 0.0, 0.12636123961329263], [0.0, 1.0, 0.0], [-0.12636123961329263, 0.0, 0.9919842927805823]], [[0.9919873186671929, 0.0, 0.12633748297109995], [0.0, 1.0, 0.0], [-0.12633748297109995, 0.0, 0.9919873186671929]], [[0.9919902077851961, 0.0, 0.12631479588030692], [0.0, 1.0, 0.0], [-0.12631479588030692, 0.0, 0.9919902077851961]], [[0.991992958524515, 0.0, 0.1262931915733387], [0.0, 1.0, 0.0], [-0.1262931915733387, 0.0, 0.991992958524515]], [[0.9919955693537065, 0.0, 0.12627268264599345], [0.0, 1.0, 0.0], [-0.12627268264599345, 0.0, 0.9919955693537065]], [[0.9919980388205905, 0.0, 0.12625328105083944], [0.0, 1.0, 0.0], [-0.12625328105083944, 0.0, 0.9919980388205905]], [[0.9920003655528398, 0.0, 0.1262349980909897], [0.0, 1.0, 0.0], [-0.1262349980909897, 0.0, 0.9920003655528398]], [[0.992002548258542, 0.0, 0.12621784441416775], [0.0, 1.0, 0.0], [-0.12621784441416775, 0.0, 0.992002548258542]], [[0.9920045857267151, 0.0, 0.12620183000720867], [0.0, 1.0, 0.0], [-0.12620183000720867, 0.0, 0.9920045857267151]], [[0.9920064768277984, 0.0, 0.12618696419083375], [0.0, 1.0, 0.0], [-0.12618696419083375, 0.0, 0.9920064768277984]], [[0.9920082205141039, 0.0, 0.1261732556148133], [0.0, 1.0, 0.0], [-0.1261732556148133, 0.0, 0.9920082205141039]], [[0.9920098158202311, 0.0, 0.12616071225350323], [0.0, 1.0, 0.0], [-0.12616071225350323, 0.0, 0.9920098158202311]], [[0.9920112618634556, 0.0, 0.12614934140166822], [0.0, 1.0, 0.0], [-0.12614934140166822, 0.0, 0.9920112618634556]], [[0.9920125578440709, 0.0, 0.12613914967076603], [0.0, 1.0, 0.0], [-0.12613914967076603, 0.0, 0.9920125578440709]], [[0.9920137030457096, 0.0, 0.12613014298548442], [0.0, 1.0, 0.0], [-0.12613014298548442, 0.0, 0.9920137030457096]], [[0.9920146968356226, 0.0, 0.12612232658069628], [0.0, 1.0, 0.0], [-0.12612232658069628, 0.0, 0.9920146968356226]], [[0.9920155386649265, 0.0, 0.1261157049987659], [0.0, 1.0, 0.0], [-0.1261157049987659, 0.0, 0.9920155386649265]], [[0.9920162280688193, 0.0, 0.12611028208719685], [0.0, 1.0, 0.0], [-0.12611028208719685, 0.0, 0.9920162280688193]], [[0.9920167646667619, 0.0, 0.12610606099664803], [0.0, 1.0, 0.0], [-0.12610606099664803, 0.0, 0.9920167646667619]], [[0.9920171481626262, 0.0, 0.12610304417931478], [0.0, 1.0, 0.0], [-0.12610304417931478, 0.0, 0.9920171481626262]], [[0.9920173783448085, 0.0, 0.12610123338767573], [0.0, 1.0, 0.0], [-0.12610123338767573, 0.0, 0.9920173783448085]], [[0.9920174550863154, 0.0, 0.12610062967356675], [0.0, 1.0, 0.0], [-0.12610062967356675, 0.0, 0.9920174550863154]]], "thrust_force_vector": [[15757.837205990734, 0.0, 0.0], [15757.768510534643, 0.0, 0.0], [15757.562467580261, 0.0, 0.0], [15757.219206800264, 0.0, 0.0], [15756.738944947349, 0.0, 0.0], [15756.121984727728, 0.0, 0.0], [15755.368715174796, 0.0, 0.0], [15754.479611134806, 0.0, 0.0], [15753.455233078124, 0.0, 0.0], [15752.296226529803, 0.0, 0.0], [15751.003321742133, 0.0, 0.0], [15749.577333151383, 0.0, 0.0], [15748.019158736664, 0.0, 0.0], [15746.329779471214, 0.0, 0.0], [15744.510258552411, 0.0, 0.0], [15742.561740725816, 0.0, 0.0], [15740.485451390761, 0.0, 0.0], [15738.282695813465, 0.0, 0.0], [15735.954858162566, 0.0, 0.0], [15733.503400542564, 0.0, 0.0], [15730.929861972954, 0.0, 0.0], [15728.235857317864, 0.0, 0.0], [15725.423076146317, 0.0, 0.0], [15722.493281533049, 0.0, 0.0], [15719.448308861452, 0.0, 0.0], [15716.290064536475, 0.0, 0.0], [15713.02052463364, 0.0, 0.0], [15709.641733577531, 0.0, 0.0], [15706.155802701249, 0.0, 0.0], [15702.564908765215, 0.0, 0.0], [15698.871292507298, 0.0, 0.0], [15695.077257067385, 0.0, 0.0], [15691.18516643677, 0.0, 0.0], [15687.197443803245, 0.0, 0.0], [15683.116569959968, 0.0, 0.0], [15678.945081580088, 0.0, 0.0], [15674.685569486437, 0.0, 0.0], [15670.34067693885, 0.0, 0.0], [15665.91309783935, 0.0, 0.0], [15661.405574899865, 0.0, 0.0], [15656.820897847963, 0.0, 0.0], [15652.1619015413, 0.0, 0.0], [15647.431464087258, 0.0, 0.0], [15642.63250494427, 0.0, 0.0], [15637.767982977892, 0.0, 0.0], [15632.840894515128, 0.0, 0.0], [15627.85427142496, 0.0, 0.0], [15622.811179061238, 0.0, 0.0], [15617.714714338084, 0.0, 0.0], [15612.568003683702, 0.0, 0.0], [15607.374201026045, 0.0, 0.0], [15602.136485782774, 0.0, 0.0], [15596.858060790151, 0.0, 0.0], [15591.54215032297, 0.0, 0.0], [15586.191997950573, 0.0, 0.0], [15580.810864582818, 0.0, 0.0], [15575.402026350555, 0.0, 0.0], [15569.968772566232, 0.0, 0.0], [15564.514403678493, 0.0, 0.0], [15559.042229212708, 0.0, 0.0], [15553.555565719404, 0.0, 0.0], [15548.057734737724, 0.0, 0.0], [15542.552060739257, 0.0, 0.0], [15537.041869120885, 0.0, 0.0], [15531.530484147203, 0.0, 0.0], [15526.021226988041, 0.0, 0.0], [15520.517413652615, 0.0, 0.0], [15515.022353075108, 0.0, 0.0], [15509.539345059033, 0.0, 0.0], [15504.071678382768, 0.0, 0.0], [15498.622628812285, 0.0, 0.0], [15493.195457190059, 0.0, 0.0], [15487.793407527664, 0.0, 0.0], [15482.4197050952, 0.0, 0.0], [15477.077554574265, 0.0, 0.0], [15471.770138176018, 0.0, 0.0], [15466.500613856168, 0.0, 0.0], [15461.272113452475, 0.0, 0.0], [15456.087740949752, 0.0, 0.0], [15450.950570694933, 0.0, 0.0], [15445.863645671134, 0.0, 0.0], [15440.829975780684, 0.0, 0.0], [15435.85253617836, 0.0, 0.0], [15430.934265617532, 0.0, 0.0], [15426.078064786472, 0.0, 0.0], [15421.286794785354, 0.0, 0.0], [15416.5632754726, 0.0, 0.0], [15411.910283965339, 0.0, 0.0], [15407.33055317177, 0.0, 0.0], [15402.826770228728, 0.0, 0.0], [15398.4015751127, 0.0, 0.0], [15394.05755922755, 0.0, 0.0], [15389.797263967883, 0.0, 0.0], [15385.623179439011, 0.0, 0.0], [15381.537743097335, 0.0, 0.0], [15377.543338466054, 0.0, 0.0], [15373.642293908142, 0.0, 0.0], [15369.836881385134, 0.0, 0.0], [15366.129315285814, 0.0, 0.0], [15362.521751273018, 0.0, 0.0], [15359.0162852022, 0.0, 0.0], [15355.614951977532, 0.0, 0.0], [15352.319724591145, 0.0, 0.0], [15349.132513042643, 0.0, 0.0], [15346.05516339648, 0.0, 0.0], [15343.089456880734, 0.0, 0.0], [15340.237108914094, 0.0, 0.0], [15337.499768307212, 0.0, 0.0], [15334.879016396633, 0.0, 0.0], [15332.376366277726, 0.0, 0.0], [15329.993262034764, 0.0, 0.0], [15327.731077992332, 0.0, 0.0], [15325.591118117689, 0.0, 0.0], [15323.574615280972, 0.0, 0.0], [15321.682730710347, 0.0, 0.0], [15319.916553384895, 0.0, 0.0], [15318.277099511646, 0.0, 0.0], [15316.765312030306, 0.0, 0.0], [15315.3820601522, 0.0, 0.0], [15314.128138909555, 0.0, 0.0], [15313.004268817635, 0.0, 0.0], [15312.011095456031, 0.0, 0.0], [15311.149189214508, 0.0, 0.0], [15310.419044992052, 0.0, 0.0], [15309.821081956086, 0.0, 0.0], [15309.355643328401, 0.0, 0.0], [15309.022996251739, 0.0, 0.0], [15308.823331606867, 0.0, 0.0], [15308.756764003136, 0.0, 0.0]]}, "wind": {"body_rotations": [[0.0, 0.1828879065106839, 0.0], [0.0, 0.182887282948818, 0.0], [0.0, 0.18288541265253966, 0.0], [0.0, 0.1828822967895891, 0.0], [0.0, 0.18287793730522678, 0.0], [0.0, 0.1828723369210241, 0.0], [0.0, 0.1828654991328589, 0.0], [0.0, 0.1828574282086388, 0.0], [0.0, 0.18284812918522506, 0.0], [0.0, 0.1828376078651197, 0.0], [0.0, 0.18282587081235008, 0.0], [0.0, 0.1828129253480434, 0.0], [0.0, 0.18279877954535131, 0.0], [0.0, 0.18278344222396573, 0.0], [0.0, 0.18276692294401092, 0.0], [0.0, 0.18274923199955814, 0.0], [0.0, 0.1827303804115496, 0.0], [0.0, 0.18271037992027903, 0.0], [0.0, 0.18268924297738776, 0.0], [0.0, 0.1826669827373657, 0.0], [0.0, 0.18264361304859802, 0.0], [0.0, 0.1826191484439679, 0.0], [0.0, 0.18259360413093453, 0.0], [0.0, 0.1825669959813286, 0.0], [0.0, 0.18253934052048054, 0.0], [0.0, 0.18251065491614718, 0.0], [0.0, 0.18248095696691077, 0.0], [0.0, 0.18245026509014808, 0.0], [0.0, 0.18241859830972634, 0.0], [0.0, 0.18238597624313957, 0.0], [0.0, 0.18235241908848954, 0.0], [0.0, 0.18231794761088063, 0.0], [0.0, 0.18228258312864215, 0.0], [0.0, 0.18224634749908292, 0.0], [0.0, 0.18220926310404428, 0.0], [0.0, 0.18217135283501856, 0.0], [0.0, 0.18213264007803015, 0.0], [0.0, 0.18209314869824011, 0.0], [0.0, 0.18205290302422392, 0.0], [0.0, 0.18201192783200684, 0.0], [0.0, 0.18197024832884728, 0.0], [0.0, 0.1819278901368118, 0.0], [0.0, 0.18188487927607555, 0.0], [0.0, 0.18184124214800002, 0.0], [0.0, 0.18179700551811545, 0.0], [0.0, 0.1817521964987537, 0.0], [0.0, 0.18170684253165742, 0.0], [0.0, 0.18166097137036108, 0.0], [0.0, 0.18161461106237684, 0.0], [0.0, 0.18156778993137393, 0.0], [0.0, 0.18152053655912861, 0.0], [0.0, 0.18147287976738616, 0.0], [0.0, 0.18142484859968813, 0.0], [0.0, 0.18137647230300896, 0.0], [0.0, 0.18132778030947366, 0.0], [0.0, 0.18127880221785372, 0.0], [0.0, 0.18122956777514737, 0.0], [0.0, 0.18118010685808783, 0.0], [0.0, 0.18113044945459408, 0.0], [0.0, 0.18108062564527916, 0.0], [0.0, 0.18103066558492384, 0.0], [0.0, 0.1809805994839908, 0.0], [0.0, 0.18093045759015694, 0.0], [0.0, 0.18088027016988711, 0.0], [0.0, 0.18083006749006347, 0.0], [0.0, 0.18077987979969157, 0.0], [0.0, 0.18072973731167555, 0.0], [0.0, 0.18067967018463904, 0.0], [0.0, 0.1806297085049593, 0.0], [0.0, 0.18057988226873792, 0.0], [0.0, 0.18053022136405888, 0.0], [0.0, 0.18048075555327428, 0.0], [0.0, 0.18043151445543587, 0.0], [0.0, 0.1803825275289324, 0.0], [0.0, 0.18033382405420553, 0.0], [0.0, 0.18028543311670506, 0.0], [0.0, 0.18023738358996436, 0.0], [0.0, 0.18018970411888366, 0.0], [0.0, 0.1801424231032284, 0.0], [0.0, 0.18009556868126017, 0.0], [0.0, 0.1800491687136588, 0.0], [0.0, 0.18000325076759563, 0.0], [0.0, 0.17995784210106808, 0.0], [0.0, 0.17991296964744133, 0.0], [0.0, 0.17986866000025634, 0.0], [0.0, 0.17982493939823288, 0.0], [0.0, 0.17978183371059822, 0.0], [0.0, 0.17973936842259103, 0.0], [0.0, 0.1796975686212729, 0.0], [0.0, 0.17965645898161692, 0.0], [0.0, 0.17961606375285744, 0.0], [0.0, 0.1795764067450868, 0.0], [0.0, 0.17953751131619833, 0.0], [0.0, 0.17949940035908388, 0.0], [0.0, 0.17946209628910048, 0.0], [0.0, 0.17942562103190732, 0.0], [0.0, 0.17938999601154168, 0.0], [0.0, 0.1793552421388087, 0.0], [0.0, 0.1793213798000374, 0.0], [0.0, 0.17928842884606605, 0.0], [0.0, 0.1792564085816205, 0.0], [0.0, 0.17922533775496582, 0.0], [0.0, 0.17919523454790717, 0.0], [0.0, 0.17916611656612996, 0.0], [0.0, 0.17913800082982048, 0.0], [0.0, 0.17911090376466446, 0.0], [0.0, 0.17908484119318507, 0.0], [0.0, 0.17905982832635445, 0.0], [0.0, 0.1790358797556648, 0.0], [0.0, 0.1790130094454021, 0.0], [0.0, 0.17899123072536635, 0.0], [0.0, 0.17897055628390024, 0.0], [0.0, 0.17895099816125967, 0.0], [0.0, 0.17893256774336327, 0.0], [0.0, 0.1789152757558343, 0.0], [0.0, 0.17889913225848045, 0.0], [0.0, 0.17888414664004798, 0.0], [0.0, 0.17887032761336577, 0.0], [0.0, 0.17885768321086518, 0.0], [0.0, 0.17884622078038726, 0.0], [0.0, 0.17883594698145308, 0.0], [0.0, 0.17882686778178816, 0.0], [0.0, 0.17881898845426586, 0.0], [0.0, 0.17881231357420418, 0.0], [0.0, 0.17880684701700486, 0.0], [0.0, 0.1788025919561624, 0.0], [0.0, 0.17879955086163898, 0.0], [0.0, 0.17879772549860742, 0.0], [0.0, 0.1787971169265211, 0.0]], "velocity_vector": [[0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]], "lift_force_vector": [[0.0, 0.0, -390054.4816139758], [0.0, 0.0, -390054.4909286619], [0.0, 0.0, -390054.5188664849], [0.0, 0.0, -390054.56540884485], [0.0, 0.0, -390054.630524604], [0.0, 0.0, -390054.71417036344], [0.0, 0.0, -390054.8162902508], [0.0, 0.0, -390054.936816209], [0.0, 0.0, -390055.07566779066], [0.0, 0.0, -390055.23275250825], [0.0, 0.0, -390055.4079656701], [0.0, 0.0, -390055.601190624], [0.0, 0.0, -390055.8122987589], [0.0, 0.0, -390056.04114971095], [0.0, 0.0, -390056.2875913603], [0.0, 0.0, -390056.551460068], [0.0, 0.0, -390056.8325807478], [0.0, 0.0, -390057.13076702825], [0.0, 0.0, -390057.4458214245], [0.0, 0.0, -390057.7775354805], [0.0, 0.0, -390058.1256899419], [0.0, 0.0, -390058.49005497375], [0.0, 0.0, -390058.8703902402], [0.0, 0.0, -390059.2664453025], [0.0, 0.0, -390059.6779595777], [0.0, 0.0, -390060.1046627278], [0.0, 0.0, -390060.54627484345], [0.0, 0.0, -390061.0025065852], [0.0, 0.0, -390061.4730595589], [0.0, 0.0, -390061.9576263679], [0.0, 0.0, -390062.45589107974], [0.0, 0.0, -390062.9675292741], [0.0, 0.0, -390063.4922084312], [0.0, 0.0, -390064.02958808444], [0.0, 0.0, -390064.57932020875], [0.0, 0.0, -390065.1410493916], [0.0, 0.0, -390065.7144131274], [0.0, 0.0, -390066.2990421433], [0.0, 0.0, -390066.8945606341], [0.0, 0.0, -390067.5005865431], [0.0, 0.0, -390068.1167318449], [0.0, 0.0, -390068.7426028899], [0.0, 0.0, -390069.37780065875], [0.0, 0.0, -390070.0219209993], [0.0, 0.0, -390070.67455506476], [0.0, 0.0, -390071.33528944425], [0.0, 0.0, -390072.0037065767], [0.0, 0.0, -390072.6793850398], [0.0, 0.0, -390073.361899744], [0.0, 0.0, -390074.05082237336], [0.0, 0.0, -390074.7457216154], [0.0, 0.0, -390075.44616343116], [0.0, 0.0, -390076.1517114358], [0.0, 0.0, -390076.86192707205], [0.0, 0.0, -390077.5763700674], [0.0, 0.0, -390078.29459857335], [0.0, 0.0, -390079.01616954536], [0.0, 0.0, -390079.740639043], [0.0, 0.0, -390080.46756245155], [0.0, 0.0, -390081.19649482216], [0.0, 0.0, -390081.9269911307], [0.0, 0.0, -390082.6586065771], [0.0, 0.0, -390083.390896855], [0.0, 0.0, -390084.123418422], [0.0, 0.0, -390084.8557287649], [0.0, 0.0, -390085.58738668816], [0.0, 0.0, -390086.3179525832], [0.0, 0.0, -390087.0469886166], [0.0, 0.0, -390087.7740591329], [0.0, 0.0, -390088.4987307285], [0.0, 0.0, -390089.2205726409], [0.0, 0.0, -390089.939156944], [0.0, 0.0, -390090.65405875177], [0.0, 0.0, -390091.36485652544], [0.0, 0.0, -390092.0711322323], [0.0, 0.0, -390092.7724716335], [0.0, 0.0, -390093.4684644629], [0.0, 0.0, -390094.15870464995], [0.0, 0.0, -390094.8427905762], [0.0, 0.0, -390095.52032520407], [0.0, 0.0, -390096.1909163506], [0.0, 0.0, -390096.8541768402], [0.0, 0.0, -390097.5097247204], [0.0, 0.0, -390098.1571834275], [0.0, 0.0, -390098.7961820059], [0.0, 0.0, -390099.42635522335], [0.0, 0.0, -390100.0473438289], [0.0, 0.0, -390100.6587946469], [0.0, 0.0, -390101.2603607525], [0.0, 0.0, -390101.85170165804], [0.0, 0.0, -390102.43248347024], [0.0, 0.0, -390103.00237897923], [0.0, 0.0, -390103.5610678595], [0.0, 0.0, -390104.10823680274], [0.0, 0.0, -390104.64357959415], [0.0, 0.0, -390105.16679732245], [0.0, 0.0, -390105.6775984651], [0.0, 0.0, -390106.17569897615], [0.0, 0.0, -390106.6608224823], [0.0, 0.0, -390107.1327003063], [0.0, 0.0, -390107.5910716321], [0.0, 0.0, -390108.0356835708], [0.0, 0.0, -390108.46629127295], [0.0, 0.0, -390108.8826580564], [0.0, 0.0, -390109.2845554346], [0.0, 0.0, -390109.6717632276], [0.0, 0.0, -390110.0440696764], [0.0, 0.0, -390110.4012714285], [0.0, 0.0, -390110.74317374936], [0.0, 0.0, -390111.06959046307], [0.0, 0.0, -390111.3803440822], [0.0, 0.0, -390111.6752658659], [0.0, 0.0, -390111.95419585845], [0.0, 0.0, -390112.21698298526], [0.0, 0.0, -390112.4634850299], [0.0, 0.0, -390112.6935687726], [0.0, 0.0, -390112.9071099747], [0.0, 0.0, -390113.1039934247], [0.0, 0.0, -390113.284113023], [0.0, 0.0, -390113.44737172517], [0.0, 0.0, -390113.5936816904], [0.0, 0.0, -390113.72296421975], [0.0, 0.0, -390113.8351498124], [0.0, 0.0, -390113.9301782019], [0.0, 0.0, -390114.00799835625], [0.0, 0.0, -390114.06856849306], [0.0, 0.0, -390114.1118560992], [0.0, 0.0, -390114.1378379604], [0.0, 0.0, -390114.1465001213]], "drag_force_vector": [[-36087.120514177135, 0.0, 0.0], [-36087.054078455425, 0.0, 0.0], [-36086.85481307415, 0.0, 0.0], [-36086.52284336978, 0.0, 0.0], [-36086.05837811569, 0.0, 0.0], [-36085.46170941137, 0.0, 0.0], [-36084.73321243993, 0.0, 0.0], [-36083.873345239335, 0.0, 0.0], [-36082.882648340776, 0.0, 0.0], [-36081.76174442982, 0.0, 0.0], [-36080.51133787238, 0.0, 0.0], [-36079.132214242396, 0.0, 0.0], [-36077.62523975559, 0.0, 0.0], [-36075.99136067575, 0.0, 0.0], [-36074.23160263304, 0.0, 0.0], [-36072.34706992175, 0.0, 0.0], [-36070.33894471757, 0.0, 0.0], [-36068.20848625373, 0.0, 0.0], [-36065.957029944126, 0.0, 0.0], [-36063.58598644909, 0.0, 0.0], [-36061.09684069347, 0.0, 0.0], [-36058.49115083951, 0.0, 0.0], [-36055.77054718964, 0.0, 0.0], [-36052.9367310863, 0.0, 0.0], [-36049.99147369899, 0.0, 0.0], [-36046.93661482791, 0.0, 0.0], [-36043.77406163073, 0.0, 0.0], [-36040.505787298855, 0.0, 0.0], [-36037.13382972453, 0.0, 0.0], [-36033.660290077896, 0.0, 0.0], [-36030.08733140416, 0.0, 0.0], [-36026.41717711961, 0.0, 0.0], [-36022.6521095194, 0.0, 0.0], [-36018.79446821329, 0.0, 0.0], [-36014.846648561266, 0.0, 0.0], [-36010.81110004239, 0.0, 0.0], [-36006.69032460962, 0.0, 0.0], [-36002.486875017785, 0.0, 0.0], [-35998.203353108496, 0.0, 0.0], [-35993.8424080736, 0.0, 0.0], [-35989.40673469235, 0.0, 0.0], [-35984.89907155204, 0.0, 0.0], [-35980.32219923204, 0.0, 0.0], [-35975.67893846291, 0.0, 0.0], [-35970.972148294524, 0.0, 0.0], [-35966.20472419976, 0.0, 0.0], [-35961.37959620232, 0.0, 0.0], [-35956.49972697013, 0.0, 0.0], [-35951.56810988026, 0.0, 0.0], [-35946.587767107005, 0.0, 0.0], [-35941.561747667685, 0.0, 0.0], [-35936.49312546405, 0.0, 0.0], [-35931.384997331836, 0.0, 0.0], [-35926.24048105261, 0.0, 0.0], [-35921.062713401705, 0.0, 0.0], [-35915.854848145726, 0.0, 0.0], [-35910.620054072424, 0.0, 0.0], [-35905.36151300784, 0.0, 0.0], [-35900.08241782203, 0.0, 0.0], [-35894.785970453806, 0.0, 0.0], [-35889.475379926575, 0.0, 0.0], [-35884.153860374165, 0.0, 0.0], [-35878.824629068295, 0.0, 0.0], [-35873.49090445246, 0.0, 0.0], [-35868.15590418396, 0.0, 0.0], [-35862.82284318809, 0.0, 0.0], [-35857.49493172063, 0.0, 0.0], [-35852.175373429774, 0.0, 0.0], [-35846.86736346309, 0.0, 0.0], [-35841.57408653981, 0.0, 0.0], [-35836.298715084835, 0.0, 0.0], [-35831.04440735046, 0.0, 0.0], [-35825.81430555671, 0.0, 0.0], [-35820.6115340653, 0.0, 0.0], [-35815.43919755067, 0.0, 0.0], [-35810.3003792106, 0.0, 0.0], [-35805.19813898201, 0.0, 0.0], [-35800.135511784916, 0.0, 0.0], [-35795.115505794594, 0.0, 0.0], [-35790.1411007183, 0.0, 0.0], [-35785.2152461183, 0.0, 0.0], [-35780.340859741926, 0.0, 0.0], [-35775.520825886924, 0.0, 0.0], [-35770.75799378665, 0.0, 0.0], [-35766.05517602964, 0.0, 0.0], [-35761.41514699272, 0.0, 0.0], [-35756.84064132312, 0.0, 0.0], [-35752.33435242597, 0.0, 0.0], [-35747.89893099339, 0.0, 0.0], [-35743.53698356547, 0.0, 0.0], [-35739.2510711176, 0.0, 0.0], [-35735.04370766923, 0.0, 0.0], [-35730.91735894061, 0.0, 0.0], [-35726.87444103154, 0.0, 0.0], [-35722.91731912445, 0.0, 0.0], [-35719.048306239856, 0.0, 0.0], [-35715.26966200657, 0.0, 0.0], [-35711.5835914663, 0.0, 0.0], [-35707.992243927234, 0.0, 0.0], [-35704.497711827105, 0.0, 0.0], [-35701.1020296508, 0.0, 0.0], [-35697.80717286867, 0.0, 0.0], [-35694.615056915834, 0.0, 0.0], [-35691.52753620925, 0.0, 0.0], [-35688.54640318533, 0.0, 0.0], [-35685.67338738506, 0.0, 0.0], [-35682.91015457505, 0.0, 0.0], [-35680.258305885895, 0.0, 0.0], [-35677.71937701893, 0.0, 0.0], [-35675.294837449605, 0.0, 0.0], [-35672.98608969484, 0.0, 0.0], [-35670.79446860557, 0.0, 0.0], [-35668.72124069337, 0.0, 0.0], [-35666.767603501066, 0.0, 0.0], [-35664.934684993204, 0.0, 0.0], [-35663.22354300609, 0.0, 0.0], [-35661.635164711995, 0.0, 0.0], [-35660.17046612915, 0.0, 0.0], [-35658.83029167379, 0.0, 0.0], [-35657.61541372852, 0.0, 0.0], [-35656.52653227697, 0.0, 0.0], [-35655.56427454514, 0.0, 0.0], [-35654.72919469595, 0.0, 0.0], [-35654.02177355846, 0.0, 0.0], [-35653.44241838812, 0.0, 0.0], [-35652.9914626662, 0.0, 0.0], [-35652.66916593683, 0.0, 0.0], [-35652.475713682215, 0.0, 0.0], [-35652.41121722468, 0.0, 0.0]], "transform_to_inertial": [[[0.9986295347545737, 0.0, -0.05233595624294385], [0.0, 1.0, 0.0], [0.05233595624294385, 0.0, 0.9986295347545737]], [[0.9986295347545738, 0.0, -0.05233595624294385], [0.0, 1.0, 0.0], [0.05233595624294385, 0.0, 0.9986295347545738]], [[0.9986295347545739, 0.0, -0.05233595624294379], [0.0, 1.0, 0.0], [0.05233595624294379, 0.0, 0.9986295347545739]], [[0.9986295347545739, 0.0, -0.05233595624294385], [0.0, 1.0, 0.0], [0.05233595624294385, 0.0, 0.9986295347545739]], [[0.9986295347545738, 0.0, -0.05233595624294382], [0.0, 1.0, 0.0], [0.05233595624294382, 0.0, 0.9986295347545738]], [[0.9986295347545739, 0.0, -0.05233595624294382], [0.0, 1.0, 0.0], [0.05233595624294382, 0.0, 0.9986295347545739]], [[0.9986295347545739, 0.0, -0.05233595624294382], [0.0, 1.0, 0.0], [0.05233595624294382, 0.0, 0.9986295347545739]], [[0.9986295347545738, 0.0, -0.05233595624294382], [0.0, 1.0, 0.0], [0.05233595624294382, 0.0, 0.9986295347545738]], [[0.9986295347545739, 0.0, -0.05233595624294382], [0.0, 1.0, 0.0], [0.05233595624294382, 0.0, 0.9986295347545739]], [[0.9986295347545738, 0.0, -0.05233595624294385], [0.0, 1.0, 0.0], [0.05233595624294385, 0.0, 0.9986295347545738]], [[0.9986295347545739, 0.0, -0.05233595624294382], [0.0, 1.0, 0.0], [0.05233595624294382, 0.0, 0.9986295347545739]], [[0.9986295347545738, 0.0, -0.05233595624294385], [0.0, 1.0, 0.0], [0.05233595624294385, 0.0, 0.9986295347545738]], [[0.9986295347545739, 0.0, -0.05233595624294382], [0.0, 1.0, 0.0], [0.05233595624294382, 0.0, 0.9986295347545739]], [[0.9986295347545738, 0.0, -0.05233595624294382], [0.0, 1.0, 0.0], [0.05233595624294382, 0.0, 0.9986295347545738]], [[0.9986295347545739, 0.0, -0.05233595624294382], [0.0, 1.0, 0.0], [0.05233595624294382, 0.0, 0.9986295347545739]], [[0.9986295347545739, 0.0, -0.05233595624294385], [0.0, 1.0, 0.0], [0.05233595624294385, 0.0, 0.9986295347545739]], [[0.9986295347545737, 0.0, -0.05233595624294385], [0.0, 1.0, 0.0], [0.05233595624294385, 0.0, 0.9986295347545737]], [[0.9986295347545738, 0.0, -0.05233595624294385], [0.0, 1.0, 0.0], [0.05233595624294385, 0.0, 0.9986295347545738]], [[0.9986295347545738, 0.0, -0.052335956242943876], [0.0, 1.0, 0.0], [0.052335956242943876, 0.0, 0.9986295347545738]], [[0.9986295347545738, 0.0, -0.05233595624294385], [0.0, 1.0, 0.0], [0.05233595624294385, 0.0, 0.9986295347545738]], [[0.9986295347545738, 0.0, -0.05233595624294382], [0.0, 1.0, 0.0], [0.05233595624294382, 0.0, 0.9986295347545738]], [[0.9986295347545738, 0.0, -0.05233595624294382], [0.0, 1.0, 0.0], [0.05233595624294382, 0.0, 0.9986295347545738]], [[0.9986295347545739, 0.0, -0.05233595624294385], [0.0, 1.0, 0.0], [0.05233595624294385, 0.0, 0.9986295347545739]], [[0.9986295347545739, 0.0, -0.05233595624294385], [0.0, 1.0, 0.0], [0.05233595624294385, 0.0, 0.9986295347545739]], [[0.9986295347545738, 0.0, -0.05233595624294382], [0.0, 1.0, 0.0], [0.05233595624294382, 0.0, 0.9986295347545738]], [[0.9986295347545739, 0.0, -0.05233595624294385], [0.0, 1.0, 0.0], [0.05233595624294385, 0.0, 0.9986295347545739]], [[0.9986295347545738, 0.0, -0.05233595624294382], [0.0, 1.0, 0.0], [0.05233595624294382, 0.0, 0.9986295347545738]], [[0.9986295347545739, 0.0, -0.05233595624294385], [0.0, 1.0, 0.0], [0.05233595624294385, 0.0, 0.9986295347545739]], [[0.9986295347545739, 0.0, -0.05233595624294379], [0.0, 1.0, 0.0], [0.05233595624294379, 0.0, 0.9986295347545739]], [[0.9986295347545738, 0.0, -0.05233595624294382], [0.0, 1.0, 0.0], [0.05233595624294382, 0.0, 0.9986295347545738]], [[0.9986295347545737, 0.0, -0.05233595624294379], [0.0, 1.0, 0.0], [0.05233595624294379, 0.0, 0.9986295347545737]], [[0.9986295347545738, 0.0, -0.05233595624294382], [0.0, 1.0, 0.0], [0.05233595624294382, 0.0, 0.9986295347545738]], [[0.9986295347545738, 0.0, -0.05233595624294385], [0.0, 1.0, 0.0], [0.05233595624294385, 0.0, 0.9986295347545738]], [[0.9986295347545738, 0.0, -0.05233595624294382], [0.0, 1.0, 0.0], [0.05233595624294382, 0.0, 0.9986295347545738]], [[0.9986295347545739, 0.0, -0.05233595624294379], [0.0, 1.0, 0.0], [0.05233595624294379, 0.0, 0.9986295347545739]], [[0.9986295347545738, 0.0, -0.05233595624294385], [0.0, 1.0, 0.0], [0.05233595624294385, 0.0, 0.9986295347545738]], [[0.9986295347545738, 0.0, -0.05233595624294382], [0.0, 1.0, 0.0], [0.05233595624294382, 0.0, 0.9986295347545738]], [[0.9986295347545738, 0.0, -0.05233595624294385], [0.0, 1.0, 0.0], [0.05233595624294385, 0.0, 0.9986295347545738]], [[0.9986295347545739, 0.0, -0.05233595624294379], [0.0, 1.0, 0.0], [0.05233595624294379, 0.0, 0.9986295347545739]], [[0.9986295347545739, 0.0, -0.05233595624294382], [0.0, 1.0, 0.0], [0.05233595624294382, 0.0, 0.9986295347545739]], [[0.9986295347545739, 0.0, -0.052335956242943876], [0.0, 1.0, 0.0], [0.052335956242943876, 0.0, 0.9986295347545739]], [[0.9986295347545738, 0.0, -0.05233595624294385], [0.0, 1.0, 0.0], [0.05233595624294385, 0.0, 0.9986295347545738]], [[0.9986295347545739, 0.0, -0.05233595624294382], [0.0, 1.0, 0.0], [0.05233595624294382, 0.0, 0.9986295347545739]], [[0.9986295347545738, 0.0, -0.05233595624294385], [0.0, 1.0, 0.0], [0.05233595624294385, 0.0, 0.9986295347545738]], [[0.9986295347545738, 0.0, -0.05233595624294385], [0.0, 1.0, 0.0], [0.05233595624294385, 0.0, 0.9986295347545738]], [[0.9986295347545738, 0.0, -0.05233595624294385], [0.0, 1.0, 0.0], [0.05233595624294385, 0.0, 0.9986295347545738]], [[0.9986295347545739, 0.0, -0.05233595624294382], [0.0, 1.0, 0.0], [0.05233595624294382, 0.0, 0.9986295347545739]], [[0.9986295347545739, 0.0, -0.05233595624294382], [0.0, 1.0, 0.0], [0.05233595624294382, 0.0, 0.9986295347545739]], [[0.9986295347545738, 0.0, -0.05233595624294382], [0.0, 1.0, 0.0], [0.05233595624294382, 0.0, 0.9986295347545738]], [[0.9986295347545739, 0.0, -0.052335956242943876], [0.0, 1.0, 0.0], [0.052335956242943876, 0.0, 0.9986295347545739]], [[0.9986295347545738, 0.0, -0.05233595624294385], [0.0, 1.0, 0.0], [0.05233595624294385, 0.0, 0.9986295347545738]], [[0.9986295347545738, 0.0, -0.05233595624294385], [0.0, 1.0, 0.0], [0.05233595624294385, 0.0, 0.9986295347545738]], [[0.9986295347545738, 0.0, -0.05233595624294385], [0.0, 1.0, 0.0], [0.05233595624294385, 0.0, 0.9986295347545738]], [[0.9986295347545739, 0.0, -0.05233595624294385], [0.0, 1.0, 0.0], [0.05233595624294385, 0.0, 0.9986295347545739]], [[0.9986295347545738, 0.0, -0.05233595624294385], [0.0, 1.0, 0.0], [0.05233595624294385, 0.0, 0.9986295347545738]], [[0.9986295347545738, 0.0, -0.05233595624294385], [0.0, 1.0, 0.0], [0.05233595624294385, 0.0, 0.9986295347545738]], [[0.9986295347545738, 0.0, -0.05233595624294385], [0.0, 1.0, 0.0], [0.05233595624294385, 0.0, 0.9986295347545738]], [[0.9986295347545739, 0.0, -0.05233595624294385], [0.0, 1.0, 0.0], [0.05233595624294385, 0.0, 0.9986295347545739]], [[0.9986295347545739, 0.0, -0.05233595624294382], [0.0, 1.0, 0.0], [0.05233595624294382, 0.0, 0.9986295347545739]], [[0.9986295347545738, 0.0, -0.052335956242943876], [0.0, 1.0, 0.0], [0.052335956242943876, 0.0, 0.9986295347545738]], [[0.9986295347545739, 0.0, -0.05233595624294379], [0.0, 1.0, 0.0], [0.05233595624294379, 0.0, 0.9986295347545739]], [[0.9986295347545738, 0.0, -0.05233595624294382], [0.0, 1.0, 0.0], [0.05233595624294382, 0.0, 0.9986295347545738]], [[0.9986295347545739, 0.0, -0.05233595624294385], [0.0, 1.0, 0.0], [0.05233595624294385, 0.0, 0.9986295347545739]], [[0.9986295347545739, 0.0, -0.05233595624294382], [0.0, 1.0, 0.0], [0.05233595624294382, 0.0, 0.9986295347545739]], [[0.9986295347545738, 0.0, -0.052335956242943876], [0.0, 1.0, 0.0], [0.052335956242943876, 0.0, 0.9986295347545738]], [[0.9986295347545739, 0.0, -0.052335956242943876], [0.0, 1.0, 0.0], [0.052335956242943876, 0.0, 0.9986295347545739]], [[0.9986295347545739, 0.0, -0.05233595624294382], [0.0, 1.0, 0.0], [0.05233595624294382, 0.0, 0.9986295347545739]], [[0.9986295347545739, 0.0, -0.052335956242943765], [0.0, 1.0, 0.0], [0.052335956242943765, 0.0, 0.9986295347545739]], [[0.9986295347545739, 0.0, -0.05233595624294385], [0.0, 1.0, 0.0], [0.05233595624294385, 0.0, 0.9986295347545739]], [[0.9986295347545737, 0.0, -0.05233595624294385], [0.0, 1.0, 0.0], [0.05233595624294385, 0.0, 0.9986295347545737]], [[0.9986295347545738, 0.0, -0.052335956242943876], [0.0, 1.0, 0.0], [0.052335956242943876, 0.0, 0.9986295347545738]], [[0.9986295347545738, 0.0, -0.052335956242943876], [0.0, 1.0, 0.0], [0.052335956242943876, 0.0, 0.9986295347545738]], [[0.9986295347545739, 0.0, -0.05233595624294382], [0.0, 1.0, 0.0], [0.05233595624294382, 0.0, 0.9986295347545739]], [[0.9986295347545738, 0.0, -0.05233595624294382], [0.0, 1.0, 0.0], [0.05233595624294382, 0.0, 0.9986295347545738]], [[0.9986295347545738, 0.0, -0.05233595624294385], [0.0, 1.0, 0.0], [0.05233595624294385, 0.0, 0.9986295347545738]], [[0.9986295347545738, 0.0, -0.052335956242943876], [0.0, 1.0, 0.0], [0.052335956242943876, 0.0, 0.9986295347545738]], [[0.9986295347545739, 0.0, -0.05233595624294385], [0.0, 1.0, 0.0], [0.05233595624294385, 0.0, 0.9986295347545739]], [[0.9986295347545739, 0.0, -0.05233595624294385], [0.0, 1.0, 0.0], [0.05233595624294385, 0.0, 0.9986295347545739]], [[0.9986295347545738, 0.0, -0.05233595624294382], [0.0, 1.0, 0.0], [0.05233595624294382, 0.0, 0.9986295347545738]], [[0.9986295347545739, 0.0, -0.05233595624294379], [0.0, 1.0, 0.0], [0.05233595624294379, 0.0, 0.9986295347545739]], [[0.9986295347545738, 0.0, -0.05233595624294382], [0.0, 1.0, 0.0], [0.05233595624294382, 0.0, 0.9986295347545738]], [[0.9986295347545739, 0.0, -0.05233595624294385], [0.0, 1.0, 0.0], [0.05233595624294385, 0.0, 0.9986295347545739]], [[0.9986295347545739, 0.0, -0.05233595624294382], [0.0, 1.0, 0.0], [0.05233595624294382, 0.0, 0.9986295347545739]], [[0.9986295347545738, 0.0, -0.05233595624294385], [0.0, 1.0, 0.0], [0.05233595624294385, 0.0, 0.9986295347545738]], [[0.9986295347545738, 0.0, -0.05233595624294382], [0.0, 1.0, 0.0], [0.05233595624294382, 0.0, 0.9986295347545738]], [[0.9986295347545739, 0.0, -0.05233595624294382], [0.0, 1.0, 0.0], [0.05233595624294382, 0.0, 0.9986295347545739]], [[0.9986295347545739, 0.0, -0.05233595624294385], [0.0, 1.0, 0.0], [0.05233595624294385, 0.0, 0.9986295347545739]], [[0.9986295347545738, 0.0, -0.052335956242943835], [0.0, 1.0, 0.0], [0.052335956242943835, 0.0, 0.9986295347545738]], [[0.9986295347545739, 0.0, -0.05233595624294381], [0.0, 1.0, 0.0], [0.05233595624294381, 0.0, 0.9986295347545739]], [[0.9986295347545737, 0.0, -0.052335956242943835], [0.0, 1.0, 0.0], [0.052335956242943835, 0.0, 0.9986295347545737]], [[0.9986295347545739, 0.0, -0.05233595624294382], [0.0, 1.0, 0.0], [0.05233595624294382, 0.0, 0.9986295347545739]], [[0.9986295347545739, 0.0, -0.05233595624294385], [0.0, 1.0, 0.0], [0.05233595624294385, 0.0, 0.9986295347545739]], [[0.9986295347545738, 0.0, -0.05233595624294385], [0.0, 1.0, 0.0], [0.05233595624294385, 0.0, 0.9986295347545738]], [[0.9986295347545737, 0.0, -0.052335956242943835], [0.0, 1.0, 0.0], [0.052335956242943835, 0.0, 0.9986295347545737]], [[0.9986295347545738, 0.0, -0.05233595624294382], [0.0, 1.0, 0.0], [0.05233595624294382, 0.0, 0.9986295347545738]], [[0.9986295347545738, 0.0, -0.052335956242943835], [0.0, 1.0, 0.0], [0.052335956242943835, 0.0, 0.9986295347545738]], [[0.9986295347545738, 0.0, -0.05233595624294385], [0.0, 1.0, 0.0], [0.05233595624294385, 0.0, 0.9986295347545738]], [[0.9986295347545739, 0.0, -0.05233595624294385], [0.0, 1.0, 0.0], [0.05233595624294385, 0.0, 0.9986295347545739]], [[0.9986295347545738, 0.0, -0.052335956242943835], [0.0, 1.0, 0.0], [0.052335956242943835, 0.0, 0.9986295347545738]], [[0.9986295347545738, 0.0, -0.052335956242943835], [0.0, 1.0, 0.0], [0.052335956242943835, 0.0, 0.9986295347545738]], [[0.9986295347545739, 0.0, -0.05233595624294382], [0.0, 1.0, 0.0], [0.05233595624294382, 0.0, 0.9986295347545739]], [[0.9986295347545738, 0.0, -0.05233595624294385], [0.0, 1.0, 0.0], [0.05233595624294385, 0.0, 0.9986295347545738]], [[0.9986295347545738, 0.0, -0.052335956242943835], [0.0, 1.0, 0.0], [0.052335956242943835, 0.0, 0.9986295347545738]], [[0.9986295347545739, 0.0, -0.052335956242943835], [0.0, 1.0, 0.0], [0.052335956242943835, 0.0, 0.9986295347545739]], [[0.9986295347545738, 0.0, -0.05233595624294385], [0.0, 1.0, 0.0], [0.05233595624294385, 0.0, 0.9986295347545738]], [[0.9986295347545738, 0.0, -0.052335956242943835], [0.0, 1.0, 0.0], [0.052335956242943835, 0.0, 0.9986295347545738]], [[0.9986295347545739, 0.0, -0.05233595624294386], [0.0, 1.0, 0.0], [0.05233595624294386, 0.0, 0.9986295347545739]], [[0.9986295347545738, 0.0, -0.052335956242943835], [0.0, 1.0, 0.0], [0.052335956242943835, 0.0, 0.9986295347545738]], [[0.9986295347545737, 0.0, -0.05233595624294385], [0.0, 1.0, 0.0], [0.05233595624294385, 0.0, 0.9986295347545737]], [[0.9986295347545739, 0.0, -0.052335956242943835], [0.0, 1.0, 0.0], [0.052335956242943835, 0.0, 0.9986295347545739]], [[0.9986295347545739, 0.0, -0.052335956242943835], [0.0, 1.0, 0.0], [0.052335956242943835, 0.0, 0.9986295347545739]], [[0.9986295347545739, 0.0, -0.052335956242943835], [0.0, 1.0, 0.0], [0.052335956242943835, 0.0, 0.9986295347545739]], [[0.9986295347545738, 0.0, -0.05233595624294381], [0.0, 1.0, 0.0], [0.05233595624294381, 0.0, 0.9986295347545738]], [[0.9986295347545738, 0.0, -0.05233595624294385], [0.0, 1.0, 0.0], [0.05233595624294385, 0.0, 0.9986295347545738]], [[0.9986295347545738, 0.0, -0.052335956242943835], [0.0, 1.0, 0.0], [0.052335956242943835, 0.0, 0.9986295347545738]], [[0.9986295347545739, 0.0, -0.05233595624294382], [0.0, 1.0, 0.0], [0.05233595624294382, 0.0, 0.9986295347545739]], [[0.9986295347545739, 0.0, -0.05233595624294385], [0.0, 1.0, 0.0], [0.05233595624294385, 0.0, 0.9986295347545739]], [[0.9986295347545738, 0.0, -0.05233595624294385], [0.0, 1.0, 0.0], [0.05233595624294385, 0.0, 0.9986295347545738]], [[0.9986295347545738, 0.0, -0.052335956242943835], [0.0, 1.0, 0.0], [0.052335956242943835, 0.0, 0.9986295347545738]], [[0.9986295347545739, 0.0, -0.05233595624294385], [0.0, 1.0, 0.0], [0.05233595624294385, 0.0, 0.9986295347545739]], [[0.9986295347545739, 0.0, -0.05233595624294385], [0.0, 1.0, 0.0], [0.05233595624294385, 0.0, 0.9986295347545739]], [[0.9986295347545738, 0.0, -0.052335956242943835], [0.0, 1.0, 0.0], [0.052335956242943835, 0.0, 0.9986295347545738]], [[0.9986295347545738, 0.0, -0.05233595624294382], [0.0, 1.0, 0.0], [0.05233595624294382, 0.0, 0.9986295347545738]], [[0.9986295347545739, 0.0, -0.05233595624294385], [0.0, 1.0, 0.0], [0.05233595624294385, 0.0, 0.9986295347545739]], [[0.9986295347545738, 0.0, -0.052335956242943835], [0.0, 1.0, 0.0], [0.052335956242943835, 0.0, 0.9986295347545738]], [[0.9986295347545739, 0.0, -0.052335956242943876], [0.0, 1.0, 0.0], [0.052335956242943876, 0.0, 0.9986295347545739]], [[0.9986295347545739, 0.0, -0.05233595624294382], [0.0, 1.0, 0.0], [0.05233595624294382, 0.0, 0.9986295347545739]], [[0.9986295347545738, 0.0, -0.052335956242943835], [0.0, 1.0, 0.0], [0.052335956242943835, 0.0, 0.9986295347545738]], [[0.9986295347545738, 0.0, -0.05233595624294386], [0.0, 1.0, 0.0], [0.05233595624294386, 0.0, 0.9986295347545738]]]}, "planet": {"start_time": null, "latitude": [[0.0], [5.416985891280825e-06], [2.166468073634662e-05], [4.873329801394889e-05], [8.660653340417199e-05], [0.0001352615746076857], [0.00019466911508423786], [0.00026479337170244306], [0.0003455921062899007], [0.00043701665107101533], [0.0005390119379768867], [0.0006515165318099142], [0.000774462667242895], [0.0009077762896305992], [0.001051377099609002], [0.00120517860145558], [0.0013690881551813147], [0.0015430070323232958], [0.0017268304754041073], [0.0019204477610224194], [0.0021237422665366036], [0.0023365915403014553], [0.002558867375415505], [0.002790435886934766], [0.0030311575925062164], [0.0032808874963726857], [0.0035394751766983906], [0.003806764876162714], [0.004082595595767555], [0.004366801191801904], [0.004659210475905145], [0.004959647318168999], [0.0052679307532158635], [0.005583875089189885], [0.0059072900195949185], [0.006237980737912325], [0.0065757480549292965], [0.0069203885187073865], [0.007271694537118686], [0.0076294545028762475], [0.007993452920983066], [0.008363470538523292], [0.008739284476717155], [0.009120668365160447], [0.009507392478167408], [0.00989922387313519], [0.010295926530846348], [0.010697261497625173], [0.011102987029261876], [0.011512858736618406], [0.011926629732827789], [0.012344050781998699], [0.012764870449335495], [0.013188835252583447], [0.01361568981470783], [0.014045177017715078], [0.014477038157523195], [0.014911013099788442], [0.015346840436593958], [0.015784257643906615], [0.016223001239706564], [0.01666280694269482], [0.017103409831482945], [0.01754454450416912], [0.01798594523820429], [0.01842734615045248], [0.018868481357348345], [0.019309085135055908], [0.01974889207953183], [0.020187637266396826], [0.02062505641051891], [0.02106088602521232], [0.02149486358095621], [0.021926727663537714], [0.02235621813152363], [0.022783076272966385], [0.023207044961249465], [0.02362786880997883], [0.024045294326826346], [0.024459070066233386], [0.02486894678088182], [0.0252746775718417], [0.025676018037304762], [0.02607272641981446], [0.026464563751903477], [0.026851294000051384], [0.027232684206875194], [0.027608504631467655], [0.027978528887798216], [0.02834253408109374], [0.028700300942116293], [0.02905161395925762], [0.02939626150837018], [0.029734035980256885], [0.03006473390574258], [0.03038815607825177], [0.030704107673818922], [0.03101239836845894], [0.031312842452826936], [0.03160525894409846], [0.03188947169500253], [0.032165309499941855], [0.032432606198136205], [0.032691200773726906], [0.03294093745278206], [0.03318166579714387], [0.0334132407950617], [0.03363552294855629], [0.03384837835746209], [0.03405167880009756], [0.03424530181051441], [0.034429130752279484], [0.034603054888744614], [0.03476696944976228], [0.0349207756948065], [0.035064380972461534], [0.035197698776241806], [0.035320648796709944], [0.03543315696986133], [0.03553515552174588], [0.03562658300930035], [0.035707384357366506], [0.03577751089187259], [0.035836920369158594], [0.03588557700142714], [0.035923451478305106], [0.03595052098450217], [0.035966769213556904], [0.03597218637766119]], "longitude": [[0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0]]}}, "weights": {"total_mass": [[40124.54394620161], [40124.54223726906], [40124.537111547594], [40124.52857226501], [40124.51662479841], [40124.501276670424], [40124.48253754383], [40124.46041921473], [40124.434935604215], [40124.40610274844], [40124.373938787365], [40124.338463951855], [40124.29970054941], [40124.25767294844], [40124.212407561055], [40124.163932824464], [40124.112279180976], [40124.057479056595], [40123.99956683828], [40123.93857884985], [40123.87455332654], [40123.80753038834], [40123.73755201198], [40123.664662001735], [40123.58890595896], [40123.51033125052], [40123.428986975974], [40123.344923933655], [40123.25819458574], [40123.1688530221], [40123.07695492329], [40122.98255752239], [40122.88571956599], [40122.78650127421], [40122.6849642998], [40122.58117168644], [40122.47518782616], [40122.36707841604], [40122.2569104141], [40122.14475199453], [40122.030672502224], [40121.9147424067], [40121.797033255396], [40121.67761762645], [40121.556569080916], [40121.43396211458], [40121.3098721092], [40121.18437528352], [40121.05754864376], [40120.929469933864], [40120.800217585485], [40120.66987066762], [40120.53850883615], [40120.40621228311], [40120.273061685875], [40120.13913815626], [40120.00452318946], [40119.8692986131], [40119.73354653615], [40119.597349298], [40119.46078941751], [40119.323949542275], [40119.186912397876], [40119.04976073749], [40118.91257729155], [40118.77544471772], [40118.63844555112], [40118.50166215484], [40118.36517667077], [40118.22907097081], [40118.09342660842], [40117.95832477063], [40117.82384623043], [40117.690071299614], [40117.557079782186], [40117.424950928165], [40117.29376338802], [40117.163595167534], [40117.03452358338], [40116.90662521916], [40116.77997588218], [40116.65465056072], [40116.53072338207], [40116.408267571176], [40116.28735540999], [40116.168058197494], [40116.050446210465], [40115.93458866495], [40115.82055367853], [40115.70840823326], [40115.598218139465], [40115.49004800025], [40115.383961176856], [40115.28001975478], [40115.17828451072], [40115.07881488038], [40114.98166892703], [40114.886903310995], [40114.794573259926], [40114.704732539976], [40114.61743342778], [40114.5327266834], [40114.450661524024], [40114.37128559867], [40114.29464496367], [40114.220784059136], [40114.14974568626], [40114.081570985545], [40114.016299415925], [40113.95396873479], [40113.894614978984], [40113.8382724466], [40113.784973679794], [40113.73474944848], [40113.68762873495], [40113.64363871941], [40113.60280476645], [40113.56515041245], [40113.530697353875], [40113.499465436566], [40113.47147264591], [40113.446735097954], [40113.425267031445], [40113.40708080083], [40113.39218687017], [40113.380593808], [40113.37230828308], [40113.36733506117], [40113.36567700266]], "weight_breakdown": {}, "vehicle_mass_rate": [[0.17860405353798145], [0.17860323825276841], [0.17860079291562686], [0.17859671907557179], [0.17859101932136584], [0.17858369726861703], [0.17857475756382804], [0.17856420587833097], [0.17855204890585452], [0.1785382943557305], [0.17852295094878803], [0.17850602841075253], [0.17848753746448698], [0.17846748982322808], [0.17844589818126919], [0.178422776205664], [0.17839813852539987], [0.1783720007217553], [0.17834437931659225], [0.17831529176058675], [0.17828475642080074], [0.17825279256765322], [0.1782194203610662], [0.1781846608359007], [0.1781485358873783], [0.17811106825545134], [0.1780722815084138], [0.17803220002681783], [0.1779908489860069], [0.17794825433816824], [0.17790444279470638], [0.17785944180717472], [0.1778132795484638], [0.17776598489278875], [0.1777175873963773], [0.1776681172766222], [0.17761760539116353], [0.17756608321715353], [0.17751358282958257], [0.17746013687916978], [0.17740577857067535], [0.17735054164017375], [0.17729446033238241], [0.1772375693777773], [0.17717990396919694], [0.1771214997384286], [0.17706239273309124], [0.17700261939196568], [0.17694221652183073], [0.1768812212729307], [0.17681967111480998], [0.17675760381221162], [0.17669505740029015], [0.17663207016087623], [0.17656868059689174], [0.17650492740893925], [0.17644084947003144], [0.17637648580124676], [0.1763118755473366], [0.17624705795219708], [0.17618207233444744], [0.17611695806320657], [0.17605175453366698], [0.17598650114325137], [0.17592123726722367], [0.17585600223540063], [0.17579083530772224], [0.1757257756515651], [0.1756608623174812], [0.17559613421679474], [0.17553163009817238], [0.17546738852509056], [0.17540344785336878], [0.1753398462086996], [0.17527662146492964], [0.17521381122197108], [0.17515145278484265], [0.17508958314186493], [0.17502823894432615], [0.17496745648561426], [0.17490727168104442], [0.17484772004782], [0.174788836685588], [0.1747306562571717], [0.1746732129692169], [0.17461654055446238], [0.17456067225255414], [0.1745056407926346], [0.17445147837631722], [0.1743982166596124], [0.1743458867368428], [0.17429451912431998], [0.1742441437437645], [0.17419478990752726], [0.174146486302926], [0.17409926097745781], [0.17405314132468125], [0.17400815406995426], [0.1739643252569845], [0.17392168023459945], [0.17388024364434856], [0.1738400394074111], [0.1738010907135943], [0.17376342000898987], [0.17372704898520175], [0.17369199856905984], [0.17365828891152632], [0.17362593937859153], [0.1735949685414141], [0.17356539416758965], [0.17353723321239753], [0.17351050181029612], [0.17348521526813002], [0.17346138805674002], [0.17343903380477912], [0.17341816529183113], [0.17339879444248524], [0.173380932320727], [0.17336458912471855], [0.17334977418170006], [0.17333649594416786], [0.17332476198513996], [0.17331457899528382], [0.1733059527795156], [0.17329888825428083], [0.173293389445136], [0.17328945948524196], [0.17328710061329952], [0.17328631417344256]]}, "energies": {"total_energy": [[0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0]], "total_efficiency": [[0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0]], "gravity_energy": [[0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0]], "propulsion_power": [[0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0]]}, "freestream": {"velocity": [[63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934], [63.040405279753934]], "mach_number": [[0.18572440533727302], [0.18572433887654313], [0.18572413953481084], [0.18572380743342315], [0.18572334277454025], [0.18572274584100887], [0.18572201699618446], [0.18572115668370337], [0.18572016542720438], [0.18571904382999999], [0.1857177925746981], [0.18571641242277376], [0.18571490421409168], [0.18571326886637968], [0.18571150737465342], [0.18570962081059303], [0.1857076103218716], [0.18570547713143679], [0.18570322253674512], [0.18570084790895017], [0.18569835469204501], [0.1856957444019593], [0.18569301862561205], [0.1856901790199204], [0.1856872273107652], [0.185684165291914], [0.18568099482390246], [0.18567771783287446], [0.1856743363093826], [0.1856708523071486], [0.18566726794178573], [0.18566358538948327], [0.1856598068856542], [0.18565593472354736], [0.1856519712528242], [0.18564791887810203], [0.18564378005746393], [0.18563955730093679], [0.18563525316893872], [0.1856308702706957], [0.18562641126263035], [0.18562187884672218], [0.18561727576884138], [0.1856126048170568], [0.1856078688199198], [0.18560307064472414], [0.18559821319574413], [0.18559329941245128], [0.1855883322677112], [0.18558331476596152], [0.18557824994137254], [0.18557314085599091], [0.18556799059786844], [0.18556280227917674], [0.18555757903430886], [0.1855523240179696], [0.18554704040325465], [0.18554173137972144], [0.18553640015145098], [0.18553104993510358], [0.18552568395796834], [0.1855203054560086], [0.18551491767190395], [0.18550952385309025], [0.18550412724979884], [0.18549873111309587], [0.18549333869292367], [0.185487953236144], [0.18548257798458614], [0.18547721617309926], [0.1854718710276114], [0.18546654576319566], [0.18546124358214505], [0.18545596767205672], [0.18545072120392697], [0.18544550733025858], [0.18544032918318035], [0.1854351898725814], [0.18543009248426], [0.18542504007808902], [0.1854200356861983], [0.18541508231117562], [0.1854101829242864], [0.1854053404637144], [0.18540055783282297], [0.18539583789843908], [0.1853911834891602], [0.18538659739368551], [0.18538208235917208], [0.18537764108961696], [0.1853732762442662], [0.1853689904360515], [0.18536478623005564], [0.18536066614200672], [0.18535663263680344], [0.18535268812707056], [0.18534883497174676], [0.1853450754747045], [0.18534141188340358], [0.18533784638757825], [0.18533438111795933], [0.1853310181450315], [0.18532775947782643], [0.1853246070627528], [0.1853215627824634], [0.1853186284547598], [0.18531580583153598], [0.18531309659776024], [0.18531050237049704], [0.1853080246979684], [0.18530566505865587], [0.18530342486044385], [0.18530130543980308], [0.1852993080610173], [0.18529743391545078], [0.18529568412085926], [0.18529405972074306], [0.1852925616837439], [0.18529119090308485], [0.1852899481960542], [0.18528883430353324], [0.1852878498895684], [0.18528699554098776], [0.1852862717670624], [0.18528567899921214], [0.185285217590757], [0.18528488781671293], [0.18528468987363336], [0.18528462387949574]], "pressure": [[98652.68299043145], [98653.05408221664], [98654.16714084182], [98656.02151623064], [98658.61612530325], [98661.94945254807], [98666.01955082155], [98670.82404237617], [98676.36012011628], [98682.62454908165], [98689.61366815788], [98697.32339201371], [98705.7492132642], [98714.88620485984], [98724.72902270021], [98735.27190847171], [98746.50869270896], [98758.43279807817], [98771.03724288219], [98784.3146447864], [98798.25722476303], [98812.85681125462], [98828.10484455341], [98843.99238139717], [98860.51009977823], [98877.64830396585], [98895.39692973872], [98913.74554982758], [98932.68337956419], [98952.19928273687], [98972.28177764882], [98992.91904337808], [99014.0989262365], [99035.80894642604], [99058.03630488893], [99080.76789035003], [99103.99028654858], [99127.68977965608], [99151.85236587796], [99176.46375923598], [99201.50939952787], [99226.9744604614], [99252.84385795906], [99279.10225863036], [99305.7340884076], [99332.723541342], [99360.0545885553], [99387.71098734408], [99415.67629043134], [99443.93385536251], [99472.46685403965], [99501.2582823912], [99530.29097017118], [99559.54759088361], [99589.01067182717], [99618.66260425496], [99648.48565364412], [99678.46197006971], [99708.57359867799], [99738.8024902528], [99769.13051186972], [99799.53945763208], [99830.01105948241], [99860.52699808404], [99891.06891376582], [99921.61841752387], [99952.15710207434], [99982.66655294964], [100013.12835963233], [100043.52412671986], [100073.8354851124], [100104.04410321772], [100134.13169816595], [100164.08004702622], [100193.87099801922], [100223.48648171726], [100252.90852222532], [100282.11924833492], [100311.10090464388], [100339.83586263428], [100368.30663170066], [100396.49587012186], [100424.38639596717], [100451.96119793109], [100479.20344608751], [100506.09650255606], [100532.62393207349], [100558.76951246154], [100584.51724498409], [100609.85136458601], [100634.75635000569], [100659.21693375437], [100683.21811195358], [100706.74515402474], [100729.78361222209], [100752.31933100242], [100774.33845622433], [100795.82744416902], [100816.77307037708], [100837.16243829232], [100856.98298770799], [100876.22250300637], [100894.86912118703], [100912.91133967646], [100930.33802391226], [100947.13841469689], [100963.30213531392], [100978.81919840175], [100993.6800125783], [101007.87538881198], [101021.39654653317], [101034.23511948115], [101046.38316128211], [101057.83315075254], [101068.5779969246], [101078.61104378873], [101087.926074749], [101096.51731678886], [101104.37944434203], [101111.50758286634], [101117.89731211738], [101123.54466911835], [101128.44615082488], [101132.59871648118], [101135.99978966654], [101138.64726002986], [101140.5394847107], [101141.67528944605], [101142.05396936146]], "temperature": [[286.6883893277203], [286.6885945083997], [286.6892099268571], [286.69023521242383], [286.6916697475671], [286.69351266826163], [286.6957628645096], [286.69841898100964], [286.7014794179722], [286.70494233208353], [286.7088056376149], [286.71306700767894], [286.7177238756307], [286.72277343661284], [286.7282126492448], [286.734038237454], [286.7402466924485], [286.74683427482995], [286.75379701684477], [286.7611307247739], [286.7688309814577], [286.7768931489557], [286.78531237133956], [286.7940835776169], [286.8032014847849], [286.8126606010115], [286.82245522894243], [286.83257946913204], [286.8430272235954], [286.8537921994809], [286.86486791285915], [286.8762476926277], [286.8879246845285], [286.8998918552749], [286.9121419967876], [286.9246677305351], [286.9374615119768], [286.95051563510685], [286.96382223709446], [286.9773733030192], [286.99116067069747], [287.0051760355982], [287.0194109558439], [287.0338568572949], [287.0485050387126], [287.06334667700025], [287.0783728325161], [287.0935744544578], [287.1089423863129], [287.12446737137395], [287.1401400583131], [287.15595100681435], [287.17189069325934], [287.1879495164631], [287.20411780345694], [287.2203858153142], [287.23674375301647], [287.25318176335503], [287.26968994486595], [287.2862583537939], [287.3028770100815], [287.3195359033804], [287.33622499908125], [287.3529342443577], [287.36965357422173], [287.3863729175864], [287.4030822033323], [287.419771366374], [287.4364303537228], [287.45304913054275], [287.4696176861953], [287.4861260402695], [287.5025642485942], [287.51892240922854], [287.53519066842694], [287.5513592265749], [287.56741834409263], [287.58335834730235], [287.59916963425604], [287.6148426805199], [287.63036804491236], [287.64573637519175], [287.66093841369064], [287.67596500289324], [287.6908070909522], [287.7054557371425], [287.71990211724744], [287.73413752887546], [287.74815339670306], [287.7619412776412], [287.7754928659223], [287.7887999981043], [287.80185465798957], [287.8146489814542], [287.82717526118637], [287.8394259513305], [287.8513936720332], [287.8630712138903], [287.87445154229033], [287.8855278016533], [287.8962933195617], [287.90674161078033], [287.9168663811643], [287.9266615314516], [287.93612116093806], [287.9452395710329], [287.95401126869257], [287.9624309697304], [287.97049360200094], [287.97819430845607], [287.98552845007197], [287.992491608644], [287.99907958944965], [288.0052884237756], [288.01111437130953], [288.01655392239394], [288.02160380014084], [288.0262609624065], [288.0305226036247], [288.03438615649713], [288.0378492935406], [288.0409099284894], [288.0435662175526], [288.04581656052517], [288.04765960175206], [288.04909423094523], [288.0501195838528], [288.05073504277965], [288.0509402369598]], "density": [[1.1987728448488226], [1.1987764961958323], [1.1987874480886733], [1.198805694083964], [1.198831223446632], [1.1988640211557766], [1.19890406791286], [1.198951340152235], [1.1990058100540106], [1.1990674455592403], [1.1991362103874346], [1.1992120640563886], [1.199294961904318], [1.1993848551143007], [1.1994816907410042], [1.1995854117396978], [1.1996959569975387], [1.1998132613671133], [1.1999372557022299], [1.200067866895948], [1.2002050179208181], [1.2003486278713402], [1.2004986120085959], [1.2006548818070648], [1.2008173450035866], [1.200985905648461], [1.2011604641586573], [1.201340917373125], [1.2015271586101652], [1.2017190777268587], [1.201916561180512], [1.2021194920921032], [1.202327750311697], [1.20254121248581], [1.2027597521266848], [1.202983239683453], [1.203211542615154], [1.2034445254655755], [1.2036820499398824], [1.2039239749830049], [1.2041701568597452], [1.2044204492365667], [1.2046747032650313], [1.2049327676668402], [1.205194488820445], [1.2054597108491854], [1.2057282757109016], [1.2060000232889985], [1.2062747914848917], [1.2065524163118146], [1.2068327319899137], [1.2071155710426076], [1.207400764394144], [1.2076881414683085], [1.2079775302882378], [1.208268757577278], [1.208561648860838], [1.208856028569179], [1.2091517201410915], [1.2094485461283895], [1.2097463283011782], [1.210044887753827], [1.2103440450115848], [1.2106436201377873], [1.210943432841584], [1.2112433025861253], [1.2115430486971464], [1.2118424904718808], [1.2121414472882401], [1.2124397387141954], [1.2127371846172836], [1.2130336052741841], [1.213328821480291], [1.213622654659204], [1.2139149269720855], [1.2142054614267994], [1.214494081986768], [1.2147806136794725], [1.2150648827045287], [1.215346716541267], [1.2156259440557393], [1.2159023956070918], [1.2161759031532158], [1.2164463003556236], [1.2167134226834622], [1.2169771075165956], [1.217237194247698], [1.2174935243832632], [1.217745941643478], [1.2179942920608822], [1.2182384240777429], [1.2184781886420772], [1.218713439302247], [1.218944032300071], [1.2191698266623712], [1.2193906842908917], [1.219606470050533], [1.2198170518558147], [1.2200223007555326], [1.2202220910155133], [1.220416300199434], [1.2206048092476236], [1.2207875025538015], [1.220964268039688], [1.2211349972274257], [1.2212995853097681], [1.221457931217968], [1.221609937687327], [1.2217555113203382], [1.2218945626473914], [1.2220270061849785], [1.2221527604913633], [1.2222717482196677], [1.2223838961683298], [1.2224891353289022], [1.2225874009311455], [1.2226786324853807], [1.2227627738220754], [1.2228397731286238], [1.2229095829832899], [1.2229721603863004], [1.223027466788041], [1.2230754681143565], [1.2231161347889132], [1.223149441752624], [1.223175368480107], [1.2231938989931697], [1.2232050218713106], [1.2232087302592247]], "speed_of_sound": [[339.4298404955095], [339.42996195915333], [339.4303262766662], [339.4309332278371], [339.431782445797], [339.4328734172429], [339.43420548275145], [339.4357778371816], [339.43758953016606], [339.43963946669186], [339.4419264077688], [339.44444897118586], [339.44720563235524], [339.4501947252427], [339.45341444338476], [339.45686284099105], [339.46053783413197], [339.46443720201006], [339.46855858831486], [339.47289950266077], [339.4774573221056], [339.4822292927505], [339.4872125314192], [339.4924040274155], [339.49780064435896], [339.503399122096], [339.50919607868684], [339.5151880124657], [339.52137130417384], [339.5277422191635], [339.53429690967215], [339.54103141716445], [339.54794167474176], [339.55502350961643], [339.56227264565035], [339.56968470595564], [339.5772552155558], [339.58497960410625], [339.5928532086713], [339.6008712765578], [339.6090289682016], [339.61732136010613], [339.6257434478316], [339.63429014903227], [339.6429563065395], [339.6517366914904], [339.66062600649803], [339.66961888886283], [339.6787099138223], [339.68789359783756], [339.6971644019141], [339.7065167349555], [339.7159449571475], [339.72544338336996], [339.7350062866363], [339.7446279015555], [339.75430242781795], [339.76402403369974], [339.7737868595858], [339.7835850215081], [339.7934126146977], [339.80326371714796], [339.8131323931873], [339.82301269705835], [339.8328986765026], [339.84278437634765], [339.85266384209433], [339.8625311235034], [339.8723802781773], [339.8822053751366], [339.8920004983885], [339.9017597504843], [339.91147725606555], [339.92114716539504], [339.9307636578716], [339.9403209455257], [339.94981327649504], [339.9592349384767], [339.9685802621548], [339.97784362460106], [339.9870194526466], [339.99610222622255], [340.0050864816683], [340.01396681500415], [340.0227378851682], [340.03139441721356], [340.03993120546585], [340.0483431166376], [340.05662509289914], [340.06477215490276], [340.0727794047598], [340.0806420289675], [340.08835530128516], [340.09591458555735], [340.10331533848205], [340.1105531123233], [340.1176235575657], [340.1245224255098], [340.13124557080647], [340.1377889539297], [340.1441486435847], [340.15032081905156], [340.1563017724628], [340.1620879110123], [340.16767575909586], [340.1730619603816], [340.17824327980816], [340.1832166055114], [340.1879789506765], [340.1925274553157], [340.1968593879706], [340.2009721473366], [340.20486326381126], [340.20853040096256], [340.211971356919], [340.2151840656784], [340.21816659833684], [340.220917164235], [340.22343411202286], [340.22571593064106], [340.2277612502192], [340.22956884288976], [340.2311376235178], [340.23246665034566], [340.23355512555287], [340.2344023957296], [340.23500795226545], [340.2353714316511], [340.2354926156947]], "dynamic_viscosity": [[1.7823192278158038e-05], [1.7823202202566416e-05], [1.7823231969793612e-05], [1.7823281561849426e-05], [1.782335094876241e-05], [1.782344008859816e-05], [1.7823548927484873e-05], [1.7823677399646276e-05], [1.7823825427441738e-05], [1.782399292141366e-05], [1.782417978034206e-05], [1.7824385891306344e-05], [1.78246111297542e-05], [1.782485535957759e-05], [1.7825118433195786e-05], [1.7825400191645362e-05], [1.7825700464677207e-05], [1.7826019070860307e-05], [1.7826355817692396e-05], [1.782671050171733e-05], [1.7827082908649117e-05], [1.7827472813502537e-05], [1.7827879980730256e-05], [1.782830416436638e-05], [1.7828745108176272e-05], [1.782920254581271e-05], [1.7829676200978056e-05], [1.7830165787592514e-05], [1.7830671009968327e-05], [1.7831191562989767e-05], [1.7831727132298813e-05], [1.783227739448644e-05], [1.783284201728938e-05], [1.7833420659792176e-05], [1.783401297263451e-05], [1.7834618598223598e-05], [1.7835237170951513e-05], [1.783586831741737e-05], [1.7836511656654135e-05], [1.7837166800360063e-05], [1.7837833353134406e-05], [1.7838510912717485e-05], [1.783919907023479e-05], [1.7839897410445044e-05], [1.78406055119921e-05], [1.784132294766039e-05], [1.7842049284633943e-05], [1.7842784084758695e-05], [1.7843526904807886e-05], [1.7844277296750595e-05], [1.784503480802296e-05], [1.7845798981802153e-05], [1.7846569357282808e-05], [1.7847345469955784e-05], [1.7848126851889096e-05], [1.784891303201079e-05], [1.7849703536393678e-05], [1.7850497888541668e-05], [1.785129560967756e-05], [1.7852096219032156e-05], [1.7852899234134456e-05], [1.7853704171102765e-05], [1.785451054493663e-05], [1.7855317869809285e-05], [1.7856125659360494e-05], [1.785693342698972e-05], [1.7857740686149213e-05], [1.785854695063709e-05], [1.785935173488997e-05], [1.7860154554275308e-05], [1.7860954925382927e-05], [1.7861752366315764e-05], [1.7862546396979656e-05], [1.7863336539371893e-05], [1.786412231786845e-05], [1.7864903259509672e-05], [1.7865678894284325e-05], [1.7866448755411697e-05], [1.7867212379621783e-05], [1.7867969307433174e-05], [1.7868719083428638e-05], [1.7869461256528196e-05], [1.7870195380259457e-05], [1.7870921013025184e-05], [1.787163771836778e-05], [1.78723450652307e-05], [1.7873042628216485e-05], [1.7873729987841364e-05], [1.7874406730786274e-05], [1.7875072450144043e-05], [1.7875726745662758e-05], [1.7876369223985048e-05], [1.787699949888316e-05], [1.787761719148976e-05], [1.7878221930524238e-05], [1.787881335251447e-05], [1.7879391102013798e-05], [1.787995483181323e-05], [1.788050420314865e-05], [1.7881038885902904e-05], [1.788155855880277e-05], [1.7882062909610524e-05], [1.788255163531011e-05], [1.788302444228779e-05], [1.7883481046507144e-05], [1.788392117367831e-05], [1.7884344559421397e-05], [1.788475094942399e-05], [1.7885140099592594e-05], [1.7885511776197977e-05], [1.788586575601434e-05], [1.78862018264522e-05], [1.7886519785684903e-05], [1.788681944276875e-05], [1.7887100617756602e-05], [1.7887363141804946e-05], [1.7887606857274346e-05], [1.7887831617823185e-05], [1.788803728849474e-05], [1.7888223745797384e-05], [1.7888390877778098e-05], [1.7888538584088954e-05], [1.788866677604685e-05], [1.78887753766862e-05], [1.788886432080466e-05], [1.7888933555001965e-05], [1.7888983037711592e-05], [1.788901273922553e-05], [1.7889022641711888e-05]], "altitude": [[224.87111713216484], [224.83954864557782], [224.74486220149268], [224.58711483548277], [224.3664015686628], [224.08285535045172], [223.73664697848895], [223.3279849957521], [222.8571155649388], [222.32432232018718], [221.72992619622548], [221.07428523505286], [220.35779437026832], [219.58088518917754], [218.74402567282067], [217.84771991407817], [216.89250781402404], [215.87896475670973], [214.80770126257414], [213.679362620689], [212.49462850006088], [211.254212540224], [209.9588619213704], [208.60935691427665], [207.2065104102977], [205.7511674317118], [204.24420462271044], [202.68652972134083], [201.0790810127183], [199.42282676383857], [197.71876464032982], [195.96792110549626], [194.171350802015], [192.33013591665883], [190.44538552842718], [188.51823494047858], [186.54984499626636], [184.54140138029015], [182.49411390388366], [180.40921577646958], [178.2879628627206], [176.13163292607317], [173.94152485905073], [171.71895790085952], [169.46527084272793], [167.18182122146902], [164.869984501751], [162.53115324756862], [160.16673628341493], [157.77815784565786], [155.36685672463358], [152.9342853979731], [150.48190915568387], [148.01120521751398], [145.52366184313024], [143.0207774356461], [140.50405963903978], [137.97502443000587], [135.43519520478745], [132.88610186153957], [130.32927987877542], [127.76626939045167], [125.19861425824938], [122.62786114160934], [120.05555856608244], [117.48325599055552], [114.91250287391547], [112.3448477417132], [109.78183725338944], [107.22501527062528], [104.6759219273774], [102.136092702159], [99.60705749312507], [97.09033969651875], [94.58745528903464], [92.09991191465087], [89.62920797648101], [87.17683173419175], [84.74426040753127], [82.33295928650699], [79.94438084874994], [77.57996388459622], [75.24113263041389], [72.9292959106958], [70.64584628943692], [68.39215923130536], [66.16959227311412], [63.97948420609171], [61.823154269444274], [59.70190135569524], [57.61700322828122], [55.569715751874696], [53.56127213589849], [51.5928821916863], [49.66573160373767], [47.78098121550599], [45.93976633014984], [44.14319602666862], [42.392352491835084], [40.68829036832628], [39.03203611944656], [37.42458741082402], [35.86691250945441], [34.359949700453086], [32.90460672186714], [31.501760217888204], [30.152255210794465], [28.85690459194086], [27.616488632103966], [26.431754511475873], [25.303415869590708], [24.232152375455115], [23.218609318140807], [22.26339721808671], [21.36709145934421], [20.530231942987314], [19.753322761896527], [19.036831897111995], [18.381190935939372], [17.78679481197767], [17.254001567226055], [16.783132136412775], [16.3744701536759], [16.0282617817131], [15.74471556350207], [15.524002296682085], [15.36625493067217], [15.271568486587029], [15.240000000000009]], "gravity": [[9.805957764686129], [9.805957861860298], [9.805958153324287], [9.805958638902553], [9.805959318302639], [9.805960191115371], [9.80596125681507], [9.80596251475989], [9.80596396419221], [9.805965604239066], [9.805967433912706], [9.805969452111153], [9.8059716576189], [9.805974049107618], [9.805976625136969], [9.805979384155462], [9.805982324501404], [9.805985444403879], [9.805988741983834], [9.805992215255191], [9.805995862126066], [9.805999680400006], [9.806003667777329], [9.806007821856486], [9.806012140135536], [9.806016620013635], [9.806021258792594], [9.806026053678528], [9.806031001783511], [9.806036100127335], [9.806041345639303], [9.806046735160058], [9.806052265443506], [9.80605793315877], [9.806063734892177], [9.80606966714934], [9.80607572635723], [9.806081908866357], [9.806088210952957], [9.806094628821228], [9.80610115860562], [9.80610779637316], [9.806114538125836], [9.806121379802978], [9.806128317283727], [9.806135346389498], [9.80614246288651], [9.806149662488334], [9.806156940858461], [9.80616429361293], [9.806171716322963], [9.806179204517626], [9.806186753686525], [9.806194359282529], [9.8062020167245], [9.806209721400055], [9.806217468668343], [9.806225253862847], [9.806233072294178], [9.80624091925292], [9.806248790012452], [9.806256679831797], [9.806264583958487], [9.806272497631417], [9.806280416083705], [9.806288334545586], [9.806296248247262], [9.806304152421793], [9.806312042307953], [9.806319913153114], [9.806327760216092], [9.806335578770014], [9.80634336410517], [9.806351111531832], [9.806358816383103], [9.80636647401771], [9.806374079822799], [9.80638162921673], [9.806389117651833], [9.806396540617136], [9.806403893641091], [9.806411172294265], [9.806418372192018], [9.806425488997128], [9.806432518422424], [9.806439456233354], [9.80644629825054], [9.806453040352302], [9.80645967847713], [9.806466208626151], [9.80647262686551], [9.806478929328767], [9.806485112219217], [9.806491171812167], [9.806497104457206], [9.80650290658037], [9.806508574686331], [9.806514105360478], [9.80651949527099], [9.806524741170833], [9.80652983989972], [9.806534788386024], [9.806539583648615], [9.806544222798664], [9.806548703041386], [9.806553021677727], [9.806557176105972], [9.806561163823334], [9.80656498242746], [9.806568629617859], [9.806572103197318], [9.806575401073198], [9.806578521258722], [9.806581461874144], [9.80658422114791], [9.806586797417701], [9.806589189131456], [9.806591394848288], [9.806593413239368], [9.806595243088719], [9.806596883293953], [9.806598332866923], [9.806599590934338], [9.80660065673827], [9.806601529636628], [9.806602209103533], [9.806602694729639], [9.806602986222378], [9.80660308340614]], "reynolds_number": [[4240044.36456898], [4240054.9183662925], [4240086.5735165], [4240139.311297957], [4240213.100519494], [4240307.897537858], [4240423.646282072], [4240560.2782847155], [4240717.712720179], [4240895.8564498015], [4241094.604073919], [4241313.837990766], [4241553.428462247], [4241813.233686528], [4242093.099877404], [4242392.8613504395], [4242712.340615816], [4243051.348477876], [4243409.6841412885], [4243787.1353238365], [4244183.478375717], [4244598.478405362], [4245031.889411677], [4245483.45442268], [4245952.9056404615], [4246439.96459238], [4246944.342288468], [4247465.739384968], [4248003.846353876], [4248558.343658503], [4249128.901934901], [4249715.182179097], [4250316.835940049], [4250933.505518262], [4251564.824169902], [4252210.416316382], [4252869.897759289], [4253542.875900553], [4254228.949967748], [4254927.711244418], [4255638.7433053525], [4256361.6222566115], [4257095.916980277], [4257841.189383739], [4258596.994653417], [4259362.881512824], [4260138.39248475], [4260923.064157525], [4261716.427455179], [4262518.007911356], [4263327.325946841], [4264143.897150574], [4264967.232563977], [4265796.838968433], [4266632.2191758], [4267472.872321758], [4268318.294161866], [4269167.977370109], [4270021.411839857], [4270878.084986951], [4271737.482054853], [4272599.086421625], [4273462.379908541], [4274326.843090234], [4275191.955606117], [4276057.196472905], [4276922.044398119], [4277785.978094281], [4278648.476593707], [4279509.019563642], [4280367.087621563], [4281222.162650475], [4282073.7281139875], [4282921.269370946], [4283764.273989489], [4284602.232060277], [4285434.636508703], [4286260.983405905], [4287080.772278345], [4287893.5064158095], [4288698.693177558], [4289495.844296486], [4290284.476181052], [4291064.110214795], [4291834.273053248], [4292594.496917999], [4293344.319887782], [4294083.286186324], [4294810.946466783], [4295526.858092609], [4296230.585414573], [4296921.700043829], [4297599.781120773], [4298264.415579567], [4298915.198408077], [4299551.732903078], [4300173.630920574], [4300780.513120953], [4301372.009208953], [4301947.758168107], [4302507.408489634], [4303050.618395507], [4303577.056055608], [4304086.39979878], [4304578.338317606], [4305052.57086681], [4305508.807455099], [4305946.769030313], [4306366.187657739], [4306766.806691492], [4307148.380938773], [4307510.676816945], [4307853.472503273], [4308176.558077219], [4308479.735655201], [4308762.819517698], [4309025.636228603], [4309268.024746769], [4309489.836529612], [4309690.935628723], [4309871.198777423], [4310030.515470168], [4310168.788033769], [4310285.931690348], [4310381.874612027], [4310456.557967233], [4310509.935958664], [4310541.975852832], [4310552.658001196]], "dynamic_pressure": [[2382.017204538674], [2382.0244599344182], [2382.0462218531015], [2382.0824774914263], [2382.133205518306], [2382.1983760865146], [2382.2779508489634], [2382.3718829796185], [2382.4801171990675], [2382.602589804698], [2382.7392287054954], [2382.8899534614425], [2383.054675327504], [2383.2332973021926], [2383.425714180679], [2383.631812612439], [2383.851471163422], [2384.0845603826974], [2384.330942873577], [2384.5904733691823], [2384.862998812401], [2385.1483584402545], [2385.4463838725837], [2385.7568992050774], [2386.0797211065596], [2386.414658920529], [2386.7615147708866], [2387.1200836718454], [2387.490153641924], [2387.8715058220373], [2388.263914597591], [2388.6671477245504], [2389.0809664594262], [2389.5051256931297], [2389.939374088624], [2390.3834542223285], [2390.8371027292123], [2391.300050451503], [2391.772022590953], [2392.2527388646013], [2392.741913663948], [2393.239256217473], [2393.7444707564314], [2394.257256683831], [2394.7773087465366], [2395.3043172103976], [2395.837968038318], [2396.377943071203], [2396.9239202116514], [2397.4755736103575], [2398.0325738550687], [2398.5945881620555], [2399.1612805699615], [2399.7323121359427], [2400.307341134001], [2400.8860232553934], [2401.468011811021], [2402.0529579356757], [2402.6405107940504], [2403.2303177883746], [2403.822024767587], [2404.415276237908], [2405.0097155746876], [2405.604985235435], [2406.2007269738733], [2406.7965820549152], [2407.392191470422], [2407.9871961556214], [2408.5812372060523], [2409.1739560949104], [2409.7649948906424], [2410.35399647468], [2410.9406047591665], [2411.524464904516], [2412.105223536717], [2412.6825289641915], [2413.2560313940994], [2413.8253831479374], [2414.390238876286], [2414.950255772578], [2415.5050937857277], [2416.054415831495], [2416.597888002422], [2417.1351797762245], [2417.6659642224704], [2418.189918207413], [2418.706722596852], [2419.2160624568446], [2419.7176272521583], [2420.2111110423134], [2420.6962126750705], [2421.172635977231], [2421.6400899426017], [2422.098288917014], [2422.546952780229], [2422.9858071246113], [2423.4145834304545], [2423.8330192377884], [2424.240858314592], [2424.637850821236], [2425.023753471072], [2425.398329687015], [2425.761349754028], [2426.112590967373], [2426.451837776521], [2426.778881924615], [2427.0935225833696], [2427.3955664833215], [2427.684828039295], [2427.961129471028], [2428.2243009188282], [2428.474180554191], [2428.7106146852843], [2428.933457857212], [2429.1425729469906], [2429.337831253152], [2429.5191125799015], [2429.6863053157736], [2429.83930650672], [2429.9780219235527], [2430.1023661237296], [2430.21226250738], [2430.3076433675783], [2430.3884499347787], [2430.454632415414], [2430.5061500245984], [2430.542971012923], [2430.5650726873228], [2430.5724414259876]], "delta_ISA": [[0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0]], "stagnation_temperature": [[288.6711188971432], [288.67132405371666], [288.67193939987015], [288.67296456497706], [288.6743989315744], [288.67624163573436], [288.67849156758496], [288.681147371978], [288.68420744930495], [288.68766995646075], [288.69153280795257], [288.6957936771567], [288.70044999771886], [288.7054989650993], [288.7109375382625], [288.71676244150717], [288.7229701664394], [288.7295569740852], [288.73651889714154], [288.7438517423658], [288.7515510931004], [288.7596123119323], [288.76803054348585], [288.776800717346], [288.78591755111205], [288.79537555357797], [288.8051690280397], [288.8152920757251], [288.82573859934615], [288.83650230677085], [288.847576714812], [288.85895515313126], [288.8706307682563], [288.88259652770756], [288.8948452242336], [288.9073694801511], [288.9201617517875], [288.93321433402446], [288.94651936493756], [288.96006883053127], [288.9738545695649], [288.9878682784675], [289.0021015163387], [289.01654571003246], [289.0311921593195], [289.0460320421275], [289.0610564198539], [289.0762562427498], [289.09162235536957], [289.1071455020853], [289.12281633266133], [289.1386254078852], [289.1545632052533], [289.17062012470575], [289.1867864944086], [289.20305257657935], [289.2194085733517], [289.2358446326773], [289.25235085425936], [289.2689172955161], [289.28553397756946], [289.3021908912555], [289.31887800315354], [289.33558526162943], [289.3523026028904], [289.36901995704676], [289.38572725417794], [289.4024144303979], [289.41907143391774], [289.4356882311], [289.4522548125038], [289.46876119891317], [289.48519744734926], [289.5015536570599], [289.5178199754836], [289.5339866041849], [289.5500438047574], [289.5659819046899], [289.5817913031936], [289.597462476986], [289.612985986028], [289.62835247921083], [289.64355269999], [289.65857749196124], [289.67341780437755], [289.68806469760165], [289.7025093484916], [289.7167430557169], [289.73075724500046], [289.7445434742848], [289.7580934388179], [289.7713989761571], [289.7844520710869], [289.7972448604476], [289.80976963787367], [289.8220188584363], [289.83398514318975], [289.84566128361683], [289.85704024597277], [289.86811517552246], [289.8788794006715], [289.8893264369854], [289.89944999109696], [289.90924396449805], [289.91870245721475], [289.92781977136167], [289.93659041457585], [289.9450091033257], [289.9530707660947], [289.9607705464376], [289.9681038059067], [289.9750661268463], [289.9816533150552], [289.9878614023136], [289.9936866487747], [289.99912554521774], [290.0041748151627], [290.0088314168447], [290.0130925450473], [290.01695563279213], [290.0204183528861], [290.02347861932367], [290.026134588544], [290.02838466054163], [290.0302274798306], [290.03166193626157], [290.03268716569045], [290.03330255049923], [290.03350771996816]], "stagnation_pressure": [[101057.02987642185], [101057.40826843742], [101058.54322345828], [101060.43407852385], [101063.07972908848], [101066.47862960481], [101070.6287943402], [101075.52779842519], [101081.17277913583], [101087.56043740707], [101094.68703957836], [101102.54841937084], [101111.1399800944], [101120.45669708609], [101130.49312037713], [101141.24337758849], [101152.70117705505], [101164.8598111762], [101177.71215999222], [101191.25069498649], [101205.4674831102], [101220.35419103072], [101235.90208960054], [101252.10205854614], [101268.94459137593], [101286.41980050379], [101304.51742258895], [101323.22682408863], [101342.53700702202], [101362.43661494469], [101382.91393912997], [101403.95692495532], [101425.55317849288], [101447.68997329993], [101470.35425740798], [101493.53266050728], [101517.21150132474], [101541.37679519138], [101566.01426179743], [101591.10933313139], [101616.64716160005], [101642.612628326], [101668.99035161913], [101695.76469561936], [101722.9197791053], [101750.4394844667], [101778.30746683544], [101806.50716337175], [101835.02180270093], [101863.83441449673], [101892.92783920583], [101922.28473791025], [101951.88760232182], [101981.7187649036], [102011.76040911449], [102041.99457977069], [102072.40319351849], [102102.96804941448], [102133.67083960546], [102164.49316010391], [102195.41652165301], [102226.42236067403], [102257.49205029127], [102288.60691142791], [102319.74822396606], [102350.89723796486], [102382.03518493041], [102413.14328912954], [102444.20277894223], [102475.19489824469], [102506.10091781663], [102536.9021467645], [102567.57994395593], [102598.11572945486], [102628.4909959528], [102658.68732018712], [102688.68637433968], [102718.46993740746], [102748.01990653855], [102777.31830832487], [102806.34731004473], [102835.08923084661], [102863.5265528672], [102891.641932275], [102919.41821023324], [102946.83842377149], [102973.8858165617], [103000.54384958757], [103026.7962117012], [103052.62683005958], [103078.01988043131], [103102.95979736814], [103127.43128423116], [103151.41932306654], [103174.90918432173], [103197.88643639439], [103220.33695500836], [103242.24693240691], [103263.60288635918], [103284.39166896878], [103304.60047528188], [103324.21685168432], [103343.22870408298], [103361.62430586443], [103379.39230562434], [103396.52173466086], [103413.00201422695], [103428.82296253488], [103443.974801507], [103458.44816326829], [103472.23409637401], [103485.3240717677], [103497.70998846553], [103509.38417896024], [103520.33941434223], [103530.56890913215], [103540.06632582092], [103548.82577911447], [103556.84183987841], [103564.10953877933], [103570.62436962068], [103576.38229236912], [103581.37973586963], [103585.61360024664], [103589.081258989], [103591.78056071771], [103593.7098306337], [103594.86787164563], [103595.2539651761]], "isentropic_expansion_factor": [[1.4010009684795701], [1.4010009636042176], [1.4010009489809852], [1.4010009246183497], [1.401000890530434], [1.4010008467370003], [1.401000793263439], [1.4010007301407574], [1.401000657405563], [1.4010005751000445], [1.4010004832719516], [1.4010003819745698], [1.4010002712666925], [1.4010001512125922], [1.4010000218819876], [1.4009998833500068], [1.4009997356971495], [1.4009995790092453], [1.4009994133774102], [1.4009992388979984], [1.4009990556725538], [1.4009988638077564], [1.4009986634153673], [1.400998454612171], [1.4009982375199137], [1.4009980122652401], [1.4009977789796275], [1.4009975377993158], [1.400997288865237], [1.4009970323229388], [1.40099676832251], [1.4009964970184994], [1.4009962185698333], [1.4009959331397313], [1.4009956408956186], [1.400995342009036], [1.400995036655547], [1.4009947250146437], [1.4009944072696492], [1.4009940836076167], [1.4009937542192283], [1.400993419298691], [1.4009930790436282], [1.400992733654972], [1.4009923833368507], [1.400992028296477], [1.4009916687440305], [1.4009913048925409], [1.4009909369577682], [1.4009905651580805], [1.4009901897143315], [1.400989810849733], [1.4009894287897293], [1.400989043761867], [1.4009886559956652], [1.4009882657224817], [1.4009878731753798], [1.4009874785889929], [1.400987082199387], [1.400986684243923], [1.4009862849611163], [1.400985884590497], [1.4009854833724673], [1.4009850815481582], [1.4009846793592866], [1.4009842770480099], [1.40098387485678], [1.4009834730281978], [1.4009830718048653], [1.4009826714292388], [1.4009822721434813], [1.4009818741893127], [1.4009814778078633], [1.4009810832395238], [1.4009806907237963], [1.4009803004991468], [1.4009799128028564], [1.4009795278708719], [1.4009791459376588], [1.400978767236054], [1.4009783919971184], [1.4009780204499904], [1.4009776528217408], [1.4009772893372283], [1.400976930218955], [1.400976575686925], [1.4009762259585021], [1.4009758812482698], [1.4009755417678929], [1.4009752077259805], [1.4009748793279493], [1.4009745567758913], [1.4009742402684409], [1.4009739300006445], [1.4009736261638333], [1.4009733289454962], [1.4009730385291577], [1.4009727550942552], [1.4009724788160203], [1.400972209865363], [1.4009719484087575], [1.4009716946081312], [1.4009714486207563], [1.4009712105991452], [1.4009709806909476], [1.4009707590388507], [1.400970545780485], [1.4009703410483296], [1.4009701449696232], [1.4009699576662793], [1.4009697792548017], [1.4009696098462066], [1.4009694495459473], [1.400969298453842], [1.4009691566640057], [1.4009690242647868], [1.4009689013387059], [1.4009687879624002], [1.400968684206571], [1.4009685901359343], [1.4009685058091783], [1.4009684312789215], [1.4009683665916772], [1.4009683117878224], [1.4009682669015688], [1.40096823196094], [1.4009682069877523], [1.400968191997599], [1.400968186999841]], "specific_heat_at_constant_pressure": [[1004.7459388321377], [1004.745941335655], [1004.7459488450396], [1004.7459613567894], [1004.7459788650667], [1004.7460013616984], [1004.7460288361744], [1004.7460612756475], [1004.7460986649312], [1004.7461409864987], [1004.7461882204822], [1004.7462403446697], [1004.7462973345047], [1004.7463591630838], [1004.7464258011552], [1004.7464972171168], [1004.7465733770149], [1004.7466542445426], [1004.7467397810383], [1004.7468299454855], [1004.7469246945113], [1004.7470239823867], [1004.7471277610261], [1004.7472359799889], [1004.7473485864797], [1004.7474655253512], [1004.747586739106], [1004.7477121679007], [1004.7478417495491], [1004.7479754195288], [1004.7481131109862], [1004.7482547547445], [1004.748400279312], [1004.7485496108917], [1004.7487026733924], [1004.7488593884407], [1004.749019675396], [1004.7491834513644], [1004.7493506312169], [1004.7495211276075], [1004.7496948509935], [1004.7498717096582], [1004.7500516097348], [1004.750234455232], [1004.7504201480625], [1004.7506085880733], [1004.7507996730769], [1004.7509932988863], [1004.7511893593515], [1004.751387746398], [1004.7515883500673], [1004.7517910585614], [1004.751995758287], [1004.7522023339045], [1004.7524106683779], [1004.7526206430274], [1004.7528321375846], [1004.7530450302504], [1004.7532591977545], [1004.7534745154175], [1004.7536908572164], [1004.7539080958513], [1004.7541261028148], [1004.7543447484636], [1004.7545639020933], [1004.7547834320142], [1004.7550032056298], [1004.7552230895183], [1004.755442949515], [1004.7556626507974], [1004.7558820579719], [1004.7561010351637], [1004.7563194461067], [1004.7565371542363], [1004.7567540227844], [1004.7569699148747], [1004.7571846936205], [1004.7573982222236], [1004.7576103640747], [1004.7578209828552], [1004.7580299426392], [1004.758237107998], [1004.7584423441043], [1004.7586455168379], [1004.7588464928913], [1004.7590451398768], [1004.7592413264334], [1004.7594349223341], [1004.7596257985933], [1004.7598138275746], [1004.7599988830978], [1004.7601808405458], [1004.7603595769724], [1004.7605349712072], [1004.7607069039619], [1004.7608752579348], [1004.7610399179141], [1004.7612007708813], [1004.7613577061118], [1004.7615106152754], [1004.7616593925344], [1004.7618039346407], [1004.7619441410307], [1004.7620799139177], [1004.762211158384], [1004.7623377824691], [1004.7624596972556], [1004.7625768169539], [1004.7626890589837], [1004.7627963440516], [1004.7628985962283], [1004.7629957430204], [1004.7630877154411], [1004.7631744480763], [1004.7632558791483], [1004.7633319505763], [1004.7634026080324], [1004.763467800995], [1004.7635274827991], [1004.7635816106806], [1004.7636301458203], [1004.7636730533807], [1004.7637103025413], [1004.7637418665287], [1004.7637677226434], [1004.7637878522823], [1004.763802240957], [1004.7638108783084], [1004.7638137581168]], "gas_specific_constant": 287.0528742}, "aerodynamics": {"angle_of_attack": [[0.1828879065106839], [0.182887282948818], [0.18288541265253966], [0.1828822967895891], [0.18287793730522678], [0.1828723369210241], [0.1828654991328589], [0.1828574282086388], [0.18284812918522506], [0.1828376078651197], [0.18282587081235008], [0.1828129253480434], [0.18279877954535131], [0.18278344222396573], [0.18276692294401092], [0.18274923199955814], [0.1827303804115496], [0.18271037992027903], [0.18268924297738776], [0.1826669827373657], [0.18264361304859802], [0.1826191484439679], [0.18259360413093453], [0.1825669959813286], [0.18253934052048054], [0.18251065491614718], [0.18248095696691077], [0.18245026509014808], [0.18241859830972634], [0.18238597624313957], [0.18235241908848954], [0.18231794761088063], [0.18228258312864215], [0.18224634749908292], [0.18220926310404428], [0.18217135283501856], [0.18213264007803015], [0.18209314869824011], [0.18205290302422392], [0.18201192783200684], [0.18197024832884728], [0.1819278901368118], [0.18188487927607555], [0.18184124214800002], [0.18179700551811545], [0.1817521964987537], [0.18170684253165742], [0.18166097137036108], [0.18161461106237684], [0.18156778993137393], [0.18152053655912861], [0.18147287976738616], [0.18142484859968813], [0.18137647230300896], [0.18132778030947366], [0.18127880221785372], [0.18122956777514737], [0.18118010685808783], [0.18113044945459408], [0.18108062564527916], [0.18103066558492384], [0.1809805994839908], [0.18093045759015694], [0.18088027016988711], [0.18083006749006347], [0.18077987979969157], [0.18072973731167555], [0.18067967018463904], [0.1806297085049593], [0.18057988226873792], [0.18053022136405888], [0.18048075555327428], [0.18043151445543587], [0.1803825275289324], [0.18033382405420553], [0.18028543311670506], [0.18023738358996436], [0.18018970411888366], [0.1801424231032284], [0.18009556868126017], [0.1800491687136588], [0.18000325076759563], [0.17995784210106808], [0.17991296964744133], [0.17986866000025634], [0.17982493939823288], [0.17978183371059822], [0.17973936842259103], [0.1796975686212729], [0.17965645898161692], [0.17961606375285744], [0.1795764067450868], [0.17953751131619833], [0.17949940035908388], [0.17946209628910048], [0.17942562103190732], [0.17938999601154168], [0.1793552421388087], [0.1793213798000374], [0.17928842884606605], [0.1792564085816205], [0.17922533775496582], [0.17919523454790717], [0.17916611656612996], [0.17913800082982048], [0.17911090376466446], [0.17908484119318507], [0.17905982832635445], [0.1790358797556648], [0.1790130094454021], [0.17899123072536635], [0.17897055628390024], [0.17895099816125967], [0.17893256774336327], [0.1789152757558343], [0.17889913225848045], [0.17888414664004798], [0.17887032761336577], [0.17885768321086518], [0.17884622078038726], [0.17883594698145308], [0.17882686778178816], [0.17881898845426586], [0.17881231357420418], [0.17880684701700486], [0.1788025919561624], [0.17879955086163898], [0.17879772549860742], [0.1787971169265211]], "side_slip_angle": [[-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0]], "roll_angle": [[0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0]], "lift_coefficient": [[1.2165650014310005], [1.2165613249541376], [1.2165502978184968], [1.2165319269076436], [1.2165062236884492], [1.2164732042039694], [1.2164328890616367], [1.2163853034198429], [1.2163304769698196], [1.216268443916119], [1.216199242952368], [1.216122917235195], [1.21603951435433], [1.2159490863002904], [1.2158516894284013], [1.2157473844205806], [1.2156362362436552], [1.2155183141050558], [1.215393691405663], [1.2152624456897332], [1.215124658592148], [1.214980415783052], [1.2148298069093892], [1.2146729255347868], [1.2145098690754974], [1.214340738735156], [1.2141656394364349], [1.2139846797501535], [1.2137979718227847], [1.2136056313006651], [1.2134077772532843], [1.213204532093125], [1.21299602149448], [1.2127823743095216], [1.2125637224831713], [1.2123402009654198], [1.2121119476222353], [1.2118791031448517], [1.2116418109571272], [1.2114002171214695], [1.2111544702432788], [1.2109047213741606], [1.2106511239135216], [1.2103938335088469], [1.2101330079554176], [1.2098688070939672], [1.2096013927081957], [1.2093309284209366], [1.2090575795891727], [1.208781513199013], [1.2085028977593142], [1.2082219031947834], [1.2079387007388684], [1.2076534628255313], [1.2073663629814901], [1.2070775757171541], [1.2067872764180514], [1.2064956412358343], [1.2062028469789379], [1.2059090710035787], [1.2056144911045434], [1.205319285406217], [1.2050236322537107], [1.2047277101042377], [1.2044316974188036], [1.2041357725543562], [1.2038401136563326], [1.2035448985514783], [1.2032503046419132], [1.2029565087988263], [1.202663687257859], [1.2023720155146498], [1.202081668221231], [1.2017928190836367], [1.2015056407599791], [1.2012203047599213], [1.2009369813448583], [1.200655839429326], [1.2003770464836663], [1.2001007684374827], [1.1998271695847935], [1.1995564124900877], [1.1992886578959143], [1.1990240646316823], [1.1987627895240422], [1.1985049873084037], [1.1982508105423733], [1.1980004095202268], [1.1977539321891906], [1.197511524067352], [1.197273328163113], [1.1970394848960948], [1.196810132020082], [1.1965854045474675], [1.1963654346752852], [1.1961503517134189], [1.1959402820142273], [1.195735348904011], [1.1955356726166428], [1.195341370228551], [1.195152555596015], [1.1949693392940752], [1.1947918285575057], [1.1946201272237797], [1.194454335677696], [1.1942945507982332], [1.1941408659074062], [1.1939933707207324], [1.1938521513004174], [1.1937172900097315], [1.1935888654700182], [1.1934669525195327], [1.1933516221742837], [1.1932429415911299], [1.1931409740325878], [1.1930457788342295], [1.1929574113737051], [1.1928759230420583], [1.1928013612172683], [1.1927337692394855], [1.1926731863890028], [1.1926196478657252], [1.192573184771117], [1.192533824092237], [1.1925015886877888], [1.1924764972763637], [1.1924585644268422], [1.1924478005509649], [1.1924442118978438]], "drag_coefficient": [[0.11255434789086541], [0.11255379785232808], [0.11255214808883066], [0.11254939965649702], [0.11254555431458561], [0.11254061452428567], [0.11253458344676212], [0.1125274649409031], [0.11251926356031403], [0.11250998455004732], [0.11249963384257661], [0.11248821805344571], [0.11247574447629761], [0.11246222107749389], [0.11244765649014067], [0.11243206000773558], [0.112415441577253], [0.11239781179179702], [0.11237918188278856], [0.11235956371167997], [0.11233896976123411], [0.11231741312638005], [0.11229490750457656], [0.11227146718589785], [0.1122471070425081], [0.11222184251793392], [0.11219568961585263], [0.11216866488848473], [0.11214078542472951], [0.11211206883779821], [0.1120825332526976], [0.11205219729319445], [0.11202108006862142], [0.11198920116027225], [0.11195658060761919], [0.11192323889415459], [0.11188919693302952], [0.11185447605245932], [0.1118190979808548], [0.11178308483175534], [0.11174645908855858], [0.11170924358908679], [0.11167146150993587], [0.11163313635065424], [0.11159429191786445], [0.1115549523091104], [0.11151514189671392], [0.11147488531146696], [0.1114342074261894], [0.1113931333393185], [0.11135168835833921], [0.11130989798317865], [0.1112677878896144], [0.11122538391256186], [0.1111827120294778], [0.11113979834362077], [0.11109666906743222], [0.11105335050590674], [0.11100986903996342], [0.11096625110991937], [0.11092252319898693], [0.1108787118168592], [0.11083484348336645], [0.11079094471222262], [0.11074704199487573], [0.11070316178447964], [0.11065933047998121], [0.11061557441030213], [0.11057191981876054], [0.11052839284749218], [0.11048501952217435], [0.1104418257368276], [0.11039883723879611], [0.11035607961395777], [0.11031357827205407], [0.11027135843227574], [0.11022944510900166], [0.11018786309776489], [0.11014663696144972], [0.11010579101664923], [0.1100653493203158], [0.11002533565658444], [0.10998577352386099], [0.10994668612212659], [0.10990809634050801], [0.10987002674505003], [0.1098324995668004], [0.10979553669007576], [0.10975915964102037], [0.1097233895764287], [0.10968824727281647], [0.10965375311572537], [0.10961992708934434], [0.10958678876636657], [0.10955435729809178], [0.1095226514048587], [0.10949168936669271], [0.10946148901422986], [0.10943206771996017], [0.10940344238967067], [0.10937562945422516], [0.10934864486157697], [0.10932250406907615], [0.1092972220360612], [0.10927281321668178], [0.10924929155303466], [0.10922667046857658], [0.10920496286175609], [0.10918418110002154], [0.10916433701398254], [0.10914544189193251], [0.10912750647461143], [0.10911054095023588], [0.10909455494982626], [0.1090795575427555], [0.10906555723264158], [0.10905256195344312], [0.10904057906585453], [0.10902961535398831], [0.10901967702226639], [0.10901076969267053], [0.10900289840217157], [0.10899606760047695], [0.10899028114804124], [0.10898554231432665], [0.10898185377633923], [0.10897921761743487], [0.1089776353263971], [0.10897710779675127]], "lift_breakdown": {"inviscid_wings": {"main_wing": [[1.0609593469264134], [1.060956295980469], [1.0609471450463843], [1.0609318998343424], [1.0609105698565635], [1.060883168421404], [1.060849712623576], [1.0608102233330325], [1.0607647251799575], [1.0607132465385958], [1.060655819507168], [1.0605924798862703], [1.060523267154107], [1.0604482244397189], [1.0603673984931756], [1.0602808396539187], [1.0601886018162239], [1.0600907423925021], [1.059987322274225], [1.059878405790444], [1.0597640606640828], [1.0596443579660666], [1.0595193720668838], [1.0593891805867741], [1.0592538643426486], [1.0591135072940336], [1.058968196486429], [1.0588180219925716], [1.0586630768523564], [1.0585034570100305], [1.0583392612506204], [1.0581705911334978], [1.0579975509250985], [1.0578202475293552], [1.0576387904171431], [1.0574532915536006], [1.0572638653242838], [1.0570706284599742], [1.0568736999598758], [1.0566732010136364], [1.0564692549221244], [1.0562619870171879], [1.0560515245800672], [1.0558379967587161], [1.0556215344846482], [1.055402270388078], [1.0551803387129333], [1.054955875230754], [1.0547290171536268], [1.0544999030470863], [1.0542686727418868], [1.0540354672453423], [1.0538004286524838], [1.053563700056285], [1.0533254254582778], [1.0530857496780708], [1.0528448182632848], [1.0526027773991176], [1.052359773817631], [1.0521159547073058], [1.0518714676224272], [1.0516264603926528], [1.0513810810326707], [1.0511354776520505], [1.050889798365355], [1.0506441912026288], [1.0503988040202092], [1.0501537844117612], [1.0499092796203409], [1.0496654364501516], [1.0494224011796878], [1.0491803194750169], [1.048939336303762], [1.0486995958500864], [1.0484612414300578], [1.0482244154081752], [1.0479892591144753], [1.0477559127626586], [1.0475245153692465], [1.0472952046734023], [1.0470681170581482], [1.0468433874723364], [1.0466211493538815], [1.046401534554006], [1.046184673262785], [1.045970693935638], [1.0457597232214138], [1.0455518858913238], [1.0453473047693844], [1.045146100664204], [1.0449483923020513], [1.0447542962611276], [1.044563926907528], [1.0443773963324525], [1.0441948142907294], [1.0440162881411428], [1.0438419227879459], [1.0436718206238886], [1.0435060814750534], [1.043344802546806], [1.0431880783716692], [1.0430360007585386], [1.0428886587436064], [1.0427461385429473], [1.0426085235064775], [1.0424758940737675], [1.0423483277315186], [1.042225898972376], [1.0421086792560013], [1.0419967369711354], [1.0418901373998481], [1.0417889426833091], [1.0416932117892255], [1.0416030004811498], [1.0415183612892125], [1.0414393434830125], [1.041365993045849], [1.0412983526508666], [1.041236461639053], [1.0411803559986388], [1.041130068346775], [1.0410856279124623], [1.0410470605215292], [1.0410143885833583], [1.040987631079282], [1.0409668035528017], [1.0409519181016045], [1.040942983371387], [1.040940004551286]], "horizontal_stabilizer": [[0.4646046285513161], [0.4646027857867613], [0.46459725864545487], [0.46458805058382197], [0.46457516735967413], [0.46455861702860596], [0.46453840993803075], [0.46451455872039704], [0.4644870782840342], [0.4644559858032859], [0.4644213007062586], [0.46438304466164704], [0.4643412415636253], [0.4642959175155204], [0.4642471008116331], [0.46419482191793404], [0.4641391134510033], [0.46408001015565414], [0.4640175488811142], [0.46395176855573644], [0.4638827101603615], [0.4638104167003602], [0.46373493317611997], [0.4636563065526901], [0.4635745857274505], [0.4634898214971819], [0.46340206652357024], [0.46331137529744004], [0.46321780410217533], [0.4631214109754883], [0.4630222556707242], [0.4629203996164361], [0.4628159058754479], [0.46270883910253807], [0.46259926550152497], [0.46248725278107555], [0.46237287010980876], [0.46225618807059077], [0.4621372786138634], [0.4620162150102633], [0.46189307180250055], [0.46176792475662587], [0.4616408508124937], [0.46151192803357294], [0.4613812355564825], [0.46124885353950196], [0.4611148631110198], [0.4609793463173147], [0.4608423860697701], [0.4607040660920775], [0.4605644708667711], [0.4604236855815138], [0.46028179607528696], [0.46013888878403064], [0.45999505068653107], [0.4598503692496656], [0.459704932373905], [0.459558828338616], [0.4594121457472045], [0.45926497347243905], [0.45911740060168377], [0.45896951638226186], [0.45882141016688427], [0.45867317135921176], [0.4585248893595912], [0.4583766535110315], [0.45822855304539367], [0.4580806770297258], [0.4579331143132403], [0.4577859534741133], [0.45763928276714244], [0.4574931900714988], [0.4573477628389162], [0.4572030880425001], [0.4570592521257778], [0.45691634095246325], [0.4567744397565864], [0.45663363309324534], [0.4564940047899995], [0.4563556378986659], [0.45621861464797686], [0.4560830163966973], [0.45594892358751593], [0.45581641570155607], [0.45568557121367714], [0.4555564675483594], [0.45542918103655367], [0.4553037868730525], [0.4551803590747762], [0.45505897043987625], [0.45493969250761807], [0.45482259551899085], [0.4547077483783459], [0.4545952186157858], [0.45448507235035057], [0.4543773742542971], [0.45427218751808685], [0.45416957381629713], [0.4540695932746152], [0.4539723044375091], [0.45387776423705445], [0.45378602796257], [0.4536971492312805], [0.4536111799599786], [0.45352817033751125], [0.45344816879838085], [0.4533712219973427], [0.4532973747848072], [0.45322667018359325], [0.45315914936627655], [0.45309485163385044], [0.45303381439529133], [0.4529760731481288], [0.45292166146012813], [0.45287061095182957], [0.45282295128037464], [0.4527787101241347], [0.4527379131684835], [0.4527005840926743], [0.45266674455755446], [0.45263641419464257], [0.4526096105959463], [0.45258634930500985], [0.45256664380899697], [0.452550505531776], [0.4525379438280883], [0.4525289659787891], [0.45252357718716696], [0.45252178057621895]], "vertical_stabilizer": [[0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0]]}, "compressible_wings": {"main_wing": [[1.0609593469264134], [1.060956295980469], [1.0609471450463843], [1.0609318998343424], [1.0609105698565635], [1.060883168421404], [1.060849712623576], [1.0608102233330325], [1.0607647251799575], [1.0607132465385958], [1.060655819507168], [1.0605924798862703], [1.060523267154107], [1.0604482244397189], [1.0603673984931756], [1.0602808396539187], [1.0601886018162239], [1.0600907423925021], [1.059987322274225], [1.059878405790444], [1.0597640606640828], [1.0596443579660666], [1.0595193720668838], [1.0593891805867741], [1.0592538643426486], [1.0591135072940336], [1.058968196486429], [1.0588180219925716], [1.0586630768523564], [1.0585034570100305], [1.0583392612506204], [1.0581705911334978], [1.0579975509250985], [1.0578202475293552], [1.0576387904171431], [1.0574532915536006], [1.0572638653242838], [1.0570706284599742], [1.0568736999598758], [1.0566732010136364], [1.0564692549221244], [1.0562619870171879], [1.0560515245800672], [1.0558379967587161], [1.0556215344846482], [1.055402270388078], [1.0551803387129333], [1.054955875230754], [1.0547290171536268], [1.0544999030470863], [1.0542686727418868], [1.0540354672453423], [1.0538004286524838], [1.053563700056285], [1.0533254254582778], [1.0530857496780708], [1.0528448182632848], [1.0526027773991176], [1.052359773817631], [1.0521159547073058], [1.0518714676224272], [1.0516264603926528], [1.0513810810326707], [1.0511354776520505], [1.050889798365355], [1.0506441912026288], [1.0503988040202092], [1.0501537844117612], [1.0499092796203409], [1.0496654364501516], [1.0494224011796878], [1.0491803194750169], [1.048939336303762], [1.0486995958500864], [1.0484612414300578], [1.0482244154081752], [1.0479892591144753], [1.0477559127626586], [1.0475245153692465], [1.0472952046734023], [1.0470681170581482], [1.0468433874723364], [1.0466211493538815], [1.046401534554006], [1.046184673262785], [1.045970693935638], [1.0457597232214138], [1.0455518858913238], [1.0453473047693844], [1.045146100664204], [1.0449483923020513], [1.0447542962611276], [1.044563926907528], [1.0443773963324525], [1.0441948142907294], [1.0440162881411428], [1.0438419227879459], [1.0436718206238886], [1.0435060814750534], [1.043344802546806], [1.0431880783716692], [1.0430360007585386], [1.0428886587436064], [1.0427461385429473], [1.0426085235064775], [1.0424758940737675], [1.0423483277315186], [1.042225898972376], [1.0421086792560013], [1.0419967369711354], [1.0418901373998481], [1.0417889426833091], [1.0416932117892255], [1.0416030004811498], [1.0415183612892125], [1.0414393434830125], [1.041365993045849], [1.0412983526508666], [1.041236461639053], [1.0411803559986388], [1.041130068346775], [1.0410856279124623], [1.0410470605215292], [1.0410143885833583], [1.040987631079282], [1.0409668035528017], [1.0409519181016045], [1.040942983371387], [1.040940004551286]], "horizontal_stabilizer": [[0.4646046285513161], [0.4646027857867613], [0.46459725864545487], [0.46458805058382197], [0.46457516735967413], [0.46455861702860596], [0.46453840993803075], [0.46451455872039704], [0.4644870782840342], [0.4644559858032859], [0.4644213007062586], [0.46438304466164704], [0.4643412415636253], [0.4642959175155204], [0.4642471008116331], [0.46419482191793404], [0.4641391134510033], [0.46408001015565414], [0.4640175488811142], [0.46395176855573644], [0.4638827101603615], [0.4638104167003602], [0.46373493317611997], [0.4636563065526901], [0.4635745857274505], [0.4634898214971819], [0.46340206652357024], [0.46331137529744004], [0.46321780410217533], [0.4631214109754883], [0.4630222556707242], [0.4629203996164361], [0.4628159058754479], [0.46270883910253807], [0.46259926550152497], [0.46248725278107555], [0.46237287010980876], [0.46225618807059077], [0.4621372786138634], [0.4620162150102633], [0.46189307180250055], [0.46176792475662587], [0.4616408508124937], [0.46151192803357294], [0.4613812355564825], [0.46124885353950196], [0.4611148631110198], [0.4609793463173147], [0.4608423860697701], [0.4607040660920775], [0.4605644708667711], [0.4604236855815138], [0.46028179607528696], [0.46013888878403064], [0.45999505068653107], [0.4598503692496656], [0.459704932373905], [0.459558828338616], [0.4594121457472045], [0.45926497347243905], [0.45911740060168377], [0.45896951638226186], [0.45882141016688427], [0.45867317135921176], [0.4585248893595912], [0.4583766535110315], [0.45822855304539367], [0.4580806770297258], [0.4579331143132403], [0.4577859534741133], [0.45763928276714244], [0.4574931900714988], [0.4573477628389162], [0.4572030880425001], [0.4570592521257778], [0.45691634095246325], [0.4567744397565864], [0.45663363309324534], [0.4564940047899995], [0.4563556378986659], [0.45621861464797686], [0.4560830163966973], [0.45594892358751593], [0.45581641570155607], [0.45568557121367714], [0.4555564675483594], [0.45542918103655367], [0.4553037868730525], [0.4551803590747762], [0.45505897043987625], [0.45493969250761807], [0.45482259551899085], [0.4547077483783459], [0.4545952186157858], [0.45448507235035057], [0.4543773742542971], [0.45427218751808685], [0.45416957381629713], [0.4540695932746152], [0.4539723044375091], [0.45387776423705445], [0.45378602796257], [0.4536971492312805], [0.4536111799599786], [0.45352817033751125], [0.45344816879838085], [0.4533712219973427], [0.4532973747848072], [0.45322667018359325], [0.45315914936627655], [0.45309485163385044], [0.45303381439529133], [0.4529760731481288], [0.45292166146012813], [0.45287061095182957], [0.45282295128037464], [0.4527787101241347], [0.4527379131684835], [0.4527005840926743], [0.45266674455755446], [0.45263641419464257], [0.4526096105959463], [0.45258634930500985], [0.45256664380899697], [0.452550505531776], [0.4525379438280883], [0.4525289659787891], [0.45252357718716696], [0.45252178057621895]], "vertical_stabilizer": [[0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0]]}, "total": [[1.0671622819570181], [1.0671590569773137], [1.067149384051313], [1.0671332692172313], [1.0671107225337275], [1.0670817580736576], [1.0670463939137165], [1.0670046521226693], [1.066956558745456], [1.0669021437860695], [1.0668414411862879], [1.0667744888028028], [1.0667013283809914], [1.0666220055265707], [1.0665365696740363], [1.066445074053141], [1.0663475756523293], [1.0662441351798737], [1.0661348170225113], [1.0660196892015203], [1.0658988233264457], [1.0657722945465369], [1.0656401814994643], [1.065502566258585], [1.0653595342767521], [1.0652111743290842], [1.0650575784530132], [1.0648988418860996], [1.0647350630024428], [1.0645663432461976], [1.0643927870642846], [1.0642145018360747], [1.0640315978021755], [1.0638441879908085], [1.0636523881431328], [1.0634563166363333], [1.0632560944054696], [1.063051844863905], [1.0628436938220416], [1.062631769404798], [1.0624162019677885], [1.0621971240124217], [1.0619746700995805], [1.0617489767621464], [1.061520182417033], [1.06128842727541], [1.0610538532528033], [1.0608166038780147], [1.0605768242010287], [1.0603346607008886], [1.060090261192381], [1.0598437747322662], [1.0595953515253234], [1.0593451428294136], [1.0590933008609564], [1.0588399786992582], [1.0585853301912733], [1.058329509855995], [1.0580726727885421], [1.0578149745645429], [1.0575565711443364], [1.0572976187773833], [1.0570382739067639], [1.056778693073893], [1.0565190328235121], [1.0562594496090845], [1.0560000996985375], [1.0557411390802443], [1.0554827233700994], [1.0552250077182688], [1.0549681467174203], [1.0547122943110965], [1.0544576037028344], [1.054204227266348], [1.0539523164561222], [1.0537020217192292], [1.0534534924077705], [1.0532068766923914], [1.0529623214769004], [1.0527199723135814], [1.0524799733199943], [1.0522424670965682], [1.052007594645539], [1.0517754952909495], [1.0515463066000372], [1.0513201643056174], [1.0510972022301521], [1.0508775522107254], [1.0506613440256058], [1.0504487053222387], [1.0502397615465904], [1.0500346358737676], [1.0498334491404229], [1.0496363197784804], [1.0494433637502503], [1.0492546944854553], [1.0490704228194978], [1.0488906569333432], [1.0487155022953007], [1.0485450616039922], [1.0483794347333466], [1.0482187186790135], [1.048063007506584], [1.0479123923015612], [1.047766961120786], [1.0476267989458188], [1.0474919876380757], [1.0473626058953793], [1.0472387292108927], [1.0471204298330978], [1.0470077767280863], [1.04690083554345], [1.0467996685739331], [1.0467043347290614], [1.04661488950227], [1.0465313849423066], [1.0464538696260572], [1.0463823886333845], [1.0463169835239197], [1.0462576923153382], [1.0462045494640375], [1.0461575858471275], [1.0461168287465938], [1.0460823018352956], [1.046054025164727], [1.0460320151547051], [1.0460162845849494], [1.0460068425885658], [1.0460036946472315]]}, "drag_breakdown": {"parasite": {"main_wing": {"wetted_area": 239.23737313658532, "reference_area": 117.21806068545455, "parasite_drag_coefficient": [[0.006225725300732695], [0.006225722891346064], [0.006225715664654846], [0.006225703625064125], [0.00622568677991264], [0.006225665139468133], [0.006225638716920872], [0.006225607528375341], [0.006225571592840068], [0.0062255309322156544], [0.00622548557128094], [0.006225435537677407], [0.006225380861891738], [0.006225321577236625], [0.006225257719829768], [0.0062251893285711485], [0.006225116445118531], [0.006225039113861244], [0.006224957381892286], [0.0062248712989786915], [0.006224780917530261], [0.006224686292566656], [0.006224587481682845], [0.006224484545012958], [0.006224377545192591], [0.006224266547319541], [0.006224151618913039], [0.006224032829871456], [0.0062239102524286214], [0.006223783961108623], [0.00622365403267928], [0.0062235205461042015], [0.006223383582493543], [0.006223243225053435], [0.0062230995590341785], [0.0062229526716771595], [0.006222802652160638], [0.0062226495915443086], [0.006222493582712792], [0.0062223347203180296], [0.006222173100720618], [0.00622200882193016], [0.0062218419835446525], [0.006221672686688928], [0.006221501033952247], [0.006221327129324997], [0.006221151078134677], [0.006220972986981011], [0.006220792963670448], [0.006220611117149936], [0.006220427557440066], [0.006220242395567657], [0.0062200557434977585], [0.006219867714065202], [0.006219678420905644], [0.006219487978386236], [0.006219296501535915], [0.00621910410597535], [0.0062189109078466375], [0.0062187170237427425], [0.006218522570636753], [0.006218327665810985], [0.006218132426785966], [0.0062179369712494], [0.006217741416985054], [0.00621754588180173], [0.006217350483462254], [0.006217155339612609], [0.006216960567711205], [0.006216766284958362], [0.006216572608225999], [0.006216379653987636], [0.006216187538248689], [0.006215996376477154], [0.006215806283534655], [0.006215617373607982], [0.006215429760141049], [0.006215243555767431], [0.006215058872243434], [0.006214875820381738], [0.0062146945099857175], [0.006214515049784419], [0.006214337547368211], [0.006214162109125239], [0.0062139888401786065], [0.0062138178443243985], [0.006213649223970537], [0.006213483080076543], [0.006213319512094166], [0.006213158617909011], [0.006213000493783111], [0.0062128452342985205], [0.006212692932301941], [0.006212543678850412], [0.006212397563158126], [0.006212254672544329], [0.006212115092382399], [0.006211978906050098], [0.006211846194881025], [0.006211717038117315], [0.006211591512863562], [0.006211469694042065], [0.006211351654349319], [0.006211237464213889], [0.006211127191755595], [0.006211020902746062], [0.00621091866057067], [0.006210820526191908], [0.006210726558114137], [0.0062106368123498205], [0.0062105513423871776], [0.006210470199159351], [0.00621039343101504], [0.006210321083690625], [0.006210253200283851], [0.006210189821229013], [0.006210130984273677], [0.006210076724456993], [0.006210027074089524], [0.006209982062734705], [0.006209941717191827], [0.006209906061480672], [0.0062098751168277], [0.006209848901653883], [0.006209827431564107], [0.006209810719338242], [0.006209798774923798], [0.0062097916054302095], [0.006209789215124779]], "skin_friction_coefficient": [[0.0027920858705838213], [0.0027920847965989004], [0.002792081575298758], [0.0027920762086468434], [0.0027920686999142004], [0.0027920590536773962], [0.002792047275815642], [0.002792033373507077], [0.0027920173552242475], [0.0027919992307287676], [0.002791979011065152], [0.002791956708553869], [0.002791932336783571], [0.0027919059106025343], [0.0027918774461093065], [0.002791846960642579], [0.0027918144727702666], [0.002791780002277827], [0.002791743570155826], [0.0027917051985867393], [0.0027916649109310083], [0.0027916227317123835], [0.0027915786866025243], [0.002791532802404889], [0.00279148510703794], [0.0027914356295176434], [0.002791384399939301], [0.0027913314494587053], [0.0027912768102726694], [0.002791220515598886], [0.0027911625996551925], [0.002791103097638206], [0.0027910420457013785], [0.002790979480932456], [0.002790915441330395], [0.0027908499657817035], [0.002790783094036279], [0.002790714866682707], [0.0027906453251230704], [0.002790574511547279], [0.0027905024689069244], [0.0027904292408886962], [0.002790354871887367], [0.0027902794069783587], [0.0027902028918899255], [0.002790125372974945], [0.0027900468971823835], [0.002789967512028381], [0.002789887265567054], [0.002789806206360979], [0.002789724383451397], [0.0027896418463281636], [0.0027895586448994448], [0.0027894748294612047], [0.002789390450666472], [0.0027893055594944427], [0.0027892202072193994], [0.002789134445379494], [0.00278904832574541], [0.0027889619002889094], [0.0027888752211513], [0.002788788340611836], [0.00278870131105606], [0.0027886141849441408], [0.002788527014779176], [0.0027884398530755284], [0.002788352752327171], [0.002788265764976104], [0.0027881789433808176], [0.0027880923397848602], [0.0027880060062854995], [0.002787919994802513], [0.002787834357047122], [0.002787749144491081], [0.002787664408335954], [0.0027875801994825806], [0.002787496568500752], [0.002787413565599135], [0.0027873312405954282], [0.0027872496428867923], [0.0027871688214205544], [0.002787088824665231], [0.002787009700581836], [0.0027869314965955523], [0.0027868542595677216], [0.0027867780357682206], [0.0027867028708481955], [0.002786628809813206], [0.002786555896996758], [0.0027864841760342823], [0.0027864136898375197], [0.0027863444805693847], [0.0027862765896192665], [0.0027862100575788275], [0.002786144924218275], [0.002786081228463147], [0.0027860190083715975], [0.002785958301112221], [0.002785899142942408], [0.0027858415691872497], [0.002785785614219], [0.002785731311437116], [0.0027856786932488604], [0.0027856277910505178], [0.0027855786352091964], [0.002785531255045238], [0.002785485678815251], [0.0027854419336957727], [0.002785400045767556], [0.002785360040000511], [0.002785321940239283], [0.002785285769189504], [0.0027852515484046974], [0.002785219298273851], [0.002785189038009681], [0.0027851607856375646], [0.002785134557985165], [0.002785110370672754], [0.002785088238104226], [0.002785068173458824], [0.0027850501886835547], [0.002785034294486337], [0.0027850205003298397], [0.0027850088144260638], [0.0027849992437316085], [0.0027849917939436935], [0.0027849864694968842], [0.0027849832735605427], [0.0027849822080370165]], "compressibility_factor": [[0.9960454920692865], [0.9960454948883036], [0.996045503343632], [0.9960455174301075], [0.9960455371391249], [0.9960455624586462], [0.9960455933732054], [0.9960456298639213], [0.9960456719085066], [0.996045719481285], [0.9960457725532045], [0.9960458310918585], [0.9960458950615051], [0.9960459644230892], [0.9960460391342688], [0.9960461191494412], [0.996046204419772], [0.996046294893224], [0.9960463905145951], [0.996046491225548], [0.9960465969646503], [0.9960467076674124], [0.9960468232663285], [0.9960469436909181], [0.9960470688677723], [0.9960471987205994], [0.9960473331702733], [0.9960474721348817], [0.9960476155297803], [0.9960477632676439], [0.9960479152585227], [0.9960480714098975], [0.9960482316267395], [0.9960483958115681], [0.9960485638645137], [0.996048735683378], [0.9960489111637002], [0.9960490901988207], [0.9960492726799484], [0.9960494584962282], [0.9960496475348106], [0.9960498396809208], [0.9960500348179306], [0.9960502328274322], [0.9960504335893086], [0.9960506369818096], [0.9960508428816293], [0.9960510511639777], [0.9960512617026615], [0.99605147437016], [0.9960516890377045], [0.9960519055753566], [0.9960521238520886], [0.9960523437358642], [0.996052565093718], [0.9960527877918384], [0.9960530116956485], [0.9960532366698874], [0.9960534625786954], [0.996053689285693], [0.9960539166540663], [0.9960541445466498], [0.9960543728260071], [0.9960546013545183], [0.9960548299944587], [0.9960550586080855], [0.996055287057719], [0.9960555152058247], [0.9960557429150981], [0.9960559700485457], [0.9960561964695672], [0.9960564220420378], [0.9960566466303884], [0.9960568700996882], [0.996057092315724], [0.9960573131450797], [0.9960575324552172], [0.9960577501145526], [0.9960579659925373], [0.9960581799597328], [0.9960583918878874], [0.9960586016500143], [0.996058809120463], [0.9960590141749961], [0.9960592166908606], [0.9960594165468615], [0.9960596136234313], [0.9960598078027012], [0.9960599989685697], [0.9960601870067705], [0.9960603718049387], [0.9960605532526777], [0.9960607312416218], [0.9960609056654995], [0.9960610764201976], [0.9960612434038181], [0.9960614065167394], [0.9960615656616734], [0.9960617207437223], [0.996061871670433], [0.9960620183518506], [0.9960621607005702], [0.9960622986317869], [0.9960624320633454], [0.9960625609157872], [0.9960626851123956], [0.9960628045792401], [0.9960629192452193], [0.9960630290421008], [0.9960631339045609], [0.9960632337702218], [0.996063328579687], [0.9960634182765767], [0.9960635028075577], [0.9960635821223748], [0.9960636561738818], [0.9960637249180638], [0.9960637883140668], [0.9960638463242175], [0.9960638989140477], [0.9960639460523116], [0.9960639877110046], [0.9960640238653791], [0.9960640544939596], [0.9960640795785523], [0.9960640991042581], [0.9960641130594803], [0.9960641214359301], [0.9960641242286331]], "reynolds_factor": [[0.9983603032260623], [0.9983603042578512], [0.9983603073525879], [0.9983603125083845], [0.9983603197220944], [0.998360328989316], [0.9983603403043952], [0.9983603536604281], [0.9983603690492657], [0.9983603864615204], [0.998360405886569], [0.9983604273125632], [0.9983604507264341], [0.9983604761139013], [0.9983605034594824], [0.9983605327465033], [0.9983605639571064], [0.998360597072265], [0.9983606320717927], [0.9983606689343578], [0.9983607076374956], [0.9983607481576238], [0.9983607904700561], [0.9983608345490183], [0.9983608803676651], [0.9983609278980957], [0.9983609771113725], [0.998361027977539], [0.9983610804656377], [0.9983611345437309], [0.9983611901789199], [0.9983612473373658], [0.99836130598431], [0.9983613660840979], [0.9983614276001984], [0.9983614904952293], [0.9983615547309787], [0.9983616202684298], [0.9983616870677848], [0.9983617550884902], [0.9983618242892612], [0.9983618946281078], [0.9983619660623603], [0.998362038548697], [0.9983621120431698], [0.9983621865012314], [0.9983622618777634], [0.9983623381271036], [0.9983624152030748], [0.9983624930590125], [0.9983625716477935], [0.998362650921866], [0.9983627308332773], [0.9983628113337036], [0.9983628923744808], [0.998362973906632], [0.9983630558808995], [0.9983631382477729], [0.9983632209575212], [0.9983633039602213], [0.9983633872057901], [0.9983634706440127], [0.9983635542245741], [0.9983636378970905], [0.9983637216111376], [0.998363805316283], [0.9983638889621148], [0.9983639724982739], [0.9983640558744827], [0.998364139040576], [0.9983642219465306], [0.9983643045424959], [0.9983643867788232], [0.9983644686060958], [0.9983645499751578], [0.9983646308371441], [0.9983647111435089], [0.9983647908460549], [0.9983648698969618], [0.9983649482488152], [0.9983650258546326], [0.9983651026678947], [0.9983651786425694], [0.9983652537331409], [0.9983653278946362], [0.9983654010826515], [0.9983654732533774], [0.9983655443636268], [0.9983656143708577], [0.9983656832331995], [0.9983657509094779], [0.9983658173592377], [0.9983658825427673], [0.998365946421122], [0.9983660089561454], [0.9983660701104935], [0.998366129847655], [0.9983661881319733], [0.998366244928666], [0.9983663002038472], [0.9983663539245449], [0.9983664060587216], [0.9983664565752915], [0.9983665054441403], [0.9983665526361408], [0.9983665981231704], [0.9983666418781278], [0.9983666838749479], [0.9983667240886166], [0.998366762495187], [0.9983667990717896], [0.99836683379665], [0.9983668666490977], [0.9983668976095791], [0.9983669266596699], [0.998366953782084], [0.998366978960684], [0.9983670021804912], [0.998367023427693], [0.9983670426896513], [0.9983670599549095], [0.9983670752132001], [0.9983670884554487], [0.9983670996737813], [0.9983671088615269], [0.9983671160132226], [0.998367121124616], [0.998367124192668], [0.9983671252155549]], "form_factor": [[1.25449082688301], [1.2544908239326817], [1.2544908150835008], [1.2544908003408743], [1.2544907797138107], [1.2544907532149148], [1.2544907208603784], [1.2544906826699695], [1.2544906386670227], [1.25449058887842], [1.2544905333345775], [1.2544904720694245], [1.2544904051203811], [1.2544903325283359], [1.2544902543376193], [1.254490170595975], [1.2544900813545308], [1.2544899866677643], [1.2544898865934704], [1.2544897811927234], [1.2544896705298385], [1.2544895546723316], [1.254489433690875], [1.2544893076592538], [1.2544891766543214], [1.2544890407559461], [1.2544889000469646], [1.254488754613128], [1.2544886045430486], [1.254488449928144], [1.2544882908625767], [1.2544881274432018], [1.2544879597694976], [1.2544877879435097], [1.2544876120697845], [1.254487432255302], [1.2544872486094134], [1.2544870612437673], [1.2544868702722445], [1.2544866758108848], [1.2544864779778135], [1.2544862768931717], [1.2544860726790372], [1.2544858654593518], [1.2544856553598427], [1.2544854425079448], [1.2544852270327236], [1.2544850090647928], [1.254484788736235], [1.2544845661805206], [1.2544843415324243], [1.2544841149279435], [1.2544838865042143], [1.2544836563994268], [1.2544834247527414], [1.2544831917042025], [1.2544829573946554], [1.254482721965656], [1.2544824855593895], [1.2544822483185791], [1.2544820103864034], [1.2544817719064076], [1.2544815330224164], [1.2544812938784462], [1.2544810546186205], [1.2544808153870812], [1.254480576327902], [1.254480337585001], [1.254480099302056], [1.254479861622417], [1.25447962468902], [1.254479388644303], [1.2544791536301194], [1.2544789197876536], [1.254478687257338], [1.2544784561787676], [1.2544782266906196], [1.2544779989305674], [1.2544777730352044], [1.2544775491399565], [1.2544773273790082], [1.2544771078852197], [1.2544768907900503], [1.25447667622348], [1.2544764643139337], [1.2544762551882058], [1.254476048971386], [1.254475845786786], [1.2544756457558661], [1.2544754489981678], [1.2544752556312393], [1.2544750657705703], [1.2544748795295242], [1.2544746970192726], [1.254474518348729], [1.2544743436244876], [1.25447417295076], [1.2544740064293165], [1.254473844159426], [1.2544736862377994], [1.2544735327585337], [1.2544733838130575], [1.2544732394900782], [1.254473099875532], [1.2544729650525333], [1.2544728351013283], [1.2544727100992474], [1.2544725901206624], [1.2544724752369425], [1.2544723655164152], [1.2544722610243253], [1.2544721618227994], [1.2544720679708092], [1.2544719795241375], [1.2544718965353485], [1.2544718190537556], [1.2544717471253943], [1.2544716807929965], [1.2544716200959642], [1.2544715650703502], [1.254471515748834], [1.2544714721607069], [1.2544714343318522], [1.2544714022847325], [1.2544713760383757], [1.254471355608365], [1.2544713410068309], [1.2544713322424415], [1.2544713293204]]}, "horizontal_stabilizer": {"wetted_area": 83.751714, "reference_area": 41.49, "parasite_drag_coefficient": [[0.0020504615166770128], [0.0020504607186989823], [0.002050458325251315], [0.002050454337792979], [0.0020504487587545703], [0.0020504415915367697], [0.0020504328405082034], [0.0020504225110026864], [0.0020504106093158538], [0.0020503971427011953], [0.002050382119365478], [0.0020503655484635716], [0.002050347440092682], [0.0020503278052859835], [0.0020503066560056712], [0.002050284005135431], [0.002050259866472323], [0.0020502342547181036], [0.002050207185469975], [0.0020501786752107837], [0.0020501487412986547], [0.0020501174019560927], [0.0020500846762585402], [0.0020500505841224053], [0.0020500151462925754], [0.0020499783843294134], [0.00204994032059525], [0.002049900978240382], [0.0020498603811885995], [0.0020498185541222187], [0.002049775522466668], [0.002049731312374611], [0.0020496859507096376], [0.0020496394650295095], [0.0020495918835690056], [0.0020495432352223408], [0.002049493549525206], [0.002049442856636411], [0.0020493911873191626], [0.0020493385729219897], [0.0020492850453593123], [0.0020492306370916836], [0.002049175381105713], [0.002049119310893683], [0.0020490624604328706], [0.002049004864164594], [0.0020489465569729984], [0.00204888757416357], [0.0020488279514414456], [0.0020487677248894683], [0.0020487069309460563], [0.0020486456063828658], [0.002048583788282276], [0.0020485215140147147], [0.0020484588212158206], [0.0020483957477634837], [0.0020483323317547534], [0.0020482686114826378], [0.0020482046254128236], [0.0020481404121603024], [0.0020480760104659382], [0.00204801145917299], [0.002047946797203595], [0.0020478820635352352], [0.002047817297177188], [0.002047752537147004], [0.0020476878224469845], [0.002047623192040714], [0.002047558684829638], [0.002047494339629694], [0.002047430195148047], [0.002047366289959888], [0.0020473026624853586], [0.0020472393509665897], [0.0020471763934448704], [0.0020471138277379664], [0.002047051691417594], [0.0020469900217870676], [0.0020469288558591465], [0.0020468682303340455], [0.0020468081815776884], [0.002046748745600177], [0.0020466899580344725], [0.002046631854115355], [0.0020465744686586178], [0.0020465178360405444], [0.0020464619901776533], [0.002046406964506752], [0.002046352791965276], [0.002046299504971952], [0.0020462471354077845], [0.002046195714597374], [0.0020461452732905725], [0.0020460958416445092], [0.002046047449205963], [0.0020460001248941207], [0.002045953896983704], [0.0020459087930885015], [0.0020458648401452876], [0.0020458220643981544], [0.00204578049138326], [0.0020457401459139987], [0.0020457010520666015], [0.002045663233166177], [0.002045626711773197], [0.0020455915096704333], [0.0020455576478503575], [0.002045525146503002], [0.0020454940250042917], [0.0020454643019048625], [0.0020454359949193457], [0.0020454091209161597], [0.002045383695907783], [0.002045359735041528], [0.002045337252590816], [0.002045316261946969], [0.0020452967756114954], [0.002045278805188908], [0.0020452623613800482], [0.002045247453975938], [0.0020452340918521556], [0.0020452222829637364], [0.0020452120343406074], [0.0020452033520835496], [0.0020451962413606975], [0.0020451907064045734], [0.002045186750509663], [0.0020451843760305164], [0.002045183584380408]], "skin_friction_coefficient": [[0.0028566400316657093], [0.0028566389240594955], [0.002856635601915993], [0.002856630067260199], [0.00285662232346569], [0.002856612375252492], [0.002856600228684099], [0.0028565858911636607], [0.0028565693714292938], [0.0028565506795485912], [0.002856529826912259], [0.0028565068262269445], [0.0028564816915072283], [0.0028564544380667877], [0.002856425082508757], [0.0028563936427152747], [0.002856360137836223], [0.0028563245882771817], [0.0028562870156865925], [0.002856247442942155], [0.002856205894136443], [0.0028561623945617767], [0.0028561169706943466], [0.0028560696501775972], [0.0028560204618048976], [0.002855969435501494], [0.0028559166023057695], [0.002855861994349805], [0.0028558056448392977], [0.0028557475880327883], [0.002855687859220269], [0.0028556264947011494], [0.002855563531761623], [0.002855499008651413], [0.002855432964559968], [0.0028553654395920567], [0.0028552964747428473], [0.002855226111872425], [0.002855154393679817], [0.0028550813636765097], [0.002855007066159488], [0.0028549315461838093], [0.002854854849534741], [0.002854777022699473], [0.0028546981128384154], [0.002854618167756115], [0.0028545372358718185], [0.002854455366189648], [0.002854372608268497], [0.0028542890121915736], [0.0028542046285356818], [0.0028541195083402254], [0.002854033703075951], [0.0028539472646134816], [0.0028538602451916185], [0.002853772697385474], [0.00285368467407442], [0.0028535962284098864], [0.00285350741378305], [0.002853418283792387], [0.002853328892211159], [0.0028532392929548193], [0.0028531495400483677], [0.0028530596875936958], [0.002852969789736893], [0.0028528799006355987], [0.0028527900744263553], [0.0028527003651920278], [0.002852610826929299], [0.0028525215135162315], [0.0028524324786799683], [0.002852343775964538], [0.0028522554586988174], [0.0028521675799646584], [0.002852080192565204], [0.002851993348993395], [0.002851907101400709], [0.0028518215015661294], [0.00285173660086539], [0.002851652450240464], [0.00285156910016936], [0.0028514866006362476], [0.002851405001101859], [0.002851324350474281], [0.002851244697080075], [0.0028511660886357854], [0.002851088572219827], [0.002851012194244791], [0.0028509370004301555], [0.002850863035775442], [0.0028507903445338196], [0.00285071897018617], [0.0028506489554156267], [0.002850580342082619], [0.002850513171200402], [0.00285044748291112], [0.002850383316462385], [0.0028503207101844156], [0.002850259701467709], [0.0028502003267412944], [0.0028501426214515586], [0.0028500866200416555], [0.00285003235593152], [0.0028499798614984887], [0.0028499291680585334], [0.0028498803058481337], [0.0028498333040067768], [0.0028497881905601113], [0.002849744992403745], [0.002849703735287722], [0.0028496644438016482], [0.002849627141360517], [0.0028495918501912063], [0.002849558591319671], [0.002849527384558827], [0.0028494982484971597], [0.0028494712004880104], [0.0028494462566396087], [0.002849423431805801], [0.0028494027395775203], [0.0028493841922749706], [0.0028493678009405546], [0.00284935357533253], [0.0028493415239194105], [0.0028493316538750965], [0.0028493239710747683], [0.0028493184800915117], [0.0028493151841936857], [0.002849314085343063]], "compressibility_factor": [[0.9960454920692865], [0.9960454948883036], [0.996045503343632], [0.9960455174301075], [0.9960455371391249], [0.9960455624586462], [0.9960455933732055], [0.9960456298639213], [0.9960456719085067], [0.9960457194812848], [0.9960457725532045], [0.9960458310918585], [0.9960458950615051], [0.9960459644230892], [0.9960460391342688], [0.9960461191494412], [0.996046204419772], [0.9960462948932242], [0.9960463905145951], [0.9960464912255481], [0.9960465969646504], [0.9960467076674124], [0.9960468232663283], [0.996046943690918], [0.9960470688677722], [0.9960471987205994], [0.9960473331702733], [0.9960474721348819], [0.9960476155297802], [0.9960477632676439], [0.9960479152585227], [0.9960480714098975], [0.9960482316267395], [0.9960483958115681], [0.9960485638645137], [0.996048735683378], [0.9960489111637002], [0.9960490901988207], [0.9960492726799484], [0.9960494584962282], [0.9960496475348106], [0.9960498396809208], [0.9960500348179308], [0.9960502328274323], [0.9960504335893086], [0.9960506369818096], [0.9960508428816293], [0.9960510511639777], [0.9960512617026616], [0.9960514743701598], [0.9960516890377046], [0.9960519055753565], [0.9960521238520885], [0.9960523437358642], [0.996052565093718], [0.9960527877918383], [0.9960530116956486], [0.9960532366698875], [0.9960534625786954], [0.996053689285693], [0.9960539166540664], [0.9960541445466498], [0.9960543728260071], [0.9960546013545182], [0.9960548299944587], [0.9960550586080855], [0.996055287057719], [0.9960555152058247], [0.996055742915098], [0.9960559700485456], [0.9960561964695672], [0.9960564220420377], [0.9960566466303884], [0.9960568700996881], [0.996057092315724], [0.9960573131450797], [0.996057532455217], [0.9960577501145526], [0.9960579659925373], [0.9960581799597328], [0.9960583918878873], [0.9960586016500141], [0.9960588091204632], [0.9960590141749961], [0.9960592166908607], [0.9960594165468615], [0.9960596136234313], [0.9960598078027011], [0.9960599989685698], [0.9960601870067705], [0.9960603718049386], [0.9960605532526778], [0.9960607312416216], [0.9960609056654995], [0.9960610764201977], [0.996061243403818], [0.9960614065167391], [0.9960615656616734], [0.9960617207437223], [0.996061871670433], [0.9960620183518506], [0.9960621607005702], [0.9960622986317869], [0.9960624320633454], [0.9960625609157873], [0.9960626851123956], [0.9960628045792401], [0.9960629192452192], [0.9960630290421008], [0.9960631339045611], [0.9960632337702218], [0.996063328579687], [0.9960634182765766], [0.9960635028075578], [0.9960635821223748], [0.9960636561738819], [0.9960637249180639], [0.9960637883140667], [0.9960638463242175], [0.9960638989140477], [0.9960639460523115], [0.9960639877110047], [0.9960640238653792], [0.9960640544939595], [0.9960640795785523], [0.996064099104258], [0.9960641130594804], [0.9960641214359301], [0.996064124228633]], "reynolds_factor": [[0.9983603032260624], [0.9983603042578513], [0.9983603073525879], [0.9983603125083842], [0.9983603197220943], [0.9983603289893161], [0.9983603403043952], [0.9983603536604281], [0.9983603690492658], [0.9983603864615203], [0.9983604058865692], [0.9983604273125634], [0.9983604507264342], [0.9983604761139012], [0.9983605034594825], [0.9983605327465032], [0.9983605639571066], [0.998360597072265], [0.9983606320717927], [0.9983606689343578], [0.9983607076374958], [0.998360748157624], [0.9983607904700561], [0.9983608345490185], [0.9983608803676651], [0.9983609278980957], [0.9983609771113727], [0.998361027977539], [0.9983610804656377], [0.9983611345437309], [0.9983611901789198], [0.9983612473373656], [0.9983613059843099], [0.9983613660840978], [0.9983614276001984], [0.9983614904952293], [0.9983615547309787], [0.9983616202684298], [0.9983616870677849], [0.9983617550884902], [0.9983618242892612], [0.9983618946281076], [0.9983619660623603], [0.9983620385486972], [0.9983621120431699], [0.9983621865012313], [0.9983622618777634], [0.9983623381271036], [0.9983624152030748], [0.9983624930590124], [0.9983625716477935], [0.9983626509218662], [0.9983627308332773], [0.9983628113337037], [0.998362892374481], [0.9983629739066321], [0.9983630558808995], [0.998363138247773], [0.9983632209575212], [0.9983633039602214], [0.9983633872057901], [0.9983634706440127], [0.9983635542245741], [0.9983636378970905], [0.9983637216111375], [0.9983638053162829], [0.9983638889621148], [0.9983639724982739], [0.9983640558744828], [0.9983641390405759], [0.9983642219465307], [0.9983643045424959], [0.9983643867788231], [0.9983644686060958], [0.9983645499751578], [0.9983646308371441], [0.9983647111435088], [0.9983647908460548], [0.9983648698969617], [0.998364948248815], [0.9983650258546326], [0.9983651026678947], [0.9983651786425692], [0.9983652537331409], [0.9983653278946362], [0.9983654010826515], [0.9983654732533775], [0.9983655443636268], [0.9983656143708577], [0.9983656832331996], [0.9983657509094778], [0.9983658173592379], [0.9983658825427674], [0.998365946421122], [0.9983660089561455], [0.9983660701104934], [0.998366129847655], [0.9983661881319734], [0.9983662449286661], [0.9983663002038473], [0.9983663539245451], [0.9983664060587216], [0.9983664565752915], [0.9983665054441403], [0.9983665526361407], [0.9983665981231703], [0.9983666418781277], [0.9983666838749478], [0.9983667240886167], [0.9983667624951867], [0.9983667990717898], [0.9983668337966501], [0.9983668666490975], [0.9983668976095792], [0.99836692665967], [0.9983669537820838], [0.9983669789606842], [0.9983670021804913], [0.998367023427693], [0.9983670426896512], [0.9983670599549094], [0.9983670752132002], [0.9983670884554489], [0.9983670996737813], [0.9983671088615269], [0.9983671160132226], [0.9983671211246159], [0.9983671241926683], [0.9983671252155548]], "form_factor": [[1.1535793176365783], [1.1535793159759415], [1.1535793109950458], [1.1535793026969348], [1.1535792910866796], [1.153579276171374], [1.153579257960132], [1.1535792364640802], [1.1535792116963524], [1.1535791836720797], [1.1535791524083816], [1.1535791179243557], [1.1535790802410637], [1.1535790393815206], [1.1535789953706774], [1.1535789482354073], [1.1535788980044879], [1.1535788447085824], [1.1535787883802209], [1.1535787290537793], [1.1535786667654582], [1.153578601553259], [1.1535785334569604], [1.1535784625180932], [1.153578388779914], [1.1535783122873784], [1.153578233087111], [1.1535781512273775], [1.1535780667580544], [1.1535779797305963], [1.1535778901980043], [1.1535777982147932], [1.153577703836956], [1.1535776071219297], [1.1535775081285586], [1.1535774069170588], [1.1535773035489785], [1.153577198087161], [1.153577090595705], [1.1535769811399246], [1.1535768697863082], [1.1535767566024784], [1.153576641657148], [1.1535765250200796], [1.1535764067620393], [1.1535762869547566], [1.1535761656708767], [1.1535760429839177], [1.1535759189682238], [1.1535757936989202], [1.1535756672518676], [1.1535755397036132], [1.1535754111313463], [1.1535752816128495], [1.1535751512264512], [1.1535750200509773], [1.1535748881657046], [1.1535747556503104], [1.1535746225848253], [1.1535744890495847], [1.1535743551251783], [1.1535742208924022], [1.1535740864322117], [1.1535739518256687], [1.1535738171538956], [1.1535736824980254], [1.153573547939152], [1.1535734135582834], [1.153573279436291], [1.1535731456538618], [1.153573012291451], [1.1535728794292317], [1.1535727471470494], [1.153572615524373], [1.1535724846402473], [1.1535723545732468], [1.1535722254014287], [1.1535720972022856], [1.1535719700527018], [1.1535718440289051], [1.1535717192064245], [1.1535715956600432], [1.153571473463756], [1.1535713526907256], [1.1535712334132386], [1.153571115702665], [1.1535709996294137], [1.1535708852628943], [1.1535707726714741], [1.153570661922439], [1.1535705530819547], [1.1535704462150278], [1.1535703413854679], [1.1535702386558502], [1.1535701380874797], [1.1535700397403563], [1.153569943673138], [1.1535698499431088], [1.1535697586061455], [1.153569669716684], [1.1535695833276898], [1.1535694994906256], [1.1535694182554233], [1.1535693396704543], [1.1535692637825024], [1.1535691906367356], [1.1535691202766822], [1.1535690527442044], [1.1535689880794748], [1.1535689263209532], [1.1535688675053646], [1.1535688116676788], [1.1535687588410894], [1.1535687090569966], [1.1535686623449866], [1.1535686187328174], [1.1535685782464014], [1.1535685409097916], [1.1535685067451669], [1.15356847577282], [1.1535684480111463], [1.1535684234766328], [1.1535684021838493], [1.1535683841454387], [1.1535683693721124], [1.1535683578726414], [1.1535683496538536], [1.1535683447206284], [1.1535683430758943]]}, "vertical_stabilizer": {"wetted_area": 52.23818991998674, "reference_area": 25.878425601895735, "parasite_drag_coefficient": [[0.0011842504309840286], [0.0011842499741857393], [0.0011842486040693086], [0.0011842463214698728], [0.0011842431277787385], [0.0011842390249425098], [0.0011842340154618522], [0.0011842281023899232], [0.0011842212893304423], [0.0011842135804354193], [0.0011842049804025368], [0.0011841954944721885], [0.00118418512842418], [0.00118417388857408], [0.0011841617817692509], [0.0011841488153845336], [0.001184134997317606], [0.001184120335984013], [0.0011841048403118783], [0.001184088519736286], [0.001184071384193356], [0.0011840534441140036], [0.0011840347104173903], [0.0011840151945040733], [0.0011839949082488575], [0.001183973863993354], [0.0011839520745382506], [0.0011839295531352989], [0.001183906313479025], [0.0011838823696981716], [0.0011838577363468697], [0.0011838324283955557], [0.0011838064612216337], [0.0011837798505998913], [0.001183752612692675], [0.0011837247640398315], [0.0011836963215484282], [0.0011836673024822443], [0.0011836377244510597], [0.0011836076053997311], [0.001183576963597076], [0.0011835458176245597], [0.0011835141863648071], [0.0011834820889899352], [0.0011834495449497171], [0.0011834165739595863], [0.001183383195988498], [0.001183349431246631], [0.0011833153001729664], [0.0011832808234227348], [0.0011832460218547437], [0.0011832109165185924], [0.0011831755286417862], [0.0011831398796167548], [0.0011831039909877838], [0.001183067884437867], [0.0011830315817754926], [0.0011829951049213616], [0.0011829584758950597], [0.0011829217168016805], [0.0011828848498184107], [0.0011828478971810906], [0.0011828108811707519], [0.001182773824100148], [0.0011827367483002698], [0.001182699676106885], [0.0011826626298470685], [0.0011826256318257715], [0.0011825887043124077], [0.0011825518695274856], [0.0011825151496292772], [0.0011824785667005472], [0.0011824421427353352], [0.001182405899625816], [0.0011823698591492248], [0.0011823340429548746], [0.001182298472551261], [0.0011822631692932648], [0.0011822281543694647], [0.001182193448789557], [0.0011821590733718992], [0.0011821250487311834], [0.001182091395266235], [0.001182058133147963], [0.0011820252823074495], [0.0011819928624241995], [0.0011819608929145445], [0.0011819293929202215], [0.0011818983812971193], [0.0011818678766042049], [0.0011818378970926368], [0.00118180846069507], [0.0011817795850151546], [0.0011817512873172414], [0.0011817235845162912], [0.0011816964931680005], [0.0011816700294591436], [0.001181644209198142], [0.0011816190478058564], [0.0011815945603066164], [0.0011815707613194875], [0.0011815476650497813], [0.0011815252852808058], [0.0011815036353658784], [0.0011814827282205847], [0.0011814625763153], [0.0011814431916679733], [0.0011814245858371754], [0.0011814067699154223], [0.0011813897545227665], [0.0011813735498006673], [0.0011813581654061417], [0.0011813436105061951], [0.001181329893772539], [0.0011813170233765948], [0.0011813050069847942], [0.0011812938517541615], [0.0011812835643282003], [0.001181274150833072], [0.0011812656168740756], [0.001181257967532425], [0.0011812512073623327], [0.0011812453403883898], [0.0011812403701032628], [0.0011812362994656793], [0.001181233130898737], [0.0011812308662885115], [0.0011812295069829714], [0.0011812290537912087]], "skin_friction_coefficient": [[0.0027873651602856758], [0.0027873640885222044], [0.002787360873885058], [0.0027873555183336243], [0.0027873480251321718], [0.0027873383988478028], [0.0027873266453475537], [0.002787312771794713], [0.0027872967866442904], [0.002787278699637695], [0.0027872585217965876], [0.002787236265415937], [0.002787211944056273], [0.0027871855725351406], [0.0027871571669177745], [0.0027871267445069795], [0.002787094323832244], [0.0027870599246380802], [0.0027870235678716148], [0.002786985275669415], [0.002786945071343582], [0.002786902979367113], [0.002786859025358542], [0.0027868132360658617], [0.0027867656393497585], [0.002786716264166156], [0.0027866651405480747], [0.00278661229958684], [0.0027865577734126367], [0.0027865015951744243], [0.002786443799019232], [0.0027863844200708495], [0.0027863234944079185], [0.0027862610590414457], [0.002786197151891761], [0.0027861318117649134], [0.002786065078328554], [0.0027859969920872867], [0.002785927594357535], [0.0027858569272419175], [0.0027857850336031613], [0.002785711957037571], [0.0027856377418480687], [0.0027855624330168265], [0.00278548607617749], [0.002785408717587045], [0.0027853304040973323], [0.0027852511831261933], [0.0027851711026283367], [0.0027850902110658766], [0.0027850085573786123], [0.0027849261909540205], [0.0027848431615970356], [0.0027847595194995796], [0.002784675315209913], [0.0027845905996017797], [0.002784505423843411], [0.0027844198393663583], [0.002784333897834227], [0.0027842476511112913], [0.0027841611512310176], [0.0027840744503645327], [0.002783987600789042], [0.0027839006548562232], [0.0027838136649605883], [0.0027837266835079024], [0.002783639762883582], [0.0027835529554211787], [0.0027834663133709096], [0.0027833798888682927], [0.0027832937339028647], [0.002783207900287047], [0.0027831224396251313], [0.0027830374032824473], [0.002782952842354689], [0.002782868807637452], [0.0027827853495959705], [0.0027827025183351016], [0.0027826203635695455], [0.0027825389345943344], [0.002782458280255601], [0.0027823784489216566], [0.002782299488454365], [0.0027822214461808606], [0.0027821443688656137], [0.0027820683026828475], [0.0027819932931893382], [0.002781919385297608], [0.002781846623249523], [0.002781775050590311], [0.0027817047101430107], [0.0027816356439833855], [0.0027815678934152706], [0.0027815014989464263], [0.0027814365002648586], [0.0027813729362156456], [0.00278131084477828], [0.002781250263044537], [0.0027811912271968648], [0.0027811337724873474], [0.0027810779332171974], [0.002781023742716842], [0.0027809712333265696], [0.002780920436377776], [0.0027808713821748103], [0.0027808240999774195], [0.0027807786179838167], [0.0027807349633143744], [0.0027806931619959487], [0.002780653238946845], [0.0027806152179624326], [0.002780579121701424], [0.0027805449716728006], [0.0027805127882234173], [0.0027804825905262823], [0.002780454396569531], [0.002780428223146048], [0.0027804040858438283], [0.002780381999037002], [0.002780361975877577], [0.002780344028287874], [0.002780328166953683], [0.00278031440131812], [0.0027803027395762185], [0.002780293188670201], [0.0027802857542855134], [0.00278028044084756], [0.0027802772515191526], [0.0027802761881987087]], "compressibility_factor": [[0.9960454920692866], [0.9960454948883035], [0.9960455033436321], [0.9960455174301076], [0.996045537139125], [0.9960455624586462], [0.9960455933732055], [0.9960456298639212], [0.9960456719085066], [0.9960457194812848], [0.9960457725532045], [0.9960458310918584], [0.9960458950615051], [0.9960459644230893], [0.9960460391342689], [0.9960461191494413], [0.9960462044197719], [0.9960462948932243], [0.9960463905145951], [0.9960464912255481], [0.9960465969646503], [0.9960467076674125], [0.9960468232663284], [0.996046943690918], [0.9960470688677723], [0.9960471987205994], [0.9960473331702733], [0.9960474721348818], [0.9960476155297803], [0.9960477632676439], [0.9960479152585228], [0.9960480714098976], [0.9960482316267396], [0.9960483958115681], [0.9960485638645137], [0.996048735683378], [0.9960489111637002], [0.9960490901988207], [0.9960492726799484], [0.9960494584962282], [0.9960496475348105], [0.9960498396809206], [0.9960500348179309], [0.9960502328274322], [0.9960504335893086], [0.9960506369818096], [0.9960508428816292], [0.9960510511639777], [0.9960512617026615], [0.99605147437016], [0.9960516890377044], [0.9960519055753565], [0.9960521238520886], [0.9960523437358642], [0.996052565093718], [0.9960527877918383], [0.9960530116956485], [0.9960532366698875], [0.9960534625786955], [0.9960536892856929], [0.9960539166540664], [0.9960541445466498], [0.9960543728260071], [0.9960546013545183], [0.9960548299944587], [0.9960550586080856], [0.9960552870577191], [0.9960555152058247], [0.9960557429150981], [0.9960559700485457], [0.9960561964695672], [0.9960564220420377], [0.9960566466303885], [0.9960568700996884], [0.996057092315724], [0.9960573131450797], [0.9960575324552171], [0.9960577501145527], [0.9960579659925373], [0.9960581799597328], [0.9960583918878874], [0.9960586016500143], [0.9960588091204632], [0.9960590141749961], [0.9960592166908607], [0.9960594165468616], [0.9960596136234313], [0.9960598078027012], [0.9960599989685698], [0.9960601870067705], [0.9960603718049387], [0.9960605532526777], [0.9960607312416216], [0.9960609056654995], [0.9960610764201976], [0.996061243403818], [0.9960614065167392], [0.9960615656616733], [0.9960617207437222], [0.9960618716704331], [0.9960620183518506], [0.9960621607005702], [0.9960622986317869], [0.9960624320633454], [0.9960625609157873], [0.9960626851123956], [0.9960628045792401], [0.9960629192452193], [0.9960630290421008], [0.9960631339045611], [0.9960632337702219], [0.996063328579687], [0.9960634182765769], [0.9960635028075577], [0.9960635821223749], [0.9960636561738818], [0.996063724918064], [0.9960637883140668], [0.9960638463242175], [0.9960638989140478], [0.9960639460523115], [0.9960639877110047], [0.9960640238653792], [0.9960640544939596], [0.9960640795785523], [0.9960640991042581], [0.9960641130594804], [0.9960641214359301], [0.996064124228633]], "reynolds_factor": [[0.9983603032260623], [0.9983603042578512], [0.9983603073525879], [0.9983603125083843], [0.9983603197220943], [0.9983603289893159], [0.9983603403043952], [0.9983603536604281], [0.9983603690492658], [0.9983603864615203], [0.9983604058865692], [0.9983604273125632], [0.9983604507264341], [0.9983604761139012], [0.9983605034594825], [0.9983605327465032], [0.9983605639571065], [0.9983605970722649], [0.9983606320717927], [0.9983606689343579], [0.9983607076374957], [0.998360748157624], [0.9983607904700562], [0.9983608345490185], [0.9983608803676652], [0.9983609278980957], [0.9983609771113726], [0.998361027977539], [0.9983610804656375], [0.9983611345437309], [0.9983611901789199], [0.9983612473373656], [0.99836130598431], [0.9983613660840978], [0.9983614276001984], [0.9983614904952294], [0.9983615547309787], [0.9983616202684297], [0.9983616870677848], [0.9983617550884903], [0.9983618242892612], [0.9983618946281078], [0.9983619660623603], [0.9983620385486971], [0.9983621120431698], [0.9983621865012312], [0.9983622618777633], [0.9983623381271037], [0.9983624152030748], [0.9983624930590123], [0.9983625716477935], [0.998362650921866], [0.9983627308332771], [0.9983628113337037], [0.998362892374481], [0.9983629739066322], [0.9983630558808995], [0.9983631382477728], [0.9983632209575212], [0.9983633039602215], [0.9983633872057901], [0.9983634706440127], [0.9983635542245742], [0.9983636378970905], [0.9983637216111377], [0.9983638053162829], [0.9983638889621148], [0.9983639724982739], [0.9983640558744827], [0.9983641390405759], [0.9983642219465306], [0.998364304542496], [0.9983643867788232], [0.998364468606096], [0.9983645499751579], [0.9983646308371441], [0.9983647111435088], [0.9983647908460548], [0.9983648698969618], [0.998364948248815], [0.9983650258546326], [0.9983651026678946], [0.9983651786425694], [0.9983652537331409], [0.9983653278946362], [0.9983654010826514], [0.9983654732533775], [0.9983655443636268], [0.9983656143708578], [0.9983656832331996], [0.9983657509094779], [0.9983658173592377], [0.9983658825427674], [0.998365946421122], [0.9983660089561455], [0.9983660701104935], [0.998366129847655], [0.9983661881319733], [0.9983662449286661], [0.9983663002038474], [0.998366353924545], [0.9983664060587216], [0.9983664565752917], [0.9983665054441404], [0.9983665526361407], [0.9983665981231705], [0.9983666418781278], [0.9983666838749479], [0.9983667240886167], [0.9983667624951869], [0.9983667990717898], [0.99836683379665], [0.9983668666490976], [0.9983668976095791], [0.9983669266596699], [0.998366953782084], [0.9983669789606842], [0.9983670021804913], [0.998367023427693], [0.9983670426896512], [0.9983670599549096], [0.9983670752132001], [0.9983670884554486], [0.9983670996737813], [0.998367108861527], [0.9983671160132225], [0.9983671211246161], [0.9983671241926682], [0.998367125215555]], "form_factor": [[1.091256835383283], [1.091256834614925], [1.0912568323103202], [1.0912568284708775], [1.091256823098942], [1.0912568161977967], [1.0912568077716585], [1.0912567978256746], [1.0912567863659224], [1.0912567733994019], [1.0912567589340345], [1.091256742978656], [1.0912567255430108], [1.0912567066377477], [1.0912566862744102], [1.0912566644654325], [1.091256641224129], [1.0912566165646869], [1.0912565905021567], [1.0912565630524433], [1.0912565342322962], [1.0912565040592972], [1.0912564725518512], [1.0912564397291735], [1.0912564056112777], [1.0912563702189637], [1.0912563335738035], [1.0912562956981289], [1.091256256615016], [1.0912562163482722], [1.0912561749224197], [1.091256132362681], [1.0912560886949632], [1.0912560439458412], [1.0912559981425412], [1.091255951312923], [1.0912559034854648], [1.0912558546892424], [1.091255804953913], [1.0912557543096963], [1.0912557027873553], [1.0912556504181778], [1.091255597233956], [1.0912555432669673], [1.0912554885499548], [1.091255433116106], [1.091255376999033], [1.0912553202327515], [1.0912552628516592], [1.0912552048905158], [1.0912551463844207], [1.0912550873687914], [1.0912550278793425], [1.0912549679520624], [1.0912549076231937], [1.091254846929208], [1.0912547859067854], [1.0912547245927922], [1.0912546630242574], [1.0912546012383517], [1.0912545392723632], [1.091254477163676], [1.091254414949747], [1.0912543526680831], [1.091254290356219], [1.0912542280516948], [1.0912541657920323], [1.091254103614713], [1.0912540415571563], [1.0912539796566951], [1.0912539179505565], [1.091253856475836], [1.091253795269478], [1.091253734368253], [1.0912536738087344], [1.0912536136272786], [1.0912535538600032], [1.0912534945427637], [1.0912534357111348], [1.091253377400387], [1.0912533196454677], [1.0912532624809794], [1.09125320594116], [1.091253150059862], [1.0912530948705323], [1.0912530404061944], [1.0912529866994272], [1.0912529337823467], [1.0912528816865865], [1.0912528304432807], [1.0912527800830447], [1.0912527306359572], [1.0912526821315436], [1.0912526345987577], [1.0912525880659665], [1.0912525425609318], [1.0912524981107956], [1.091252454742064], [1.0912524124805911], [1.0912523713515656], [1.0912523313794946], [1.0912522925881916], [1.0912522550007595], [1.091252218639581], [1.0912521835263032], [1.0912521496818264], [1.0912521171262912], [1.0912520858790682], [1.0912520559587455], [1.0912520273831188], [1.0912520001691821], [1.0912519743331157], [1.0912519498902793], [1.0912519268552017], [1.0912519052415732], [1.0912518850622377], [1.0912518663291857], [1.0912518490535463], [1.0912518332455823], [1.0912518189146838], [1.091251806069362], [1.0912517947172462], [1.0912517848650776], [1.091251776518707], [1.0912517696830901], [1.0912517643622857], [1.0912517605594532], [1.09125175827685], [1.0912517575158316]]}, "fuselage": {"wetted_area": 385.51, "reference_area": 12.57, "parasite_drag_coefficient": [[0.006207908273535241], [0.006207906191972895], [0.006207899948553734], [0.006207889547080601], [0.006207874993888916], [0.00620785629784268], [0.006207833470328914], [0.006207806525250472], [0.006207775479017317], [0.006207740350536192], [0.0062077011611987335], [0.00620765793486803], [0.00620761069786361], [0.006207559478944917], [0.006207504309293246], [0.00620744522249215], [0.00620738225450638], [0.006207315443659286], [0.006207244830608796], [0.006207170458321935], [0.006207092372047863], [0.006207010619289557], [0.00620692524977404], [0.006206836315421281], [0.006206743870311699], [0.006206647970652377], [0.006206548674741911], [0.006206446042934014], [0.006206340137599869], [0.0062062310230892054], [0.006206118765690202], [0.00620600343358818], [0.006205885096823202], [0.00620576382724646], [0.006205639698475659], [0.00620551278584926], [0.006205383166379763], [0.00620525091870591], [0.006205116123044008], [0.006204978861138227], [0.006204839216210069], [0.006204697272906919], [0.006204553117249762], [0.006204406836580158], [0.006204258519506369], [0.006204108255848799], [0.006203956136584754], [0.006203802253792511], [0.006203646700594767], [0.0062034895711015215], [0.006203330960352427], [0.006203170964258554], [0.006203009679543758], [0.006202847203685587], [0.006202683634855774], [0.006202519071860369], [0.006202353614079588], [0.006202187361407305], [0.0062020204141903625], [0.006201852873167635], [0.00620168483940893], [0.006201516414253765], [0.006201347699250007], [0.006201178796092518], [0.00620100980656172], [0.006200840832462199], [0.006200671975561388], [0.006200503337528264], [0.006200335019872261], [0.006200167123882282], [0.006199999750565943], [0.006199833000589049], [0.006199666974215297], [0.006199501771246369], [0.0061993374909622935], [0.006199174232062204], [0.006199012092605515], [0.006198851169953551], [0.006198691560711616], [0.006198533360671632], [0.006198376664755241], [0.006198221566957576], [0.006198068160291542], [0.00619791653673283], [0.0061977667871655215], [0.006197619001328435], [0.006197473267762206], [0.006197329673757075], [0.006197188305301534], [0.006197049247031731], [0.006196912582181742], [0.0061967783925347105], [0.006196646758374871], [0.006196517758440527], [0.006196391469877913], [0.006196267968196097], [0.0061961473272228364], [0.006196029619061475], [0.006195914914048843], [0.0061958032807142805], [0.006195694785739696], [0.006195589493920741], [0.006195487468129127], [0.006195388769276084], [0.006195293456276955], [0.006195201586017021], [0.006195113213318487], [0.006195028390908696], [0.006194947169389573], [0.006194869597208342], [0.00619479572062947], [0.006194725583707906], [0.006194659228263628], [0.006194596693857443], [0.006194538017768171], [0.006194483234971107], [0.006194432378117822], [0.006194385477517357], [0.0061943425611187255], [0.006194303654494799], [0.006194268780827558], [0.006194237960894779], [0.0061942112130580155], [0.006194188553252051], [0.006194169994975714], [0.006194155549284113], [0.0061941452247822795], [0.006194139027620195], [0.006194136961489267]], "skin_friction_coefficient": [[0.0019812068216909307], [0.0019812061561104285], [0.0019812041597743325], [0.001981200833898627], [0.0019811961805091035], [0.0019811902024400824], [0.001981182903332634], [0.0019811742876322857], [0.0019811643605862255], [0.0019811531282400044], [0.0019811405974337276], [0.0019811267757977665], [0.001981111671747953], [0.001981095294480293], [0.0019810776539651914], [0.001981058760941193], [0.0019810386269082346], [0.001981017264120431], [0.0019809946855783916], [0.0019809709050210627], [0.0019809459369171173], [0.0019809197964558915], [0.001980892499537872], [0.0019808640627647436], [0.001980834503429], [0.0019808038395031447], [0.001980772089628444], [0.001980739273103293], [0.001980705409871174], [0.0019806705205082115], [0.00198063462621035], [0.001980597748780147], [0.001980559910613209], [0.001980521134684253], [0.001980481444532834], [0.001980440864248714], [0.001980399418456924], [0.001980357132302484], [0.0019803140314348286], [0.001980270141991924], [0.0019802254905841024], [0.0019801801042776106], [0.0019801340105779024], [0.001980087237412667], [0.0019800398131146115], [0.0019799917664040136], [0.0019799431263710613], [0.001979893922457956], [0.001979844184440846], [0.0019797939424115512], [0.001979743226759131], [0.0019796920681512662], [0.001979640497515509], [0.0019795885460203878], [0.0019795362450563763], [0.0019794836262167557], [0.001979430721278377], [0.0019793775621823138], [0.001979324181014458], [0.001979270609986037], [0.001979216881414068], [0.0019791630277017935], [0.0019791090813190545], [0.001979055074782672], [0.0019790010406368084], [0.00197894701143333], [0.001978893019712202], [0.0019788390979818926], [0.0019787852786998343], [0.0019787315942529256], [0.0019786780769381063], [0.0019786247589429983], [0.0019785716723266385], [0.0019785188490003118], [0.0019784663207084866], [0.0019784141190098753], [0.0019783622752586236], [0.001978310820585645], [0.0019782597858801036], [0.0019782092017710663], [0.0019781590986093166], [0.0019781095064493725], [0.001978060455031674], [0.0019780119737649983], [0.0019779640917090687], [0.001977916837557407], [0.0019778702396203965], [0.0019778243258086084], [0.001977779123616368], [0.0019777346601055836], [0.0019776909618898436], [0.0019776480551188013], [0.001977605965462825], [0.001977564718097972], [0.001977524337691235], [0.00197748484838612], [0.001977446273788538], [0.001977408636953018], [0.00197737196036925], [0.0019773362659489834], [0.0019773015750132548], [0.0019772679082799777], [0.0019772352858518916], [0.0019772037272048804], [0.0019771732511766537], [0.0019771438759558163], [0.0019771156190713135], [0.0019770884973822757], [0.00197706252706824], [0.001977037723619792], [0.0019770141018295943], [0.001976991675783833], [0.0019769704588540756], [0.0019769504636895415], [0.001976931702209796], [0.0019769141855978745], [0.0019768979242938216], [0.0019768829279886726], [0.0019768692056188674], [0.001976856765361093], [0.001976845614627576], [0.0019768357600618122], [0.001976827207534735], [0.0019768199621413426], [0.0019768140281977583], [0.001976809409238747], [0.0019768061080156865], [0.0019768041264949733], [0.0019768034658569004]], "compressibility_factor": [[0.9960454920692865], [0.9960454948883035], [0.9960455033436321], [0.9960455174301075], [0.9960455371391249], [0.9960455624586462], [0.9960455933732055], [0.9960456298639213], [0.9960456719085066], [0.9960457194812848], [0.9960457725532045], [0.9960458310918585], [0.9960458950615051], [0.9960459644230892], [0.9960460391342688], [0.9960461191494413], [0.9960462044197719], [0.9960462948932242], [0.9960463905145951], [0.9960464912255481], [0.9960465969646504], [0.9960467076674124], [0.9960468232663284], [0.996046943690918], [0.9960470688677723], [0.9960471987205994], [0.9960473331702733], [0.9960474721348818], [0.9960476155297803], [0.9960477632676439], [0.9960479152585227], [0.9960480714098975], [0.9960482316267395], [0.9960483958115681], [0.9960485638645137], [0.996048735683378], [0.9960489111637002], [0.9960490901988207], [0.9960492726799484], [0.9960494584962282], [0.9960496475348106], [0.9960498396809208], [0.9960500348179308], [0.9960502328274322], [0.9960504335893086], [0.9960506369818096], [0.9960508428816293], [0.9960510511639777], [0.9960512617026615], [0.9960514743701598], [0.9960516890377045], [0.9960519055753565], [0.9960521238520886], [0.9960523437358642], [0.996052565093718], [0.9960527877918383], [0.9960530116956485], [0.9960532366698875], [0.9960534625786954], [0.996053689285693], [0.9960539166540664], [0.9960541445466498], [0.9960543728260071], [0.9960546013545183], [0.9960548299944587], [0.9960550586080855], [0.996055287057719], [0.9960555152058247], [0.9960557429150981], [0.9960559700485457], [0.9960561964695672], [0.9960564220420377], [0.9960566466303884], [0.9960568700996882], [0.9960570923157239], [0.9960573131450797], [0.9960575324552171], [0.9960577501145526], [0.9960579659925373], [0.9960581799597328], [0.9960583918878874], [0.9960586016500143], [0.9960588091204631], [0.9960590141749961], [0.9960592166908607], [0.9960594165468615], [0.9960596136234313], [0.9960598078027012], [0.9960599989685698], [0.9960601870067705], [0.9960603718049387], [0.9960605532526777], [0.9960607312416216], [0.9960609056654995], [0.9960610764201977], [0.9960612434038181], [0.9960614065167392], [0.9960615656616734], [0.9960617207437223], [0.996061871670433], [0.9960620183518506], [0.9960621607005702], [0.9960622986317869], [0.9960624320633454], [0.9960625609157872], [0.9960626851123956], [0.9960628045792401], [0.9960629192452193], [0.9960630290421008], [0.996063133904561], [0.9960632337702218], [0.996063328579687], [0.9960634182765767], [0.9960635028075577], [0.9960635821223749], [0.9960636561738818], [0.9960637249180639], [0.9960637883140667], [0.9960638463242175], [0.9960638989140478], [0.9960639460523115], [0.9960639877110047], [0.9960640238653792], [0.9960640544939596], [0.9960640795785523], [0.9960640991042581], [0.9960641130594804], [0.9960641214359301], [0.996064124228633]], "reynolds_factor": [[0.9983603032260623], [0.9983603042578512], [0.9983603073525879], [0.9983603125083843], [0.9983603197220943], [0.998360328989316], [0.9983603403043952], [0.9983603536604281], [0.9983603690492657], [0.9983603864615203], [0.9983604058865692], [0.9983604273125634], [0.9983604507264341], [0.9983604761139012], [0.9983605034594825], [0.9983605327465032], [0.9983605639571065], [0.998360597072265], [0.9983606320717927], [0.9983606689343578], [0.9983607076374957], [0.9983607481576239], [0.9983607904700561], [0.9983608345490185], [0.9983608803676651], [0.9983609278980957], [0.9983609771113726], [0.998361027977539], [0.9983610804656377], [0.9983611345437309], [0.9983611901789199], [0.9983612473373656], [0.99836130598431], [0.9983613660840978], [0.9983614276001984], [0.9983614904952293], [0.9983615547309787], [0.9983616202684298], [0.9983616870677848], [0.9983617550884902], [0.9983618242892612], [0.9983618946281076], [0.9983619660623603], [0.9983620385486971], [0.9983621120431699], [0.9983621865012313], [0.9983622618777633], [0.9983623381271036], [0.9983624152030748], [0.9983624930590124], [0.9983625716477935], [0.998362650921866], [0.9983627308332772], [0.9983628113337039], [0.998362892374481], [0.9983629739066321], [0.9983630558808995], [0.9983631382477729], [0.9983632209575212], [0.9983633039602214], [0.9983633872057901], [0.9983634706440127], [0.9983635542245741], [0.9983636378970906], [0.9983637216111376], [0.9983638053162829], [0.9983638889621148], [0.998363972498274], [0.9983640558744827], [0.998364139040576], [0.9983642219465306], [0.9983643045424959], [0.9983643867788232], [0.9983644686060958], [0.9983645499751578], [0.998364630837144], [0.9983647111435089], [0.9983647908460549], [0.9983648698969618], [0.998364948248815], [0.9983650258546326], [0.9983651026678946], [0.9983651786425694], [0.9983652537331409], [0.9983653278946362], [0.9983654010826515], [0.9983654732533775], [0.9983655443636269], [0.9983656143708577], [0.9983656832331995], [0.9983657509094779], [0.9983658173592378], [0.9983658825427674], [0.9983659464211219], [0.9983660089561455], [0.9983660701104935], [0.998366129847655], [0.9983661881319733], [0.9983662449286662], [0.9983663002038473], [0.998366353924545], [0.9983664060587216], [0.9983664565752917], [0.9983665054441404], [0.9983665526361408], [0.9983665981231704], [0.9983666418781278], [0.9983666838749479], [0.9983667240886168], [0.9983667624951869], [0.9983667990717898], [0.99836683379665], [0.9983668666490976], [0.9983668976095792], [0.9983669266596699], [0.998366953782084], [0.9983669789606842], [0.9983670021804913], [0.998367023427693], [0.9983670426896512], [0.9983670599549096], [0.9983670752132001], [0.9983670884554487], [0.9983670996737813], [0.9983671088615269], [0.9983671160132225], [0.998367121124616], [0.9983671241926682], [0.9983671252155549]], "form_factor": [[1.0940190603973012], [1.0940190610962044], [1.0940190631924875], [1.094019066684869], [1.0940190715712148], [1.09401907784854], [1.0940190855130096], [1.0940190945599406], [1.0940191049838064], [1.094019116778239], [1.0940191299360347], [1.0940191444491572], [1.0940191603087415], [1.094019177505104], [1.0940191960277443], [1.0940192158653523], [1.0940192370058197], [1.0940192594362417], [1.0940192831429278], [1.0940193081114131], [1.0940193343264628], [1.094019361772085], [1.0940193904315392], [1.0940194202873479], [1.0940194513213086], [1.0940194835145014], [1.0940195168473057], [1.0940195512994095], [1.094019586849823], [1.0940196234768926], [1.094019661158314], [1.0940196998711442], [1.0940197395918203], [1.0940197802961702], [1.0940198219594295], [1.094019864556257], [1.094019908060752], [1.0940199524464653], [1.0940199976864233], [1.0940200437531375], [1.0940200906186268], [1.094020138254434], [1.094020186631639], [1.0940202357208841], [1.094020285492386], [1.0940203359159586], [1.0940203869610274], [1.094020438596654], [1.094020490791549], [1.0940205435140944], [1.0940205967323662], [1.0940206504141472], [1.0940207045269517], [1.0940207590380433], [1.0940208139144578], [1.0940208691230193], [1.094020924630363], [1.094020980402956], [1.0940210364071152], [1.0940210926090295], [1.094021148974782], [1.0940212054703669], [1.094021262061713], [1.094021318714703], [1.0940213753951942], [1.094021432069039], [1.0940214887021078], [1.0940215452603048], [1.0940216017095938], [1.0940216580160136], [1.0940217141457018], [1.0940217700649164], [1.0940218257400491], [1.0940218811376534], [1.09402193622446], [1.0940219909673976], [1.0940220453336122], [1.0940220992904879], [1.0940221528056633], [1.0940222058470552], [1.0940222583828738], [1.0940223103816422], [1.0940223618122158], [1.0940224126438003], [1.0940224628459703], [1.0940225123886849], [1.0940225612423098], [1.0940226093776293], [1.094022656765867], [1.094022703378701], [1.0940227491882824], [1.0940227941672478], [1.09402283828874], [1.0940228815264204], [1.0940229238544836], [1.0940229652476756], [1.094023005681305], [1.094023045131261], [1.0940230835740232], [1.0940231209866789], [1.0940231573469337], [1.0940231926331254], [1.094023226824237], [1.0940232598999073], [1.0940232918404436], [1.0940233226268334], [1.0940233522407559], [1.0940233806645885], [1.0940234078814217], [1.0940234338750672], [1.0940234586300661], [1.0940234821316983], [1.0940235043659925], [1.09402352531973], [1.0940235449804578], [1.0940235633364916], [1.0940235803769234], [1.0940235960916291], [1.0940236104712726], [1.0940236235073129], [1.0940236351920047], [1.0940236455184094], [1.0940236544803947], [1.0940236620726378], [1.09402366829063], [1.0940236731306787], [1.0940236765899103], [1.0940236786662718], [1.0940236793585294]]}, "turbofan": {"wetted_area": 20.92832112776126, "reference_area": 2.7844449567252743, "parasite_drag_coefficient": [[0.0010654425148232945], [0.0010654421024602592], [0.0010654408656225044], [0.001065438805063933], [0.0010654359220405186], [0.0010654322183095148], [0.001065427696128347], [0.0010654223582531885], [0.0010654162079372198], [0.001065409248928582], [0.0010654014854680075], [0.001065392922286152], [0.0010653835646006113], [0.0010653734181126325], [0.0010653624890035252], [0.001065350783930771], [0.0010653383100238292], [0.001065325074879653], [0.0010653110865579132], [0.0010652963535759312], [0.0010652808849033234], [0.0010652646899563726], [0.0010652477785921151], [0.0010652301611021558], [0.0010652118482062148], [0.0010651928510454108], [0.001065173181175283], [0.0010651528505585563], [0.0010651318715576617], [0.0010651102569270057], [0.001065088019805005], [0.001065065173705884], [0.0010650417325112488], [0.0010650177104614292], [0.001064993122146617], [0.00106496798249778], [0.0010649423067773845], [0.0010649161105699093], [0.001064889409772173], [0.0010648622205834788], [0.001064834559495571], [0.0010648064432824307], [0.0010647778889899008], [0.0010647489139251536], [0.0010647195356460056], [0.0010646897719500908], [0.0010646596408639005], [0.001064629160631681], [0.0010645983497042245], [0.0010645672267275317], [0.0010645358105313759], [0.0010645041201177597], [0.0010644721746492826], [0.0010644399934374234], [0.0010644075959307408], [0.0010643750017030062], [0.001064342230441276], [0.0010643093019338987], [0.0010642762360584877], [0.0010642430527698396], [0.0010642097720878307], [0.0010641764140852828], [0.0010641429988758066], [0.0010641095466016476], [0.0010640760774215123], [0.001064042611498413], [0.0010640091689875144], [0.0010639757700240044], [0.0010639424347109884], [0.0010639091831074205], [0.001063876035216068], [0.0010638430109715343], [0.0010638101302283245], [0.0010637774127489857], [0.0010637448781923027], [0.0010637125461015796], [0.0010636804358929968], [0.0010636485668440625], [0.001063616958082156], [0.0010635856285731735], [0.001063554597110282], [0.0010635238823027931], [0.0010634935025651481], [0.0010634634761060406], [0.0010634338209176647], [0.0010634045547651078], [0.001063375695175884], [0.0010633472594296222], [0.001063319264547907], [0.0010632917272842847], [0.0010632646641144346], [0.0010632380912265135], [0.0010632120245116776], [0.0010631864795547885], [0.001063161471625305], [0.00106313701566837], [0.0010631131262960904], [0.0010630898177790258], [0.0010630671040378749], [0.0010630449986353803], [0.0010630235147684422], [0.0010630026652604567], [0.0010629824625538683], [0.0010629629187029603], [0.0010629440453668651], [0.001062925853802816], [0.0010629083548596297], [0.0010628915589714365], [0.0010628754761516466], [0.0010628601159871707], [0.001062845487632882], [0.0010628315998063398], [0.0010628184607827604], [0.0010628060783902495], [0.0010627944600052905], [0.001062783612548505], [0.0010627735424806619], [0.0010627642557989672], [0.0010627557580336106], [0.0010627480542445935], [0.001062741149018814], [0.0010627350464674369], [0.00106272975022353], [0.0010627252634399821], [0.0010627215887876879], [0.0010627187284540183], [0.0010627166841415655], [0.0010627154570671646], [0.001062715047961195]], "skin_friction_coefficient": [[0.0028435612102372747], [0.0028435601096809177], [0.0028435568086826813], [0.0028435513092546563], [0.0028435436147489124], [0.002843533729855389], [0.002843521660598929], [0.002843507414335489], [0.0028434909997474885], [0.0028434724268383465], [0.0028434517069261603], [0.002843428852636584], [0.0028434038778948675], [0.0028433767979170787], [0.0028433476292005246], [0.0028433163895133676], [0.0028432830978834325], [0.002843247774586241], [0.0028432104411322615], [0.002843171120253385], [0.002843129835888636], [0.002843086613169146], [0.0028430414784023747], [0.0028429944590556027], [0.002842945583738708], [0.0028428948821862393], [0.0028428423852387952], [0.0028427881248237093], [0.0028427321339350945], [0.002842674446613205], [0.0028426150979231827], [0.002842554123933163], [0.002842491561691786], [0.002842427449205089], [0.00284236182541286], [0.002842294730164381], [0.002842226204193673], [0.002842156289094177], [0.002842085027292936], [0.0028420124620242952], [0.0028419386373030988], [0.0028418635978974508], [0.0028417873893010286], [0.0028417100577049705], [0.0028416316499693616], [0.002841552213594335], [0.002841471796690822], [0.0028413904479509208], [0.0028413082166179786], [0.0028412251524563377], [0.0028411413057208086], [0.0028410567271258667], [0.002840971467814603], [0.002840885579327455], [0.002840799113570711], [0.0028407121227848418], [0.002840624659512661], [0.002840536776567325], [0.0028404485270002266], [0.0028403599640687547], [0.0028402711412039883], [0.0028401821119783126], [0.0028400929300729763], [0.0028400036492456492], [0.002839914323297935], [0.00283982500604293], [0.002839735751272784], [0.0028396466127263327], [0.002839557644056785], [0.0028394688987995152], [0.0028393804303399415], [0.002839292291881557], [0.0028392045364140834], [0.0028391172166818118], [0.0028390303851521057], [0.00283894409398412], [0.002838858394997728], [0.002838773339642704], [0.0028386889789681386], [0.002838605363592143], [0.0028385225436718307], [0.0028384405688736225], [0.0028383594883438492], [0.0028382793506797226], [0.0028382002039006385], [0.0028381220954198654], [0.002838045072016614], [0.0028379691798085136], [0.002837894464224498], [0.0028378209699781325], [0.002837748741041385], [0.002837677820618851], [0.0028376082511224637], [0.002837540074146685], [0.0028374733304441964], [0.0028374080599021145], [0.0028373443015187144], [0.0028372820933807146], [0.00283722147264109], [0.002837162475497466], [0.0028371051371710704], [0.002837049491886284], [0.002836995572850769], [0.002836943412236219], [0.002836893041159712], [0.002836844489665695], [0.002836797786708593], [0.0028367529601360715], [0.0028367100366729382], [0.0028366690419057133], [0.002836630000267853], [0.0028365929350256647], [0.0028365578682648857], [0.00283652482087796], [0.0028364938125519973], [0.002836464861757453], [0.002836437985737485], [0.002836413200498045], [0.002836390520798667], [0.002836369960143994], [0.0028363515307760073], [0.002836335243667001], [0.0028363211085132745], [0.002836309133729578], [0.002836299326444267], [0.00283629169249522], [0.002836286236426487], [0.00283628296148568], [0.002836281869622112]], "compressibility_factor": [[0.9960454920692865], [0.9960454948883035], [0.9960455033436321], [0.9960455174301075], [0.9960455371391249], [0.9960455624586462], [0.9960455933732055], [0.9960456298639213], [0.9960456719085066], [0.9960457194812848], [0.9960457725532045], [0.9960458310918585], [0.9960458950615051], [0.9960459644230892], [0.9960460391342688], [0.9960461191494413], [0.9960462044197719], [0.9960462948932242], [0.9960463905145951], [0.9960464912255481], [0.9960465969646504], [0.9960467076674124], [0.9960468232663284], [0.996046943690918], [0.9960470688677723], [0.9960471987205994], [0.9960473331702733], [0.9960474721348818], [0.9960476155297803], [0.9960477632676439], [0.9960479152585227], [0.9960480714098975], [0.9960482316267395], [0.9960483958115681], [0.9960485638645137], [0.996048735683378], [0.9960489111637002], [0.9960490901988207], [0.9960492726799484], [0.9960494584962282], [0.9960496475348106], [0.9960498396809208], [0.9960500348179308], [0.9960502328274322], [0.9960504335893086], [0.9960506369818096], [0.9960508428816293], [0.9960510511639777], [0.9960512617026615], [0.9960514743701598], [0.9960516890377045], [0.9960519055753565], [0.9960521238520886], [0.9960523437358642], [0.996052565093718], [0.9960527877918383], [0.9960530116956485], [0.9960532366698875], [0.9960534625786954], [0.996053689285693], [0.9960539166540664], [0.9960541445466498], [0.9960543728260071], [0.9960546013545183], [0.9960548299944587], [0.9960550586080855], [0.996055287057719], [0.9960555152058247], [0.9960557429150981], [0.9960559700485457], [0.9960561964695672], [0.9960564220420377], [0.9960566466303884], [0.9960568700996882], [0.9960570923157239], [0.9960573131450797], [0.9960575324552171], [0.9960577501145526], [0.9960579659925373], [0.9960581799597328], [0.9960583918878874], [0.9960586016500143], [0.9960588091204631], [0.9960590141749961], [0.9960592166908607], [0.9960594165468615], [0.9960596136234313], [0.9960598078027012], [0.9960599989685698], [0.9960601870067705], [0.9960603718049387], [0.9960605532526777], [0.9960607312416216], [0.9960609056654995], [0.9960610764201977], [0.9960612434038181], [0.9960614065167392], [0.9960615656616734], [0.9960617207437223], [0.996061871670433], [0.9960620183518506], [0.9960621607005702], [0.9960622986317869], [0.9960624320633454], [0.9960625609157872], [0.9960626851123956], [0.9960628045792401], [0.9960629192452193], [0.9960630290421008], [0.996063133904561], [0.9960632337702218], [0.996063328579687], [0.9960634182765767], [0.9960635028075577], [0.9960635821223749], [0.9960636561738818], [0.9960637249180639], [0.9960637883140667], [0.9960638463242175], [0.9960638989140478], [0.9960639460523115], [0.9960639877110047], [0.9960640238653792], [0.9960640544939596], [0.9960640795785523], [0.9960640991042581], [0.9960641130594804], [0.9960641214359301], [0.996064124228633]], "reynolds_factor": [[0.9983603032260623], [0.998360304257851], [0.9983603073525879], [0.9983603125083843], [0.9983603197220942], [0.998360328989316], [0.9983603403043952], [0.9983603536604281], [0.9983603690492657], [0.9983603864615203], [0.9983604058865692], [0.9983604273125634], [0.9983604507264341], [0.9983604761139012], [0.9983605034594825], [0.9983605327465032], [0.9983605639571065], [0.998360597072265], [0.9983606320717927], [0.9983606689343578], [0.9983607076374957], [0.9983607481576239], [0.9983607904700561], [0.9983608345490185], [0.9983608803676651], [0.9983609278980957], [0.9983609771113726], [0.998361027977539], [0.9983610804656377], [0.9983611345437309], [0.99836119017892], [0.9983612473373656], [0.99836130598431], [0.9983613660840978], [0.9983614276001985], [0.9983614904952293], [0.9983615547309787], [0.9983616202684298], [0.9983616870677848], [0.9983617550884902], [0.9983618242892612], [0.9983618946281076], [0.9983619660623603], [0.9983620385486972], [0.9983621120431699], [0.9983621865012313], [0.9983622618777633], [0.9983623381271036], [0.9983624152030748], [0.9983624930590124], [0.9983625716477935], [0.998362650921866], [0.9983627308332772], [0.9983628113337037], [0.998362892374481], [0.9983629739066321], [0.9983630558808995], [0.9983631382477729], [0.9983632209575212], [0.9983633039602215], [0.9983633872057901], [0.9983634706440127], [0.9983635542245741], [0.9983636378970906], [0.9983637216111376], [0.9983638053162829], [0.9983638889621148], [0.998363972498274], [0.9983640558744827], [0.998364139040576], [0.9983642219465306], [0.9983643045424959], [0.9983643867788232], [0.9983644686060958], [0.9983645499751578], [0.9983646308371441], [0.9983647111435089], [0.9983647908460549], [0.9983648698969618], [0.998364948248815], [0.9983650258546326], [0.9983651026678946], [0.9983651786425694], [0.9983652537331409], [0.9983653278946362], [0.9983654010826514], [0.9983654732533775], [0.9983655443636268], [0.9983656143708577], [0.9983656832331995], [0.9983657509094779], [0.9983658173592377], [0.9983658825427674], [0.9983659464211219], [0.9983660089561454], [0.9983660701104936], [0.998366129847655], [0.9983661881319732], [0.9983662449286662], [0.9983663002038473], [0.998366353924545], [0.9983664060587216], [0.9983664565752917], [0.9983665054441404], [0.9983665526361407], [0.9983665981231704], [0.9983666418781278], [0.9983666838749479], [0.9983667240886167], [0.9983667624951869], [0.9983667990717898], [0.99836683379665], [0.9983668666490976], [0.9983668976095792], [0.9983669266596699], [0.998366953782084], [0.9983669789606842], [0.9983670021804913], [0.998367023427693], [0.9983670426896512], [0.9983670599549096], [0.9983670752132001], [0.9983670884554487], [0.9983670996737813], [0.9983671088615269], [0.9983671160132225], [0.998367121124616], [0.9983671241926682], [0.9983671252155549]], "form_factor": 1.204891983794575}, "pylon": {"wetted_area": 8.371328451104505, "reference_area": 134.6, "parasite_drag_coefficient": [[0.0002130885029646589], [0.00021308842049205185], [0.00021308817312450085], [0.0002130877610127866], [0.00021308718440810368], [0.00021308644366190298], [0.00021308553922566944], [0.00021308447165063773], [0.00021308324158744396], [0.0002130818497857164], [0.00021308029709360147], [0.00021307858445723042], [0.00021307671292012225], [0.00021307468362252648], [0.00021307249780070503], [0.0002130701567861542], [0.0002130676620047658], [0.0002130650149759306], [0.00021306221731158263], [0.00021305927071518625], [0.00021305617698066465], [0.00021305293799127456], [0.000213049555718423], [0.00021304603222043118], [0.00021304236964124297], [0.0002130385702090821], [0.00021303463623505658], [0.00021303057011171122], [0.00021302637431153232], [0.0002130220513854011], [0.00021301760396100097], [0.00021301303474117677], [0.00021300834650224974], [0.0002130035420922858], [0.00021299862442932343], [0.000212993596499556], [0.00021298846135547688], [0.0002129832221139819], [0.0002129778819544346], [0.00021297244411669572], [0.00021296691189911417], [0.00021296128865648612], [0.00021295557779798017], [0.00021294978278503068], [0.00021294390712920113], [0.00021293795439001814], [0.0002129319281727801], [0.0002129258321263362], [0.00021291966994084488], [0.00021291344534550633], [0.00021290716210627518], [0.00021290082402355195], [0.0002128944349298565], [0.0002128879986874847], [0.00021288151918614812], [0.00021287500034060126], [0.00021286844608825516], [0.00021286186038677976], [0.00021285524721169753], [0.00021284861055396792], [0.00021284195441756616], [0.00021283528281705656], [0.00021282859977516132], [0.00021282190932032954], [0.00021281521548430245], [0.00021280852229968257], [0.00021280183379750287], [0.0002127951540048009], [0.00021278848694219766], [0.00021278183662148408], [0.0002127752070432136], [0.00021276860219430688], [0.00021276202604566489], [0.00021275548254979715], [0.00021274897563846055], [0.00021274250922031593], [0.00021273608717859937], [0.0002127297133688125], [0.00021272339161643118], [0.00021271712571463468], [0.00021271091942205638], [0.00021270477646055864], [0.0002126987005130296], [0.00021269269522120813], [0.00021268676418353293], [0.00021268091095302154], [0.00021267513903517677], [0.00021266945188592445], [0.00021266385290958143], [0.00021265834545685695], [0.00021265293282288694], [0.00021264761824530272], [0.0002126424049023355], [0.0002126372959109577], [0.000212632294325061], [0.00021262740313367397], [0.00021262262525921808], [0.00021261796355580517], [0.00021261342080757502], [0.00021260899972707606], [0.00021260470295368845], [0.00021260053305209134], [0.00021259649251077368], [0.00021259258374059205], [0.00021258880907337304], [0.00021258517076056319], [0.00021258167097192596], [0.00021257831179428727], [0.0002125750952303293], [0.00021257202319743414], [0.0002125690975265764], [0.00021256631996126795], [0.00021256369215655205], [0.00021256121567804986], [0.00021255889200105812], [0.00021255672250970105], [0.0002125547084961324], [0.0002125528511597934], [0.00021255115160672214], [0.00021254961084891868], [0.0002125482298037628], [0.0002125470092934874], [0.00021254595004470606], [0.00021254505268799643], [0.00021254431775753754], [0.00021254374569080363], [0.00021254333682831309], [0.0002125430914134329], [0.000212543009592239]], "skin_friction_coefficient": [[0.0028435612102372747], [0.0028435601096809177], [0.0028435568086826813], [0.0028435513092546563], [0.0028435436147489124], [0.002843533729855389], [0.002843521660598929], [0.002843507414335489], [0.0028434909997474885], [0.0028434724268383465], [0.0028434517069261603], [0.002843428852636584], [0.0028434038778948675], [0.0028433767979170787], [0.0028433476292005246], [0.0028433163895133676], [0.0028432830978834325], [0.002843247774586241], [0.0028432104411322615], [0.002843171120253385], [0.002843129835888636], [0.002843086613169146], [0.0028430414784023747], [0.0028429944590556027], [0.002842945583738708], [0.0028428948821862393], [0.0028428423852387952], [0.0028427881248237093], [0.0028427321339350945], [0.002842674446613205], [0.0028426150979231827], [0.002842554123933163], [0.002842491561691786], [0.002842427449205089], [0.00284236182541286], [0.002842294730164381], [0.002842226204193673], [0.002842156289094177], [0.002842085027292936], [0.0028420124620242952], [0.0028419386373030988], [0.0028418635978974508], [0.0028417873893010286], [0.0028417100577049705], [0.0028416316499693616], [0.002841552213594335], [0.002841471796690822], [0.0028413904479509208], [0.0028413082166179786], [0.0028412251524563377], [0.0028411413057208086], [0.0028410567271258667], [0.002840971467814603], [0.002840885579327455], [0.002840799113570711], [0.0028407121227848418], [0.002840624659512661], [0.002840536776567325], [0.0028404485270002266], [0.0028403599640687547], [0.0028402711412039883], [0.0028401821119783126], [0.0028400929300729763], [0.0028400036492456492], [0.002839914323297935], [0.00283982500604293], [0.002839735751272784], [0.0028396466127263327], [0.002839557644056785], [0.0028394688987995152], [0.0028393804303399415], [0.002839292291881557], [0.0028392045364140834], [0.0028391172166818118], [0.0028390303851521057], [0.00283894409398412], [0.002838858394997728], [0.002838773339642704], [0.0028386889789681386], [0.002838605363592143], [0.0028385225436718307], [0.0028384405688736225], [0.0028383594883438492], [0.0028382793506797226], [0.0028382002039006385], [0.0028381220954198654], [0.002838045072016614], [0.0028379691798085136], [0.002837894464224498], [0.0028378209699781325], [0.002837748741041385], [0.002837677820618851], [0.0028376082511224637], [0.002837540074146685], [0.0028374733304441964], [0.0028374080599021145], [0.0028373443015187144], [0.0028372820933807146], [0.00283722147264109], [0.002837162475497466], [0.0028371051371710704], [0.002837049491886284], [0.002836995572850769], [0.002836943412236219], [0.002836893041159712], [0.002836844489665695], [0.002836797786708593], [0.0028367529601360715], [0.0028367100366729382], [0.0028366690419057133], [0.002836630000267853], [0.0028365929350256647], [0.0028365578682648857], [0.00283652482087796], [0.0028364938125519973], [0.002836464861757453], [0.002836437985737485], [0.002836413200498045], [0.002836390520798667], [0.002836369960143994], [0.0028363515307760073], [0.002836335243667001], [0.0028363211085132745], [0.002836309133729578], [0.002836299326444267], [0.00283629169249522], [0.002836286236426487], [0.00283628296148568], [0.002836281869622112]], "compressibility_factor": [[0.9960454920692865], [0.9960454948883035], [0.9960455033436321], [0.9960455174301075], [0.9960455371391249], [0.9960455624586462], [0.9960455933732055], [0.9960456298639213], [0.9960456719085066], [0.9960457194812848], [0.9960457725532045], [0.9960458310918585], [0.9960458950615051], [0.9960459644230892], [0.9960460391342688], [0.9960461191494413], [0.9960462044197719], [0.9960462948932242], [0.9960463905145951], [0.9960464912255481], [0.9960465969646504], [0.9960467076674124], [0.9960468232663284], [0.996046943690918], [0.9960470688677723], [0.9960471987205994], [0.9960473331702733], [0.9960474721348818], [0.9960476155297803], [0.9960477632676439], [0.9960479152585227], [0.9960480714098975], [0.9960482316267395], [0.9960483958115681], [0.9960485638645137], [0.996048735683378], [0.9960489111637002], [0.9960490901988207], [0.9960492726799484], [0.9960494584962282], [0.9960496475348106], [0.9960498396809208], [0.9960500348179308], [0.9960502328274322], [0.9960504335893086], [0.9960506369818096], [0.9960508428816293], [0.9960510511639777], [0.9960512617026615], [0.9960514743701598], [0.9960516890377045], [0.9960519055753565], [0.9960521238520886], [0.9960523437358642], [0.996052565093718], [0.9960527877918383], [0.9960530116956485], [0.9960532366698875], [0.9960534625786954], [0.996053689285693], [0.9960539166540664], [0.9960541445466498], [0.9960543728260071], [0.9960546013545183], [0.9960548299944587], [0.9960550586080855], [0.996055287057719], [0.9960555152058247], [0.9960557429150981], [0.9960559700485457], [0.9960561964695672], [0.9960564220420377], [0.9960566466303884], [0.9960568700996882], [0.9960570923157239], [0.9960573131450797], [0.9960575324552171], [0.9960577501145526], [0.9960579659925373], [0.9960581799597328], [0.9960583918878874], [0.9960586016500143], [0.9960588091204631], [0.9960590141749961], [0.9960592166908607], [0.9960594165468615], [0.9960596136234313], [0.9960598078027012], [0.9960599989685698], [0.9960601870067705], [0.9960603718049387], [0.9960605532526777], [0.9960607312416216], [0.9960609056654995], [0.9960610764201977], [0.9960612434038181], [0.9960614065167392], [0.9960615656616734], [0.9960617207437223], [0.996061871670433], [0.9960620183518506], [0.9960621607005702], [0.9960622986317869], [0.9960624320633454], [0.9960625609157872], [0.9960626851123956], [0.9960628045792401], [0.9960629192452193], [0.9960630290421008], [0.996063133904561], [0.9960632337702218], [0.996063328579687], [0.9960634182765767], [0.9960635028075577], [0.9960635821223749], [0.9960636561738818], [0.9960637249180639], [0.9960637883140667], [0.9960638463242175], [0.9960638989140478], [0.9960639460523115], [0.9960639877110047], [0.9960640238653792], [0.9960640544939596], [0.9960640795785523], [0.9960640991042581], [0.9960641130594804], [0.9960641214359301], [0.996064124228633]], "reynolds_factor": [[0.9983603032260623], [0.998360304257851], [0.9983603073525879], [0.9983603125083843], [0.9983603197220942], [0.998360328989316], [0.9983603403043952], [0.9983603536604281], [0.9983603690492657], [0.9983603864615203], [0.9983604058865692], [0.9983604273125634], [0.9983604507264341], [0.9983604761139012], [0.9983605034594825], [0.9983605327465032], [0.9983605639571065], [0.998360597072265], [0.9983606320717927], [0.9983606689343578], [0.9983607076374957], [0.9983607481576239], [0.9983607904700561], [0.9983608345490185], [0.9983608803676651], [0.9983609278980957], [0.9983609771113726], [0.998361027977539], [0.9983610804656377], [0.9983611345437309], [0.99836119017892], [0.9983612473373656], [0.99836130598431], [0.9983613660840978], [0.9983614276001985], [0.9983614904952293], [0.9983615547309787], [0.9983616202684298], [0.9983616870677848], [0.9983617550884902], [0.9983618242892612], [0.9983618946281076], [0.9983619660623603], [0.9983620385486972], [0.9983621120431699], [0.9983621865012313], [0.9983622618777633], [0.9983623381271036], [0.9983624152030748], [0.9983624930590124], [0.9983625716477935], [0.998362650921866], [0.9983627308332772], [0.9983628113337037], [0.998362892374481], [0.9983629739066321], [0.9983630558808995], [0.9983631382477729], [0.9983632209575212], [0.9983633039602215], [0.9983633872057901], [0.9983634706440127], [0.9983635542245741], [0.9983636378970906], [0.9983637216111376], [0.9983638053162829], [0.9983638889621148], [0.998363972498274], [0.9983640558744827], [0.998364139040576], [0.9983642219465306], [0.9983643045424959], [0.9983643867788232], [0.9983644686060958], [0.9983645499751578], [0.9983646308371441], [0.9983647111435089], [0.9983647908460549], [0.9983648698969618], [0.998364948248815], [0.9983650258546326], [0.9983651026678946], [0.9983651786425694], [0.9983652537331409], [0.9983653278946362], [0.9983654010826514], [0.9983654732533775], [0.9983655443636268], [0.9983656143708577], [0.9983656832331995], [0.9983657509094779], [0.9983658173592377], [0.9983658825427674], [0.9983659464211219], [0.9983660089561454], [0.9983660701104936], [0.998366129847655], [0.9983661881319732], [0.9983662449286662], [0.9983663002038473], [0.998366353924545], [0.9983664060587216], [0.9983664565752917], [0.9983665054441404], [0.9983665526361407], [0.9983665981231704], [0.9983666418781278], [0.9983666838749479], [0.9983667240886167], [0.9983667624951869], [0.9983667990717898], [0.99836683379665], [0.9983668666490976], [0.9983668976095792], [0.9983669266596699], [0.998366953782084], [0.9983669789606842], [0.9983670021804913], [0.998367023427693], [0.9983670426896512], [0.9983670599549096], [0.9983670752132001], [0.9983670884554487], [0.9983670996737813], [0.9983671088615269], [0.9983671160132225], [0.998367121124616], [0.9983671241926682], [0.9983671252155549]], "form_factor": 1.204891983794575}, "total": [[0.016946876539716934], [0.01694687029915599], [0.01694685158127621], [0.0169468203974843], [0.016946776766783484], [0.01694672071576151], [0.016946652278573858], [0.016946571496922247], [0.016946478420028343], [0.016946373104602758], [0.016946255614809294], [0.01694612602222458], [0.016945984405792945], [0.016945830851776766], [0.016945665453702168], [0.016945488312300187], [0.016945299535443437], [0.016945099238078232], [0.01694488754215243], [0.016944664576538815], [0.016944430476954122], [0.016944185385873955], [0.016943929452443354], [0.016943662832383306], [0.016943385687893178], [0.01694309818754918], [0.016942800506198785], [0.01694249282485142], [0.01694217533056531], [0.016941848216330622], [0.016941511680949026], [0.01694116592890961], [0.016940811170261513], [0.016940447620483016], [0.016940075500347457], [0.01693969503578593], [0.016939306457746894], [0.016938910002052766], [0.016938505909253634], [0.016938094424478155], [0.01693767579728176], [0.016937250281492237], [0.016936818135052815], [0.01693637961986289], [0.01693593500161641], [0.016935484549638086], [0.016935028536717606], [0.016934567238941742], [0.016934100935524696], [0.016933629908636696], [0.016933154443230944], [0.01693267482686898], [0.01693219134954472], [0.016931704303507166], [0.01693121398308191], [0.01693072068449156], [0.01693022470567528], [0.016929726346107333], [0.016929225906615067], [0.01692872368919617], [0.016928219996835428], [0.01692771513332117], [0.016927209403061288], [0.016926703110899277], [0.016926196561930045], [0.01692569006131591], [0.016925183914102714], [0.01692467842503616], [0.016924173898378695], [0.016923670637726727], [0.01692316894582855], [0.01692266912440296], [0.016922171473958667], [0.016921676293614712], [0.016921183880921807], [0.016920694531684922], [0.016920208539787013], [0.01691972619701419], [0.016919247792882248], [0.016918773614464783], [0.016918303946222884], [0.01691783906983671], [0.016917379264038638], [0.016916924804448636], [0.016916475963411396], [0.01691603300983571], [0.016915596209036005], [0.01691516582257614], [0.016914742108115586], [0.016914325319258044], [0.016913915705402596], [0.01691351351159749], [0.016913118978396553], [0.016912732341718435], [0.01691235383270866], [0.016911983677604596], [0.01691162209760339], [0.01691126930873305], [0.016910925521726464], [0.016910590941898822], [0.01691026576902814], [0.016909950197239138], [0.016909644414890495], [0.016909348604465583], [0.016909062942466573], [0.016908787599312195], [0.016908522739239044], [0.016908268520206503], [0.0169080250938054], [0.016907792605170398], [0.01690757119289612], [0.016907360988957166], [0.016907162118631962], [0.01690697470043043], [0.01690679884602578], [0.01690663466019009], [0.01690648224073395], [0.016906341678450218], [0.016906213057061702], [0.01690609645317303], [0.016905991936226543], [0.016905899568462442], [0.016905819404882953], [0.016905751493220725], [0.01690569587391142], [0.016905652580070485], [0.01690562163747413], [0.01690560306454449], [0.0169055968723391]]}, "compressible": {"main_wing": {"compressibility_drag": [[1.7547350771577839e-12], [1.75473405423601e-12], [1.7547309850464913e-12], [1.7547258683188357e-12], [1.7547187019463872e-12], [1.7547094829987986e-12], [1.7546982077437959e-12], [1.7546848716711368e-12], [1.7546694695255672e-12], [1.754651995341517e-12], [1.754632442486667e-12], [1.7546108037080604e-12], [1.75458707118498e-12], [1.7545612365853998e-12], [1.754533291128645e-12], [1.7545032256510983e-12], [1.7544710306773803e-12], [1.754436696495161e-12], [1.754400213233834e-12], [1.7543615709471695e-12], [1.7543207596992098e-12], [1.7542777696530865e-12], [1.7542325911637449e-12], [1.7541852148711333e-12], [1.7541356317988442e-12], [1.7540838334517816e-12], [1.7540298119171111e-12], [1.7539735599669202e-12], [1.7539150711604625e-12], [1.753854339949425e-12], [1.75379136178093e-12], [1.7537261332034814e-12], [1.7536586519705509e-12], [1.7535889171453138e-12], [1.7535169292029013e-12], [1.7534426901331322e-12], [1.7533662035409115e-12], [1.7532874747446482e-12], [1.7532065108732887e-12], [1.7531233209605758e-12], [1.7530379160367236e-12], [1.752950309216559e-12], [1.752860515785121e-12], [1.7527685532797436e-12], [1.7526744415669976e-12], [1.752578202917557e-12], [1.7524798620749232e-12], [1.752379446320247e-12], [1.7522769855330442e-12], [1.7521725122452316e-12], [1.7520660616912995e-12], [1.7519576718527506e-12], [1.751847383496175e-12], [1.7517352402070011e-12], [1.7516212884152504e-12], [1.7515055774175445e-12], [1.7513881593910346e-12], [1.751269089401888e-12], [1.7511484254076e-12], [1.751026228252226e-12], [1.7509025616555585e-12], [1.7507774921955266e-12], [1.7506510892840784e-12], [1.750523425136611e-12], [1.7503945747347394e-12], [1.750264615782314e-12], [1.750133628655195e-12], [1.750001696344843e-12], [1.7498689043943106e-12], [1.7497353408299746e-12], [1.749601096084953e-12], [1.7494662629178012e-12], [1.7493309363251082e-12], [1.7491952134475828e-12], [1.7490591934714828e-12], [1.7489229775237291e-12], [1.7487866685624077e-12], [1.7486503712618479e-12], [1.7485141918926348e-12], [1.7483782381977695e-12], [1.7482426192634008e-12], [1.7481074453862194e-12], [1.7479728279364452e-12], [1.7478388792174513e-12], [1.7477057123216485e-12], [1.7475734409838828e-12], [1.747442179431055e-12], [1.7473120422302547e-12], [1.7471831441340217e-12], [1.7470555999237024e-12], [1.7469295242511823e-12], [1.7468050314797462e-12], [1.7466822355232545e-12], [1.7465612496848645e-12], [1.7464421864958308e-12], [1.7463251575532555e-12], [1.7462102733589238e-12], [1.7460976431585409e-12], [1.7459873747812305e-12], [1.7458795744812022e-12], [1.7457743467799963e-12], [1.745671794311168e-12], [1.7455720176666375e-12], [1.745475115245474e-12], [1.7453811831057687e-12], [1.7452903148190595e-12], [1.7452026013280055e-12], [1.7451181308081447e-12], [1.7450369885323362e-12], [1.744959256740586e-12], [1.744885014513238e-12], [1.744814337648987e-12], [1.7447472985478021e-12], [1.7446839660985134e-12], [1.74462440557231e-12], [1.7445686785206117e-12], [1.7445168426795402e-12], [1.7444689518797366e-12], [1.7444250559619687e-12], [1.7443852006996157e-12], [1.7443494277262645e-12], [1.7443177744708656e-12], [1.74429027409885e-12], [1.7442669554598281e-12], [1.7442478430423562e-12], [1.7442329569354072e-12], [1.7442223127966706e-12], [1.744215921827783e-12], [1.744213790756905e-12]], "thickness_to_chord": 0.15015527441765908, "wing_sweep": 0.6108652381980153, "crest_critical": [[0.7382243985219679], [0.7382241637446525], [0.7382234595856909], [0.738222286563873], [0.7382206455432069], [0.7382185377320544], [0.7382159646818015], [0.7382129282852673], [0.7382094307746523], [0.7382054747192397], [0.7382010630226429], [0.7381961989197836], [0.7381908859734798], [0.7381851280707359], [0.7381789294186623], [0.7381722945401156], [0.7381652282689918], [0.7381577357452284], [0.7381498224095072], [0.7381414939976615], [0.7381327565348073], [0.7381236163292103], [0.7381140799658658], [0.7381041542998895], [0.7380938464495805], [0.738083163789343], [0.7380721139423478], [0.7380607047729814], [0.7380489443791483], [0.7380368410843277], [0.7380244034295439], [0.7380116401651001], [0.7379985602422345], [0.7379851728046002], [0.7379714871796768], [0.7379575128700326], [0.7379432595445227], [0.7379287370294139], [0.7379139552994285], [0.7378989244687443], [0.7378836547819572], [0.7378681566050292], [0.7378524404162052], [0.7378365167969265], [0.7378203964227931], [0.7378040900544914], [0.7377876085288098], [0.7377709627496787], [0.7377541636792493], [0.7377372223290877], [0.7377201497514093], [0.7377029570304094], [0.737685655273716], [0.7376682556039095], [0.7376507691502181], [0.7376332070402757], [0.7376155803920657], [0.7375979003059864], [0.737580177857059], [0.7375624240873102], [0.7375446499983069], [0.7375268665438657], [0.7375090846229371], [0.7374913150726656], [0.7374735686616386], [0.7374558560833278], [0.7374381879497197], [0.7374205747851305], [0.7374030270202577], [0.7373855549863743], [0.7373681689097846], [0.7373508789064497], [0.7373336949768189], [0.7373166270008902], [0.7372996847334466], [0.7372828777995245], [0.7372662156900656], [0.7372497077577839], [0.7372333632132385], [0.7372171911210852], [0.7372012003965533], [0.7371853998020944], [0.7371697979442354], [0.7371544032706132], [0.7371392240672017], [0.7371242684557038], [0.737109544391145], [0.7370950596596096], [0.7370808218761614], [0.7370668384829254], [0.7370531167473259], [0.7370396637604619], [0.7370264864356496], [0.7370135915070939], [0.7370009855286842], [0.7369886748729437], [0.7369766657300783], [0.7369649641071435], [0.7369535758273411], [0.7369425065293878], [0.7369317616670096], [0.7369213465085073], [0.7369112661364179], [0.7369015254472561], [0.7368921291513121], [0.7368830817725307], [0.73687438764845], [0.7368660509301758], [0.7368580755824391], [0.7368504653836552], [0.7368432239260483], [0.7368363546157993], [0.7368298606732152], [0.7368237451329309], [0.736818010844106], [0.7368126604706652], [0.7368076964915156], [0.7368031212007816], [0.7367989367080445], [0.7367951449385545], [0.736791747633469], [0.7367887463500479], [0.7367861424618496], [0.7367839371589145], [0.736782131447918], [0.7367807261523084], [0.7367797219124234], [0.7367791191855839], [0.7367789182461527]], "divergence_mach": [[0.7636693963587021], [0.7636691534891207], [0.7636684250593232], [0.7636672116059811], [0.763665514022883], [0.7636633335600405], [0.7636606718223122], [0.7636575307677589], [0.76365391270552], [0.7636498202934364], [0.7636452565352028], [0.7636402247772417], [0.7636347287051736], [0.7636287723399795], [0.7636223600337799], [0.7636154964653247], [0.7636081866351234], [0.7636004358602763], [0.7635922497689936], [0.7635836342948105], [0.7635745956705156], [0.7635651404218069], [0.7635552753606502], [0.7635450075784423], [0.7635343444388347], [0.7635232935704112], [0.7635118628590969], [0.7635000604403466], [0.7634878946911822], [0.7634753742219751], [0.7634625078681403], [0.7634493046815851], [0.7634357739220773], [0.763421925048432], [0.7634077677096268], [0.7633933117357633], [0.7633785671289607], [0.7633635440541762], [0.7633482528299391], [0.7633327039190411], [0.763316907919187], [0.7633008755536315], [0.7632846176617812], [0.7632681451897975], [0.7632514691812448], [0.7632346007677073], [0.7632175511594939], [0.76320033163637], [0.7631829535383284], [0.76316542825648], [0.7631477672239864], [0.7631299819070909], [0.7631120837962773], [0.7630940843974975], [0.76307599522358], [0.7630578277857043], [0.7630395935850665], [0.7630213041046717], [0.7630029708012731], [0.7629846050974921], [0.7629662183740958], [0.7629478219624553], [0.7629294271371843], [0.7629110451089601], [0.7628926870175401], [0.7628743639249769], [0.762856086809029], [0.7628378665567632], [0.7628197139584008], [0.7628016397013108], [0.7627836543642766], [0.7627657684119344], [0.7627479921894275], [0.7627303359172958], [0.7627128096865488], [0.7626954234539769], [0.7626781870376541], [0.7626611101126622], [0.7626442022070286], [0.7626274726978477], [0.7626109308076379], [0.7625945856008732], [0.7625784459807291], [0.7625625206860142], [0.7625468182883018], [0.7625313471892328], [0.7625161156180248], [0.7625011316291318], [0.7624864031000922], [0.762471937729545], [0.7624577430354069], [0.7624438263531919], [0.7624301948345029], [0.7624168554456586], [0.7624038149664468], [0.7623910799890375], [0.7623786569169998], [0.7623665519644395], [0.7623547711552713], [0.7623433203225664], [0.762332205108029], [0.7623214309615468], [0.7623110031408408], [0.762300926711198], [0.7622912065452621], [0.7622818473229085], [0.7622728535311809], [0.7622642294642645], [0.7622559792235464], [0.7622481067176754], [0.762240615662692], [0.7622335095821808], [0.7622267918074458], [0.7622204654777192], [0.7622145335403648], [0.7622089987511272], [0.7622038636743561], [0.7621991306832494], [0.762194801960101], [0.7621908794965203], [0.7621873650936787], [0.7621842603625114], [0.7621815667239206], [0.7621792854089646], [0.7621774174590168], [0.7621759637259079], [0.7621749248720467], [0.7621743013705172], [0.7621740935051385]]}, "horizontal_stabilizer": {"compressibility_drag": [[8.318305053958211e-13], [8.318195984255826e-13], [8.317868850289761e-13], [8.317323877419412e-13], [8.316561441003869e-13], [8.31558206606905e-13], [8.314386426809384e-13], [8.312975345979364e-13], [8.311349794121228e-13], [8.30951088868753e-13], [8.307459893001063e-13], [8.305198215105182e-13], [8.302727406469192e-13], [8.300049160576927e-13], [8.297165311376442e-13], [8.294077831619417e-13], [8.290788831068728e-13], [8.287300554593035e-13], [8.28361538014502e-13], [8.279735816624884e-13], [8.27566450163614e-13], [8.271404199136577e-13], [8.266957796979232e-13], [8.262328304370656e-13], [8.257518849209881e-13], [8.252532675358607e-13], [8.247373139812337e-13], [8.242043709784841e-13], [8.236547959726304e-13], [8.230889568247341e-13], [8.225072314994467e-13], [8.219100077435863e-13], [8.21297682760242e-13], [8.206706628758219e-13], [8.200293632028961e-13], [8.193742072970323e-13], [8.187056268096572e-13], [8.180240611371256e-13], [8.173299570656648e-13], [8.166237684133217e-13], [8.159059556692814e-13], [8.151769856311568e-13], [8.144373310399467e-13], [8.136874702134389e-13], [8.129278866797293e-13], [8.121590688083737e-13], [8.113815094430039e-13], [8.105957055333489e-13], [8.098021577674084e-13], [8.090013702058767e-13], [8.081938499168397e-13], [8.073801066123042e-13], [8.065606522874389e-13], [8.057360008610846e-13], [8.049066678204559e-13], [8.040731698672658e-13], [8.032360245683535e-13], [8.023957500096204e-13], [8.015528644533742e-13], [8.007078860005052e-13], [7.998613322566206e-13], [7.990137200030505e-13], [7.98165564872585e-13], [7.973173810302374e-13], [7.964696808593262e-13], [7.956229746530753e-13], [7.947777703117593e-13], [7.9393457304516e-13], [7.930938850821208e-13], [7.922562053843422e-13], [7.914220293680194e-13], [7.905918486306762e-13], [7.897661506844053e-13], [7.889454186960357e-13], [7.881301312329553e-13], [7.873207620161786e-13], [7.865177796793208e-13], [7.857216475344211e-13], [7.849328233445018e-13], [7.84151759102012e-13], [7.833789008146567e-13], [7.826146882971078e-13], [7.818595549695619e-13], [7.811139276625682e-13], [7.803782264285055e-13], [7.796528643589672e-13], [7.789382474091705e-13], [7.782347742277504e-13], [7.77542835993198e-13], [7.768628162563826e-13], [7.761950907889608e-13], [7.755400274373061e-13], [7.748979859828425e-13], [7.742693180076717e-13], [7.736543667655681e-13], [7.730534670590472e-13], [7.724669451211986e-13], [7.718951185027551e-13], [7.713382959648349e-13], [7.707967773757471e-13], [7.702708536134622e-13], [7.697608064722504e-13], [7.692669085741842e-13], [7.687894232852382e-13], [7.683286046352058e-13], [7.67884697242302e-13], [7.674579362418722e-13], [7.670485472184785e-13], [7.6665674614296e-13], [7.662827393119088e-13], [7.659267232917443e-13], [7.655888848659358e-13], [7.652694009855597e-13], [7.649684387234769e-13], [7.646861552310923e-13], [7.644226976991095e-13], [7.641782033204623e-13], [7.639527992565471e-13], [7.637466026065258e-13], [7.635597203786488e-13], [7.633922494653521e-13], [7.632442766199483e-13], [7.631158784364814e-13], [7.630071213320241e-13], [7.629180615312705e-13], [7.628487450536443e-13], [7.627992077028447e-13], [7.627694750588183e-13], [7.627595624717256e-13]], "thickness_to_chord": 0.09079588711195336, "wing_sweep": 0.49261918137539956, "crest_critical": [[0.7885281773152105], [0.7885286013288394], [0.788529873111284], [0.7885319918873456], [0.7885349563656237], [0.7885387647392399], [0.788543414687064], [0.7885489033750889], [0.7885552274583078], [0.7885623830827178], [0.7885703658878326], [0.7885791710093678], [0.7885887930823362], [0.7885992262443845], [0.7886104641395236], [0.7886224999220811], [0.7886353262610284], [0.7886489353445766], [0.7886633188850761], [0.7886784681242265], [0.78869437383857], [0.7887110263452636], [0.788728415508187], [0.7887465307442233], [0.7887653610299737], [0.7887848949085956], [0.7888051204969828], [0.7888260254932281], [0.7888475971842597], [0.7888698224538486], [0.7888926877907195], [0.7889161792970502], [0.7889402826970905], [0.7889649833460954], [0.7889902662394014], [0.7890161160217947], [0.7890425169970547], [0.7890694531376878], [0.7890969080948935], [0.7891248652087092], [0.7891533075183379], [0.7891822177726333], [0.7892115784407885], [0.789241371723196], [0.7892715795623907], [0.7893021836542575], [0.7893331654592729], [0.7893645062139321], [0.7893961869423332], [0.7894281884677953], [0.789460491424661], [0.7894930762701915], [0.7895259232965155], [0.7895590126427421], [0.7895923243070532], [0.7896258381589796], [0.7896595339516592], [0.7896933913341776], [0.789727389863987], [0.7897615090193238], [0.7897957282116872], [0.78983002679833], [0.7898643840947756], [0.7898987793873465], [0.789933191945694], [0.7899676010353139], [0.7900019859300573], [0.7900363259246462], [0.7900706003470842], [0.7901047885711486], [0.7901388700287247], [0.7901728242221592], [0.7902066307365493], [0.7902402692519297], [0.7902737195554398], [0.7903069615533626], [0.7903399752831161], [0.7903727409251332], [0.790405238814628], [0.7904374494533013], [0.7904693535208764], [0.7905009318865591], [0.7905321656203457], [0.7905630360042148], [0.7905935245431607], [0.7906236129761148], [0.7906532832866655], [0.790682517713678], [0.7907112987617191], [0.7907396092113099], [0.7907674321290126], [0.7907947508773616], [0.7908215491245675], [0.7908478108540559], [0.7908735203738277], [0.7908986623255743], [0.7909232216936285], [0.7909471838137055], [0.7909705343813903], [0.7909932594604687], [0.7910153454909822], [0.7910367792970932], [0.7910575480947019], [0.7910776394988219], [0.7910970415307539], [0.791115742624986], [0.7911337316358504], [0.7911509978439737], [0.7911675309623979], [0.7911833211425414], [0.7911983589798347], [0.791212635519124], [0.7912261422598155], [0.7912388711607365], [0.791250814644771], [0.7912619656031654], [0.7912723173996222], [0.7912818638740946], [0.7912905993462919], [0.7912985186189603], [0.7913056169808114], [0.791311890209245], [0.7913173345727493], [0.7913219468330267], [0.7913257242468476], [0.7913286645676176], [0.791330766046656], [0.7913320274341857], [0.7913324479800643]], "divergence_mach": [[0.8117993988385819], [0.8117998353657966], [0.8118011446813717], [0.8118033259872306], [0.8118063779538607], [0.8118102987210585], [0.8118150858991923], [0.8118207365706167], [0.8118272472916068], [0.8118346140944193], [0.8118428324898802], [0.8118518974701493], [0.8118618035119066], [0.8118725445797879], [0.8118841141302244], [0.811896505115513], [0.81190970998827], [0.8119237207061631], [0.8119385287369559], [0.811954125063871], [0.8119705001912458], [0.8119876441504751], [0.812005546506299], [0.8120241963632695], [0.8120435823726626], [0.8120636927395187], [0.8120845152300349], [0.8121060371792472], [0.8121282454988928], [0.8121511266856536], [0.8121746668295065], [0.8121988516224735], [0.8122236663674954], [0.8122490959876283], [0.8122751250353872], [0.8123017377023923], [0.8123289178291925], [0.8123566489152868], [0.8123849141293855], [0.8124136963198535], [0.8124429780253428], [0.8124727414855875], [0.8125029686524073], [0.8125336412008889], [0.8125647405406512], [0.8125962478273839], [0.8126281439744208], [0.8126604096645045], [0.8126930253617118], [0.8127259713234155], [0.8127592276124344], [0.8127927741092799], [0.8128265905244576], [0.8128606564109376], [0.8128949511766036], [0.8129294540968914], [0.8129641443274092], [0.8129990009166412], [0.8130340028187353], [0.8130691289062844], [0.8131043579831753], [0.8131396687974476], [0.8131750400541795], [0.8132104504283871], [0.8132458785779227], [0.813281303156361], [0.813316702825878], [0.8133520562701371], [0.813387342207065], [0.8134225394017136], [0.8134576266789572], [0.8134925829362111], [0.8135273871560832], [0.8135620184189211], [0.8135964559153374], [0.8136306789586049], [0.8136646669970014], [0.8136983996260403], [0.8137318566005839], [0.813765017846895], [0.8137978634745126], [0.8138303737880498], [0.8138625292988367], [0.8138943107364415], [0.8139256990600292], [0.813956675469607], [0.8139872214170587], [0.8140173186170788], [0.814046949057905], [0.8140760950118732], [0.8141047390458022], [0.8141328640312178], [0.8141604531543429], [0.8141874899259187], [0.8142139581908402], [0.8142398421375406], [0.8142651263072075], [0.81428979560278], [0.814313835297688], [0.8143372310444288], [0.8143599688828591], [0.8143820352482932], [0.814403416979344], [0.8144241013255167], [0.8144440759545937], [0.8144633289597392], [0.814481848866352], [0.8144996246387061], [0.8145166456862524], [0.8145329018697558], [0.814548383507097], [0.8145630813788357], [0.8145769867335066], [0.8145900912926244], [0.814602387255455], [0.8146138673034501], [0.8146245246044601], [0.8146343528166416], [0.8146433460920658], [0.8146514990800964], [0.8146588069304044], [0.8146652652957712], [0.81467087033456], [0.8146756187129036], [0.8146795076066136], [0.8146825347027938], [0.8146846982011559], [0.8146859968150391], [0.8146864297721624]]}, "vertical_stabilizer": {"compressibility_drag": [[4.571507858486836e-14], [4.571483907396911e-14], [4.571412069408369e-14], [4.571292390353745e-14], [4.5711249465827764e-14], [4.5709098449059966e-14], [4.5706472225155795e-14], [4.5703372468838965e-14], [4.5699801156396725e-14], [4.569576056421888e-14], [4.5691253267117586e-14], [4.5686282136427756e-14], [4.568085033789083e-14], [4.567496132932466e-14], [4.566861885808095e-14], [4.566182695829404e-14], [4.565458994792325e-14], [4.5646912425591904e-14], [4.563879926722743e-14], [4.563025562250393e-14], [4.5621286911093004e-14], [4.5611898818725803e-14], [4.560209729307032e-14], [4.559188853942878e-14], [4.5581279016258773e-14], [4.557027543052272e-14], [4.555888473287165e-14], [4.554711411266568e-14], [4.553497099284018e-14], [4.5522463024617013e-14], [4.550959808207246e-14], [4.549638425656179e-14], [4.5482829851009104e-14], [4.546894337406705e-14], [4.545473353415161e-14], [4.5440209233358504e-14], [4.5425379561265826e-14], [4.5410253788629375e-14], [4.5394841360978126e-14], [4.5379151892110333e-14], [4.536319515750464e-14], [4.534698108764353e-14], [4.5330519761261296e-14], [4.531382139851815e-14], [4.5296896354110595e-14], [4.527975511031969e-14], [4.526240827000653e-14], [4.524486654955869e-14], [4.52271407717948e-14], [4.5209241858831437e-14], [4.519118082492125e-14], [4.517296876926334e-14], [4.5154616868795446e-14], [4.5136136370972776e-14], [4.511753858653615e-14], [4.509883488227984e-14], [4.5080036673818627e-14], [4.506115541836497e-14], [4.504220260751666e-14], [4.50231897600637e-14], [4.500412841481571e-14], [4.498503012345869e-14], [4.4965906443442445e-14], [4.4946768930904634e-14], [4.492762913363684e-14], [4.4908498584094273e-14], [4.4889388792457456e-14], [4.487031123974409e-14], [4.4851277370982253e-14], [4.483229858844257e-14], [4.4813386244936126e-14], [4.479455163718124e-14], [4.477580599924258e-14], [4.475716049604431e-14], [4.4738626216963345e-14], [4.472021416950383e-14], [4.4701935273055014e-14], [4.4683800352738014e-14], [4.4665820133340744e-14], [4.464800523334645e-14], [4.463036615905601e-14], [4.46129132988089e-14], [4.4595656917300303e-14], [4.4578607150002686e-14], [4.456177399768759e-14], [4.4545167321054167e-14], [4.452879683546271e-14], [4.4512672105777055e-14], [4.449680254131569e-14], [4.4481197390914155e-14], [4.446586573809858e-14], [4.44508164963735e-14], [4.4436058404622524e-14], [4.4421600022624345e-14], [4.44074497266854e-14], [4.439361570538795e-14], [4.4380105955456814e-14], [4.4366928277742497e-14], [4.435409027332442e-14], [4.4341599339731626e-14], [4.4329462667284365e-14], [4.431768723555439e-14], [4.430627980994472e-14], [4.4295246938391555e-14], [4.4284594948184846e-14], [4.4274329942909966e-14], [4.4264457799510507e-14], [4.425498416547141e-14], [4.4245914456123185e-14], [4.423725385206645e-14], [4.422900729671688e-14], [4.4221179493973423e-14], [4.421377490600257e-14], [4.420679775114842e-14], [4.420025200195871e-14], [4.4194141383334384e-14], [4.418846937079732e-14], [4.4183239188879394e-14], [4.417845380963135e-14], [4.417411595125091e-14], [4.4170228076831284e-14], [4.4166792393229055e-14], [4.4163810850051527e-14], [4.416128513876398e-14], [4.415921669191457e-14], [4.415760668248148e-14], [4.415645602333571e-14], [4.415576536682559e-14], [4.415553510447923e-14]], "thickness_to_chord": 0.09352740548802943, "wing_sweep": 0.5445427266222308, "crest_critical": [[0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869]], "divergence_mach": [[0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929]]}, "total": [[2.632280661138473e-12], [2.6322684917355618e-12], [2.632231990769551e-12], [2.6321711799643143e-12], [2.632086095512602e-12], [2.6319767880547636e-12], [2.63184332264989e-12], [2.631685778737912e-12], [2.631504250094087e-12], [2.631298844774489e-12], [2.631069685053891e-12], [2.6308169073550066e-12], [2.63054066216979e-12], [2.630241113972417e-12], [2.6299184411243703e-12], [2.629572835771334e-12], [2.6292045037321762e-12], [2.6288136643800564e-12], [2.6284005505155632e-12], [2.627965408232162e-12], [2.6275084967739168e-12], [2.62703008838547e-12], [2.6265304681547383e-12], [2.6260099338476276e-12], [2.6254687957360914e-12], [2.6249073764181653e-12], [2.624326010631216e-12], [2.6237250450580698e-12], [2.623104838125933e-12], [2.622465759798776e-12], [2.621808191362449e-12], [2.6211325252036294e-12], [2.620439164581802e-12], [2.6197285233952027e-12], [2.619001025939949e-12], [2.6182571066635228e-12], [2.6174972099118344e-12], [2.616721789670403e-12], [2.615931309299932e-12], [2.6151262412660078e-12], [2.6143070668635097e-12], [2.6134742759353593e-12], [2.612628366586329e-12], [2.6117698448917007e-12], [2.6108992246008374e-12], [2.6100170268362506e-12], [2.6091237797879337e-12], [2.6082200184031546e-12], [2.6073062840722476e-12], [2.6063831243099398e-12], [2.60545109243306e-12], [2.604510747234318e-12], [2.6035626526524093e-12], [2.6026073774390584e-12], [2.601645494822242e-12], [2.6006775821670903e-12], [2.599704220633207e-12], [2.5987259948298735e-12], [2.597743492468491e-12], [2.596757304012795e-12], [2.595768022326995e-12], [2.594776242322036e-12], [2.593782560600106e-12], [2.5927875750977532e-12], [2.5917918847277026e-12], [2.5907960890194835e-12], [2.5898007877594118e-12], [2.588806580629747e-12], [2.587814066847414e-12], [2.5868238448027595e-12], [2.5858365116979085e-12], [2.5848526631856586e-12], [2.5838728930087563e-12], [2.5828977926396627e-12], [2.5819279509214014e-12], [2.5809639537094113e-12], [2.5800063835147835e-12], [2.579055819149007e-12], [2.578112835370477e-12], [2.577178002533128e-12], [2.5762518862371132e-12], [2.575335046982136e-12], [2.5744280398233072e-12], [2.5735314140300223e-12], [2.5726457127478415e-12], [2.571771472663904e-12], [2.5709092236756882e-12], [2.5700594885637823e-12], [2.5692227826685352e-12], [2.568399613570999e-12], [2.5675904807782417e-12], [2.566795875413426e-12], [2.5660162799107195e-12], [2.5652521677151607e-12], [2.5645040029880843e-12], [2.5637722403176908e-12], [2.563057324435579e-12], [2.5623596899390384e-12], [2.56167976101939e-12], [2.561017951196681e-12], [2.560374663060743e-12], [2.5597502880189727e-12], [2.5591452060507665e-12], [2.558559785469104e-12], [2.5579943826891594e-12], [2.5574493420042717e-12], [2.556924995369388e-12], [2.5564216621920944e-12], [2.5559396491314195e-12], [2.555479249904561e-12], [2.5550407451016994e-12], [2.5546244020088966e-12], [2.5542304744393646e-12], [2.553859202573139e-12], [2.553510812805361e-12], [2.5531855176030555e-12], [2.5528835153707997e-12], [2.552604990325163e-12], [2.552350112378126e-12], [2.5521190370295157e-12], [2.5519119052684475e-12], [2.551728843484043e-12], [2.5515699633853827e-12], [2.5514353619306162e-12], [2.5513251212655415e-12], [2.551239308671533e-12], [2.5511779765228513e-12], [2.551141162253427e-12], [2.55112888833311e-12]]}, "induced": {"inviscid_wings": {"main_wing": [[0.09379992971684349], [0.09379940810603989], [0.09379784360716527], [0.09379523722062186], [0.09379159061285088], [0.093786906115199], [0.09378118672207168], [0.09377443608880977], [0.09376665852885141], [0.09375785901064856], [0.09374804315386653], [0.09373721722527967], [0.09372538813407967], [0.09371256342679928], [0.09369875128167336], [0.09368396050264452], [0.09366820051283642], [0.09365148134761976], [0.09363381364723813], [0.09361520864898698], [0.0935956781789815], [0.09357523464352414], [0.09355389102000622], [0.09353166084754871], [0.09350855821706212], [0.0934845977611175], [0.09345979464335866], [0.09343416454753839], [0.09340772366631367], [0.0933804886895623], [0.0933524767925604], [0.09332370562366536], [0.09329419329185], [0.09326395835384582], [0.09323301980111862], [0.09320139704648596], [0.09316910991054206], [0.09313617860786139], [0.09310262373294041], [0.09306846624595073], [0.09303372745829863], [0.09299842901802818], [0.09296259289501699], [0.09292624136600874], [0.09288939699959121], [0.09285208264091052], [0.09281432139639434], [0.09277613661831656], [0.09273755188923227], [0.09269859100644207], [0.0926592779663023], [0.09261963694849953], [0.09257969230033665], [0.09253946852090077], [0.09249899024534118], [0.09245828222900696], [0.09241736933169858], [0.09237627650190645], [0.09233502876104754], [0.09229365118779764], [0.09225216890244296], [0.09221060705131377], [0.09216899079128262], [0.09212734527434588], [0.09208569563230136], [0.09204406696153923], [0.09200248430793993], [0.09196097265185925], [0.09191955689334007], [0.09187826183731969], [0.09183711217912417], [0.09179613249003328], [0.09175534720301323], [0.091714780598666], [0.09167445679128955], [0.09163439971517995], [0.09159463311107642], [0.09155518051282063], [0.09151606523423395], [0.09147731035614452], [0.09143893871369219], [0.09140097288379512], [0.09136343517286709], [0.09132634760473844], [0.09128973190882884], [0.09125360950850997], [0.09121800150976496], [0.09118292869001783], [0.09114841148724051], [0.09111446998930978], [0.09108112392359943], [0.09104839264679312], [0.0910162951349983], [0.0909848499740828], [0.09095407535024423], [0.09092398904089298], [0.09089460840573901], [0.09086595037814099], [0.0908380314567591], [0.090810867697397], [0.09078447470516424], [0.09075886762685964], [0.09073406114363518], [0.09071006946393033], [0.09068690631662557], [0.09066458494449482], [0.09064311809792103], [0.09062251802881985], [0.09060279648492275], [0.0905839647042048], [0.09056603340965745], [0.09054901280429009], [0.09053291256638607], [0.0905177418450425], [0.09050350925592053], [0.09049022287732447], [0.09047789024647376], [0.09046651835606132], [0.09045611365108558], [0.09044668202588202], [0.0904382288214977], [0.0904307588232361], [0.09042427625850606], [0.09041878479492188], [0.09041428753864192], [0.09041078703297055], [0.09040828525721777], [0.09040678362581858], [0.09040628298767764]], "horizontal_stabilizer": [[0.026989195051415536], [0.026988987117412083], [0.026988363450035184], [0.02698732445309734], [0.026985870799244107], [0.02698400342947463], [0.026981723552367314], [0.026979032643184443], [0.026975932442681188], [0.026972424955806436], [0.026968512450107663], [0.026964197454004742], [0.026959482754819856], [0.026954371396644746], [0.02694886667797472], [0.02694297214919215], [0.026936691609829533], [0.0269300291056623], [0.0269229889256187], [0.02691557559850445], [0.026907793889557052], [0.026899648796834385], [0.02689114554741217], [0.026882289593472098], [0.026873086608154316], [0.026863542481330365], [0.02685366331518988], [0.026843455419674738], [0.02683292530781464], [0.02682207969087044], [0.02681092547342074], [0.02679946974825092], [0.026787719791182836], [0.026775683055749355], [0.02676336716780327], [0.026750779919985125], [0.026737929266116716], [0.02672482331550914], [0.026711470327169886], [0.02669787870393879], [0.026684056986550988], [0.026670013847642723], [0.026655758085679795], [0.026641298618826775], [0.026626644478800882], [0.026611804804627392], [0.026596788836405816], [0.026581605909020384], [0.026566265445806644], [0.02655077695223808], [0.026535150009559652], [0.026519394268416138], [0.02650351944249381], [0.026487535302124634], [0.026471451667943572], [0.02645527840449971], [0.02643902541392271], [0.026422702629593713], [0.02640632000982596], [0.02638988753159323], [0.02637341518427635], [0.026356912963452547], [0.02634039086472061], [0.02632385887756955], [0.026307326979295456], [0.026290805128973596], [0.026274303261482952], [0.026257831281575442], [0.026241399058044627], [0.026225016417902668], [0.026208693140680347], [0.026192438952764477], [0.026176263521810985], [0.026160176451252598], [0.02614418727485917], [0.02612830545140213], [0.026112540359383717], [0.026096901291858664], [0.026081397451349898], [0.02606603794483049], [0.026050831778822465], [0.026035787854566114], [0.0260209149632945], [0.026006221781594372], [0.025991716866871947], [0.025977408652898958], [0.02596330544548038], [0.025949415418193827], [0.025935746608242303], [0.025922306912409234], [0.025909104083109445], [0.02589614572452986], [0.025883439288891412], [0.025870992072800685], [0.02585881121369478], [0.02584690368641118], [0.02583527629983849], [0.02582393569367096], [0.025812888335282808], [0.025802140516676352], [0.025791698351555856], [0.025781567772487066], [0.02577175452816574], [0.02576226418079072], [0.025753102103521216], [0.025744273478048873], [0.025735783292270782], [0.02572763633804101], [0.025719837209059956], [0.025712390298816903], [0.025705299798664018], [0.025698569695975945], [0.02569220377240485], [0.025686205602242], [0.025680578550856956], [0.02567532577326064], [0.025670450212738515], [0.02566595459959054], [0.025661841449972675], [0.025658113064810383], [0.025654771528840846], [0.02565181870971524], [0.025649256257214117], [0.025647085602554374], [0.025645307957783293], [0.025643924315268855], [0.02564293544728423], [0.02564234190568725], [0.02564214402168106]], "vertical_stabilizer": [[0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0]]}, "inviscid": [[0.09000614826540533], [0.09000562991927878], [0.0900040752128635], [0.09000148514184592], [0.08999786136480753], [0.08999320620209007], [0.08998752263394838], [0.08998081429842568], [0.08997308548851436], [0.08996434114907056], [0.08995458687301261], [0.08994382889721483], [0.08993207409781429], [0.0899193299851326], [0.08990560469803614], [0.08989090699793971], [0.0898752462622794], [0.0898586324775775], [0.08984107623206847], [0.08982258870787808], [0.08980318167279233], [0.08978286747162639], [0.0897616590171294], [0.08973956978062755], [0.08971661378208962], [0.08969280558000275], [0.08966816026079168], [0.08964269342786331], [0.08961642119041122], [0.08958936015174386], [0.08956152739747439], [0.0895329404832186], [0.08950361742214538], [0.08947357667213844], [0.08944283712279241], [0.08941141808205283], [0.08937933926266627], [0.08934662076841082], [0.08931328308006775], [0.0892793470412069], [0.0892448338437807], [0.08920976501356503], [0.0891741623953949], [0.08913804813824015], [0.08910144468022888], [0.08906437473341067], [0.08902686126853127], [0.08898892749965157], [0.08895059686864061], [0.0889118930296999], [0.08887283983373732], [0.0888334613127085], [0.08879378166397205], [0.08875382523453047], [0.08871361650538369], [0.08867318007574522], [0.08863254064737562], [0.08859172300890517], [0.08855075202015852], [0.08850965259657678], [0.08846844969366253], [0.08842716829150923], [0.08838583337939761], [0.08834446994047886], [0.08830310293655544], [0.08826175729297817], [0.0882204578836523], [0.08817922951613388], [0.08813809691695315], [0.08809708471693757], [0.08805621743682242], [0.0880155194729342], [0.08797501508304376], [0.08793472837243717], [0.08789468328009922], [0.08785490356513989], [0.08781541279336498], [0.08777623432406215], [0.08773739129700557], [0.08769890661961158], [0.08766080295437197], [0.08762310270645039], [0.08758582801152903], [0.08754900072385952], [0.08751264240456527], [0.08747677431013419], [0.08744141738120717], [0.08740659223153668], [0.0873723191372222], [0.08733861802619461], [0.08730550846793528], [0.08727300966341477], [0.08724114043533111], [0.08720991921856988], [0.08717936405089542], [0.08714949256395386], [0.0871203219744787], [0.08709186907575656], [0.08706415022939447], [0.0870371813572746], [0.08701097793382691], [0.08698555497852042], [0.08696092704863274], [0.08693710823228663], [0.08691411214170457], [0.08689195190675769], [0.0868706401687759], [0.08685018907456331], [0.0868306102707686], [0.08681191489839864], [0.08679411358767232], [0.0867772164531004], [0.08676123308881621], [0.08674617256418658], [0.08673204341962955], [0.08671885366275708], [0.08670661076470706], [0.08669532165675772], [0.0866849927272116], [0.08667562981847565], [0.08666723822447953], [0.08665982268826053], [0.08665338739984901], [0.08664793599439957], [0.08664347155055786], [0.08663999658908578], [0.08663751307174035], [0.086636022400408], [0.08663552541646002]], "total": [[0.09237709804172137], [0.09237656502881436], [0.09237496633150064], [0.09237230297378904], [0.09236857666143954], [0.092363789780795], [0.09235794539688129], [0.09235104725122029], [0.09234309975890939], [0.09233410800544625], [0.09232407774281767], [0.09231301538527432], [0.09230092800450221], [0.09228782332439739], [0.09227370971526326], [0.09225859618764098], [0.09224249238559364], [0.09222540857957101], [0.09220735565882227], [0.09218834512334946], [0.09216838907543867], [0.09214750021078004], [0.09212569180910969], [0.09210297772458327], [0.0920793723755546], [0.09205489073415973], [0.09202954831543103], [0.09200336116602616], [0.09197634585270972], [0.09194851945034575], [0.09191989952974701], [0.0918905041450193], [0.09186035182075336], [0.0918294615388177], [0.0917978527249804], [0.09176554523516561], [0.09173255934151416], [0.09169891571821867], [0.09166463542709259], [0.09162973990294782], [0.09159425093877567], [0.09155819067077016], [0.0915215815631409], [0.09148444639276146], [0.09144680823376392], [0.0914086904418666], [0.091370116638713], [0.09133111069605157], [0.09129169671978564], [0.09125189903405602], [0.0912117421651693], [0.09117125082549243], [0.09113044989736252], [0.0910893644168789], [0.09104801955781096], [0.09100644061536596], [0.0909646529900768], [0.09092268217167958], [0.09088055372299308], [0.09083829326389921], [0.09079592645534677], [0.09075347898344269], [0.09071097654361261], [0.0906684448248503], [0.09062590949406868], [0.09058339618056999], [0.09054093046062886], [0.09049853784216791], [0.09045624374966793], [0.0904140735090774], [0.09037205233301793], [0.09033020530606534], [0.0902885573702052], [0.09024713331051255], [0.09020595774094789], [0.09016505509040308], [0.09012444958889598], [0.09008416525398663], [0.09004422587741838], [0.09000465501191474], [0.08996547595826203], [0.08992671175255956], [0.08988838515372771], [0.08985051863122606], [0.08981313435303027], [0.08977625417380489], [0.08973989962338033], [0.08970409189540514], [0.08966885183628281], [0.08963419993436503], [0.08960015630938577], [0.08956674070212195], [0.08953397246436189], [0.08950187054910178], [0.08947045350098015], [0.08943973944703291], [0.08940974608765641], [0.08938049068783839], [0.08935199006869889], [0.08932426059922376], [0.08929731818832498], [0.08927117827712619], [0.08924585583153344], [0.08922136533508154], [0.08919772078200326], [0.08917493567060217], [0.08915302299689343], [0.08913199524845539], [0.08911186439864663], [0.08909264190096935], [0.08907433868378327], [0.089056965145251], [0.08904053114854171], [0.08902504601732243], [0.08901051853146198], [0.08899695692306868], [0.0889843688727227], [0.08897276150599828], [0.0889621413902633], [0.08895251453167974], [0.08894388637255206], [0.08893626178884678], [0.08892964508801994], [0.08892404000709828], [0.08891944971100123], [0.0889158767911291], [0.08891332326421142], [0.08891179057141779], [0.08891127957769591]], "viscous": [[0.0023709497763159952], [0.0023709351095355527], [0.002370891118637085], [0.0023708178319430833], [0.00237071529663195], [0.0023705835787049046], [0.0023704227629328285], [0.002370232952794538], [0.0023700142703949718], [0.0023697668563756455], [0.002369490869804987], [0.0023691864880594346], [0.002368853906687875], [0.0023684933392647267], [0.0023681050172270615], [0.002367689189701208], [0.002367246123314208], [0.0023667761019934746], [0.002366279426753757], [0.002365756415471331], [0.0023652074026463315], [0.002364632739153594], [0.0023640327919802655], [0.0023634079439556555], [0.0023627585934649165], [0.0023620851541569384], [0.0023613880546393337], [0.0023606677381628133], [0.0023599246622984767], [0.0023591592986018403], [0.002358372132272577], [0.0023575636618006377], [0.002356734398607928], [0.0023558848666791693], [0.0023550156021879213], [0.0023541271531127236], [0.002353220078847834], [0.0023522949498077897], [0.0023513523470247858], [0.002350392861740895], [0.002349417094994927], [0.002348425657205071], [0.0023474191677459342], [0.002346398254521235], [0.0023453635535350056], [0.0023443157084558886], [0.0023432553701817093], [0.0023421831963999495], [0.0023410998511449537], [0.002340006004356065], [0.002338902331431887], [0.00233778951278388], [0.0023366682333904646], [0.002335539182348378], [0.0023344030524272254], [0.002333260539620683], [0.002332112342701144], [0.002330959162774356], [0.0023298017028345313], [0.0023286406673223756], [0.00232747676168416], [0.002326310691933427], [0.0023251431642149424], [0.0023239748843714063], [0.002322806557513209], [0.002321638887591813], [0.002320472576976482], [0.0023193083260339723], [0.002318146832714751], [0.00231698879213979], [0.0023158348961954817], [0.0023146858331311204], [0.002313542287161406], [0.0023124049380753224], [0.002311274460848588], [0.002310151525263132], [0.002309036795530975], [0.002307930929924446], [0.0023068345804127355], [0.0023057483923031074], [0.00230467300389], [0.002303609046109109], [0.002302557142198618], [0.0023015179073664874], [0.0023004919484649494], [0.0022994798636706303], [0.0022984822421730855], [0.00229749966386838], [0.0022965326990605824], [0.0022955819081703754], [0.002294647841450431], [0.002293731038707129], [0.0022928320290307087], [0.0022919513305318193], [0.002291089450084691], [0.002290246883079002], [0.0022894241131776465], [0.0022886216120817852], [0.002287839839304381], [0.002287079241949093], [0.0022863402544980285], [0.00228562329860569], [0.002284928782900674], [0.0022842571027948443], [0.002283608640298621], [0.0022829837638444392], [0.0022823828281174643], [0.0022818061738920556], [0.0022812541278779746], [0.002280727002570681], [0.0022802250961109095], [0.002279748692150559], [0.0022792980597254515], [0.0022788734531357956], [0.0022784751118323683], [0.0022781032603115463], [0.0022777581080155726], [0.0022774398492405217], [0.0022771486630516315], [0.0022768847132040105], [0.0022766481480724983], [0.0022764391005861634], [0.002276257688170879], [0.0022761040126986548], [0.0022759781604433224], [0.002275880202043259], [0.0022758101924709936], [0.0022757681710097264], [0.00227575416123588]], "oswald_efficiency_factor": [[0.5306492672909201], [0.5306491218648852], [0.530648685675723], [0.5306479589902184], [0.530646942252802], [0.5306456360852994], [0.530644041286502], [0.530642158831687], [0.530639989871961], [0.5306375357335593], [0.5306347979169702], [0.5306317780959955], [0.5306284781166704], [0.5306248999960967], [0.5306210459211448], [0.5306169182470684], [0.5306125194959992], [0.5306078523553409], [0.5306029196760614], [0.5305977244708763], [0.5305922699123315], [0.5305865593307957], [0.5305805962123273], [0.5305743841964912], [0.530567927074018], [0.5305612287844231], [0.5305542934135115], [0.530547125190779], [0.5305397284867582], [0.5305321078102334], [0.5305242678054256], [0.5305162132490369], [0.5305079490472584], [0.5304994802326731], [0.5304908119611034], [0.530481949508365], [0.5304728982669569], [0.5304636637426893], [0.530454251551234], [0.5304446674146108], [0.5304349171576119], [0.5304250067041791], [0.5304149420737075], [0.5304047293772911], [0.5303943748139439], [0.5303838846667308], [0.5303732652988888], [0.5303625231498842], [0.5303516647314179], [0.5303406966234244], [0.530329625470003], [0.5303184579753264], [0.5303072008995229], [0.5302958610545139], [0.5302844452998559], [0.5302729605385185], [0.5302614137126749], [0.5302498117994655], [0.5302381618067329], [0.5302264707687636], [0.5302147457420067], [0.5302029938007934], [0.5301912220330468], [0.5301794375359931], [0.530167647411868], [0.5301558587636355], [0.5301440786907073], [0.5301323142846645], [0.5301205726250111], [0.5301088607749078], [0.530097185776959], [0.5300855546489939], [0.5300739743798706], [0.5300624519253164], [0.5300509942037808], [0.5300396080923281], [0.5300283004225487], [0.5300170779765107], [0.5300059474827508], [0.5299949156122911], [0.5299839889747049], [0.5299731741142202], [0.5299624775058718], [0.5299519055516881], [0.5299414645769459], [0.5299311608264518], [0.5299210004608972], [0.5299109895532517], [0.529901134085219], [0.5298914399437528], [0.5298819129176329], [0.5298725586940913], [0.5298633828555169], [0.5298543908762173], [0.5298455881192429], [0.5298369798332927], [0.5298285711496789], [0.5298203670793588], [0.5298123725100582], [0.5298045922034458], [0.5297970307924018], [0.5297896927783488], [0.5297825825286746], [0.5297757042742272], [0.5297690621068859], [0.5297626599772234], [0.5297565016922496], [0.5297505909132242], [0.5297449311535858], [0.5297395257769327], [0.5297343779951101], [0.5297294908663862], [0.5297248672937016], [0.5297205100230318], [0.5297164216418127], [0.5297126045774817], [0.5297090610960956], [0.5297057933010425], [0.5297028031318564], [0.5297000923631057], [0.5296976626034043], [0.529695515294486], [0.5296936517103948], [0.5296920729567655], [0.5296907799701935], [0.5296897735177076], [0.5296890541963363], [0.52968862243277], [0.5296884784831185]], "viscous_wings_drag": {"main_wing": [[0.0026629992086125843], [0.0026629828623483008], [0.0026629338340756897], [0.0026628521553486964], [0.002662737878728573], [0.0026625910777470564], [0.002662411846847212], [0.002662200301314751], [0.0026619565771869797], [0.0026616808311531615], [0.0026613732404324754], [0.0026610340026417007], [0.0026606633356443575], [0.0026602614773872137], [0.0026598286857190245], [0.0026593652381975653], [0.002658871431879807], [0.0026583475830989547], [0.002657794027227364], [0.0026572111184252284], [0.0026565992293760754], [0.0026559587510094607], [0.002655290092208937], [0.0026545936795113836], [0.0026538699567883245], [0.0026531193849208107], [0.0026523424414599183], [0.0026515396202754352], [0.002650711431196654], [0.0026498583996383876], [0.002648981066222216], [0.002648079986382549], [0.002647155729967739], [0.0026462088808291455], [0.002645240036404795], [0.002644249807292036], [0.00264323881681416], [0.0026422077005801366], [0.0026411571060363384], [0.002640087692012504], [0.0026390001282617214], [0.0026378950949957013], [0.0026367732824137944], [0.002635635390227147], [0.0026344821271811936], [0.002633314210570427], [0.002632132365753465], [0.0026309373256635385], [0.002629729830315308], [0.00262851062631271], [0.0026272804663524606], [0.0026260401087267985], [0.0026247903168267767], [0.002623531858642465], [0.0026222655062666995], [0.002620992035395069], [0.0026197122248297266], [0.002618426855983162], [0.002617136712382474], [0.002615842579176885], [0.002614545242646381], [0.0026132454897132705], [0.002611944107456218], [0.0026106418826273353], [0.0026093396011726325], [0.002608038047756494], [0.002606738005289857], [0.00260544025446167], [0.0026041455732775973], [0.0026028547365993496], [0.0026015685156930354], [0.002600287677780354], [0.0025990129855953613], [0.002597745196948323], [0.0025964850642935192], [0.002595233334304871], [0.002593990747456443], [0.002592758037609999], [0.0025915359316095923], [0.002590325148881341], [0.0025891264010419676], [0.002587940391512883], [0.0025867678151422157], [0.0025856093578335852], [0.00258446569618289], [0.0025833374971213525], [0.0025822254175679304], [0.0025811301040873464], [0.0025800521925569172], [0.002578992307841318], [0.002577951063474867], [0.0025769290613508857], [0.002575926891420442], [0.002574945131398227], [0.002573984346475806], [0.002573045089044562], [0.0025721278984252105], [0.0025712333006054334], [0.0025703618079869718], [0.0025695139191386964], [0.0025686901185595448], [0.002567890876448378], [0.0025671166484824742], [0.002566367875604369], [0.0025656449838155075], [0.0025649483839790205], [0.002564278471630595], [0.0025636356267957584], [0.0025630202138180423], [0.002562432581191708], [0.0025618730614048323], [0.0025613419707894414], [0.0025608396093793205], [0.0025603662607764197], [0.0025599221920236527], [0.0025595076534875813], [0.0025591228787469416], [0.0025587680844897783], [0.0025584434704188064], [0.0025581492191627804], [0.002557885496198091], [0.002557652449775545], [0.0025574502108561734], [0.0025572788930545917], [0.0025571385925894606], [0.0025570293882418143], [0.0025569513413210817], [0.002556904495638838], [0.002556888877489299]], "horizontal_stabilizer": [[0.0001681908183096066], [0.00016818941866514315], [0.0001681852206439448], [0.00016817822698197356], [0.00016816844223658948], [0.00016815587278322267], [0.0001681405268100524], [0.00016812241431181], [0.00016810154708158542], [0.00016807793870184353], [0.00016805160453344138], [0.00016802256170371155], [0.00016799082909288435], [0.00016795642731937412], [0.00016791937872347678], [0.00016787970735001386], [0.0001678374389294716], [0.00016779260085796537], [0.00016774522217594457], [0.0001676953335456292], [0.00016764296722727423], [0.00016758815705429544], [0.0001675309384070945], [0.00016747134818611263], [0.00016740942478330414], [0.00016734520805303604], [0.00016727873928172867], [0.0001672100611564613], [0.00016713921773288886], [0.0001670662544018729], [0.00016699121785570072], [0.00016691415605299054], [0.00016683511818317513], [0.000166754154629951], [0.0001666713169342714], [0.00016658665775640415], [0.0001665002308374831], [0.0001664120909604889], [0.00016632229391056], [0.00016623089643483198], [0.00016613795620179376], [0.0001660435317602683], [0.00016594768249788994], [0.00016585046859920034], [0.00016575195100364484], [0.00016565219136294341], [0.0001655512519985378], [0.00016544919585868972], [0.0001653460864753164], [0.00016524198792096755], [0.0001651369647654848], [0.0001650310820326517], [0.00016492440515695277], [0.0001648169999401259], [0.00016470893250808343], [0.00016460026926757508], [0.000164491076863241], [0.00016438142213473413], [0.00016427137207394735], [0.0001641609937825911], [0.00016405035442993354], [0.00016393952121086423], [0.00016382856130423777], [0.00016371754183154883], [0.0001636065298159682], [0.000163495592141791], [0.00016338479551427504], [0.00016327420641982452], [0.00016316389108687047], [0.0001630539154468626], [0.00016294434509611162], [0.00016283524525793208], [0.00016272668074533036], [0.00016261871592436334], [0.00016251141467789454], [0.00016240484037008076], [0.00016229905581133548], [0.00016219412322394765], [0.00016209010420836404], [0.00016198705970995691], [0.0001618850499866012], [0.00016178413457676555], [0.0001616843722683328], [0.00016158582106803635], [0.00016148853817162223], [0.000161392579934584], [0.0001612980018437311], [0.00016120485848926955], [0.00016111320353766234], [0.00016102308970519365], [0.00016093456873219933], [0.00016084769135791735], [0.00016076250729616125], [0.0001606790652116129], [0.00016059741269675333], [0.00016051759624963503], [0.0001604396612522106], [0.00016036365194936232], [0.00016028961142873285], [0.00016021758160106184], [0.0001601476031813566], [0.00016007971567064076], [0.0001600139573384268], [0.0001599503652058817], [0.00015988897502955366], [0.00015982982128585468], [0.00015977293715620653], [0.0001597183545127061], [0.0001596661039046856], [0.00015961621454562767], [0.00015956871430093027], [0.0001595236296762288], [0.00015948098580633523], [0.00015944080644486453], [0.00015940311395435996], [0.0001593679292972151], [0.00015933527202704152], [0.00015930516028072063], [0.0001592776107711023], [0.0001592526387801596], [0.00015923025815296253], [0.00015921048129202933], [0.00015919331915239496], [0.00015917878123725598], [0.00015916687559416575], [0.00015915760881183343], [0.0001591509860175174], [0.00015914701087501378], [0.00015914568558315497]], "vertical_stabilizer": [[0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0]]}}, "miscellaneous": {"total_wetted_area": 882.8533112433041, "reference_area": 134.6, "total": [[0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712]], "trim_correction_factor": 1.02}, "untrimmed": [[0.1103473998930053], [0.11034686063953733], [0.11034524322434378], [0.11034254868284021], [0.11033877873978981], [0.1103339358081232], [0.11032802298702168], [0.11032104405970893], [0.11031300349050395], [0.11030390642161501], [0.11029375866919275], [0.11028256671906442], [0.1102703377218604], [0.1102570794877391], [0.11024280048053006], [0.11022750981150546], [0.11021121723260098], [0.11019393312921276], [0.1101756685125378], [0.11015643501145095], [0.11013624486395501], [0.11011511090821573], [0.11009304657311428], [0.1100700658685273], [0.11004618337500795], [0.11002141423326854], [0.10999577413318885], [0.10996927930243601], [0.10994194649483285], [0.10991379297823355], [0.10988483652225255], [0.10985509538548476], [0.10982458830257003], [0.10979333447085514], [0.10976135353688156], [0.1097286655825045], [0.10969529111081326], [0.10966125103182287], [0.10962656664789687], [0.10959125963897581], [0.10955535204760646], [0.10951886626381058], [0.10948182500974105], [0.10944425132417082], [0.10940616854692593], [0.10936760030304941], [0.10932857048697443], [0.10928910324653623], [0.10924922296685234], [0.10920895425423381], [0.1091683219199404], [0.10912735096390064], [0.1090860665584455], [0.10904449403192339], [0.10900265885242921], [0.1089605866113929], [0.10891830300728648], [0.10887583382932034], [0.1088332049411406], [0.10879044226462684], [0.10874757176371268], [0.10870461942829333], [0.1086616112582024], [0.10861857324727707], [0.10857553136752522], [0.10853251155341141], [0.10848953968625609], [0.10844664157872758], [0.10840384295956915], [0.10836116945832566], [0.10831864659036701], [0.10827629974198785], [0.10823415415568245], [0.10819223491564486], [0.10815056693338634], [0.10810917493360367], [0.10806808344019771], [0.10802731676251459], [0.10798689898181345], [0.1079468539378914], [0.10790720521599588], [0.10786797613390631], [0.10782918972927548], [0.10779086874718292], [0.10775303562794902], [0.10771571249514708], [0.10767892114392195], [0.10764268302948604], [0.10760701925590233], [0.10757195056512618], [0.10753749732629066], [0.10750367952522094], [0.10747051675425916], [0.10743802820232017], [0.10740623264518802], [0.10737514843613598], [0.10734479349675756], [0.1073151853080685], [0.10728634090192173], [0.10725827685261831], [0.1072310092688482], [0.10720455378585977], [0.10717892555791779], [0.10715413925104039], [0.10713020903596253], [0.10710714858140652], [0.1070849710476241], [0.10706368908015303], [0.10704331480394268], [0.10702385981762993], [0.10700533518816913], [0.10698775144569748], [0.10697111857866262], [0.10695544602924142], [0.10694074268897598], [0.10692701689474665], [0.10691427642494424], [0.10690252849593582], [0.10689177975881206], [0.1068820362963396], [0.10687330362026522], [0.10686558666879566], [0.10685888980438916], [0.10685321681180514], [0.10684857089639868], [0.10684495468268553], [0.10684237021317144], [0.10684081894744812], [0.10684030176152085]], "trim_corrected_drag": [[0.11255434789086541], [0.11255379785232808], [0.11255214808883066], [0.11254939965649702], [0.11254555431458561], [0.11254061452428567], [0.11253458344676212], [0.1125274649409031], [0.11251926356031403], [0.11250998455004732], [0.11249963384257661], [0.11248821805344571], [0.11247574447629761], [0.11246222107749389], [0.11244765649014067], [0.11243206000773558], [0.112415441577253], [0.11239781179179702], [0.11237918188278856], [0.11235956371167997], [0.11233896976123411], [0.11231741312638005], [0.11229490750457656], [0.11227146718589785], [0.1122471070425081], [0.11222184251793392], [0.11219568961585263], [0.11216866488848473], [0.11214078542472951], [0.11211206883779821], [0.1120825332526976], [0.11205219729319445], [0.11202108006862142], [0.11198920116027225], [0.11195658060761919], [0.11192323889415459], [0.11188919693302952], [0.11185447605245932], [0.1118190979808548], [0.11178308483175534], [0.11174645908855858], [0.11170924358908679], [0.11167146150993587], [0.11163313635065424], [0.11159429191786445], [0.1115549523091104], [0.11151514189671392], [0.11147488531146696], [0.1114342074261894], [0.1113931333393185], [0.11135168835833921], [0.11130989798317865], [0.1112677878896144], [0.11122538391256186], [0.1111827120294778], [0.11113979834362077], [0.11109666906743222], [0.11105335050590674], [0.11100986903996342], [0.11096625110991937], [0.11092252319898693], [0.1108787118168592], [0.11083484348336645], [0.11079094471222262], [0.11074704199487573], [0.11070316178447964], [0.11065933047998121], [0.11061557441030213], [0.11057191981876054], [0.11052839284749218], [0.11048501952217435], [0.1104418257368276], [0.11039883723879611], [0.11035607961395777], [0.11031357827205407], [0.11027135843227574], [0.11022944510900166], [0.11018786309776489], [0.11014663696144972], [0.11010579101664923], [0.1100653493203158], [0.11002533565658444], [0.10998577352386099], [0.10994668612212659], [0.10990809634050801], [0.10987002674505003], [0.1098324995668004], [0.10979553669007576], [0.10975915964102037], [0.1097233895764287], [0.10968824727281647], [0.10965375311572537], [0.10961992708934434], [0.10958678876636657], [0.10955435729809178], [0.1095226514048587], [0.10949168936669271], [0.10946148901422986], [0.10943206771996017], [0.10940344238967067], [0.10937562945422516], [0.10934864486157697], [0.10932250406907615], [0.1092972220360612], [0.10927281321668178], [0.10924929155303466], [0.10922667046857658], [0.10920496286175609], [0.10918418110002154], [0.10916433701398254], [0.10914544189193251], [0.10912750647461143], [0.10911054095023588], [0.10909455494982626], [0.1090795575427555], [0.10906555723264158], [0.10905256195344312], [0.10904057906585453], [0.10902961535398831], [0.10901967702226639], [0.10901076969267053], [0.10900289840217157], [0.10899606760047695], [0.10899028114804124], [0.10898554231432665], [0.10898185377633923], [0.10897921761743487], [0.1089776353263971], [0.10897710779675127]], "spoiler_drag": 0.0, "drag_coefficient_increment": 0.0, "total": [[0.11255434789086541], [0.11255379785232808], [0.11255214808883066], [0.11254939965649702], [0.11254555431458561], [0.11254061452428567], [0.11253458344676212], [0.1125274649409031], [0.11251926356031403], [0.11250998455004732], [0.11249963384257661], [0.11248821805344571], [0.11247574447629761], [0.11246222107749389], [0.11244765649014067], [0.11243206000773558], [0.112415441577253], [0.11239781179179702], [0.11237918188278856], [0.11235956371167997], [0.11233896976123411], [0.11231741312638005], [0.11229490750457656], [0.11227146718589785], [0.1122471070425081], [0.11222184251793392], [0.11219568961585263], [0.11216866488848473], [0.11214078542472951], [0.11211206883779821], [0.1120825332526976], [0.11205219729319445], [0.11202108006862142], [0.11198920116027225], [0.11195658060761919], [0.11192323889415459], [0.11188919693302952], [0.11185447605245932], [0.1118190979808548], [0.11178308483175534], [0.11174645908855858], [0.11170924358908679], [0.11167146150993587], [0.11163313635065424], [0.11159429191786445], [0.1115549523091104], [0.11151514189671392], [0.11147488531146696], [0.1114342074261894], [0.1113931333393185], [0.11135168835833921], [0.11130989798317865], [0.1112677878896144], [0.11122538391256186], [0.1111827120294778], [0.11113979834362077], [0.11109666906743222], [0.11105335050590674], [0.11100986903996342], [0.11096625110991937], [0.11092252319898693], [0.1108787118168592], [0.11083484348336645], [0.11079094471222262], [0.11074704199487573], [0.11070316178447964], [0.11065933047998121], [0.11061557441030213], [0.11057191981876054], [0.11052839284749218], [0.11048501952217435], [0.1104418257368276], [0.11039883723879611], [0.11035607961395777], [0.11031357827205407], [0.11027135843227574], [0.11022944510900166], [0.11018786309776489], [0.11014663696144972], [0.11010579101664923], [0.1100653493203158], [0.11002533565658444], [0.10998577352386099], [0.10994668612212659], [0.10990809634050801], [0.10987002674505003], [0.1098324995668004], [0.10979553669007576], [0.10975915964102037], [0.1097233895764287], [0.10968824727281647], [0.10965375311572537], [0.10961992708934434], [0.10958678876636657], [0.10955435729809178], [0.1095226514048587], [0.10949168936669271], [0.10946148901422986], [0.10943206771996017], [0.10940344238967067], [0.10937562945422516], [0.10934864486157697], [0.10932250406907615], [0.1092972220360612], [0.10927281321668178], [0.10924929155303466], [0.10922667046857658], [0.10920496286175609], [0.10918418110002154], [0.10916433701398254], [0.10914544189193251], [0.10912750647461143], [0.10911054095023588], [0.10909455494982626], [0.1090795575427555], [0.10906555723264158], [0.10905256195344312], [0.10904057906585453], [0.10902961535398831], [0.10901967702226639], [0.10901076969267053], [0.10900289840217157], [0.10899606760047695], [0.10899028114804124], [0.10898554231432665], [0.10898185377633923], [0.10897921761743487], [0.1089776353263971], [0.10897710779675127]]}}, "stability": {"static": {"Cm_alpha": [[-15.630405094823296], [-15.630405043397747], [-15.630404889152516], [-15.630404632181829], [-15.630404272642675], [-15.630403810754682], [-15.630403246800011], [-15.630402581123143], [-15.630401814130675], [-15.630400946291072], [-15.630399978134342], [-15.63039891025172], [-15.630397743295298], [-15.630396477977584], [-15.630395115071078], [-15.630393655407762], [-15.630392099878577], [-15.630390449432863], [-15.63038870507776], [-15.630386867877558], [-15.630384938953025], [-15.63038291948071], [-15.630380810692191], [-15.630378613873287], [-15.630376330363259], [-15.63037396155396], [-15.630371508888963], [-15.630368973862641], [-15.63036635801922], [-15.630363662951837], [-15.630360890301496], [-15.630358041756079], [-15.630355119049252], [-15.630352123959401], [-15.630349058308497], [-15.63034592396098], [-15.630342722822576], [-15.630339456839103], [-15.630336127995271], [-15.630332738313427], [-15.63032928985232], [-15.630325784705796], [-15.630322225001507], [-15.630318612899586], [-15.630314950591309], [-15.630311240297758], [-15.6303074842684], [-15.630303684779744], [-15.630299844133916], [-15.630295964657229], [-15.630292048698774], [-15.63028809862896], [-15.630284116838073], [-15.63028010573478], [-15.630276067744688], [-15.630272005308846], [-15.630267920882247], [-15.630263816932342], [-15.630259695937529], [-15.630255560385649], [-15.630251412772477], [-15.630247255600192], [-15.630243091375888], [-15.63023892261003], [-15.63023475181495], [-15.630230581503337], [-15.630226414186708], [-15.630222252373905], [-15.630218098569586], [-15.630213955272726], [-15.630209824975118], [-15.630205710159863], [-15.630201613299931], [-15.630197536856627], [-15.630193483278173], [-15.630189454998234], [-15.630185454434454], [-15.630181483987052], [-15.630177546037373], [-15.630173642946502], [-15.630169777053855], [-15.630165950675782], [-15.630162166104245], [-15.630158425605423], [-15.630154731418404], [-15.63015108575387], [-15.630147490792794], [-15.63014394868516], [-15.63014046154871], [-15.630137031467719], [-15.630133660491744], [-15.630130350634467], [-15.630127103872503], [-15.630123922144247], [-15.63012080734877], [-15.630117761344685], [-15.6301147859491], [-15.63011188293655], [-15.630109054037966], [-15.63010630093969], [-15.630103625282494], [-15.63010102866063], [-15.630098512620918], [-15.630096078661857], [-15.630093728232747], [-15.630091462732878], [-15.63008928351072], [-15.630087191863137], [-15.630085189034663], [-15.630083276216773], [-15.630081454547206], [-15.63007972510933], [-15.630078088931484], [-15.630076546986441], [-15.630075100190819], [-15.630073749404552], [-15.630072495430433], [-15.630071339013622], [-15.630070280841245], [-15.630069321541992], [-15.630068461685763], [-15.63006770178334], [-15.630067042286104], [-15.630066483585754], [-15.63006602601413], [-15.63006566984297], [-15.630065415283816], [-15.630065262487829], [-15.630065211545748]], "Cm0": [[0.5620946670695426], [0.5620946652744512], [0.5620946598902739], [0.5620946509202998], [0.5620946383700087], [0.5620946222470673], [0.5620946025613247], [0.5620945793248053], [0.5620945525517027], [0.5620945222583689], [0.5620944884633048], [0.5620944511871485], [0.5620944104526622], [0.5620943662847173], [0.5620943187102789], [0.5620942677583888], [0.5620942134601468], [0.562094155848691], [0.5620940949591773], [0.5620940308287565], [0.5620939634965507], [0.5620938930036293], [0.5620938193929824], [0.5620937427094939], [0.5620936629999125], [0.5620935803128232], [0.5620934946986162], [0.5620934062094549], [0.5620933148992433], [0.562093220823592], [0.5620931240397833], [0.5620930246067349], [0.5620929225849638], [0.562092818036547], [0.5620927110250833], [0.5620926016156542], [0.562092489874782], [0.5620923758703887], [0.5620922596717536], [0.5620921413494703], [0.5620920209754022], [0.5620918986226389], [0.5620917743654491], [0.562091648279236], [0.5620915204404895], [0.5620913909267399], [0.5620912598165089], [0.562091127189261], [0.562090993125356], [0.5620908577059979], [0.5620907210131848], [0.5620905831296603], [0.5620904441388607], [0.5620903041248644], [0.5620901631723415], [0.5620900213665003], [0.5620898787930365], [0.5620897355380804], [0.5620895916881443], [0.5620894473300706], [0.5620893025509781], [0.5620891574382094], [0.5620890120792786], [0.5620888665618177], [0.5620887209735236], [0.5620885754021056], [0.5620884299352323], [0.562088284660479], [0.5620881396652745], [0.5620879950368498], [0.5620878508621849], [0.5620877072279564], [0.5620875642204872], [0.5620874219256932], [0.5620872804290334], [0.5620871398154588], [0.5620870001693614], [0.5620868615745243], [0.5620867241140726], [0.5620865878704235], [0.5620864529252377], [0.5620863193593719], [0.5620861872528302], [0.5620860566847172], [0.5620859277331922], [0.5620858004754224], [0.562085674987538], [0.5620855513445879], [0.5620854296204951], [0.5620853098880148], [0.5620851922186896], [0.562085076682811], [0.5620849633493753], [0.5620848522860457], [0.562084743559112], [0.5620846372334523], [0.5620845333724954], [0.5620844320381846], [0.5620843332909408], [0.5620842371896282], [0.5620841437915208], [0.5620840531522684], [0.5620839653258656], [0.5620838803646193], [0.56208379831912], [0.5620837192382123], [0.5620836431689664], [0.5620835701566516], [0.5620835002447101], [0.5620834334747327], [0.5620833698864338], [0.5620833095176299], [0.562083252404217], [0.5620831985801514], [0.5620831480774289], [0.5620831009260671], [0.5620830571540882], [0.5620830167875042], [0.5620829798502995], [0.5620829463644199], [0.5620829163497587], [0.5620828898241454], [0.5620828668033362], [0.5620828473010042], [0.5620828313287324], [0.5620828188960068], [0.5620828100102109], [0.5620828046766219], [0.5620828028984067]], "CM": [[-2.2965173986366176], [-2.2965076445020647], [-2.2964783881886577], [-2.2964296479637456], [-2.2963614542576876], [-2.2962738496449218], [-2.2961668888126177], [-2.2960406385250423], [-2.295895177575439], [-2.2957305967341943], [-2.2955469986844443], [-2.2953444979528377], [-2.2951232208301318], [-2.2948833052853757], [-2.294624900870361], [-2.294348168618146], [-2.294053280932345], [-2.2937404214694883], [-2.2934097850137904], [-2.2930615773441807], [-2.2926960150942204], [-2.292313325605079], [-2.2919137467703035], [-2.2914975268761553], [-2.2910649244315255], [-2.290616207994684], [-2.290151655991779], [-2.2896715565286097], [-2.2891762071981248], [-2.2886659148791733], [-2.2881409955328116], [-2.2876017739894565], [-2.2870485837333288], [-2.2864817666795867], [-2.2859016729483006], [-2.285308660631636], [-2.28470309555732], [-2.2840853510477834], [-2.283455807674193], [-2.282814853006687], [-2.2821628813606796], [-2.281500293539894], [-2.2808274965751103], [-2.280144903459429], [-2.279452932882041], [-2.2787520089565367], [-2.2780425609488355], [-2.2773250230015614], [-2.276599833855354], [-2.2758674365700875], [-2.2751282782424984], [-2.2743828097224394], [-2.273631485328597], [-2.272874762561212], [-2.272113101816091], [-2.2713469660951375], [-2.2705768207182047], [-2.269803133033825], [-2.269026372129047], [-2.268247008540166], [-2.26746551396292], [-2.2666823609633155], [-2.26589802268875], [-2.26511297257977], [-2.2643276840827093], [-2.263542630363531], [-2.262758284022744], [-2.261975116811044], [-2.261193599348289], [-2.2604142008414834], [-2.2596373888072616], [-2.2588636287947974], [-2.2580933841110165], [-2.2573271155489993], [-2.2565652811176427], [-2.255808335775054], [-2.2550567311638225], [-2.2543109153495564], [-2.253571332562772], [-2.2528384229428706], [-2.2521126222866625], [-2.251394361799256], [-2.250684067849046], [-2.2499821617259306], [-2.2492890594037025], [-2.248605171305491], [-2.247930902074296], [-2.2472666503462655], [-2.2466128085287878], [-2.2459697625829174], [-2.2453378918098785], [-2.24471756864145], [-2.2441091584357524], [-2.2435130192770187], [-2.242929501779586], [-2.242358948897663], [-2.241801695738852], [-2.241258069382572], [-2.2407283887042047], [-2.240212964202846], [-2.2397120978351857], [-2.239226082853672], [-2.2387552036501353], [-2.238299735604722], [-2.23785994493921], [-2.2374360885762394], [-2.2370284140038548], [-2.2366371591443133], [-2.236262552230097], [-2.235904811683082], [-2.2355641460006948], [-2.235240753646897], [-2.234934822948506], [-2.2346465319974533], [-2.234376048557611], [-2.2341235299784614], [-2.2338891231130704], [-2.233672964242141], [-2.233475179003962], [-2.2332958823288367], [-2.233135178380758], [-2.232993160503061], [-2.2328699111706243], [-2.2327655019475907], [-2.2326799934504615], [-2.232613435316948], [-2.232565866180572], [-2.232537313650996], [-2.232527794299488]], "Cn_beta": [[0.16603021791201023], [0.1660301848640922], [0.1660300857403819], [0.1660299206009971], [0.16602968954609407], [0.16602939271580372], [0.16602903029014615], [0.16602860248891887], [0.16602810957156064], [0.16602755183699106], [0.16602692962342605], [0.16602624330816781], [0.16602549330737226], [0.1660246800757915], [0.16602380410649234], [0.16602286593055213], [0.16602186611673], [0.16602080527111543], [0.16601968403675454], [0.16601850309325225], [0.1660172631563533], [0.16601596497749974], [0.16601460934336826], [0.1660131970753838], [0.1660117290292144], [0.1660102060942424], [0.16600862919301695], [0.16600699928068624], [0.16600531734440876], [0.16600358440274585], [0.16600180150503493], [0.1659999697307447], [0.16599809018881098], [0.16599616401695544], [0.165994192380987], [0.1659921764740866], [0.16599011751607393], [0.1659880167526604], [0.16598587545468535], [0.16598369491733705], [0.16598147645935993], [0.16597922142224775], [0.16597693116942236], [0.16597460708540096], [0.16597225057494963], [0.16596986306222564], [0.16596744598990867], [0.16596500081832055], [0.165962529024535], [0.16596003210147803], [0.165957511557019], [0.16595496891305328], [0.16595240570457626], [0.16594982347875137], [0.16594722379397], [0.16594460821890564], [0.1659419783315629], [0.1659393357183206], [0.1659366819729708], [0.16593401869575478], [0.16593134749239388], [0.16592866997311984], [0.16592598775170134], [0.1659233024444701], [0.1659206156693454], [0.16591792904485897], [0.16591524418917958], [0.16591256271913885], [0.1659098862492583], [0.16590721639077846], [0.16590455475069116], [0.16590190293077392], [0.1658992625266295], [0.16589663512672798], [0.16589402231145586], [0.16589142565216916], [0.16588884671025278], [0.16588628703618685], [0.16588374816862034], [0.165881231633451], [0.16587873894291524], [0.1658762715946862], [0.1658738310709802], [0.16587141883767403], [0.16586903634343164], [0.16586668501884297], [0.16586436627557224], [0.16586208150551898], [0.16585983207999216], [0.16585761934889492], [0.16585544463992455], [0.1658533092577841], [0.16585121448341048], [0.16584916157321472], [0.16584715175833842], [0.16584518624392572], [0.16584326620840942], [0.16584139280281582], [0.16583956715008358], [0.1658377903444012], [0.16583606345056093], [0.1658343875033305], [0.16583276350684328], [0.16583119243400576], [0.165829675225925], [0.16582821279135362], [0.16582680600615507], [0.16582545571278873], [0.16582416271981326], [0.16582292780141195], [0.16582175169693678], [0.16582063511047485], [0.16581957871043387], [0.16581858312914988], [0.16581764896251605], [0.16581677676963266], [0.16581596707247903], [0.16581522035560747], [0.16581453706585847], [0.1658139176120992], [0.16581336236498354], [0.1658128716567344], [0.1658124457809499], [0.16581208499242983], [0.16581178950702788], [0.165811559501524], [0.1658113951135212], [0.1658112964413651], [0.16581126354408632]], "static_margin": [[3.5185229439035766], [3.5185229590704097], [3.518523004561643], [3.5185230803494774], [3.518523186387608], [3.518523322611243], [3.5185234889371553], [3.5185236852637267], [3.5185239114710165], [3.518524167420838], [3.5185244529568473], [3.518524767904639], [3.5185251120718615], [3.518525485248336], [3.5185258872061924], [3.5185263177000126], [3.5185267764669854], [3.5185272632270763], [3.5185277776832025], [3.5185283195214243], [3.518528888411138], [3.518529484005293], [3.5185301059406067], [3.5185307538377946], [3.5185314273018093], [3.518532125922095], [3.5185328492728423], [3.518533596913255], [3.5185343683878325], [3.518535163226656], [3.5185359809456798], [3.518536821047042], [3.5185376830193706], [3.518538566338112], [3.51853947046585], [3.5185403948526535], [3.5185413389364126], [3.5185423021431923], [3.5185432838875927], [3.5185442835731116], [3.518545300592517], [3.5185463343282266], [3.5185473841526895], [3.5185484494287778], [3.518549529510178], [3.518550623741802], [3.518551731460177], [3.5185528519938667], [3.5185539846638854], [3.5185551287841097], [3.5185562836617077], [3.518557448597562], [3.518558622886701], [3.51855980581873], [3.5185609966782643], [3.5185621947453734], [3.5185633992960126], [3.5185646096024716], [3.5185658249338148], [3.518567044556325], [3.518568267733954], [3.518569493728761], [3.5185707218013706], [3.5185719512114115], [3.518573181217965], [3.5185744110800177], [3.5185756400569024], [3.5185768674087456], [3.5185780923969125], [3.5185793142844504], [3.51858053233653], [3.518581745820883], [3.5185829540082443], [3.5185841561727806], [3.5185853515925314], [3.5185865395498315], [3.5185877193317374], [3.518588890230458], [3.5185900515437636], [3.51859120257541], [3.5185923426355448], [3.518593471041116], [3.518594587116278], [3.51859569019278], [3.5185967796103723], [3.518597854717178], [3.518598914870094], [3.5185999594351465], [3.518600987787879], [3.5186019993137108], [3.518602993408292], [3.518603969477859], [3.5186049269395827], [3.518605865221902], [3.5186067837648585], [3.5186076820204213], [3.5186085594528027], [3.518609415538772], [3.518610249767953], [3.518611061643121], [3.5186118506804935], [3.5186126164100004], [3.5186133583755623], [3.518614076135352], [3.5186147692620406], [3.518615437343055], [3.5186160799808053], [3.518616696792917], [3.518617287412447], [3.518617851488098], [3.5186183886844136], [3.518618898681978], [3.5186193811775883], [3.518619835884438], [3.5186202625322722], [3.518620660867547], [3.5186210306535712], [3.5186213716706414], [3.5186216837161686], [3.518621966604793], [3.518622220168488], [3.5186224442566565], [3.5186226387362187], [3.5186228034916813], [3.5186229384252137], [3.51862304345669], [3.518623118523752], [3.5186231635818235], [3.518623178604154]], "neutral_point": [[31.415771965970954, 16.105893475970955, 15.625654085970956], [31.415772035396508, 16.10589354539651, 15.625654155396509], [31.415772243630748, 16.10589375363075, 15.62565436363075], [31.41577259054643, 16.10589410054643, 15.62565471054643], [31.415773075931593, 16.105894585931594, 15.625655195931595], [31.41577369948966, 16.10589520948966, 15.62565581948966], [31.415774460839653, 16.105895970839654, 15.625656580839655], [31.415775359516427, 16.105896869516428, 15.625657479516429], [31.415776394970955, 16.105897904970956, 15.625658514970956], [31.415777566570693, 16.105899076570694, 15.625659686570694], [31.415778873599983, 16.105900383599984, 15.625660993599984], [31.415780315260495, 16.105901825260496, 15.625662435260496], [31.41578189067174, 16.105903400671743, 15.625664010671743], [31.415783598871645, 16.105905108871646, 15.625665718871646], [31.41578543881713, 16.105906948817132, 15.625667558817133], [31.415787409384816, 16.105908919384817, 15.625669529384817], [31.415789509371688, 16.10591101937169, 15.62567162937169], [31.415791737495905, 16.105913247495906, 15.625673857495906], [31.415794092397576, 16.105915602397577, 15.625676212397577], [31.41579657263966, 16.10591808263966, 15.625678692639662], [31.415799176708834, 16.105920686708835, 15.625681296708835], [31.415801903016483, 16.105923413016484, 15.625684023016484], [31.4158047498997, 16.1059262598997, 15.6256868698997], [31.41580771562232, 16.105929225622322, 15.625689835622323], [31.415810798376036, 16.105932308376037, 15.625692918376037], [31.415813996281543, 16.105935506281543, 15.625696116281544], [31.41581730738972, 16.10593881738972, 15.625699427389721], [31.415820729682835, 16.105942239682836, 15.625702849682837], [31.415824261075855, 16.105945771075856, 15.625706381075856], [31.415827899417746, 16.105949409417747, 15.625710019417747], [31.415831642492808, 16.10595315249281, 15.62571376249281], [31.4158354880221, 16.1059569980221, 15.625717608022102], [31.41583943366484, 16.10596094366484, 15.62572155366484], [31.4158434770199, 16.105964987019902, 15.625725597019903], [31.415847615627285, 16.105969125627286, 15.625729735627287], [31.415851846969705, 16.105973356969706, 15.625733966969706], [31.415856168474125, 16.105977678474126, 15.625738288474126], [31.415860577513385, 16.105982087513386, 15.625742697513386], [31.415865071407836, 16.105986581407837, 15.625747191407838], [31.415869647427016, 16.105991157427017, 15.625751767427017], [31.415874302791345, 16.105995812791345, 15.625756422791346], [31.415879034673868, 16.10600054467387, 15.625761154673869], [31.415883840201992, 16.106005350201993, 15.625765960201994], [31.415888716459296, 16.106010226459297, 15.625770836459298], [31.415893660487303, 16.106015170487304, 15.625775780487304], [31.415898669287373, 16.106020179287373, 15.625780789287374], [31.41590373982249, 16.10602524982249, 15.625785859822491], [31.415908869019184, 16.106030379019185, 15.625790989019185], [31.41591405376942, 16.10603556376942, 15.625796173769421], [31.415919290932496, 16.106040800932497, 15.625801410932498], [31.415924577337012, 16.106046087337013, 15.625806697337014], [31.41592990978278, 16.10605141978278, 15.62581202978278], [31.415935285042817, 16.106056795042818, 15.625817405042818], [31.41594069986533, 16.106062209865332, 15.625822819865332], [31.41594615097567, 16.106067660975672, 15.625828270975672], [31.41595163507839, 16.10607314507839, 15.625833755078391], [31.415957148859196, 16.106078658859197, 15.625839268859197], [31.415962688987033, 16.106084198987034, 15.625844808987035], [31.41596825211607, 16.10608976211607, 15.625850372116071], [31.415973834887744, 16.106095344887745, 15.625855954887745], [31.41597943393283, 16.10610094393283, 15.62586155393283], [31.415985045873427, 16.106106555873428, 15.625867165873428], [31.415990667325087, 16.106112177325087, 15.625872787325088], [31.41599629489878, 16.10611780489878, 15.62587841489878], [31.416001925202984, 16.106123435202985, 15.625884045202985], [31.41600755484574, 16.106129064845742, 15.625889674845743], [31.41601318043668, 16.10613469043668, 15.62589530043668], [31.416018798589057, 16.106140308589058, 15.625900918589059], [31.416024405921807, 16.106145915921807, 15.625906525921808], [31.41602999906155, 16.10615150906155, 15.625912119061551], [31.416035574644646, 16.106157084644646, 15.625917694644647], [31.416041129319158, 16.10616263931916, 15.62592324931916], [31.416046659746915, 16.106168169746915, 15.625928779746916], [31.416052162605435, 16.106173672605436, 15.625934282605437], [31.416057634589976, 16.106179144589976, 15.625939754589977], [31.41606307241546, 16.106184582415462, 15.625945192415463], [31.416068472818417, 16.106189982818417, 15.625950592818418], [31.416073832558958, 16.10619534255896, 15.625955952558959], [31.416079148422654, 16.106200658422654, 15.625961268422655], [31.416084417222486, 16.106205927222486, 15.625966537222487], [31.41608963580067, 16.10621114580067, 15.625971755800672], [31.416094801030575, 16.106216311030575, 15.625976921030576], [31.41609990981854, 16.106221419818542, 15.625982029818543], [31.416104959105677, 16.10622646910568, 15.625987079105679], [31.416109945869717, 16.106231455869718, 15.625992065869719], [31.416114867126723, 16.106236377126724, 15.625996987126724], [31.416119719932915, 16.106241229932916, 15.626001839932917], [31.416124501386307, 16.106246011386308, 15.626006621386308], [31.416129208628476, 16.106250718628477, 15.626011328628477], [31.416133838846196, 16.106255348846197, 15.626015958846198], [31.41613838927309, 16.10625989927309, 15.626020509273092], [31.416142857191225, 16.106264367191226, 15.626024977191227], [31.416147239932727, 16.106268749932728, 15.626029359932728], [31.416151534881298, 16.1062730448813, 15.626033654881299], [31.416155739473748, 16.10627724947375, 15.62603785947375], [31.416159851201492, 16.106281361201493, 15.626041971201493], [31.416163867611985, 16.106285377611986, 15.626045987611986], [31.416167786310158, 16.10628929631016, 15.62604990631016], [31.416171604959782, 16.106293114959783, 15.626053724959784], [31.41617532128484, 16.10629683128484, 15.626057441284841], [31.416178933070828, 16.10630044307083, 15.62606105307083], [31.41618243816602, 16.106303948166023, 15.626064558166023], [31.416185834482743, 16.106307344482744, 15.626067954482744], [31.416189119998542, 16.106310629998543, 15.626071239998543], [31.416192292757334, 16.106313802757334, 15.626074412757335], [31.416195350870588, 16.10631686087059, 15.62607747087059], [31.416198292518352, 16.106319802518353, 15.626080412518354], [31.416201115950322, 16.106322625950323, 15.626083235950324], [31.41620381948683, 16.106325329486832, 15.626085939486833], [31.41620640151983, 16.10632791151983, 15.626088521519831], [31.41620886051378, 16.10633037051378, 15.626090980513782], [31.41621119500657, 16.106332705006572, 15.626093315006573], [31.4162134036103, 16.1063349136103, 15.626095523610301], [31.416215485012128, 16.10633699501213, 15.626097605012129], [31.41621743797497, 16.106338947974972, 15.626099557974973], [31.41621926133824, 16.106340771338242, 15.626101381338243], [31.416220954018495, 16.106342464018496, 15.626103074018497], [31.416222515010052, 16.106344025010053, 15.626104635010053], [31.416223943385567, 16.10634545338557, 15.626106063385569], [31.416225238296565, 16.106346748296566, 15.626107358296567], [31.416226398973908, 16.10634790897391, 15.62610851897391], [31.416227424728245, 16.106348934728246, 15.626109544728246], [31.41622831495041, 16.10634982495041, 15.62611043495041], [31.416229069111736, 16.106350579111737, 15.626111189111738], [31.416229686764407, 16.106351196764408, 15.626111806764408], [31.416230167541652, 16.106351677541653, 15.626112287541654], [31.41623051115803, 16.10635202115803, 15.626112631158032], [31.41623071740949, 16.10635222740949, 15.626112837409492], [31.41623078617359, 16.10635229617359, 15.62611290617359]], "Cn_r": [[-1.8669051954422868], [-1.8669051879665644], [-1.866905165543964], [-1.8669051281881814], [-1.8669050759220363], [-1.8669050087774544], [-1.8669049267954465], [-1.8669048300260869], [-1.8669047185284764], [-1.8669045923707086], [-1.8669044516298245], [-1.8669042963917646], [-1.866904126751312], [-1.8669039428120366], [-1.866903744686225], [-1.866903532494812], [-1.8669033063673033], [-1.8669030664416906], [-1.8669028128643694], [-1.866902545790042], [-1.8669022653816219], [-1.8669019718101278], [-1.8669016652545805], [-1.8669013459018848], [-1.866901013946714], [-1.866900669591386], [-1.866900313045736], [-1.8668999445269852], [-1.8668995642596034], [-1.8668991724751667], [-1.8668987694122134], [-1.866898355316094], [-1.8668979304388158], [-1.8668974950388861], [-1.8668970493811505], [-1.8668965937366264], [-1.8668961283823338], [-1.8668956536011225], [-1.8668951696814946], [-1.866894676917426], [-1.8668941756081823], [-1.8668936660581337], [-1.8668931485765647], [-1.8668926234774825], [-1.8668920910794233], [-1.8668915517052533], [-1.8668910056819696], [-1.8668904533405], [-1.8668898950154962], [-1.8668893310451287], [-1.8668887617708783], [-1.8668881875373275], [-1.8668876086919466], [-1.8668870255848824], [-1.8668864385687443], [-1.8668858479983848], [-1.8668852542306882], [-1.8668846576243492], [-1.8668840585396556], [-1.8668834573382687], [-1.8668828543830036], [-1.8668822500376092], [-1.8668816446665486], [-1.866881038634777], [-1.8668804323075225], [-1.8668798260500643], [-1.8668792202275148], [-1.8668786152045977], [-1.8668780113454289], [-1.8668774090133005], [-1.8668768085704601], [-1.866876210377896], [-1.86687561479512], [-1.8668750221799542], [-1.866874432888316], [-1.8668738472740094], [-1.8668732656885108], [-1.8668726884807638], [-1.8668721159969692], [-1.8668715485803833], [-1.866870986571112], [-1.8668704303059123], [-1.866869880117993], [-1.8668693363368178], [-1.8668687992879116], [-1.866868269292671], [-1.8668677466681742], [-1.8668672317269945], [-1.86686672477702], [-1.866866226121272], [-1.866865736057727], [-1.8668652548791453], [-1.8668647828728997], [-1.8668643203208066], [-1.866863867498966], [-1.8668634246775972], [-1.8668629921208846], [-1.8668625700868242], [-1.8668621588270735], [-1.8668617585868077], [-1.8668613696045764], [-1.8668609921121668], [-1.8668606263344707], [-1.866860272489354], [-1.8668599307875318], [-1.8668596014324468], [-1.8668592846201533], [-1.8668589805392046], [-1.866858689370544], [-1.866858411287403], [-1.866858146455199], [-1.8668578950314434], [-1.8668576571656517], [-1.8668574329992542], [-1.8668572226655211], [-1.866857026289482], [-1.8668568439878548], [-1.8668566758689826], [-1.866856522032768], [-1.8668563825706184], [-1.8668562575653926], [-1.8668561470913556], [-1.866856051214135], [-1.8668559699906822], [-1.8668559034692433], [-1.8668558516893294], [-1.866855814681694], [-1.8668557924683178], [-1.8668557850623926]], "Cl_p": [[-0.4375012191373282], [-0.43750121581202794], [-0.43750120583815877], [-0.4375011892218153], [-0.4375011659731502], [-0.43750113610636837], [-0.437501099639718], [-0.43750105659547844], [-0.43750100699994643], [-0.43750095088341945], [-0.4375008882801756], [-0.4375008192284528], [-0.4375007437704243], [-0.43750066195217124], [-0.4375005738236541], [-0.43750047943868037], [-0.43750037885487103], [-0.43750027213362314], [-0.43750015934007186], [-0.43750004054304825], [-0.43749991581503633], [-0.4374997852321267], [-0.43749964887396875], [-0.4374995068237199], [-0.4374993591679936], [-0.43749920599680375], [-0.43749904740350876], [-0.43749888348475235], [-0.4374987143404022], [-0.4374985400734877], [-0.4374983607901348], [-0.43749817659949947], [-0.4374979876136988], [-0.43749779394774096], [-0.4374975957194529], [-0.4374973930494067], [-0.43749718606084415], [-0.4374969748795993], [-0.43749675963402046], [-0.4374965404548897], [-0.43749631747534157], [-0.4374960908307802], [-0.4374958606587951], [-0.43749562709907547], [-0.437495390293324], [-0.4374951503851686], [-0.43749490752007403], [-0.43749466184525143], [-0.43749441350956786], [-0.43749416266345403], [-0.4374939094588124], [-0.4374936540489231], [-0.4374933965883503], [-0.43749313723284644], [-0.43749287613925825], [-0.43749261346542934], [-0.43749234937010506], [-0.43749208401283457], [-0.4374918175538742], [-0.4374915501540898], [-0.4374912819748589], [-0.4374910131779732], [-0.4374907439255395], [-0.43749047437988275], [-0.4374902047034476], [-0.43748993505870015], [-0.43748966560803004], [-0.4374893965136528], [-0.4374891279375126], [-0.437488860041185], [-0.4374885929857797], [-0.43748832693184475], [-0.4374880620392703], [-0.43748779846719327], [-0.4374875363739022], [-0.43748727591674363], [-0.43748701725202854], [-0.4374867605349389], [-0.4374865059194366], [-0.4374862535581718], [-0.43748600360239315], [-0.4374857562018577], [-0.4374855115047438], [-0.4374852696575631], [-0.4374850308050743], [-0.43748479509019933], [-0.4374845626539377], [-0.4374843336352859], [-0.4374841081711547], [-0.43748388639628977], [-0.4374836684431929], [-0.4374834544420454], [-0.43748324452063114], [-0.4374830388042632], [-0.43748283741571153], [-0.4374826404751299], [-0.4374824480999887], [-0.4374822604050051], [-0.4374820775020774], [-0.4374818995002207], [-0.4374817265055035], [-0.43748155862098703], [-0.43748139594666574], [-0.4374812385794091], [-0.4374810866129075], [-0.4374809401376167], [-0.4374807992407073], [-0.43748066400601365], [-0.43748053451398716], [-0.43748041084164885], [-0.43748029306254627], [-0.43748018124671095], [-0.4374800754606188], [-0.4374799757671517], [-0.4374798822255623], [-0.43747979489143923], [-0.4374797138166765], [-0.43747963904944326], [-0.4374795706341567], [-0.43747950861145646], [-0.4374794530181819], [-0.43747940388735096], [-0.43747936124814135], [-0.4374793251258739], [-0.4374792955419985], [-0.4374792725140816], [-0.4374792560557963], [-0.43747924617691475], [-0.4374792428833024]], "Cl_beta": [[-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0]], "Cy_beta": 0, "Cm_q": [[33.77723536725203], [33.77723511052258], [33.77723434049107], [33.77723305762803], [33.777231262717294], [33.77722895685556], [33.77722614145167], [33.77722281822571], [33.77721898920791], [33.77721465673738], [33.77720982346055], [33.77720449232959], [33.777198666600476], [33.777192349830905], [33.77718554587805], [33.777178258896136], [33.77717049333377], [33.77716225393111], [33.777153545716914], [33.77714437400526], [33.77713474439229], [33.777124662752556], [33.77711413523539], [33.77710316826095], [33.77709176851621], [33.77707994295069], [33.77706769877212], [33.777055043441855], [33.77704198467019], [33.77702853041148], [33.77701468885918], [33.77700046844065], [33.776985877811896], [33.77697092585209], [33.77695562165807], [33.776939974538585], [33.77692399400849], [33.77690768978282], [33.77689107177066], [33.77687415006904], [33.776856934956605], [33.77683943688721], [33.77682166648343], [33.77680363452997], [33.77678535196697], [33.776766829883194], [33.77674807950925], [33.776729112210546], [33.77670993948035], [33.776690572932644], [33.77667102429506], [33.776651305401565], [33.77663142818526], [33.77661140467101], [33.77659124696814], [33.776570967262955], [33.776550577811356], [33.776530090931345], [33.77650951899548], [33.7764888744234], [33.77646816967424], [33.77644741723908], [33.77642662963341], [33.77640581938949], [33.77638499904883], [33.77636418115461], [33.77634337824411], [33.776322602841155], [33.77630186744866], [33.77628118454101], [33.77626056655668], [33.77624002589076], [33.776219574887556], [33.77619922583322], [33.77617899094838], [33.776158882381], [33.776138912199016], [33.776119092383254], [33.77609943482032], [33.77607995129555], [33.776060653486084], [33.7760415529539], [33.776022661139095], [33.77600398935308], [33.775985548771935], [33.77596735042994], [33.775949405212934], [33.77593172385214], [33.775914316917714], [33.77589719481273], [33.77588036776693], [33.775863845830955], [33.77584763887036], [33.77583175655993], [33.77581620837809], [33.77580100360131], [33.775786151298874], [33.77577166032751], [33.77575753932631], [33.77574379671178], [33.77573044067293], [33.77571747916659], [33.77570491991281], [33.77569277039041], [33.77568103783271], [33.77566972922337], [33.775658851292384], [33.775648410512154], [33.77563841309394], [33.775628864984135], [33.775619771860974], [33.77561113913123], [33.77560297192717], [33.77559527510358], [33.77558805323507], [33.77558131061332], [33.775575051244836], [33.7755692788485], [33.77556399685354], [33.775559208397524], [33.775554916324644], [33.77555112318403], [33.77554783122836], [33.77554504241253], [33.775542758392554], [33.77554098052466], [33.77553970986448], [33.775538947166474], [33.77553869288348]], "Cm_alpha_dot": [[-55.04071405175028], [-55.0407134838465], [-55.04071178048217], [-55.040708942698046], [-55.04070497222804], [-55.04069987149806], [-55.04069364362448], [-55.04068629241217], [-55.04067782235206], [-55.040668238618316], [-55.040657547064946], [-55.04064575422216], [-55.04063286729232], [-55.04061889414507], [-55.040603843312645], [-55.040587723984295], [-55.040570546000446], [-55.04055231984645], [-55.04053305664606], [-55.04051276815423], [-55.04049146674972], [-55.040469165427275], [-55.04044587778936], [-55.04042161803763], [-55.040396400963836], [-55.0403702419406], [-55.04034315691163], [-55.040315162381766], [-55.040286275406366], [-55.040256513580864], [-55.04022589502942], [-55.040194438393755], [-55.04016216282124], [-55.04012908795302], [-55.04009523391166], [-55.04006062128852], [-55.040025271130936], [-55.03998920492895], [-55.03995244460198], [-55.03991501248512], [-55.03987693131523], [-55.03983822421682], [-55.03979891468755], [-55.03975902658375], [-55.03971858410563], [-55.039677611782196], [-55.03963613445613], [-55.03959417726844], [-55.03955176564293], [-55.0395089252705], [-55.039465682093294], [-55.039422062288885], [-55.03937809225408], [-55.03933379858872], [-55.03928920807942], [-55.03924434768321], [-55.039199244511], [-55.03915392581112], [-55.03910841895261], [-55.039062751408636], [-55.03901695073983], [-55.038971044577465], [-55.03892506060677], [-55.03887902655019], [-55.03883297015063], [-55.038786919154646], [-55.03874090129582], [-55.03869494427799], [-55.03864907575869], [-55.03860332333247], [-55.03855771451439], [-55.03851227672357], [-55.038467037266855], [-55.03842202332233], [-55.03837726192337], [-55.038332779942436], [-55.03828860407508], [-55.038244760824114], [-55.03820127648401], [-55.0381581771252], [-55.03811548857877], [-55.038073236421134], [-55.03803144595903], [-55.03799014221462], [-55.03794934991066], [-55.037909093456264], [-55.03786939693222], [-55.03783028407723], [-55.037791778273814], [-55.03775390253475], [-55.037716679489584], [-55.03768013137152], [-55.03764428000447], [-55.03760914679021], [-55.03757475269628], [-55.03754111824344], [-55.0375082634941], [-55.037476208040516], [-55.037444970993555], [-55.03741457097161], [-55.03738502608988], [-55.03735635394995], [-55.03732857162963], [-55.037301695673136], [-55.037275742081555], [-55.0372507263037], [-55.03722666322728], [-55.037203567170195], [-55.037181451872605], [-55.03716033048878], [-55.037140215579775], [-55.03712111910621], [-55.03710305242135], [-55.037086026264745], [-55.03707005075602], [-55.037055135389124], [-55.03704128902695], [-55.037028519896225], [-55.0370168355829], [-55.03700624302779], [-55.03699674852264], [-55.03698835770651], [-55.03698107556271], [-55.036974906415644], [-55.03696985392879], [-55.036965921102265], [-55.03696311027132], [-55.0369614231049], [-55.036960860604765]], "Cz_alpha": [[-4.55487441913143], [-4.554873835328305], [-4.554872084291675], [-4.554869167139545], [-4.5548650857342645], [-4.554859842681258], [-4.554853441326976], [-4.554845885756531], [-4.55483718079054], [-4.554827331981691], [-4.554816345610513], [-4.554804228680813], [-4.554790988914452], [-4.554776634745695], [-4.554761175314937], [-4.55474462046203], [-4.554726980719021], [-4.554708267302432], [-4.554688492105058], [-4.554667667687247], [-4.554645807267757], [-4.5546229247141286], [-4.5545990345325675], [-4.554574151857516], [-4.554548292440598], [-4.554521472639326], [-4.554493709405326], [-4.554465020272124], [-4.55443542334266], [-4.554404937276289], [-4.554373581275606], [-4.554341375072728], [-4.55430833891541], [-4.554274493552719], [-4.554239860220526], [-4.554204460626592], [-4.554168316935447], [-4.5541314517530065], [-4.55409388811091], [-4.5540556494506355], [-4.5540167596074115], [-4.553977242793933], [-4.5539371235838555], [-4.553896426895114], [-4.553855177973155], [-4.5538134023739], [-4.553771125946697], [-4.553728374817098], [-4.553685175369494], [-4.553641554229776], [-4.5535975382478195], [-4.553553154479937], [-4.553508430171326], [-4.553463392738387], [-4.553418069751177], [-4.553372488915674], [-4.553326678056192], [-4.553280665097766], [-4.553234478048533], [-4.553188144982216], [-4.553141694020632], [-4.55309515331628], [-4.5530485510349985], [-4.553001915338725], [-4.552955274368345], [-4.552908656226667], [-4.5528620889615175], [-4.552815600548931], [-4.552769218876582], [-4.552722971727217], [-4.5526768867624], [-4.552630991506329], [-4.55258531332985], [-4.55253987943469], [-4.55249471683783], [-4.552449852356135], [-4.552405312591138], [-4.552361123914068], [-4.552317312451114], [-4.552273904068856], [-4.55223092436], [-4.552188398629294], [-4.552146351879721], [-4.552104808798922], [-4.552063793745878], [-4.5520233307378435], [-4.551983443437553], [-4.551944155140672], [-4.551905488763515], [-4.551867466831064], [-4.551830111465238], [-4.551793444373417], [-4.551757486837292], [-4.551722259701963], [-4.551687783365317], [-4.551654077767718], [-4.551621162381964], [-4.551589056203513], [-4.5515577777410545], [-4.5515273450072975], [-4.551497775510107], [-4.551469086243908], [-4.551441293681375], [-4.551414413765447], [-4.551388461901589], [-4.5513634529503735], [-4.551339401220374], [-4.55131632046128], [-4.55129422385743], [-4.5512731240214945], [-4.551253032988557], [-4.551233962210446], [-4.551215922550366], [-4.551198924277829], [-4.55118297706385], [-4.551168089976486], [-4.55115427147662], [-4.551141529414048], [-4.551129871023888], [-4.55111930292321], [-4.5511098311080564], [-4.551101460950659], [-4.551094197196989], [-4.551088043964608], [-4.551083004740773], [-4.551079082380861], [-4.551076279107059], [-4.5510745965073784], [-4.551074035534899]], "Cy_phi": [[1.2165650014310005], [1.2165613249541376], [1.2165502978184968], [1.2165319269076436], [1.2165062236884492], [1.2164732042039694], [1.2164328890616367], [1.2163853034198429], [1.2163304769698196], [1.216268443916119], [1.216199242952368], [1.216122917235195], [1.21603951435433], [1.2159490863002904], [1.2158516894284013], [1.2157473844205806], [1.2156362362436552], [1.2155183141050558], [1.215393691405663], [1.2152624456897332], [1.215124658592148], [1.214980415783052], [1.2148298069093892], [1.2146729255347868], [1.2145098690754974], [1.214340738735156], [1.2141656394364349], [1.2139846797501535], [1.2137979718227847], [1.2136056313006651], [1.2134077772532843], [1.213204532093125], [1.21299602149448], [1.2127823743095216], [1.2125637224831713], [1.2123402009654198], [1.2121119476222353], [1.2118791031448517], [1.2116418109571272], [1.2114002171214695], [1.2111544702432788], [1.2109047213741606], [1.2106511239135216], [1.2103938335088469], [1.2101330079554176], [1.2098688070939672], [1.2096013927081957], [1.2093309284209366], [1.2090575795891727], [1.208781513199013], [1.2085028977593142], [1.2082219031947834], [1.2079387007388684], [1.2076534628255313], [1.2073663629814901], [1.2070775757171541], [1.2067872764180514], [1.2064956412358343], [1.2062028469789379], [1.2059090710035787], [1.2056144911045434], [1.205319285406217], [1.2050236322537107], [1.2047277101042377], [1.2044316974188036], [1.2041357725543562], [1.2038401136563326], [1.2035448985514783], [1.2032503046419132], [1.2029565087988263], [1.202663687257859], [1.2023720155146498], [1.202081668221231], [1.2017928190836367], [1.2015056407599791], [1.2012203047599213], [1.2009369813448583], [1.200655839429326], [1.2003770464836663], [1.2001007684374827], [1.1998271695847935], [1.1995564124900877], [1.1992886578959143], [1.1990240646316823], [1.1987627895240422], [1.1985049873084037], [1.1982508105423733], [1.1980004095202268], [1.1977539321891906], [1.197511524067352], [1.197273328163113], [1.1970394848960948], [1.196810132020082], [1.1965854045474675], [1.1963654346752852], [1.1961503517134189], [1.1959402820142273], [1.195735348904011], [1.1955356726166428], [1.195341370228551], [1.195152555596015], [1.1949693392940752], [1.1947918285575057], [1.1946201272237797], [1.194454335677696], [1.1942945507982332], [1.1941408659074062], [1.1939933707207324], [1.1938521513004174], [1.1937172900097315], [1.1935888654700182], [1.1934669525195327], [1.1933516221742837], [1.1932429415911299], [1.1931409740325878], [1.1930457788342295], [1.1929574113737051], [1.1928759230420583], [1.1928013612172683], [1.1927337692394855], [1.1926731863890028], [1.1926196478657252], [1.192573184771117], [1.192533824092237], [1.1925015886877888], [1.1924764972763637], [1.1924585644268422], [1.1924478005509649], [1.1924442118978438]], "Cl_r": [[0.30414125035775014], [0.3041403312385344], [0.3041375744546242], [0.3041329817269109], [0.3041265559221123], [0.30411830105099236], [0.3041082222654092], [0.3040963258549607], [0.3040826192424549], [0.3040671109790298], [0.304049810738092], [0.30403072930879876], [0.3040098785885825], [0.3039872715750726], [0.3039629223571003], [0.30393684610514515], [0.3039090590609138], [0.30387957852626396], [0.3038484228514157], [0.3038156114224333], [0.303781164648037], [0.303745103945763], [0.3037074517273473], [0.3036682313836967], [0.30362746726887435], [0.303585184683789], [0.3035414098591087], [0.30349616993753836], [0.3034494929556962], [0.3034014078251663], [0.3033519443133211], [0.30330113302328127], [0.30324900537362], [0.3031955935773804], [0.30314093062079284], [0.30308505024135496], [0.3030279869055588], [0.3029697757862129], [0.3029104527392818], [0.3028500542803674], [0.3027886175608197], [0.30272618034354015], [0.3026627809783804], [0.3025984583772117], [0.3025332519888544], [0.3024672017734918], [0.3024003481770489], [0.30233273210523415], [0.3022643948972932], [0.30219537829975324], [0.30212572443982855], [0.30205547579869585], [0.3019846751847171], [0.30191336570638283], [0.30184159074537253], [0.30176939392928853], [0.30169681910451285], [0.3016239103089586], [0.30155071174473447], [0.3014772677508947], [0.30140362277613586], [0.30132982135155423], [0.30125590806342767], [0.30118192752605943], [0.3011079243547009], [0.30103394313858906], [0.30096002841408315], [0.30088622463786957], [0.3008125761604783], [0.3007391271997066], [0.3006659218144648], [0.30059300387866245], [0.30052041705530774], [0.30044820477090917], [0.3003764101899948], [0.3003050761899803], [0.30023424533621457], [0.3001639598573315], [0.30009426162091657], [0.3000251921093707], [0.2999567923961984], [0.2998891031225219], [0.2998221644739786], [0.2997560161579206], [0.29969069738101056], [0.29962624682710093], [0.2995627026355933], [0.2995001023800567], [0.29943848304729764], [0.299377881016838], [0.29931833204077823], [0.2992598712240237], [0.2992025330050205], [0.2991463511368669], [0.2990913586688213], [0.2990375879283547], [0.2989850705035568], [0.29893383722600275], [0.2988839181541607], [0.29883534255713773], [0.29878813889900374], [0.2987423348235188], [0.2986979571393764], [0.29865503180594494], [0.298613583919424], [0.2985736376995583], [0.29853521647685155], [0.2984983426801831], [0.29846303782510436], [0.29842932250243287], [0.29839721636750455], [0.2983667381298832], [0.2983379055435709], [0.29831073539778247], [0.29828524350814695], [0.29826144470855737], [0.2982393528434263], [0.29821898076051456], [0.2982003403043171], [0.29818344230987137], [0.2981682965972507], [0.2981549119664313], [0.29814329619277924], [0.29813345602305924], [0.2981253971719472], [0.29811912431909093], [0.29811464110671054], [0.2981119501377412], [0.29811105297446094]]}, "dynamic": {"dutchRollFreqHz": [[0.578041553067613], [0.5780423758674984], [0.5780448437749975], [0.5780489553139293], [0.5780547080249517], [0.5780620984670016], [0.5780711222193099], [0.5780817738839886], [0.5780940470891933], [0.5781079344928525], [0.57812342778697], [0.5781405177024894], [0.5781591940147247], [0.5781794455493527], [0.5782012601889608], [0.5782246248801504], [0.5782495256411903], [0.5782759475702158], [0.5783038748539713], [0.5783332907770888], [0.5783641777318987], [0.5783965172287675], [0.5784302899069571], [0.5784654755459991], [0.5785020530775797], [0.5785400005979255], [0.5785792953806852], [0.5786199138903048], [0.5786618317958777], [0.5787050239854754], [0.5787494645809398], [0.578795126953138], [0.5788419837376624], [0.5788900068509766], [0.5789391675069903], [0.5789894362340602], [0.5790407828924009], [0.5790931766919043], [0.5791465862103498], [0.579200979412], [0.5792563236665702], [0.5793125857685605], [0.5793697319569393], [0.5794277279351691], [0.5794865388915613], [0.5795461295199494], [0.5796064640406686], [0.57966750622183], [0.5797292194008764], [0.5797915665064094], [0.5798545100802733], [0.5799180122998837], [0.5799820350007879], [0.580046539699445], [0.5801114876162105], [0.5801768396985134], [0.5802425566442135], [0.5803085989251212], [0.5803749268106705], [0.5804415003917293], [0.5805082796045309], [0.5805752242547184], [0.5806422940414797], [0.5807094485817664], [0.580776647434577], [0.5808438501252916], [0.580911016170045], [0.5809781051001204], [0.581045076486351], [0.5811118899635157], [0.5811785052547115], [0.581244882195688], [0.5813109807591355], [0.581376761078897], [0.5814421834741101], [0.5815072084732442], [0.5815717968380303], [0.581635909587265], [0.581699508020473], [0.5817625537414147], [0.5818250086814241], [0.581886835122563], [0.5819479957205745], [0.5820084535276256], [0.5820681720148192], [0.5821271150944672], [0.5821852471421074], [0.582242533018247], [0.5822989380898291], [0.582354428251396], [0.5824089699459449], [0.5824625301854586], [0.5825150765710991], [0.5825665773130532], [0.582617001250011], [0.5826663178682743], [0.5827144973204716], [0.5827615104438792], [0.5828073287783264], [0.5828519245836792], [0.5828952708568902], [0.5829373413486004], [0.5829781105792878], [0.583017553854946], [0.5830556472822882], [0.5830923677834609], [0.5831276931102638], [0.5831616018578631], [0.5831940734779877], [0.5832250882916031], [0.583254627501052], [0.5832826732016578], [0.5833092083927758], [0.5833342169882915], [0.5833576838265586], [0.5833795946797642], [0.5833999362627227], [0.5834186962410871], [0.5834358632389749], [0.5834514268460023], [0.5834653776237232], [0.5834777071114666], [0.5834884078315732], [0.583497473294018], [0.583504898000431], [0.5835106774474969], [0.5835148081297425], [0.5835172875417082], [0.5835181141794976]], "dutchRollDamping": [[0.9270692319843195], [0.9270707324184934], [0.9270752328255567], [0.9270827305196595], [0.9270932210261116], [0.927106698083983], [0.9271231536497323], [0.927142577901873], [0.9271649592466723], [0.9271902843248772], [0.9272185380194664], [0.9272497034644266], [0.9272837620545397], [0.9273206934561908], [0.9273604756191766], [0.9274030847895147], [0.9274484955232517], [0.9274966807012514], [0.9275476115449673], [0.9276012576331858], [0.9276575869197283], [0.9277165657521113], [0.9277781588911456], [0.9278423295314742], [0.9279090393230259], [0.9279782483933883], [0.9280499153710741], [0.9281239974096782], [0.9282004502129089], [0.9282792280604808], [0.9283602838348568], [0.9284435690488205], [0.9285290338738709], [0.928616627169421], [0.9287062965127829], [0.9287979882299249], [0.9288916474269882], [0.928987218022537], [0.9290846427805325], [0.929183863344011], [0.9292848202694456], [0.9293874530617728], [0.9294917002100703], [0.9295974992238557], [0.9297047866699982], [0.9298134982102155], [0.9299235686391317], [0.9300349319228882], [0.9301475212382708], [0.9302612690123421], [0.930376106962547], [0.9304919661372811], [0.930608776956887], [0.9307264692550603], [0.930844972320644], [0.9309642149397809], [0.9310841254384066], [0.9312046317250529], [0.9313256613339409], [0.9314471414683327], [0.9315689990441272], [0.9316911607336602], [0.9318135530096952], [0.9319361021895712], [0.9320587344794867], [0.9321813760188865], [0.9323039529249335], [0.9324263913370304], [0.9325486174613702], [0.9326705576154886], [0.9327921382727823], [0.932913286106981], [0.9330339280365324], [0.9331539912688821], [0.933273403344612], [0.9333920921814222], [0.9335099861179169], [0.9336270139571745], [0.9337431050100705], [0.9338581891383335], [0.9339721967972935], [0.9340850590783114], [0.9341967077508503], [0.9343070753041693], [0.9344160949886114], [0.9345237008564548], [0.9346298278023104], [0.9347344116030311], [0.9348373889571089], [0.9349386975235415], [0.9350382759601316], [0.9351360639612052], [0.9352320022947137], [0.9353260328387053], [0.9354180986171379], [0.9355081438350038], [0.9355961139127594], [0.9356819555200139], [0.9357656166084793], [0.9358470464441402], [0.935926195638634], [0.9360030161798163], [0.9360774614614876], [0.9361494863122735], [0.9362190470236206], [0.9362861013769079], [0.9363506086696431], [0.9364125297407309], [0.9364718269947964], [0.936528464425545], [0.9365824076381475], [0.9366336238706259], [0.9366820820142404], [0.9367277526328465], [0.9367706079812228], [0.9368106220223513], [0.9368477704436353], [0.9368820306720514], [0.9369133818882213], [0.9369418050393878], [0.9369672828513019], [0.936989799838993], [0.937009342316433], [0.9370258984050731], [0.9370394580412595], [0.9370500129825123], [0.9370575568126718], [0.9370620849459034], [0.9370635946295599]], "rollSubsistenceTimeConstant": [[-3.981454657200725], [-3.981442560370586], [-3.981406277438381], [-3.9813458310734693], [-3.981261259040755], [-3.9811526141745888], [-3.981019964342307], [-3.980863392397412], [-3.980682996122419], [-3.980478888161452], [-3.9802511959426314], [-3.9800000615903235], [-3.9797256418273568], [-3.9794281078672418], [-3.9791076452965632], [-3.978764453947597], [-3.97839874776128], [-3.978010754640688], [-3.9776007162950977], [-3.977168888074821], [-3.9767155387969506], [-3.9762409505621408], [-3.975745418562647], [-3.975229250881726], [-3.97469276828462], [-3.974136304001307], [-3.973560203501186], [-3.9729648242598916], [-3.9723505355184985], [-3.9717177180352214], [-3.971066763829926], [-3.970398075921604], [-3.969712068059073], [-3.9690091644450907], [-3.9682897994541584], [-3.9675544173442145], [-3.9668034719624794], [-3.9660374264456726], [-3.965256752914885], [-3.964461932165299], [-3.9636534533510552], [-3.9628318136654888], [-3.961997518017012], [-3.9611510787008752], [-3.960293015067073], [-3.9594238531846475], [-3.9585441255026668], [-3.957654370508096], [-3.956755132380865], [-3.955846960646341], [-3.954930409825513], [-3.9540060390830964], [-3.953074411873849], [-3.9521360955873304], [-3.951191661191358], [-3.9502416828744202], [-3.949286737687269], [-3.9483274051839827], [-3.947364267062683], [-3.9463979068061903], [-3.945428909322842], [-3.9444578605876766], [-3.94348534728429], [-3.942511956447488], [-3.941538275107042], [-3.9405648899327317], [-3.939592386880892], [-3.9386213508426806], [-3.9376523652942668], [-3.9366860119491425], [-3.935722870412791], [-3.9347635178398352], [-3.9338085285939175], [-3.9328584739104904], [-3.931913921562655], [-3.9309754355302684], [-3.9300435756724656], [-3.9291188974037894], [-3.928201951374054], [-3.927293283152117], [-3.9263934329137307], [-3.9255029351335784], [-3.924622318281684], [-3.923752104524289], [-3.92289280942937], [-3.9220449416768965], [-3.9212090027739697], [-3.920385486774949], [-3.9195748800066976], [-3.9187776607990434], [-3.9179942992205574], [-3.917225256819773], [-3.9164709863719356], [-3.9157319316313512], [-3.91500852708945], [-3.9143011977386686], [-3.9136103588421616], [-3.9129364157095194], [-3.9122797634784616], [-3.9116407869026695], [-3.911019860145757], [-3.9104173465814798], [-3.909833598600234], [-3.90926895742189], [-3.9087237529150363], [-3.9081983034226675], [-3.9076929155943696], [-3.907207884225046], [-3.906743492100229], [-3.9063000098480227], [-3.905877695797698], [-3.905476795844991], [-3.9050975433241217], [-3.904740158886586], [-3.9044048503867215], [-3.9040918127740887], [-3.903801227992705], [-3.9035332648871135], [-3.90328807911535], [-3.903065813068803], [-3.9028665957989825], [-3.9026905429512286], [-3.9025377567053527], [-3.9024083257232522], [-3.9023023251034643], [-3.9022198163427126], [-3.9021608473044385], [-3.9021254521943094], [-3.9021136515427224]], "spiralSubsistenceTimeConstant": [[9.328413185080104], [9.32844068478876], [9.328523167757163], [9.328660585516758], [9.328852857323112], [9.329099870187877], [9.329401478951906], [9.329757506352454], [9.330167743131991], [9.330631948138247], [9.33114984846682], [9.331721139601996], [9.332345485586977], [9.333022519201966], [9.33375184216992], [9.33453302536833], [9.335365609066402], [9.336249103175197], [9.337182987514678], [9.3381667120993], [9.33919969743912], [9.340281334855778], [9.341410986821831], [9.342587987301547], [9.343811642129241], [9.345081229383354], [9.346395999786589], [9.347755177124192], [9.34915795866678], [9.350603515624412], [9.352090993596338], [9.353619513056001], [9.355188169834921], [9.356796035632714], [9.358442158530464], [9.360125563528966], [9.361845253095229], [9.363600207721369], [9.365389386501565], [9.367211727720257], [9.369066149453316], [9.370951550179159], [9.372866809406673], [9.374810788316315], [9.376782330403431], [9.378780262148016], [9.380803393682077], [9.382850519474092], [9.38492041902847], [9.387011857583538], [9.3891235868295], [9.391254345633962], [9.393402860771344], [9.39556784767087], [9.397748011159402], [9.39994204622741], [9.40214863879091], [9.404366466464317], [9.406594199343772], [9.408830500790968], [9.41107402822666], [9.413323433927593], [9.41557736582959], [9.41783446833519], [9.420093383125277], [9.422352749973083], [9.424611207562048], [9.426867394310023], [9.429119949185074], [9.431367512538586], [9.433608726924028], [9.435842237925534], [9.438066694985976], [9.44028075222925], [9.442483069288741], [9.444672312127727], [9.446847153862805], [9.449006275582459], [9.45114836716056], [9.453272128072317], [9.455376268198647], [9.457459508631521], [9.459520582470724], [9.461558235616952], [9.463571227555736], [9.46555833213923], [9.467518338353369], [9.469450051084781], [9.471352291874881], [9.47322389966422], [9.475063731528294], [9.476870663406338], [9.478643590813725], [9.480381429546307], [9.482083116375488], [9.483747609724348], [9.485373890336946], [9.48696096193389], [9.488507851848869], [9.490013611659018], [9.49147731779357], [9.492898072131942], [9.494275002583738], [9.49560726365176], [9.496894036983203], [9.498134531899595], [9.499327985909218], [9.500473665207759], [9.501570865149661], [9.502618910714073], [9.503617156942449], [9.50456498936031], [9.505461824380243], [9.506307109682037], [9.507100324578355], [9.50784098035181], [9.508528620578764], [9.50916282142891], [9.509743191941649], [9.510269374287619], [9.510741043998634], [9.511157910185615], [9.511519715728827], [9.511826237446572], [9.512077286243326], [9.512272707234487], [9.512412379848213], [9.512496217904086], [9.512524169672231]], "shortPeriodFreqHz": [[2.6933449908045324], [2.6933488993340684], [2.693360622582111], [2.693380153528362], [2.693407480476899], [2.693442587063066], [2.6934854522630984], [2.693536050406478], [2.693594351191046], [2.6936603197008213], [2.693733916426544], [2.693815097288921], [2.6939038136645683], [2.69400001241463], [2.6941036359160555], [2.694214622095528], [2.6943329044660196], [2.6944584121659476], [2.694591070000925], [2.6947307984880684], [2.6948775139028474], [2.695031128328444], [2.6951915497075984], [2.6953586818969146], [2.6955324247235923], [2.695712674044552], [2.695899321807924], [2.6960922561168754], [2.696291361295715], [2.6964965179582694], [2.6967076030784756], [2.6969244900631457], [2.6971470488268774], [2.697375145869068], [2.697608644352967], [2.6978474041867537], [2.6980912821065703], [2.698340131761481], [2.698593803800288], [2.69885214596018], [2.6991150031571487], [2.699382217578124], [2.69965362877477], [2.699929073758906], [2.7002083870994693], [2.700491401021011], [2.700777945503597], [2.701067848384143], [2.7013609354590375], [2.701657030588078], [2.701955955799583], [2.7022575313966786], [2.7025615760646646], [2.7028679069794057], [2.7031763399166877], [2.7034866893624754], [2.7037987686240004], [2.7041123899416184], [2.7044273646013712], [2.704743503048186], [2.7050606149996383], [2.7053785095602225], [2.705696995336055], [2.7060158805499377], [2.706334973156728], [2.706654080958925], [2.7069730117224196], [2.7072915732923355], [2.707609573708876], [2.707926821323141], [2.7082431249127965], [2.7085582937975685], [2.7088721379544762], [2.709184468132714], [2.7094950959681503], [2.709803834097346], [2.7101104962710223], [2.7104148974669284], [2.7107168540020115], [2.7110161836438484], [2.7113127057212507], [2.7116062412339725], [2.7118966129614726], [2.7121836455706414], [2.712467165722443], [2.7127470021773856], [2.713022985899778], [2.713294950160688], [2.7135627306395445], [2.7138261655243237], [2.714085095610247], [2.7143393643969365], [2.7145888181839584], [2.714833306164704], [2.7150726805185443], [2.7153067965011854], [2.7155355125331995], [2.715758690286632], [2.7159761947696817], [2.716187894409339], [2.71639366113199], [2.7165933704418825], [2.7167869014974437], [2.7169741371853746], [2.7171549641924813], [2.717329273075207], [2.7174969583268003], [2.7176579184420895], [2.717812055979827], [2.7179592776225374], [2.7180994942338628], [2.718232620913347], [2.718358577048629], [2.71847728636501], [2.718588676972368], [2.718692681409381], [2.7187892366850317], [2.718878284317379], [2.7189597703695467], [2.7190336454829307], [2.719099864907585], [2.7191583885297796], [2.719209180896706], [2.719252211238306], [2.719287453486228], [2.719314886289888], [2.71933449302962], [2.719346261826913], [2.719350185551733]], "shortPeriodDamp": [[0.176848335149427], [0.1768486069811391], [0.17684942231446], [0.17685078066403717], [0.17685268122125744], [0.17685512285471375], [0.17685810411085154], [0.17686162321480567], [0.1768656780714164], [0.17687026626643523], [0.17687538506790831], [0.1768810314277474], [0.17688720198348032], [0.17689389306018358], [0.1769011006725945], [0.17690882052740384], [0.17691704802572494], [0.17692577826574082], [0.17693500604552695], [0.17694472586604756], [0.17695493193432496], [0.17696561816678077], [0.1769767781927442], [0.17698840535813312], [0.1770004927292942], [0.1770130330970132], [0.1770260189806841], [0.1770394426326386], [0.1770532960426339], [0.1770675709424952], [0.17708225881091286], [0.1770973508783878], [0.1771128381323271], [0.17712871132228356], [0.17714496096534033], [0.1771615773516325], [0.17717855055000814], [0.17719587041382293], [0.1772135265868655], [0.17723150850941108], [0.17724980542439991], [0.17726840638373792], [0.17728730025471437], [0.17730647572653432], [0.17732592131696462], [0.1773456253790834], [0.1773655761081375], [0.1773857615484982], [0.17740616960071226], [0.177426788028649], [0.17744760446673172], [0.17746860642725687], [0.17748978130779217], [0.17751111639865028], [0.1775325988904373], [0.17755421588166553], [0.17757595438643212], [0.17759780134215628], [0.17761974361737], [0.17764176801955991], [0.1776638613030545], [0.177686010176952], [0.17770820131308418], [0.1777304213540127], [0.1777526569210512], [0.17777489462231003], [0.17779712106075837], [0.17781932284229754], [0.17784148658384424], [0.177863598921413], [0.1778856465182], [0.17790761607265665], [0.17792949432655247], [0.1779512680730207], [0.17797292416458096], [0.1779944495211358], [0.17801583113793415], [0.17803705609349774], [0.17805811155750656], [0.17807898479863477], [0.17809966319233692], [0.1781201342285754], [0.1781403855194864], [0.17816040480697948], [0.17818017997026353], [0.178199699033298], [0.17821895017216094], [0.1782379217223316], [0.1782566021858806], [0.1782749802385656], [0.17829304473682578], [0.1783107847246704], [0.17832818944045836], [0.17834524832356302], [0.17836195102091842], [0.17837828739344216], [0.1783942475223311], [0.17840982171522407], [0.17842500051223126], [0.17843977469181996], [0.1784541352765598], [0.17846807353871771], [0.17848158100570208], [0.17849464946535182], [0.17850727097106484], [0.17851943784676536], [0.17853114269170461], [0.17854237838509138], [0.17855313809055218], [0.17856341526041242], [0.17857320363980186], [0.1785824972705772], [0.17859129049506015], [0.17859957795958953], [0.17860735461788274], [0.17861461573420742], [0.17862135688635677], [0.17862757396843051], [0.17863326319341788], [0.17863842109557912], [0.17864304453262791], [0.17864713068770832], [0.17865067707116944], [0.1786536815221323], [0.17865614220985224], [0.17865805763487125], [0.17865942662996298], [0.17866024836086883], [0.17866052232682306]], "phugoidFreqHz": [[0.21998142939177204], [0.2199814315717236], [0.2199814381102654], [0.21998144900345945], [0.21998146424474496], [0.21998148382494276], [0.21998150773226002], [0.2199815359522979], [0.21998156846806036], [0.21998160525996385], [0.21998164630584965], [0.21998169158099665], [0.21998174105813675], [0.21998179470747112], [0.2199818524966879], [0.21998191439098178], [0.21998198035307528], [0.21998205034324073], [0.21998212431932437], [0.21998220223677176], [0.21998228404865458], [0.21998236970569893], [0.21998245915631498], [0.21998255234662772], [0.21998264922050997], [0.21998274971961587], [0.21998285378341573], [0.219982961349233], [0.2199830723522817], [0.21998318672570535], [0.2199833044006177], [0.2199834253061435], [0.21998354936946166], [0.21998367651584913], [0.21998380666872538], [0.21998393974969935], [0.21998407567861572], [0.21998421437360374], [0.21998435575112665], [0.21998449972603146], [0.21998464621160063], [0.21998479511960398], [0.2199849463603523], [0.21998509984275072], [0.21998525547435432], [0.21998541316142292], [0.2199855728089783], [0.21998573432086097], [0.2199858975997882], [0.2199860625474126], [0.21998622906438137], [0.21998639705039613], [0.2199865664042731], [0.21998673702400454], [0.21998690880681973], [0.21998708164924696], [0.21998725544717604], [0.2199874300959208], [0.21998760549028218], [0.21998778152461174], [0.219987958092875], [0.2199881350887156], [0.2199883124055192], [0.2199884899364779], [0.21998866757465405], [0.21998884521304543], [0.219989022744649], [0.21998920006252587], [0.21998937705986532], [0.21998955363004952], [0.21998972966671745], [0.21998990506382893], [0.21999007971572904], [0.219990253517211], [0.21999042636358013], [0.21999059815071678], [0.21999076877513873], [0.219990938134064], [0.21999110612547262], [0.21999127264816798], [0.21999143760183787], [0.2199916008871148], [0.21999176240563623], [0.21999192206010326], [0.21999207975433993], [0.2199922353933506], [0.21999238888337747], [0.21999254013195696], [0.2199926890479755], [0.21999283554172452], [0.2199929795249541], [0.21999312091092676], [0.21999325961446917], [0.21999339555202377], [0.21999352864169913], [0.219993658803319], [0.21999378595847113], [0.21999391003055396], [0.21999403094482337], [0.2199941486284371], [0.21999426301049907], [0.21999437402210206], [0.21999448159636908], [0.21999458566849378], [0.2199946861757794], [0.21999478305767695], [0.21999487625582093], [0.2199949657140652], [0.2199950513785168], [0.21999513319756764], [0.2199952111219268], [0.21999528510464908], [0.21999535510116425], [0.21999542106930314], [0.21999548296932367], [0.21999554076393435], [0.21999559441831704], [0.21999564390014772], [0.2199956891796161], [0.21999573022944371], [0.21999576702490017], [0.21999579954381793], [0.219995827766606], [0.21999585167626157], [0.21999587125838022], [0.2199958865011647], [0.21999589739543202], [0.21999590393461882], [0.21999590611478553]], "phugoidDamp": [[0.06542021392366569], [0.06542009192399846], [0.06541972600182501], [0.06541911638758478], [0.0654182634651473], [0.06541716777156445], [0.06541582999666566], [0.06541425098259376], [0.06541243172318259], [0.06541037336328265], [0.06540807719792754], [0.06540554467143506], [0.06540277737637827], [0.06539977705247246], [0.06539654558533742], [0.06539308500518196], [0.06538939748537019], [0.06538548534089782], [0.06538135102677065], [0.06537699713628371], [0.06537242639920898], [0.06536764167989327], [0.06536264597525204], [0.06535744241270466], [0.06535203424797847], [0.0653464248628708], [0.06534061776290606], [0.06533461657490815], [0.06532842504451719], [0.06532204703359692], [0.06531548651760931], [0.06530874758287568], [0.06530183442380225], [0.06529475134001472], [0.06528750273345288], [0.06528009310538078], [0.06527252705335092], [0.06526480926811438], [0.0652569445304683], [0.06524893770805684], [0.06524079375212409], [0.06523251769422715], [0.06522411464289744], [0.06521558978026067], [0.06520694835863874], [0.06519819569708717], [0.0651893371779285], [0.06518037824324471], [0.0651713243913338], [0.06516218117316729], [0.06515295418880673], [0.06514364908380536], [0.06513427154560665], [0.06512482729990884], [0.0651153221070481], [0.06510576175834333], [0.0650961520724598], [0.06508649889176311], [0.06507680807866587], [0.06506708551198914], [0.06505733708332183], [0.06504756869339122], [0.06503778624844202], [0.06502799565662692], [0.06501820282441315], [0.06500841365300722], [0.06499863403479826], [0.06498886984981413], [0.06497912696222333], [0.0649694112168294], [0.06495972843562467], [0.06495008441435425], [0.0649404849191127], [0.06493093568298434], [0.06492144240270355], [0.06491201073536511], [0.0649026462951624], [0.06489335465016972], [0.06488414131916985], [0.0648750117685116], [0.06486597140902738], [0.06485702559298334], [0.06484817961108384], [0.06483943868951962], [0.06483080798706999], [0.06482229259224666], [0.06481389752050305], [0.06480562771148046], [0.06479748802631628], [0.06478948324500831], [0.06478161806383165], [0.06477389709280582], [0.06476632485323049], [0.06475890577527232], [0.0647516441956052], [0.06474454435512343], [0.06473761039670237], [0.06473084636302089], [0.06472425619445471], [0.06471784372701549], [0.06471161269036538], [0.06470556670588541], [0.06469970928481042], [0.06469404382643003], [0.06468857361634298], [0.06468330182478405], [0.06467823150501552], [0.06467336559177093], [0.0646687068997857], [0.06466425812236615], [0.0646600218300431], [0.06465600046928296], [0.06465219636126363], [0.06464861170072059], [0.06464524855484846], [0.06464210886228375], [0.06463919443213864], [0.0646365069431074], [0.06463404794264241], [0.06463181884618328], [0.06462982093647163], [0.06462805536291293], [0.06462652314101504], [0.06462522515189259], [0.06462416214183357], [0.0646233347219343], [0.06462274336780137], [0.06462238841932147], [0.06462227008049058]]}}, "propulsion": {"throttle": [[0.08070910771705718], [0.08070851523110648], [0.08070673815982203], [0.0807037776598449], [0.08069963566165465], [0.08069431486306364], [0.08068781873010211], [0.08068015149306662], [0.08067131814394227], [0.08066132443159275], [0.08065017685790253], [0.08063788267253409], [0.08062444986690721], [0.0806098871683758], [0.0805942040330047], [0.08057741063856404], [0.0805595178761422], [0.08054053734206003], [0.08052048132862467], [0.08049936281463156], [0.08047719545535363], [0.08045399357204665], [0.08042977214087922], [0.08040454678134351], [0.08037833374446829], [0.08035114990037402], [0.08032301272530828], [0.08029394028864927], [0.0802639512391249], [0.08023306479065899], [0.0802013007082178], [0.08016867929286767], [0.08013522136681822], [0.08010094825780265], [0.08006588178366], [0.0800300442361207], [0.07999345836446263], [0.07995614735916208], [0.0799181348350414], [0.07987944481414819], [0.07984010170876184], [0.07980013030387688], [0.0797595557396646], [0.07971840349379998], [0.07967669936352846], [0.07963446944770129], [0.07959174012893099], [0.0795485380550406], [0.07950489012119155], [0.0794608234514039], [0.07941636538025847], [0.0793715434346488], [0.07932638531525606], [0.07928091887853234], [0.0792351721178968], [0.07918917314595716], [0.07914295017595216], [0.07909653150367099], [0.07904994548941884], [0.07900322053999377], [0.07895638509078981], [0.0789094675880715], [0.07886249647124594], [0.07881550015548747], [0.0787685070142149], [0.07872154536216187], [0.0786746434380405], [0.07862782938809278], [0.07858113124904846], [0.07853457693202788], [0.07848819420610209], [0.07844201068237401], [0.07839605379820845], [0.07835035080158649], [0.07830492873591795], [0.07825981442481716], [0.07821503445750944], [0.07817061517398978], [0.07812658265096684], [0.07808296268769961], [0.07803978079227376], [0.07799706216806974], [0.07795483170062524], [0.07791311394470823], [0.07787193311148079], [0.07783131305651739], [0.07779127726730134], [0.07775184885164182], [0.07771305052638854], [0.07767490460580442], [0.07763743299094958], [0.07760065715908132], [0.07756459815306138], [0.0775292765716846], [0.07749471255973134], [0.0774609257985265], [0.07742793549690977], [0.07739576038225458], [0.07736441869195756], [0.07733392816513493], [0.07730430603479357], [0.07727556901979744], [0.07724773331786527], [0.07722081459806998], [0.07719482799413468], [0.07716978809803814], [0.07714570895335562], [0.07712260404957233], [0.07710048631615085], [0.07707936811718497], [0.07705926124612841], [0.07704017692071534], [0.07702212577872168], [0.07700511787309472], [0.07698916266813856], [0.07697426903546462], [0.07696044525043856], [0.0769476989888396], [0.07693603732376132], [0.07692546672263491], [0.0769159930448855], [0.07690762153924922], [0.07690035684198084], [0.07689420297489052], [0.07688916334374504], [0.0768852407368644], [0.0768824373241843], [0.0768807546561309], [0.07688019366342469]], "battery_energy": [[0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0]], "battery_voltage": [[0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0]], "voltage_under_load": [[0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0]], "voltage_open_circuit": [[0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0]], "state_of_charge": [[0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0]], "thrust_breakdown": {}, "acoustic_outputs": {"fan": {"exit_static_temperature": [[289.992029896238], [289.9922374124739], [289.992859836193], [289.99389679250487], [289.99534765684274], [289.99721155533996], [289.99948736535544], [290.0021737161511], [290.0052689897154], [290.00877132173923], [290.0126786027373], [290.0169884793191], [290.02169835560596], [290.0268053947935], [290.03230652086046], [290.03819842042105], [290.04447754471937], [290.05114011176715], [290.0581821086202], [290.06559929379574], [290.07338719982613], [290.0815411359487], [290.09005619093085], [290.0989272360271], [290.1081489280677], [290.117715712676], [290.12762182761327], [290.1378613062486], [290.14842798115177], [290.1593154878075], [290.17051726844795], [290.1820265760013], [290.1938364781557], [290.2059398615333], [290.2183294359742], [290.23099773892665], [290.2439371399407], [290.25713984526396], [290.2705979025349], [290.2843032055719], [290.2982474992552], [290.31242238449806], [290.3268193233055], [290.34142964391594], [290.3562445460238], [290.37125510607933], [290.38645228266324], [290.40182692193184], [290.4173697631298], [290.4330714441681], [290.44892250726235], [290.4649134046288], [290.4810345042355], [290.4972760956029], [290.5136283956527], [290.5300815546003], [290.54662566188733], [290.56325075215096], [290.5799468112258], [290.5967037821763], [290.6135115713538], [290.63036005447657], [290.647239082728], [290.6641384888693], [290.6810480933646], [290.69795771051156], [290.7148571545777], [290.7317362459355], [290.7485848171943], [290.765392719325], [290.7821498277739], [290.7988460485612], [290.81547132436145], [290.83201564056253], [290.8484690312983], [290.86482158545203], [290.88106345262673], [290.89718484907985], [290.9131760636168], [290.9290274634412], [290.9447294999583], [290.96027271452743], [290.97564774415997], [290.99084532716023], [291.0058563087052], [291.0206716463606], [291.035282415527], [291.0496798148184], [291.0638551713639], [291.07779994603305], [291.0915057385804], [291.10496429270677], [291.1181675010339], [291.13110740998826], [291.14377622459364], [291.1561663131677], [291.16827021192023], [291.18008062944944], [291.1915904511361], [291.20279274342937], [291.21368075802553], [291.22424793593257], [291.23448791142346], [291.24439451587097], [291.25396178146514], [291.2631839448083], [291.2720554503887], [291.2805709539268], [291.2887253255969], [291.29651365311673], [291.30393124470874], [291.3109736319257], [291.3176365723446], [291.3239160521218], [291.32980828841255], [291.33530973165017], [291.34041706768414], [291.3451272197783], [291.349437350464], [291.35334486325024], [291.3568474041881], [291.35994286328923], [291.3626293757971], [291.36490532331123], [291.3667693347616], [291.36822028723543], [291.36925730665365], [291.3698797682976], [291.37008729718525]], "exit_static_pressure": [[98652.68299043145], [98653.05408221664], [98654.16714084182], [98656.02151623064], [98658.61612530325], [98661.94945254807], [98666.01955082155], [98670.82404237617], [98676.36012011628], [98682.62454908165], [98689.61366815788], [98697.32339201371], [98705.7492132642], [98714.88620485984], [98724.72902270021], [98735.27190847171], [98746.50869270896], [98758.43279807817], [98771.03724288219], [98784.3146447864], [98798.25722476303], [98812.85681125462], [98828.10484455341], [98843.99238139717], [98860.51009977823], [98877.64830396585], [98895.39692973872], [98913.74554982758], [98932.68337956419], [98952.19928273687], [98972.28177764882], [98992.91904337808], [99014.0989262365], [99035.80894642604], [99058.03630488893], [99080.76789035003], [99103.99028654858], [99127.68977965608], [99151.85236587796], [99176.46375923598], [99201.50939952787], [99226.9744604614], [99252.84385795906], [99279.10225863036], [99305.7340884076], [99332.723541342], [99360.0545885553], [99387.71098734408], [99415.67629043134], [99443.93385536251], [99472.46685403965], [99501.2582823912], [99530.29097017118], [99559.54759088361], [99589.01067182717], [99618.66260425496], [99648.48565364412], [99678.46197006971], [99708.57359867799], [99738.8024902528], [99769.13051186972], [99799.53945763208], [99830.01105948241], [99860.52699808404], [99891.06891376582], [99921.61841752387], [99952.15710207434], [99982.66655294964], [100013.12835963233], [100043.52412671986], [100073.8354851124], [100104.04410321772], [100134.13169816595], [100164.08004702622], [100193.87099801922], [100223.48648171726], [100252.90852222532], [100282.11924833492], [100311.10090464388], [100339.83586263428], [100368.30663170066], [100396.49587012186], [100424.38639596717], [100451.96119793109], [100479.20344608751], [100506.09650255606], [100532.62393207349], [100558.76951246154], [100584.51724498409], [100609.85136458601], [100634.75635000569], [100659.21693375437], [100683.21811195358], [100706.74515402474], [100729.78361222209], [100752.31933100242], [100774.33845622433], [100795.82744416902], [100816.77307037708], [100837.16243829232], [100856.98298770799], [100876.22250300637], [100894.86912118703], [100912.91133967646], [100930.33802391226], [100947.13841469689], [100963.30213531392], [100978.81919840175], [100993.6800125783], [101007.87538881198], [101021.39654653317], [101034.23511948115], [101046.38316128211], [101057.83315075254], [101068.5779969246], [101078.61104378873], [101087.926074749], [101096.51731678886], [101104.37944434203], [101111.50758286634], [101117.89731211738], [101123.54466911835], [101128.44615082488], [101132.59871648118], [101135.99978966654], [101138.64726002986], [101140.5394847107], [101141.67528944605], [101142.05396936146]], "exit_stagnation_temperature": [[336.96036478320025], [336.96060380630655], [336.9613207316462], [336.96251512736865], [336.96418627401175], [336.9663331649356], [336.9689545069282], [336.9720487209854], [336.9756139432612], [336.9796480261912], [336.98414853978534], [336.9891127730925], [336.99453773583326], [337.0004201602005], [337.00675650282915], [337.0135429469294], [337.0207754045862], [337.0284495192221], [337.0365606682208], [337.0451039657122], [337.0540742655157], [337.06346616423934], [337.0732740045353], [337.08349187850723], [337.09411363126975], [337.1051328646549], [337.11654294106705], [337.128336987481], [337.1405078995818], [337.1530483460444], [337.16595077295005], [337.1792074083357], [337.1928102668766], [337.206751154696], [337.2210216743007], [337.23561322963974], [337.2505170312822], [337.26572410171156], [337.28122528073396], [337.29701123099557], [337.3130724436073], [337.3293992438727], [337.3459817971152], [337.3628101146032], [337.37987405956585], [337.39716335329996], [337.41466758136096], [337.43237619983677], [337.4502785416986], [337.46836382322664], [337.4866211505061], [337.5050395259886], [337.5236078551177], [337.5423149530109], [337.5611495511977], [337.5801003044073], [337.59915579740215], [337.61830455185475], [337.6375350332611], [337.6568356578891], [337.6761947997562], [337.6956007976324], [337.7150419620645], [337.73450658241734], [337.75398293392834], [337.7734592847691], [337.7929239031135], [337.81236506420345], [337.83177105741186], [337.8511301932967], [337.87043081064263], [337.8896612834845], [337.9088100281107], [337.9278655100413], [337.946816250975], [337.96565083570425], [337.9843579189903], [338.002926232398], [338.02134459108294], [338.0396019005286], [338.0576871632301], [338.0755894853178], [338.0932980831196], [338.11080228965636], [338.1280915610678], [338.1451554829636], [338.16198377669554], [338.1785663055505], [338.19489308085525], [338.2109542679937], [338.22674019233045], [338.2422413450389], [338.25744838882895], [338.2723521635705], [338.28694369181204], [338.30121418418787], [338.31515504471287], [338.3287578759593], [338.3420144841163], [338.35491688392443], [338.36745730348645], [338.37962818894806], [338.3914222090485], [338.402832259536], [338.41385146744807], [338.42447319525013], [338.434691044835], [338.44449886137545], [338.4538907370325], [338.46286101451375], [338.47140429048164], [338.47951541880667], [338.4871895136689], [338.4944219524995], [338.50120837876653], [338.50754470459805], [338.5134271132445], [338.5188520613784], [338.5238162812283], [338.52831678254705], [338.5323508544129], [338.5359160668629], [338.53901027235577], [338.5416316070666], [338.5437784920084], [338.5454496339839], [338.5466440263642], [338.5473609496955], [338.5475999721317]], "exit_stagnation_pressure": [[98652.68299043145], [98653.05408221664], [98654.16714084182], [98656.02151623064], [98658.61612530325], [98661.94945254807], [98666.01955082155], [98670.82404237617], [98676.36012011628], [98682.62454908165], [98689.61366815788], [98697.32339201371], [98705.7492132642], [98714.88620485984], [98724.72902270021], [98735.27190847171], [98746.50869270896], [98758.43279807817], [98771.03724288219], [98784.3146447864], [98798.25722476303], [98812.85681125462], [98828.10484455341], [98843.99238139717], [98860.51009977823], [98877.64830396585], [98895.39692973872], [98913.74554982758], [98932.68337956419], [98952.19928273687], [98972.28177764882], [98992.91904337808], [99014.0989262365], [99035.80894642604], [99058.03630488893], [99080.76789035003], [99103.99028654858], [99127.68977965608], [99151.85236587796], [99176.46375923598], [99201.50939952787], [99226.9744604614], [99252.84385795906], [99279.10225863036], [99305.7340884076], [99332.723541342], [99360.0545885553], [99387.71098734408], [99415.67629043134], [99443.93385536251], [99472.46685403965], [99501.2582823912], [99530.29097017118], [99559.54759088361], [99589.01067182717], [99618.66260425496], [99648.48565364412], [99678.46197006971], [99708.57359867799], [99738.8024902528], [99769.13051186972], [99799.53945763208], [99830.01105948241], [99860.52699808404], [99891.06891376582], [99921.61841752387], [99952.15710207434], [99982.66655294964], [100013.12835963233], [100043.52412671986], [100073.8354851124], [100104.04410321772], [100134.13169816595], [100164.08004702622], [100193.87099801922], [100223.48648171726], [100252.90852222532], [100282.11924833492], [100311.10090464388], [100339.83586263428], [100368.30663170066], [100396.49587012186], [100424.38639596717], [100451.96119793109], [100479.20344608751], [100506.09650255606], [100532.62393207349], [100558.76951246154], [100584.51724498409], [100609.85136458601], [100634.75635000569], [100659.21693375437], [100683.21811195358], [100706.74515402474], [100729.78361222209], [100752.31933100242], [100774.33845622433], [100795.82744416902], [100816.77307037708], [100837.16243829232], [100856.98298770799], [100876.22250300637], [100894.86912118703], [100912.91133967646], [100930.33802391226], [100947.13841469689], [100963.30213531392], [100978.81919840175], [100993.6800125783], [101007.87538881198], [101021.39654653317], [101034.23511948115], [101046.38316128211], [101057.83315075254], [101068.5779969246], [101078.61104378873], [101087.926074749], [101096.51731678886], [101104.37944434203], [101111.50758286634], [101117.89731211738], [101123.54466911835], [101128.44615082488], [101132.59871648118], [101135.99978966654], [101138.64726002986], [101140.5394847107], [101141.67528944605], [101142.05396936146]], "exit_velocity": [[307.2173293659819], [307.21743279107505], [307.21774300386113], [307.21825981690233], [307.2189829179273], [307.2199118700236], [307.22104611190423], [307.2223849582473], [307.22392760011786], [307.22567310545753], [307.2276204196555], [307.22976836618983], [307.232115647345], [307.23466084500285], [307.2374024215093], [307.2403387206065], [307.2434679684475], [307.2467882746734], [307.25029763356827], [307.25399392527726], [307.257874917102], [307.2619382648576], [307.26618151430125], [307.2706021026256], [307.275197360022], [307.2799645113009], [307.284900677586], [307.2900028780617], [307.2952680317902], [307.30069295958214], [307.3062743859334], [307.31200894101454], [307.3178931627208], [307.3239234987751], [307.3300963088882], [307.33640786696986], [307.3428543633916], [307.3494319073011], [307.3561365289836], [307.36296418227255], [307.3699107470044], [307.3769720315189], [307.38414377520127], [307.39142165106585], [307.39880126837926], [307.40627817532226], [307.41384786168686], [307.42150576160793], [307.4292472563301], [307.4370676770017], [307.44496230750303], [307.45292638729865], [307.46095511431855], [307.46904364785985], [307.47718711151674], [307.4853805961258], [307.4936191627317], [307.50189784557296], [307.51021165507933], [307.5185555808826], [307.5269245948438], [307.53531365408395], [307.5437177040275], [307.55213168144974], [307.5605505175273], [307.56896914089555], [307.57738248070154], [307.58578546965913], [307.59417304709905], [307.6025401620147], [307.61088177610327], [307.6191928667938], [307.6274684302686], [307.63570348447286], [307.6438930721051], [307.65203226359915], [307.6601161600835], [307.6681398963231], [307.67609864363857], [307.68398761280565], [307.69180205692817], [307.6995372742838], [307.70718861114443], [307.7147514645643], [307.7222212851407], [307.72959357973633], [307.736863914173], [307.744027915886], [307.75108127654033], [307.75801975461013], [307.7648391779168], [307.77153544612315], [307.7781045331874], [307.78454248976794], [307.7908454455857], [307.79700961173563], [307.8030312829515], [307.8089068398184], [307.8146327509337], [307.82020557501687], [307.8256219629617], [307.8308786598375], [307.8359725068292], [307.84090044312126], [307.8456595077269], [307.8502468412496], [307.854659687591], [307.85889539559247], [307.86295142061454], [307.8668253260561], [307.8705147848044], [307.8740175806211], [307.8773316094641], [307.8804548807387], [307.8833855184851], [307.88612176249393], [307.8886619693559], [307.891004613438], [307.8931482877948], [307.8950917050026], [307.89683369792743], [307.89837322042007], [307.8997093479375], [307.9008412780942], [307.90176833113816], [307.9024899503569], [307.90300570240765], [307.90331527757553], [307.90341848995797]]}, "core": {"exit_static_temperature": [[704.8545842184285], [704.8546237941706], [704.8547424977505], [704.8549402582408], [704.8552169574749], [704.8555724301164], [704.8560064637547], [704.85651879903], [704.8571091297835], [704.8577771032359], [704.8585223201941], [704.8593443352825], [704.8602426572055], [704.8612167490306], [704.8622660285041], [704.8633898683912], [704.864587596841], [704.8658584977801], [704.8672018113297], [704.8686167342506], [704.8701024204132], [704.8716579812906], [704.873282486481], [704.8749749642499], [704.8767344021004], [704.878559747366], [704.8804499078276], [704.8824037523533], [704.8844201115621], [704.8864977785115], [704.8886355094038], [704.8908320243185], [704.8930860079637], [704.8953961104506], [704.8977609480871], [704.9001791041914], [704.9026491299296], [704.9051695451664], [704.9077388393392], [704.9103554723519], [704.9130178754805], [704.9157244523026], [704.9184735796418], [704.9212636085263], [704.9240928651666], [704.9269596519472], [704.9298622484329], [704.9327989123898], [704.93576788082], [704.9387673710095], [704.9417955815866], [704.9448506935976], [704.9479308715852], [704.9510342646872], [704.9541590077372], [704.9573032223786], [704.9604650181894], [704.9636424938078], [704.9668337380728], [704.9700368311691], [704.9732498457748], [704.9764708482197], [704.9796978996447], [704.9829290571666], [704.9861623750467], [704.9893959058599], [704.9926277016687], [704.995855815196], [704.9990783010007], [705.0022932166502], [705.0054986238931], [705.0086925898348], [705.0118731881014], [705.0150385000094], [705.0181866157275], [705.0213156354347], [705.0244236704716], [705.0275088444895], [705.0305692945894], [705.033603172456], [705.0366086454803], [705.0395838978787], [705.0425271317987], [705.0454365684138], [705.0483104490128], [705.0511470360702], [705.0539446143108], [705.0567014917582], [705.0594160007707], [705.0620864990613], [705.0647113707063], [705.0672890271345], [705.0698179081031], [705.0722964826559], [705.074723250063], [705.0770967407441], [705.0794155171723], [705.0816781747588], [705.0838833427184], [705.0860296849133], [705.0881159006782], [705.0901407256204], [705.0921029324019], [705.094001331497], [705.0958347719259], [705.0976021419677], [705.0993023698469], [705.1009344243948], [705.1024973156915], [705.1039900956737], [705.1054118587261], [705.1067617422407], [705.1080389271498], [705.1092426384366], [705.1103721456144], [705.1114267631792], [705.1124058510363], [705.113308814896], [705.1141351066435], [705.1148842246797], [705.1155557142309], [705.1161491676338], [705.1166642245864], [705.1171005723733], [705.1174579460586], [705.1177361286533], [705.1179349512464], [705.1180542931139], [705.1180940817895]], "exit_static_pressure": [[98652.68299043145], [98653.05408221664], [98654.16714084182], [98656.02151623064], [98658.61612530325], [98661.94945254807], [98666.01955082155], [98670.82404237617], [98676.36012011628], [98682.62454908165], [98689.61366815788], [98697.32339201371], [98705.7492132642], [98714.88620485984], [98724.72902270021], [98735.27190847171], [98746.50869270896], [98758.43279807817], [98771.03724288219], [98784.3146447864], [98798.25722476303], [98812.85681125462], [98828.10484455341], [98843.99238139717], [98860.51009977823], [98877.64830396585], [98895.39692973872], [98913.74554982758], [98932.68337956419], [98952.19928273687], [98972.28177764882], [98992.91904337808], [99014.0989262365], [99035.80894642604], [99058.03630488893], [99080.76789035003], [99103.99028654858], [99127.68977965608], [99151.85236587796], [99176.46375923598], [99201.50939952787], [99226.9744604614], [99252.84385795906], [99279.10225863036], [99305.7340884076], [99332.723541342], [99360.0545885553], [99387.71098734408], [99415.67629043134], [99443.93385536251], [99472.46685403965], [99501.2582823912], [99530.29097017118], [99559.54759088361], [99589.01067182717], [99618.66260425496], [99648.48565364412], [99678.46197006971], [99708.57359867799], [99738.8024902528], [99769.13051186972], [99799.53945763208], [99830.01105948241], [99860.52699808404], [99891.06891376582], [99921.61841752387], [99952.15710207434], [99982.66655294964], [100013.12835963233], [100043.52412671986], [100073.8354851124], [100104.04410321772], [100134.13169816595], [100164.08004702622], [100193.87099801922], [100223.48648171726], [100252.90852222532], [100282.11924833492], [100311.10090464388], [100339.83586263428], [100368.30663170066], [100396.49587012186], [100424.38639596717], [100451.96119793109], [100479.20344608751], [100506.09650255606], [100532.62393207349], [100558.76951246154], [100584.51724498409], [100609.85136458601], [100634.75635000569], [100659.21693375437], [100683.21811195358], [100706.74515402474], [100729.78361222209], [100752.31933100242], [100774.33845622433], [100795.82744416902], [100816.77307037708], [100837.16243829232], [100856.98298770799], [100876.22250300637], [100894.86912118703], [100912.91133967646], [100930.33802391226], [100947.13841469689], [100963.30213531392], [100978.81919840175], [100993.6800125783], [101007.87538881198], [101021.39654653317], [101034.23511948115], [101046.38316128211], [101057.83315075254], [101068.5779969246], [101078.61104378873], [101087.926074749], [101096.51731678886], [101104.37944434203], [101111.50758286634], [101117.89731211738], [101123.54466911835], [101128.44615082488], [101132.59871648118], [101135.99978966654], [101138.64726002986], [101140.5394847107], [101141.67528944605], [101142.05396936146]], "exit_stagnation_temperature": [[788.9235148249438], [788.9230478707984], [788.9216472897908], [788.9193139260295], [788.9160491857969], [788.9118550366992], [788.9067340064827], [788.9006891815004], [788.8937242048563], [788.8858432742012], [788.8770511392015], [788.867353098673], [788.8567549973789], [788.8452632225068], [788.8328846998088], [788.8196268894218], [788.8054977813716], [788.7905058907403], [788.7746602525318], [788.7579704162223], [788.7404464399885], [788.7220988846466], [788.7029388072717], [788.6829777545287], [788.6622277557016], [788.6407013154397], [788.6184114062042], [788.5953714604462], [788.5715953624986], [788.5470974402003], [788.5218924562487], [788.4959955992965], [788.4694224747849], [788.4421890955275], [788.4143118720552], [788.3858076027116], [788.3566934635213], [788.3269869978297], [788.2967061057185], [788.2658690332111], [788.2344943612686], [788.2026009945803], [788.1702081501628], [788.1373353457722], [788.1040023881353], [788.070229361002], [788.0360366130373], [788.0014447455532], [787.9664746000833], [787.9311472458223], [787.8954839669204], [787.859506249653], [787.823235769469], [787.7866943779245], [787.7499040895124], [787.7128870683913], [787.6756656150324], [787.6382621527711], [787.6006992143035], [787.5629994281023], [787.5251855047818], [787.4872802234147], [787.4493064178089], [787.4112869627477], [787.3732447602106], [787.3352027255768], [787.2971837738213], [787.2592108057097], [787.2213066940099], [787.1834942697112], [787.1457963082746], [787.1082355159183], [787.070834515946], [787.0336158351187], [786.9966018900976], [786.9598149739378], [786.9232772426783], [786.8870107019906], [786.851037193943], [786.8153783838421], [786.780055747199], [786.7450905567973], [786.7105038698946], [786.6763165155455], [786.6425490820669], [786.6092219046476], [786.5763550531146], [786.543968319852], [786.5120812078932], [786.4807129191875], [786.4498823430484], [786.4196080447828], [786.3899082545312], [786.3608008562934], [786.3323033771734], [786.3044329768408], [786.2772064371997], [786.2506401523029], [786.2247501184881], [786.1995519247596], [786.1750607434101], [786.1512913208987], [786.1282579689816], [786.1059745561088], [786.084454499078], [786.0637107549761], [786.0437558133809], [786.024601688855], [786.006259913724], [785.9887415311375], [785.9720570884343], [785.9562166307994], [785.9412296952274], [785.9271053047861], [785.9138519631933], [785.9014776497058], [785.8899898143225], [785.8793953733056], [785.869700705023], [785.8609116461155], [785.8530334879873], [785.8460709736247], [785.8400282947495], [785.8349090892926], [785.830716439214], [785.8274528686454], [785.825120342377], [785.8237202646737], [785.8232534784318]], "exit_stagnation_pressure": [[98652.68299043145], [98653.05408221664], [98654.16714084182], [98656.02151623064], [98658.61612530325], [98661.94945254807], [98666.01955082155], [98670.82404237617], [98676.36012011628], [98682.62454908165], [98689.61366815788], [98697.32339201371], [98705.7492132642], [98714.88620485984], [98724.72902270021], [98735.27190847171], [98746.50869270896], [98758.43279807817], [98771.03724288219], [98784.3146447864], [98798.25722476303], [98812.85681125462], [98828.10484455341], [98843.99238139717], [98860.51009977823], [98877.64830396585], [98895.39692973872], [98913.74554982758], [98932.68337956419], [98952.19928273687], [98972.28177764882], [98992.91904337808], [99014.0989262365], [99035.80894642604], [99058.03630488893], [99080.76789035003], [99103.99028654858], [99127.68977965608], [99151.85236587796], [99176.46375923598], [99201.50939952787], [99226.9744604614], [99252.84385795906], [99279.10225863036], [99305.7340884076], [99332.723541342], [99360.0545885553], [99387.71098734408], [99415.67629043134], [99443.93385536251], [99472.46685403965], [99501.2582823912], [99530.29097017118], [99559.54759088361], [99589.01067182717], [99618.66260425496], [99648.48565364412], [99678.46197006971], [99708.57359867799], [99738.8024902528], [99769.13051186972], [99799.53945763208], [99830.01105948241], [99860.52699808404], [99891.06891376582], [99921.61841752387], [99952.15710207434], [99982.66655294964], [100013.12835963233], [100043.52412671986], [100073.8354851124], [100104.04410321772], [100134.13169816595], [100164.08004702622], [100193.87099801922], [100223.48648171726], [100252.90852222532], [100282.11924833492], [100311.10090464388], [100339.83586263428], [100368.30663170066], [100396.49587012186], [100424.38639596717], [100451.96119793109], [100479.20344608751], [100506.09650255606], [100532.62393207349], [100558.76951246154], [100584.51724498409], [100609.85136458601], [100634.75635000569], [100659.21693375437], [100683.21811195358], [100706.74515402474], [100729.78361222209], [100752.31933100242], [100774.33845622433], [100795.82744416902], [100816.77307037708], [100837.16243829232], [100856.98298770799], [100876.22250300637], [100894.86912118703], [100912.91133967646], [100930.33802391226], [100947.13841469689], [100963.30213531392], [100978.81919840175], [100993.6800125783], [101007.87538881198], [101021.39654653317], [101034.23511948115], [101046.38316128211], [101057.83315075254], [101068.5779969246], [101078.61104378873], [101087.926074749], [101096.51731678886], [101104.37944434203], [101111.50758286634], [101117.89731211738], [101123.54466911835], [101128.44615082488], [101132.59871648118], [101135.99978966654], [101138.64726002986], [101140.5394847107], [101141.67528944605], [101142.05396936146]], "exit_velocity": [[411.0180448808957], [411.0168071635915], [411.0130947348129], [411.0069097635678], [410.9982558635925], [410.9871380914322], [410.97356294376704], [410.95753835394373], [410.9390736877815], [410.91817973858383], [410.8948687214053], [410.8691542665591], [410.84105141234676], [410.81057659706966], [410.77774765024725], [410.742583783105], [410.7051055783331], [410.66533497905505], [410.6232952770964], [410.579011100511], [410.53250840034354], [410.4838144367154], [410.43295776413595], [410.3799682161297], [410.32487688913255], [410.2677161256972], [410.20851949696555], [410.14732178448213], [410.0841589612909], [410.01906817236096], [409.95208771432954], [409.88325701458984], [409.81261660969926], [409.7402081231409], [409.66607424245706], [409.5902586957246], [409.51280622740785], [409.4337625736117], [409.35317443670147], [409.2710894593438], [409.1875561979614], [409.1026240955971], [409.0163434542217], [408.92876540649775], [408.8399418869948], [408.74992560286836], [408.6587700040377], [408.5665292528605], [408.47325819330524], [408.3790123196694], [408.2838477448274], [408.1878211680264], [408.0909898422783], [407.99341154130866], [407.8951445261346], [407.796247511242], [407.6967796304168], [407.596800402214], [407.4963696951218], [407.39554769238845], [407.2943948565821], [407.19297189386504], [407.0913397180276], [406.98955941427784], [406.8876922028268], [406.7857994022879], [406.68394239289483], [406.58218257957594], [406.48058135491306], [406.37920006197845], [406.27809995709856], [406.1773421725556], [406.0769876792714], [405.97709724944195], [405.8777314192243], [405.77895045141616], [405.68081429824974], [405.58338256420234], [405.4867144689822], [405.39086881058904], [405.2959039285819], [405.20187766749257], [405.1088473404743], [405.0168696931713], [404.92600086784546], [404.83629636779943], [404.74781102210966], [404.6605989506784], [404.574713529668], [404.49020735731756], [404.40713222017064], [404.3255390597286], [404.24547793960255], [404.16699801311154], [404.09014749142483], [404.01497361224386], [403.9415226090135], [403.8698396807644], [403.79996896253743], [403.7319534964594], [403.66583520346177], [403.6016548556991], [403.53945204965476], [403.4792651799879], [403.4211314141066], [403.36508666753883], [403.31116558006505], [403.259401492679], [403.2098264253707], [403.1624710557524], [403.11736469855623], [403.0745352860151], [403.0340093491491], [402.9958119999511], [402.95996691452046], [402.92649631713977], [402.89542096531056], [402.86676013576255], [402.8405316114461], [402.8167516695303], [402.7954350704013], [402.77659504767576], [402.76024329926076], [402.74638997941594], [402.73504369189055], [402.7262114840782], [402.7198988422553], [402.71610968784495], [402.71484637476897]]}}}, "lift_curve_slope": [[4.442320071240564], [4.442320037475977], [4.442319936202844], [4.442319767483048], [4.442319531419679], [4.442319228156972], [4.442318857880214], [4.442318420815628], [4.442317917230226], [4.442317347431644], [4.442316711767937], [4.442316010627367], [4.442315244438155], [4.442314413668201], [4.442313518824796], [4.442312560454294], [4.442311539141768], [4.442310455510635], [4.442309310222269], [4.442308103975567], [4.442306837506523], [4.442305511587748], [4.442304127027991], [4.442302684671618], [4.442301185398089], [4.442299630121393], [4.442298019789474], [4.44229635538364], [4.4422946379179304], [4.442292868438491], [4.442291048022908], [4.442289177779534], [4.442287258846789], [4.442285292392447], [4.442283279612907], [4.442281221732438], [4.442279120002418], [4.442276975700548], [4.442274790130055], [4.4422725646188805], [4.442270300518853], [4.442267999204846], [4.44226566207392], [4.442263290544459], [4.442260886055291], [4.44225845006479], [4.442255984049983], [4.442253489505631], [4.442250967943305], [4.442248420890457], [4.44224584988948], [4.442243256496758], [4.442240642281711], [4.442238008825826], [4.4422353577216995], [4.442232690572053], [4.442230008988759], [4.442227314591859], [4.442224609008569], [4.442221893872297], [4.442219170821645], [4.44221644149942], [4.442213707551632], [4.442210970626502], [4.442208232373469], [4.442205494442187], [4.442202758481536], [4.442200026138629], [4.442197299057821], [4.442194578879725], [4.442191867240226], [4.442189165769501], [4.442186476091053], [4.442183799820732], [4.442181138565776], [4.442178493923859], [4.4421758674821366], [4.442173260816303], [4.442170675489664], [4.442168113052206], [4.4421655750396845], [4.44216306297271], [4.44216057835586], [4.442158122676795], [4.44215569740537], [4.442153303992794], [4.442150943870753], [4.442148618450596], [4.442146329122494], [4.4421440772546354], [4.442141864192421], [4.442139691257692], [4.442137559747947], [4.442135470935597], [4.442133426067225], [4.442131426362859], [4.442129473015271], [4.442127567189283], [4.442125710021094], [4.4421239026176265], [4.442122146055882], [4.442120441382331], [4.442118789612299], [4.442117191729386], [4.442115648684908], [4.442114161397339], [4.442112730751798], [4.442111357599524], [4.442110042757409], [4.442108787007512], [4.442107591096624], [4.442106455735835], [4.44210538160013], [4.4421043693280025], [4.442103419521095], [4.442102532743845], [4.442101709523177], [4.442100950348194], [4.442100255669899], [4.442099625900943], [4.442099061415386], [4.4420985625484875], [4.442098129596513], [4.442097762816567], [4.442097462426447], [4.4420972286045215], [4.4420970614896245], [4.442096961180981], [4.442096927738148]]}}}}
\ No newline at end of file
@@ -0,0 +1 @@
+{"segments": {"climb": {"conditions": {"tag": "aerodynamic_conditions", "frames": {"inertial": {"position_vector": [[0.0, 0.0, -10.668000000000001], [4.634906974686439, 0.0, -12.38396358961699], [18.42821968458844, 0.0, -17.482251718218116], [41.04697365663427, 0.0, -25.819243013523835], [71.94177874476978, 0.0, -37.16907405827669], [110.35813516715646, 0.0, -51.23520025101667], [155.3545964381545, 0.0, -67.65887275766931], [205.82654871738941, 0.0, -86.02637933932412], [260.533949550763, 0.0, -105.87777170366901], [318.1319279900574, 0.0, -126.71801684194648], [377.2036430999505, 0.0, -148.02990395304928], [436.2948728971663, 0.0, -169.2876231706872], [493.9496546618147, 0.0, -189.97020280543063], [548.7461483626212, 0.0, -209.57433009523632], [599.3318239652689, 0.0, -227.62627622199312], [644.4570675319296, 0.0, -243.69273303681857], [683.0063347866893, 0.0, -257.39041344068073], [714.0260408223122, 0.0, -268.39430243979643], [736.7484563207051, 0.0, -276.44447852726375], [750.6109822297868, 0.0, -281.35145341071654], [755.270294196396, 0.0, -283.0]], "velocity_vector": [[78.50357432570463, 0.0, -29.076900372459388], [78.5118529704813, 0.0, -29.054539409925027], [78.53402716093717, 0.0, -28.99454940271604], [78.56396304542592, 0.0, -28.91333650373663], [78.59575796987828, 0.0, -28.826795630483705], [78.62613198516796, 0.0, -28.743846058457564], [78.65443282928496, 0.0, -28.666313217518223], [78.68135473477376, 0.0, -28.592336985319218], [78.70774780294728, 0.0, -28.519602959526058], [78.73406299673337, 0.0, -28.446874014692373], [78.76029598019896, 0.0, -28.374162442137653], [78.78612921981251, 0.0, -28.30235254780713], [78.81108471323398, 0.0, -28.232786676217714], [78.83462883206398, 0.0, -28.166977368756935], [78.85623277679781, 0.0, -28.10643822032308], [78.87540561653256, 0.0, -28.05258822299332], [78.89171289945374, 0.0, -28.00669478841666], [78.90478795903562, 0.0, -27.96983650865674], [78.91433928813325, 0.0, -27.9428769438429], [78.92015549380326, 0.0, -27.926445782005175], [78.92210852317113, 0.0, -27.920925905817626]], "acceleration_vector": [[0.14411106200160617, 0.0, 0.3890797653986957], [0.13643966520888906, 0.0, 0.3686904386916252], [0.11676266577011596, 0.0, 0.316260904351904], [0.09260581545741875, 0.0, 0.25163058632374136], [0.07087431619232909, 0.0, 0.1932375944569673], [0.054983709172095274, 0.0, 0.15040284895700107], [0.04505059540613843, 0.0, 0.12360951463878989], [0.039546426507973464, 0.0, 0.10882518574263145], [0.036741085838666976, 0.0, 0.1013972090877], [0.035360070151011946, 0.0, 0.09786811604733847], [0.03465546756194371, 0.0, 0.09619578761167302], [0.03425073998266548, 0.0, 0.09534483756854284], [0.03397649739164166, 0.0, 0.0948445034185843], [0.03376318837976733, 0.0, 0.09449748093967347], [0.033584814892940074, 0.0, 0.09422652476777849], [0.03343311642295177, 0.0, 0.0940038253341946], [0.03330659060354435, 0.0, 0.09382092454071689], [0.033206081856889114, 0.0, 0.0936765873717178], [0.033132988160957666, 0.0, 0.09357189271226929], [0.03308857797514975, 0.0, 0.09350834421741183], [0.03307367659198235, 0.0, 0.09348702581637269]], "gravity_force_vector": [[0.0, 0.0, 462924.7542749965], [0.0, 0.0, 462923.1851311688], [0.0, 0.0, 462918.5185781835], [0.0, 0.0, 462910.87554538075], [0.0, 0.0, 462900.45248572645], [0.0, 0.0, 462887.5151316809], [0.0, 0.0, 462872.3911219466], [0.0, 0.0, 462855.4614459013], [0.0, 0.0, 462837.1505632711], [0.0, 0.0, 462817.9153443114], [0.0, 0.0, 462798.23322289134], [0.0, 0.0, 462778.59001366404], [0.0, 0.0, 462759.4677909907], [0.0, 0.0, 462741.3331548045], [0.0, 0.0, 462724.62615090056], [0.0, 0.0, 462709.75006808003], [0.0, 0.0, 462697.06229487795], [0.0, 0.0, 462686.86638153746], [0.0, 0.0, 462679.40541891934], [0.0, 0.0, 462674.8568163199], [0.0, 0.0, 462673.3285352873]], "total_force_vector": [[6802.812513903482, 0.0, 18366.644878573657], [6440.663217170077, 0.0, 17404.110039630556], [5511.7595640996005, 0.0, 14929.036193889391], [4371.379273199098, 0.0, 11878.009223536937], [3345.4988055377617, 0.0, 9121.444492403185], [2595.3492639783944, 0.0, 7099.337773742387], [2126.4264284060337, 0.0, 5834.474244429555], [1866.56746213531, 0.0, 5136.4830857986235], [1734.0992789884913, 0.0, 4785.727561461274], [1668.859902716882, 0.0, 4619.00029921555], [1635.5467440795328, 0.0, 4539.910100140027], [1616.3880132980994, 0.0, 4499.588992106903], [1603.3898965036205, 0.0, 4475.820937446435], [1593.2709625990537, 0.0, 4459.297233974736], [1584.805353793432, 0.0, 4446.375581526721], [1577.6042184712423, 0.0, 4435.746569662006], [1571.5975249641924, 0.0, 4427.013694784895], [1566.8258259801369, 0.0, 4420.120897007233], [1563.355646717071, 0.0, 4415.120851626678], [1561.247240466444, 0.0, 4412.08578239358], [1560.5397961015115, 0.0, 4411.067607958568]], "time": [[0.0], [0.05903757135390373], [0.23469658447441694], [0.5226517314796703], [0.9158126009820533], [1.4044982675483], [1.9766756682128073], [2.6182558964232934], [3.3134411176785146], [4.045113564643696], [4.795257033392922], [5.545400502142147], [6.27707294910733], [6.972258170362552], [7.613838398573037], [8.186015799237545], [8.67470146580379], [9.067862335306174], [9.355817482311428], [9.531476495431942], [9.590514066785845]]}, "body": {"inertial_rotations": [[0.0, 0.4472077839064203, 0.0], [0.0, 0.4472371398705435, 0.0], [0.0, 0.44729004732879013, 0.0], [0.0, 0.4472900588394308, 0.0], [0.0, 0.447173002411118, 0.0], [0.0, 0.44691511802815637, 0.0], [0.0, 0.44652787387540827, 0.0], [0.0, 0.44603983710029677, 0.0], [0.0, 0.44548222891496364, 0.0], [0.0, 0.44488248846356315, 0.0], [0.0, 0.44426336668809974, 0.0], [0.0, 0.44364408443383585, 0.0], [0.0, 0.4430415535291696, 0.0], [0.0, 0.4424710628123085, 0.0], [0.0, 0.44194650262263585, 0.0], [0.0, 0.4414803295624343, 0.0], [0.0, 0.44108342860758665, 0.0], [0.0, 0.4407649516910193, 0.0], [0.0, 0.44053217283017926, 0.0], [0.0, 0.4403903706868539, 0.0], [0.0, 0.44034274592838235, 0.0]], "transform_to_inertial": [[[0.9016581083865661, 0.0, 0.4324495988907371], [0.0, 1.0, 0.0], [-0.4324495988907371, 0.0, 0.9016581083865661]], [[0.9016454130231457, 0.0, 0.4324760677474778], [0.0, 1.0, 0.0], [-0.4324760677474778, 0.0, 0.9016454130231457]], [[0.9016225305517168, 0.0, 0.4325237709092051], [0.0, 1.0, 0.0], [-0.4325237709092051, 0.0, 0.9016225305517168]], [[0.9016225255730911, 0.0, 0.432523781287458], [0.0, 1.0, 0.0], [-0.432523781287458, 0.0, 0.9016225255730911]], [[0.9016731490848638, 0.0, 0.43241823761190384], [0.0, 1.0, 0.0], [-0.43241823761190384, 0.0, 0.9016731490848638]], [[0.9017846330114203, 0.0, 0.43218569581194843], [0.0, 1.0, 0.0], [-0.43218569581194843, 0.0, 0.9017846330114203]], [[0.9019519267759176, 0.0, 0.4318364525896463], [0.0, 1.0, 0.0], [-0.4318364525896463, 0.0, 0.9019519267759176]], [[0.9021625714238439, 0.0, 0.43139621547009166], [0.0, 1.0, 0.0], [-0.43139621547009166, 0.0, 0.9021625714238439]], [[0.9024029812189492, 0.0, 0.4308930951954936], [0.0, 1.0, 0.0], [-0.4308930951954936, 0.0, 0.9024029812189492]], [[0.9026612429308434, 0.0, 0.43035181016296986], [0.0, 1.0, 0.0], [-0.43035181016296986, 0.0, 0.9026612429308434]], [[0.9029275100902687, 0.0, 0.42979287048785225], [0.0, 1.0, 0.0], [-0.42979287048785225, 0.0, 0.9029275100902687]], [[0.9031935000298686, 0.0, 0.42923362112466884], [0.0, 1.0, 0.0], [-0.42923362112466884, 0.0, 0.9031935000298686]], [[0.9034519625870135, 0.0, 0.4286893412457015], [0.0, 1.0, 0.0], [-0.4286893412457015, 0.0, 0.9034519625870135]], [[0.9036963788447662, 0.0, 0.42817386055533196], [0.0, 1.0, 0.0], [-0.42817386055533196, 0.0, 0.9036963788447662]], [[0.9039208574638936, 0.0, 0.42769975852429387], [0.0, 1.0, 0.0], [-0.42769975852429387, 0.0, 0.9039208574638936]], [[0.9041201413431226, 0.0, 0.42727832851397], [0.0, 1.0, 0.0], [-0.42727832851397, 0.0, 0.9041201413431226]], [[0.9042896573020546, 0.0, 0.4269194487213397], [0.0, 1.0, 0.0], [-0.4269194487213397, 0.0, 0.9042896573020546]], [[0.9044255754294674, 0.0, 0.42663143169377093], [0.0, 1.0, 0.0], [-0.42663143169377093, 0.0, 0.9044255754294674]], [[0.9045248617036377, 0.0, 0.42642088898178426], [0.0, 1.0, 0.0], [-0.42642088898178426, 0.0, 0.9045248617036377]], [[0.9045853200054272, 0.0, 0.4262926211309303], [0.0, 1.0, 0.0], [-0.4262926211309303, 0.0, 0.9045853200054272]], [[0.9046056210626862, 0.0, 0.4262495399901235], [0.0, 1.0, 0.0], [-0.4262495399901235, 0.0, 0.9046056210626862]]], "thrust_force_vector": [[189959.969719521, 0.0, 0.0], [189930.04754621658, 0.0, 0.0], [189841.15645121215, 0.0, 0.0], [189695.83087413327, 0.0, 0.0], [189498.05502758696, 0.0, 0.0], [189253.05556254598, 0.0, 0.0], [188967.1467541993, 0.0, 0.0], [188647.5965480263, 0.0, 0.0], [188302.4666794119, 0.0, 0.0], [187940.41134294792, 0.0, 0.0], [187570.44686860693, 0.0, 0.0], [187201.7119367465, 0.0, 0.0], [186843.2329040878, 0.0, 0.0], [186503.7026433726, 0.0, 0.0], [186191.27760951195, 0.0, 0.0], [185913.39607233356, 0.0, 0.0], [185676.61945872125, 0.0, 0.0], [185486.49797710933, 0.0, 0.0], [185347.4610491809, 0.0, 0.0], [185262.7325859253, 0.0, 0.0], [185234.27085424098, 0.0, 0.0]]}, "wind": {"body_rotations": [[0.0, 0.09248530175118179, 0.0], [0.0, 0.0927994827515227, 0.0], [0.0, 0.09361637082792937, 0.0], [0.0, 0.09465029616061402, 0.0], [0.0, 0.09563455072912444, 0.0], [0.0, 0.09643185738035427, 0.0], [0.0, 0.09703053077883615, 0.0], [0.0, 0.09748285509884531, 0.0], [0.0, 0.09784950430417833, 0.0], [0.0, 0.09817364727727686, 0.0], [0.0, 0.0984778800633481, 0.0], [0.0, 0.09877020071300793, 0.0], [0.0, 0.09905050098707967, 0.0], [0.0, 0.0993149115454647, 0.0], [0.0, 0.0995581719490967, 0.0], [0.0, 0.09977480413692422, 0.0], [0.0, 0.0999596902326846, 0.0], [0.0, 0.10010837550145155, 0.0], [0.0, 0.10021724806172706, 0.0], [0.0, 0.10028365340563149, 0.0], [0.0, 0.10030597032240997, 0.0]], "velocity_vector": [[0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]], "lift_force_vector": [[0.0, 0.0, -396974.92531796], [0.0, 0.0, -397990.97420175304], [0.0, 0.0, -400606.65617620805], [0.0, 0.0, -403840.48958286643], [0.0, 0.0, -406780.78364552656], [0.0, 0.0, -408966.52878472867], [0.0, 0.0, -410372.7010974303], [0.0, 0.0, -411196.44863498904], [0.0, 0.0, -411664.94175085536], [0.0, 0.0, -411946.06014242314], [0.0, 0.0, -412137.7460548879], [0.0, 0.0, -412288.29418966937], [0.0, 0.0, -412418.2403983947], [0.0, 0.0, -412534.78054115566], [0.0, 0.0, -412639.3836586069], [0.0, 0.0, -412731.3160330694], [0.0, 0.0, -412809.15968195564], [0.0, 0.0, -412871.4388873293], [0.0, 0.0, -412916.88431264524], [0.0, 0.0, -412944.5423594224], [0.0, 0.0, -412953.8277166871]], "drag_force_vector": [[-28360.41556726216, 0.0, 0.0], [-28449.295802682067, 0.0, 0.0], [-28679.697876090468, 0.0, 0.0], [-28968.293307282784, 0.0, 0.0], [-29235.807429769644, 0.0, 0.0], [-29440.56660583954, 0.0, 0.0], [-29578.94091303416, 0.0, 0.0], [-29667.413240952654, 0.0, 0.0], [-29725.567844906538, 0.0, 0.0], [-29767.915393401774, 0.0, 0.0], [-29802.784773296367, 0.0, 0.0], [-29834.070601702002, 0.0, 0.0], [-29863.17572028162, 0.0, 0.0], [-29890.306678655077, 0.0, 0.0], [-29915.1671546264, 0.0, 0.0], [-29937.286895108562, 0.0, 0.0], [-29956.170799963485, 0.0, 0.0], [-29971.36709851134, 0.0, 0.0], [-29982.50160886822, 0.0, 0.0], [-29989.296265450466, 0.0, 0.0], [-29991.580358374256, 0.0, 0.0]], "transform_to_inertial": [[[0.9377429152401682, 0.0, 0.3473301382213626], [0.0, 1.0, 0.0], [-0.3473301382213626, 0.0, 0.9377429152401682]], [[0.937841805520691, 0.0, 0.3470630314765467], [0.0, 1.0, 0.0], [-0.3470630314765467, 0.0, 0.937841805520691]], [[0.938106681230871, 0.0, 0.34634643729942005], [0.0, 1.0, 0.0], [-0.34634643729942005, 0.0, 0.938106681230871]], [[0.9384642721282523, 0.0, 0.34537633088963937], [0.0, 1.0, 0.0], [-0.34537633088963937, 0.0, 0.9384642721282523]], [[0.9388440696776236, 0.0, 0.34434258062452494], [0.0, 1.0, 0.0], [-0.34434258062452494, 0.0, 0.9388440696776236]], [[0.9392068941463175, 0.0, 0.34335172926319724], [0.0, 1.0, 0.0], [-0.34335172926319724, 0.0, 0.9392068941463175]], [[0.939544954117395, 0.0, 0.3424255819773722], [0.0, 1.0, 0.0], [-0.3424255819773722, 0.0, 0.939544954117395]], [[0.9398665423553032, 0.0, 0.3415419191857525], [0.0, 1.0, 0.0], [-0.3415419191857525, 0.0, 0.9398665423553032]], [[0.9401818135121103, 0.0, 0.3406730948300428], [0.0, 1.0, 0.0], [-0.3406730948300428, 0.0, 0.9401818135121103]], [[0.9404961544417818, 0.0, 0.3398043311675411], [0.0, 1.0, 0.0], [-0.3398043311675411, 0.0, 0.9404961544417818]], [[0.9408095133506185, 0.0, 0.33893577502083283], [0.0, 1.0, 0.0], [-0.33893577502083283, 0.0, 0.9408095133506185]], [[0.9411180972289117, 0.0, 0.3380779896240405], [0.0, 1.0, 0.0], [-0.3380779896240405, 0.0, 0.9411180972289117]], [[0.9414161962308146, 0.0, 0.3372470095854141], [0.0, 1.0, 0.0], [-0.3372470095854141, 0.0, 0.9414161962308146]], [[0.9416974360446453, 0.0, 0.3364609025532404], [0.0, 1.0, 0.0], [-0.3364609025532404, 0.0, 0.9416974360446453]], [[0.9419555000409587, 0.0, 0.3357377487602299], [0.0, 1.0, 0.0], [-0.3357377487602299, 0.0, 0.9419555000409587]], [[0.9421845239393065, 0.0, 0.33509449838704075], [0.0, 1.0, 0.0], [-0.33509449838704075, 0.0, 0.9421845239393065]], [[0.942379318114699, 0.0, 0.3345462909519022], [0.0, 1.0, 0.0], [-0.3345462909519022, 0.0, 0.942379318114699]], [[0.9425355026527226, 0.0, 0.33410601048047556], [0.0, 1.0, 0.0], [-0.33410601048047556, 0.0, 0.9425355026527226]], [[0.9426495954347313, 0.0, 0.3337839723934294], [0.0, 1.0, 0.0], [-0.3337839723934294, 0.0, 0.9426495954347313]], [[0.9427190713243002, 0.0, 0.3335876984564165], [0.0, 1.0, 0.0], [-0.3335876984564165, 0.0, 0.9427190713243002]], [[0.9427424007009396, 0.0, 0.33352176228940317], [0.0, 1.0, 0.0], [-0.33352176228940317, 0.0, 0.9427424007009396]]]}, "planet": {"start_time": null, "latitude": [[0.0], [4.168264442735348e-05], [0.00016572859502636542], [0.0003691432451463332], [0.0006469855287954895], [0.000992469725124768], [0.0013971288471427148], [0.0018510285439742031], [0.002343016609625662], [0.0028609982185242877], [0.0033922314604104137], [0.003923638422983905], [0.004442125713216926], [0.004934906968126137], [0.0053898192692130465], [0.0057956253236225745], [0.006142293580015664], [0.006421248987636758], [0.006625587842194244], [0.006750251075536768], [0.006792151418946025]], "longitude": [[0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0]]}}, "weights": {"total_mass": [[47205.34581906071], [47205.21123881207], [47204.81093050036], [47204.15509443825], [47203.26041205488], [47202.14958104331], [47200.85068979069], [47199.39645298158], [47197.82333411989], [47196.17058359685], [47194.479222344606], [47192.79100097385], [47191.147362868935], [47189.58843736159], [47188.15208614427], [47186.87302279478], [47185.78202191096], [47184.9052311032], [47184.26359611591], [47183.87240673525], [47183.74096891976]], "weight_breakdown": {}, "vehicle_mass_rate": [[2.2797395858330334], [2.2793995184449867], [2.2783893407931073], [2.2767380711897496], [2.2744913118928154], [2.2717088467093483], [2.2684628275370105], [2.264836195880905], [2.2609208138012877], [2.256815134010348], [2.2526215555261815], [2.2484436894866997], [2.244383701036293], [2.2405398211142984], [2.2370040785778422], [2.2338602820196174], [2.23118226889671], [2.229032430875224], [2.227460517311353], [2.226502713856252], [2.2261809905976104]]}, "energies": {"total_energy": [[0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0]], "total_efficiency": [[0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0]], "gravity_energy": [[0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0]], "propulsion_power": [[0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0]]}, "freestream": {"velocity": [[83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037457], [83.71545447037458], [83.71545447037458]], "mach_number": [[0.24603881196545835], [0.24604357509058086], [0.24605772839723147], [0.24608087785005622], [0.2461124035090452], [0.2461514906997265], [0.24619715243705106], [0.24624824833155048], [0.24630350765034156], [0.24636155926369707], [0.24642096673882807], [0.2464802656564507], [0.24653800093508374], [0.24659276284524553], [0.24664322090033536], [0.2466881550181042], [0.24672648344432246], [0.24675728701136557], [0.2467798293893497], [0.2467935730710396], [0.2467981909069845]], "pressure": [[101196.9095791597], [101176.3183324689], [101115.15989365494], [101015.21508135727], [100879.28101085195], [100711.02080168884], [100514.84800854081], [100295.82489096894], [100059.54331783373], [99811.97866338161], [99559.32614523772], [99307.83359846367], [99063.64089970784], [98832.63167349796], [98620.30009454847], [98431.63417035739], [98271.01606894268], [98142.13947122551], [98047.94349726039], [97990.56249544857], [97971.29090546048]], "temperature": [[288.0806581161103], [288.069504393135], [288.0363656756482], [287.98217560054064], [287.90840242812646], [287.8169738765445], [287.71022199743834], [287.59083608457644], [287.4618059208207], [287.3263492727886], [287.1878279803296], [287.0496596871862], [286.9152305000683], [286.7878116636272], [286.6704820655142], [286.566057821542], [286.47702990115624], [286.40551052512166], [286.3531888551229], [286.32129631070836], [286.31058170701255]], "density": [[1.2237458997948307], [1.2235442680183548], [1.2229453517465316], [1.2219664574159117], [1.2206347759213891], [1.218985937632413], [1.2170629126216468], [1.2149150485813194], [1.212596937459702], [1.2101670126967439], [1.2076859663491555], [1.2052151209389856], [1.2028148550936644], [1.200543138381019], [1.198454204205521], [1.1965973764914546], [1.1950160584636744], [1.1937468864347258], [1.1928190473423452], [1.1922537560255289], [1.1920638870314062]], "speed_of_sound": [[340.25304301228493], [340.24645609849705], [340.2268850309215], [340.19487902422344], [340.15130191233067], [340.09728818785334], [340.0342109634244], [339.9636547166803], [339.8873823153955], [339.80729266601367], [339.7253714985272], [339.64363941030035], [339.56410027198126], [339.48869181903757], [339.41923951845683], [339.35741448238883], [339.3046960411375], [339.26233946038917], [339.23134916466347], [339.2124577177586], [339.2061107203416]], "dynamic_viscosity": [[1.7890456763993185e-05], [1.7889918517141975e-05], [1.7888319278074044e-05], [1.7885703932425393e-05], [1.7882143078327722e-05], [1.7877729432858806e-05], [1.7872575212410456e-05], [1.78668099038106e-05], [1.7860577568074935e-05], [1.7854033378164692e-05], [1.7847339596270315e-05], [1.784066132762822e-05], [1.7834162304515977e-05], [1.7828000849447912e-05], [1.7822326106556404e-05], [1.7817274604125106e-05], [1.781296719817418e-05], [1.7809506436547804e-05], [1.780697437289835e-05], [1.780543085087738e-05], [1.7804912271459354e-05]], "altitude": [[10.668000000000001], [12.38396358961699], [17.482251718218116], [25.819243013523835], [37.16907405827669], [51.23520025101667], [67.65887275766931], [86.02637933932412], [105.87777170366901], [126.71801684194648], [148.02990395304928], [169.2876231706872], [189.97020280543063], [209.57433009523632], [227.62627622199312], [243.69273303681857], [257.39041344068073], [268.39430243979643], [276.44447852726375], [281.35145341071654], [283.0]], "gravity": [[9.806617158348947], [9.806611875736166], [9.806596180625284], [9.806570515228277], [9.806535574977143], [9.806492272919272], [9.806441713603768], [9.806385170771877], [9.80632406047167], [9.80625990671296], [9.806194301721964], [9.806128864133388], [9.80606519762434], [9.806004851452286], [9.805949283756105], [9.8058998282119], [9.805857664497797], [9.805823792913861], [9.805799013402552], [9.805783909128143], [9.805778834706075]], "reynolds_number": [[5726317.975501229], [5725546.729775834], [5723255.7359025255], [5719510.829242191], [5714415.468045736], [5708105.279540232], [5700743.94082897], [5692519.59261012], [5683640.594594989], [5674330.237158861], [5664820.741772687], [5655347.059793544], [5646140.845784835], [5637424.8178235395], [5629407.618688317], [5622279.243978624], [5616207.07660296], [5611332.547397037], [5607768.4259019], [5605596.734255381], [5604867.2714058785]], "dynamic_pressure": [[4288.175315762903], [4287.4687700601535], [4285.370084398798], [4281.939902932198], [4277.273506326312], [4271.495748336145], [4264.757202054483], [4257.230788637375], [4249.107805841208], [4240.593012541858], [4231.899082121518], [4223.24089720034], [4214.830032860856], [4206.869622506709], [4199.549707507094], [4193.043125731892], [4187.501968099222], [4183.0546133281805], [4179.803336495617], [4177.822477338997], [4177.157150056623]], "delta_ISA": [[0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0]], "stagnation_temperature": [[291.5768920212924], [291.56574066810697], [291.53260898868945], [291.47843041358476], [291.40467287907086], [291.31326367912385], [291.2065343547242], [291.0871736145424], [290.9581705959703], [290.8227423769162], [290.68425008436], [290.5461106443985], [290.41170945981605], [290.28431710201534], [290.1670118311725], [290.062609194499], [289.9735996627783], [289.90209503712356], [289.849784145746], [289.8178981662881], [289.80718576728054]], "stagnation_pressure": [[105553.38241576863], [105532.07675956665], [105468.79627296679], [105365.38308262099], [105224.7306281582], [105050.62825229828], [104847.64173775256], [104621.00817107019], [104376.5128341551], [104120.33813251546], [103858.89432657014], [103598.64653772292], [103345.9485941626], [103106.88954476643], [102887.15575736508], [102691.91004154895], [102525.68839054427], [102392.31433223563], [102294.83043435012], [102235.44623897305], [102215.50181888045]], "isentropic_expansion_factor": [[1.4009674629902642], [1.4009677347708909], [1.400968541935644], [1.4009698608196552], [1.4009716542606425], [1.40097387361328], [1.4009764603119141], [1.4009793472542535], [1.4009824604142127], [1.4009857208068228], [1.400989046676252], [1.4009923557189043], [1.400995567204735], [1.4009986039218223], [1.4010013939078643], [1.4010038719525135], [1.4010059808664508], [1.4010076725216793], [1.401008908673646], [1.4010096615792125], [1.4010099144250812]], "specific_heat_at_constant_pressure": [[1004.7642314321242], [1004.7640745316155], [1004.7636093512551], [1004.7628518420325], [1004.7618269239647], [1004.7605668662356], [1004.7591098362428], [1004.7574985099901], [1004.7557785655699], [1004.7539970525229], [1004.7522007691983], [1004.7504347976591], [1004.7487412953985], [1004.7471585866774], [1004.7457205549105], [1004.7444563095385], [1004.7433900814858], [1004.7425412887079], [1004.7419247073309], [1004.7415506845302], [1004.7414253361826]], "gas_specific_constant": 287.0528742}, "aerodynamics": {"angle_of_attack": [[0.09248530175118179], [0.0927994827515227], [0.09361637082792937], [0.09465029616061402], [0.09563455072912444], [0.09643185738035427], [0.09703053077883615], [0.09748285509884531], [0.09784950430417833], [0.09817364727727686], [0.0984778800633481], [0.09877020071300793], [0.09905050098707967], [0.0993149115454647], [0.0995581719490967], [0.09977480413692422], [0.0999596902326846], [0.10010837550145155], [0.10021724806172706], [0.10028365340563149], [0.10030597032240997]], "side_slip_angle": [[-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0]], "roll_angle": [[0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0]], "lift_coefficient": [[0.6877735710493035], [0.6896475433867195], [0.6945200174777697], [0.7006872777646043], [0.7065588606077516], [0.7113162446848974], [0.7148897852471119], [0.7175911945643564], [0.7197821517523316], [0.7217199333222988], [0.723539139778432], [0.7252873282548156], [0.7269637228656747], [0.7285451256353979], [0.7300000504164553], [0.7312957225879433], [0.7324015269819397], [0.7332908167891871], [0.7339419872868761], [0.7343391604494042], [0.7344726389568179]], "drag_coefficient": [[0.04913545679368803], [0.0492975676163346], [0.04972115156618426], [0.050261712489335635], [0.050781206037810944], [0.05120603229239958], [0.05152799555284165], [0.05177348826304555], [0.05197414454208206], [0.05215269665509608], [0.052321053978396856], [0.05248335609479976], [0.05263939193677879], [0.05278691218693221], [0.052922901681051064], [0.0530442178769077], [0.053147912835384864], [0.05323140859339889], [0.053292605971479286], [0.05332995689012246], [0.05334251360278765]], "lift_breakdown": {"inviscid_wings": {"main_wing": [[0.621336127333716], [0.6228994460651227], [0.6269641113043137], [0.6321087294907123], [0.6370065395115885], [0.6409748514382553], [0.643955664081121], [0.64620902969835], [0.648036637995339], [0.6496530780117836], [0.6511706109130437], [0.6526288966930559], [0.6540272835595528], [0.6553464199373544], [0.656560043014704], [0.6576408166597496], [0.6585632068414001], [0.6593049899678648], [0.6598481480406861], [0.6601794392993127], [0.6602907766012894]], "horizontal_stabilizer": [[0.2018252667137241], [0.2027414164538319], [0.20512371807052918], [0.2081395613403599], [0.21101126594724706], [0.21333826870402126], [0.21508624373063512], [0.2164075434257822], [0.2174790787185516], [0.21842673468349963], [0.21931638909956624], [0.22017132978522774], [0.22099119021496227], [0.22176462705455707], [0.22247623661395396], [0.2231099808869423], [0.22365087581370927], [0.22408587759785173], [0.2244044092671889], [0.22459869671286023], [0.2246639916795508]], "vertical_stabilizer": [[0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0]]}, "compressible_wings": {"main_wing": [[0.621336127333716], [0.6228994460651227], [0.6269641113043137], [0.6321087294907123], [0.6370065395115885], [0.6409748514382553], [0.643955664081121], [0.64620902969835], [0.648036637995339], [0.6496530780117836], [0.6511706109130437], [0.6526288966930559], [0.6540272835595528], [0.6553464199373544], [0.656560043014704], [0.6576408166597496], [0.6585632068414001], [0.6593049899678648], [0.6598481480406861], [0.6601794392993127], [0.6602907766012894]], "horizontal_stabilizer": [[0.2018252667137241], [0.2027414164538319], [0.20512371807052918], [0.2081395613403599], [0.21101126594724706], [0.21333826870402126], [0.21508624373063512], [0.2164075434257822], [0.2174790787185516], [0.21842673468349963], [0.21931638909956624], [0.22017132978522774], [0.22099119021496227], [0.22176462705455707], [0.22247623661395396], [0.2231099808869423], [0.22365087581370927], [0.22408587759785173], [0.2244044092671889], [0.22459869671286023], [0.2246639916795508]], "vertical_stabilizer": [[0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0]]}, "total": [[0.6033101500432487], [0.604953985426947], [0.6092280855068156], [0.6146379629514073], [0.6197884742173261], [0.6239616181446469], [0.6270963028483438], [0.6294659601441723], [0.631387852414326], [0.6330876608090341], [0.6346834559459931], [0.6362169546094874], [0.6376874761979603], [0.6390746716099982], [0.6403509214179434], [0.6414874759543363], [0.6424574798087191], [0.6432375585870063], [0.6438087607779616], [0.644157158288951], [0.6442742446989631]]}, "drag_breakdown": {"parasite": {"main_wing": {"wetted_area": 239.23737313658532, "reference_area": 117.21806068545455, "parasite_drag_coefficient": [[0.005932910284177589], [0.005933031988371745], [0.005933393629095422], [0.005933985152177275], [0.005934790738476697], [0.005935789597560109], [0.005936956537333604], [0.005938262443524915], [0.005939674865403093], [0.005941158777896297], [0.005942677476045142], [0.005944193527326505], [0.0059456697253846315], [0.005947070011506137], [0.005948360342951002], [0.005949509492440502], [0.005950489765518344], [0.0059512776245213865], [0.0059518542100460425], [0.005952205752944904], [0.005952323871853659]], "skin_friction_coefficient": [[0.0026540547077907335], [0.002654108538698064], [0.0026542684955805844], [0.0026545301308009677], [0.0026548864465211325], [0.002655328245867963], [0.002655844385025995], [0.002656421985466917], [0.0026570466931659965], [0.002657703015821895], [0.002658374718575739], [0.0026590452452820122], [0.0026596981403513424], [0.002660317456275099], [0.0026608881375973325], [0.002661396374399048], [0.002661829919431555], [0.0026621783639313792], [0.0026624333681009526], [0.0026625888431890724], [0.002662641082972685]], "compressibility_factor": [[0.9930806217246151], [0.9930803556680173], [0.9930795650691427], [0.9930782718533071], [0.9930765105207303], [0.9930743264221933], [0.9930717745266515], [0.993068918386968], [0.9930658288730949], [0.9930625825178423], [0.9930592595701753], [0.9930559419178383], [0.9930527110022191], [0.9930496457990143], [0.993046820910784], [0.9930443048065365], [0.9930421582385305], [0.9930404328622378], [0.9930391700808219], [0.9930384001307171], [0.9930381414204288]], "reynolds_factor": [[0.9971262984333262], [0.9971262007894746], [0.9971259106397881], [0.9971254360404165], [0.9971247896674341], [0.9971239881821226], [0.9971230517764225], [0.9971220037909135], [0.9971208702474983], [0.9971196792402186], [0.9971184602192881], [0.9971172432278951], [0.9971160581369818], [0.9971149339049964], [0.9971138978794643], [0.997112975153128], [0.997112187985536], [0.9971115552993678], [0.9971110922590823], [0.9971108099377392], [0.9971107150762276]], "form_factor": [[1.2576583082244086], [1.2576585983800483], [1.257659460596691], [1.257660870981385], [1.2576627919367191], [1.257665174037736], [1.2576679573715852], [1.2576710726607572], [1.2576744426400166], [1.2576779838564422], [1.257681608789492], [1.2576852281149835], [1.2576887529791305], [1.2576920972024233], [1.2576951793629572], [1.2576979247206035], [1.2577002669487303], [1.2577021496446987], [1.2577035275953832], [1.2577043677791466], [1.2577046500906301]]}, "horizontal_stabilizer": {"wetted_area": 83.751714, "reference_area": 41.49, "parasite_drag_coefficient": [[0.0019513896433749967], [0.0019514298125948818], [0.001951549174337283], [0.0019517444101356178], [0.0019520102987465337], [0.0019523399781126289], [0.001952725133379198], [0.0019531561551567305], [0.00195362233284771], [0.0019541121061939196], [0.00195461336050047], [0.001955113740958401], [0.0019556009674295697], [0.0019560631385829694], [0.0019564890184884643], [0.0019568683004867428], [0.0019571918439516395], [0.001957451880227851], [0.001957642184736613], [0.0019577582129510487], [0.0019577971985915046]], "skin_friction_coefficient": [[0.0027144248396230694], [0.0027144803328648065], [0.0027146452293928622], [0.0027149149444243635], [0.0027152822643271316], [0.002715737708589946], [0.0027162697896522146], [0.0027168652316356344], [0.0027175092375148324], [0.002718185836706846], [0.002718878292978094], [0.0027195695387076746], [0.0027202426097575894], [0.0027208810656001343], [0.002721469385181242], [0.002721993331367567], [0.0027224402779287677], [0.00272279949392912], [0.0027230623813833833], [0.0027232226630111754], [0.002723276517819067]], "compressibility_factor": [[0.9930806217246151], [0.9930803556680176], [0.9930795650691427], [0.9930782718533072], [0.9930765105207304], [0.9930743264221933], [0.9930717745266514], [0.9930689183869681], [0.9930658288730949], [0.9930625825178424], [0.9930592595701755], [0.9930559419178384], [0.9930527110022193], [0.9930496457990144], [0.9930468209107841], [0.9930443048065365], [0.9930421582385305], [0.9930404328622378], [0.9930391700808219], [0.9930384001307172], [0.9930381414204288]], "reynolds_factor": [[0.9971262984333263], [0.9971262007894748], [0.9971259106397881], [0.9971254360404164], [0.9971247896674341], [0.9971239881821227], [0.9971230517764225], [0.9971220037909135], [0.9971208702474982], [0.9971196792402187], [0.9971184602192881], [0.9971172432278951], [0.9971160581369818], [0.9971149339049964], [0.9971138978794641], [0.997112975153128], [0.9971121879855361], [0.9971115552993677], [0.9971110922590825], [0.9971108099377392], [0.9971107150762277]], "form_factor": [[1.155360540962727], [1.1553607039804126], [1.1553611883980672], [1.1553619807914857], [1.1553630600366678], [1.1553643983644135], [1.1553659621130885], [1.1553677123598087], [1.155369605694158], [1.155371595229605], [1.155373631794691], [1.1553756652050378], [1.1553776455409652], [1.1553795243856533], [1.1553812559955348], [1.1553827983812424], [1.1553841142804055], [1.1553851720061543], [1.155385946157987], [1.1553864181845894], [1.1553865767909475]]}, "vertical_stabilizer": {"wetted_area": 52.23818991998674, "reference_area": 25.878425601895735, "parasite_drag_coefficient": [[0.0011265563373009854], [0.0011265792880996459], [0.001126647485722281], [0.0011267590340097464], [0.0011269109495718088], [0.0011270993114887312], [0.0011273193687694446], [0.0011275656308123007], [0.0011278319778991659], [0.0011281118049492134], [0.0011283981902191383], [0.0011286840749043226], [0.0011289624429916775], [0.0011292264950158127], [0.0011294698117807545], [0.0011296865050890899], [0.0011298713529768445], [0.0011300199173339457], [0.0011301286421957699], [0.001130194931396264], [0.0011302172046433283]], "skin_friction_coefficient": [[0.00264961367475249], [0.002649667394943033], [0.002649827022831862], [0.002650088119923117], [0.0026504437027621212], [0.002650884593380055], [0.0026513996708696407], [0.002651976083179737], [0.002652599505800193], [0.0026532544782894353], [0.002653924799180651], [0.0026545939463867253], [0.0026552454981754025], [0.0026558635398551216], [0.002656433046956175], [0.0026569402379864925], [0.0026573728909110093], [0.002657720618397456], [0.002657975097821227], [0.0026581302529697626], [0.002658182385252672]], "compressibility_factor": [[0.9930806217246151], [0.9930803556680173], [0.9930795650691429], [0.9930782718533072], [0.9930765105207304], [0.9930743264221933], [0.9930717745266515], [0.9930689183869681], [0.9930658288730949], [0.9930625825178424], [0.9930592595701755], [0.9930559419178384], [0.9930527110022191], [0.9930496457990144], [0.9930468209107841], [0.9930443048065365], [0.9930421582385305], [0.9930404328622378], [0.993039170080822], [0.9930384001307171], [0.9930381414204289]], "reynolds_factor": [[0.9971262984333265], [0.9971262007894747], [0.997125910639788], [0.9971254360404164], [0.9971247896674341], [0.9971239881821226], [0.9971230517764225], [0.9971220037909136], [0.9971208702474982], [0.9971196792402187], [0.9971184602192881], [0.997117243227895], [0.9971160581369818], [0.9971149339049965], [0.9971138978794643], [0.997112975153128], [0.997112187985536], [0.9971115552993679], [0.9971110922590825], [0.9971108099377392], [0.9971107150762277]], "form_factor": [[1.0920793810847012], [1.0920794562177376], [1.0920796794802845], [1.0920800446848251], [1.0920805420948594], [1.092081158911045], [1.092081879618246], [1.0920826862765554], [1.0920835588780038], [1.0920844758128134], [1.092085414418473], [1.092086351566032], [1.0920872642489392], [1.092088130153658], [1.0920889281990107], [1.0920896390342685], [1.0920902454873787], [1.0920907329558938], [1.092091089734475], [1.0920913072741687], [1.0920913803699537]]}, "fuselage": {"wetted_area": 385.51, "reference_area": 12.57, "parasite_drag_coefficient": [[0.005931177440103027], [0.005931282261667823], [0.005931593733341605], [0.005932103187719134], [0.005932796988043318], [0.005933657213354606], [0.005934662150996221], [0.005935786711626949], [0.00593700293569158], [0.00593828065155708], [0.005939588247162453], [0.005940893490900267], [0.005942164353022467], [0.0059433697985716285], [0.005944480533909222], [0.005945469693440143], [0.005946313455259619], [0.005946991576217906], [0.005947487838761485], [0.005947790403752552], [0.005947892065136904]], "skin_friction_coefficient": [[0.0018941811255678619], [0.001894214718965749], [0.001894314539988802], [0.0018944778110001864], [0.0018947001618323874], [0.0018949758493436565], [0.0018952979152311506], [0.0018956583190070581], [0.0018960481002857977], [0.0018964575896808908], [0.0018968766560872217], [0.0018972949697494696], [0.0018977022655079772], [0.001898088596928499], [0.001898444575569281], [0.0018987615910891465], [0.0018990320085811928], [0.001899249340083416], [0.001899408387814472], [0.0018995053572736149], [0.0018995379388788518]], "compressibility_factor": [[0.9930806217246151], [0.9930803556680174], [0.9930795650691427], [0.9930782718533072], [0.9930765105207304], [0.9930743264221933], [0.9930717745266515], [0.9930689183869681], [0.9930658288730949], [0.9930625825178424], [0.9930592595701754], [0.9930559419178384], [0.9930527110022191], [0.9930496457990144], [0.993046820910784], [0.9930443048065365], [0.9930421582385305], [0.9930404328622376], [0.9930391700808219], [0.9930384001307171], [0.9930381414204288]], "reynolds_factor": [[0.9971262984333263], [0.9971262007894747], [0.997125910639788], [0.9971254360404164], [0.9971247896674341], [0.9971239881821226], [0.9971230517764226], [0.9971220037909135], [0.9971208702474983], [0.9971196792402187], [0.9971184602192881], [0.9971172432278951], [0.9971160581369818], [0.9971149339049964], [0.9971138978794641], [0.997112975153128], [0.9971121879855361], [0.9971115552993679], [0.9971110922590825], [0.9971108099377392], [0.9971107150762277]], "form_factor": [[1.093273506520633], [1.093273438658968], [1.093273237004014], [1.0932729071451905], [1.0932724578778048], [1.0932719007638183], [1.0932712498182104], [1.0932705212459342], [1.0932697331195445], [1.0932689049579094], [1.0932680572301536], [1.0932672108260477], [1.093266386524154], [1.0932656044765041], [1.0932648837215762], [1.093264241734577], [1.0932636940228038], [1.0932632537727602], [1.0932629315545666], [1.093262735087962], [1.0932626690730534]]}, "turbofan": {"wetted_area": 20.92832112776126, "reference_area": 2.7844449567252743, "parasite_drag_coefficient": [[0.0010124839696043879], [0.0010125046318854459], [0.0010125660292367687], [0.0010126664545482857], [0.0010128032218783296], [0.0010129728012327325], [0.001013170915313764], [0.0010133926209670266], [0.0010136324086639664], [0.0010138843319268318], [0.001014142159211114], [0.0010143995356000758], [0.0010146501447237093], [0.0010148878651867852], [0.0010151069179610327], [0.0010153020020786663], [0.0010154684163755443], [0.0010156021653758317], [0.0010157000477752864], [0.0010157597263448768], [0.0010157797784096402]], "skin_friction_coefficient": [[0.0027022200652764357], [0.0027022752108709787], [0.002702439074358876], [0.002702707099631364], [0.0027030721181744853], [0.002703524708781232], [0.0027040534557649367], [0.002704645166333021], [0.002705285136096029], [0.002705957494490099], [0.002706645610136251], [0.0027073325223871706], [0.0027080013734729694], [0.002708635825992254], [0.002709220456287346], [0.0027097411165969533], [0.002710185259976673], [0.0027105422228947415], [0.0027108034613852108], [0.002710962737613828], [0.0027110162546011393]], "compressibility_factor": [[0.9930806217246151], [0.9930803556680174], [0.9930795650691427], [0.9930782718533072], [0.9930765105207304], [0.9930743264221933], [0.9930717745266515], [0.9930689183869681], [0.9930658288730949], [0.9930625825178424], [0.9930592595701754], [0.9930559419178384], [0.9930527110022191], [0.9930496457990144], [0.993046820910784], [0.9930443048065365], [0.9930421582385305], [0.9930404328622376], [0.9930391700808219], [0.9930384001307171], [0.9930381414204288]], "reynolds_factor": [[0.9971262984333263], [0.9971262007894747], [0.997125910639788], [0.9971254360404164], [0.9971247896674341], [0.9971239881821226], [0.9971230517764226], [0.9971220037909135], [0.9971208702474983], [0.9971196792402187], [0.9971184602192881], [0.9971172432278951], [0.9971160581369818], [0.9971149339049964], [0.9971138978794641], [0.997112975153128], [0.9971121879855361], [0.9971115552993679], [0.9971110922590825], [0.997110809937739], [0.9971107150762277]], "form_factor": 1.204891983794575}, "pylon": {"wetted_area": 8.371328451104505, "reference_area": 134.6, "parasite_drag_coefficient": [[0.0002024967939208776], [0.00020250092637708918], [0.00020251320584735376], [0.00020253329090965714], [0.0002025606443756659], [0.00020259456024654648], [0.00020263418306275282], [0.00020267852419340532], [0.00020272648173279327], [0.00020277686638536636], [0.0002028284318422228], [0.00020287990712001514], [0.00020293002894474185], [0.00020297757303735709], [0.00020302138359220654], [0.00020306040041573326], [0.00020309368327510883], [0.00020312043307516632], [0.00020314000955505725], [0.00020315194526897537], [0.00020315595568192802]], "skin_friction_coefficient": [[0.0027022200652764357], [0.0027022752108709787], [0.002702439074358876], [0.002702707099631364], [0.0027030721181744853], [0.002703524708781232], [0.0027040534557649367], [0.002704645166333021], [0.002705285136096029], [0.002705957494490099], [0.002706645610136251], [0.0027073325223871706], [0.0027080013734729694], [0.002708635825992254], [0.002709220456287346], [0.0027097411165969533], [0.002710185259976673], [0.0027105422228947415], [0.0027108034613852108], [0.002710962737613828], [0.0027110162546011393]], "compressibility_factor": [[0.9930806217246151], [0.9930803556680174], [0.9930795650691427], [0.9930782718533072], [0.9930765105207304], [0.9930743264221933], [0.9930717745266515], [0.9930689183869681], [0.9930658288730949], [0.9930625825178424], [0.9930592595701754], [0.9930559419178384], [0.9930527110022191], [0.9930496457990144], [0.993046820910784], [0.9930443048065365], [0.9930421582385305], [0.9930404328622376], [0.9930391700808219], [0.9930384001307171], [0.9930381414204288]], "reynolds_factor": [[0.9971262984333263], [0.9971262007894747], [0.997125910639788], [0.9971254360404164], [0.9971247896674341], [0.9971239881821226], [0.9971230517764226], [0.9971220037909135], [0.9971208702474983], [0.9971196792402187], [0.9971184602192881], [0.9971172432278951], [0.9971160581369818], [0.9971149339049964], [0.9971138978794641], [0.997112975153128], [0.9971121879855361], [0.9971115552993679], [0.9971110922590825], [0.997110809937739], [0.9971107150762277]], "form_factor": 1.204891983794575}, "total": [[0.016157014468481862], [0.016157328908996627], [0.016158263257580713], [0.016159791529499718], [0.016161872841092353], [0.016164453461995357], [0.016167468288854986], [0.016170842086281327], [0.016174491002238306], [0.01617832453890871], [0.016182247864980542], [0.016186164276809585], [0.016189977662496798], [0.01619359488190069], [0.016196928008682682], [0.016199896393950877], [0.0162024285173571], [0.016204463596752088], [0.016205952933070252], [0.01620686097265862], [0.016207166074316968]]}, "compressible": {"main_wing": {"compressibility_drag": [[8.506018322971727e-11], [8.54257072807949e-11], [8.638382356301311e-11], [8.76208760650942e-11], [8.88458117483914e-11], [8.990918496196315e-11], [9.079590299988744e-11], [9.155738785820592e-11], [9.225231796821326e-11], [9.291964708434788e-11], [9.357576244566024e-11], [9.422109585979188e-11], [9.484724315196006e-11], [9.544180881871175e-11], [9.59911606080454e-11], [9.648191346086695e-11], [9.690177259757054e-11], [9.724006801403243e-11], [9.748813313274944e-11], [9.763958148818634e-11], [9.769050316887262e-11]], "thickness_to_chord": 0.15015527441765908, "wing_sweep": 0.6108652381980153, "crest_critical": [[0.7502398243383452], [0.7500346472475204], [0.7495066084633919], [0.7488495122131108], [0.7482356070526778], [0.7477465537566675], [0.7473841131408578], [0.7471129214985016], [0.7468947388102226], [0.7467030863022296], [0.746524288834964], [0.7463535013383696], [0.7461906765192867], [0.7460379297936686], [0.7458981299150833], [0.7457742214731286], [0.7456689096621856], [0.745584511081502], [0.7455228772138126], [0.7454853532648071], [0.7454727542531929]], "divergence_mach": [[0.7760989679070782], [0.7758867188058421], [0.7753404796672594], [0.7746607347308871], [0.7740256695877843], [0.7735197596827484], [0.7731448265230677], [0.7728642874915344], [0.772638584518038], [0.7724403261627429], [0.7722553659336168], [0.7720786917615209], [0.7719102547232026], [0.7717522431484266], [0.7716076246704895], [0.7714794453726218], [0.7713705036914024], [0.7712831960742426], [0.7712194378204814], [0.7711806205021384], [0.7711675872298523]]}, "horizontal_stabilizer": {"compressibility_drag": [[1.424902356420088e-11], [1.4323585117752825e-11], [1.4520621689284557e-11], [1.4778110761134167e-11], [1.5035549671156584e-11], [1.5259388551836882e-11], [1.5444477575628678e-11], [1.560112602424024e-11], [1.574217673803053e-11], [1.5876577185174257e-11], [1.6008403836425235e-11], [1.6138178307687542e-11], [1.62644013573107e-11], [1.6384620234635145e-11], [1.6496043008880952e-11], [1.6595873889938633e-11], [1.6681508008270865e-11], [1.6750659098068442e-11], [1.6801453422675042e-11], [1.683250076215716e-11], [1.6842946080172485e-11]], "thickness_to_chord": 0.09079588711195336, "wing_sweep": 0.49261918137539956, "crest_critical": [[0.8603696043043402], [0.8600796115461949], [0.8593268261617221], [0.8583765296684374], [0.8574744370528938], [0.8567454455187227], [0.8561990223844123], [0.855786647614835], [0.855452646209435], [0.8551575736967223], [0.8548808304854256], [0.8546151313501834], [0.8543605607114491], [0.8541206078539307], [0.8539000105465349], [0.8537036917694675], [0.8535362401719501], [0.8534016411787896], [0.8533031201124441], [0.8532430438959964], [0.8532228566317782]], "divergence_mach": [[0.8857610262341338], [0.8854624751442648], [0.8846874733876373], [0.8837091315297806], [0.8827804161533835], [0.8820299104565377], [0.8814673611593712], [0.8810428162925298], [0.8806989577622764], [0.8803951770029768], [0.880110266483573], [0.8798367259754888], [0.8795746423906128], [0.879327607990211], [0.8791005003652951], [0.8788983877841738], [0.8787259943173201], [0.8785874230082973], [0.8784859943660077], [0.8784241451667021], [0.8784033621313866]]}, "vertical_stabilizer": {"compressibility_drag": [[2.806937906870216e-12], [2.8077336066906648e-12], [2.8100992154911423e-12], [2.8139724591124613e-12], [2.8192551646886257e-12], [2.8258177744187805e-12], [2.833502253176545e-12], [2.84212433506809e-12], [2.8514764755452007e-12], [2.861332062768647e-12], [2.871450689406725e-12], [2.8815840653142553e-12], [2.8914822400947414e-12], [2.9008999229005706e-12], [2.9096027403888338e-12], [2.9173732803280904e-12], [2.924016761640054e-12], [2.929366169276625e-12], [2.9332866991247133e-12], [2.9356793738129432e-12], [2.936483713396748e-12]], "thickness_to_chord": 0.09352740548802943, "wing_sweep": 0.5445427266222308, "crest_critical": [[0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869]], "divergence_mach": [[0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929]]}, "total": [[1.0211614470078837e-10], [1.0255702600523839e-10], [1.0371454446778882e-10], [1.0521295928534082e-10], [1.067006165842366e-10], [1.0799439128821882e-10], [1.0907388282869267e-10], [1.1000063821751425e-10], [1.1084597118178898e-10], [1.1165755633229079e-10], [1.124556169714922e-10], [1.1324085823279367e-10], [1.140031267493655e-10], [1.1472732897624747e-10], [1.153968063573152e-10], [1.1599516063113366e-10], [1.1650729736748145e-10], [1.169200932813775e-10], [1.172228732545492e-10], [1.1740776162415645e-10], [1.1746993296244185e-10]]}, "induced": {"inviscid_wings": {"main_wing": [[0.03284780261920296], [0.033008808214339214], [0.03342923731399727], [0.03396510982479728], [0.03447912765519453], [0.03489830955145043], [0.03521472615170495], [0.03545475949324412], [0.035649947859071135], [0.03582296787262989], [0.035985746024308846], [0.03614249677417642], [0.03629311738979844], [0.036435481411534035], [0.03656669886721097], [0.03668374704925933], [0.03678378723526861], [0.03686433611007057], [0.036923371433629296], [0.03695940189683878], [0.036971514549674324]], "horizontal_stabilizer": [[0.0052502781417046555], [0.005297268074278589], [0.005420428617694947], [0.005578352577528525], [0.005730816052600136], [0.005855853743758973], [0.005950657906189593], [0.006022821884485782], [0.006081661859016761], [0.006133935937623712], [0.006183212385802275], [0.00623075005820926], [0.006276506385586733], [0.006319823644332802], [0.006359808359840536], [0.006395522895295227], [0.006426083159782071], [0.0064507127884311935], [0.006468777475644949], [0.006479808243599092], [0.006483517484853915]], "vertical_stabilizer": [[0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0]]}, "inviscid": [[0.03022429242868419], [0.030378990615339996], [0.030783090278519734], [0.03129844095893667], [0.03179307604673483], [0.03219666819205242], [0.03250144653491843], [0.0327327268191278], [0.03292084622666045], [0.03308763613728848], [0.03324458278733824], [0.03339574442878425], [0.033541018473994905], [0.033678350328412446], [0.03380494781376867], [0.0339178895446935], [0.03401443086689393], [0.0340921698430257], [0.0341491498579736], [0.03418392762606746], [0.03419561943955039]], "total": [[0.03099157658486731], [0.031150194322976932], [0.03156453835544087], [0.03209297177138754], [0.03260019785877325], [0.03301411356460454], [0.033326748992000776], [0.03356405432129857], [0.03375712724668891], [0.03392834480039714], [0.034089477672841734], [0.03424468098219108], [0.034393843911407304], [0.03453485438750806], [0.03466484429350645], [0.03478081335455817], [0.03487994295463703], [0.034959766461117515], [0.03501827455398715], [0.03505398506190327], [0.035065990462795696]], "viscous": [[0.0007672841561831235], [0.000771203707636936], [0.0007814480769211256], [0.0007945308124508782], [0.0008071218120384376], [0.000817445372552129], [0.0008253024570823479], [0.0008313275021707743], [0.0008362810200284579], [0.0008407086631086732], [0.0008448948855035124], [0.0008489365534068379], [0.000852825437412409], [0.0008565040590956081], [0.0008598964797377874], [0.0008629238098646873], [0.0008655120877431061], [0.0008675966180918442], [0.0008691246960135476], [0.0008700574358358259], [0.0008703710232453264]], "oswald_efficiency_factor": [[0.5055318746235865], [0.5057022361936466], [0.5061407919474167], [0.5066870182818461], [0.5071982020980286], [0.5076063664176454], [0.5079096684764915], [0.5081372510460207], [0.5083208376995454], [0.5084824579443039], [0.5086334978161196], [0.5087779746449762], [0.5089158880567527], [0.509045417006938], [0.5091640985209313], [0.5092693975613316], [0.5093589756233363], [0.5094308213713444], [0.5094833207495301], [0.5095152970992407], [0.5095260357964222]], "viscous_wings_drag": {"main_wing": [[0.0008703713564959969], [0.0008747746230926638], [0.0008862823914221604], [0.0009009768411904793], [0.000915117348301162], [0.0009267104827934661], [0.0009355336242882872], [0.0009422996474449557], [0.0009478626046133248], [0.0009528351209131751], [0.0009575365054563915], [0.0009620754568845846], [0.0009664426984903158], [0.0009705736810489868], [0.0009743831473531655], [0.0009777825409665593], [0.0009806888469523654], [0.0009830294582745674], [0.0009847452293903572], [0.0009857925254114195], [0.0009861446246317643]], "horizontal_stabilizer": [[3.020498765050068e-05], [3.048045775271369e-05], [3.120289253822449e-05], [3.213037621194175e-05], [3.3027597804190164e-05], [3.376576369209846e-05], [3.4328117092705283e-05], [3.475884632684938e-05], [3.5112291800258204e-05], [3.542783870798822e-05], [3.5726184228667054e-05], [3.601448058512274e-05], [3.629223897464341e-05], [3.655535573303688e-05], [3.679834358589143e-05], [3.701546357172389e-05], [3.720130717308418e-05], [3.735112315122832e-05], [3.746102735677867e-05], [3.752814645839695e-05], [3.755071762111355e-05]], "vertical_stabilizer": [[0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0]]}}, "miscellaneous": {"total_wetted_area": 882.8533112433041, "reference_area": 134.6, "total": [[0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712]], "trim_correction_factor": 1.02}, "untrimmed": [[0.04817201646440003], [0.048330948643465294], [0.04874622702567084], [0.04927618871503493], [0.04978549611550093], [0.050201992443529], [0.05051764269886436], [0.05075832182651525], [0.0509550436687079], [0.05113009475989812], [0.0512951509592126], [0.05145427068117624], [0.051607246996841945], [0.05175187469307079], [0.05188519772652065], [0.052004135173438916], [0.05210579689743614], [0.05218765548372441], [0.05224765291321499], [0.05228427146090437], [0.0522965819635173]], "trim_corrected_drag": [[0.04913545679368803], [0.0492975676163346], [0.04972115156618426], [0.050261712489335635], [0.050781206037810944], [0.05120603229239958], [0.05152799555284165], [0.05177348826304555], [0.05197414454208206], [0.05215269665509608], [0.052321053978396856], [0.05248335609479976], [0.05263939193677879], [0.05278691218693221], [0.052922901681051064], [0.0530442178769077], [0.053147912835384864], [0.05323140859339889], [0.053292605971479286], [0.05332995689012246], [0.05334251360278765]], "spoiler_drag": 0.0, "drag_coefficient_increment": 0.0, "total": [[0.04913545679368803], [0.0492975676163346], [0.04972115156618426], [0.050261712489335635], [0.050781206037810944], [0.05120603229239958], [0.05152799555284165], [0.05177348826304555], [0.05197414454208206], [0.05215269665509608], [0.052321053978396856], [0.05248335609479976], [0.05263939193677879], [0.05278691218693221], [0.052922901681051064], [0.0530442178769077], [0.053147912835384864], [0.05323140859339889], [0.053292605971479286], [0.05332995689012246], [0.05334251360278765]]}}, "stability": {"static": {"Cm_alpha": [[-15.684778965862783], [-15.684783870701562], [-15.684798445672303], [-15.684822286651205], [-15.684854757731525], [-15.68489502299731], [-15.684942069224618], [-15.684994724928927], [-15.685051683699974], [-15.685111534681333], [-15.685172798446057], [-15.685233965287335], [-15.685293533658779], [-15.685350047408345], [-15.685402130955698], [-15.685448521763888], [-15.685488099547541], [-15.685519911736943], [-15.68554319480267], [-15.68555739113296], [-15.685562161238497]], "Cm0": [[0.5639926745081767], [0.5639928457194857], [0.5639933544823481], [0.5639941866901709], [0.5639953201456037], [0.5639967256696522], [0.5639983678941005], [0.5640002059263918], [0.5640021941641686], [0.564004283359212], [0.5640064218697383], [0.5640085569969959], [0.5640106363270863], [0.5640126090306734], [0.5640144270909067], [0.5640160464368972], [0.5640174279632767], [0.5640185384190627], [0.5640193511520288], [0.5640198466978374], [0.5640200132060655]], "CM": [[-0.8866188410502318], [-0.8915469845510452], [-0.9043605531690404], [-0.9205788879679647], [-0.9360187178616207], [-0.948526834213853], [-0.9579198863180609], [-0.9650178620700081], [-0.9707723380712916], [-0.9758603239513399], [-0.9806361437485225], [-0.9852251499849234], [-0.9896255463112169], [-0.9937765434873371], [-0.9975955353535086], [-1.000996507621902], [-1.0038991036159564], [-1.0062333788405944], [-1.007942622184445], [-1.0089851541886816], [-1.00933551942944]], "Cn_beta": [[0.163322708311844], [0.1633245424085507], [0.1633299920962391], [0.16333890505317597], [0.1633510416645352], [0.16336608714274942], [0.1633836603039257], [0.1634033210009579], [0.16342457915303066], [0.16344690640652565], [0.16346974974290288], [0.16349254589661605], [0.16351473572456107], [0.16353577801939964], [0.16355516245840496], [0.16357242146357767], [0.16358714078976905], [0.16359896869093662], [0.16360762354812727], [0.1636128998743861], [0.16361467263890994]], "static_margin": [[3.5023196921074984], [3.50231821511026], [3.502313826123293], [3.50230664679285], [3.5022968685374547], [3.5022847429892843], [3.5022705751695162], [3.502254717764865], [3.5022375641128227], [3.502219539033853], [3.502201088035853], [3.5021826657877555], [3.5021647245438983], [3.502147702927478], [3.5021320153294697], [3.502118042119171], [3.502106120835404], [3.5020965385042278], [3.50208952520354], [3.5020852489684535], [3.502083812106401]], "neutral_point": [[31.341602249998477, 16.031723759998478, 15.551484369998478], [31.341595489104613, 16.031716999104614, 15.551477609104614], [31.341575398698016, 16.031696908698017, 15.551457518698017], [31.34154253560939, 16.03166404560939, 15.55142465560939], [31.341497776049117, 16.031619286049118, 15.551379896049118], [31.3414422718531, 16.0315637818531, 15.551324391853102], [31.34137741924318, 16.03149892924318, 15.551259539243182], [31.341304832628232, 16.031426342628233, 15.551186952628234], [31.34122631249438, 16.031347822494382, 15.551108432494383], [31.341143803439753, 16.031265313439754, 15.551025923439754], [31.341059344758357, 16.031180854758357, 15.550941464758358], [31.340975017678446, 16.031096527678447, 15.550857137678447], [31.340892892375585, 16.031014402375586, 15.550775012375587], [31.340814976629343, 16.030936486629344, 15.550697096629344], [31.340743167297287, 16.030864677297288, 15.550625287297288], [31.34067920550418, 16.03080071550418, 15.550561325504182], [31.340624636320033, 16.030746146320034, 15.550506756320035], [31.340580773594784, 16.030702283594785, 15.550462893594785], [31.340548670500503, 16.030670180500504, 15.550430790500505], [31.340529096210986, 16.030650606210987, 15.550411216210987], [31.340522519034277, 16.030644029034278, 15.550404639034278]], "Cn_r": [[-1.8741351507273674], [-1.8741358432432462], [-1.8741379010896686], [-1.8741412672119149], [-1.8741458518316412], [-1.8741515369323134], [-1.8741581794635294], [-1.8741656140293923], [-1.8741736561822402], [-1.8741821067252482], [-1.8741907567771317], [-1.8741993931780825], [-1.8742078039171648], [-1.8742157833896995], [-1.874223137364586], [-1.874229687569854], [-1.874235275817603], [-1.8742397676003975], [-1.8742430551031801], [-1.874245059587157], [-1.8742457331137516]], "Cl_p": [[-0.4410542770987914], [-0.44105460102374155], [-0.4410555635864496], [-0.44105713810843916], [-0.44105928260933325], [-0.44106194190315445], [-0.44106504909502736], [-0.44106852683636916], [-0.4410722888632823], [-0.4410762420071429], [-0.4410802885621776], [-0.4410843288133446], [-0.44108826357502057], [-0.4410919966509507], [-0.441095437159231], [-0.44109850167929915], [-0.4411011161838625], [-0.4411032177237686], [-0.44110475583941683], [-0.44110569367811525], [-0.44110600880225637]], "Cl_beta": [[-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0]], "Cy_beta": 0, "Cm_q": [[34.05154883150814], [34.05157384009968], [34.05164815465178], [34.05176971545551], [34.0519352814203], [34.05214059191861], [34.05238048233864], [34.05264898099123], [34.05293942788132], [34.053244629935115], [34.05355704378873], [34.05386897095291], [34.05417275381209], [34.05446096554458], [34.054726589622604], [34.05496318557045], [34.05516503811884], [34.055327287285095], [34.0554460373411], [34.05551844307866], [34.05554277220465]], "Cm_alpha_dot": [[-55.64679367242387], [-55.64684886042329], [-55.647012854849585], [-55.64728111020594], [-55.64764647385927], [-55.64809954323452], [-55.64862892086178], [-55.64922142828077], [-55.64986236819441], [-55.65053586706441], [-55.651225278516165], [-55.6519136140388], [-55.65258397550817], [-55.65321997427645], [-55.65380612725048], [-55.654328222631015], [-55.654773649002195], [-55.65513168232476], [-55.65539372634111], [-55.65555350288807], [-55.65560718954572]], "Cz_alpha": [[-4.5275327319506475], [-4.527698131857403], [-4.528131489520904], [-4.528688037898103], [-4.529229306378733], [-4.529681134693661], [-4.530034647902351], [-4.5303154530631025], [-4.530554308384642], [-4.53077300011224], [-4.530982445532817], [-4.5311857717379915], [-4.531381760544681], [-4.531567185873509], [-4.531738109759398], [-4.531890542620561], [-4.532020784856143], [-4.532125619327049], [-4.532202434494789], [-4.532249308083293], [-4.532265064518007]], "Cy_phi": [[0.6877735710493035], [0.6896475433867195], [0.6945200174777697], [0.7006872777646043], [0.7065588606077516], [0.7113162446848974], [0.7148897852471119], [0.7175911945643564], [0.7197821517523316], [0.7217199333222988], [0.723539139778432], [0.7252873282548156], [0.7269637228656747], [0.7285451256353979], [0.7300000504164553], [0.7312957225879433], [0.7324015269819397], [0.7332908167891871], [0.7339419872868761], [0.7343391604494042], [0.7344726389568179]], "Cl_r": [[0.17194339276232587], [0.17241188584667988], [0.17363000436944243], [0.17517181944115107], [0.1766397151519379], [0.17782906117122435], [0.17872244631177797], [0.1793977986410891], [0.1799455379380829], [0.1804299833305747], [0.180884784944608], [0.1813218320637039], [0.18174093071641867], [0.18213628140884947], [0.18250001260411383], [0.18282393064698582], [0.18310038174548493], [0.18332270419729677], [0.18348549682171902], [0.18358479011235104], [0.18361815973920448]]}, "dynamic": {"dutchRollFreqHz": [[0.7692235929779699], [0.7691645381831849], [0.7689890940352578], [0.7687022408979296], [0.7683118088292709], [0.7678280721858752], [0.7672634488521898], [0.7666322413285548], [0.7659503269258711], [0.765234765853634], [0.7645033511503272], [0.7637741384231478], [0.7630649837119101], [0.7623931058087366], [0.7617746823155681], [0.7612244854728598], [0.7607555620607311], [0.7603789603450285], [0.7601035058804698], [0.7599356270519629], [0.7598792306008341]], "dutchRollDamping": [[0.9480653379101609], [0.9479822576405357], [0.9477354430644132], [0.9473319182959227], [0.9467827255102446], [0.9461023510912219], [0.9453082982678012], [0.9444207183273265], [0.9434619703647847], [0.9424560661470553], [0.9414280342240764], [0.9404032570075076], [0.9394068207966553], [0.9384629017132764], [0.9375942004446023], [0.9368214340020328], [0.9361628901758268], [0.935634048443131], [0.9352472694398671], [0.9350115538200369], [0.9349323704896285]], "rollSubsistenceTimeConstant": [[-2.9133187759982913], [-2.913796731135521], [-2.9152173503351673], [-2.917542260768606], [-2.920711024135446], [-2.9246440350427276], [-2.9292444943453453], [-2.9344000062355446], [-2.9399845973029293], [-2.9458614637669434], [-2.951886302324843], [-2.9579109532730734], [-2.963787145665747], [-2.969370213872586], [-2.9745226955484902], [-2.979117732884608], [-2.9830422016435176], [-2.9861994958195175], [-2.988511902240415], [-2.989922508636367], [-2.9903965997875854]], "spiralSubsistenceTimeConstant": [[25.535260528417112], [25.400807096689594], [25.057761390018978], [24.638066463115713], [24.25637056980589], [23.96494851460899], [23.762960534276612], [23.625537012441523], [23.52623429182151], [23.44644506014542], [23.375992426714305], [23.310512769910304], [23.248828041699273], [23.191240074082785], [23.138627795370144], [23.092021659219768], [23.052412285797192], [23.02066455020653], [22.997476144631406], [22.9833566102069], [22.978615470742913]], "shortPeriodFreqHz": [[3.6314584472645355], [3.6311691011418104], [3.630310441464426], [3.6289090070708783], [3.6270050516113392], [3.6246496253158105], [3.6219031074211987], [3.6188344638633905], [3.6155202304186504], [3.6120428447077146], [3.6084884938572395], [3.6049447818027436], [3.6014984291599084], [3.5982331088312556], [3.5952274612801847], [3.5925533123171833], [3.590274109431922], [3.588443588722259], [3.5871046803073456], [3.5862886563698773], [3.586014523106768]], "shortPeriodDamp": [[0.16218735785985453], [0.1621772413616336], [0.16214597609691644], [0.162091687467113], [0.16201328996903427], [0.16191160382469452], [0.1617893037984428], [0.16165021501085705], [0.16149862921357402], [0.1613389203759086], [0.16117540206494918], [0.16101228379398666], [0.16085363679597342], [0.16070334240648831], [0.160565026647367], [0.16044199084814545], [0.16033714585303865], [0.1602529539676317], [0.1601913806611748], [0.160153856793644], [0.16014125165357698]], "phugoidFreqHz": [[0.16566416648010499], [0.16566407724039786], [0.16566381210131675], [0.1656633785331929], [0.16566278828402878], [0.1656620567780254], [0.1656612026744415], [0.16566024749071565], [0.16565921514828974], [0.1656581313924143], [0.16565702312072647], [0.16565591767698445], [0.16565484215226642], [0.16565382271833398], [0.1656528840076734], [0.16565204855020865], [0.16565133627436063], [0.1656507640782986], [0.16565034547553067], [0.1656500903175093], [0.16565000459478874]], "phugoidDamp": [[0.05051664698675194], [0.050545593458259555], [0.05062224638036205], [0.05072219642497577], [0.050820585726263585], [0.050903002626704726], [0.050967010339600854], [0.05101704830520794], [0.05105887936037859], [0.05109672569555454], [0.05113278609679802], [0.051167772479023495], [0.05120155218929737], [0.05123359178709055], [0.051263205581138394], [0.05128968350965233], [0.05131235829979216], [0.051330644168322344], [0.05134406223145578], [0.05135225817769804], [0.05135501459610453]]}}, "propulsion": {"throttle": [[1.0], [1.0], [1.0], [1.0], [1.0], [1.0], [1.0], [1.0], [1.0], [1.0], [1.0], [1.0], [1.0], [1.0], [1.0], [1.0], [1.0], [1.0], [1.0], [1.0], [1.0]], "battery_energy": [[0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0]], "battery_voltage": [[0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0]], "voltage_under_load": [[0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0]], "voltage_open_circuit": [[0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0]], "state_of_charge": [[0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0]], "thrust_breakdown": {}, "acoustic_outputs": {"fan": {"exit_static_temperature": [[291.40014330594397], [291.3888626764395], [291.355346905559], [291.3005402455136], [291.2259276509809], [291.13345875979365], [291.0254921432367], [290.9047476808165], [290.7742491633906], [290.63725096449366], [290.4971531762497], [290.3574123362865], [290.22145309297275], [290.09258393160155], [289.9739187964148], [289.8683058728314], [289.77826450116817], [289.7059309622723], [289.65301366086356], [289.62075804601074], [289.60992146453344]], "exit_static_pressure": [[101196.9095791597], [101176.3183324689], [101115.15989365494], [101015.21508135727], [100879.28101085195], [100711.02080168884], [100514.84800854081], [100295.82489096894], [100059.54331783373], [99811.97866338161], [99559.32614523772], [99307.83359846367], [99063.64089970784], [98832.63167349796], [98620.30009454847], [98431.63417035739], [98271.01606894268], [98142.13947122551], [98047.94349726039], [97990.56249544857], [97971.29090546048]], "exit_stagnation_temperature": [[340.34907931562344], [340.3360881386845], [340.2974901348766], [340.2343726195458], [340.14844553913923], [340.04195394859585], [339.9176138367063], [339.77855731002484], [339.6282665225006], [339.47048925323156], [339.30914119239424], [339.1482031402965], [338.9916192767266], [338.8432000968222], [338.7065321276616], [338.58489588356997], [338.48119318122906], [338.3978846701652], [338.33693818712743], [338.29978832807734], [338.28730746571597]], "exit_stagnation_pressure": [[101196.9095791597], [101176.3183324689], [101115.15989365494], [101015.21508135727], [100879.28101085195], [100711.02080168884], [100514.84800854081], [100295.82489096894], [100059.54331783373], [99811.97866338161], [99559.32614523772], [99307.83359846367], [99063.64089970784], [98832.63167349796], [98620.30009454847], [98431.63417035739], [98271.01606894268], [98142.13947122551], [98047.94349726039], [97990.56249544857], [97971.29090546048]], "exit_velocity": [[313.6308022793227], [313.6252977438617], [313.6089427311514], [313.58219645793855], [313.5457811900082], [313.5006454553975], [313.44793721042663], [313.3889809986842], [313.32525033169105], [313.25833224234503], [313.18988611748296], [313.12160025923066], [313.05514877060915], [312.99215028928506], [312.93412947784196], [312.8824819116412], [312.838442870761], [312.8030604350935], [312.7771731786857], [312.7613926667511], [312.75609088383135]]}, "core": {"exit_static_temperature": [[701.6992192482493], [701.6969166111636], [701.6900757658167], [701.6788908789309], [701.6636672172903], [701.6448053448055], [701.6227894002619], [701.5981770081947], [701.5715872059742], [701.5436851694179], [701.5151646699551], [701.4867297429258], [701.4590766703611], [701.4328769145172], [701.4087613638818], [701.3873061270397], [701.3690200426264], [701.3543340221165], [701.3435922971912], [701.3370456072379], [701.33484633774]], "exit_static_pressure": [[101196.9095791597], [101176.3183324689], [101115.15989365494], [101015.21508135727], [100879.28101085195], [100711.02080168884], [100514.84800854081], [100295.82489096894], [100059.54331783373], [99811.97866338161], [99559.32614523772], [99307.83359846367], [99063.64089970784], [98832.63167349796], [98620.30009454847], [98431.63417035739], [98271.01606894268], [98142.13947122551], [98047.94349726039], [97990.56249544857], [97971.29090546048]], "exit_stagnation_temperature": [[782.253526546243], [782.2788991568468], [782.3542840024666], [782.4775587503383], [782.6453856772259], [782.8533823523902], [783.0962466700714], [783.3678635819422], [783.6614338199386], [783.9696385069053], [784.2848298040162], [784.5992315921382], [784.9051381720317], [785.1951039584646], [785.4621200274365], [785.6997746486419], [785.9023955869271], [786.0651724712972], [786.1842580116274], [786.2568472644523], [786.2812344770404]], "exit_stagnation_pressure": [[101196.9095791597], [101176.3183324689], [101115.15989365494], [101015.21508135727], [100879.28101085195], [100711.02080168884], [100514.84800854081], [100295.82489096894], [100059.54331783373], [99811.97866338161], [99559.32614523772], [99307.83359846367], [99063.64089970784], [98832.63167349796], [98620.30009454847], [98431.63417035739], [98271.01606894268], [98142.13947122551], [98047.94349726039], [97990.56249544857], [97971.29090546048]], "exit_velocity": [[402.3383816163103], [402.4074579737215], [402.61262030223935], [402.9478873390763], [403.4038655919081], [403.96825585320744], [404.6262433448799], [405.360841068262], [406.15329063530186], [406.98355268169064], [407.8308551357476], [408.67425260252793], [409.49316297067037], [410.267862790393], [410.97993239445054], [411.6126464161477], [412.1513079426343], [412.5835263267961], [412.89943996904117], [413.0918861485718], [413.15652021053995]]}}}, "lift_curve_slope": [[4.47839727515696], [4.478400564241069], [4.4784103379547195], [4.478426325408767], [4.4784481003409224], [4.478475102401261], [4.478506652349509], [4.478541964800057], [4.47858016384256], [4.478620303457144], [4.47866139155442], [4.478702415643192], [4.478742368607902], [4.478780273686577], [4.4788152080783465], [4.478846324743653], [4.478872872020758], [4.4788942107336505], [4.47890982852331], [4.478919351193171], [4.478922550915219]]}}, "cutback": {"conditions": {"tag": "aerodynamic_conditions", "frames": {"inertial": {"position_vector": [[755.270294196396, 0.0, -283.0], [755.8879259327546, 0.0, -283.0308555944198], [757.7406051694973, 0.0, -283.1234115881513], [760.8276840651251, 0.0, -283.27763561638363], [765.1480831355312, 0.0, -283.49347375034006], [770.7002916314499, 0.0, -283.77085051613597], [777.4823680667547, 0.0, -284.10966892117017], [785.4919408973341, 0.0, -284.50981048804135], [794.7262093503862, 0.0, -284.97113529597686], [805.1819444037709, 0.0, -285.49348202976], [816.8554899151463, 0.0, -286.0766680361384], [829.7427639004238, 0.0, -286.7204893876941], [843.8392599611659, 0.0, -287.424720954152], [859.1400488603587, 0.0, -288.1891164811036], [875.6397802460759, 0.0, -289.0134086761164], [893.3326845223621, 0.0, -289.8973093022004], [912.2125748667536, 0.0, -290.84050927859835], [932.2728493936543, 0.0, -291.8426787888641], [953.506493462892, 0.0, -292.9034673961928], [975.9060821325667, 0.0, -294.0225041659608], [999.4637827554066, 0.0, -295.1993977954332], [1024.171357717658, 0.0, -296.433736750594], [1050.0201673196161, 0.0, -297.72508941005066], [1077.0011727967217, 0.0, -299.07300421596267], [1105.1049394802376, 0.0, -300.4770098319412], [1134.3216400963288, 0.0, -301.93661530786545], [1164.6410582024635, 0.0, -303.4513102515572], [1196.0525917598607, 0.0, -305.0205650072535], [1228.5452568408125, 0.0, -306.64383084081607], [1262.1076914695047, 0.0, -308.32054013161155], [1296.728159595068, 0.0, -310.0501065709959], [1332.3945551954034, 0.0, -311.8319253673339], [1369.0944065104109, 0.0, -313.66537345748156], [1406.8148804030736, 0.0, -315.5498097246577], [1445.5427868469433, 0.0, -317.48457522262834], [1485.264583538387, 0.0, -319.4689934061262], [1525.966380632055, 0.0, -321.5023703674233], [1567.633945597837, 0.0, -323.5839950789757], [1610.2527081976818, 0.0, -325.71313964205433], [1653.807765580481, 0.0, -327.8890595412751], [1698.2838874932818, 0.0, -330.1109939049398], [1743.66552160696, 0.0, -332.3781657710962], [1789.9367989545487, 0.0, -334.6897823592249], [1837.0815394802455, 0.0, -337.0450353474572], [1885.0832576972539, 0.0, -339.4431011552277], [1933.9251684523674, 0.0, -341.8831412312623], [1983.5901927953983, 0.0, -344.36430234680154], [2034.060963951294, 0.0, -346.88571689395593], [2085.3198333929345, 0.0, -349.44650318908936], [2137.3488770124222, 0.0, -352.0457657811249], [2190.1299013887674, 0.0, -354.68259576466426], [2243.6444501497126, 0.0, -357.35607109781233], [2297.8738104255444, 0.0, -360.0652569245951], [2352.799019392547, 0.0, -362.80920590185815], [2408.4008709039235, 0.0, -365.5869585305321], [2464.6599222057325, 0.0, -368.3975434911488], [2521.556500735618, 0.0, -371.23997798348967], [2579.070711001863, 0.0, -374.11326807025034], [2637.182441540417, 0.0, -377.0164090245985], [2695.87137194742, 0.0, -379.9483856815049], [2755.116979984832, 0.0, -382.9081727927243], [2814.8985487565797, 0.0, -385.89473538530297], [2875.1951739528295, 0.0, -388.9070291234852], [2935.9857711597524, 0.0, -391.94400067389574], [2997.2490832322947, 0.0, -395.0045880738668], [3058.9636877273215, 0.0, -398.08772110278335], [3121.108004394594, 0.0, -401.19232165631615], [3183.660302722903, 0.0, -404.3173041234111], [3246.598709538759, 0.0, -407.46157576590366], [3309.901216654953, 0.0, -410.6240371006257], [3373.5456885663634, 0.0, -413.8035822838708], [3437.5098701902407, 0.0, -416.9990994980836], [3501.77139464831, 0.0, -420.20947134063783], [3566.3077910880093, 0.0, -423.43357521456824], [3631.0964925400476, 0.0, -426.6702837211178], [3696.114843809566, 0.0, -429.91846505396444], [3761.3401093981875, 0.0, -433.1769833949892], [3826.749481454107, 0.0, -436.44469931144715], [3892.320087747509, 0.0, -439.7204701544016], [3958.028999668484, 0.0, -443.00315045828427], [4023.8532402446635, 0.0, -446.2915923414389], [4089.76979217576, 0.0, -449.5846459075109], [4155.75560588223, 0.0, -452.8811596475406], [4221.787607565194, 0.0, -456.17998084262126], [4287.842707274838, 0.0, -459.47995596697933], [4353.897806984482, 0.0, -462.7799310913374], [4419.929808667443, 0.0, -466.078752286418], [4485.915622373912, 0.0, -469.3752660264478], [4551.832174305012, 0.0, -472.6683195925197], [4617.656414881188, 0.0, -475.9567614756744], [4683.365326802162, 0.0, -479.239441779557], [4748.93593309556, 0.0, -482.5152126225115], [4814.345305151482, 0.0, -485.7829285389694], [4879.570570740101, 0.0, -489.04144687999417], [4944.588922009624, 0.0, -492.28962821284085], [5009.377623461661, 0.0, -495.52633671939043], [5073.914019901358, 0.0, -498.75044059332083], [5138.17554435943, 0.0, -501.9608124358751], [5202.139725983307, 0.0, -505.15632965008786], [5265.78419789472, 0.0, -508.335874833333], [5329.086705010919, 0.0, -511.49833616805506], [5392.0251118267715, 0.0, -514.6426078105476], [5454.577410155076, 0.0, -517.7675902776425], [5516.721726822347, 0.0, -520.8721908311752], [5578.436331317373, 0.0, -523.9553238600919], [5639.699643389909, 0.0, -527.0159112600629], [5700.490240596838, 0.0, -530.0528828104734], [5760.786865793087, 0.0, -533.0651765486557], [5820.568434564835, 0.0, -536.0517391412343], [5879.814042602246, 0.0, -539.0115262524537], [5938.502973009256, 0.0, -541.9435029093602], [5996.614703547804, 0.0, -544.8466438637083], [6054.128913814051, 0.0, -547.7199339504689], [6111.025492343936, 0.0, -550.5623684428099], [6167.2845436457455, 0.0, -553.3729534034264], [6222.886395157123, 0.0, -556.1507060321006], [6277.8116041241265, 0.0, -558.8946550093635], [6332.040964399954, 0.0, -561.6038408361462], [6385.555513160899, 0.0, -564.2773161692944], [6438.336537537242, 0.0, -566.9141461528337], [6490.36558115673, 0.0, -569.5134087448693], [6541.624450598374, 0.0, -572.0741950400028], [6592.09522175427, 0.0, -574.595609587157], [6641.760246097298, 0.0, -577.0767707026964], [6690.602156852411, 0.0, -579.5168107787309], [6738.603875069415, 0.0, -581.9148765865014], [6785.748615595117, 0.0, -584.2701295747338], [6832.0198929427, 0.0, -586.5817461628624], [6877.40152705638, 0.0, -588.8489180290188], [6921.87764896918, 0.0, -591.0708523926835], [6965.432706351981, 0.0, -593.2467722919043], [7008.051468951825, 0.0, -595.375916854983], [7049.7190339176095, 0.0, -597.4575415665354], [7090.420831011269, 0.0, -599.4909185278325], [7130.142627702718, 0.0, -601.4753367113303], [7168.870534146587, 0.0, -603.4101022093009], [7206.591008039251, 0.0, -605.2945384764771], [7243.290859354256, 0.0, -607.1279865666247], [7278.957254954594, 0.0, -608.9098053629627], [7313.577723080156, 0.0, -610.6393718023471], [7347.140157708845, 0.0, -612.3160810931424], [7379.632822789797, 0.0, -613.9393469267052], [7411.044356347197, 0.0, -615.5086016824015], [7441.363774453324, 0.0, -617.0232966260933], [7470.580475069419, 0.0, -618.4829021020175], [7498.684241752935, 0.0, -619.886907717996], [7525.665247230041, 0.0, -621.234822523908], [7551.514056831997, 0.0, -622.5261751833647], [7576.221631794249, 0.0, -623.7605141385255], [7599.779332417087, 0.0, -624.9374077679979], [7622.178921086763, 0.0, -626.0564445377659], [7643.412565155997, 0.0, -627.1172331450946], [7663.472839682898, 0.0, -628.1194026553603], [7682.35273002729, 0.0, -629.0626026317582], [7700.0456343035785, 0.0, -629.9465032578422], [7716.545365689297, 0.0, -630.770795452855], [7731.84615458849, 0.0, -631.5351909798067], [7745.9426506492255, 0.0, -632.2394225462646], [7758.829924634509, 0.0, -632.8832438978202], [7770.503470145883, 0.0, -633.4664299041987], [7780.959205199268, 0.0, -633.9887766379818], [7790.193473652316, 0.0, -634.4501014459173], [7798.2030464829, 0.0, -634.8502430127885], [7804.985122918207, 0.0, -635.1890614178227], [7810.537331414129, 0.0, -635.4664381836185], [7814.857730484522, 0.0, -635.6822763175751], [7817.944809380149, 0.0, -635.8365003458073], [7819.797488616901, 0.0, -635.9290563395389], [7820.415120353262, 0.0, -635.9599119339587]], "velocity_vector": [[83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667], [83.61118137463801, 0.0, -4.17704037791667]], "acceleration_vector": [[2.036149027162537e-12, 0.0, -1.7114087924596788e-13], [-1.3885559368986833e-12, 0.0, 6.64329702360078e-14], [8.739675649849232e-13, 0.0, -4.025252353656583e-14], [-5.355715870791755e-13, 0.0, 2.6069424396979457e-14], [1.687538997430238e-14, 0.0, -8.208711488322251e-15], [2.0650148258027912e-13, 0.0, 6.05765437811101e-15], [-1.4455103780619538e-13, 0.0, 1.1102230246251565e-15], [2.4091839634365897e-13, 0.0, -1.124100812432971e-14], [1.1457501614131615e-13, 0.0, -1.0283440765590512e-14], [-2.6201263381153694e-14, 0.0, -3.608224830031759e-16], [4.929390229335695e-14, 0.0, -3.0808688933348094e-15], [7.66053886991358e-14, 0.0, -1.0408340855860843e-16], [-1.0458300891968975e-13, 0.0, 1.6930901125533637e-15], [-6.039613253960852e-14, 0.0, 1.2073675392798577e-15], [1.4654943925052066e-13, 0.0, -9.159339953157541e-16], [-4.04121180963557e-14, 0.0, 5.412337245047638e-16], [-5.551115123125783e-14, 0.0, 2.2620794126737565e-15], [1.8496315590255108e-13, 0.0, -9.173217740965356e-15], [-1.2723155862204294e-13, 0.0, 4.170275236248244e-15], [-3.197442310920451e-14, 0.0, 1.942890293094024e-15], [-9.325873406851315e-15, 0.0, 1.1379786002407855e-15], [-9.015010959956271e-14, 0.0, 2.5673907444456745e-15], [-2.3092638912203256e-14, 0.0, 3.899658373995862e-15], [-4.39648317751562e-14, 0.0, 3.2612801348363973e-15], [-4.884981308350689e-15, 0.0, -1.3183898417423734e-15], [-3.774758283725532e-14, 0.0, 8.257283745649602e-16], [-4.6629367034256575e-14, 0.0, 2.8449465006019636e-15], [-5.551115123125783e-15, 0.0, -3.469446951953614e-16], [4.884981308350689e-15, 0.0, -8.881784197001252e-16], [6.505906924303417e-14, 0.0, -1.7694179454963432e-15], [-3.26405569239796e-14, 0.0, 2.636779683484747e-16], [3.885780586188048e-14, 0.0, -2.1441182163073336e-15], [2.0872192862952943e-14, 0.0, 2.5673907444456745e-16], [-5.284661597215745e-14, 0.0, 2.005340338229189e-15], [-1.4654943925052066e-14, 0.0, 1.97758476261356e-15], [-9.992007221626409e-15, 0.0, 6.522560269672795e-16], [1.7319479184152442e-14, 0.0, -2.609024107869118e-15], [-6.217248937900877e-15, 0.0, 1.5126788710517758e-15], [9.103828801926284e-14, 0.0, -4.551914400963142e-15], [-1.7319479184152442e-14, 0.0, 5.273559366969494e-16], [4.440892098500626e-15, 0.0, 4.440892098500626e-16], [-1.509903313490213e-14, 0.0, 1.5265566588595902e-16], [2.353672812205332e-14, 0.0, 1.1102230246251565e-16], [-8.43769498715119e-15, 0.0, 1.1379786002407855e-15], [-1.3322676295501878e-15, 0.0, -1.6653345369377348e-16], [4.75175454539567e-14, 0.0, -2.123301534595612e-15], [4.440892098500626e-16, 0.0, 2.192690473634684e-15], [5.10702591327572e-14, 0.0, -2.2620794126737565e-15], [-2.886579864025407e-15, 0.0, -8.187894806610529e-16], [-1.4876988529977098e-14, 0.0, 1.096345236817342e-15], [5.684341886080802e-14, 0.0, -3.0531133177191805e-15], [1.0436096431476471e-14, 0.0, -2.3592239273284576e-16], [-2.3092638912203256e-14, 0.0, 1.970645868709653e-15], [-2.398081733190338e-14, 0.0, 1.3877787807814457e-16], [3.4638958368304884e-14, 0.0, -9.298117831235686e-16], [-3.219646771412954e-14, 0.0, -1.1102230246251565e-16], [2.1316282072803006e-14, 0.0, 2.220446049250313e-16], [-5.062616992290714e-14, 0.0, 2.42861286636753e-15], [2.3092638912203256e-14, 0.0, -3.191891195797325e-16], [2.220446049250313e-15, 0.0, -5.551115123125783e-16], [-1.687538997430238e-14, 0.0, 1.609823385706477e-15], [7.993605777301127e-15, 0.0, -1.0269562977782698e-15], [4.884981308350689e-15, 0.0, -9.43689570931383e-16], [-1.7763568394002505e-14, 0.0, -5.551115123125783e-17], [-2.3092638912203256e-14, 0.0, 3.3306690738754696e-16], [1.3766765505351941e-14, 0.0, 1.6653345369377348e-15], [6.217248937900877e-15, 0.0, 1.0547118733938987e-15], [6.217248937900877e-15, 0.0, -6.106226635438361e-16], [-7.993605777301127e-15, 0.0, -5.551115123125783e-16], [3.375077994860476e-14, 0.0, -1.915134717478395e-15], [2.7533531010703882e-14, 0.0, -7.494005416219807e-16], [-4.085620730620576e-14, 0.0, 1.8596235662471372e-15], [1.687538997430238e-14, 0.0, -3.608224830031759e-16], [-1.865174681370263e-14, 0.0, 1.1657341758564144e-15], [-3.907985046680551e-14, 0.0, 1.0547118733938987e-15], [1.865174681370263e-14, 0.0, -1.1102230246251565e-15], [-2.042810365310288e-14, 0.0, 5.551115123125783e-17], [0.0, 0.0, 2.220446049250313e-16], [-2.1316282072803006e-14, 0.0, 1.609823385706477e-15], [2.1316282072803006e-14, 0.0, -8.881784197001252e-16], [2.3092638912203256e-14, 0.0, -1.4432899320127035e-15], [3.197442310920451e-14, 0.0, -1.5543122344752192e-15], [-5.684341886080802e-14, 0.0, 3.1086244689504383e-15], [-2.842170943040401e-14, 0.0, -1.7763568394002505e-15], [-5.684341886080802e-14, 0.0, -1.3322676295501878e-15], [2.1316282072803006e-14, 0.0, -1.1102230246251565e-15], [-1.4210854715202004e-14, 0.0, 1.1102230246251565e-15], [3.552713678800501e-14, 0.0, -2.7755575615628914e-15], [-2.4868995751603507e-14, 0.0, 6.661338147750939e-16], [5.684341886080802e-14, 0.0, -2.3869795029440866e-15], [6.394884621840902e-14, 0.0, -3.774758283725532e-15], [2.398081733190338e-14, 0.0, -1.3322676295501878e-15], [1.4210854715202004e-14, 0.0, -7.771561172376096e-16], [3.730349362740526e-14, 0.0, -8.326672684688674e-16], [-3.730349362740526e-14, 0.0, 5.551115123125783e-16], [2.5757174171303632e-14, 0.0, -3.608224830031759e-16], [-5.329070518200751e-15, 0.0, -2.220446049250313e-16], [-3.952393967665557e-14, 0.0, 1.0824674490095276e-15], [4.884981308350689e-14, 0.0, -2.1649348980190553e-15], [1.2434497875801753e-14, 0.0, 9.43689570931383e-16], [4.1744385725905886e-14, 0.0, -1.6653345369377348e-15], [3.68594044175552e-14, 0.0, -2.4424906541753444e-15], [5.240252676230739e-14, 0.0, -1.915134717478395e-15], [-5.417888360170764e-14, 0.0, 2.4147350785597155e-15], [6.261657858885883e-14, 0.0, -3.3861802251067274e-15], [-3.907985046680551e-14, 0.0, 3.885780586188048e-16], [5.728750807065808e-14, 0.0, -2.095545958979983e-15], [-2.4868995751603507e-14, 0.0, 1.0685896612017132e-15], [-1.4210854715202004e-14, 0.0, 1.2212453270876722e-15], [-1.3766765505351941e-14, 0.0, 9.159339953157541e-16], [-4.75175454539567e-14, 0.0, 2.8171909249863347e-15], [2.220446049250313e-15, 0.0, -2.0539125955565396e-15], [-6.8833827526759706e-15, 0.0, 8.465450562766819e-16], [-1.4654943925052066e-14, 0.0, 6.938893903907228e-17], [1.4654943925052066e-14, 0.0, 6.245004513516506e-16], [-2.220446049250313e-16, 0.0, -1.0130785099704553e-15], [7.172040739078511e-14, 0.0, -3.788636071533347e-15], [-3.397282455352979e-14, 0.0, -5.828670879282072e-16], [3.930189507173054e-14, 0.0, -2.1094237467877974e-15], [-2.6423307986078726e-14, 0.0, 8.326672684688674e-16], [-8.881784197001252e-16, 0.0, 4.440892098500626e-16], [3.108624468950438e-14, 0.0, -9.020562075079397e-16], [2.6201263381153694e-14, 0.0, -2.456368441983159e-15], [5.995204332975845e-15, 0.0, 4.0245584642661925e-16], [-1.021405182655144e-14, 0.0, -1.5265566588595902e-15], [1.2656542480726785e-14, 0.0, -8.326672684688674e-17], [2.398081733190338e-14, 0.0, -8.049116928532385e-16], [4.884981308350689e-15, 0.0, 1.7763568394002505e-15], [2.5757174171303632e-14, 0.0, -1.4432899320127035e-15], [-2.398081733190338e-14, 0.0, 1.1102230246251565e-15], [-8.43769498715119e-15, 0.0, 2.3592239273284576e-16], [-2.3092638912203256e-14, 0.0, -5.551115123125783e-16], [1.0658141036401503e-14, 0.0, -1.942890293094024e-16], [-1.7319479184152442e-14, 0.0, -4.787836793695988e-16], [-3.8191672047105385e-14, 0.0, 2.581268532253489e-15], [6.084022174945858e-14, 0.0, -3.5388358909926865e-15], [5.10702591327572e-14, 0.0, -3.635980405647388e-15], [-6.838973831690964e-14, 0.0, 2.9282132274488504e-15], [2.708944180085382e-14, 0.0, -1.3877787807814457e-17], [-1.1324274851176597e-14, 0.0, 5.898059818321144e-16], [5.240252676230739e-14, 0.0, -1.1934897514720433e-15], [-1.6209256159527285e-14, 0.0, 1.9012569296705806e-15], [3.530509218307998e-14, 0.0, -3.184952301893418e-15], [4.1744385725905886e-14, 0.0, -2.5049406993105094e-15], [-1.9984014443252818e-14, 0.0, 2.706168622523819e-15], [-3.064215547965432e-14, 0.0, 1.790234627208065e-15], [3.019806626980426e-14, 0.0, -1.6930901125533637e-15], [3.552713678800501e-15, 0.0, 1.5751289161869408e-15], [-7.549516567451064e-14, 0.0, 2.581268532253489e-15], [-2.4424906541753444e-14, 0.0, 8.743006318923108e-16], [-2.55351295663786e-14, 0.0, 1.3114509478384662e-15], [5.995204332975845e-14, 0.0, 1.5126788710517758e-15], [1.2878587085651816e-14, 0.0, -2.282896094385478e-15], [1.9984014443252818e-14, 0.0, 2.0261570199409107e-15], [-1.4210854715202004e-14, 0.0, -9.992007221626409e-16], [-7.149836278586008e-14, 0.0, 5.551115123125783e-16], [5.262457136723242e-14, 0.0, -8.465450562766819e-16], [4.529709940470639e-14, 0.0, -1.6237011735142914e-15], [-4.8405723873656825e-14, 0.0, 1.249000902703301e-16], [-4.8405723873656825e-14, 0.0, 1.6583956430338276e-15], [1.9984014443252818e-15, 0.0, 2.498001805406602e-16], [1.1812772982011666e-13, 0.0, -6.286637876939949e-15], [-2.113864638886298e-13, 0.0, 5.870304242705515e-15], [2.424727085781342e-13, 0.0, -1.0928757898653885e-14], [5.6621374255882984e-14, 0.0, -1.1927958620816526e-14], [-2.7400304247748863e-13, 0.0, 6.841749389252527e-15], [-5.200284647344233e-13, 0.0, 4.758693439299577e-14], [-7.216449660063518e-15, 0.0, -3.1183389204159084e-14], [8.384404281969182e-13, 0.0, -1.3322676295501878e-13]], "gravity_force_vector": [[0.0, 0.0, 462673.3285352873], [0.0, 0.0, 462673.273953621], [0.0, 0.0, 462673.1102275043], [0.0, 0.0, 462672.8374135788], [0.0, 0.0, 462672.45560622506], [0.0, 0.0, 462671.964937532], [0.0, 0.0, 462671.3655772518], [0.0, 0.0, 462670.65773274406], [0.0, 0.0, 462669.84164890443], [0.0, 0.0, 462668.91760808416], [0.0, 0.0, 462667.88592999417], [0.0, 0.0, 462666.7469715978], [0.0, 0.0, 462665.5011269914], [0.0, 0.0, 462664.14882727177], [0.0, 0.0, 462662.6905403909], [0.0, 0.0, 462661.1267709993], [0.0, 0.0, 462659.4580602762], [0.0, 0.0, 462657.68498574814], [0.0, 0.0, 462655.80816109356], [0.0, 0.0, 462653.8282359377], [0.0, 0.0, 462651.74589563377], [0.0, 0.0, 462649.56186103285], [0.0, 0.0, 462647.27688823995], [0.0, 0.0, 462644.8917683618], [0.0, 0.0, 462642.40732723835], [0.0, 0.0, 462639.82442516636], [0.0, 0.0, 462637.1439566092], [0.0, 0.0, 462634.36684989533], [0.0, 0.0, 462631.4940669054], [0.0, 0.0, 462628.5266027487], [0.0, 0.0, 462625.4654854275], [0.0, 0.0, 462622.3117754899], [0.0, 0.0, 462619.066565672], [0.0, 0.0, 462615.73098053003], [0.0, 0.0, 462612.30617606017], [0.0, 0.0, 462608.7933393075], [0.0, 0.0, 462605.1936879658], [0.0, 0.0, 462601.5084699665], [0.0, 0.0, 462597.7389630547], [0.0, 0.0, 462593.8864743595], [0.0, 0.0, 462589.9523399494], [0.0, 0.0, 462585.9379243817], [0.0, 0.0, 462581.84462023946], [0.0, 0.0, 462577.67384765984], [0.0, 0.0, 462573.4270538523], [0.0, 0.0, 462569.10571260826], [0.0, 0.0, 462564.7113238009], [0.0, 0.0, 462560.2454128754], [0.0, 0.0, 462555.7095303313], [0.0, 0.0, 462551.10525119584], [0.0, 0.0, 462546.4341744869], [0.0, 0.0, 462541.6979226707], [0.0, 0.0, 462536.89814110845], [0.0, 0.0, 462532.0364974962], [0.0, 0.0, 462527.1146812961], [0.0, 0.0, 462522.1344031611], [0.0, 0.0, 462517.09739434975], [0.0, 0.0, 462512.0054061372], [0.0, 0.0, 462506.8602092141], [0.0, 0.0, 462501.6635930841], [0.0, 0.0, 462496.4173654497], [0.0, 0.0, 462491.1233515944], [0.0, 0.0, 462485.7833937567], [0.0, 0.0, 462480.3993504994], [0.0, 0.0, 462474.97309607174], [0.0, 0.0, 462469.5065197661], [0.0, 0.0, 462464.00152526924], [0.0, 0.0, 462458.4600300072], [0.0, 0.0, 462452.8839644868], [0.0, 0.0, 462447.27527163055], [0.0, 0.0, 462441.6359061073], [0.0, 0.0, 462435.96783365845], [0.0, 0.0, 462430.2730304198], [0.0, 0.0, 462424.5534822394], [0.0, 0.0, 462418.8111839915], [0.0, 0.0, 462413.04813888576], [0.0, 0.0, 462407.26635777566], [0.0, 0.0, 462401.4678584604], [0.0, 0.0, 462395.65466498665], [0.0, 0.0, 462389.8288069463], [0.0, 0.0, 462383.9923187711], [0.0, 0.0, 462378.14723902644], [0.0, 0.0, 462372.29560970224], [0.0, 0.0, 462366.43947550247], [0.0, 0.0, 462360.58088313293], [0.0, 0.0, 462354.7218805872], [0.0, 0.0, 462348.86451643327], [0.0, 0.0, 462343.0108390969], [0.0, 0.0, 462337.1628961464], [0.0, 0.0, 462331.32273357647], [0.0, 0.0, 462325.4923950918], [0.0, 0.0, 462319.673921391], [0.0, 0.0, 462313.86934945063], [0.0, 0.0, 462308.0807118109], [0.0, 0.0, 462302.31003586156], [0.0, 0.0, 462296.55934312835], [0.0, 0.0, 462290.8306485624], [0.0, 0.0, 462285.1259598302], [0.0, 0.0, 462279.4472766062], [0.0, 0.0, 462273.7965898672], [0.0, 0.0, 462268.1758811889], [0.0, 0.0, 462262.58712204604], [0.0, 0.0, 462257.03227311507], [0.0, 0.0, 462251.5132835796], [0.0, 0.0, 462246.0320904402], [0.0, 0.0, 462240.5906178271], [0.0, 0.0, 462235.19077631744], [0.0, 0.0, 462229.8344622562], [0.0, 0.0, 462224.52355708287], [0.0, 0.0, 462219.2599266611], [0.0, 0.0, 462214.045420614], [0.0, 0.0, 462208.8818716657], [0.0, 0.0, 462203.77109498705], [0.0, 0.0, 462198.71488754725], [0.0, 0.0, 462193.7150274729], [0.0, 0.0, 462188.77327341045], [0.0, 0.0, 462183.891363898], [0.0, 0.0, 462179.0710167423], [0.0, 0.0, 462174.31392840267], [0.0, 0.0, 462169.62177338207], [0.0, 0.0, 462164.99620362726], [0.0, 0.0, 462160.4388479339], [0.0, 0.0, 462155.95131136087], [0.0, 0.0, 462151.535174654], [0.0, 0.0, 462147.1919936748], [0.0, 0.0, 462142.9232988412], [0.0, 0.0, 462138.7305945757], [0.0, 0.0, 462134.61535876116], [0.0, 0.0, 462130.579042208], [0.0, 0.0, 462126.6230681299], [0.0, 0.0, 462122.74883162807], [0.0, 0.0, 462118.9576991881], [0.0, 0.0, 462115.25100818335], [0.0, 0.0, 462111.6300663911], [0.0, 0.0, 462108.0961515188], [0.0, 0.0, 462104.6505107392], [0.0, 0.0, 462101.2943602389], [0.0, 0.0, 462098.0288847758], [0.0, 0.0, 462094.8552372489], [0.0, 0.0, 462091.77453827835], [0.0, 0.0, 462088.78787579865], [0.0, 0.0, 462085.8963046614], [0.0, 0.0, 462083.1008462526], [0.0, 0.0, 462080.4024881184], [0.0, 0.0, 462077.8021836072], [0.0, 0.0, 462075.3008515201], [0.0, 0.0, 462072.8993757766], [0.0, 0.0, 462070.5986050917], [0.0, 0.0, 462068.3993526653], [0.0, 0.0, 462066.30239588575], [0.0, 0.0, 462064.30847604567], [0.0, 0.0, 462062.41829807026], [0.0, 0.0, 462060.63253025984], [0.0, 0.0, 462058.9518040452], [0.0, 0.0, 462057.3767137568], [0.0, 0.0, 462055.90781640605], [0.0, 0.0, 462054.54563148273], [0.0, 0.0, 462053.29064076394], [0.0, 0.0, 462052.1432881372], [0.0, 0.0, 462051.10397943866], [0.0, 0.0, 462050.17308230285], [0.0, 0.0, 462049.3509260301], [0.0, 0.0, 462048.63780146337], [0.0, 0.0, 462048.0339608832], [0.0, 0.0, 462047.53961791453], [0.0, 0.0, 462047.1549474483], [0.0, 0.0, 462046.88008557755], [0.0, 0.0, 462046.715129547], [0.0, 0.0, 462046.66013771814]], "total_force_vector": [[9.607174433767796e-08, 0.0, -7.916241884231567e-09], [-6.553455023095012e-08, 0.0, 3.026798367500305e-09], [4.124740371480584e-08, 0.0, -1.9208528101444244e-09], [-2.5225745048373938e-08, 0.0, 1.5133991837501526e-09], [8.076312951743603e-10, 0.0, -4.0745362639427185e-10], [9.691575542092323e-09, 0.0, 1.1641532182693481e-10], [-6.7739165388047695e-09, 0.0, 2.9103830456733704e-10], [1.1365045793354511e-08, 0.0, -2.9103830456733704e-10], [5.4060365073382854e-09, 0.0, -5.238689482212067e-10], [-1.2223608791828156e-09, 0.0, -5.820766091346741e-11], [2.306478563696146e-09, 0.0, -1.7462298274040222e-10], [3.623426891863346e-09, 0.0, 2.3283064365386963e-10], [-4.933099262416363e-09, 0.0, -5.820766091346741e-11], [-2.8448994271457195e-09, 0.0, 3.4924596548080444e-10], [6.897607818245888e-09, 0.0, -5.820766091346741e-11], [-1.9208528101444244e-09, 0.0, -1.7462298274040222e-10], [-2.5902409106492996e-09, 0.0, 5.820766091346741e-11], [8.731149137020111e-09, 0.0, -4.0745362639427185e-10], [-6.002665031701326e-09, 0.0, 2.3283064365386963e-10], [-1.469743438065052e-09, 0.0, 2.3283064365386963e-10], [-4.656612873077393e-10, 0.0, 0.0], [-4.2637111619114876e-09, 0.0, 5.820766091346741e-11], [-1.0695657692849636e-09, 0.0, 0.0], [-2.08092387765646e-09, 0.0, 2.9103830456733704e-10], [-2.4010660126805305e-10, 0.0, -5.820766091346741e-11], [-1.775333657860756e-09, 0.0, 3.4924596548080444e-10], [-2.190063241869211e-09, 0.0, 2.9103830456733704e-10], [-2.546585164964199e-10, 0.0, -1.1641532182693481e-10], [2.0372681319713593e-10, 0.0, -1.7462298274040222e-10], [3.0631781555712223e-09, 0.0, -2.3283064365386963e-10], [-1.5279510989785194e-09, 0.0, 2.9103830456733704e-10], [1.7971615307033062e-09, 0.0, -4.656612873077393e-10], [9.677023626863956e-10, 0.0, 5.820766091346741e-11], [-2.5174813345074654e-09, 0.0, 5.820766091346741e-11], [-6.984919309616089e-10, 0.0, 5.820766091346741e-11], [-4.874891601502895e-10, 0.0, -5.820766091346741e-11], [8.076312951743603e-10, 0.0, -1.1641532182693481e-10], [-2.9831426218152046e-10, 0.0, 2.3283064365386963e-10], [4.321918822824955e-09, 0.0, 0.0], [-8.294591680169106e-10, 0.0, -1.7462298274040222e-10], [2.4010660126805305e-10, 0.0, 4.656612873077393e-10], [-6.83940015733242e-10, 0.0, 2.3283064365386963e-10], [1.1132215149700642e-09, 0.0, -1.7462298274040222e-10], [-4.0745362639427185e-10, 0.0, -5.820766091346741e-11], [-6.548361852765083e-11, 0.0, 1.7462298274040222e-10], [2.2337189875543118e-09, 0.0, -5.820766091346741e-11], [0.0, 0.0, 0.0], [2.393790055066347e-09, 0.0, -5.820766091346741e-11], [-1.3096723705530167e-10, 0.0, 2.3283064365386963e-10], [-7.057678885757923e-10, 0.0, 2.3283064365386963e-10], [2.713932190090418e-09, 0.0, 0.0], [4.802132025361061e-10, 0.0, -1.7462298274040222e-10], [-1.0695657692849636e-09, 0.0, 5.820766091346741e-11], [-1.1350493878126144e-09, 0.0, -1.1641532182693481e-10], [1.6370904631912708e-09, 0.0, -2.9103830456733704e-10], [-1.5061232261359692e-09, 0.0, 0.0], [1.0113581083714962e-09, 0.0, -5.820766091346741e-11], [-2.371962182223797e-09, 0.0, 2.9103830456733704e-10], [1.076841726899147e-09, 0.0, -5.820766091346741e-11], [1.0913936421275139e-10, 0.0, 1.1641532182693481e-10], [-8.003553375601768e-10, 0.0, 1.1641532182693481e-10], [3.5652192309498787e-10, 0.0, -2.3283064365386963e-10], [2.3283064365386963e-10, 0.0, -2.3283064365386963e-10], [-8.36735125631094e-10, 0.0, 5.820766091346741e-11], [-1.0913936421275139e-09, 0.0, 0.0], [6.402842700481415e-10, 0.0, 1.7462298274040222e-10], [2.9103830456733704e-10, 0.0, -1.1641532182693481e-10], [2.9103830456733704e-10, 0.0, 1.1641532182693481e-10], [-3.710738383233547e-10, 0.0, 1.1641532182693481e-10], [1.5934347175061703e-09, 0.0, 0.0], [1.2878444977104664e-09, 0.0, -1.1641532182693481e-10], [-1.9208528101444244e-09, 0.0, 2.9103830456733704e-10], [7.785274647176266e-10, 0.0, 1.1641532182693481e-10], [-8.87666828930378e-10, 0.0, -5.820766091346741e-11], [-1.8335413187742233e-09, 0.0, 5.820766091346741e-11], [8.658389560878277e-10, 0.0, -1.7462298274040222e-10], [-9.38598532229662e-10, 0.0, 5.820766091346741e-11], [0.0, 0.0, 5.820766091346741e-11], [-1.0040821507573128e-09, 0.0, -1.1641532182693481e-10], [9.968061931431293e-10, 0.0, -5.820766091346741e-11], [1.0695657692849636e-09, 0.0, -1.7462298274040222e-10], [1.4988472685217857e-09, 0.0, 0.0], [-2.6702764444053173e-09, 0.0, 1.7462298274040222e-10], [-1.3460521586239338e-09, 0.0, -2.9103830456733704e-10], [-2.6921043172478676e-09, 0.0, -5.820766091346741e-11], [9.968061931431293e-10, 0.0, -2.9103830456733704e-10], [-6.621121428906918e-10, 0.0, 2.3283064365386963e-10], [1.6880221664905548e-09, 0.0, -1.1641532182693481e-10], [-1.1859810911118984e-09, 0.0, 5.820766091346741e-11], [2.684828359633684e-09, 0.0, -1.7462298274040222e-10], [3.0122464522719383e-09, 0.0, -1.1641532182693481e-10], [1.1496013030409813e-09, 0.0, 1.1641532182693481e-10], [6.984919309616089e-10, 0.0, 5.820766091346741e-11], [1.775333657860756e-09, 0.0, -5.820766091346741e-11], [-1.760781742632389e-09, 0.0, 5.820766091346741e-11], [1.2369127944111824e-09, 0.0, 1.1641532182693481e-10], [-2.473825588822365e-10, 0.0, 5.820766091346741e-11], [-1.862645149230957e-09, 0.0, 1.1641532182693481e-10], [2.3137545213103294e-09, 0.0, 1.1641532182693481e-10], [5.748006515204906e-10, 0.0, -1.1641532182693481e-10], [1.9354047253727913e-09, 0.0, -4.656612873077393e-10], [1.760781742632389e-09, 0.0, -2.3283064365386963e-10], [2.444721758365631e-09, 0.0, -4.656612873077393e-10], [-2.561137080192566e-09, 0.0, 1.1641532182693481e-10], [2.954038791358471e-09, 0.0, -2.3283064365386963e-10], [-1.8335413187742233e-09, 0.0, 1.7462298274040222e-10], [2.6921043172478676e-09, 0.0, -2.9103830456733704e-10], [-1.1568772606551647e-09, 0.0, 0.0], [-6.766640581190586e-10, 0.0, -5.820766091346741e-11], [-6.548361852765083e-10, 0.0, -5.820766091346741e-11], [-2.255546860396862e-09, 0.0, 5.820766091346741e-11], [1.0186340659856796e-10, 0.0, -1.1641532182693481e-10], [-3.4924596548080444e-10, 0.0, 5.820766091346741e-11], [-6.83940015733242e-10, 0.0, 0.0], [6.83940015733242e-10, 0.0, 5.820766091346741e-11], [-3.637978807091713e-11, 0.0, -1.1641532182693481e-10], [3.383320290595293e-09, 0.0, -2.3283064365386963e-10], [-1.6152625903487206e-09, 0.0, 0.0], [1.877197064459324e-09, 0.0, -1.1641532182693481e-10], [-1.229636836796999e-09, 0.0, 5.820766091346741e-11], [-3.637978807091713e-11, 0.0, 2.3283064365386963e-10], [1.4551915228366852e-09, 0.0, 5.820766091346741e-11], [1.1932570487260818e-09, 0.0, -2.3283064365386963e-10], [2.9831426218152046e-10, 0.0, -5.820766091346741e-11], [-4.94765117764473e-10, 0.0, 0.0], [5.748006515204906e-10, 0.0, 2.3283064365386963e-10], [1.1568772606551647e-09, 0.0, 5.820766091346741e-11], [2.4010660126805305e-10, 0.0, 1.7462298274040222e-10], [1.2078089639544487e-09, 0.0, 0.0], [-1.1714291758835316e-09, 0.0, -5.820766091346741e-11], [-3.8562575355172157e-10, 0.0, -5.820766091346741e-11], [-1.0986695997416973e-09, 0.0, -1.1641532182693481e-10], [4.874891601502895e-10, 0.0, -1.7462298274040222e-10], [-8.512870408594608e-10, 0.0, -5.820766091346741e-11], [-1.7971615307033062e-09, 0.0, -5.820766091346741e-11], [2.8594513423740864e-09, 0.0, -3.4924596548080444e-10], [2.4010660126805305e-09, 0.0, -3.4924596548080444e-10], [-3.259629011154175e-09, 0.0, -1.1641532182693481e-10], [1.2732925824820995e-09, 0.0, 0.0], [-5.093170329928398e-10, 0.0, 2.9103830456733704e-10], [2.459273673593998e-09, 0.0, -2.3283064365386963e-10], [-7.494236342608929e-10, 0.0, 4.0745362639427185e-10], [1.6807462088763714e-09, 0.0, -1.1641532182693481e-10], [1.9354047253727913e-09, 0.0, -1.1641532182693481e-10], [-9.167706593871117e-10, 0.0, 4.0745362639427185e-10], [-1.4770193956792355e-09, 0.0, -5.820766091346741e-11], [1.3969838619232178e-09, 0.0, -1.1641532182693481e-10], [1.8189894035458565e-10, 0.0, 1.1641532182693481e-10], [-3.5433913581073284e-09, 0.0, 1.7462298274040222e-10], [-1.1568772606551647e-09, 0.0, -1.1641532182693481e-10], [-1.2150849215686321e-09, 0.0, 5.820766091346741e-11], [2.8230715543031693e-09, 0.0, -5.820766091346741e-11], [6.111804395914078e-10, 0.0, -1.7462298274040222e-10], [9.313225746154785e-10, 0.0, 1.1641532182693481e-10], [-6.475602276623249e-10, 0.0, 2.3283064365386963e-10], [-3.3614924177527428e-09, 0.0, -1.1641532182693481e-10], [2.459273673593998e-09, 0.0, -2.3283064365386963e-10], [2.1245796233415604e-09, 0.0, 0.0], [-2.291926648467779e-09, 0.0, 5.820766091346741e-11], [-2.291926648467779e-09, 0.0, 1.1641532182693481e-10], [7.275957614183426e-11, 0.0, -1.7462298274040222e-10], [5.558831617236137e-09, 0.0, -4.0745362639427185e-10], [-9.924406185746193e-09, 0.0, 6.402842700481415e-10], [1.1430529411882162e-08, 0.0, -8.149072527885437e-10], [2.648448571562767e-09, 0.0, -6.984919309616089e-10], [-1.2900272849947214e-08, 0.0, 4.656612873077393e-10], [-2.4498149286955595e-08, 0.0, 2.5029294192790985e-09], [-3.346940502524376e-10, 0.0, -1.57160684466362e-09], [3.952300176024437e-08, 0.0, -6.344635039567947e-09]], "time": [[9.590514066785845], [9.59790101822231], [9.620059289476009], [9.656981132283093], [9.708653635880983], [9.775058731522941], [9.856173198796345], [9.951968673742355], [10.062411658774163], [10.187463534390377], [10.327080572679414], [10.481213952610194], [10.649809777103794], [10.832809091880073], [11.030147906072704], [11.241757214605382], [11.467563022321395], [11.707486369858099], [11.961443361257308], [12.22934519330187], [12.511098186568207], [12.80660381818397], [13.11575875627934], [13.438454896119925], [13.774579397908623], [14.124014726243242], [14.486638691216067], [14.862324491140985], [15.250940756893293], [15.652351597846602], [16.06641664939082], [16.492991122014587], [16.931925851935038], [17.38306735325708], [17.84625787164408], [18.321335439481125], [18.808133932511556], [19.30648312792696], [19.816208763890423], [20.337132600472064], [20.869072481975646], [21.411842400634455], [21.965252561654168], [22.52910944957992], [23.103215895964453], [23.687371148313634], [24.28137094028518], [24.88500756311618], [25.4980699382543], [26.120343691167342], [26.75161122630535], [27.391651803189], [28.040241613597757], [28.69715385983072], [29.36215883401281], [30.035023998418623], [30.715514066785772], [31.403391086589394], [32.0984145222489], [32.80034133923808], [33.508926089068936], [34.22392099511966], [34.94507603927671], [35.672139049360716], [36.40485578730557], [37.1429700380599], [37.88622369917994], [38.634356871082275], [39.38710794792505], [40.14421370908586], [40.90540941120423], [41.67042888075664], [42.43900460713145], [43.21086783617174], [43.985748664152595], [44.763376132160616], [45.54347832084235], [46.32578244548854], [47.110014951420965], [47.895901609648554], [48.68316761275929], [49.47153767101436], [50.26073610861094], [51.05048696008009], [51.8405140667857], [52.63054117349132], [53.42029202496045], [54.209490462557056], [54.99786052081212], [55.78512652392286], [56.57101318215045], [57.35524568808287], [58.137549812729056], [58.91765200141079], [59.69527946941882], [60.47016029739968], [61.24202352643996], [62.01059925281478], [62.77561872236718], [63.53681442448556], [64.29392018564637], [65.04667126248914], [65.79480443439147], [66.53805809551152], [67.27617234626585], [68.0088890842107], [68.73595209429472], [69.45710713845178], [70.17210204450248], [70.88068679433333], [71.58261361132251], [72.27763704698202], [72.96551406678563], [73.6460041351528], [74.3188692995586], [74.98387427374071], [75.64078651997366], [76.28937633038242], [76.92941690726606], [77.56068444240407], [78.18295819531711], [78.79602057045525], [79.39965719328625], [79.99365698525779], [80.57781223760695], [81.15191868399148], [81.71577557191725], [82.26918573293695], [82.81195565159577], [83.34389553309934], [83.86481936968099], [84.37454500564446], [84.87289420105986], [85.35969269409027], [85.83477026192733], [86.29796078031434], [86.74910228163638], [87.18803701155683], [87.6146114841806], [88.02867653572481], [88.43008737667812], [88.81870364243044], [89.19438944235536], [89.55701340732817], [89.90644873566279], [90.2425732374515], [90.56526937729207], [90.87442431538744], [91.16992994700323], [91.45168294026955], [91.71958477231411], [91.97354176371331], [92.21346511125002], [92.43927091896603], [92.6508802274987], [92.84821904169135], [93.03121835646762], [93.19981418096123], [93.35394756089201], [93.49356459918104], [93.61861647479725], [93.72905945982907], [93.82485493477508], [93.90596940204847], [93.97237449769042], [94.02404700128832], [94.06096884409541], [94.08312711534911], [94.09051406678557]]}, "body": {"inertial_rotations": [[0.0, 0.16294959192074324, 0.0], [0.0, 0.1629499720091177, 0.0], [0.0, 0.16295111214906832, 0.0], [0.0, 0.16295301196517537, 0.0], [0.0, 0.16295567083181728, 0.0], [0.0, 0.16295908787337246, 0.0], [0.0, 0.16296326196443744, 0.0], [0.0, 0.16296819173012386, 0.0], [0.0, 0.162973875546433, 0.0], [0.0, 0.16298031154067988, 0.0], [0.0, 0.16298749759199516, 0.0], [0.0, 0.16299543133189068, 0.0], [0.0, 0.16300411014489075, 0.0], [0.0, 0.1630135311692284, 0.0], [0.0, 0.16302369129761388, 0.0], [0.0, 0.1630345871780656, 0.0], [0.0, 0.16304621521480567, 0.0], [0.0, 0.163058571569229, 0.0], [0.0, 0.16307165216093528, 0.0], [0.0, 0.16308545266882402, 0.0], [0.0, 0.1630999685322666, 0.0], [0.0, 0.16311519495233537, 0.0], [0.0, 0.16313112689310416, 0.0], [0.0, 0.16314775908301782, 0.0], [0.0, 0.1631650860163239, 0.0], [0.0, 0.1631831019545763, 0.0], [0.0, 0.16320180092820283, 0.0], [0.0, 0.16322117673814185, 0.0], [0.0, 0.16324122295754512, 0.0], [0.0, 0.16326193293354901, 0.0], [0.0, 0.1632832997891125, 0.0], [0.0, 0.1633053164249211, 0.0], [0.0, 0.16332797552136102, 0.0], [0.0, 0.16335126954055842, 0.0], [0.0, 0.16337519072848608, 0.0], [0.0, 0.16339973111713857, 0.0], [0.0, 0.16342488252677312, 0.0], [0.0, 0.16345063656821926, 0.0], [0.0, 0.16347698464525368, 0.0], [0.0, 0.16350391795704453, 0.0], [0.0, 0.16353142750065872, 0.0], [0.0, 0.16355950407364175, 0.0], [0.0, 0.16358813827665844, 0.0], [0.0, 0.16361732051620367, 0.0], [0.0, 0.1636470410073786, 0.0], [0.0, 0.16367728977673265, 0.0], [0.0, 0.16370805666517257, 0.0], [0.0, 0.16373933133093477, 0.0], [0.0, 0.1637711032526269, 0.0], [0.0, 0.16380336173233118, 0.0], [0.0, 0.163836095898774, 0.0], [0.0, 0.16386929471056141, 0.0], [0.0, 0.1639029469594757, 0.0], [0.0, 0.16393704127383937, 0.0], [0.0, 0.1639715661219394, 0.0], [0.0, 0.16400650981551762, 0.0], [0.0, 0.16404186051331981, 0.0], [0.0, 0.16407760622471168, 0.0], [0.0, 0.16411373481335084, 0.0], [0.0, 0.16415023400092515, 0.0], [0.0, 0.1641870913709472, 0.0], [0.0, 0.16422429437261046, 0.0], [0.0, 0.1642618303247047, 0.0], [0.0, 0.16429968641958864, 0.0], [0.0, 0.1643378497272216, 0.0], [0.0, 0.16437630719925017, 0.0], [0.0, 0.1644150456731533, 0.0], [0.0, 0.16445405187643986, 0.0], [0.0, 0.16449331243090307, 0.0], [0.0, 0.16453281385692625, 0.0], [0.0, 0.16457254257784268, 0.0], [0.0, 0.1646124849243452, 0.0], [0.0, 0.1646526271389471, 0.0], [0.0, 0.16469295538049322, 0.0], [0.0, 0.16473345572871617, 0.0], [0.0, 0.16477411418884305, 0.0], [0.0, 0.1648149166962454, 0.0], [0.0, 0.16485584912113466, 0.0], [0.0, 0.16489689727330056, 0.0], [0.0, 0.1649380469068914, 0.0], [0.0, 0.16497928372523482, 0.0], [0.0, 0.16502059338569713, 0.0], [0.0, 0.16506196150458113, 0.0], [0.0, 0.1651033736620583, 0.0], [0.0, 0.16514481540713769, 0.0], [0.0, 0.16518627226266563, 0.0], [0.0, 0.16522772973035843, 0.0], [0.0, 0.16526917329586235, 0.0], [0.0, 0.16531058843384386, 0.0], [0.0, 0.165351960613104, 0.0], [0.0, 0.1653932753017187, 0.0], [0.0, 0.16543451797219988, 0.0], [0.0, 0.1654756741066778, 0.0], [0.0, 0.16551672920210234, 0.0], [0.0, 0.16555766877546096, 0.0], [0.0, 0.16559847836900898, 0.0], [0.0, 0.1656391435555175, 0.0], [0.0, 0.16567964994352555, 0.0], [0.0, 0.16571998318260558, 0.0], [0.0, 0.1657601289686343, 0.0], [0.0, 0.1658000730490644, 0.0], [0.0, 0.16583980122820247, 0.0], [0.0, 0.16587929937248486, 0.0], [0.0, 0.16591855341575, 0.0], [0.0, 0.16595754936450685, 0.0], [0.0, 0.1659962733031978, 0.0], [0.0, 0.1660347113994479, 0.0], [0.0, 0.16607284990930657, 0.0], [0.0, 0.16611067518247277, 0.0], [0.0, 0.16614817366750367, 0.0], [0.0, 0.1661853319170052, 0.0], [0.0, 0.16622213659280008, 0.0], [0.0, 0.16625857447107267, 0.0], [0.0, 0.16629463244748674, 0.0], [0.0, 0.16633029754227494, 0.0], [0.0, 0.1663655569052972, 0.0], [0.0, 0.16640039782106325, 0.0], [0.0, 0.16643480771372227, 0.0], [0.0, 0.16646877415200953, 0.0], [0.0, 0.16650228485415564, 0.0], [0.0, 0.16653532769274884, 0.0], [0.0, 0.16656789069955286, 0.0], [0.0, 0.16659996207027453, 0.0], [0.0, 0.1666315301692809, 0.0], [0.0, 0.16666258353426225, 0.0], [0.0, 0.16669311088083827, 0.0], [0.0, 0.1667231011071066, 0.0], [0.0, 0.16675254329812833, 0.0], [0.0, 0.16678142673035165, 0.0], [0.0, 0.16680974087596792, 0.0], [0.0, 0.16683747540719954, 0.0], [0.0, 0.16686462020051834, 0.0], [0.0, 0.16689116534078816, 0.0], [0.0, 0.16691710112533392, 0.0], [0.0, 0.16694241806793222, 0.0], [0.0, 0.16696710690272107, 0.0], [0.0, 0.16699115858802896, 0.0], [0.0, 0.16701456431011755, 0.0], [0.0, 0.16703731548683773, 0.0], [0.0, 0.16705940377120007, 0.0], [0.0, 0.1670808210548487, 0.0], [0.0, 0.167101559471448, 0.0], [0.0, 0.16712161139997023, 0.0], [0.0, 0.1671409694678883, 0.0], [0.0, 0.16715962655427005, 0.0], [0.0, 0.1671775757927702, 0.0], [0.0, 0.1671948105745212, 0.0], [0.0, 0.16721132455092097, 0.0], [0.0, 0.1672271116363122, 0.0], [0.0, 0.16724216601055622, 0.0], [0.0, 0.16725648212149807, 0.0], [0.0, 0.16727005468731965, 0.0], [0.0, 0.16728287869878292, 0.0], [0.0, 0.16729494942135736, 0.0], [0.0, 0.1673062623972362, 0.0], [0.0, 0.1673168134472332, 0.0], [0.0, 0.16732659867256533, 0.0], [0.0, 0.16733561445651712, 0.0], [0.0, 0.167343857465984, 0.0], [0.0, 0.16735132465289695, 0.0], [0.0, 0.16735801325552713, 0.0], [0.0, 0.16736392079966717, 0.0], [0.0, 0.16736904509969192, 0.0], [0.0, 0.1673733842594909, 0.0], [0.0, 0.16737693667328885, 0.0], [0.0, 0.16737970102632566, 0.0], [0.0, 0.16738167629542522, 0.0], [0.0, 0.16738286174943418, 0.0], [0.0, 0.16738325694953446, 0.0]], "transform_to_inertial": [[[0.9867530658807387, 0.0, 0.16222942696983972], [0.0, 1.0, 0.0], [-0.16222942696983972, 0.0, 0.9867530658807387]], [[0.9867530042191482, 0.0, 0.1622298020231968], [0.0, 1.0, 0.0], [-0.1622298020231968, 0.0, 0.9867530042191482]], [[0.9867528192538284, 0.0, 0.16223092705961287], [0.0, 1.0, 0.0], [-0.16223092705961287, 0.0, 0.9867528192538284]], [[0.9867525110431193, 0.0, 0.16223280170821977], [0.0, 1.0, 0.0], [-0.16223280170821977, 0.0, 0.9867525110431193]], [[0.9867520796842467, 0.0, 0.16223542535098176], [0.0, 1.0, 0.0], [-0.16223542535098176, 0.0, 0.9867520796842467]], [[0.9867515253132958, 0.0, 0.16223879712289554], [0.0, 1.0, 0.0], [-0.16223879712289554, 0.0, 0.9867515253132958]], [[0.9867508481051863, 0.0, 0.16224291591220735], [0.0, 1.0, 0.0], [-0.16224291591220735, 0.0, 0.9867508481051863]], [[0.9867500482736362, 0.0, 0.16224778036070792], [0.0, 1.0, 0.0], [-0.16224778036070792, 0.0, 0.9867500482736362]], [[0.9867491260711173, 0.0, 0.16225338886410454], [0.0, 1.0, 0.0], [-0.16225338886410454, 0.0, 0.9867491260711173]], [[0.9867480817888035, 0.0, 0.16225973957244255], [0.0, 1.0, 0.0], [-0.16225973957244255, 0.0, 0.9867480817888035]], [[0.986746915756511, 0.0, 0.162266830390604], [0.0, 1.0, 0.0], [-0.162266830390604, 0.0, 0.986746915756511]], [[0.98674562834263, 0.0, 0.16227465897886936], [0.0, 1.0, 0.0], [-0.16227465897886936, 0.0, 0.98674562834263]], [[0.9867442199540484, 0.0, 0.16228322275354487], [0.0, 1.0, 0.0], [-0.16228322275354487, 0.0, 0.9867442199540484]], [[0.9867426910360676, 0.0, 0.16229251888765417], [0.0, 1.0, 0.0], [-0.16229251888765417, 0.0, 0.9867426910360676]], [[0.98674104207231, 0.0, 0.16230254431170177], [0.0, 1.0, 0.0], [-0.16230254431170177, 0.0, 0.98674104207231]], [[0.9867392735846171, 0.0, 0.16231329571449848], [0.0, 1.0, 0.0], [-0.16231329571449848, 0.0, 0.9867392735846171]], [[0.986737386132942, 0.0, 0.16232476954405103], [0.0, 1.0, 0.0], [-0.16232476954405103, 0.0, 0.986737386132942]], [[0.9867353803152306, 0.0, 0.16233696200852474], [0.0, 1.0, 0.0], [-0.16233696200852474, 0.0, 0.9867353803152306]], [[0.9867332567672956, 0.0, 0.1623498690772683], [0.0, 1.0, 0.0], [-0.1623498690772683, 0.0, 0.9867332567672956]], [[0.9867310161626831, 0.0, 0.16236348648190188], [0.0, 1.0, 0.0], [-0.16236348648190188, 0.0, 0.9867310161626831]], [[0.9867286592125282, 0.0, 0.16237780971748073], [0.0, 1.0, 0.0], [-0.16237780971748073, 0.0, 0.9867286592125282]], [[0.9867261866654042, 0.0, 0.16239283404371607], [0.0, 1.0, 0.0], [-0.16239283404371607, 0.0, 0.9867261866654042]], [[0.9867235993071624, 0.0, 0.16240855448626654], [0.0, 1.0, 0.0], [-0.16240855448626654, 0.0, 0.9867235993071624]], [[0.986720897960762, 0.0, 0.16242496583809823], [0.0, 1.0, 0.0], [-0.16242496583809823, 0.0, 0.986720897960762]], [[0.9867180834860939, 0.0, 0.16244206266090624], [0.0, 1.0, 0.0], [-0.16244206266090624, 0.0, 0.9867180834860939]], [[0.986715156779792, 0.0, 0.16245983928660765], [0.0, 1.0, 0.0], [-0.16245983928660765, 0.0, 0.986715156779792]], [[0.9867121187750387, 0.0, 0.16247828981889792], [0.0, 1.0, 0.0], [-0.16247828981889792, 0.0, 0.9867121187750387]], [[0.9867089704413595, 0.0, 0.16249740813487568], [0.0, 1.0, 0.0], [-0.16249740813487568, 0.0, 0.9867089704413595]], [[0.9867057127844088, 0.0, 0.16251718788673314], [0.0, 1.0, 0.0], [-0.16251718788673314, 0.0, 0.9867057127844088]], [[0.9867023468457471, 0.0, 0.16253762250351428], [0.0, 1.0, 0.0], [-0.16253762250351428, 0.0, 0.9867023468457471]], [[0.986698873702608, 0.0, 0.1625587051929392], [0.0, 1.0, 0.0], [-0.1625587051929392, 0.0, 0.986698873702608]], [[0.9866952944676561, 0.0, 0.1625804289432938], [0.0, 1.0, 0.0], [-0.1625804289432938, 0.0, 0.9866952944676561]], [[0.986691610288736, 0.0, 0.16260278652538884], [0.0, 1.0, 0.0], [-0.16260278652538884, 0.0, 0.986691610288736]], [[0.9866878223486104, 0.0, 0.16262577049458368], [0.0, 1.0, 0.0], [-0.16262577049458368, 0.0, 0.9866878223486104]], [[0.9866839318646901, 0.0, 0.16264937319287665], [0.0, 1.0, 0.0], [-0.16264937319287665, 0.0, 0.9866839318646901]], [[0.9866799400887526, 0.0, 0.1626735867510631], [0.0, 1.0, 0.0], [-0.1626735867510631, 0.0, 0.9866799400887526]], [[0.9866758483066523, 0.0, 0.16269840309095873], [0.0, 1.0, 0.0], [-0.16269840309095873, 0.0, 0.9866758483066523]], [[0.9866716578380198, 0.0, 0.16272381392769059], [0.0, 1.0, 0.0], [-0.16272381392769059, 0.0, 0.9866716578380198]], [[0.9866673700359514, 0.0, 0.1627498107720528], [0.0, 1.0, 0.0], [-0.1627498107720528, 0.0, 0.9866673700359514]], [[0.9866629862866886, 0.0, 0.162776384932931], [0.0, 1.0, 0.0], [-0.162776384932931, 0.0, 0.9866629862866886]], [[0.9866585080092876, 0.0, 0.1628035275197888], [0.0, 1.0, 0.0], [-0.1628035275197888, 0.0, 0.9866585080092876]], [[0.9866539366552773, 0.0, 0.1628312294452261], [0.0, 1.0, 0.0], [-0.1628312294452261, 0.0, 0.9866539366552773]], [[0.9866492737083091, 0.0, 0.16285948142759754], [0.0, 1.0, 0.0], [-0.16285948142759754, 0.0, 0.9866492737083091]], [[0.9866445206837938, 0.0, 0.16288827399370012], [0.0, 1.0, 0.0], [-0.16288827399370012, 0.0, 0.9866445206837938]], [[0.9866396791285296, 0.0, 0.16291759748152534], [0.0, 1.0, 0.0], [-0.16291759748152534, 0.0, 0.9866396791285296]], [[0.9866347506203186, 0.0, 0.1629474420430765], [0.0, 1.0, 0.0], [-0.1629474420430765, 0.0, 0.9866347506203186]], [[0.9866297367675735, 0.0, 0.16297779764725184], [0.0, 1.0, 0.0], [-0.16297779764725184, 0.0, 0.9866297367675735]], [[0.9866246392089126, 0.0, 0.16300865408279058], [0.0, 1.0, 0.0], [-0.16300865408279058, 0.0, 0.9866246392089126]], [[0.9866194596127443, 0.0, 0.16304000096128685], [0.0, 1.0, 0.0], [-0.16304000096128685, 0.0, 0.9866194596127443]], [[0.9866141996768404, 0.0, 0.1630718277202646], [0.0, 1.0, 0.0], [-0.1630718277202646, 0.0, 0.9866141996768404]], [[0.9866088611278995, 0.0, 0.16310412362631807], [0.0, 1.0, 0.0], [-0.16310412362631807, 0.0, 0.9866088611278995]], [[0.9866034457210975, 0.0, 0.16313687777831692], [0.0, 1.0, 0.0], [-0.16313687777831692, 0.0, 0.9866034457210975]], [[0.9865979552396291, 0.0, 0.16317007911067163], [0.0, 1.0, 0.0], [-0.16317007911067163, 0.0, 0.9865979552396291]], [[0.9865923914942365, 0.0, 0.16320371639666537], [0.0, 1.0, 0.0], [-0.16320371639666537, 0.0, 0.9865923914942365]], [[0.9865867563227279, 0.0, 0.163237778251845], [0.0, 1.0, 0.0], [-0.163237778251845, 0.0, 0.9865867563227279]], [[0.9865810515894837, 0.0, 0.16327225313747756], [0.0, 1.0, 0.0], [-0.16327225313747756, 0.0, 0.9865810515894837]], [[0.9865752791849535, 0.0, 0.16330712936406402], [0.0, 1.0, 0.0], [-0.16330712936406402, 0.0, 0.9865752791849535]], [[0.986569441025139, 0.0, 0.1633423950949193], [0.0, 1.0, 0.0], [-0.1633423950949193, 0.0, 0.986569441025139]], [[0.9865635390510684, 0.0, 0.16337803834980694], [0.0, 1.0, 0.0], [-0.16337803834980694, 0.0, 0.9865635390510684]], [[0.9865575752282572, 0.0, 0.1634140470086394], [0.0, 1.0, 0.0], [-0.1634140470086394, 0.0, 0.9865575752282572]], [[0.9865515515461587, 0.0, 0.1634504088152332], [0.0, 1.0, 0.0], [-0.1634504088152332, 0.0, 0.9865515515461587]], [[0.9865454700176042, 0.0, 0.16348711138112496], [0.0, 1.0, 0.0], [-0.16348711138112496, 0.0, 0.9865454700176042]], [[0.9865393326782294, 0.0, 0.16352414218944522], [0.0, 1.0, 0.0], [-0.16352414218944522, 0.0, 0.9865393326782294]], [[0.9865331415858914, 0.0, 0.163561488598849], [0.0, 1.0, 0.0], [-0.163561488598849, 0.0, 0.9865331415858914]], [[0.9865268988200745, 0.0, 0.16359913784750374], [0.0, 1.0, 0.0], [-0.16359913784750374, 0.0, 0.9865268988200745]], [[0.986520606481283, 0.0, 0.16363707705713149], [0.0, 1.0, 0.0], [-0.16363707705713149, 0.0, 0.986520606481283]], [[0.9865142666904247, 0.0, 0.16367529323710842], [0.0, 1.0, 0.0], [-0.16367529323710842, 0.0, 0.9865142666904247]], [[0.9865078815881826, 0.0, 0.16371377328861564], [0.0, 1.0, 0.0], [-0.16371377328861564, 0.0, 0.9865078815881826]], [[0.9865014533343744, 0.0, 0.16375250400884567], [0.0, 1.0, 0.0], [-0.16375250400884567, 0.0, 0.9865014533343744]], [[0.9864949841073029, 0.0, 0.16379147209525954], [0.0, 1.0, 0.0], [-0.16379147209525954, 0.0, 0.9864949841073029]], [[0.9864884761030935, 0.0, 0.16383066414989642], [0.0, 1.0, 0.0], [-0.16383066414989642, 0.0, 0.9864884761030935]], [[0.9864819315350227, 0.0, 0.1638700666837322], [0.0, 1.0, 0.0], [-0.1638700666837322, 0.0, 0.9864819315350227]], [[0.9864753526328336, 0.0, 0.16390966612108826], [0.0, 1.0, 0.0], [-0.16390966612108826, 0.0, 0.9864753526328336]], [[0.9864687416420428, 0.0, 0.1639494488040891], [0.0, 1.0, 0.0], [-0.1639494488040891, 0.0, 0.9864687416420428]], [[0.9864621008232355, 0.0, 0.1639894009971644], [0.0, 1.0, 0.0], [-0.1639894009971644, 0.0, 0.9864621008232355]], [[0.9864554324513503, 0.0, 0.16402950889160003], [0.0, 1.0, 0.0], [-0.16402950889160003, 0.0, 0.9864554324513503]], [[0.9864487388149539, 0.0, 0.16406975861013173], [0.0, 1.0, 0.0], [-0.16406975861013173, 0.0, 0.9864487388149539]], [[0.9864420222155055, 0.0, 0.16411013621158266], [0.0, 1.0, 0.0], [-0.16411013621158266, 0.0, 0.9864420222155055]], [[0.986435284966611, 0.0, 0.16415062769554328], [0.0, 1.0, 0.0], [-0.16415062769554328, 0.0, 0.986435284966611]], [[0.9864285293932679, 0.0, 0.16419121900709177], [0.0, 1.0, 0.0], [-0.16419121900709177, 0.0, 0.9864285293932679]], [[0.9864217578310994, 0.0, 0.16423189604155405], [0.0, 1.0, 0.0], [-0.16423189604155405, 0.0, 0.9864217578310994]], [[0.9864149726255803, 0.0, 0.16427264464930122], [0.0, 1.0, 0.0], [-0.16427264464930122, 0.0, 0.9864149726255803]], [[0.9864081761312525, 0.0, 0.16431345064058447], [0.0, 1.0, 0.0], [-0.16431345064058447, 0.0, 0.9864081761312525]], [[0.9864013707109324, 0.0, 0.16435429979040347], [0.0, 1.0, 0.0], [-0.16435429979040347, 0.0, 0.9864013707109324]], [[0.9863945587349078, 0.0, 0.16439517784341018], [0.0, 1.0, 0.0], [-0.16439517784341018, 0.0, 0.9863945587349078]], [[0.9863877425801286, 0.0, 0.1644360705188429], [0.0, 1.0, 0.0], [-0.1644360705188429, 0.0, 0.9863877425801286]], [[0.9863809246293865, 0.0, 0.16447696351549185], [0.0, 1.0, 0.0], [-0.16447696351549185, 0.0, 0.9863809246293865]], [[0.9863741072704885, 0.0, 0.16451784251669158], [0.0, 1.0, 0.0], [-0.16451784251669158, 0.0, 0.9863741072704885]], [[0.986367292895421, 0.0, 0.16455869319534228], [0.0, 1.0, 0.0], [-0.16455869319534228, 0.0, 0.986367292895421]], [[0.9863604838995079, 0.0, 0.1645995012189546], [0.0, 1.0, 0.0], [-0.1645995012189546, 0.0, 0.9863604838995079]], [[0.9863536826805598, 0.0, 0.16464025225471943], [0.0, 1.0, 0.0], [-0.16464025225471943, 0.0, 0.9863536826805598]], [[0.9863468916380169, 0.0, 0.16468093197459752], [0.0, 1.0, 0.0], [-0.16468093197459752, 0.0, 0.9863468916380169]], [[0.9863401131720859, 0.0, 0.16472152606042964], [0.0, 1.0, 0.0], [-0.16472152606042964, 0.0, 0.9863401131720859]], [[0.9863333496828685, 0.0, 0.16476202020906483], [0.0, 1.0, 0.0], [-0.16476202020906483, 0.0, 0.9863333496828685]], [[0.986326603569486, 0.0, 0.16480240013750436], [0.0, 1.0, 0.0], [-0.16480240013750436, 0.0, 0.986326603569486]], [[0.986319877229197, 0.0, 0.1648426515880576], [0.0, 1.0, 0.0], [-0.1648426515880576, 0.0, 0.986319877229197]], [[0.9863131730565099, 0.0, 0.1648827603335145], [0.0, 1.0, 0.0], [-0.1648827603335145, 0.0, 0.9863131730565099]], [[0.9863064934422905, 0.0, 0.1649227121823217], [0.0, 1.0, 0.0], [-0.1649227121823217, 0.0, 0.9863064934422905]], [[0.9862998407728651, 0.0, 0.16496249298377147], [0.0, 1.0, 0.0], [-0.16496249298377147, 0.0, 0.9862998407728651]], [[0.9862932174291189, 0.0, 0.16500208863319493], [0.0, 1.0, 0.0], [-0.16500208863319493, 0.0, 0.9862932174291189]], [[0.9862866257855912, 0.0, 0.16504148507715627], [0.0, 1.0, 0.0], [-0.16504148507715627, 0.0, 0.9862866257855912]], [[0.9862800682095666, 0.0, 0.1650806683186518], [0.0, 1.0, 0.0], [-0.1650806683186518, 0.0, 0.9862800682095666]], [[0.9862735470601633, 0.0, 0.1651196244223072], [0.0, 1.0, 0.0], [-0.1651196244223072, 0.0, 0.9862735470601633]], [[0.9862670646874194, 0.0, 0.16515833951957007], [0.0, 1.0, 0.0], [-0.16515833951957007, 0.0, 0.9862670646874194]], [[0.9862606234313761, 0.0, 0.16519679981389865], [0.0, 1.0, 0.0], [-0.16519679981389865, 0.0, 0.9862606234313761]], [[0.9862542256211595, 0.0, 0.16523499158594426], [0.0, 1.0, 0.0], [-0.16523499158594426, 0.0, 0.9862542256211595]], [[0.9862478735740615, 0.0, 0.16527290119872012], [0.0, 1.0, 0.0], [-0.16527290119872012, 0.0, 0.9862478735740615]], [[0.98624156959462, 0.0, 0.16531051510276187], [0.0, 1.0, 0.0], [-0.16531051510276187, 0.0, 0.98624156959462]], [[0.9862353159736972, 0.0, 0.16534781984127164], [0.0, 1.0, 0.0], [-0.16534781984127164, 0.0, 0.9862353159736972]], [[0.9862291149875608, 0.0, 0.16538480205524517], [0.0, 1.0, 0.0], [-0.16538480205524517, 0.0, 0.9862291149875608]], [[0.9862229688969629, 0.0, 0.1654214484885808], [0.0, 1.0, 0.0], [-0.1654214484885808, 0.0, 0.9862229688969629]], [[0.9862168799462221, 0.0, 0.16545774599316568], [0.0, 1.0, 0.0], [-0.16545774599316568, 0.0, 0.9862168799462221]], [[0.9862108503623063, 0.0, 0.1654936815339389], [0.0, 1.0, 0.0], [-0.1654936815339389, 0.0, 0.9862108503623063]], [[0.9862048823539175, 0.0, 0.16552924219392726], [0.0, 1.0, 0.0], [-0.16552924219392726, 0.0, 0.9862048823539175]], [[0.9861989781105799, 0.0, 0.16556441517925302], [0.0, 1.0, 0.0], [-0.16556441517925302, 0.0, 0.9861989781105799]], [[0.9861931398017302, 0.0, 0.16559918782411046], [0.0, 1.0, 0.0], [-0.16559918782411046, 0.0, 0.9861931398017302]], [[0.9861873695758128, 0.0, 0.16563354759570686], [0.0, 1.0, 0.0], [-0.16563354759570686, 0.0, 0.9861873695758128]], [[0.9861816695593774, 0.0, 0.1656674820991705], [0.0, 1.0, 0.0], [-0.1656674820991705, 0.0, 0.9861816695593774]], [[0.9861760418561833, 0.0, 0.16570097908241632], [0.0, 1.0, 0.0], [-0.16570097908241632, 0.0, 0.9861760418561833]], [[0.9861704885463074, 0.0, 0.16573402644097404], [0.0, 1.0, 0.0], [-0.16573402644097404, 0.0, 0.9861704885463074]], [[0.9861650116852584, 0.0, 0.1657666122227699], [0.0, 1.0, 0.0], [-0.1657666122227699, 0.0, 0.9861650116852584]], [[0.9861596133030979, 0.0, 0.16579872463286435], [0.0, 1.0, 0.0], [-0.16579872463286435, 0.0, 0.9861596133030979]], [[0.9861542954035675, 0.0, 0.1658303520381399], [0.0, 1.0, 0.0], [-0.1658303520381399, 0.0, 0.9861542954035675]], [[0.9861490599632234, 0.0, 0.16586148297193887], [0.0, 1.0, 0.0], [-0.16586148297193887, 0.0, 0.9861490599632234]], [[0.9861439089305798, 0.0, 0.16589210613864794], [0.0, 1.0, 0.0], [-0.16589210613864794, 0.0, 0.9861439089305798]], [[0.9861388442252591, 0.0, 0.16592221041822602], [0.0, 1.0, 0.0], [-0.16592221041822602, 0.0, 0.9861388442252591]], [[0.9861338677371532, 0.0, 0.16595178487067555], [0.0, 1.0, 0.0], [-0.16595178487067555, 0.0, 0.9861338677371532]], [[0.9861289813255919, 0.0, 0.16598081874045123], [0.0, 1.0, 0.0], [-0.16598081874045123, 0.0, 0.9861289813255919]], [[0.9861241868185237, 0.0, 0.16600930146080786], [0.0, 1.0, 0.0], [-0.16600930146080786, 0.0, 0.9861241868185237]], [[0.9861194860117057, 0.0, 0.16603722265808138], [0.0, 1.0, 0.0], [-0.16603722265808138, 0.0, 0.9861194860117057]], [[0.9861148806679053, 0.0, 0.1660645721559025], [0.0, 1.0, 0.0], [-0.1660645721559025, 0.0, 0.9861148806679053]], [[0.9861103725161128, 0.0, 0.16609133997934206], [0.0, 1.0, 0.0], [-0.16609133997934206, 0.0, 0.9861103725161128]], [[0.9861059632507673, 0.0, 0.16611751635898125], [0.0, 1.0, 0.0], [-0.16611751635898125, 0.0, 0.9861059632507673]], [[0.9861016545309947, 0.0, 0.16614309173490985], [0.0, 1.0, 0.0], [-0.16614309173490985, 0.0, 0.9861016545309947]], [[0.9860974479798589, 0.0, 0.16616805676064653], [0.0, 1.0, 0.0], [-0.16616805676064653, 0.0, 0.9860974479798589]], [[0.9860933451836266, 0.0, 0.16619240230698], [0.0, 1.0, 0.0], [-0.16619240230698, 0.0, 0.9860933451836266]], [[0.9860893476910467, 0.0, 0.1662161194657305], [0.0, 1.0, 0.0], [-0.1662161194657305, 0.0, 0.9860893476910467]], [[0.9860854570126446, 0.0, 0.16623919955342606], [0.0, 1.0, 0.0], [-0.16623919955342606, 0.0, 0.9860854570126446]], [[0.9860816746200313, 0.0, 0.16626163411489378], [0.0, 1.0, 0.0], [-0.16626163411489378, 0.0, 0.9860816746200313]], [[0.9860780019452279, 0.0, 0.16628341492676663], [0.0, 1.0, 0.0], [-0.16628341492676663, 0.0, 0.9860780019452279]], [[0.9860744403800076, 0.0, 0.16630453400089523], [0.0, 1.0, 0.0], [-0.16630453400089523, 0.0, 0.9860744403800076]], [[0.986070991275253, 0.0, 0.166324983587674], [0.0, 1.0, 0.0], [-0.166324983587674, 0.0, 0.986070991275253]], [[0.9860676559403312, 0.0, 0.1663447561792696], [0.0, 1.0, 0.0], [-0.1663447561792696, 0.0, 0.9860676559403312]], [[0.9860644356424865, 0.0, 0.16636384451275635], [0.0, 1.0, 0.0], [-0.16636384451275635, 0.0, 0.9860644356424865]], [[0.9860613316062508, 0.0, 0.1663822415731545], [0.0, 1.0, 0.0], [-0.1663822415731545, 0.0, 0.9860613316062508]], [[0.9860583450128725, 0.0, 0.16639994059636823], [0.0, 1.0, 0.0], [-0.16639994059636823, 0.0, 0.9860583450128725]], [[0.9860554769997648, 0.0, 0.1664169350720239], [0.0, 1.0, 0.0], [-0.1664169350720239, 0.0, 0.9860554769997648]], [[0.9860527286599724, 0.0, 0.16643321874620728], [0.0, 1.0, 0.0], [-0.16643321874620728, 0.0, 0.9860527286599724]], [[0.9860501010416582, 0.0, 0.16644878562409401], [0.0, 1.0, 0.0], [-0.16644878562409401, 0.0, 0.9860501010416582]], [[0.9860475951476108, 0.0, 0.16646362997247638], [0.0, 1.0, 0.0], [-0.16646362997247638, 0.0, 0.9860475951476108]], [[0.9860452119347706, 0.0, 0.16647774632218354], [0.0, 1.0, 0.0], [-0.16647774632218354, 0.0, 0.9860452119347706]], [[0.9860429523137789, 0.0, 0.16649112947039135], [0.0, 1.0, 0.0], [-0.16649112947039135, 0.0, 0.9860429523137789]], [[0.9860408171485462, 0.0, 0.16650377448282458], [0.0, 1.0, 0.0], [-0.16650377448282458, 0.0, 0.9860408171485462]], [[0.9860388072558426, 0.0, 0.1665156766958452], [0.0, 1.0, 0.0], [-0.1665156766958452, 0.0, 0.9860388072558426]], [[0.9860369234049104, 0.0, 0.16652683171843138], [0.0, 1.0, 0.0], [-0.16652683171843138, 0.0, 0.9860369234049104]], [[0.9860351663170981, 0.0, 0.16653723543403967], [0.0, 1.0, 0.0], [-0.16653723543403967, 0.0, 0.9860351663170981]], [[0.9860335366655164, 0.0, 0.16654688400235432], [0.0, 1.0, 0.0], [-0.16654688400235432, 0.0, 0.9860335366655164]], [[0.9860320350747179, 0.0, 0.16655577386092116], [0.0, 1.0, 0.0], [-0.16655577386092116, 0.0, 0.9860320350747179]], [[0.9860306621203981, 0.0, 0.16656390172666233], [0.0, 1.0, 0.0], [-0.16656390172666233, 0.0, 0.9860306621203981]], [[0.986029418329121, 0.0, 0.1665712645972745], [0.0, 1.0, 0.0], [-0.1665712645972745, 0.0, 0.986029418329121]], [[0.9860283041780663, 0.0, 0.16657785975250936], [0.0, 1.0, 0.0], [-0.16657785975250936, 0.0, 0.9860283041780663]], [[0.9860273200948013, 0.0, 0.16658368475533286], [0.0, 1.0, 0.0], [-0.16658368475533286, 0.0, 0.9860273200948013]], [[0.9860264664570757, 0.0, 0.16658873745296648], [0.0, 1.0, 0.0], [-0.16658873745296648, 0.0, 0.9860264664570757]], [[0.9860257435926406, 0.0, 0.16659301597780216], [0.0, 1.0, 0.0], [-0.16659301597780216, 0.0, 0.9860257435926406]], [[0.9860251517790903, 0.0, 0.16659651874820766], [0.0, 1.0, 0.0], [-0.16659651874820766, 0.0, 0.9860251517790903]], [[0.9860246912437304, 0.0, 0.1665992444691938], [0.0, 1.0, 0.0], [-0.1665992444691938, 0.0, 0.9860246912437304]], [[0.9860243621634672, 0.0, 0.1666011921329728], [0.0, 1.0, 0.0], [-0.1666011921329728, 0.0, 0.9860243621634672]], [[0.9860241646647232, 0.0, 0.1666023610193888], [0.0, 1.0, 0.0], [-0.1666023610193888, 0.0, 0.9860241646647232]], [[0.9860240988233765, 0.0, 0.16660275069622457], [0.0, 1.0, 0.0], [-0.16660275069622457, 0.0, 0.9860240988233765]]], "thrust_force_vector": [[57551.09877367903, 0.0, 0.0], [57551.12909177618, 0.0, 0.0], [57551.22003754664, 0.0, 0.0], [57551.37158321654, 0.0, 0.0], [57551.5836834983, 0.0, 0.0], [57551.85627451716, 0.0, 0.0], [57552.18927429506, 0.0, 0.0], [57552.582582726565, 0.0, 0.0], [57553.03608140622, 0.0, 0.0], [57553.549633843155, 0.0, 0.0], [57554.12308538422, 0.0, 0.0], [57554.75626322311, 0.0, 0.0], [57555.44897645067, 0.0, 0.0], [57556.20101610232, 0.0, 0.0], [57557.01215513467, 0.0, 0.0], [57557.88214845532, 0.0, 0.0], [57558.81073303095, 0.0, 0.0], [57559.797627847816, 0.0, 0.0], [57560.842533930176, 0.0, 0.0], [57561.94513450621, 0.0, 0.0], [57563.105094901264, 0.0, 0.0], [57564.32206267341, 0.0, 0.0], [57565.595667655194, 0.0, 0.0], [57566.92552197111, 0.0, 0.0], [57568.31122013434, 0.0, 0.0], [57569.75233907549, 0.0, 0.0], [57571.24843822944, 0.0, 0.0], [57572.79905958803, 0.0, 0.0], [57574.40372776825, 0.0, 0.0], [57576.06195009914, 0.0, 0.0], [57577.773216678164, 0.0, 0.0], [57579.53700049154, 0.0, 0.0], [57581.35275744712, 0.0, 0.0], [57583.2199265058, 0.0, 0.0], [57585.13792976765, 0.0, 0.0], [57587.10617254941, 0.0, 0.0], [57589.1240435114, 0.0, 0.0], [57591.190914749364, 0.0, 0.0], [57593.30614192394, 0.0, 0.0], [57595.46906434242, 0.0, 0.0], [57597.679005134865, 0.0, 0.0], [57599.935271326016, 0.0, 0.0], [57602.23715400302, 0.0, 0.0], [57604.58392842921, 0.0, 0.0], [57606.9748542079, 0.0, 0.0], [57609.40917541394, 0.0, 0.0], [57611.886120745, 0.0, 0.0], [57614.40490370233, 0.0, 0.0], [57616.964722721044, 0.0, 0.0], [57619.56476137528, 0.0, 0.0], [57622.20418853261, 0.0, 0.0], [57624.88215852972, 0.0, 0.0], [57627.59781138751, 0.0, 0.0], [57630.35027298437, 0.0, 0.0], [57633.1386552621, 0.0, 0.0], [57635.96205642241, 0.0, 0.0], [57638.81956117006, 0.0, 0.0], [57641.710240889246, 0.0, 0.0], [57644.63315391676, 0.0, 0.0], [57647.58734572647, 0.0, 0.0], [57650.571849208245, 0.0, 0.0], [57653.585684895435, 0.0, 0.0], [57656.62786121466, 0.0, 0.0], [57659.69737475428, 0.0, 0.0], [57662.79321052811, 0.0, 0.0], [57665.91434224624, 0.0, 0.0], [57669.059732590424, 0.0, 0.0], [57672.22833351184, 0.0, 0.0], [57675.4190865152, 0.0, 0.0], [57678.630922966244, 0.0, 0.0], [57681.86276438672, 0.0, 0.0], [57685.113522780535, 0.0, 0.0], [57688.38210095979, 0.0, 0.0], [57691.667392843934, 0.0, 0.0], [57694.9682838282, 0.0, 0.0], [57698.28365110739, 0.0, 0.0], [57701.6123640144, 0.0, 0.0], [57704.95328440121, 0.0, 0.0], [57708.305266972166, 0.0, 0.0], [57711.667159673, 0.0, 0.0], [57715.03780404501, 0.0, 0.0], [57718.416035621995, 0.0, 0.0], [57721.80068430229, 0.0, 0.0], [57725.190574763175, 0.0, 0.0], [57728.584526825965, 0.0, 0.0], [57731.98135589443, 0.0, 0.0], [57735.379873330865, 0.0, 0.0], [57738.778886909415, 0.0, 0.0], [57742.177201198785, 0.0, 0.0], [57745.573618028604, 0.0, 0.0], [57748.96693687758, 0.0, 0.0], [57752.35595534392, 0.0, 0.0], [57755.73946957743, 0.0, 0.0], [57759.11627471993, 0.0, 0.0], [57762.485165353144, 0.0, 0.0], [57765.844935976784, 0.0, 0.0], [57769.19438142867, 0.0, 0.0], [57772.53229738435, 0.0, 0.0], [57775.85748081022, 0.0, 0.0], [57779.16873041428, 0.0, 0.0], [57782.46484715708, 0.0, 0.0], [57785.74463469378, 0.0, 0.0], [57789.00689987371, 0.0, 0.0], [57792.25045320505, 0.0, 0.0], [57795.47410937053, 0.0, 0.0], [57798.67668765278, 0.0, 0.0], [57801.857012498804, 0.0, 0.0], [57805.013913930736, 0.0, 0.0], [57808.14622810334, 0.0, 0.0], [57811.25279774633, 0.0, 0.0], [57814.33247267659, 0.0, 0.0], [57817.384110292565, 0.0, 0.0], [57820.406576046546, 0.0, 0.0], [57823.398743957434, 0.0, 0.0], [57826.35949709026, 0.0, 0.0], [57829.28772804146, 0.0, 0.0], [57832.18233944215, 0.0, 0.0], [57835.042244416465, 0.0, 0.0], [57837.866367113784, 0.0, 0.0], [57840.65364313056, 0.0, 0.0], [57843.403020047794, 0.0, 0.0], [57846.11345786774, 0.0, 0.0], [57848.78392950439, 0.0, 0.0], [57851.41342125553, 0.0, 0.0], [57854.00093326629, 0.0, 0.0], [57856.54547999256, 0.0, 0.0], [57859.04609065482, 0.0, 0.0], [57861.50180969665, 0.0, 0.0], [57863.911697236465, 0.0, 0.0], [57866.274829497415, 0.0, 0.0], [57868.59029926498, 0.0, 0.0], [57870.85721629585, 0.0, 0.0], [57873.074707762, 0.0, 0.0], [57875.241918651656, 0.0, 0.0], [57877.35801219849, 0.0, 0.0], [57879.42217027871, 0.0, 0.0], [57881.43359379008, 0.0, 0.0], [57883.39150306696, 0.0, 0.0], [57885.295138265596, 0.0, 0.0], [57887.14375968933, 0.0, 0.0], [57888.93664821079, 0.0, 0.0], [57890.67310557696, 0.0, 0.0], [57892.352454799344, 0.0, 0.0], [57893.97404044644, 0.0, 0.0], [57895.537228996596, 0.0, 0.0], [57897.04140915313, 0.0, 0.0], [57898.4859921386, 0.0, 0.0], [57899.87041198607, 0.0, 0.0], [57901.19412584046, 0.0, 0.0], [57902.456614229726, 0.0, 0.0], [57903.65738130261, 0.0, 0.0], [57904.79595511143, 0.0, 0.0], [57905.87188781905, 0.0, 0.0], [57906.88475596175, 0.0, 0.0], [57907.83416063242, 0.0, 0.0], [57908.71972770148, 0.0, 0.0], [57909.54110801137, 0.0, 0.0], [57910.29797752185, 0.0, 0.0], [57910.9900375162, 0.0, 0.0], [57911.61701474382, 0.0, 0.0], [57912.17866154329, 0.0, 0.0], [57912.67475598272, 0.0, 0.0], [57913.1051019459, 0.0, 0.0], [57913.46952933953, 0.0, 0.0], [57913.76789397473, 0.0, 0.0], [57914.00007785502, 0.0, 0.0], [57914.16598913515, 0.0, 0.0], [57914.2655622023, 0.0, 0.0], [57914.29875763527, 0.0, 0.0]]}, "wind": {"body_rotations": [[0.0, 0.11303317531370542, 0.0], [0.0, 0.1130335554020799, 0.0], [0.0, 0.11303469554203051, 0.0], [0.0, 0.11303659535813752, 0.0], [0.0, 0.11303925422477946, 0.0], [0.0, 0.11304267126633463, 0.0], [0.0, 0.11304684535739963, 0.0], [0.0, 0.11305177512308602, 0.0], [0.0, 0.11305745893939519, 0.0], [0.0, 0.11306389493364204, 0.0], [0.0, 0.11307108098495733, 0.0], [0.0, 0.11307901472485284, 0.0], [0.0, 0.11308769353785293, 0.0], [0.0, 0.11309711456219056, 0.0], [0.0, 0.11310727469057605, 0.0], [0.0, 0.11311817057102778, 0.0], [0.0, 0.11312979860776784, 0.0], [0.0, 0.11314215496219122, 0.0], [0.0, 0.11315523555389745, 0.0], [0.0, 0.1131690360617862, 0.0], [0.0, 0.11318355192522878, 0.0], [0.0, 0.11319877834529755, 0.0], [0.0, 0.11321471028606635, 0.0], [0.0, 0.11323134247597998, 0.0], [0.0, 0.1132486694092861, 0.0], [0.0, 0.11326668534753845, 0.0], [0.0, 0.11328538432116501, 0.0], [0.0, 0.11330476013110403, 0.0], [0.0, 0.11332480635050732, 0.0], [0.0, 0.11334551632651121, 0.0], [0.0, 0.11336688318207465, 0.0], [0.0, 0.11338889981788328, 0.0], [0.0, 0.11341155891432321, 0.0], [0.0, 0.11343485293352061, 0.0], [0.0, 0.11345877412144828, 0.0], [0.0, 0.11348331451010076, 0.0], [0.0, 0.11350846591973526, 0.0], [0.0, 0.11353421996118142, 0.0], [0.0, 0.11356056803821583, 0.0], [0.0, 0.11358750135000667, 0.0], [0.0, 0.11361501089362087, 0.0], [0.0, 0.11364308746660395, 0.0], [0.0, 0.11367172166962063, 0.0], [0.0, 0.11370090390916586, 0.0], [0.0, 0.11373062440034075, 0.0], [0.0, 0.11376087316969485, 0.0], [0.0, 0.11379164005813475, 0.0], [0.0, 0.11382291472389695, 0.0], [0.0, 0.11385468664558906, 0.0], [0.0, 0.11388694512529336, 0.0], [0.0, 0.11391967929173617, 0.0], [0.0, 0.11395287810352359, 0.0], [0.0, 0.11398653035243787, 0.0], [0.0, 0.11402062466680157, 0.0], [0.0, 0.11405514951490157, 0.0], [0.0, 0.1140900932084798, 0.0], [0.0, 0.11412544390628196, 0.0], [0.0, 0.11416118961767387, 0.0], [0.0, 0.11419731820631301, 0.0], [0.0, 0.11423381739388735, 0.0], [0.0, 0.11427067476390938, 0.0], [0.0, 0.11430787776557265, 0.0], [0.0, 0.11434541371766689, 0.0], [0.0, 0.11438326981255083, 0.0], [0.0, 0.1144214331201838, 0.0], [0.0, 0.11445989059221233, 0.0], [0.0, 0.11449862906611549, 0.0], [0.0, 0.11453763526940207, 0.0], [0.0, 0.11457689582386521, 0.0], [0.0, 0.11461639724988844, 0.0], [0.0, 0.11465612597080488, 0.0], [0.0, 0.11469606831730735, 0.0], [0.0, 0.11473621053190929, 0.0], [0.0, 0.11477653877345541, 0.0], [0.0, 0.11481703912167837, 0.0], [0.0, 0.11485769758180522, 0.0], [0.0, 0.1148985000892076, 0.0], [0.0, 0.11493943251409681, 0.0], [0.0, 0.11498048066626275, 0.0], [0.0, 0.11502163029985359, 0.0], [0.0, 0.115062867118197, 0.0], [0.0, 0.1151041767786593, 0.0], [0.0, 0.1151455448975433, 0.0], [0.0, 0.11518695705502051, 0.0], [0.0, 0.11522839880009986, 0.0], [0.0, 0.11526985565562785, 0.0], [0.0, 0.11531131312332059, 0.0], [0.0, 0.11535275668882451, 0.0], [0.0, 0.11539417182680604, 0.0], [0.0, 0.1154355440060662, 0.0], [0.0, 0.11547685869468087, 0.0], [0.0, 0.11551810136516207, 0.0], [0.0, 0.11555925749963995, 0.0], [0.0, 0.11560031259506452, 0.0], [0.0, 0.11564125216842312, 0.0], [0.0, 0.11568206176197116, 0.0], [0.0, 0.11572272694847971, 0.0], [0.0, 0.11576323333648772, 0.0], [0.0, 0.11580356657556776, 0.0], [0.0, 0.11584371236159646, 0.0], [0.0, 0.11588365644202661, 0.0], [0.0, 0.11592338462116465, 0.0], [0.0, 0.11596288276544703, 0.0], [0.0, 0.11600213680871216, 0.0], [0.0, 0.11604113275746906, 0.0], [0.0, 0.11607985669615997, 0.0], [0.0, 0.11611829479241008, 0.0], [0.0, 0.11615643330226874, 0.0], [0.0, 0.11619425857543494, 0.0], [0.0, 0.11623175706046585, 0.0], [0.0, 0.11626891530996739, 0.0], [0.0, 0.11630571998576228, 0.0], [0.0, 0.11634215786403486, 0.0], [0.0, 0.11637821584044893, 0.0], [0.0, 0.11641388093523711, 0.0], [0.0, 0.11644914029825937, 0.0], [0.0, 0.11648398121402544, 0.0], [0.0, 0.11651839110668444, 0.0], [0.0, 0.11655235754497169, 0.0], [0.0, 0.11658586824711781, 0.0], [0.0, 0.116618911085711, 0.0], [0.0, 0.11665147409251503, 0.0], [0.0, 0.11668354546323671, 0.0], [0.0, 0.11671511356224307, 0.0], [0.0, 0.11674616692722439, 0.0], [0.0, 0.11677669427380044, 0.0], [0.0, 0.11680668450006879, 0.0], [0.0, 0.1168361266910905, 0.0], [0.0, 0.11686501012331384, 0.0], [0.0, 0.11689332426893011, 0.0], [0.0, 0.11692105880016172, 0.0], [0.0, 0.11694820359348054, 0.0], [0.0, 0.11697474873375033, 0.0], [0.0, 0.1170006845182961, 0.0], [0.0, 0.11702600146089441, 0.0], [0.0, 0.11705069029568328, 0.0], [0.0, 0.11707474198099113, 0.0], [0.0, 0.11709814770307973, 0.0], [0.0, 0.11712089887979994, 0.0], [0.0, 0.11714298716416223, 0.0], [0.0, 0.11716440444781087, 0.0], [0.0, 0.11718514286441015, 0.0], [0.0, 0.1172051947929324, 0.0], [0.0, 0.11722455286085048, 0.0], [0.0, 0.11724320994723224, 0.0], [0.0, 0.1172611591857324, 0.0], [0.0, 0.1172783939674834, 0.0], [0.0, 0.11729490794388311, 0.0], [0.0, 0.11731069502927438, 0.0], [0.0, 0.11732574940351839, 0.0], [0.0, 0.11734006551446025, 0.0], [0.0, 0.11735363808028183, 0.0], [0.0, 0.11736646209174512, 0.0], [0.0, 0.11737853281431956, 0.0], [0.0, 0.11738984579019837, 0.0], [0.0, 0.11740039684019536, 0.0], [0.0, 0.11741018206552753, 0.0], [0.0, 0.11741919784947927, 0.0], [0.0, 0.11742744085894619, 0.0], [0.0, 0.11743490804585911, 0.0], [0.0, 0.11744159664848937, 0.0], [0.0, 0.11744750419262934, 0.0], [0.0, 0.11745262849265407, 0.0], [0.0, 0.11745696765245309, 0.0], [0.0, 0.11746052006625102, 0.0], [0.0, 0.11746328441928784, 0.0], [0.0, 0.11746525968838738, 0.0], [0.0, 0.11746644514239638, 0.0], [0.0, 0.11746684034249663, 0.0]], "velocity_vector": [[0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]], "lift_force_vector": [[0.0, 0.0, -455605.6984840491], [0.0, 0.0, -455605.61881578347], [0.0, 0.0, -455605.37983784056], [0.0, 0.0, -455604.981630995], [0.0, 0.0, -455604.42432973586], [0.0, 0.0, -455603.70812234207], [0.0, 0.0, -455602.8332507795], [0.0, 0.0, -455601.80001062143], [0.0, 0.0, -455600.6087509882], [0.0, 0.0, -455599.2598744133], [0.0, 0.0, -455597.75383673556], [0.0, 0.0, -455596.0911469595], [0.0, 0.0, -455594.2723671009], [0.0, 0.0, -455592.29811200756], [0.0, 0.0, -455590.1690491859], [0.0, 0.0, -455587.88589859265], [0.0, 0.0, -455585.44943240786], [0.0, 0.0, -455582.8604748112], [0.0, 0.0, -455580.1199017303], [0.0, 0.0, -455577.22864055977], [0.0, 0.0, -455574.18766989774], [0.0, 0.0, -455570.99801923416], [0.0, 0.0, -455567.66076863743], [0.0, 0.0, -455564.1770484306], [0.0, 0.0, -455560.5480388377], [0.0, 0.0, -455556.7749696257], [0.0, 0.0, -455552.85911972757], [0.0, 0.0, -455548.80181684706], [0.0, 0.0, -455544.6044370517], [0.0, 0.0, -455540.2684043486], [0.0, 0.0, -455535.7951902474], [0.0, 0.0, -455531.18631330214], [0.0, 0.0, -455526.4433386437], [0.0, 0.0, -455521.5678774975], [0.0, 0.0, -455516.56158667925], [0.0, 0.0, -455511.4261680847], [0.0, 0.0, -455506.1633681579], [0.0, 0.0, -455500.7749773495], [0.0, 0.0, -455495.2628295551], [0.0, 0.0, -455489.62880154746], [0.0, 0.0, -455483.87481238006], [0.0, 0.0, -455478.0028227978], [0.0, 0.0, -455472.01483461045], [0.0, 0.0, -455465.91289006884], [0.0, 0.0, -455459.69907121867], [0.0, 0.0, -455453.37549924525], [0.0, 0.0, -455446.9443338013], [0.0, 0.0, -455440.4077723202], [0.0, 0.0, -455433.7680493235], [0.0, 0.0, -455427.0274357054], [0.0, 0.0, -455420.1882380092], [0.0, 0.0, -455413.25279769424], [0.0, 0.0, -455406.22349038016], [0.0, 0.0, -455399.1027250906], [0.0, 0.0, -455391.8929434743], [0.0, 0.0, -455384.59661902266], [0.0, 0.0, -455377.2162562657], [0.0, 0.0, -455369.754389968], [0.0, 0.0, -455362.2135842993], [0.0, 0.0, -455354.5964320082], [0.0, 0.0, -455346.90555357194], [0.0, 0.0, -455339.1435963432], [0.0, 0.0, -455331.31323368254], [0.0, 0.0, -455323.4171640818], [0.0, 0.0, -455315.45811027684], [0.0, 0.0, -455307.43881834846], [0.0, 0.0, -455299.3620568176], [0.0, 0.0, -455291.2306157236], [0.0, 0.0, -455283.04730570293], [0.0, 0.0, -455274.81495704915], [0.0, 0.0, -455266.53641877125], [0.0, 0.0, -455258.2145576379], [0.0, 0.0, -455249.8522572172], [0.0, 0.0, -455241.4524169082], [0.0, 0.0, -455233.01795095997], [0.0, 0.0, -455224.55178748886], [0.0, 0.0, -455216.05686748726], [0.0, 0.0, -455207.5361438209], [0.0, 0.0, -455198.99258022715], [0.0, 0.0, -455190.4291502984], [0.0, 0.0, -455181.8488364685], [0.0, 0.0, -455173.2546289846], [0.0, 0.0, -455164.6495248816], [0.0, 0.0, -455156.0365269444], [0.0, 0.0, -455147.4186426715], [0.0, 0.0, -455138.79888323013], [0.0, 0.0, -455130.18026241125], [0.0, 0.0, -455121.5657955752], [0.0, 0.0, -455112.9584985998], [0.0, 0.0, -455104.3613868207], [0.0, 0.0, -455095.77747397515], [0.0, 0.0, -455087.209771137], [0.0, 0.0, -455078.66128565266], [0.0, 0.0, -455070.1350200777], [0.0, 0.0, -455061.63397111004], [0.0, 0.0, -455053.1611285196], [0.0, 0.0, -455044.71947408724], [0.0, 0.0, -455036.31198053074], [0.0, 0.0, -455027.9416104413], [0.0, 0.0, -455019.61131522054], [0.0, 0.0, -455011.3240340089], [0.0, 0.0, -455003.0826926285], [0.0, 0.0, -454994.8902025217], [0.0, 0.0, -454986.7494596911], [0.0, 0.0, -454978.663343645], [0.0, 0.0, -454970.6347163486], [0.0, 0.0, -454962.6664211711], [0.0, 0.0, -454954.7612818474], [0.0, 0.0, -454946.9221014349], [0.0, 0.0, -454939.15166128334], [0.0, 0.0, -454931.45272000425], [0.0, 0.0, -454923.82801244955], [0.0, 0.0, -454916.2802486968], [0.0, 0.0, -454908.8121130392], [0.0, 0.0, -454901.42626298417], [0.0, 0.0, -454894.1253282614], [0.0, 0.0, -454886.9119098334], [0.0, 0.0, -454879.78857892466], [0.0, 0.0, -454872.75787604577], [0.0, 0.0, -454865.82231004385], [0.0, 0.0, -454858.9843571467], [0.0, 0.0, -454852.24646003015], [0.0, 0.0, -454845.6110268875], [0.0, 0.0, -454839.08043051435], [0.0, 0.0, -454832.657007405], [0.0, 0.0, -454826.3430568589], [0.0, 0.0, -454820.1408401034], [0.0, 0.0, -454814.0525794233], [0.0, 0.0, -454808.0804573099], [0.0, 0.0, -454802.22661562095], [0.0, 0.0, -454796.49315475277], [0.0, 0.0, -454790.8821328336], [0.0, 0.0, -454785.3955649226], [0.0, 0.0, -454780.0354222326], [0.0, 0.0, -454774.8036313639], [0.0, 0.0, -454769.70207355317], [0.0, 0.0, -454764.73258394614], [0.0, 0.0, -454759.896950877], [0.0, 0.0, -454755.19691517006], [0.0, 0.0, -454750.6341694648], [0.0, 0.0, -454746.2103575459], [0.0, 0.0, -454741.92707370163], [0.0, 0.0, -454737.7858620986], [0.0, 0.0, -454733.78821617225], [0.0, 0.0, -454729.9355780409], [0.0, 0.0, -454726.22933793656], [0.0, 0.0, -454722.67083365424], [0.0, 0.0, -454719.2613500282], [0.0, 0.0, -454716.0021184194], [0.0, 0.0, -454712.8943162279], [0.0, 0.0, -454709.93906643003], [0.0, 0.0, -454707.1374371291], [0.0, 0.0, -454704.49044113496], [0.0, 0.0, -454701.9990355556], [0.0, 0.0, -454699.66412142396], [0.0, 0.0, -454697.4865433335], [0.0, 0.0, -454695.4670891025], [0.0, 0.0, -454693.60648946534], [0.0, 0.0, -454691.9054177751], [0.0, 0.0, -454690.3644897353], [0.0, 0.0, -454688.9842631575], [0.0, 0.0, -454687.7652377363], [0.0, 0.0, -454686.70785485243], [0.0, 0.0, -454685.81249738566], [0.0, 0.0, -454685.0794895831], [0.0, 0.0, -454684.5090969053], [0.0, 0.0, -454684.10152593325], [0.0, 0.0, -454683.8569242862], [0.0, 0.0, -454683.7753805568]], "drag_force_vector": [[-34098.434231540414, 0.0, 0.0], [-34098.464612427684, 0.0, 0.0], [-34098.555745835336, 0.0, 0.0], [-34098.70760402452, 0.0, 0.0], [-34098.92014075726, 0.0, 0.0], [-34099.193291314994, 0.0, 0.0], [-34099.52697250323, 0.0, 0.0], [-34099.92108266294, 0.0, 0.0], [-34100.375501688395, 0.0, 0.0], [-34100.89009104185, 0.0, 0.0], [-34101.46469377516, 0.0, 0.0], [-34102.09913455291, 0.0, 0.0], [-34102.79321967822, 0.0, 0.0], [-34103.54673712081, 0.0, 0.0], [-34104.35945654991, 0.0, 0.0], [-34105.23112936867, 0.0, 0.0], [-34106.161488750775, 0.0, 0.0], [-34107.150249682636, 0.0, 0.0], [-34108.19710900698, 0.0, 0.0], [-34109.30174546877, 0.0, 0.0], [-34110.463819767385, 0.0, 0.0], [-34111.68297460899, 0.0, 0.0], [-34112.95883476377, 0.0, 0.0], [-34114.291007127096, 0.0, 0.0], [-34115.6790807827, 0.0, 0.0], [-34117.12262707097, 0.0, 0.0], [-34118.62119966005, 0.0, 0.0], [-34120.17433462097, 0.0, 0.0], [-34121.7815505067, 0.0, 0.0], [-34123.442348435055, 0.0, 0.0], [-34125.15621217587, 0.0, 0.0], [-34126.92260824165, 0.0, 0.0], [-34128.74098598331, 0.0, 0.0], [-34130.610777689755, 0.0, 0.0], [-34132.531398691564, 0.0, 0.0], [-34134.50224747, 0.0, 0.0], [-34136.52270576966, 0.0, 0.0], [-34138.59213871666, 0.0, 0.0], [-34140.70989494079, 0.0, 0.0], [-34142.87530670349, 0.0, 0.0], [-34145.08769002937, 0.0, 0.0], [-34147.34634484476, 0.0, 0.0], [-34149.65055511934, 0.0, 0.0], [-34151.99958901459, 0.0, 0.0], [-34154.39269903652, 0.0, 0.0], [-34156.82912219463, 0.0, 0.0], [-34159.30808016579, 0.0, 0.0], [-34161.82877946373, 0.0, 0.0], [-34164.390411614775, 0.0, 0.0], [-34166.992153338644, 0.0, 0.0], [-34169.63316673534, 0.0, 0.0], [-34172.31259947825, 0.0, 0.0], [-34175.02958501252, 0.0, 0.0], [-34177.78324276026, 0.0, 0.0], [-34180.57267833119, 0.0, 0.0], [-34183.39698374007, 0.0, 0.0], [-34186.25523762955, 0.0, 0.0], [-34189.14650550037, 0.0, 0.0], [-34192.06983994667, 0.0, 0.0], [-34195.02428089888, 0.0, 0.0], [-34198.00885587203, 0.0, 0.0], [-34201.02258022107, 0.0, 0.0], [-34204.06445740249, 0.0, 0.0], [-34207.13347924245, 0.0, 0.0], [-34210.22862621155, 0.0, 0.0], [-34213.3488677058, 0.0, 0.0], [-34216.49316233471, 0.0, 0.0], [-34219.66045821507, 0.0, 0.0], [-34222.849693272314, 0.0, 0.0], [-34226.05979554747, 0.0, 0.0], [-34229.28968351129, 0.0, 0.0], [-34232.53826638441, 0.0, 0.0], [-34235.80444446417, 0.0, 0.0], [-34239.087109458174, 0.0, 0.0], [-34242.38514482345, 0.0, 0.0], [-34245.69742611269, 0.0, 0.0], [-34249.02282132649, 0.0, 0.0], [-34252.36019127158, 0.0, 0.0], [-34255.7083899257, 0.0, 0.0], [-34259.06626480793, 0.0, 0.0], [-34262.43265735562, 0.0, 0.0], [-34265.80640330658, 0.0, 0.0], [-34269.186333087746, 0.0, 0.0], [-34272.57127220869, 0.0, 0.0], [-34275.96004166156, 0.0, 0.0], [-34279.35145832584, 0.0, 0.0], [-34282.74433537883, 0.0, 0.0], [-34286.13748271086, 0.0, 0.0], [-34289.529707346024, 0.0, 0.0], [-34292.919813867265, 0.0, 0.0], [-34296.306604846926, 0.0, 0.0], [-34299.68888128111, 0.0, 0.0], [-34303.06544302872, 0.0, 0.0], [-34306.43508925492, 0.0, 0.0], [-34309.796618878456, 0.0, 0.0], [-34313.14883102235, 0.0, 0.0], [-34316.49052546948, 0.0, 0.0], [-34319.82050311985, 0.0, 0.0], [-34323.13756645261, 0.0, 0.0], [-34326.44051999053, 0.0, 0.0], [-34329.72817076659, 0.0, 0.0], [-34332.99932879419, 0.0, 0.0], [-34336.25280753925, 0.0, 0.0], [-34339.487424393934, 0.0, 0.0], [-34342.70200115272, 0.0, 0.0], [-34345.89536449022, 0.0, 0.0], [-34349.06634643939, 0.0, 0.0], [-34352.21378487184, 0.0, 0.0], [-34355.33652397825, 0.0, 0.0], [-34358.43341474957, 0.0, 0.0], [-34361.503315458394, 0.0, 0.0], [-34364.545092140186, 0.0, 0.0], [-34367.557619074476, 0.0, 0.0], [-34370.53977926507, 0.0, 0.0], [-34373.49046491959, 0.0, 0.0], [-34376.40857792793, 0.0, 0.0], [-34379.29303033863, 0.0, 0.0], [-34382.1427448346, 0.0, 0.0], [-34384.95665520511, 0.0, 0.0], [-34387.733706817366, 0.0, 0.0], [-34390.472857083514, 0.0, 0.0], [-34393.17307592617, 0.0, 0.0], [-34395.833346239604, 0.0, 0.0], [-34398.45266434775, 0.0, 0.0], [-34401.03004045863, 0.0, 0.0], [-34403.56449911376, 0.0, 0.0], [-34406.05507963396, 0.0, 0.0], [-34408.500836559644, 0.0, 0.0], [-34410.90084008636, 0.0, 0.0], [-34413.25417649484, 0.0, 0.0], [-34415.559948575115, 0.0, 0.0], [-34417.81727604529, 0.0, 0.0], [-34420.02529596301, 0.0, 0.0], [-34422.18316313118, 0.0, 0.0], [-34424.29005049647, 0.0, 0.0], [-34426.345149540415, 0.0, 0.0], [-34428.347670663716, 0.0, 0.0], [-34430.296843562064, 0.0, 0.0], [-34432.19191759416, 0.0, 0.0], [-34434.03216214225, 0.0, 0.0], [-34435.81686696273, 0.0, 0.0], [-34437.54534252906, 0.0, 0.0], [-34439.21692036519, 0.0, 0.0], [-34440.830953369645, 0.0, 0.0], [-34442.3868161303, 0.0, 0.0], [-34443.88390522918, 0.0, 0.0], [-34445.321639537055, 0.0, 0.0], [-34446.69946049859, 0.0, 0.0], [-34448.01683240606, 0.0, 0.0], [-34449.2732426628, 0.0, 0.0], [-34450.468202036274, 0.0, 0.0], [-34451.601244899226, 0.0, 0.0], [-34452.671929460455, 0.0, 0.0], [-34453.67983798315, 0.0, 0.0], [-34454.624576992974, 0.0, 0.0], [-34455.505777473016, 0.0, 0.0], [-34456.323095047745, 0.0, 0.0], [-34457.07621015502, 0.0, 0.0], [-34457.764828205145, 0.0, 0.0], [-34458.38867972799, 0.0, 0.0], [-34458.94752050827, 0.0, 0.0], [-34459.44113170741, 0.0, 0.0], [-34459.86931997372, 0.0, 0.0], [-34460.231917537974, 0.0, 0.0], [-34460.528782300185, 0.0, 0.0], [-34460.75979789811, 0.0, 0.0], [-34460.92487376726, 0.0, 0.0], [-34461.02394518638, 0.0, 0.0], [-34461.056973309496, 0.0, 0.0]], "transform_to_inertial": [[[0.9987544343347802, 0.0, 0.04989569016070804], [0.0, 1.0, 0.0], [-0.04989569016070804, 0.0, 0.9987544343347802]], [[0.9987544343347801, 0.0, 0.04989569016070801], [0.0, 1.0, 0.0], [-0.04989569016070801, 0.0, 0.9987544343347801]], [[0.9987544343347801, 0.0, 0.04989569016070804], [0.0, 1.0, 0.0], [-0.04989569016070804, 0.0, 0.9987544343347801]], [[0.9987544343347801, 0.0, 0.04989569016070804], [0.0, 1.0, 0.0], [-0.04989569016070804, 0.0, 0.9987544343347801]], [[0.9987544343347801, 0.0, 0.04989569016070802], [0.0, 1.0, 0.0], [-0.04989569016070802, 0.0, 0.9987544343347801]], [[0.9987544343347801, 0.0, 0.049895690160708064], [0.0, 1.0, 0.0], [-0.049895690160708064, 0.0, 0.9987544343347801]], [[0.9987544343347801, 0.0, 0.049895690160707995], [0.0, 1.0, 0.0], [-0.049895690160707995, 0.0, 0.9987544343347801]], [[0.9987544343347801, 0.0, 0.04989569016070805], [0.0, 1.0, 0.0], [-0.04989569016070805, 0.0, 0.9987544343347801]], [[0.9987544343347803, 0.0, 0.04989569016070802], [0.0, 1.0, 0.0], [-0.04989569016070802, 0.0, 0.9987544343347803]], [[0.9987544343347802, 0.0, 0.04989569016070804], [0.0, 1.0, 0.0], [-0.04989569016070804, 0.0, 0.9987544343347802]], [[0.9987544343347802, 0.0, 0.04989569016070804], [0.0, 1.0, 0.0], [-0.04989569016070804, 0.0, 0.9987544343347802]], [[0.9987544343347802, 0.0, 0.049895690160708064], [0.0, 1.0, 0.0], [-0.049895690160708064, 0.0, 0.9987544343347802]], [[0.9987544343347802, 0.0, 0.04989569016070802], [0.0, 1.0, 0.0], [-0.04989569016070802, 0.0, 0.9987544343347802]], [[0.9987544343347802, 0.0, 0.04989569016070805], [0.0, 1.0, 0.0], [-0.04989569016070805, 0.0, 0.9987544343347802]], [[0.9987544343347802, 0.0, 0.04989569016070805], [0.0, 1.0, 0.0], [-0.04989569016070805, 0.0, 0.9987544343347802]], [[0.9987544343347802, 0.0, 0.04989569016070802], [0.0, 1.0, 0.0], [-0.04989569016070802, 0.0, 0.9987544343347802]], [[0.9987544343347802, 0.0, 0.04989569016070804], [0.0, 1.0, 0.0], [-0.04989569016070804, 0.0, 0.9987544343347802]], [[0.9987544343347801, 0.0, 0.04989569016070802], [0.0, 1.0, 0.0], [-0.04989569016070802, 0.0, 0.9987544343347801]], [[0.9987544343347801, 0.0, 0.04989569016070804], [0.0, 1.0, 0.0], [-0.04989569016070804, 0.0, 0.9987544343347801]], [[0.9987544343347801, 0.0, 0.04989569016070804], [0.0, 1.0, 0.0], [-0.04989569016070804, 0.0, 0.9987544343347801]], [[0.9987544343347802, 0.0, 0.04989569016070804], [0.0, 1.0, 0.0], [-0.04989569016070804, 0.0, 0.9987544343347802]], [[0.9987544343347801, 0.0, 0.04989569016070804], [0.0, 1.0, 0.0], [-0.04989569016070804, 0.0, 0.9987544343347801]], [[0.9987544343347802, 0.0, 0.04989569016070801], [0.0, 1.0, 0.0], [-0.04989569016070801, 0.0, 0.9987544343347802]], [[0.9987544343347801, 0.0, 0.04989569016070804], [0.0, 1.0, 0.0], [-0.04989569016070804, 0.0, 0.9987544343347801]], [[0.9987544343347801, 0.0, 0.04989569016070801], [0.0, 1.0, 0.0], [-0.04989569016070801, 0.0, 0.9987544343347801]], [[0.9987544343347801, 0.0, 0.049895690160708064], [0.0, 1.0, 0.0], [-0.049895690160708064, 0.0, 0.9987544343347801]], [[0.9987544343347801, 0.0, 0.04989569016070801], [0.0, 1.0, 0.0], [-0.04989569016070801, 0.0, 0.9987544343347801]], [[0.9987544343347802, 0.0, 0.04989569016070801], [0.0, 1.0, 0.0], [-0.04989569016070801, 0.0, 0.9987544343347802]], [[0.9987544343347801, 0.0, 0.04989569016070802], [0.0, 1.0, 0.0], [-0.04989569016070802, 0.0, 0.9987544343347801]], [[0.9987544343347801, 0.0, 0.04989569016070802], [0.0, 1.0, 0.0], [-0.04989569016070802, 0.0, 0.9987544343347801]], [[0.9987544343347802, 0.0, 0.04989569016070804], [0.0, 1.0, 0.0], [-0.04989569016070804, 0.0, 0.9987544343347802]], [[0.9987544343347802, 0.0, 0.04989569016070804], [0.0, 1.0, 0.0], [-0.04989569016070804, 0.0, 0.9987544343347802]], [[0.9987544343347801, 0.0, 0.04989569016070804], [0.0, 1.0, 0.0], [-0.04989569016070804, 0.0, 0.9987544343347801]], [[0.9987544343347802, 0.0, 0.04989569016070804], [0.0, 1.0, 0.0], [-0.04989569016070804, 0.0, 0.9987544343347802]], [[0.9987544343347801, 0.0, 0.04989569016070802], [0.0, 1.0, 0.0], [-0.04989569016070802, 0.0, 0.9987544343347801]], [[0.9987544343347801, 0.0, 0.04989569016070802], [0.0, 1.0, 0.0], [-0.04989569016070802, 0.0, 0.9987544343347801]], [[0.9987544343347802, 0.0, 0.04989569016070805], [0.0, 1.0, 0.0], [-0.04989569016070805, 0.0, 0.9987544343347802]], [[0.9987544343347802, 0.0, 0.04989569016070805], [0.0, 1.0, 0.0], [-0.04989569016070805, 0.0, 0.9987544343347802]], [[0.9987544343347802, 0.0, 0.04989569016070805], [0.0, 1.0, 0.0], [-0.04989569016070805, 0.0, 0.9987544343347802]], [[0.9987544343347802, 0.0, 0.04989569016070805], [0.0, 1.0, 0.0], [-0.04989569016070805, 0.0, 0.9987544343347802]], [[0.9987544343347801, 0.0, 0.04989569016070804], [0.0, 1.0, 0.0], [-0.04989569016070804, 0.0, 0.9987544343347801]], [[0.9987544343347801, 0.0, 0.04989569016070801], [0.0, 1.0, 0.0], [-0.04989569016070801, 0.0, 0.9987544343347801]], [[0.9987544343347801, 0.0, 0.04989569016070801], [0.0, 1.0, 0.0], [-0.04989569016070801, 0.0, 0.9987544343347801]], [[0.9987544343347802, 0.0, 0.04989569016070802], [0.0, 1.0, 0.0], [-0.04989569016070802, 0.0, 0.9987544343347802]], [[0.9987544343347802, 0.0, 0.04989569016070804], [0.0, 1.0, 0.0], [-0.04989569016070804, 0.0, 0.9987544343347802]], [[0.9987544343347802, 0.0, 0.04989569016070802], [0.0, 1.0, 0.0], [-0.04989569016070802, 0.0, 0.9987544343347802]], [[0.9987544343347801, 0.0, 0.04989569016070804], [0.0, 1.0, 0.0], [-0.04989569016070804, 0.0, 0.9987544343347801]], [[0.9987544343347801, 0.0, 0.04989569016070804], [0.0, 1.0, 0.0], [-0.04989569016070804, 0.0, 0.9987544343347801]], [[0.9987544343347802, 0.0, 0.04989569016070805], [0.0, 1.0, 0.0], [-0.04989569016070805, 0.0, 0.9987544343347802]], [[0.9987544343347802, 0.0, 0.04989569016070805], [0.0, 1.0, 0.0], [-0.04989569016070805, 0.0, 0.9987544343347802]], [[0.9987544343347802, 0.0, 0.04989569016070802], [0.0, 1.0, 0.0], [-0.04989569016070802, 0.0, 0.9987544343347802]], [[0.9987544343347802, 0.0, 0.04989569016070802], [0.0, 1.0, 0.0], [-0.04989569016070802, 0.0, 0.9987544343347802]], [[0.9987544343347802, 0.0, 0.04989569016070802], [0.0, 1.0, 0.0], [-0.04989569016070802, 0.0, 0.9987544343347802]], [[0.9987544343347802, 0.0, 0.049895690160707995], [0.0, 1.0, 0.0], [-0.049895690160707995, 0.0, 0.9987544343347802]], [[0.9987544343347802, 0.0, 0.04989569016070802], [0.0, 1.0, 0.0], [-0.04989569016070802, 0.0, 0.9987544343347802]], [[0.9987544343347802, 0.0, 0.04989569016070802], [0.0, 1.0, 0.0], [-0.04989569016070802, 0.0, 0.9987544343347802]], [[0.9987544343347801, 0.0, 0.049895690160708064], [0.0, 1.0, 0.0], [-0.049895690160708064, 0.0, 0.9987544343347801]], [[0.9987544343347801, 0.0, 0.04989569016070802], [0.0, 1.0, 0.0], [-0.04989569016070802, 0.0, 0.9987544343347801]], [[0.9987544343347802, 0.0, 0.04989569016070805], [0.0, 1.0, 0.0], [-0.04989569016070805, 0.0, 0.9987544343347802]], [[0.9987544343347801, 0.0, 0.04989569016070802], [0.0, 1.0, 0.0], [-0.04989569016070802, 0.0, 0.9987544343347801]], [[0.9987544343347801, 0.0, 0.04989569016070805], [0.0, 1.0, 0.0], [-0.04989569016070805, 0.0, 0.9987544343347801]], [[0.9987544343347802, 0.0, 0.04989569016070804], [0.0, 1.0, 0.0], [-0.04989569016070804, 0.0, 0.9987544343347802]], [[0.9987544343347801, 0.0, 0.04989569016070801], [0.0, 1.0, 0.0], [-0.04989569016070801, 0.0, 0.9987544343347801]], [[0.9987544343347801, 0.0, 0.04989569016070804], [0.0, 1.0, 0.0], [-0.04989569016070804, 0.0, 0.9987544343347801]], [[0.9987544343347802, 0.0, 0.04989569016070802], [0.0, 1.0, 0.0], [-0.04989569016070802, 0.0, 0.9987544343347802]], [[0.9987544343347802, 0.0, 0.04989569016070804], [0.0, 1.0, 0.0], [-0.04989569016070804, 0.0, 0.9987544343347802]], [[0.9987544343347801, 0.0, 0.049895690160707995], [0.0, 1.0, 0.0], [-0.049895690160707995, 0.0, 0.9987544343347801]], [[0.9987544343347801, 0.0, 0.04989569016070804], [0.0, 1.0, 0.0], [-0.04989569016070804, 0.0, 0.9987544343347801]], [[0.9987544343347802, 0.0, 0.04989569016070805], [0.0, 1.0, 0.0], [-0.04989569016070805, 0.0, 0.9987544343347802]], [[0.9987544343347801, 0.0, 0.04989569016070801], [0.0, 1.0, 0.0], [-0.04989569016070801, 0.0, 0.9987544343347801]], [[0.9987544343347801, 0.0, 0.04989569016070801], [0.0, 1.0, 0.0], [-0.04989569016070801, 0.0, 0.9987544343347801]], [[0.9987544343347801, 0.0, 0.04989569016070805], [0.0, 1.0, 0.0], [-0.04989569016070805, 0.0, 0.9987544343347801]], [[0.9987544343347801, 0.0, 0.04989569016070802], [0.0, 1.0, 0.0], [-0.04989569016070802, 0.0, 0.9987544343347801]], [[0.9987544343347802, 0.0, 0.04989569016070802], [0.0, 1.0, 0.0], [-0.04989569016070802, 0.0, 0.9987544343347802]], [[0.9987544343347801, 0.0, 0.04989569016070801], [0.0, 1.0, 0.0], [-0.04989569016070801, 0.0, 0.9987544343347801]], [[0.9987544343347801, 0.0, 0.04989569016070804], [0.0, 1.0, 0.0], [-0.04989569016070804, 0.0, 0.9987544343347801]], [[0.9987544343347801, 0.0, 0.04989569016070801], [0.0, 1.0, 0.0], [-0.04989569016070801, 0.0, 0.9987544343347801]], [[0.9987544343347802, 0.0, 0.049895690160708064], [0.0, 1.0, 0.0], [-0.049895690160708064, 0.0, 0.9987544343347802]], [[0.9987544343347802, 0.0, 0.04989569016070804], [0.0, 1.0, 0.0], [-0.04989569016070804, 0.0, 0.9987544343347802]], [[0.9987544343347801, 0.0, 0.04989569016070801], [0.0, 1.0, 0.0], [-0.04989569016070801, 0.0, 0.9987544343347801]], [[0.9987544343347802, 0.0, 0.04989569016070802], [0.0, 1.0, 0.0], [-0.04989569016070802, 0.0, 0.9987544343347802]], [[0.9987544343347801, 0.0, 0.04989569016070804], [0.0, 1.0, 0.0], [-0.04989569016070804, 0.0, 0.9987544343347801]], [[0.9987544343347802, 0.0, 0.04989569016070802], [0.0, 1.0, 0.0], [-0.04989569016070802, 0.0, 0.9987544343347802]], [[0.9987544343347802, 0.0, 0.04989569016070801], [0.0, 1.0, 0.0], [-0.04989569016070801, 0.0, 0.9987544343347802]], [[0.9987544343347801, 0.0, 0.04989569016070802], [0.0, 1.0, 0.0], [-0.04989569016070802, 0.0, 0.9987544343347801]], [[0.9987544343347802, 0.0, 0.049895690160707995], [0.0, 1.0, 0.0], [-0.049895690160707995, 0.0, 0.9987544343347802]], [[0.9987544343347801, 0.0, 0.04989569016070804], [0.0, 1.0, 0.0], [-0.04989569016070804, 0.0, 0.9987544343347801]], [[0.9987544343347802, 0.0, 0.04989569016070805], [0.0, 1.0, 0.0], [-0.04989569016070805, 0.0, 0.9987544343347802]], [[0.9987544343347802, 0.0, 0.04989569016070805], [0.0, 1.0, 0.0], [-0.04989569016070805, 0.0, 0.9987544343347802]], [[0.9987544343347802, 0.0, 0.04989569016070802], [0.0, 1.0, 0.0], [-0.04989569016070802, 0.0, 0.9987544343347802]], [[0.9987544343347801, 0.0, 0.04989569016070804], [0.0, 1.0, 0.0], [-0.04989569016070804, 0.0, 0.9987544343347801]], [[0.99875443433478, 0.0, 0.04989569016070802], [0.0, 1.0, 0.0], [-0.04989569016070802, 0.0, 0.99875443433478]], [[0.9987544343347801, 0.0, 0.04989569016070804], [0.0, 1.0, 0.0], [-0.04989569016070804, 0.0, 0.9987544343347801]], [[0.9987544343347801, 0.0, 0.04989569016070804], [0.0, 1.0, 0.0], [-0.04989569016070804, 0.0, 0.9987544343347801]], [[0.9987544343347802, 0.0, 0.04989569016070805], [0.0, 1.0, 0.0], [-0.04989569016070805, 0.0, 0.9987544343347802]], [[0.9987544343347802, 0.0, 0.04989569016070805], [0.0, 1.0, 0.0], [-0.04989569016070805, 0.0, 0.9987544343347802]], [[0.9987544343347802, 0.0, 0.04989569016070801], [0.0, 1.0, 0.0], [-0.04989569016070801, 0.0, 0.9987544343347802]], [[0.9987544343347801, 0.0, 0.04989569016070804], [0.0, 1.0, 0.0], [-0.04989569016070804, 0.0, 0.9987544343347801]], [[0.9987544343347801, 0.0, 0.04989569016070804], [0.0, 1.0, 0.0], [-0.04989569016070804, 0.0, 0.9987544343347801]], [[0.9987544343347801, 0.0, 0.049895690160708064], [0.0, 1.0, 0.0], [-0.049895690160708064, 0.0, 0.9987544343347801]], [[0.9987544343347801, 0.0, 0.04989569016070801], [0.0, 1.0, 0.0], [-0.04989569016070801, 0.0, 0.9987544343347801]], [[0.9987544343347802, 0.0, 0.049895690160707995], [0.0, 1.0, 0.0], [-0.049895690160707995, 0.0, 0.9987544343347802]], [[0.9987544343347802, 0.0, 0.04989569016070802], [0.0, 1.0, 0.0], [-0.04989569016070802, 0.0, 0.9987544343347802]], [[0.9987544343347801, 0.0, 0.04989569016070802], [0.0, 1.0, 0.0], [-0.04989569016070802, 0.0, 0.9987544343347801]], [[0.9987544343347801, 0.0, 0.049895690160707995], [0.0, 1.0, 0.0], [-0.049895690160707995, 0.0, 0.9987544343347801]], [[0.9987544343347802, 0.0, 0.04989569016070804], [0.0, 1.0, 0.0], [-0.04989569016070804, 0.0, 0.9987544343347802]], [[0.9987544343347801, 0.0, 0.04989569016070802], [0.0, 1.0, 0.0], [-0.04989569016070802, 0.0, 0.9987544343347801]], [[0.9987544343347801, 0.0, 0.04989569016070802], [0.0, 1.0, 0.0], [-0.04989569016070802, 0.0, 0.9987544343347801]], [[0.9987544343347801, 0.0, 0.04989569016070801], [0.0, 1.0, 0.0], [-0.04989569016070801, 0.0, 0.9987544343347801]], [[0.9987544343347802, 0.0, 0.04989569016070802], [0.0, 1.0, 0.0], [-0.04989569016070802, 0.0, 0.9987544343347802]], [[0.9987544343347802, 0.0, 0.04989569016070805], [0.0, 1.0, 0.0], [-0.04989569016070805, 0.0, 0.9987544343347802]], [[0.9987544343347801, 0.0, 0.04989569016070801], [0.0, 1.0, 0.0], [-0.04989569016070801, 0.0, 0.9987544343347801]], [[0.9987544343347802, 0.0, 0.04989569016070804], [0.0, 1.0, 0.0], [-0.04989569016070804, 0.0, 0.9987544343347802]], [[0.9987544343347801, 0.0, 0.04989569016070802], [0.0, 1.0, 0.0], [-0.04989569016070802, 0.0, 0.9987544343347801]], [[0.9987544343347802, 0.0, 0.04989569016070804], [0.0, 1.0, 0.0], [-0.04989569016070804, 0.0, 0.9987544343347802]], [[0.9987544343347801, 0.0, 0.04989569016070804], [0.0, 1.0, 0.0], [-0.04989569016070804, 0.0, 0.9987544343347801]], [[0.9987544343347802, 0.0, 0.04989569016070804], [0.0, 1.0, 0.0], [-0.04989569016070804, 0.0, 0.9987544343347802]], [[0.9987544343347801, 0.0, 0.049895690160708064], [0.0, 1.0, 0.0], [-0.049895690160708064, 0.0, 0.9987544343347801]], [[0.9987544343347803, 0.0, 0.04989569016070804], [0.0, 1.0, 0.0], [-0.04989569016070804, 0.0, 0.9987544343347803]], [[0.9987544343347802, 0.0, 0.04989569016070802], [0.0, 1.0, 0.0], [-0.04989569016070802, 0.0, 0.9987544343347802]], [[0.9987544343347801, 0.0, 0.04989569016070802], [0.0, 1.0, 0.0], [-0.04989569016070802, 0.0, 0.9987544343347801]], [[0.9987544343347802, 0.0, 0.04989569016070805], [0.0, 1.0, 0.0], [-0.04989569016070805, 0.0, 0.9987544343347802]], [[0.9987544343347802, 0.0, 0.04989569016070805], [0.0, 1.0, 0.0], [-0.04989569016070805, 0.0, 0.9987544343347802]], [[0.9987544343347802, 0.0, 0.04989569016070802], [0.0, 1.0, 0.0], [-0.04989569016070802, 0.0, 0.9987544343347802]], [[0.9987544343347802, 0.0, 0.04989569016070805], [0.0, 1.0, 0.0], [-0.04989569016070805, 0.0, 0.9987544343347802]], [[0.9987544343347801, 0.0, 0.04989569016070804], [0.0, 1.0, 0.0], [-0.04989569016070804, 0.0, 0.9987544343347801]], [[0.9987544343347802, 0.0, 0.04989569016070801], [0.0, 1.0, 0.0], [-0.04989569016070801, 0.0, 0.9987544343347802]], [[0.9987544343347802, 0.0, 0.04989569016070802], [0.0, 1.0, 0.0], [-0.04989569016070802, 0.0, 0.9987544343347802]], [[0.9987544343347801, 0.0, 0.04989569016070801], [0.0, 1.0, 0.0], [-0.04989569016070801, 0.0, 0.9987544343347801]], [[0.9987544343347802, 0.0, 0.04989569016070804], [0.0, 1.0, 0.0], [-0.04989569016070804, 0.0, 0.9987544343347802]], [[0.9987544343347802, 0.0, 0.04989569016070804], [0.0, 1.0, 0.0], [-0.04989569016070804, 0.0, 0.9987544343347802]], [[0.9987544343347802, 0.0, 0.049895690160707995], [0.0, 1.0, 0.0], [-0.049895690160707995, 0.0, 0.9987544343347802]], [[0.9987544343347801, 0.0, 0.04989569016070804], [0.0, 1.0, 0.0], [-0.04989569016070804, 0.0, 0.9987544343347801]], [[0.9987544343347802, 0.0, 0.04989569016070805], [0.0, 1.0, 0.0], [-0.04989569016070805, 0.0, 0.9987544343347802]], [[0.9987544343347801, 0.0, 0.04989569016070804], [0.0, 1.0, 0.0], [-0.04989569016070804, 0.0, 0.9987544343347801]], [[0.9987544343347801, 0.0, 0.04989569016070801], [0.0, 1.0, 0.0], [-0.04989569016070801, 0.0, 0.9987544343347801]], [[0.9987544343347801, 0.0, 0.04989569016070802], [0.0, 1.0, 0.0], [-0.04989569016070802, 0.0, 0.9987544343347801]], [[0.9987544343347802, 0.0, 0.04989569016070804], [0.0, 1.0, 0.0], [-0.04989569016070804, 0.0, 0.9987544343347802]], [[0.9987544343347802, 0.0, 0.049895690160707995], [0.0, 1.0, 0.0], [-0.049895690160707995, 0.0, 0.9987544343347802]], [[0.9987544343347802, 0.0, 0.049895690160708064], [0.0, 1.0, 0.0], [-0.049895690160708064, 0.0, 0.9987544343347802]], [[0.9987544343347802, 0.0, 0.04989569016070802], [0.0, 1.0, 0.0], [-0.04989569016070802, 0.0, 0.9987544343347802]], [[0.9987544343347801, 0.0, 0.04989569016070804], [0.0, 1.0, 0.0], [-0.04989569016070804, 0.0, 0.9987544343347801]], [[0.9987544343347802, 0.0, 0.04989569016070802], [0.0, 1.0, 0.0], [-0.04989569016070802, 0.0, 0.9987544343347802]], [[0.9987544343347801, 0.0, 0.04989569016070804], [0.0, 1.0, 0.0], [-0.04989569016070804, 0.0, 0.9987544343347801]], [[0.9987544343347801, 0.0, 0.04989569016070804], [0.0, 1.0, 0.0], [-0.04989569016070804, 0.0, 0.9987544343347801]], [[0.9987544343347802, 0.0, 0.04989569016070804], [0.0, 1.0, 0.0], [-0.04989569016070804, 0.0, 0.9987544343347802]], [[0.9987544343347802, 0.0, 0.04989569016070804], [0.0, 1.0, 0.0], [-0.04989569016070804, 0.0, 0.9987544343347802]], [[0.9987544343347801, 0.0, 0.04989569016070805], [0.0, 1.0, 0.0], [-0.04989569016070805, 0.0, 0.9987544343347801]], [[0.9987544343347802, 0.0, 0.04989569016070802], [0.0, 1.0, 0.0], [-0.04989569016070802, 0.0, 0.9987544343347802]], [[0.9987544343347802, 0.0, 0.04989569016070802], [0.0, 1.0, 0.0], [-0.04989569016070802, 0.0, 0.9987544343347802]], [[0.9987544343347801, 0.0, 0.04989569016070805], [0.0, 1.0, 0.0], [-0.04989569016070805, 0.0, 0.9987544343347801]], [[0.9987544343347802, 0.0, 0.04989569016070805], [0.0, 1.0, 0.0], [-0.04989569016070805, 0.0, 0.9987544343347802]], [[0.9987544343347801, 0.0, 0.04989569016070798], [0.0, 1.0, 0.0], [-0.04989569016070798, 0.0, 0.9987544343347801]], [[0.9987544343347801, 0.0, 0.04989569016070802], [0.0, 1.0, 0.0], [-0.04989569016070802, 0.0, 0.9987544343347801]], [[0.9987544343347802, 0.0, 0.04989569016070802], [0.0, 1.0, 0.0], [-0.04989569016070802, 0.0, 0.9987544343347802]], [[0.9987544343347802, 0.0, 0.049895690160708064], [0.0, 1.0, 0.0], [-0.049895690160708064, 0.0, 0.9987544343347802]], [[0.9987544343347801, 0.0, 0.04989569016070802], [0.0, 1.0, 0.0], [-0.04989569016070802, 0.0, 0.9987544343347801]], [[0.9987544343347802, 0.0, 0.049895690160708064], [0.0, 1.0, 0.0], [-0.049895690160708064, 0.0, 0.9987544343347802]], [[0.9987544343347801, 0.0, 0.04989569016070802], [0.0, 1.0, 0.0], [-0.04989569016070802, 0.0, 0.9987544343347801]], [[0.9987544343347802, 0.0, 0.04989569016070805], [0.0, 1.0, 0.0], [-0.04989569016070805, 0.0, 0.9987544343347802]], [[0.9987544343347801, 0.0, 0.04989569016070798], [0.0, 1.0, 0.0], [-0.04989569016070798, 0.0, 0.9987544343347801]], [[0.9987544343347802, 0.0, 0.04989569016070804], [0.0, 1.0, 0.0], [-0.04989569016070804, 0.0, 0.9987544343347802]], [[0.9987544343347801, 0.0, 0.04989569016070804], [0.0, 1.0, 0.0], [-0.04989569016070804, 0.0, 0.9987544343347801]], [[0.9987544343347803, 0.0, 0.04989569016070801], [0.0, 1.0, 0.0], [-0.04989569016070801, 0.0, 0.9987544343347803]], [[0.9987544343347802, 0.0, 0.049895690160708064], [0.0, 1.0, 0.0], [-0.049895690160708064, 0.0, 0.9987544343347802]], [[0.9987544343347802, 0.0, 0.04989569016070802], [0.0, 1.0, 0.0], [-0.04989569016070802, 0.0, 0.9987544343347802]], [[0.9987544343347802, 0.0, 0.04989569016070804], [0.0, 1.0, 0.0], [-0.04989569016070804, 0.0, 0.9987544343347802]], [[0.9987544343347801, 0.0, 0.049895690160707995], [0.0, 1.0, 0.0], [-0.049895690160707995, 0.0, 0.9987544343347801]], [[0.9987544343347802, 0.0, 0.04989569016070802], [0.0, 1.0, 0.0], [-0.04989569016070802, 0.0, 0.9987544343347802]]]}, "planet": {"start_time": null, "latitude": [[0.006792151418946025], [0.006797705667862765], [0.006814366472252049], [0.006842128005710309], [0.0068809805598295855], [0.0069309105475932695], [0.006991900508128957], [0.007063929112815976], [0.007146971172746171], [0.007240997647534659], [0.007345975655478126], [0.007461868485056443], [0.007588635607774251], [0.007726232692337339], [0.007874611620159538], [0.008033720502194006], [0.008203503697083711], [0.008383901830624037], [0.008574851816531451], [0.008776286878510214], [0.008988136573610086], [0.00921032681686626], [0.009442779907213426], [0.009685414554664373], [0.009938145908744173], [0.010200885588169367], [0.01047354171176245], [0.010756018930590092], [0.011048218461314617], [0.011350038120746302], [0.011661372361585116], [0.011982112309338684], [0.012312145800404291], [0.01265135742130084], [0.012999628549037717], [0.013356837392605864], [0.013722859035577024], [0.014097565479795727], [0.014480825690149345], [0.014872505640399873], [0.015272468360061997], [0.015680573982310517], [0.01609667979290092], [0.01652064028008529], [0.016952307185506818], [0.01739152955605447], [0.01783815379666011], [0.018292023724019304], [0.018752980621217285], [0.019220863293240548], [0.019695508123355156], [0.020176749130331573], [0.020664418026496382], [0.021158344276590108], [0.021658355157411182], [0.022164275818224475], [0.022675929341913877], [0.023193136806856966], [0.023715717349500752], [0.024243488227615823], [0.024776264884207692], [0.025313861012061872], [0.025856088618901325], [0.0264027580931323], [0.026953678270156586], [0.02750865649922605], [0.028067498710816992], [0.028630009484499924], [0.029195992117281633], [0.029765248692395073], [0.03033758014851389], [0.03091278634936607], [0.031490666153723576], [0.03207101748574289], [0.03265363740563206], [0.03323832218061914], [0.03382486735619789], [0.03441306782762519], [0.03500271791164548], [0.035593611418416916], [0.03618554172361463], [0.03677830184068493], [0.037371684493226226], [0.037965482187470465], [0.03855948728484035], [0.03915349207455676], [0.03974728884627091], [0.040340669962695745], [0.04093342793221156], [0.041525355481420355], [0.04211624562762292], [0.042705891751194415], [0.043294087667832125], [0.043880627700650744], [0.044465306752099726], [0.04504792037567776], [0.04562826484741884], [0.04620613723712576], [0.04678133547932498], [0.04735365844391949], [0.047922906006513395], [0.048488879118385016], [0.04905137987608331], [0.04961021159062331], [0.0501651788562566], [0.05071608761879277], [0.051262745243448045], [0.05180496058219676], [0.05234254404060327], [0.052875307644109866], [0.05340306510375802], [0.053925631881320095], [0.05444282525381853], [0.054954464377409785], [0.05546037035061133], [0.05596036627684898], [0.05645427732630296], [0.0569419307970311], [0.057423156175347934], [0.057897785195438006], [0.058365651898183664], [0.058826592689185324], [0.0592804463959555], [0.05972705432426536], [0.06016626031362473], [0.06059791079187599], [0.061021854828883115], [0.06143794418929622], [0.06184603338437456], [0.062245979722848364], [0.06263764336080316], [0.06302088735056777], [0.06339557768859014], [0.06376158336228364], [0.06411877639582729], [0.06446703189490455], [0.06480622809036449], [0.06513624638079031], [0.06545697137396048], [0.0657682909271875], [0.06607009618652106], [0.06636228162480087], [0.0666447450785469], [0.06691738778367295], [0.06718011441001288], [0.06743283309464498], [0.06767545547400518], [0.06790789671477658], [0.06813007554354474], [0.06834191427520837], [0.06854333884013623], [0.06873427881005902], [0.06891466742268931], [0.06908444160505939], [0.06924354199556955], [0.0693919129647388], [0.06952950263465131], [0.06965626289709079], [0.069772149430358], [0.06987712171476339], [0.06997114304679171], [0.07005418055193231], [0.0701262051961706], [0.07018719179613742], [0.07023711902791224], [0.07027596943447689], [0.07030372943181869], [0.07032038931367794], [0.07032594325494125]], "longitude": [[0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0]]}}, "weights": {"total_mass": [[47183.74096891976], [47183.735859658096], [47183.72053363832], [47183.69499615547], [47183.659256032646], [47183.61332561806], [47183.557220780924], [47183.49096090614], [47183.41456888783], [47183.32807112167], [47183.23149749612], [47183.12488138238], [47183.00825962329], [47182.881672521], [47182.74516382348], [47182.59878070994], [47182.44257377501], [47182.27659701189], [47182.10090779421], [47181.91556685688], [47181.720638275794], [47181.516189446345], [47181.30229106088], [47181.07901708504], [47180.84644473295], [47180.60465444143], [47180.35372984294], [47180.09375773761], [47179.82482806413], [47179.54703386954], [47179.26047127805], [47178.96523945876], [47178.66144059233], [47178.349179836696], [47178.028565291694], [47177.69970796273], [47177.36272172344], [47177.017723277364], [47176.66483211866], [47176.30417049184], [47175.935863350605], [47175.56003831568], [47175.176825631774], [47174.78635812364], [47174.38877115119], [47173.9842025638], [47173.572792653635], [47173.15468410829], [47172.73002196241], [47172.29895354863], [47171.8616284476], [47171.41819843731], [47170.96881744158], [47170.51364147776], [47170.05282860377], [47169.58653886438], [47169.11493423667], [47168.63817857501], [47168.156437555146], [47167.66987861775], [47167.17867091129], [47166.68298523431], [47166.18299397699], [47165.67887106229], [47165.17079188639], [47164.6589332586], [47164.14347334081], [47163.62459158633], [47163.10246867832], [47162.5772864677], [47162.0492279106], [47161.518477005404], [47160.9852187294], [47160.44963897498], [47159.9119244855], [47159.372262790814], [47158.83084214244], [47158.28785144842], [47157.74348020794], [47157.19791844564], [47156.65135664569], [47156.10398568567], [47155.55599677022], [47155.00758136454], [47154.458931127716], [47153.910237845965], [47153.36169336568], [47152.813489526496], [47152.26581809421], [47151.71887069372], [47151.17283874192], [47150.62791338063], [47150.08428540949], [47149.54214521902], [47149.00168272366], [47148.46308729497], [47147.92654769491], [47147.392252009326], [47146.86038758159], [47146.3311409464], [47145.804697763844], [47145.281242753714], [47144.760959630046], [47144.24403103602], [47143.73063847909], [47143.220962266554], [47142.71518144141], [47142.21347371863], [47141.71601542187], [47141.22298142059], [47140.7345450676], [47140.250878137194], [47139.77215076366], [47139.298531380446], [47138.83018665976], [47138.36728145287], [47137.90997873087], [47137.45843952622], [47137.01282287478], [47136.5732857586], [47136.13998304941], [47135.71306745279], [47135.292689453025], [47134.87899725885], [47134.472136749835], [47134.07225142364], [47133.67948234409], [47133.29396809006], [47132.91584470525], [47132.54524564881], [47132.182301746914], [47131.8271411452], [47131.47988926219], [47131.14066874364], [47130.8095994179], [47130.48679825224], [47130.17237931022], [47129.86645371004], [47129.569129584015], [47129.28051203903], [47129.000703118174], [47128.72980176335], [47128.46790377914], [47128.21510179766], [47127.971485244656], [47127.737140306745], [47127.512149899754], [47127.296593638355], [47127.09054780679], [47126.89408533088], [47126.70727575125], [47126.530185197735], [47126.362876365085], [47126.20540848989], [47126.0578373288], [47125.92021513798], [47125.792590653895], [47125.67500907535], [47125.56751204681], [47125.47013764311], [47125.38292035537], [47125.305891078315], [47125.23907709885], [47125.182502086034], [47125.136186082316], [47125.10014549616], [47125.074393095994], [47125.05893800548], [47125.05378570018]], "weight_breakdown": {}, "vehicle_mass_rate": [[0.6916601419765643], [0.6916606246242479], [0.6916620724338002], [0.6916644849781619], [0.691667861557594], [0.6916722011867598], [0.6916775026005114], [0.6916837642535634], [0.6916909843183697], [0.6916991606876608], [0.6917082909734505], [0.6917183725070891], [0.6917294023397896], [0.6917413772431237], [0.6917542937086546], [0.6917681479482118], [0.691782935895095], [0.6917986532035048], [0.6918152952486648], [0.691832857128713], [0.6918513336633244], [0.6918707193952273], [0.691891008590606], [0.6919121952392145], [0.691934273055427], [0.6919572354784992], [0.691981075673507], [0.6920057865319015], [0.692031360672234], [0.692057790441131], [0.6920850679138996], [0.6921131848959187], [0.6921421329229716], [0.6921719032627995], [0.6922024869160944], [0.69223387461743], [0.692266056836776], [0.6922990237806183], [0.6923327653935448], [0.6923672713592836], [0.6924025311028744], [0.692438533791625], [0.6924752683372357], [0.6925127233972926], [0.6925508873773875], [0.6925897484328771], [0.692629294470897], [0.6926695131527679], [0.6927103918958057], [0.6927519178760807], [0.6927940780305735], [0.6928368590596319], [0.6928802474299285], [0.6929242293769451], [0.6929687909078835], [0.6930139178045022], [0.6930595956265324], [0.6931058097143468], [0.6931525451928154], [0.6931997869741318], [0.6932475197618138], [0.6932957280541309], [0.6933443961478206], [0.6933935081420914], [0.6934430479425877], [0.6934929992654872], [0.6935433456417005], [0.6935940704213704], [0.6936451567782507], [0.6936965877144069], [0.6937483460648147], [0.6938004145023678], [0.6938527755429196], [0.6939054115500607], [0.6939583047407553], [0.6940114371904903], [0.6940647908386404], [0.694118347494386], [0.6941720888421007], [0.6942259964474414], [0.694280051763069], [0.6943342361349284], [0.6943885308082417], [0.694442916934089], [0.6944973755754003], [0.6945518877138928], [0.6946064342562778], [0.6946609960414409], [0.694715553846811], [0.6947700883957703], [0.6948245803641482], [0.6948790103877557], [0.6949333590694734], [0.6949876069864868], [0.6950417346976245], [0.6950957227511124], [0.6951495516916363], [0.6952032020683997], [0.6952566544426457], [0.6953098893951813], [0.6953628875346377], [0.69541562950493], [0.6954680959934341], [0.695520267738754], [0.6955721255391347], [0.6956236502597823], [0.6956748228419014], [0.695725624309868], [0.6957760357802075], [0.6958260384691726], [0.6958756137011918], [0.6959247429170958], [0.6959734076820875], [0.6960215896942131], [0.6960692707924183], [0.6961164329646917], [0.696163058356407], [0.6962091292781356], [0.6962546282143395], [0.6962995378307284], [0.6963438409829967], [0.6963875207243474], [0.6964305603136435], [0.6964729432233324], [0.6965146531472439], [0.6965556740083778], [0.6965959899665541], [0.6966355854261003], [0.696674445043436], [0.6967125537343708], [0.6967498966817085], [0.6967864593422458], [0.6968222274541479], [0.6968571870438062], [0.6968913244329671], [0.6969246262454709], [0.6969570794137228], [0.6969886711855655], [0.6970193891307545], [0.6970492211466691], [0.6970781554651586], [0.6971061806579237], [0.6971332856428802], [0.697159459689317], [0.6971846924237111], [0.6972089738350578], [0.6972322942798945], [0.697254644487237], [0.697276015563581], [0.6972963989975055], [0.6973157866637948], [0.6973341708280701], [0.697351544150434], [0.6973678996897444], [0.6973832309068672], [0.6973975316683176], [0.6974107962495356], [0.6974230193374948], [0.6974341960340036], [0.6974443218581471], [0.6974533927484688], [0.697461405065266], [0.6974683555921868], [0.6974742415392154], [0.6974790605416701], [0.6974828106640321], [0.6974854903997441], [0.697487098672422], [0.6974876348355222]]}, "energies": {"total_energy": [[0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0]], "total_efficiency": [[0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0]], "gravity_energy": [[0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0]], "propulsion_power": [[0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0]]}, "freestream": {"velocity": [[83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458], [83.71545447037458]], "mach_number": [[0.2467981909069845], [0.24679827734076223], [0.24679853661241116], [0.24679896863288817], [0.24679957325382013], [0.24680035026755204], [0.24680129940721449], [0.24680242034681033], [0.2468037127013205], [0.24680517602682892], [0.2468068098206669], [0.24680861352157643], [0.2468105865098922], [0.2468127281077436], [0.24681503757927456], [0.24681751413088324], [0.24682015691148015], [0.24682296501276504], [0.24682593746952275], [0.24682907325993755], [0.24683237130592622], [0.24683583047348936], [0.24683944957308152], [0.24684322735999928], [0.24684716253478764], [0.24685125374366476], [0.2468554995789645], [0.24685989857959653], [0.2468644492315253], [0.24686914996826537], [0.24687399917139496], [0.246878995171087], [0.246884136246657], [0.24688942062712851], [0.24689484649181503], [0.24690041197091941], [0.24690611514614907], [0.24691195405134853], [0.24691792667314774], [0.24692403095162682], [0.2469302647809966], [0.24693662601029515], [0.2469431124440997], [0.2469497218432542], [0.24695645192561191], [0.24696330036679306], [0.2469702648009575], [0.24697734282159137], [0.2469845319823089], [0.24699182979766784], [0.24699923374399887], [0.24700674126024866], [0.24701434974883685], [0.24702205657652526], [0.24702985907530126], [0.24703775454327243], [0.24704574024557502], [0.2470538134152935], [0.24706197125439278], [0.24707021093466128], [0.2470785295986661], [0.24708692436071866], [0.24709539230785132], [0.2471039305008046], [0.247112535975024], [0.24712120574166765], [0.24712993678862225], [0.2471387260815295], [0.24714757056482045], [0.24715646716275882], [0.24716541278049278], [0.2471744043051143], [0.24718343860672606], [0.24719251253951605], [0.2472016229428386], [0.24721076664230193], [0.24721994045086237], [0.24722914116992398], [0.2472383655904435], [0.24724761049404112], [0.24725687265411506], [0.24726614883696119], [0.2472754358028961], [0.2472847303073845], [0.2472940291021688], [0.24730332893640242], [0.24731262655778513], [0.24732191871370027], [0.24733120215235396], [0.24734047362391542], [0.247349729881658], [0.2473589676831006], [0.24736818379114955], [0.24737737497523962], [0.24738653801247426], [0.24739566968876509], [0.24740476679996917], [0.24741382615302474], [0.24742284456708408], [0.24743181887464383], [0.24744074592267176], [0.24744962257373007], [0.2474584457070943], [0.2474672122198679], [0.24747591902809157], [0.24748456306784755], [0.24749314129635777], [0.2475016506930759], [0.24751008826077267], [0.2475184510266143], [0.24752673604323308], [0.24753494038979035], [0.24754306117303101], [0.24755109552832927], [0.24755904062072512], [0.24756689364595166], [0.24757465183145183], [0.24758231243738518], [0.24758987275762373], [0.24759733012073673], [0.2476046818909634], [0.24761192546917432], [0.24761905829381997], [0.2476260778418666], [0.24763298162971906], [0.24763976721413], [0.24764643219309523], [0.24765297420673474], [0.24765939093815886], [0.24766568011432008], [0.2476718395068486], [0.247677866932873], [0.24768376025582428], [0.24768951738622363], [0.24769513628245374], [0.24770061495151285], [0.24770595144975102], [0.24771114388358964], [0.24771619041022205], [0.24772108923829625], [0.24772583862857914], [0.24773043689460136], [0.24773488240328376], [0.24773917357554365], [0.24774330888688173], [0.2477472868679493], [0.2477511061050946], [0.2477547652408895], [0.24775826297463494], [0.24776159806284578], [0.24776476931971447], [0.24776777561755334], [0.24777061588721555], [0.24777328911849433], [0.2477757943605001], [0.2477781307220161], [0.24778029737183116], [0.24778229353905082], [0.24778411851338553], [0.2477857716454164], [0.24778725234683813], [0.24778856009067945], [0.24778969441150037], [0.24779065490556618], [0.247791441230999], [0.24779205310790584], [0.24779249031848313], [0.24779275270709877], [0.24779284018035]], "pressure": [[97971.29090546048], [97970.93023141337], [97969.84834186258], [97968.04563452388], [97965.52277207188], [97962.28068186218], [97958.32055554284], [97953.64384855566], [97948.25227952638], [97942.14782954555], [97935.33274133972], [97927.80951833332], [97919.5809236024], [97910.6499787205], [97901.0199624969], [97890.69440960887], [97879.67710912807], [97867.97210294216], [97855.5836840726], [97842.51639488916], [97828.77502522324], [97814.36461037981], [97799.29042905013], [97783.55800112561], [97767.17308541492], [97750.14167726494], [97732.47000608734], [97714.16453279217], [97695.23194712939], [97675.67916494065], [97655.51332532242], [97634.741787702], [97613.37212882821], [97591.4121396785], [97568.86982228386], [97545.75338647388], [97522.07124654304], [97497.83201784072], [97473.04451328614], [97447.71773981085], [97421.86089473011], [97395.48336204533], [97368.59470867949], [97341.20468064795], [97313.32319916553], [97284.96035669385], [97256.12641292873], [97226.83179073165], [97197.08707200612], [97166.90299352193], [97136.29044268871], [97105.26045328127], [97073.82420111947], [97041.99299970311], [97009.77829580636], [96977.19166503132], [96944.24480732552], [96910.94954246294], [96877.31780549315], [96843.3616421587], [96809.09320428452], [96774.5247451403], [96739.66861477883], [96704.53725535217], [96669.14319640746], [96633.49905016525], [96597.61750678172], [96561.51132959733], [96525.1933503739], [96488.67646452229], [96451.97362632223], [96415.09784413729], [96378.06217562594], [96340.87972295162], [96303.56362799321], [96266.12706755787], [96228.58324859879], [96190.94540343872], [96153.2267850025], [96115.44066205865], [96077.60031447414], [96039.71902848153], [96001.81009196282], [95963.88678974951], [95925.96239894214], [95888.05018425024], [95850.1633933545], [95812.3152522926], [95774.51896087077], [95736.78768810189], [95699.13456767234], [95661.57269343841], [95624.11511495443], [95586.77483303327], [95549.56479534107], [95512.49789202763], [95475.58695139288], [95438.8447355922], [95402.28393638012], [95365.91717089474], [95329.75697748385], [95293.81581157353], [95258.10604158012], [95222.63994486774], [95187.42970375091], [95152.48740154403], [95117.82501865897], [95083.45442875086], [95049.3873949132], [95015.63556592407], [94982.21047254234], [94949.12352385672], [94916.38600368699], [94884.00906703858], [94852.00373661132], [94820.38089936269], [94789.15130312653], [94758.32555328756], [94727.91410951197], [94697.92728253594], [94668.37523101036], [94639.26795840448], [94610.61530996769], [94582.42696974972], [94554.71245768073], [94527.48112671047], [94500.74216000774], [94474.50456821997], [94448.77718679328], [94423.56867335392], [94398.88750515021], [94374.74197655641], [94351.14019663802], [94328.09008677902], [94305.59937837101], [94283.67561056459], [94262.32612808365], [94241.55807910116], [94221.37841317899], [94201.79387926919], [94182.81102377929], [94164.43618869987], [94146.67550979555], [94129.53491485945], [94113.02012203005], [94097.13663817238], [94081.88975732187], [94067.28455919179], [94053.32590774418], [94040.0184498243], [94027.36661385847], [94015.37460861546], [94004.04642203137], [93993.38582009806], [93983.39634581521], [93974.08131820582], [93965.44383139524], [93957.48675375401], [93950.21272710373], [93943.62416598697], [93937.72325700046], [93932.51195819199], [93927.99199852039], [93924.1648773796], [93921.03186418608], [93918.59399802919], [93916.852087386], [93915.80670989877], [93915.4582122163]], "temperature": [[286.31058170701255], [286.31038116346645], [286.30977960296565], [286.30877723589754], [286.3073744128263], [286.30557162436975], [286.30336950102816], [286.30076881296327], [286.29777046972885], [286.29437551995267], [286.2905851509694], [286.28640068840497], [286.2818235957132], [286.27685547366326], [286.2714980597799], [286.2657532277352], [286.2596229866932], [286.2531094806067], [286.2462149874672], [286.2389419185079], [286.23129281735976], [286.2232703591618], [286.2148773496248], [286.2061167240499], [286.19699154630115], [286.18750500773405], [286.1776604260784], [286.1674612442777], [286.1569110292847], [286.1460134708129], [286.13477238004606], [286.1231916883046], [286.11127544567006], [286.0990278195681], [286.08645309331047], [286.0735556645964], [286.060340043974], [286.0468108532622], [286.0329728239336], [286.0188307954595], [286.0043897136163], [285.9896546287556], [285.9746306940371], [285.95932316362587], [285.9437373908542], [285.92787882634883], [285.91175301612407], [285.89536559964154], [285.8787223078374], [285.8618289611176], [285.8446914673216], [285.8273158196556], [285.8097080945963], [285.7918744497651], [285.77382112177395], [285.755554424044], [285.73708074459705], [285.71840654382095], [285.6995383522098], [285.68048276807974], [285.66124645526077], [285.641836140766], [285.62225861243854], [285.60252071657743], [285.58262935554274], [285.56259148534156], [285.542414113195], [285.52210429508716], [285.50166913329747], [285.4811157739166], [285.46045140434705], [285.4396832507893], [285.41881857571485], [285.397864675326], [285.376828877004], [285.355718536747], [285.33454103659693], [285.31330378205803], [285.29201419950726], [285.2706797335969], [285.2493078446513], [285.2279060060578], [285.2064817016538], [285.1850424231088], [285.1635956673057], [285.14214893371843], [285.12070972179], [285.0992855283099], [285.0778838447928], [285.056512154859], [285.0351779316175], [285.0138886350533], [284.99265170941885], [284.97147458063085], [284.9503646536743], [284.92932931001315], [284.90837590500945], [284.8875117653518], [284.8667441864937], [284.8460804301027], [284.82552772152184], [284.80509324724335], [284.7847841523964], [284.7646075382488], [284.74457045972457], [284.72467992293764], [284.70494288274216], [284.6853662403017], [284.6659568406761], [284.64672147042904], [284.6276668552553], [284.60879965762985], [284.59012647447844], [284.5716538348721], [284.5533881977443], [284.5353359496335], [284.51750340245053], [284.4998967912722], [284.48252227216204], [284.4653859200183], [284.44849372645064], [284.43185159768564], [284.4154653525025], [284.3993407201994], [284.38348333859045], [284.3678987520356], [284.35259240950256], [284.3375696626622], [284.3228357640183], [284.30839586507153], [284.2942550145191], [284.28041815649], [284.26689012881724], [284.2536756613469], [284.2407793742852], [284.22820577658337], [284.21595926436237], [284.2040441193761], [284.192464507515], [284.1812244773503], [284.1703279587191], [284.1597787613508], [284.1495805735358], [284.13973696083644], [284.1302513648413], [284.12112710196175], [284.11236736227374], [284.10397520840246], [284.0959535744522], [284.08830526498105], [284.0810329540207], [284.0741391841421], [284.0676263655668], [284.06149677532477], [284.0557525564587], [284.0503957172749], [284.0454281306418], [284.0408515333353], [284.03666752543165], [284.0328775697488], [284.0294829913347], [284.0264849770047], [284.0238845749264], [284.0216826942537], [284.019880104809], [284.018477436814], [284.0174751806699], [284.01687368678563], [284.0166731654554]], "density": [[1.1920638870314062], [1.192060333503962], [1.1920496742130406], [1.1920319130323562], [1.1920070564163634], [1.1919751133976555], [1.1919360955833227], [1.1918900171502782], [1.1918368948395444], [1.1917767479495083], [1.191709598328156], [1.1916354703642742], [1.1915543909776396], [1.191466389608195], [1.191371498204213], [1.191269751209463], [1.1911611855493822], [1.1910458406162607], [1.1909237582534462], [1.1907949827385758], [1.1906595607658534], [1.1905175414273663], [1.1903689761934668], [1.190213918892215], [1.190052425687906], [1.1898845550586825], [1.1897103677732543], [1.1895299268667288], [1.1893432976155662], [1.1891505475116795], [1.1889517462356833], [1.188746965629312], [1.1885362796670178], [1.1883197644267671], [1.1880974980600425], [1.187869560761078], [1.1876360347353303], [1.1873970041672097], [1.1871525551870856], [1.186902775837582], [1.1866477560391822], [1.1863875875551548], [1.186122363955824], [1.185852180582203], [1.1855771345089943], [1.1852973245070009], [1.1850128510049378], [1.184723816050685], [1.1844303232719875], [1.1841324778366267], [1.1838303864120812], [1.1835241571246928], [1.183213899518369], [1.1828997245128166], [1.1825817443613609], [1.1822600726083308], [1.1819348240460699], [1.181606114671551], [1.181274061642656], [1.1809387832341045], [1.1806003987930764], [1.1802590286945336], [1.1799147942962662], [1.1795678178936861], [1.179218222674376], [1.1788661326724281], [1.1785116727225826], [1.1781549684141859], [1.177796146044994], [1.1774353325748335], [1.1770726555791409], [1.1767082432024072], [1.1763422241115304], [1.1759747274491132], [1.1756058827867122], [1.1752358200780577], [1.1748646696122733], [1.1744925619670967], [1.174119627962138], [1.173745998612172], [1.173371805080509], [1.1729971786324316], [1.1726222505887407], [1.1722471522794102], [1.171872014997376], [1.1714969699524722], [1.1711221482255338], [1.1707476807226747], [1.1703736981297697], [1.1700003308671392], [1.1696277090444702], [1.169255962415969], [1.1688852203357794], [1.1685156117136655], [1.168147264970983], [1.167780307996949], [1.167414868105221], [1.1670510719908078], [1.1666890456873116], [1.1663289145245275], [1.165970803086404], [1.1656148351693831], [1.1652611337411187], [1.1649098208996094], [1.1645610178327277], [1.1642148447781782], [1.1638714209838885], [1.163530864668841], [1.1631932929843538], [1.162858821975836], [1.1625275665449997], [1.162199640412565], [1.1618751560814542], [1.1615542248004789], [1.1612369565285423], [1.1609234598993512], [1.160613842186658], [1.1603082092700308], [1.1600066656011565], [1.1597093141707062], [1.1594162564757347], [1.1591275924876512], [1.158843420620755], [1.158563837701336], [1.1582889389373636], [1.1580188178887503], [1.1577535664382104], [1.157493274762711], [1.1572380313055182], [1.1569879227488584], [1.1567430339871765], [1.1565034481010146], [1.1562692463315067], [1.1560405080554947], [1.1558173107612688], [1.1555997300249359], [1.1553878394874293], [1.155181710832138], [1.1549814137631935], [1.1547870159843834], [1.1545985831787204], [1.1544161789886507], [1.1542398649969194], [1.1540697007080873], [1.1539057435306947], [1.1537480487600955], [1.1535966695619397], [1.1534516569563198], [1.153313059802583], [1.1531809247848028], [1.1530552963979228], [1.1529362169345616], [1.1528237264724914], [1.152717862862783], [1.1526186617186254], [1.1525261564048175], [1.1524403780279295], [1.1523613554271461], [1.152289115165776], [1.1522236815234428], [1.1521650764889557], [1.1521133197538505], [1.1520684287066112], [1.1520304184275736], [1.1519993016845047], [1.1519750889288607], [1.1519577882927272], [1.1519474055864378], [1.1519439442968724]], "speed_of_sound": [[339.2061107203416], [339.2059919234606], [339.20563557411566], [339.2050417961866], [339.2042107960929], [339.2031428627232], [339.20183836733645], [339.2002977634353], [339.1985215866109], [339.1965104543606], [339.19426506587615], [339.1917862018054], [339.18907472398575], [339.1861315751489], [339.1829577785997], [339.17955443786565], [339.17592273632005], [339.17206393677765], [339.16797938106276], [339.1636704895505], [339.15913876068106], [339.15438577044745], [339.14941317185617], [339.1442226943618], [339.13881614327545], [339.1331953991466], [339.1273624171195], [339.1213192262643], [339.11506792888133], [339.10861069978193], [339.10194978554307], [339.0950875037377], [339.08802624214036], [339.0807684579087], [339.0733166767411], [339.06567349201026], [339.05784156387375], [339.049823618361], [339.0416224464378], [339.033240903048], [339.024681906133], [339.01594843562964], [339.0070435324459], [338.9979702974158], [338.98873189023345], [338.979331528366], [338.96977248594675], [338.9600580926485], [338.95019173253723], [338.9401768429064], [338.93001691309314], [338.91971548327575], [338.90927614325284], [338.898702531206], [338.88799833244406], [338.87716727813176], [338.8662131440012], [338.8551397490483], [338.84395095421274], [338.83265066104417], [338.82124281035277], [338.8097313808463], [338.79812038775344], [338.7864138814336], [338.7746159459746], [338.76273069777733], [338.75076228412973], [338.738714881768], [338.7265926954284], [338.71439995638804], [338.7021409209959], [338.68981986919437], [338.6774411030328], [338.66500894517134], [338.6525277373783], [338.64000183901965], [338.6274356255414], [338.61483348694645], [338.6021998262653], [338.58953905802133], [338.57685560669216], [338.5641539051659], [338.5514383931948], [338.5387135158448], [338.52598372194336], [338.513253462525], [338.5005271892751], [338.4878093529735], [338.47510440193696], [338.4624167804622], [338.4497509272697], [338.43711127394863], [338.42450224340365], [338.411928248304], [338.39939368953577], [338.3869029546572], [338.37446041635854], [338.36207043092577], [338.34973733671023], [338.3374654526032], [338.32525907651717], [338.31312248387337], [338.3010599260972], [338.2890756291208], [338.27717379189465], [338.2653585849074], [338.2536341487156], [338.24200459248334], [338.23047399253204], [338.21904639090167], [338.2077257939232], [338.19651617080336], [338.18542145222165], [338.1744455289407], [338.1635922504302], [338.15286542350464], [338.142268810976], [338.13180613032137], [338.121481052366], [338.11129719998246], [338.10125814680674], [338.09136741597075], [338.08162847885256], [338.0720447538448], [338.062619605141], [338.05335634154113], [338.0442582152762], [338.03532842085286], [338.02657009391794], [338.0179863101433], [338.0095800841326], [338.00135436834813], [337.9933120520606], [337.98545596032073], [337.97778885295304], [337.97031342357303], [337.963032298628], [337.95594803646037], [337.9490631263965], [337.94237998785877], [337.93590096950294], [337.92962834838056], [337.92356432912624], [337.91771104317115], [337.9120705479824], [337.90664482632815], [337.9014357855701], [337.89644525698174], [337.89167499509483], [337.88712667707205], [337.88280190210804], [337.8787021908578], [337.87482898489304], [337.871183646187], [337.8677674566274], [337.8645816175581], [337.86162724934945], [337.8589053909977], [337.8564169997529], [337.8541629507772], [337.85214403683113], [337.8503609679902], [337.8488143713906], [337.8475047910052], [337.8464326874486], [337.84559843781216], [337.8450023355294], [337.84464459027055], [337.8445253278679]], "dynamic_viscosity": [[1.7804912271459354e-05], [1.7804902565201482e-05], [1.7804873449802924e-05], [1.7804824935387718e-05], [1.7804757038825417e-05], [1.780466978372532e-05], [1.7804563200428393e-05], [1.780443732599691e-05], [1.7804292204201764e-05], [1.7804127885507537e-05], [1.7803944427055202e-05], [1.78037418926426e-05], [1.7803520352702647e-05], [1.7803279884279197e-05], [1.7803020571000743e-05], [1.780274250305177e-05], [1.780244577714193e-05], [1.7802130496472935e-05], [1.7801796770703266e-05], [1.7801444715910637e-05], [1.780107445455224e-05], [1.780068611542287e-05], [1.780027983361081e-05], [1.7799855750451573e-05], [1.7799414013479495e-05], [1.779895477637723e-05], [1.7798478198923054e-05], [1.779798444693616e-05], [1.7797473692219803e-05], [1.779694611250242e-05], [1.7796401891376688e-05], [1.7795841218236584e-05], [1.7795264288212393e-05], [1.7794671302103792e-05], [1.7794062466310925e-05], [1.7793437992763573e-05], [1.779279809884837e-05], [1.779214300733419e-05], [1.7791472946295577e-05], [1.7790788149034434e-05], [1.7790088853999798e-05], [1.7789375304705884e-05], [1.778864774964836e-05], [1.7787906442218845e-05], [1.7787151640617744e-05], [1.7786383607765377e-05], [1.7785602611211463e-05], [1.7784808923042968e-05], [1.7784002819790375e-05], [1.778318458233241e-05], [1.7782354495799198e-05], [1.7781512849473946e-05], [1.778065993669315e-05], [1.7779796054745387e-05], [1.7778921504768693e-05], [1.7778036591646568e-05], [1.777714162390267e-05], [1.7776236913594212e-05], [1.777532277620407e-05], [1.777439953053172e-05], [1.7773467498582917e-05], [1.7772527005458308e-05], [1.7771578379240846e-05], [1.7770621950882188e-05], [1.7769658054088036e-05], [1.7768687025202472e-05], [1.776770920309136e-05], [1.7766724929024767e-05], [1.7765734546558585e-05], [1.776473840141526e-05], [1.7763736841363728e-05], [1.776273021609858e-05], [1.776171887711857e-05], [1.7760703177604367e-05], [1.7759683472295694e-05], [1.7758660117367928e-05], [1.7757633470308083e-05], [1.775660388979031e-05], [1.7755571735550923e-05], [1.7754537368263046e-05], [1.775350114941081e-05], [1.7752463441163255e-05], [1.7751424606247972e-05], [1.7750385007824417e-05], [1.774934500935708e-05], [1.7748304974488494e-05], [1.7747265266912085e-05], [1.7746226250245026e-05], [1.774518828790095e-05], [1.7744151742962825e-05], [1.7743116978055747e-05], [1.7742084355219957e-05], [1.7741054235783946e-05], [1.774002698023774e-05], [1.7739002948106522e-05], [1.773798249782442e-05], [1.773696598660871e-05], [1.7735953770334367e-05], [1.7734946203409014e-05], [1.773394363864839e-05], [1.7732946427152258e-05], [1.773195491818094e-05], [1.7730969459032384e-05], [1.7729990394919917e-05], [1.7729018068850658e-05], [1.7728052821504688e-05], [1.7727094991114934e-05], [1.772614491334797e-05], [1.7725202921185555e-05], [1.772426934480719e-05], [1.772334451147351e-05], [1.7722428745410777e-05], [1.7721522367696287e-05], [1.7720625696144934e-05], [1.7719739045196837e-05], [1.771886272580616e-05], [1.7717997045331096e-05], [1.7717142307425053e-05], [1.771629881192922e-05], [1.771546685476632e-05], [1.7714646727835795e-05], [1.7713838718910365e-05], [1.771304311153399e-05], [1.7712260184921364e-05], [1.77114902138588e-05], [1.771073346860678e-05], [1.7709990214803985e-05], [1.770926071337301e-05], [1.7708545220427644e-05], [1.7707843987181932e-05], [1.7707157259860863e-05], [1.7706485279612833e-05], [1.7705828282423925e-05], [1.7705186499033967e-05], [1.770456015485442e-05], [1.7703949469888182e-05], [1.770335465865128e-05], [1.7702775930096458e-05], [1.770221348753882e-05], [1.770166752858334e-05], [1.7701138245054515e-05], [1.770062582292797e-05], [1.7700130442264178e-05], [1.7699652277144245e-05], [1.769919149560787e-05], [1.769874825959338e-05], [1.769832272487997e-05], [1.7697915041032122e-05], [1.769752535134624e-05], [1.769715379279948e-05], [1.7696800496000877e-05], [1.7696465585144712e-05], [1.7696149177966148e-05], [1.7695851385699194e-05], [1.7695572313036974e-05], [1.7695312058094333e-05], [1.7695070712372768e-05], [1.7694848360727754e-05], [1.7694645081338404e-05], [1.7694460945679545e-05], [1.769429601849617e-05], [1.7694150357780294e-05], [1.7694024014750204e-05], [1.7693917033832197e-05], [1.7693829452644665e-05], [1.7693761301984623e-05], [1.7693712605816767e-05], [1.7693683381264837e-05], [1.7693673638605535e-05]], "altitude": [[283.0], [283.0308555944198], [283.1234115881513], [283.27763561638363], [283.49347375034006], [283.77085051613597], [284.10966892117017], [284.50981048804135], [284.97113529597686], [285.49348202976], [286.0766680361384], [286.7204893876941], [287.424720954152], [288.1891164811036], [289.0134086761164], [289.8973093022004], [290.84050927859835], [291.8426787888641], [292.9034673961928], [294.0225041659608], [295.1993977954332], [296.433736750594], [297.72508941005066], [299.07300421596267], [300.4770098319412], [301.93661530786545], [303.4513102515572], [305.0205650072535], [306.64383084081607], [308.32054013161155], [310.0501065709959], [311.8319253673339], [313.66537345748156], [315.5498097246577], [317.48457522262834], [319.4689934061262], [321.5023703674233], [323.5839950789757], [325.71313964205433], [327.8890595412751], [330.1109939049398], [332.3781657710962], [334.6897823592249], [337.0450353474572], [339.4431011552277], [341.8831412312623], [344.36430234680154], [346.88571689395593], [349.44650318908936], [352.0457657811249], [354.68259576466426], [357.35607109781233], [360.0652569245951], [362.80920590185815], [365.5869585305321], [368.3975434911488], [371.23997798348967], [374.11326807025034], [377.0164090245985], [379.9483856815049], [382.9081727927243], [385.89473538530297], [388.9070291234852], [391.94400067389574], [395.0045880738668], [398.08772110278335], [401.19232165631615], [404.3173041234111], [407.46157576590366], [410.6240371006257], [413.8035822838708], [416.9990994980836], [420.20947134063783], [423.43357521456824], [426.6702837211178], [429.91846505396444], [433.1769833949892], [436.44469931144715], [439.7204701544016], [443.00315045828427], [446.2915923414389], [449.5846459075109], [452.8811596475406], [456.17998084262126], [459.47995596697933], [462.7799310913374], [466.078752286418], [469.3752660264478], [472.6683195925197], [475.9567614756744], [479.239441779557], [482.5152126225115], [485.7829285389694], [489.04144687999417], [492.28962821284085], [495.52633671939043], [498.75044059332083], [501.9608124358751], [505.15632965008786], [508.335874833333], [511.49833616805506], [514.6426078105476], [517.7675902776425], [520.8721908311752], [523.9553238600919], [527.0159112600629], [530.0528828104734], [533.0651765486557], [536.0517391412343], [539.0115262524537], [541.9435029093602], [544.8466438637083], [547.7199339504689], [550.5623684428099], [553.3729534034264], [556.1507060321006], [558.8946550093635], [561.6038408361462], [564.2773161692944], [566.9141461528337], [569.5134087448693], [572.0741950400028], [574.595609587157], [577.0767707026964], [579.5168107787309], [581.9148765865014], [584.2701295747338], [586.5817461628624], [588.8489180290188], [591.0708523926835], [593.2467722919043], [595.375916854983], [597.4575415665354], [599.4909185278325], [601.4753367113303], [603.4101022093009], [605.2945384764771], [607.1279865666247], [608.9098053629627], [610.6393718023471], [612.3160810931424], [613.9393469267052], [615.5086016824015], [617.0232966260933], [618.4829021020175], [619.886907717996], [621.234822523908], [622.5261751833647], [623.7605141385255], [624.9374077679979], [626.0564445377659], [627.1172331450946], [628.1194026553603], [629.0626026317582], [629.9465032578422], [630.770795452855], [631.5351909798067], [632.2394225462646], [632.8832438978202], [633.4664299041987], [633.9887766379818], [634.4501014459173], [634.8502430127885], [635.1890614178227], [635.4664381836185], [635.6822763175751], [635.8365003458073], [635.9290563395389], [635.9599119339587]], "gravity": [[9.805778834706075], [9.805778739728932], [9.805778454830715], [9.805777980111083], [9.805777315736067], [9.805776461938047], [9.805775419015648], [9.80577418733365], [9.80577276732285], [9.805771159479919], [9.805769364367226], [9.80576738261263], [9.805765214909282], [9.805762862015364], [9.80576032475383], [9.805757604012117], [9.80575470074184], [9.805751615958455], [9.805748350740895], [9.805744906231206], [9.805741283634138], [9.805737484216737], [9.805733509307872], [9.805729360297812], [9.805725038637698], [9.805720545839062], [9.80571588347329], [9.805711053171075], [9.80570605662183], [9.805700895573121], [9.805695571830046], [9.805690087254595], [9.805684443765003], [9.805678643335085], [9.805672687993548], [9.805666579823255], [9.805660320960525], [9.805653913594387], [9.805647359965779], [9.805640662366805], [9.805633823139901], [9.805626844677041], [9.805619729418884], [9.805612479853925], [9.805605098517615], [9.80559758799149], [9.805589950902263], [9.805582189920889], [9.80557430776165], [9.80556630718121], [9.805558190977612], [9.80554996198935], [9.805541623094337], [9.805533177208922], [9.805524627286852], [9.805515976318254], [9.805507227328572], [9.805498383377536], [9.805489447558045], [9.805480422995144], [9.805471312844883], [9.805462120293233], [9.805452848554971], [9.805443500872547], [9.805434080514964], [9.80542459077662], [9.805415034976171], [9.805405416455345], [9.805395738577806], [9.805386004727948], [9.80537621830973], [9.805366382745477], [9.805356501474684], [9.805346577952816], [9.8053366156501], [9.8053266180503], [9.805316588649516], [9.805306530954944], [9.805296448483666], [9.805286344761411], [9.80527622332132], [9.805266087702712], [9.805255941449849], [9.805245788110694], [9.805235631235679], [9.805225474376439], [9.805215321084608], [9.805205174910544], [9.805195039402097], [9.805184918103377], [9.80517481455351], [9.805164732285395], [9.80515467482447], [9.80514464568749], [9.80513464838129], [9.805124686401554], [9.8051147632316], [9.805104882341155], [9.805095047185155], [9.805085261202526], [9.805075527814981], [9.805065850425834], [9.8050562324188], [9.805046677156813], [9.805037187980862], [9.805027768208808], [9.805018421134232], [9.805009150025281], [9.804999958123531], [9.804990848642854], [9.80498182476828], [9.804972889654898], [9.804964046426758], [9.804955298175754], [9.804946647960586], [9.80493809880564], [9.804929653699968], [9.804921315596236], [9.804913087409677], [9.804904972017082], [9.804896972255811], [9.804889090922774], [9.804881330773464], [9.804873694521007], [9.804866184835188], [9.804858804341537], [9.80485155562042], [9.804844441206107], [9.80483746358591], [9.804830625199315], [9.804823928437107], [9.804817375640566], [9.804810969100624], [9.80480471105707], [9.804798603697785], [9.804792649157946], [9.804786849519306], [9.80478120680946], [9.80477572300113], [9.804770400011483], [9.804765239701458], [9.80476024387511], [9.804755414278999], [9.804750752601551], [9.8047462604725], [9.80474193946229], [9.804737791081541], [9.804733816780526], [9.80473001794865], [9.804726395913972], [9.80472295194275], [9.804719687238979], [9.804716602943985], [9.804713700136023], [9.804710979829904], [9.804708442976622], [9.80470609046305], [9.804703923111612], [9.80470194168], [9.804700146860906], [9.80469853928178], [9.80469711950463], [9.80469588802579], [9.804694845275778], [9.80469399161913], [9.804693327354277], [9.804692852713442], [9.804692567862551], [9.804692472901188]], "reynolds_number": [[5604867.2714058785], [5604853.618824686], [5604812.666001354], [5604744.427694687], [5604648.9284962695], [5604526.20282084], [5604376.2948928075], [5604199.25872896], [5603995.158117312], [5603764.0665921355], [5603506.067405216], [5603221.253493286], [5602909.727441675], [5602571.6014442565], [5602206.997259588], [5601816.046163382], [5601398.888897271], [5600955.675613912], [5600486.565818442], [5599991.728306315], [5599471.341097608], [5598925.591367709], [5598354.675374559], [5597758.798382371], [5597138.174581935], [5596493.0270075025], [5595823.587450352], [5595130.096368986], [5594412.802796092], [5593671.964242257], [5592907.846596513], [5592120.724023735], [5591310.878858978], [5590478.601498757], [5589624.190289357], [5588747.951412226], [5587850.198766482], [5586931.253848601], [5585991.445629362], [5585031.110428069], [5584050.591784158], [5583050.240326197], [5582030.413638368], [5580991.476124521], [5579933.798869772], [5578857.75949984], [5577763.742038055], [5576652.136760206], [5575523.3400472365], [5574377.754235864], [5573215.787467206], [5572037.853533473], [5570844.371722816], [5569635.76666231], [5568412.46815931], [5567174.911041047], [5565923.5349927405], [5564658.784394086], [5563381.108154394], [5562090.959546287], [5560788.796038137], [5559475.079125239], [5558150.274159833], [5556814.850180065], [5555469.279737873], [5554114.038725981], [5552749.606203979], [5551376.464223633], [5549995.097653431], [5548605.994002485], [5547209.643243825], [5545806.537637213], [5544397.171551438], [5542982.0412862925], [5541561.644894215], [5540136.482001662], [5538707.05363036], [5537273.862018397], [5535837.410441331], [5534398.203033247], [5532956.74460801], [5531513.540480589], [5530069.096288654], [5528623.917814457], [5527178.510807058], [5525733.380804969], [5524289.032959301], [5522845.971857395], [5521404.701347148], [5519965.724361896], [5518529.542746119], [5517096.657081842], [5515667.566515937], [5514242.768588299], [5512822.759060949], [5511408.031748205], [5509999.078347839], [5508596.3882734245], [5507200.4484877875], [5505811.743337716], [5504430.754389931], [5503057.96026838], [5501693.836492864], [5500338.855319156], [5498993.485580503], [5497658.192530674], [5496333.437688587], [5495019.678684482], [5493717.369107763], [5492426.958356545], [5491148.891488879], [5489883.609075764], [5488631.547055997], [5487393.136592801], [5486168.8039323855], [5484958.970264391], [5483764.05158431], [5482584.458557893], [5481420.596387523], [5480272.864680748], [5479141.657320789], [5478027.362339218], [5476930.361790803], [5475851.031630453], [5474789.741592457], [5473746.855071881], [5472722.729008269], [5471717.713771596], [5470732.153050542], [5469766.383743112], [5468820.735849575], [5467895.532367826], [5466991.089191114], [5466107.715008193], [5465245.711205945], [5464405.371774408], [5463586.983214355], [5462790.82444729], [5462017.16672803], [5461266.273559772], [5460538.400611734], [5459833.795639319], [5459152.698406918], [5458495.340613258], [5457861.945819346], [5457252.729379084], [5456667.898372458], [5456107.651541395], [5455572.179228268], [5455061.663317064], [5454576.277177228], [5454116.185610174], [5453681.544798516], [5453272.502257958], [5452889.196791927], [5452531.758448911], [5452200.308482497], [5451894.959314179], [5451615.814498849], [5451362.968693066], [5451136.507626055], [5450936.508073455], [5450763.0378338145], [5450616.155707851], [5450495.91148047], [5450402.345905545], [5450335.49069345], [5450295.368501379], [5450281.992926415]], "dynamic_pressure": [[4177.157150056623], [4177.144698003732], [4177.1073463703415], [4177.045108730483], [4176.958007701461], [4176.846074934734], [4176.709351103157], [4176.547885884598], [4176.361737941922], [4176.150974899353], [4175.915673315262], [4175.655918651341], [4175.37180523822], [4175.06343623754], [4174.730923600479], [4174.37438802278], [4173.993958896296], [4173.589774257072], [4173.161980730002], [4172.710733470065], [4172.236196100226], [4171.738540645965], [4171.217947466535], [4170.674605182922], [4170.108710602603], [4169.5204686411], [4168.910092240396], [4168.2778022842485], [4167.623827510426], [4166.948404419949], [4166.251777183354], [4165.534197544038], [4164.795924718741], [4164.037225295205], [4163.25837312706], [4162.459649226024], [4161.641341651414], [4160.803745397078], [4159.947162275772], [4159.071900801059], [4158.17827606678], [4157.266609624153], [4156.337229356567], [4155.390469352154], [4154.42666977413], [4153.446176729084], [4152.44934213316], [4151.436523576279], [4150.408084184428], [4149.3643924800945], [4148.305822240916], [4147.232752356586], [4146.145566684145], [4145.044653901626], [4143.930407360245], [4142.803224935076], [4141.663508874406], [4140.511665647714], [4139.348105792461], [4138.173243759665], [4136.987497758392], [4135.791289599201], [4134.585044536616], [4133.369191110717], [4132.144160987873], [4130.910388800745], [4129.668311987569], [4128.41837063083], [4127.161007295377], [4125.896666866048], [4124.62579638486], [4123.348844887879], [4122.066263241755], [4120.778503980076], [4119.486021139542], [4118.1892700960425], [4116.888707400733], [4115.584790616113], [4114.277978152234], [4112.968729103035], [4111.65750308294], [4110.344760063701], [4109.030960211614], [4107.716563725117], [4106.402030672863], [4105.087820832302], [4103.774393528857], [4102.462207475703], [4101.151720614264], [4099.843389955428], [4098.53767142158], [4097.235019689449], [4095.935888033889], [4094.6407281725915], [4093.3499901117916], [4092.0641219930403], [4090.7835699410443], [4089.5087779126843], [4088.2401875471764], [4086.9782380175016], [4085.723365883089], [4084.4760049438387], [4083.2365860954587], [4082.0055371862663], [4080.7832828753712], [4079.570244492362], [4078.3668398985114], [4077.173483349526], [4075.9905853598693], [4074.818552568744], [4073.6577876076826], [4072.508688969856], [4071.3716508811035], [4070.247063172687], [4069.1353111558496], [4068.0367754981635], [4066.951832101731], [4065.880851983239], [4064.8242011558837], [4063.7822405132556], [4062.7553257151085], [4061.7438070751223], [4060.748029450647], [4059.76833213443], [4058.805048748395], [4057.85850713945], [4056.9290292773658], [4056.016931154739], [4055.1225226890374], [4054.246107626802], [4053.3879834499376], [4052.548441284185], [4051.7277658097423], [4050.9262351740695], [4050.1441209068794], [4049.3816878373304], [4048.639194013464], [4047.9168906238147], [4047.215021921324], [4046.5338251494513], [4045.873530470581], [4045.2343608966685], [4044.6165322221927], [4044.0202529593844], [4043.44572427573], [4042.8931399338153], [4042.3626862334513], [4041.8545419561156], [4041.3688783117354], [4040.905858887779], [4040.465639600696], [4040.0483686496877], [4039.6541864728247], [4039.2832257055074], [4038.9356111412885], [4038.6114596950492], [4038.310880368525], [4038.0339742182173], [4037.7808343256434], [4037.5515457699717], [4037.346185603037], [4037.1648228267127], [4037.0075183726567], [4036.8743250844573], [4036.76528770214], [4036.680442849057], [4036.6198190211635], [4036.583436578674], [4036.571307740099]], "delta_ISA": [[0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0]], "stagnation_temperature": [[289.80718576728054], [289.8069852649951], [289.80638382826083], [289.8053816674191], [289.8039791329574], [289.8021767153861], [289.79997504506764], [289.7973748919951], [289.79437716552343], [289.79098291405097], [289.7871933246529], [289.78300972266516], [289.77843357122197], [289.7734664707426], [289.76811015837245], [289.7623665073745], [289.75623752647425], [289.74972535915686], [289.74283228291716], [289.7355607084627], [289.72791317887044], [289.71989236869695], [289.71150108304244], [289.70274225656954], [289.6936189524767], [289.68413436142583], [289.67429180042683], [289.66409471167617], [289.65354666135335], [289.6426513383728], [289.6314125530931], [289.6198342359846], [289.60792043625344], [289.5956753204254], [289.5831031708882], [289.57020838439314], [289.5569954705167], [289.5434690500835], [289.52963385354917], [289.5154947193455], [289.5010565921879], [289.4863245213456], [289.471303658875], [289.4559992578174], [289.44041667036146], [289.4245613459706], [289.40843882947706], [289.39205475914156], [289.3754148646815], [289.35852496526644], [289.34139096748225], [289.3240188632653], [289.30641472780616], [289.2885847174246], [289.2705350674161], [289.2522720898706], [289.23380217146484], [289.2151317712283], [289.19626741828364], [289.1772157095633], [289.15798330750187], [289.13857693770547], [289.1190033865999], [289.0992694990564], [289.07938217599775], [289.0593483719847], [289.0391750927835], [289.01886939291546], [288.99843837318963], [288.97788917821975], [288.95722899392496], [288.9364650450165], [288.91560459247177], [288.89465493099397], [288.87362338646165], [288.85251731336626], [288.83134409224044], [288.8101111270766], [288.78882584273805], [288.767495682362], [288.74612810475713], [288.7247305817948], [288.7033105957968], [288.6818756369179], [288.66043320052756], [288.63899078458854], [288.61755588703465], [288.5961360031495], [288.57473862294546], [288.5533712285443], [288.5320412915613], [288.5107562704925], [288.4895236081073], [288.46835072884517], [288.44724503622064], [288.42621391023414], [288.4052647047917], [288.384404745134], [288.36364132527524], [288.3429817054524], [288.3224331095876], [288.30200272276204], [288.2816976887042], [288.26152510729196], [288.24149203207065], [288.22160546778747], [288.2018723679416], [288.18229963235444], [288.16289410475656], [288.1436625703958], [288.1246117536649], [288.10574831575076], [288.0870788523061], [288.06860989114347], [288.0503478899535], [288.0322992340473], [288.01447023412464], [287.99686712406776], [287.9794960587622], [287.96236311194565], [287.9454742740845], [287.92883545028], [287.9124524582043], [287.8963310260667], [287.8804767906115], [287.86489529514773], [287.8495919876118], [287.83457221866274], [287.81984123981266], [287.8054042015907], [287.79126615174306], [287.7774320334685], [287.76390668369083], [287.7506948313684], [287.73780109584084], [287.7252299852151], [287.71298589478926], [287.701073105517], [287.6894957825109], [287.67825797358677], [287.66736360784927], [287.6568164943183], [287.64662032059823], [287.6367786515885], [287.6272949282385], [287.6181724663441], [287.6094144553897], [287.60102395743286], [287.59300390603477], [287.5853571052343], [287.57808622856885], [287.57119381813936], [287.56468228372216], [287.55855390192704], [287.55281081540113], [287.5474550320805], [287.54248842448834], [287.5379127290805], [287.53372954563855], [287.5299403367112], [287.5265464271025], [287.52354900340947], [287.52094911360683], [287.51874766668135], [287.51694543231383], [287.5155430406102], [287.51454098188145], [287.51393960647215], [287.5137391246379]], "stagnation_pressure": [[102215.50181888045], [102215.12855235439], [102214.0088899417], [102212.1432430816], [102209.53229731481], [102206.17701199655], [102202.07861989536], [102197.23862667734], [102191.6588102768], [102185.3412201526], [102178.28817643235], [102170.50226894266], [102161.98635612882], [102152.74356386163], [102142.77728413435], [102132.0911736492], [102120.68915229477], [102108.57540151555], [102095.75436257354], [102082.23073470319], [102068.00947316275], [102053.09578717905], [102037.49513779176], [102021.21323559366], [102004.25603837261], [101986.62974865217], [101968.34081113694], [101949.39591005961], [101929.80196643445], [101909.56613521725], [101888.69580237354], [101867.19858185726], [101845.08231250073], [101822.35505481856], [101799.02508772611], [101775.10090517582], [101750.5912127117], [101725.50492394544], [101699.8511569543], [101673.63923060407], [101646.8786607992], [101619.57915666066], [101591.75061663505], [101563.40312453643], [101534.5469455227], [101505.1925220096], [101475.3504695232], [101445.03157249362], [101414.24677999297], [101383.00720141789], [101351.32410212068], [101319.20889899], [101286.67315598446], [101253.72857961946], [101220.38701441244], [101186.6604382854], [101152.5609579304], [101118.10080413657], [101083.29232708468], [101048.14799160838], [101012.68037242637], [100976.90214934663], [100940.82610244547], [100904.4651072236], [100867.8321297409], [100830.94022173327], [100793.80251571206], [100756.43222004974], [100718.84261405338], [100681.04704302837], [100643.05891333325], [100604.89168742987], [100566.55887892963], [100528.07404763736], [100489.45079459687], [100450.70275713748], [100411.84360392645], [100372.88703002642], [100333.84675196263], [100294.73650279871], [100255.57002722661], [100216.36107666814], [100177.123404395], [100137.87076066382], [100098.61688787249], [100059.37551573664], [100020.16035648905], [99980.98510010364], [99941.86340954575], [99902.80891604917], [99863.83521442393], [99824.95585839299], [99786.18435596299], [99747.53416482722], [99709.01868780452], [99670.65126831442], [99632.44518588996], [99594.41365173], [99556.56980429162], [99518.92670492377], [99481.49733354477], [99444.29458436302], [99407.33126164271], [99370.62007551616], [99334.17363784312], [99298.00445811845], [99262.12493942879], [99226.54737446], [99191.28394155447], [99156.34670082196], [99121.74759030183], [99087.49842217953], [99053.61087905776], [99020.0965102818], [98986.96672832147], [98954.23280520918], [98921.9058690356], [98889.99690050239], [98858.51672953332], [98827.47603194551], [98796.8853261782], [98766.75497008295], [98737.09515777385], [98707.91591653768], [98679.22710380706], [98651.03840419362], [98623.35932658444], [98596.19920129991], [98569.56717731505], [98543.4722195436], [98517.9231061853], [98492.92842613677], [98468.4965764667], [98444.63575995453], [98421.35398269346], [98398.6590517582], [98376.55857293733], [98355.0599485301], [98334.17037520884], [98313.89684194556], [98294.24612800473], [98275.22480100047], [98256.83921502005], [98239.09550881201], [98221.99960404051], [98205.55720360497], [98189.77379002563], [98174.65462389454], [98160.20474239286], [98146.42895787327], [98133.33185650904], [98120.91779700833], [98109.19090939475], [98098.1550938538], [98087.81401964476], [98078.17112407964], [98069.22961156661], [98060.99245272076], [98053.46238353933], [98046.64190464467], [98040.5332805914], [98035.13853924074], [98030.45947119988], [98026.49762932792], [98023.25432830767], [98020.73064428272], [98018.92741456135], [98017.84523738564], [98017.48447176661]], "isentropic_expansion_factor": [[1.4010099144250812], [1.4010099191570782], [1.401009933351309], [1.4010099570024923], [1.4010099901018296], [1.4010100326370072], [1.4010100845922029], [1.4010101459480928], [1.4010102166818585], [1.4010102967671987], [1.4010103861743388], [1.401010484870045], [1.4010105928176388], [1.4010107099770115], [1.401010836304643], [1.4010109717536197], [1.4010111162736547], [1.4010112698111106], [1.4010114323090208], [1.4010116037071154], [1.4010117839418466], [1.4010119729464159], [1.4010121706508023], [1.401012376981794], [1.401012591863017], [1.40101281521497], [1.401013046955057], [1.4010132869976235], [1.4010135352539916], [1.401013791632499], [1.401014056038536], [1.401014328374588], [1.4010146085402742], [1.4010148964323914], [1.4010151919449572], [1.401015494969254], [1.4010158053938744], [1.4010161231047689], [1.401016447985292], [1.401016779916252], [1.4010171187759597], [1.4010174644402786], [1.401017816782677], [1.4010181756742799], [1.4010185409839215], [1.4010189125781995], [1.4010192903215293], [1.4010196740761998], [1.4010200637024284], [1.401020459058419], [1.4010208600004186], [1.4010212663827755], [1.401021678057997], [1.40102209487681], [1.4010225166882195], [1.4010229433395696], [1.4010233746766025], [1.4010238105435218], [1.401024250783052], [1.401024695236501], [1.4010251437438228], [1.401025596143679], [1.4010260522735023], [1.4010265119695584], [1.4010269750670106], [1.4010274413999817], [1.4010279108016195], [1.4010283831041577], [1.401028858138982], [1.4010293357366934], [1.401029815727171], [1.4010302979396367], [1.401030782202719], [1.4010312683445172], [1.4010317561926637], [1.4010322455743889], [1.4010327363165846], [1.4010332282458666], [1.4010337211886381], [1.4010342149711534], [1.4010347094195792], [1.4010352043600582], [1.401035699618771], [1.4010361950219974], [1.4010366903961784], [1.4010371855679773], [1.4010376803643405], [1.401038174612558], [1.4010386681403229], [1.401039160775791], [1.401039652347641], [1.4010401426851318], [1.4010406316181605], [1.4010411189773215], [1.4010416045939622], [1.40104208830024], [1.4010425699291775], [1.40104304931472], [1.4010435262917873], [1.4010440006963305], [1.4010444723653839], [1.4010449411371189], [1.401045406850895], [1.4010458693473136], [1.401046328468266], [1.4010467840569862], [1.401047235958099], [1.4010476840176693], [1.4010481280832503], [1.4010485680039306], [1.401049003630381], [1.401049434814901], [1.4010498614114624], [1.4010502832757556], [1.4010507002652324], [1.4010511122391482], [1.4010515190586055], [1.4010519205865946], [1.4010523166880335], [1.4010527072298093], [1.4010530920808153], [1.401053471111991], [1.401053844196358], [1.4010542112090576], [1.4010545720273861], [1.4010549265308303], [1.4010552746011011], [1.4010556161221677], [1.4010559509802891], [1.4010562790640475], [1.4010566002643774], [1.4010569144745975], [1.4010572215904393], [1.4010575215100756], [1.4010578141341488], [1.4010580993657973], [1.4010583771106824], [1.4010586472770135], [1.4010589097755721], [1.4010591645197366], [1.4010594114255046], [1.4010596504115156], [1.4010598813990727], [1.4010601043121618], [1.401060319077474], [1.4010605256244224], [1.4010607238851618], [1.401060913794606], [1.4010610952904439], [1.401061268313157], [1.4010614328060331], [1.4010615887151823], [1.401061735989549], [1.4010618745809271], [1.40106200444397], [1.4010621255362037], [1.4010622378180368], [1.4010623412527707], [1.4010624358066088], [1.4010625214486647], [1.4010625981509708], [1.401062665888484], [1.401062724639093], [1.401062774383624], [1.4010628151058442], [1.4010628467924673], [1.4010628694331555], [1.4010628830205232], [1.4010628875501383]], "specific_heat_at_constant_pressure": [[1004.7414253361826], [1004.7414229915352], [1004.7414159587383], [1004.7414042412286], [1004.7413878447304], [1004.7413667772521], [1004.7413410490797], [1004.7413106727695], [1004.7412756631387], [1004.7412360372541], [1004.7411918144198], [1004.7411430161628], [1004.7410896662166], [1004.741031790504], [1004.7409694171182], [1004.7409025763012], [1004.7408313004223], [1004.7407556239536], [1004.7406755834454], [1004.7405912174986], [1004.7405025667368], [1004.7404096737768], [1004.7403125831968], [1004.7402113415047], [1004.7401059971041], [1004.7399966002595], [1004.739883203059], [1004.7397658593783], [1004.7396446248408], [1004.7395195567786], [1004.7393907141912], [1004.7392581577038], [1004.7391219495242], [1004.7389821533994], [1004.7388388345701], [1004.7386920597256], [1004.7385418969575], [1004.7383884157119], [1004.7382316867422], [1004.7380717820599], [1004.7379087748861], [1004.7377427396009], [1004.7375737516936], [1004.7374018877126], [1004.7372272252129], [1004.7370498427059], [1004.7368698196068], [1004.7366872361828], [1004.7365021735011], [1004.736314713376], [1004.736124938317], [1004.7359329314756], [1004.7357387765936], [1004.7355425579497], [1004.7353443603075], [1004.7351442688639], [1004.7349423691959], [1004.73473874721], [1004.73453348909], [1004.7343266812462], [1004.7341184102646], [1004.7339087628568], [1004.7336978258103], [1004.7334856859388], [1004.7332724300344], [1004.7330581448185], [1004.7328429168956], [1004.7326268327058], [1004.7324099784794], [1004.7321924401914], [1004.7319743035175], [1004.7317556537906], [1004.7315365759582], [1004.7313171545405], [1004.7310974735905], [1004.7308776166533], [1004.7306576667283], [1004.7304377062308], [1004.7302178169562], [1004.7299980800435], [1004.7297785759423], [1004.729559384378], [1004.7293405843212], [1004.7291222539552], [1004.7289044706476], [1004.7286873109211], [1004.7284708504264], [1004.7282551639157], [1004.7280403252181], [1004.7278264072158], [1004.7276134818221], [1004.7274016199596], [1004.7271908915404], [1004.726981365448], [1004.7267731095192], [1004.726566190528], [1004.7263606741711], [1004.7261566250537], [1004.7259541066771], [1004.7257531814278], [1004.7255539105666], [1004.7253563542209], [1004.7251605713757], [1004.724966619868], [1004.724774556381], [1004.72458443644], [1004.7243963144088], [1004.7242102434882], [1004.7240262757144], [1004.7238444619597], [1004.7236648519328], [1004.723487494181], [1004.7233124360936], [1004.7231397239052], [1004.7229694027006], [1004.722801516421], [1004.7226361078696], [1004.7224732187194], [1004.7223128895215], [1004.7221551597132], [1004.7220000676282], [1004.721847650506], [1004.7216979445033], [1004.7215509847052], [1004.721406805137], [1004.7212654387766], [1004.7211269175676], [1004.7209912724323], [1004.7208585332859], [1004.7207287290502], [1004.7206018876682], [1004.7204780361187], [1004.7203572004314], [1004.7202394057016], [1004.7201246761061], [1004.7200130349181], [1004.719904504523], [1004.7197991064336], [1004.7196968613061], [1004.7195977889552], [1004.7195019083697], [1004.7194092377276], [1004.7193197944121], [1004.7192335950253], [1004.7191506554043], [1004.7190709906345], [1004.718994615065], [1004.7189215423218], [1004.7188517853217], [1004.7187853562855], [1004.7187222667505], [1004.7186625275838], [1004.7186061489926], [1004.7185531405374], [1004.718503511142], [1004.7184572691036], [1004.7184144221035], [1004.7183749772154], [1004.7183389409148], [1004.7183063190867], [1004.7182771170328], [1004.7182513394785], [1004.7182289905788], [1004.718210073924], [1004.7181945925436], [1004.718182548911], [1004.7181739449469], [1004.7181687820209], [1004.7181670609544]], "gas_specific_constant": 287.0528742}, "aerodynamics": {"angle_of_attack": [[0.11303317531370542], [0.1130335554020799], [0.11303469554203051], [0.11303659535813752], [0.11303925422477946], [0.11304267126633463], [0.11304684535739963], [0.11305177512308602], [0.11305745893939519], [0.11306389493364204], [0.11307108098495733], [0.11307901472485284], [0.11308769353785293], [0.11309711456219056], [0.11310727469057605], [0.11311817057102778], [0.11312979860776784], [0.11314215496219122], [0.11315523555389745], [0.1131690360617862], [0.11318355192522878], [0.11319877834529755], [0.11321471028606635], [0.11323134247597998], [0.1132486694092861], [0.11326668534753845], [0.11328538432116501], [0.11330476013110403], [0.11332480635050732], [0.11334551632651121], [0.11336688318207465], [0.11338889981788328], [0.11341155891432321], [0.11343485293352061], [0.11345877412144828], [0.11348331451010076], [0.11350846591973526], [0.11353421996118142], [0.11356056803821583], [0.11358750135000667], [0.11361501089362087], [0.11364308746660395], [0.11367172166962063], [0.11370090390916586], [0.11373062440034075], [0.11376087316969485], [0.11379164005813475], [0.11382291472389695], [0.11385468664558906], [0.11388694512529336], [0.11391967929173617], [0.11395287810352359], [0.11398653035243787], [0.11402062466680157], [0.11405514951490157], [0.1140900932084798], [0.11412544390628196], [0.11416118961767387], [0.11419731820631301], [0.11423381739388735], [0.11427067476390938], [0.11430787776557265], [0.11434541371766689], [0.11438326981255083], [0.1144214331201838], [0.11445989059221233], [0.11449862906611549], [0.11453763526940207], [0.11457689582386521], [0.11461639724988844], [0.11465612597080488], [0.11469606831730735], [0.11473621053190929], [0.11477653877345541], [0.11481703912167837], [0.11485769758180522], [0.1148985000892076], [0.11493943251409681], [0.11498048066626275], [0.11502163029985359], [0.115062867118197], [0.1151041767786593], [0.1151455448975433], [0.11518695705502051], [0.11522839880009986], [0.11526985565562785], [0.11531131312332059], [0.11535275668882451], [0.11539417182680604], [0.1154355440060662], [0.11547685869468087], [0.11551810136516207], [0.11555925749963995], [0.11560031259506452], [0.11564125216842312], [0.11568206176197116], [0.11572272694847971], [0.11576323333648772], [0.11580356657556776], [0.11584371236159646], [0.11588365644202661], [0.11592338462116465], [0.11596288276544703], [0.11600213680871216], [0.11604113275746906], [0.11607985669615997], [0.11611829479241008], [0.11615643330226874], [0.11619425857543494], [0.11623175706046585], [0.11626891530996739], [0.11630571998576228], [0.11634215786403486], [0.11637821584044893], [0.11641388093523711], [0.11644914029825937], [0.11648398121402544], [0.11651839110668444], [0.11655235754497169], [0.11658586824711781], [0.116618911085711], [0.11665147409251503], [0.11668354546323671], [0.11671511356224307], [0.11674616692722439], [0.11677669427380044], [0.11680668450006879], [0.1168361266910905], [0.11686501012331384], [0.11689332426893011], [0.11692105880016172], [0.11694820359348054], [0.11697474873375033], [0.1170006845182961], [0.11702600146089441], [0.11705069029568328], [0.11707474198099113], [0.11709814770307973], [0.11712089887979994], [0.11714298716416223], [0.11716440444781087], [0.11718514286441015], [0.1172051947929324], [0.11722455286085048], [0.11724320994723224], [0.1172611591857324], [0.1172783939674834], [0.11729490794388311], [0.11731069502927438], [0.11732574940351839], [0.11734006551446025], [0.11735363808028183], [0.11736646209174512], [0.11737853281431956], [0.11738984579019837], [0.11740039684019536], [0.11741018206552753], [0.11741919784947927], [0.11742744085894619], [0.11743490804585911], [0.11744159664848937], [0.11744750419262934], [0.11745262849265407], [0.11745696765245309], [0.11746052006625102], [0.11746328441928784], [0.11746525968838738], [0.11746644514239638], [0.11746684034249663]], "side_slip_angle": [[-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0]], "roll_angle": [[0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0]], "lift_coefficient": [[0.8103325292795724], [0.8103348031808028], [0.8103416241357123], [0.8103529898985485], [0.8103688967268592], [0.8103893393826933], [0.8104143111339108], [0.8104438037559563], [0.8104778075340983], [0.8105163112659635], [0.8105593022645401], [0.8106067663615569], [0.8106586879112598], [0.8107150497945712], [0.8107758334236893], [0.8108410187470521], [0.8109105842546942], [0.8109845069840403], [0.8110627625260745], [0.8111453250318905], [0.8112321672196948], [0.8113232603821597], [0.8114185743941966], [0.8115180777211459], [0.811621737427338], [0.8117295191850802], [0.8118413872840361], [0.8119573046410038], [0.8120772328101051], [0.8122011319933701], [0.8123289610517312], [0.8124606775164088], [0.8125962376007094], [0.8127355962122268], [0.8128787069654348], [0.813025522194695], [0.8131759929676579], [0.8133300690990718], [0.8134876991649861], [0.8136488305173669], [0.8138134092990895], [0.813981380459369], [0.8141526877695477], [0.8143272738393088], [0.8145050801332779], [0.814686046988019], [0.8148701136294293], [0.8150572181905179], [0.8152472977295938], [0.8154402882488261], [0.8156361247131988], [0.8158347410698631], [0.8160360702678494], [0.8162400442781905], [0.8164465941143979], [0.8166556498533402], [0.8168671406564669], [0.8170809947914377], [0.8172971396540833], [0.8175155017907658], [0.8177360069210722], [0.8179585799608826], [0.8181831450457852], [0.81840962555484], [0.8186379441346943], [0.8188680227240259], [0.8190997825783382], [0.8193331442950657], [0.8195680278390264], [0.819804352568174], [0.8200420372596804], [0.8202810001363099], [0.8205211588931086], [0.8207624307243844], [0.8210047323509653], [0.8212479800477566], [0.8214920896715585], [0.8217369766891525], [0.8219825562056514], [0.8222287429930925], [0.8224754515192799], [0.8227225959768546], [0.8229700903125942], [0.8232178482569227], [0.8234657833536342], [0.8237138089898064], [0.8239618384259075], [0.8242097848260737], [0.8244575612885567], [0.8247050808763272], [0.8249522566478259], [0.8251990016878447], [0.8254452291385305], [0.8256908522305064], [0.8259357843140893], [0.826179938890587], [0.8264232296436935], [0.8266655704709166], [0.8269068755150827], [0.8271470591958723], [0.8273860362413651], [0.8276237217196178], [0.8278600310702353], [0.8280948801359131], [0.8283281851939668], [0.8285598629878178], [0.828789830758407], [0.8290180062755585], [0.8292443078692436], [0.829468654460751], [0.8296909655937443], [0.8299111614651875], [0.8301291629561302], [0.830344891662334], [0.8305582699247253], [0.8307692208596653], [0.830977668389006], [0.831183537269947], [0.8313867531246377], [0.8315872424695555], [0.8317849327445989], [0.8319797523419238], [0.832171630634469], [0.832360498004188], [0.8325462858699515], [0.8327289267151137], [0.8329083541147316], [0.8330845027624069], [0.8332573084967603], [0.8334267083274993], [0.8335926404610791], [0.8337550443259464], [0.8339138605973306], [0.834069031221597], [0.8342204994401264], [0.8343682098127143], [0.8345121082404852], [0.8346521419882923], [0.834788259706597], [0.8349204114528355], [0.8350485487122126], [0.8351726244179631], [0.8352925929710354], [0.835408410259192], [0.8355200336755317], [0.8356274221363961], [0.8357305360986673], [0.8358293375764555], [0.8359237901571317], [0.8360138590167321], [0.8360995109347115], [0.8361807143080262], [0.8362574391645594], [0.8363296571758523], [0.836397341669173], [0.8364604676388683], [0.83651901175703], [0.8365729523834584], [0.8366222695748986], [0.836666945093567], [0.8367069624149576], [0.8367423067349136], [0.8367729649759755], [0.8367989257929639], [0.8368201795778833], [0.8368367184640009], [0.8368485363292438], [0.8368556287988294], [0.8368579932471318]], "drag_coefficient": [[0.060646893898068016], [0.06064712872132368], [0.06064783311732832], [0.060649006864849066], [0.06065064959519367], [0.06065276079230493], [0.06065533979285484], [0.06065838578637531], [0.06066189781542503], [0.06066587477577578], [0.060670315416635145], [0.06067521834089745], [0.06068058200542403], [0.06068640472135252], [0.060692684654440186], [0.06069941982543481], [0.06070660811047507], [0.060714247241526284], [0.06072233480684416], [0.06073086825146877], [0.06073984487775511], [0.06074926184593059], [0.06075911617468678], [0.06076940474180536], [0.06078012428481358], [0.06079127140167596], [0.06080284255151773], [0.06081483405538275], [0.06082724209702576], [0.06084006272373898], [0.06085329184721405], [0.060866925244438305], [0.06088095855862798], [0.06089538730019688], [0.06091020684776103], [0.06092541244918115], [0.060940999222641325], [0.06095696215776616], [0.060973296116774864], [0.06098999583567512], [0.061007055925493124], [0.06102447087354643], [0.061042235044752396], [0.061060342682978955], [0.06107878791243445], [0.06109756473909832], [0.061116667052192486], [0.061136088625693336], [0.06115582311988639], [0.0611758640829614], [0.061196204952649866], [0.061216839057905675], [0.061237759620626275], [0.06125895975741898], [0.06128043248140797], [0.06130217070408663], [0.06132416723721052], [0.061346414794736924], [0.06136890599480474], [0.06139163336176094], [0.061414589328228485], [0.06143776623721918], [0.061461156344290176], [0.06148475181974381], [0.06150854475087187], [0.061532527144242455], [0.06155669092803176], [0.06158102795439742], [0.06160553000189709], [0.06163018877794827], [0.06165499592133216], [0.06167994300473889], [0.06170502153735568], [0.06173022296749679], [0.06175553868527379], [0.061780960025308224], [0.061806478269483676], [0.061832084649737974], [0.061857770350895125], [0.06188352651353548], [0.06190934423690434], [0.0619352145818577], [0.061961128573845115], [0.0619870772059275], [0.062013051441831266], [0.062039042219035556], [0.06206504045189345], [0.062091037034784774], [0.06211702284530094], [0.062142988747459216], [0.062168925594947196], [0.062194824234394396], [0.06222067550867068], [0.062246470260210934], [0.06227219933436381], [0.06229785358276232], [0.062323423866718825], [0.062348901060636494], [0.06237427605544305], [0.062399539762040226], [0.062424683114768155], [0.06244969707488564], [0.06247457263406284], [0.06249930081788342], [0.06252387268935737], [0.06254827935244184], [0.06257251195556573], [0.06259656169516058], [0.06262041981919243], [0.06264407763069428], [0.06266752649129749], [0.06269075782475918], [0.06271376312048484], [0.06273653393704343], [0.0627590619056732], [0.06278133873377681], [0.0628033562084019], [0.06282510619970844], [0.06284658066441623], [0.06286777164923565], [0.06288867129427454], [0.06290927183642359], [0.06292956561271432], [0.06294954506365043], [0.06296920273650924], [0.06298853128861036], [0.06300752349055143], [0.06302617222940667], [0.06304447051188802], [0.06306241146746525], [0.0630799883514438], [0.06309719454799895], [0.06311402357316191], [0.06313046907775854], [0.06314652485029718], [0.06316218481980332], [0.06317744305860057], [0.06319229378503446], [0.0632067313661372], [0.06322075032023437], [0.06323434531948617], [0.06324751119236725], [0.0632602429260793], [0.06327253566889632], [0.06328438473244107], [0.06329578559388974], [0.0633067338981041], [0.06331722545969076], [0.06332725626498266], [0.06333682247394443], [0.06334592042199959], [0.06335454662177648], [0.06336269776477421], [0.06337037072294431], [0.06337756255019077], [0.06338427048378273], [0.06339049194568289], [0.06339622454378864], [0.06340146607308426], [0.06340621451670463], [0.06341046804691], [0.06341422502596909], [0.06341748400695266], [0.06342024373443143], [0.0634225031450893], [0.06342426136823384], [0.06342551772622146], [0.06342627173478628], [0.06342652310327429]], "lift_breakdown": {"inviscid_wings": {"main_wing": [[0.7235370075501192], [0.7235389032955333], [0.7235445899073393], [0.7235540655127218], [0.7235673269907124], [0.723584369973194], [0.723605188845993], [0.7236297767503627], [0.7236581255848509], [0.7236902260074192], [0.7237260674379487], [0.7237656380610631], [0.7238089248292827], [0.723855913466498], [0.7239065884718103], [0.7239609331236768], [0.7240189294843856], [0.7240805584048928], [0.7241457995299737], [0.7242146313036933], [0.7242870309752559], [0.7243629746051429], [0.7244424370716053], [0.7245253920775019], [0.7246118121574481], [0.7247016686853205], [0.7247949318820875], [0.7248915708239752], [0.7249915534509745], [0.7250948465756778], [0.7252014158924605], [0.7253112259869837], [0.7254242403460488], [0.7255404213677807], [0.7256597303721425], [0.7257821276117945], [0.7259075722832833], [0.7260360225385674], [0.7261674354968761], [0.7263017672569096], [0.726438972909354], [0.7265790065497623], [0.7267218212917316], [0.7268673692804377], [0.7270156017064916], [0.7271664688201256], [0.7273199199457103], [0.7274759034965966], [0.7276343669902905], [0.7277952570639465], [0.7279585194901856], [0.7281240991932441], [0.7282919402654252], [0.7284619859838901], [0.7286341788277454], [0.7288084604954649], [0.7289847719225988], [0.7291630532998202], [0.7293432440912506], [0.7295252830531141], [0.7297091082526729], [0.7298946570874706], [0.7300818663048695], [0.7302706720218736], [0.7304610097452464], [0.7306528143919024], [0.7308460203095903], [0.7310405612978341], [0.7312363706291645], [0.7314333810705985], [0.7316315249053941], [0.7318307339550483], [0.732030939601556], [0.7322320728099129], [0.732434064150847], [0.7326368438238013], [0.7328403416801306], [0.7330444872465229], [0.7332492097486424], [0.7334544381349689], [0.7336601011008497], [0.7338661271127376], [0.7340724444326212], [0.7342789811426287], [0.73448566516981], [0.7346924243110751], [0.7348991862582956], [0.7351058786235447], [0.7353124289644799], [0.7355187648098548], [0.7357248136851533], [0.7359305031383311], [0.7361357607656591], [0.7363405142376633], [0.7365446913251461], [0.7367482199252701], [0.7369510280877265], [0.7371530440409269], [0.737354196218261], [0.7375544132843771], [0.7377536241614716], [0.7379517580556039], [0.7381487444830062], [0.7383445132963683], [0.7385389947111084], [0.7387321193316126], [0.7389238181774088], [0.7391140227092986], [0.7393026648554082], [0.7394896770371585], [0.739674992195141], [0.7398585438148835], [0.7400402659524988], [0.7402200932601983], [0.7403979610116632], [0.7405738051272619], [0.7407475621990867], [0.7409191695158277], [0.7410885650874302], [0.7412556876695678], [0.7414204767878765], [0.7415828727619743], [0.7417428167292212], [0.741900250668234], [0.7420551174221298], [0.7422073607214825], [0.7423569252069944], [0.7425037564518535], [0.742647800983782], [0.7427890063067464], [0.7429273209223294], [0.7430626943507519], [0.7431950771515218], [0.7433244209437118], [0.7434506784258488], [0.7435738033953991], [0.7436937507678483], [0.7438104765953568], [0.7439239380849796], [0.7440340936164564], [0.7441409027595284], [0.7442443262908103], [0.7443443262101792], [0.7444408657566799], [0.7445339094239481], [0.7446234229751189], [0.7447093734572311], [0.7447917292151213], [0.7448704599047739], [0.7449455365061458], [0.7450169313354524], [0.7450846180568904], [0.7451485716938189], [0.7452087686393563], [0.7452651866664306], [0.7453178049372303], [0.7453666040120852], [0.7454115658577605], [0.7454526738551477], [0.7454899128063639], [0.7455232689412503], [0.7455527299232587], [0.7455782848547394], [0.7455999242815854], [0.7456176401973194], [0.7456314260464848], [0.7456412767274792], [0.7456471885947391], [0.745649159460298]], "horizontal_stabilizer": [[0.2618582558799395], [0.261859370951431], [0.2618627157992263], [0.2618682893235775], [0.2618760896917969], [0.26188611433884434], [0.26189835996796196], [0.26191282255153736], [0.26192949733219223], [0.2619483788240151], [0.2619694608140218], [0.2619927363637983], [0.26201819781133767], [0.26204583677306337], [0.2620756441460653], [0.26210761011051514], [0.262141724132271], [0.26217797496569656], [0.2622163506566615], [0.26225683854572773], [0.2622994252715579], [0.2623440967744916], [0.26239083830032817], [0.26243963440431206], [0.26249046895529854], [0.26254332514012835], [0.2625981854681913], [0.2626550317761877], [0.2627138452330868], [0.26277460634528066], [0.26283729496193664], [0.262901890280541], [0.26296837085264557], [0.2630367145898081], [0.2631068987697266], [0.26317890004257627], [0.26325269443753624], [0.26332825736951976], [0.2634055636460925], [0.26348458747459724], [0.2635653024694595], [0.26364768165970903], [0.26373169749667646], [0.2638173218618978], [0.2639045260752089], [0.2639932809030348], [0.26408355656687205], [0.2641753227519626], [0.26426854861616456], [0.2643632027990092], [0.2644592534309501], [0.2645566681428065], [0.26465541407538595], [0.26475545788930654], [0.2648567657749941], [0.2649593034628771], [0.2650630362337505], [0.2651679289293406], [0.2652739459630323], [0.2653810513307927], [0.2654892086222608], [0.2655983810320188], [0.2657085313710377], [0.26581962207829246], [0.2659316152325525], [0.2660444725643326], [0.2661581554680189], [0.26627262501414795], [0.26638784196185605], [0.26650376677147936], [0.266620359617315], [0.2667375804005285], [0.26685538876221593], [0.2669737440966115], [0.2670926055644323], [0.2672119321063716], [0.2673316824567213], [0.26745181515712824], [0.26757228857048193], [0.26769306089492256], [0.2678140901779737], [0.26793533433078776], [0.2680567511425075], [0.26817829829473017], [0.26829993337608155], [0.26842161389688196], [0.26854329730391147], [0.2686649409952591], [0.2687865023352591], [0.26890793866950385], [0.26902920733993324], [0.269150265699988], [0.26927107112982634], [0.2693915810516003], [0.2695117529447807], [0.2696315443615234], [0.2697509129420866], [0.26986981643026364], [0.26998821268885964], [0.2701060597151803], [0.2702233156565318], [0.27033993882573515], [0.27045588771664203], [0.2705711210196366], [0.27068559763713235], [0.2707992766990523], [0.27091211757827216], [0.2710240799060418], [0.27113512358736064], [0.27124520881630765], [0.27135429609131717], [0.27146234623039267], [0.27156932038625237], [0.27167518006139846], [0.2717798871231025], [0.2718834038183036], [0.27198569278839985], [0.2720867170839469], [0.2721864401792298], [0.2722848259867276], [0.2723818388714386], [0.2724774436650799], [0.2725716056801362], [0.2726642907237644], [0.27275546511153853], [0.2728450956810281], [0.27293314980520855], [0.27301959540568715], [0.27310440096574695], [0.27318753554319375], [0.27326896878300094], [0.27334867092975307], [0.27342661283986436], [0.2735027659935836], [0.27357710250676665], [0.27364959514241255], [0.2737202173219603], [0.27378894313633545], [0.2738557473567381], [0.27392060544517954], [0.27398349356473806], [0.27404438858955193], [0.27410326811452723], [0.27416011046476063], [0.2742148947046754], [0.27426760064685535], [0.2743182088605784], [0.27436670068004954], [0.27441305821231216], [0.27445726434484685], [0.2744993027528538], [0.2745391579061997], [0.2745768150760444], [0.2746122603411231], [0.274645480593702], [0.2746764635451812], [0.2747051977313597], [0.27473167251735114], [0.27475587810214447], [0.2747778055228108], [0.2747974466583577], [0.27481479423321964], [0.27482984182039116], [0.27484258384418186], [0.27485301558263936], [0.2748611331695601], [0.27486693359616854], [0.2748704147124139], [0.2748715752278925]], "vertical_stabilizer": [[0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0]]}, "compressible_wings": {"main_wing": [[0.7235370075501192], [0.7235389032955333], [0.7235445899073393], [0.7235540655127218], [0.7235673269907124], [0.723584369973194], [0.723605188845993], [0.7236297767503627], [0.7236581255848509], [0.7236902260074192], [0.7237260674379487], [0.7237656380610631], [0.7238089248292827], [0.723855913466498], [0.7239065884718103], [0.7239609331236768], [0.7240189294843856], [0.7240805584048928], [0.7241457995299737], [0.7242146313036933], [0.7242870309752559], [0.7243629746051429], [0.7244424370716053], [0.7245253920775019], [0.7246118121574481], [0.7247016686853205], [0.7247949318820875], [0.7248915708239752], [0.7249915534509745], [0.7250948465756778], [0.7252014158924605], [0.7253112259869837], [0.7254242403460488], [0.7255404213677807], [0.7256597303721425], [0.7257821276117945], [0.7259075722832833], [0.7260360225385674], [0.7261674354968761], [0.7263017672569096], [0.726438972909354], [0.7265790065497623], [0.7267218212917316], [0.7268673692804377], [0.7270156017064916], [0.7271664688201256], [0.7273199199457103], [0.7274759034965966], [0.7276343669902905], [0.7277952570639465], [0.7279585194901856], [0.7281240991932441], [0.7282919402654252], [0.7284619859838901], [0.7286341788277454], [0.7288084604954649], [0.7289847719225988], [0.7291630532998202], [0.7293432440912506], [0.7295252830531141], [0.7297091082526729], [0.7298946570874706], [0.7300818663048695], [0.7302706720218736], [0.7304610097452464], [0.7306528143919024], [0.7308460203095903], [0.7310405612978341], [0.7312363706291645], [0.7314333810705985], [0.7316315249053941], [0.7318307339550483], [0.732030939601556], [0.7322320728099129], [0.732434064150847], [0.7326368438238013], [0.7328403416801306], [0.7330444872465229], [0.7332492097486424], [0.7334544381349689], [0.7336601011008497], [0.7338661271127376], [0.7340724444326212], [0.7342789811426287], [0.73448566516981], [0.7346924243110751], [0.7348991862582956], [0.7351058786235447], [0.7353124289644799], [0.7355187648098548], [0.7357248136851533], [0.7359305031383311], [0.7361357607656591], [0.7363405142376633], [0.7365446913251461], [0.7367482199252701], [0.7369510280877265], [0.7371530440409269], [0.737354196218261], [0.7375544132843771], [0.7377536241614716], [0.7379517580556039], [0.7381487444830062], [0.7383445132963683], [0.7385389947111084], [0.7387321193316126], [0.7389238181774088], [0.7391140227092986], [0.7393026648554082], [0.7394896770371585], [0.739674992195141], [0.7398585438148835], [0.7400402659524988], [0.7402200932601983], [0.7403979610116632], [0.7405738051272619], [0.7407475621990867], [0.7409191695158277], [0.7410885650874302], [0.7412556876695678], [0.7414204767878765], [0.7415828727619743], [0.7417428167292212], [0.741900250668234], [0.7420551174221298], [0.7422073607214825], [0.7423569252069944], [0.7425037564518535], [0.742647800983782], [0.7427890063067464], [0.7429273209223294], [0.7430626943507519], [0.7431950771515218], [0.7433244209437118], [0.7434506784258488], [0.7435738033953991], [0.7436937507678483], [0.7438104765953568], [0.7439239380849796], [0.7440340936164564], [0.7441409027595284], [0.7442443262908103], [0.7443443262101792], [0.7444408657566799], [0.7445339094239481], [0.7446234229751189], [0.7447093734572311], [0.7447917292151213], [0.7448704599047739], [0.7449455365061458], [0.7450169313354524], [0.7450846180568904], [0.7451485716938189], [0.7452087686393563], [0.7452651866664306], [0.7453178049372303], [0.7453666040120852], [0.7454115658577605], [0.7454526738551477], [0.7454899128063639], [0.7455232689412503], [0.7455527299232587], [0.7455782848547394], [0.7455999242815854], [0.7456176401973194], [0.7456314260464848], [0.7456412767274792], [0.7456471885947391], [0.745649159460298]], "horizontal_stabilizer": [[0.2618582558799395], [0.261859370951431], [0.2618627157992263], [0.2618682893235775], [0.2618760896917969], [0.26188611433884434], [0.26189835996796196], [0.26191282255153736], [0.26192949733219223], [0.2619483788240151], [0.2619694608140218], [0.2619927363637983], [0.26201819781133767], [0.26204583677306337], [0.2620756441460653], [0.26210761011051514], [0.262141724132271], [0.26217797496569656], [0.2622163506566615], [0.26225683854572773], [0.2622994252715579], [0.2623440967744916], [0.26239083830032817], [0.26243963440431206], [0.26249046895529854], [0.26254332514012835], [0.2625981854681913], [0.2626550317761877], [0.2627138452330868], [0.26277460634528066], [0.26283729496193664], [0.262901890280541], [0.26296837085264557], [0.2630367145898081], [0.2631068987697266], [0.26317890004257627], [0.26325269443753624], [0.26332825736951976], [0.2634055636460925], [0.26348458747459724], [0.2635653024694595], [0.26364768165970903], [0.26373169749667646], [0.2638173218618978], [0.2639045260752089], [0.2639932809030348], [0.26408355656687205], [0.2641753227519626], [0.26426854861616456], [0.2643632027990092], [0.2644592534309501], [0.2645566681428065], [0.26465541407538595], [0.26475545788930654], [0.2648567657749941], [0.2649593034628771], [0.2650630362337505], [0.2651679289293406], [0.2652739459630323], [0.2653810513307927], [0.2654892086222608], [0.2655983810320188], [0.2657085313710377], [0.26581962207829246], [0.2659316152325525], [0.2660444725643326], [0.2661581554680189], [0.26627262501414795], [0.26638784196185605], [0.26650376677147936], [0.266620359617315], [0.2667375804005285], [0.26685538876221593], [0.2669737440966115], [0.2670926055644323], [0.2672119321063716], [0.2673316824567213], [0.26745181515712824], [0.26757228857048193], [0.26769306089492256], [0.2678140901779737], [0.26793533433078776], [0.2680567511425075], [0.26817829829473017], [0.26829993337608155], [0.26842161389688196], [0.26854329730391147], [0.2686649409952591], [0.2687865023352591], [0.26890793866950385], [0.26902920733993324], [0.269150265699988], [0.26927107112982634], [0.2693915810516003], [0.2695117529447807], [0.2696315443615234], [0.2697509129420866], [0.26986981643026364], [0.26998821268885964], [0.2701060597151803], [0.2702233156565318], [0.27033993882573515], [0.27045588771664203], [0.2705711210196366], [0.27068559763713235], [0.2707992766990523], [0.27091211757827216], [0.2710240799060418], [0.27113512358736064], [0.27124520881630765], [0.27135429609131717], [0.27146234623039267], [0.27156932038625237], [0.27167518006139846], [0.2717798871231025], [0.2718834038183036], [0.27198569278839985], [0.2720867170839469], [0.2721864401792298], [0.2722848259867276], [0.2723818388714386], [0.2724774436650799], [0.2725716056801362], [0.2726642907237644], [0.27275546511153853], [0.2728450956810281], [0.27293314980520855], [0.27301959540568715], [0.27310440096574695], [0.27318753554319375], [0.27326896878300094], [0.27334867092975307], [0.27342661283986436], [0.2735027659935836], [0.27357710250676665], [0.27364959514241255], [0.2737202173219603], [0.27378894313633545], [0.2738557473567381], [0.27392060544517954], [0.27398349356473806], [0.27404438858955193], [0.27410326811452723], [0.27416011046476063], [0.2742148947046754], [0.27426760064685535], [0.2743182088605784], [0.27436670068004954], [0.27441305821231216], [0.27445726434484685], [0.2744993027528538], [0.2745391579061997], [0.2745768150760444], [0.2746122603411231], [0.274645480593702], [0.2746764635451812], [0.2747051977313597], [0.27473167251735114], [0.27475587810214447], [0.2747778055228108], [0.2747974466583577], [0.27481479423321964], [0.27482984182039116], [0.27484258384418186], [0.27485301558263936], [0.2748611331695601], [0.27486693359616854], [0.2748704147124139], [0.2748715752278925]], "vertical_stabilizer": [[0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0]]}, "total": [[0.7108180081399759], [0.7108200027901779], [0.7108259860839582], [0.7108359560513584], [0.7108499094095256], [0.7108678415637661], [0.7108897466086938], [0.7109156173297863], [0.7109454452053494], [0.71097922040874], [0.7110169318110001], [0.711058566983822], [0.7111041122028595], [0.7111535524513783], [0.711206871424289], [0.7112640515325018], [0.7113250739076266], [0.711389918407053], [0.7114585636193637], [0.7115309868700794], [0.7116071642278026], [0.7116870705106665], [0.711770679293155], [0.711857962913286], [0.7119488924801212], [0.7120434378816494], [0.7121415677930142], [0.7122432496850911], [0.7123484498334256], [0.7124571333275177], [0.7125692640804661], [0.7126848048389551], [0.7128037171936048], [0.7129259615896727], [0.7130514973381008], [0.7131802826269256], [0.7133122745330333], [0.7134474290342736], [0.7135857010219177], [0.7137270443134798], [0.7138714116658681], [0.7140187547889202], [0.7141690243592524], [0.7143221700344815], [0.7144781404677877], [0.7146368833228238], [0.7147983452889731], [0.7149624720969456], [0.7151292085347315], [0.7152984984638826], [0.7154702848361394], [0.7156445097104063], [0.7158211142700434], [0.7160000388405181], [0.7161812229073666], [0.716364605134509], [0.7165501233828658], [0.7167377147293313], [0.716927315486038], [0.71711886121997], [0.7173122867728704], [0.7175075262814761], [0.7177045131980572], [0.7179031803112632], [0.7181034597672757], [0.7183052830912509], [0.7185085812090686], [0.7187132844693559], [0.7189193226658127], [0.7191266250598017], [0.7193351204032284], [0.7195447369616754], [0.7197554025378147], [0.7199670444950741], [0.7201795897815485], [0.7203929649541725], [0.7206070962031216], [0.7208219093764496], [0.7210373300049574], [0.7212532833272741], [0.7214696943151578], [0.7216864876989953], [0.7219035879935037], [0.7221209195236165], [0.7223384064505564], [0.7225559727980758], [0.7227735424788663], [0.7229910393211173], [0.7232083870952253], [0.723425509540638], [0.7236423303928298], [0.7238587734103901], [0.7240747624022198], [0.7242902212548302], [0.7245050739597275], [0.7247192446408659], [0.7249326575821874], [0.7251452372551901], [0.7253569083465639], [0.725567595785853], [0.7257772247731273], [0.7259857208066823], [0.7261930097107328], [0.7263990176630818], [0.7266036712227779], [0.726806897357735], [0.7270086234722869], [0.7272087774347006], [0.7274072876045997], [0.727604082860308], [0.7277990926260915], [0.7279922468992873], [0.7281834762773072], [0.7283727119845036], [0.7285598858988819], [0.7287449305786539], [0.7289277792886019], [0.7291083660262694], [0.7292866255479279], [0.729462493394347], [0.7296359059163149], [0.7298068002999332], [0.7299751145916396], [0.730140787722972], [0.7303037595350452], [0.7304639708027314], [0.7306213632585365], [0.7307758796161464], [0.7309274635936495], [0.731076059936403], [0.7312216144395431], [0.7313640739701285], [0.7315033864888866], [0.7316395010715764], [0.7317723679299355], [0.7319019384322056], [0.7320281651232327], [0.7321510017441161], [0.7322704032514009], [0.7323863258358206], [0.7324987269405374], [0.7326075652789151], [0.7327128008517855], [0.7328143949642035], [0.7329123102416946], [0.7330065106459616], [0.7330969614900591], [0.7331836294530312], [0.7332664825939752], [0.7333454903655545], [0.7334206236269399], [0.7334918546561634], [0.7335591571618942], [0.7336225062946073], [0.7336818786571694], [0.7337372523147968], [0.7337886068044124], [0.7338359231433846], [0.7338791838376304], [0.7339183728890939], [0.7339534758025944], [0.7339844795920295], [0.7340113727859435], [0.7340341454324245], [0.7340527891034065], [0.7340672968982465], [0.7340776634467052], [0.7340838849112539], [0.7340859589887122]]}, "drag_breakdown": {"parasite": {"main_wing": {"wetted_area": 239.23737313658532, "reference_area": 117.21806068545455, "parasite_drag_coefficient": [[0.005952323871853659], [0.005952326082737256], [0.005952332714630393], [0.005952343765260331], [0.005952359230840011], [0.005952379106069242], [0.005952403384136416], [0.005952432056720694], [0.00595246511399469], [0.005952502544627643], [0.005952544335789025], [0.005952590473152726], [0.005952640940901612], [0.005952695721732672], [0.005952754796862539], [0.005952818146033597], [0.005952885747520469], [0.005952957578137059], [0.0059530336132440085], [0.005953113826756669], [0.0059531981911535164], [0.00595328667748506], [0.0059533792553831824], [0.005953475893071], [0.005953576557373106], [0.005953681213726364], [0.005953789826191088], [0.0059539023574626945], [0.005954018768883842], [0.005954139020456962], [0.0059542630708572875], [0.00595439087744628], [0.00595452239628553], [0.005954657582151082], [0.0059547963885481624], [0.005954938767726396], [0.005955084670695393], [0.00595523404724077], [0.005955386845940615], [0.005955543014182322], [0.005955702498179852], [0.005955865242991429], [0.005956031192537571], [0.00595620028961956], [0.005956372475938297], [0.005956547692113525], [0.005956725877703449], [0.005956906971224702], [0.00595709091017272], [0.005957277631042437], [0.005957467069349382], [0.005957659159651071], [0.005957853835568801], [0.00595805102980975], [0.005958250674189412], [0.005958452699654377], [0.005958657036305405], [0.005958863613420838], [0.005959072359480312], [0.005959283202188749], [0.005959496068500675], [0.005959710884644804], [0.005959927576148898], [0.005960146067864911], [0.005960366283994388], [0.005960588148114129], [0.005960811583202078], [0.005961036511663485], [0.005961262855357293], [0.005961490535622705], [0.005961719473306048], [0.005961949588787763], [0.005962180802009655], [0.005962413032502297], [0.005962646199412633], [0.00596288022153174], [0.005963115017322781], [0.0059633505049490705], [0.005963586602302323], [0.005963823227031032], [0.005964060296568947], [0.005964297728163701], [0.005964535438905534], [0.005964773345756114], [0.00596501136557744], [0.0059652494151608325], [0.0059654874112559835], [0.005965725270600087], [0.005965962909946981], [0.005966200246096358], [0.005966437195922982], [0.00596667367640595], [0.005966909604657931], [0.005967144897954408], [0.0059673794737629205], [0.0059676132497722655], [0.005967846143921684], [0.005968078074429966], [0.005968308959824534], [0.005968538718970431], [0.005968767271099252], [0.005968994535837986], [0.005969220433237722], [0.0059694448838022865], [0.005969667808516743], [0.005969889128875749], [0.005970108766911778], [0.005970326645223189], [0.005970542687002124], [0.00597075681606223], [0.005970968956866196], [0.005971179034553087], [0.00597138697496547], [0.005971592704676318], [0.005971796151015698], [0.005971997242097182], [0.005972195906844051], [0.0059723920750152015], [0.005972585677230783], [0.005972776644997574], [0.005972964910734027], [0.005973150407795056], [0.005973333070496449], [0.005973512834139016], [0.005973689635032357], [0.005973863410518316], [0.00597403409899404], [0.005974201639934723], [0.005974365973915943], [0.005974527042635616], [0.005974684788935569], [0.005974839156822703], [0.00597499009148975], [0.005975137539335595], [0.005975281447985195], [0.005975421766309025], [0.005975558444442116], [0.005975691433802599], [0.005975820687109821], [0.005975946158401979], [0.005976067803053254], [0.005976185577790489], [0.005976299440709359], [0.005976409351290043], [0.005976515270412394], [0.005976617160370583], [0.005976714984887225], [0.0059768087091269986], [0.005976898299709701], [0.005976983724722782], [0.005977064953733329], [0.005977141957799518], [0.005977214709481467], [0.005977283182851594], [0.005977347353504346], [0.005977407198565394], [0.00597746269670026], [0.005977513828122336], [0.005977560574600354], [0.005977602919465265], [0.005977640847616505], [0.0059776743455277155], [0.005977703401251821], [0.005977728004425572], [0.00597774814627341], [0.005977763819610838], [0.00597777501884707], [0.005977781739987203], [0.0059777839806336745]], "skin_friction_coefficient": [[0.002662641082972685], [0.0026626420607673935], [0.0026626449938163678], [0.0026626498811142523], [0.002662656720985823], [0.002662665511086518], [0.002662676248403193], [0.0026626889292550924], [0.0026627035492950354], [0.0026627201035108188], [0.0026627385862268206], [0.002662758991105845], [0.0026627813111511456], [0.0026628055387087047], [0.002662831665469672], [0.002662859682473075], [0.0026628895801086893], [0.002662921348120149], [0.0026629549756082625], [0.002662990451034529], [0.0026630277622248706], [0.002663066896373572], [0.0026631078400474223], [0.0026631505791900704], [0.0026631950991265695], [0.002663241384568148], [0.002663289419617163], [0.0026633391877722576], [0.0026633906719337325], [0.0026634438544090996], [0.00266349871691884], [0.002663555240602358], [0.0026636134060241254], [0.0026636731931800285], [0.0026637345815038846], [0.00266379754987418], [0.002663862076620966], [0.0026639281395329536], [0.0026639957158648016], [0.002664064782344564], [0.0026641353151813357], [0.0026642072900730793], [0.0026642806822146105], [0.002664355466305772], [0.0026644316165597764], [0.0026645091067117135], [0.00266458791002724], [0.0026646679993114083], [0.002664749346917688], [0.0026648319247571236], [0.0026649157043076724], [0.002665000656623669], [0.002665086752345472], [0.00266517396170924], [0.0026652622545568667], [0.002665351600346057], [0.002665441968160536], [0.002665533326720409], [0.0026656256443926612], [0.002665718889201761], [0.002665813028840431], [0.002665908030680521], [0.0026660038617840063], [0.002666100488914116], [0.0026661978785465688], [0.0026662959968809263], [0.0026663948098520495], [0.002666494283141672], [0.002666594382190072], [0.002666695072207829], [0.0026667963181877066], [0.0026668980849165894], [0.002667000336987543], [0.0026671030388119308], [0.0026672061546316322], [0.0026673096485313116], [0.002667413484450795], [0.002667517626197473], [0.002667622037458806], [0.0026677266818148668], [0.0026678315227509452], [0.0026679365236702028], [0.0026680416479063786], [0.0026681468587365365], [0.002668252119393848], [0.0026683573930804142], [0.0026684626429801118], [0.0026685678322714737], [0.0026686729241405817], [0.0026687778817939783], [0.0026688826684715897], [0.002668987247459667], [0.0026690915821037113], [0.0026691956358214047], [0.0026692993721155463], [0.0026694027545869532], [0.00266950574694738], [0.0026696083130323704], [0.0026697104168141297], [0.00266981202241434], [0.0026699130941169433], [0.0026700135963808975], [0.0026701134938528722], [0.002670212751379902], [0.0026703113340219888], [0.00267040920706464], [0.0026705063360313403], [0.002670602686695966], [0.0026706982250951096], [0.0026707929175403427], [0.0026708867306303803], [0.0026709796312631737], [0.002671071586647889], [0.002671162564316808], [0.0026712525321371202], [0.0026713414583225997], [0.0026714293114451847], [0.002671516060446427], [0.00267160167464883], [0.002671686123767055], [0.002671769377918996], [0.002671851407636736], [0.002671932183877329], [0.002672011678033482], [0.002672089861944053], [0.0026721667079044153], [0.002672242188676653], [0.0026723162774996063], [0.002672388948098748], [0.0026724601746958812], [0.0026725299320186744], [0.0026725981953100155], [0.0026726649403371783], [0.0026727301434008094], [0.0026727937813437234], [0.0026728558315595036], [0.002672916272000906], [0.002672975081188061], [0.002673032238216471], [0.002673087722764809], [0.002673141515102483], [0.0026731935960970115], [0.002673243947221163], [0.002673292550559884], [0.0026733393888169993], [0.0026733844453216823], [0.0026734277040347], [0.002673469149554424], [0.0026735087671226065], [0.0026735465426299117], [0.002673582462621212], [0.0026736165143006504], [0.002673648685536434], [0.0026736789648654077], [0.002673707341497357], [0.0026737338053190677], [0.0026737583468981374], [0.002673780957486518], [0.002673801629023818], [0.0026738203541403402], [0.002673837126159851], [0.0026738519391021026], [0.002673864787685087], [0.0026738756673270283], [0.002673884574148107], [0.0026738915049719356], [0.002673896457326733], [0.002673899429446288], [0.0026739004202705973]], "compressibility_factor": [[0.9930381414204288], [0.9930381365780058], [0.9930381220523903], [0.9930380978485404], [0.9930380639747203], [0.9930380204424947], [0.9930379672667256], [0.99303790446557], [0.9930378320604705], [0.9930377500761519], [0.9930376585406113], [0.9930375574851099], [0.9930374469441627], [0.9930373269555292], [0.9930371975601975], [0.993037058802377], [0.9930369107294795], [0.9930367533921057], [0.993036586844031], [0.9930364111421853], [0.9930362263466365], [0.9930360325205726], [0.9930358297302784], [0.9930356180451178], [0.9930353975375088], [0.9930351682829031], [0.9930349303597595], [0.9930346838495203], [0.9930344288365852], [0.9930341654082832], [0.9930338936548463], [0.9930336136693786], [0.9930333255478282], [0.9930330293889559], [0.9930327252943016], [0.9930324133681544], [0.9930320937175174], [0.9930317664520729], [0.9930314316841484], [0.9930310895286781], [0.9930307401031673], [0.9930303835276548], [0.9930300199246714], [0.9930296494192029], [0.9930292721386468], [0.9930288882127727], [0.9930284977736799], [0.9930281009557522], [0.9930276978956163], [0.993027288732095], [0.9930268736061637], [0.9930264526609017], [0.9930260260414472], [0.9930255938949476], [0.9930251563705121], [0.9930247136191621], [0.9930242657937812], [0.9930238130490631], [0.9930233555414631], [0.9930228934291431], [0.9930224268719197], [0.993021956031212], [0.9930214810699863], [0.9930210021527014], [0.9930205194452537], [0.9930200331149229], [0.9930195433303124], [0.9930190502612944], [0.9930185540789546], [0.9930180549555284], [0.9930175530643485], [0.9930170485797825], [0.9930165416771748], [0.993016032532786], [0.9930155213237345], [0.9930150082279323], [0.9930144934240288], [0.9930139770913449], [0.9930134594098141], [0.9930129405599193], [0.9930124207226317], [0.9930119000793459], [0.9930113788118194], [0.9930108571021085], [0.9930103351325045], [0.9930098130854711], [0.9930092911435802], [0.9930087694894477], [0.993008248305671], [0.9930077277747628], [0.993007208079088], [0.9930066894008013], [0.9930061719217786], [0.993005655823557], [0.9930051412872685], [0.9930046284935748], [0.9930041176226065], [0.9930036088538953], [0.993003102366312], [0.993002598338002], [0.9930020969463216], [0.9930015983677759], [0.9930011027779527], [0.9930006103514613], [0.9930001212618694], [0.9929996356816398], [0.9929991537820694], [0.9929986757332253], [0.992998201703885], [0.9929977318614741], [0.9929972663720055], [0.99299680540002], [0.9929963491085247], [0.9929958976589339], [0.9929954512110113], [0.9929950099228094], [0.9929945739506141], [0.9929941434488849], [0.9929937185701989], [0.9929932994651953], [0.9929928862825188], [0.9929924791687657], [0.9929920782684278], [0.9929916837238413], [0.9929912956751326], [0.9929909142601666], [0.9929905396144951], [0.9929901718713061], [0.9929898111613765], [0.9929894576130192], [0.9929891113520387], [0.9929887725016819], [0.9929884411825944], [0.9929881175127714], [0.9929878016075175], [0.9929874935794006], [0.9929871935382111], [0.9929869015909192], [0.9929866178416359], [0.9929863423915736], [0.9929860753390068], [0.9929858167792365], [0.9929855668045521], [0.9929853255041988], [0.9929850929643422], [0.9929848692680373], [0.9929846544951932], [0.9929844487225485], [0.9929842520236372], [0.9929840644687632], [0.9929838861249727], [0.9929837170560291], [0.9929835573223886], [0.9929834069811774], [0.9929832660861689], [0.992983134687765], [0.992983012832975], [0.9929829005653987], [0.9929827979252097], [0.9929827049491396], [0.9929826216704646], [0.992982548118992], [0.9929824843210495], [0.9929824302994749], [0.9929823860736068], [0.9929823516592791], [0.9929823270688113], [0.9929823123110084], [0.9929823073911535]], "reynolds_factor": [[0.9971107150762276], [0.9971107133006576], [0.9971107079745546], [0.9971106990997398], [0.9971106866792495], [0.997110670717331], [0.9971106512194445], [0.9971106281922592], [0.9971106016436516], [0.9971105715827043], [0.997110538019701], [0.9971105009661247], [0.9971104604346538], [0.9971104164391578], [0.9971103689946926], [0.9971103181174963], [0.9971102638249837], [0.9971102061357406], [0.9971101450695186], [0.9971100806472272], [0.9971100128909292], [0.9971099418238314], [0.9971098674702789], [0.9971097898557472], [0.9971097090068318], [0.9971096249512434], [0.9971095377177955], [0.9971094473363966], [0.9971093538380413], [0.9971092572547987], [0.9971091576198036], [0.9971090549672439], [0.9971089493323521], [0.9971088407513916], [0.9971087292616461], [0.9971086149014071], [0.997108497709962], [0.9971083777275807], [0.9971082549955026], [0.9971081295559238], [0.9971080014519825], [0.9971078707277454], [0.9971077374281937], [0.997107601599207], [0.9971074632875497], [0.9971073225408553], [0.99710717940761], [0.9971070339371378], [0.997106886179584], [0.9971067361858977], [0.9971065840078172], [0.9971064296978495], [0.9971062733092567], [0.9971061148960353], [0.9971059545129004], [0.9971057922152659], [0.9971056280592275], [0.9971054621015426], [0.9971052943996129], [0.9971051250114634], [0.9971049539957245], [0.9971047814116115], [0.9971046073189055], [0.9971044317779322], [0.9971042548495423], [0.9971040765950909], [0.997103897076417], [0.9971037163558214], [0.9971035344960475], [0.9971033515602582], [0.9971031676120155], [0.9971029827152582], [0.9971027969342807], [0.9971026103337105], [0.9971024229784867], [0.9971022349338367], [0.9971020462652551], [0.9971018570384798], [0.9971016673194706], [0.9971014771743857], [0.9971012866695594], [0.9971010958714778], [0.9971009048467577], [0.9971007136621218], [0.9971005223843767], [0.9971003310803884], [0.99710013981706], [0.9970999486613078], [0.997099757680038], [0.9970995669401235], [0.9970993765083791], [0.9970991864515404], [0.9970989968362376], [0.997098807728974], [0.997098619196101], [0.9970984313037959], [0.9970982441180379], [0.9970980577045835], [0.9970978721289453], [0.9970976874563672], [0.9970975037518005], [0.9970973210798829], [0.9970971395049131], [0.9970969590908291], [0.9970967799011841], [0.997096601999125], [0.9970964254473683], [0.9970962503081792], [0.9970960766433462], [0.997095904514162], [0.9970957339813991], [0.9970955651052885], [0.9970953979454982], [0.9970952325611104], [0.9970950690106006], [0.9970949073518163], [0.9970947476419562], [0.9970945899375484], [0.9970944342944297], [0.9970942807677265], [0.9970941294118328], [0.9970939802803913], [0.9970938334262727], [0.9970936889015574], [0.9970935467575156], [0.9970934070445878], [0.9970932698123672], [0.9970931351095806], [0.9970930029840709], [0.9970928734827785], [0.9970927466517244], [0.9970926225359931], [0.9970925011797158], [0.9970923826260534], [0.9970922669171811], [0.9970921540942724], [0.9970920441974835], [0.9970919372659384], [0.9970918333377141], [0.9970917324498266], [0.9970916346382174], [0.9970915399377382], [0.9970914483821401], [0.9970913600040594], [0.9970912748350055], [0.9970911929053504], [0.9970911142443147], [0.9970910388799588], [0.9970909668391712], [0.997090898147659], [0.9970908328299374], [0.9970907709093213], [0.9970907124079152], [0.9970906573466066], [0.9970906057450566], [0.9970905576216931], [0.9970905129937037], [0.997090471877029], [0.9970904342863572], [0.9970904002351175], [0.997090369735476], [0.9970903427983301], [0.9970903194333054], [0.9970902996487513], [0.9970902834517378], [0.9970902708480539], [0.9970902618422035], [0.9970902564374057], [0.9970902546355916]], "form_factor": [[1.2577046500906301], [1.2577046553748195], [1.2577046712255857], [1.257704697637524], [1.2577047346016272], [1.2577047821052918], [1.2577048401323183], [1.257704908662917], [1.2577049876737165], [1.2577050771377687], [1.2577051770245584], [1.2577052873000125], [1.2577054079265106], [1.2577055388628977], [1.2577056800644957], [1.2577058314831189], [1.2577059930670895], [1.2577061647612517], [1.2577063465069915], [1.257706538242254], [1.257706739901563], [1.2577069514160422], [1.257707172713437], [1.2577074037181382], [1.2577076443512034], [1.2577078945303843], [1.257708154170153], [1.2577084231817277], [1.257708701473102], [1.257708988949075], [1.257709285511278], [1.2577095910582117], [1.2577099054852734], [1.2577102286847937], [1.2577105605460697], [1.2577109009554004], [1.2577112497961236], [1.2577116069486536], [1.2577119722905195], [1.2577123456964039], [1.257712727038185], [1.2577131161849773], [1.2577135130031716], [1.2577139173564833], [1.2577143291059918], [1.2577147481101882], [1.257715174225021], [1.2577156073039417], [1.2577160471979556], [1.257716493755667], [1.257716946823331], [1.2577174062449028], [1.25771787186209], [1.2577183435144048], [1.2577188210392143], [1.2577193042717978], [1.257719793045398], [1.2577202871912796], [1.2577207865387812], [1.2577212909153759], [1.2577218001467252], [1.2577223140567413], [1.2577228324676415], [1.2577233552000107], [1.2577238820728591], [1.2577244129036864], [1.2577249475085392], [1.2577254857020765], [1.257726027297629], [1.2577265721072657], [1.2577271199418543], [1.2577276706111271], [1.257728223923746], [1.2577287796873664], [1.2577293377087042], [1.2577298977936], [1.257730459747089], [1.2577310233734633], [1.2577315884763431], [1.2577321548587426], [1.2577327223231383], [1.2577332906715366], [1.2577338597055436], [1.2577344292264339], [1.2577349990352176], [1.2577355689327134], [1.257736138719614], [1.2577367081965585], [1.257737277164202], [1.257737845423284], [1.2577384127747004], [1.2577389790195719], [1.2577395439593155], [1.2577401073957146], [1.257740669130989], [1.2577412289678636], [1.2577417867096405], [1.2577423421602696], [1.2577428951244165], [1.2577434454075325], [1.2577439928159266], [1.257744537156832], [1.2577450782384778], [1.2577456158701559], [1.257746149862292], [1.2577466800265116], [1.257747206175711], [1.257747728124122], [1.2577482456873825], [1.2577487586826002], [1.2577492669284234], [1.2577497702451026], [1.257750268454559], [1.2577507613804488], [1.2577512488482292], [1.2577517306852202], [1.2577522067206692], [1.257752676785815], [1.2577531407139473], [1.2577535983404715], [1.257754049502967], [1.257754494041249], [1.2577549317974266], [1.2577553626159625], [1.2577557863437308], [1.2577562028300733], [1.2577566119268562], [1.2577570134885252], [1.2577574073721605], [1.2577577934375288], [1.257758171547138], [1.2577585415662875], [1.2577589033631187], [1.2577592568086644], [1.2577596017768993], [1.2577599381447846], [1.2577602657923164], [1.2577605846025715], [1.2577608944617482], [1.2577611952592147], [1.2577614868875464], [1.2577617692425687], [1.2577620422233962], [1.257762305732471], [1.2577625596756], [1.25776280396199], [1.2577630385042837], [1.2577632632185909], [1.2577634780245235], [1.257763682845223], [1.2577638776073912], [1.2577640622413189], [1.2577642366809114], [1.2577644008637148], [1.257764554730939], [1.2577646982274804], [1.2577648313019438], [1.2577649539066613], [1.2577650659977102], [1.257765167534931], [1.2577652584819425], [1.2577653388061556], [1.2577654084787844], [1.2577654674748604], [1.2577655157732386], [1.2577655533566083], [1.2577655802114993], [1.2577655963282852], [1.2577656017011896]]}, "horizontal_stabilizer": {"wetted_area": 83.751714, "reference_area": 41.49, "parasite_drag_coefficient": [[0.0019577971985915046], [0.00195779792830288], [0.001957800117186936], [0.0019578037644935363], [0.0019578088689727324], [0.001957815428875151], [0.0019578234419525657], [0.001957832905458616], [0.0019578438161496937], [0.001957856170285986], [0.001957869963632676], [0.0019578851914613107], [0.0019579018485513205], [0.001957919929191704], [0.001957939427182861], [0.0019579603358386008], [0.0019579826479882924], [0.001958006355979174], [0.001958031451678833], [0.001958057926477823], [0.001958085771292447], [0.0019581149765677004], [0.0019581455322803458], [0.001958177427942175], [0.001958210652603389], [0.0019582451948561585], [0.0019582810428383133], [0.0019583181842371925], [0.0019583566062936447], [0.001958396295806175], [0.001958437239135232], [0.0019584794222076503], [0.001958522830521233], [0.0019585674491494824], [0.0019586132627464614], [0.001958660255551813], [0.001958708411395909], [0.001958757713705136], [0.00195880814550733], [0.001958859689437331], [0.001958912327742691], [0.0019589660422894965], [0.0019590208145683356], [0.001959076625700389], [0.001959133456443651], [0.0019591912871992773], [0.001959250098018061], [0.001959309868607024], [0.0019593705783361366], [0.001959432206245155], [0.001959494731050579], [0.0019595581311527186], [0.00195962238464288], [0.001959687469310667], [0.001959753362651385], [0.0019598200418735542], [0.0019598874839065333], [0.001959955665408241], [0.001960024562772986], [0.0019600941521393835], [0.0019601644093983845], [0.0019602353102013853], [0.0019603068299684397], [0.0019603789438965534], [0.0019604516269680636], [0.001960524853959122], [0.0019605985994482276], [0.001960672837824866], [0.001960747543298221], [0.001960822689905939], [0.0019608982515229995], [0.0019609742018706234], [0.0019610505145252607], [0.0019611271629276458], [0.001961204120391899], [0.001961281360114695], [0.0019613588551844873], [0.001961436578590771], [0.001961514503233405], [0.001961592601931983], [0.0019616708474352296], [0.001961749212430447], [0.001961827669553001], [0.0019619061913958265], [0.001961984750518974], [0.0019620633194591727], [0.0019621418707394217], [0.001962220376878603], [0.0019622988104011], [0.001962377143846439], [0.0019624553497789334], [0.00196253340079734], [0.001962611269544507], [0.001962688928717031], [0.001962766351074905], [0.001962843509451157], [0.0019629203767614826], [0.0019629969260138483], [0.001963073130318097], [0.001963148962895512], [0.0019632243970883635], [0.0019632994063694285], [0.001963373964351471], [0.001963448044796687], [0.001963521621626111], [0.001963594668928981], [0.001963667160972045], [0.001963739072208834], [0.0019638103772888593], [0.0019638810510667717], [0.001963951068611443], [0.0019640204052149934], [0.0019640890364017367], [0.0019641569379370677], [0.0019642240858362627], [0.001964290456373204], [0.001964356026089024], [0.0019644207718006548], [0.0019644846706092884], [0.001964547699908761], [0.0019646098373938057], [0.0019646710610682436], [0.0019647313492530357], [0.0019647906805942534], [0.001964849034070925], [0.0019649063890027738], [0.001964962725057831], [0.0019650180222599394], [0.001965072260996129], [0.001965125422023857], [0.001965177486478135], [0.0019652284358785063], [0.001965278252135905], [0.0019653269175593513], [0.0019653744148625378], [0.0019654207271702384], [0.0019654658380245968], [0.001965509731391245], [0.001965552391665281], [0.0019655938036770883], [0.001965633952697995], [0.0019656728244457733], [0.00196571040508998], [0.001965746681257125], [0.001965781640035679], [0.0019658152689809114], [0.0019658475561195447], [0.0019658784899542537], [0.0019659080594679724], [0.0019659362541280356], [0.0019659630638901287], [0.001965988479202063], [0.001966012491007374], [0.00196603509074872], [0.0019660562703711056], [0.001966076022324913], [0.00196609433956875], [0.001966111215572093], [0.0019661266443177596], [0.0019661406203041673], [0.0019661531385474175], [0.001966164194583165], [0.001966173784468311], [0.0019661819047824894], [0.0019661885526293496], [0.001966193725637668], [0.0019661974219622185], [0.0019661996402844943], [0.0019662003798131865]], "skin_friction_coefficient": [[0.002723276517819067], [0.002723277525842993], [0.0027232805495692796], [0.0027232855879615616], [0.0027232926392929424], [0.0027233017011465367], [0.0027233127704162584], [0.0027233258433078155], [0.0027233409153399313], [0.002723357981345792], [0.0027233770354747025], [0.0027233980711939792], [0.0027234210812910483], [0.002723446057875776], [0.002723472992383003], [0.00272350187557532], [0.002723532697546037], [0.002723565447722383], [0.0027236001148689248], [0.002723636687091191], [0.002723675151839517], [0.0027237154959131133], [0.002723757705464315], [0.002723801766003089], [0.002723847662401712], [0.002723895378899685], [0.0027239448991088354], [0.002723996206018642], [0.0027240492820017584], [0.002724104108819748], [0.0027241606676290117], [0.0027242189389869234], [0.0027242789028581664], [0.0027243405386212717], [0.002724403825075338], [0.002724468740446968], [0.002724535262397384], [0.0027246033680297355], [0.00272467303389661], [0.0027247442360077106], [0.0027248169498377403], [0.002724891150334456], [0.00272496681192691], [0.0027250439085338713], [0.0027251224135724224], [0.00272520229996673], [0.002725283540156998], [0.0027253661061085728], [0.002725449969321234], [0.002725535100838643], [0.002725621471257953], [0.002725709050739581], [0.002725797809017136], [0.0027258877154075073], [0.002725978738821095], [0.0027260708477721994], [0.002726164010389548], [0.0027262581944269676], [0.002726353367274208], [0.0027264494959678746], [0.0027265465472025288], [0.0027266444873418907], [0.002726743282430188], [0.0027268428982036128], [0.002726943300101909], [0.002727044453280081], [0.002727146322620195], [0.002727248872743309], [0.0027273520680215105], [0.0027274558725900277], [0.0027275602503594835], [0.0027276651650282057], [0.0027277705800946416], [0.0027278764588698676], [0.002727982764490171], [0.0027280894599297075], [0.002728196508013249], [0.0027283038714289833], [0.0027284115127413893], [0.00272851939440418], [0.00272862747877329], [0.002728735728119923], [0.0027288441046436503], [0.0027289525704855514], [0.0027290610877413945], [0.0027291696184748486], [0.0027292781247307343], [0.0027293865685483016], [0.002729494911974514], [0.0027296031170773697], [0.0027297111459592227], [0.002729818960770118], [0.0027299265237211226], [0.002730033797097658], [0.0027301407432728346], [0.002730247324720755], [0.002730353504029827], [0.002730459243916023], [0.0027305645072361485], [0.0027306692570010487], [0.0027307734563887984], [0.0027308770687578454], [0.002730980057660105], [0.002731082386854007], [0.0027311840203174814], [0.0027312849222608983], [0.0027313850571399154], [0.002731484389668287], [0.002731582884830565], [0.002731680507894746], [0.0027317772244248154], [0.002731873000293211], [0.0027319678016931807], [0.002732061595151049], [0.0027321543475383753], [0.0027322460260839985], [0.0027323365983859737], [0.0027324260324233787], [0.002732514296568001], [0.0027326013595959033], [0.0027326871906988353], [0.0027327717594955287], [0.0027328550360428243], [0.002732936990846679], [0.0027330175948729945], [0.0027330968195583036], [0.002733174636820283], [0.002733251019068116], [0.00273332593921267], [0.0027333993706765017], [0.002733471287403688], [0.0027335416638694693], [0.002733610475089713], [0.0027336776966301593], [0.002733743304615517], [0.002733807275738311], [0.0027338695872675604], [0.0027339302170572336], [0.002733989143554496], [0.002734046345807746], [0.0027341018034744277], [0.0027341554968286254], [0.0027342074067684334], [0.0027342575148230955], [0.0027343058031599173], [0.002734352254590941], [0.0027343968525793787], [0.0027344395812458197], [0.002734480425374175], [0.002734519370417398], [0.002734556402502936], [0.0027345915084379434], [0.0027346246757142477], [0.0027346558925130417], [0.0027346851477093345], [0.0027347124308761375], [0.002734737732288391], [0.0027347610429266198], [0.00273478235448034], [0.0027348016593511837], [0.0027348189506557707], [0.002734834222228292], [0.0027348474686228466], [0.0027348586851154914], [0.0027348678677060183], [0.0027348750131194776], [0.002734880118807392], [0.0027348831829487443], [0.0027348842044506417]], "compressibility_factor": [[0.9930381414204288], [0.9930381365780059], [0.9930381220523903], [0.9930380978485405], [0.9930380639747204], [0.9930380204424947], [0.9930379672667257], [0.99303790446557], [0.9930378320604705], [0.993037750076152], [0.9930376585406114], [0.99303755748511], [0.9930374469441628], [0.9930373269555289], [0.9930371975601974], [0.9930370588023771], [0.9930369107294794], [0.9930367533921058], [0.993036586844031], [0.9930364111421854], [0.9930362263466365], [0.9930360325205725], [0.9930358297302783], [0.9930356180451178], [0.9930353975375087], [0.9930351682829031], [0.9930349303597596], [0.9930346838495203], [0.9930344288365852], [0.9930341654082833], [0.9930338936548463], [0.9930336136693787], [0.9930333255478283], [0.9930330293889558], [0.9930327252943015], [0.9930324133681542], [0.9930320937175174], [0.9930317664520728], [0.9930314316841484], [0.9930310895286781], [0.9930307401031674], [0.9930303835276548], [0.9930300199246715], [0.9930296494192028], [0.9930292721386468], [0.9930288882127727], [0.9930284977736799], [0.9930281009557522], [0.9930276978956162], [0.993027288732095], [0.9930268736061637], [0.993026452660902], [0.9930260260414472], [0.9930255938949475], [0.9930251563705121], [0.9930247136191622], [0.9930242657937811], [0.993023813049063], [0.9930233555414631], [0.9930228934291432], [0.9930224268719197], [0.9930219560312122], [0.9930214810699863], [0.9930210021527013], [0.9930205194452536], [0.9930200331149229], [0.9930195433303123], [0.9930190502612946], [0.9930185540789547], [0.9930180549555284], [0.9930175530643485], [0.9930170485797823], [0.9930165416771748], [0.993016032532786], [0.9930155213237345], [0.9930150082279324], [0.9930144934240288], [0.9930139770913451], [0.9930134594098141], [0.9930129405599194], [0.9930124207226317], [0.9930119000793458], [0.9930113788118196], [0.9930108571021085], [0.9930103351325047], [0.9930098130854712], [0.99300929114358], [0.9930087694894478], [0.993008248305671], [0.9930077277747626], [0.9930072080790882], [0.9930066894008012], [0.9930061719217788], [0.993005655823557], [0.9930051412872685], [0.9930046284935748], [0.9930041176226064], [0.9930036088538952], [0.9930031023663118], [0.993002598338002], [0.9930020969463218], [0.9930015983677759], [0.9930011027779527], [0.9930006103514613], [0.9930001212618692], [0.99299963568164], [0.9929991537820693], [0.9929986757332253], [0.992998201703885], [0.9929977318614741], [0.9929972663720056], [0.99299680540002], [0.9929963491085246], [0.9929958976589339], [0.9929954512110113], [0.9929950099228095], [0.9929945739506142], [0.992994143448885], [0.9929937185701989], [0.9929932994651955], [0.9929928862825188], [0.9929924791687657], [0.9929920782684278], [0.9929916837238412], [0.9929912956751326], [0.9929909142601667], [0.992990539614495], [0.9929901718713061], [0.9929898111613767], [0.9929894576130193], [0.9929891113520387], [0.992988772501682], [0.9929884411825944], [0.9929881175127713], [0.9929878016075177], [0.9929874935794005], [0.9929871935382111], [0.9929869015909191], [0.9929866178416359], [0.9929863423915736], [0.992986075339007], [0.9929858167792365], [0.9929855668045521], [0.9929853255041987], [0.9929850929643422], [0.9929848692680373], [0.9929846544951932], [0.9929844487225485], [0.9929842520236372], [0.9929840644687633], [0.9929838861249727], [0.9929837170560291], [0.9929835573223886], [0.9929834069811774], [0.9929832660861689], [0.992983134687765], [0.9929830128329751], [0.9929829005653988], [0.9929827979252097], [0.9929827049491396], [0.9929826216704647], [0.992982548118992], [0.9929824843210495], [0.9929824302994749], [0.9929823860736067], [0.9929823516592792], [0.9929823270688112], [0.9929823123110084], [0.9929823073911536]], "reynolds_factor": [[0.9971107150762277], [0.9971107133006576], [0.9971107079745546], [0.9971106990997398], [0.9971106866792494], [0.9971106707173311], [0.9971106512194444], [0.9971106281922593], [0.9971106016436517], [0.9971105715827043], [0.997110538019701], [0.9971105009661249], [0.9971104604346539], [0.9971104164391579], [0.9971103689946924], [0.9971103181174963], [0.9971102638249837], [0.9971102061357405], [0.9971101450695186], [0.9971100806472274], [0.9971100128909289], [0.9971099418238314], [0.997109867470279], [0.9971097898557469], [0.9971097090068319], [0.9971096249512434], [0.9971095377177955], [0.9971094473363967], [0.9971093538380414], [0.9971092572547988], [0.9971091576198036], [0.997109054967244], [0.9971089493323521], [0.9971088407513915], [0.997108729261646], [0.9971086149014071], [0.997108497709962], [0.9971083777275804], [0.9971082549955026], [0.9971081295559239], [0.9971080014519826], [0.9971078707277455], [0.9971077374281938], [0.9971076015992071], [0.9971074632875497], [0.9971073225408552], [0.99710717940761], [0.9971070339371377], [0.9971068861795839], [0.997106736185898], [0.9971065840078173], [0.9971064296978496], [0.9971062733092565], [0.9971061148960353], [0.9971059545129003], [0.997105792215266], [0.9971056280592275], [0.9971054621015427], [0.9971052943996129], [0.9971051250114632], [0.9971049539957244], [0.9971047814116114], [0.9971046073189055], [0.9971044317779322], [0.9971042548495422], [0.9971040765950909], [0.9971038970764169], [0.9971037163558213], [0.9971035344960476], [0.9971033515602583], [0.9971031676120155], [0.9971029827152582], [0.9971027969342807], [0.9971026103337105], [0.9971024229784867], [0.9971022349338365], [0.997102046265255], [0.9971018570384798], [0.9971016673194708], [0.9971014771743859], [0.9971012866695594], [0.9971010958714779], [0.9971009048467577], [0.9971007136621218], [0.9971005223843767], [0.9971003310803884], [0.9971001398170599], [0.9970999486613079], [0.9970997576800381], [0.9970995669401237], [0.9970993765083792], [0.9970991864515405], [0.9970989968362377], [0.997098807728974], [0.9970986191961012], [0.997098431303796], [0.9970982441180378], [0.9970980577045835], [0.9970978721289453], [0.9970976874563672], [0.9970975037518004], [0.9970973210798829], [0.9970971395049132], [0.9970969590908291], [0.9970967799011841], [0.9970966019991251], [0.9970964254473684], [0.997096250308179], [0.9970960766433462], [0.997095904514162], [0.9970957339813991], [0.9970955651052886], [0.9970953979454985], [0.9970952325611104], [0.9970950690106005], [0.9970949073518163], [0.997094747641956], [0.9970945899375483], [0.9970944342944297], [0.9970942807677265], [0.9970941294118327], [0.9970939802803911], [0.9970938334262728], [0.9970936889015573], [0.9970935467575155], [0.9970934070445878], [0.9970932698123671], [0.9970931351095808], [0.997093002984071], [0.9970928734827784], [0.9970927466517244], [0.9970926225359931], [0.9970925011797158], [0.9970923826260534], [0.9970922669171812], [0.9970921540942723], [0.9970920441974834], [0.9970919372659384], [0.9970918333377141], [0.9970917324498269], [0.9970916346382174], [0.9970915399377382], [0.99709144838214], [0.9970913600040595], [0.9970912748350055], [0.9970911929053504], [0.9970911142443146], [0.9970910388799586], [0.9970909668391713], [0.9970908981476589], [0.9970908328299376], [0.9970907709093213], [0.9970907124079152], [0.9970906573466066], [0.9970906057450566], [0.997090557621693], [0.9970905129937035], [0.997090471877029], [0.9970904342863572], [0.9970904002351176], [0.997090369735476], [0.9970903427983301], [0.9970903194333055], [0.9970902996487514], [0.9970902834517379], [0.9970902708480539], [0.9970902618422036], [0.9970902564374056], [0.9970902546355916]], "form_factor": [[1.1553865767909475], [1.1553865797596754], [1.1553865886648464], [1.155386603503424], [1.155386624270348], [1.1553866509585367], [1.1553866835588884], [1.155386722060285], [1.155386766449595], [1.155386816711678], [1.155386872829389], [1.1553869347835841], [1.155387002553127], [1.1553870761148948], [1.1553871554437856], [1.1553872405127266], [1.155387331292683], [1.1553874277526657], [1.1553875298597431], [1.1553876375790502], [1.1553877508737997], [1.1553878697052944], [1.1553879940329383], [1.1553881238142512], [1.15538825900488], [1.1553883995586147], [1.1553885454274022], [1.155388696561361], [1.1553888529087986], [1.1553890144162273], [1.1553891810283803], [1.1553893526882308], [1.1553895293370098], [1.1553897109142244], [1.155389897357677], [1.1553900886034871], [1.1553902845861097], [1.1553904852383567], [1.1553906904914204], [1.1553909002748928], [1.1553911145167908], [1.1553913331435783], [1.1553915560801902], [1.1553917832500566], [1.1553920145751275], [1.155392249975899], [1.1553924893714387], [1.1553927326794116], [1.1553929798161071], [1.1553932306964672], [1.1553934852341137], [1.1553937433413768], [1.1553940049293228], [1.1553942699077853], [1.1553945381853938], [1.1553948096696034], [1.155395084266726], [1.1553953618819617], [1.1553956424194296], [1.1553959257821995], [1.155396211872325], [1.1553965005908753], [1.1553967918379688], [1.1553970855128066], [1.1553973815137053], [1.1553976797381325], [1.1553979800827403], [1.1553982824434004], [1.1553985867152397], [1.1553988927926744], [1.155399200569448], [1.1553995099386656], [1.15539982079283], [1.1554001330238806], [1.1554004465232268], [1.155400761181789], [1.1554010768900325], [1.1554013935380079], [1.1554017110153862], [1.1554020292114997], [1.1554023480153783], [1.1554026673157873], [1.1554029870012683], [1.1554033069601757], [1.1554036270807166], [1.1554039472509898], [1.1554042673590241], [1.1554045872928178], [1.1554049069403785], [1.1554052261897618], [1.1554055449291107], [1.155405863046695], [1.1554061804309512], [1.1554064969705213], [1.1554068125542927], [1.1554071270714374], [1.1554074404114516], [1.1554077524641948], [1.1554080631199288], [1.1554083722693589], [1.1554086798036691], [1.1554089856145657], [1.1554092895943127], [1.1554095916357725], [1.155409891632444], [1.1554101894785007], [1.1554104850688292], [1.155410778299068], [1.1554110690656436], [1.155411357265811], [1.1554116427976882], [1.155411925560295], [1.1554122054535896], [1.155412482378505], [1.1554127562369856], [1.1554130269320226], [1.155413294367691], [1.155413558449183], [1.155413819082844], [1.1554140761762088], [1.1554143296380321], [1.1554145793783255], [1.1554148253083898], [1.1554150673408474], [1.155415305389675], [1.1554155393702368], [1.155415769199315], [1.1554159947951401], [1.1554162160774237], [1.1554164329673864], [1.1554166453877885], [1.1554168532629587], [1.1554170565188224], [1.1554172550829294], [1.155417448884482], [1.1554176378543604], [1.1554178219251507], [1.1554180010311677], [1.1554181751084815], [1.1554183440949424], [1.1554185079302026], [1.1554186665557398], [1.1554188199148798], [1.1554189679528177], [1.1554191106166387], [1.1554192478553382], [1.1554193796198415], [1.1554195058630223], [1.1554196265397205], [1.15541974160676], [1.1554198510229643], [1.1554199547491733], [1.1554200527482568], [1.1554201449851305], [1.1554202314267683], [1.1554203120422146], [1.1554203868025978], [1.1554204556811394], [1.1554205186531654], [1.1554205756961158], [1.1554206267895522], [1.1554206719151676], [1.1554207110567913], [1.155420744200397], [1.1554207713341056], [1.1554207924481934], [1.1554208075350922], [1.1554208165893953], [1.155420819607857]]}, "vertical_stabilizer": {"wetted_area": 52.23818991998674, "reference_area": 25.878425601895735, "parasite_drag_coefficient": [[0.0011302172046433283], [0.0011302176215414112], [0.0011302188720927733], [0.001130220955868797], [0.0011302238721552782], [0.0011302276199526495], [0.0011302321979763043], [0.0011302376046570118], [0.0011302438381414189], [0.0011302508962926497], [0.0011302587766909933], [0.0011302674766346808], [0.0011302769931407577], [0.0011302873229460464], [0.0011302984625081946], [0.0011303104080068213], [0.0011303231553447472], [0.0011303367001493166], [0.0011303510377738113], [0.0011303661632989523], [0.0011303820715344837], [0.0011303987570208606], [0.0011304162140310058], [0.0011304344365721728], [0.0011304534183878793], [0.0011304731529599406], [0.0011304936335105819], [0.001130514853004638], [0.0011305368041518386], [0.0011305594794091788], [0.0011305828709833716], [0.0011306069708333863], [0.0011306317706730683], [0.0011306572619738415], [0.00113068343596749], [0.0011307102836490242], [0.0011307377957796277], [0.0011307659628896742], [0.0011307947752818375], [0.0011308242230342654], [0.0011308542960038405], [0.001130884983829511], [0.0011309162759356997], [0.0011309481615357862], [0.001130980629635662], [0.001131013669037359], [0.0011310472683427508], [0.0011310814159573197], [0.001131116100093998], [0.0011311513087770753], [0.0011311870298461753], [0.0011312232509602942], [0.0011312599596019085], [0.0011312971430811477], [0.0011313347885400233], [0.001131372882956728], [0.0011314114131499861], [0.001131450365783472], [0.001131489727370281], [0.0011315294842774554], [0.0011315696227305729], [0.0011316101288183814], [0.0011316509884974888], [0.0011316921875971064], [0.0011317337118238384], [0.0011317755467665238], [0.0011318176779011176], [0.0011318600905956273], [0.001131902770115086], [0.0011319457016265675], [0.0011319888702042498], [0.0011320322608345062], [0.001132075858421045], [0.0011321196477900761], [0.001132163613695519], [0.0011322077408242365], [0.0011322520138013076], [0.0011322964171953179], [0.0011323409355236908], [0.0011323855532580339], [0.0011324302548295143], [0.001132475024634252], [0.001132519847038742], [0.0011325647063852823], [0.0011326095869974302], [0.0011326544731854646], [0.0011326993492518668], [0.0011327441994968112], [0.0011327890082236615], [0.001132833759744475], [0.0011328784383855183], [0.0011329230284927788], [0.0011329675144374776], [0.0011330118806215873], [0.0011330561114833429], [0.0011331001915027457], [0.0011331441052070674], [0.0011331878371763388], [0.0011332313720488307], [0.0011332746945265234], [0.001133317789380553], [0.0011333606414566562], [0.0011334032356805801], [0.0011334455570634794], [0.0011334875907072896], [0.001133529321810075], [0.001133570735671346], [0.0011336118176973522], [0.0011336525534063405], [0.0011336929284337823], [0.0011337329285375623], [0.001133772539603134], [0.0011338117476486287], [0.0011338505388299323], [0.0011338888994457095], [0.0011339268159423909], [0.0011339642749191008], [0.0011340012631325534], [0.001134037767501872], [0.0011340737751133836], [0.0011341092732253327], [0.0011341442492725537], [0.0011341786908710763], [0.0011342125858226726], [0.0011342459221193406], [0.001134278687947719], [0.0011343108716934409], [0.0011343424619454146], [0.0011343734475000363], [0.001134403817365326], [0.0011344335607649952], [0.0011344626671424348], [0.0011344911261646257], [0.0011345189277259702], [0.0011345460619520474], [0.0011345725192032738], [0.0011345982900784952], [0.0011346233654184808], [0.0011346477363093357], [0.0011346713940858233], [0.0011346943303345985], [0.0011347165368973478], [0.001134738005873836], [0.0011347587296248623], [0.0011347787007751154], [0.0011347979122159374], [0.0011348163571079809], [0.0011348340288837814], [0.0011348509212502115], [0.0011348670281908478], [0.0011348823439682274], [0.0011348968631260045], [0.0011349105804909982], [0.001134923491175142], [0.0011349355905773183], [0.0011349468743850927], [0.0011349573385763356], [0.0011349669794207384], [0.0011349757934812166], [0.0011349837776152088], [0.0011349909289758567], [0.0011349972450130823], [0.0011350027234745474], [0.0011350073624065045], [0.0011350111601545318], [0.001135014115364162], [0.0011350162269813848], [0.0011350174942530574], [0.001135017916727177]], "skin_friction_coefficient": [[0.002658182385252672], [0.0026581833610352405], [0.0026581862880484817], [0.002658191165289107], [0.0026581979910853385], [0.002658206763097432], [0.002658217478318435], [0.0026582301330751626], [0.0026582447230293687], [0.0026582612431791525], [0.002658279687860563], [0.0026583000507494257], [0.0026583223248633865], [0.0026583465025641516], [0.002658372575559961], [0.0026584005349082587], [0.002658430371018579], [0.00265846207365564], [0.0026584956319426565], [0.0026585310343648504], [0.0026585682687731687], [0.002658607322388227], [0.002658648181804429], [0.002658690832994322], [0.002658735261313131], [0.0026587814515035167], [0.00265882938770052], [0.0026588790534367124], [0.0026589304316475522], [0.0026589835046769263], [0.0026590382542829014], [0.00265909466164366], [0.002659152707363636], [0.0026592123714798467], [0.0026592736334684003], [0.0026593364722512095], [0.0026594008662028865], [0.002659466793157816], [0.0026595342304174263], [0.002659603154757627], [0.0026596735424364386], [0.002659745369201797], [0.0026598186102995297], [0.0026598932404815093], [0.002659969234013976], [0.0026600465646860415], [0.0026601252058183387], [0.002660205130271857], [0.0026602863104569197], [0.002660368718342348], [0.0026604523254647604], [0.0026605371029380267], [0.0026606230214628944], [0.002660710051336746], [0.002660798162463508], [0.0026608873243637084], [0.002660977506184669], [0.002661068676710843], [0.0026611608043742856], [0.002661253857265247], [0.0026613478031429117], [0.0026614426094462556], [0.002661538243305018], [0.002661634671550807], [0.0026617318607283147], [0.002661829777106649], [0.002661928386690757], [0.0026620276552329868], [0.0026621275482447263], [0.0026622280310081396], [0.0026623290685880256], [0.0026624306258437305], [0.0026625326674411813], [0.0026626351578649767], [0.0026627380614305833], [0.0026628413422965813], [0.002662944964477005], [0.002663048891853737], [0.0026631530881889715], [0.0026632575171377415], [0.002663362142260492], [0.0026634669270357105], [0.00266357183487261], [0.002663676829123843], [0.0026637818730982665], [0.0026638869300737262], [0.00266399196330989], [0.002664096936061091], [0.0026642018115891988], [0.0026643065531765015], [0.0026644111241386093], [0.0026645154878373583], [0.0026646196076937135], [0.0026647234472006822], [0.002664826969936209], [0.002664930139576059], [0.002665032919906703], [0.0026651352748381578], [0.002665237168416813], [0.0026653385648382345], [0.0026654394284599137], [0.002665539723813998], [0.002665639415619965], [0.002665738468797245], [0.002665836848477797], [0.002665934520018625], [0.0026660314490142213], [0.002666127601308955], [0.0026662229430093735], [0.0026663174404964363], [0.0026664110604376597], [0.0026665037697991773], [0.0026665955358577014], [0.0026666863262123953], [0.002666776108796639], [0.0026668648518896883], [0.002666952524128223], [0.0026670390945177833], [0.0026671245324440657], [0.002667208807684129], [0.0026672918904174325], [0.0026673737512367653], [0.0026674543611590247], [0.0026675336916358572], [0.002667611714564144], [0.00266768840229634], [0.0026677637276506507], [0.0026678376639210633], [0.002667910184887187], [0.0026679812648239425], [0.0026680508785110768], [0.0026681190012424914], [0.0026681856088353983], [0.002668250677639278], [0.0026683141845446727], [0.002668376106991746], [0.002668436422978693], [0.0026684951110699097], [0.002668552150403981], [0.0026686075207014576], [0.0026686612022724125], [0.0026687131760237954], [0.002668763423466559], [0.0026688119267225738], [0.00266885866853131], [0.0026689036322563044], [0.002668946801891377], [0.0026689881620666498], [0.002669027698054287], [0.0026690653957740377], [0.0026691012417985093], [0.002669135223358216], [0.002669167328346373], [0.0026691975453234534], [0.0026692258635214808], [0.0026692522728480896], [0.0026692767638903177], [0.002669299327918151], [0.0026693199568878128], [0.002669338643444796], [0.0026693553809266283], [0.00266937016336539], [0.002669382985489962], [0.002669393842728012], [0.002669402731207718], [0.0026694096477592384], [0.002669414589915889], [0.002669417555915098], [0.0026694185446990504]], "compressibility_factor": [[0.9930381414204289], [0.9930381365780057], [0.9930381220523903], [0.9930380978485405], [0.9930380639747204], [0.9930380204424947], [0.9930379672667257], [0.9930379044655698], [0.9930378320604705], [0.993037750076152], [0.9930376585406114], [0.99303755748511], [0.9930374469441628], [0.9930373269555292], [0.9930371975601975], [0.9930370588023771], [0.9930369107294795], [0.993036753392106], [0.9930365868440308], [0.9930364111421853], [0.9930362263466366], [0.9930360325205726], [0.9930358297302784], [0.9930356180451178], [0.9930353975375088], [0.9930351682829031], [0.9930349303597595], [0.9930346838495204], [0.9930344288365853], [0.9930341654082834], [0.9930338936548463], [0.9930336136693787], [0.9930333255478283], [0.993033029388956], [0.9930327252943016], [0.9930324133681543], [0.9930320937175174], [0.993031766452073], [0.9930314316841484], [0.9930310895286781], [0.9930307401031676], [0.9930303835276548], [0.9930300199246714], [0.993029649419203], [0.9930292721386469], [0.9930288882127726], [0.9930284977736799], [0.9930281009557522], [0.9930276978956162], [0.9930272887320949], [0.9930268736061637], [0.9930264526609018], [0.9930260260414472], [0.9930255938949475], [0.9930251563705121], [0.9930247136191621], [0.9930242657937811], [0.9930238130490631], [0.9930233555414633], [0.9930228934291431], [0.9930224268719197], [0.9930219560312122], [0.9930214810699863], [0.9930210021527013], [0.9930205194452536], [0.9930200331149229], [0.9930195433303123], [0.9930190502612946], [0.9930185540789548], [0.9930180549555284], [0.9930175530643485], [0.9930170485797825], [0.9930165416771747], [0.9930160325327859], [0.9930155213237346], [0.9930150082279324], [0.9930144934240288], [0.993013977091345], [0.9930134594098141], [0.9930129405599193], [0.9930124207226317], [0.9930119000793458], [0.9930113788118196], [0.9930108571021085], [0.9930103351325045], [0.9930098130854711], [0.99300929114358], [0.9930087694894477], [0.993008248305671], [0.9930077277747628], [0.9930072080790882], [0.9930066894008012], [0.9930061719217786], [0.993005655823557], [0.9930051412872685], [0.9930046284935748], [0.9930041176226065], [0.9930036088538953], [0.9930031023663118], [0.9930025983380019], [0.9930020969463217], [0.9930015983677759], [0.9930011027779527], [0.9930006103514614], [0.9930001212618693], [0.9929996356816401], [0.9929991537820694], [0.9929986757332253], [0.9929982017038851], [0.992997731861474], [0.9929972663720055], [0.99299680540002], [0.9929963491085246], [0.9929958976589339], [0.9929954512110113], [0.9929950099228095], [0.992994573950614], [0.9929941434488849], [0.9929937185701989], [0.9929932994651954], [0.9929928862825189], [0.9929924791687658], [0.9929920782684278], [0.9929916837238413], [0.9929912956751326], [0.9929909142601667], [0.992990539614495], [0.9929901718713063], [0.9929898111613766], [0.9929894576130193], [0.9929891113520388], [0.9929887725016822], [0.9929884411825944], [0.9929881175127714], [0.9929878016075177], [0.9929874935794006], [0.9929871935382111], [0.9929869015909193], [0.9929866178416359], [0.9929863423915736], [0.9929860753390068], [0.9929858167792365], [0.9929855668045521], [0.9929853255041989], [0.9929850929643423], [0.9929848692680373], [0.9929846544951932], [0.9929844487225485], [0.9929842520236373], [0.9929840644687633], [0.9929838861249728], [0.9929837170560291], [0.9929835573223887], [0.9929834069811774], [0.9929832660861688], [0.992983134687765], [0.9929830128329752], [0.9929829005653988], [0.9929827979252097], [0.9929827049491396], [0.9929826216704646], [0.9929825481189921], [0.9929824843210495], [0.9929824302994749], [0.9929823860736068], [0.9929823516592792], [0.9929823270688113], [0.9929823123110084], [0.9929823073911536]], "reynolds_factor": [[0.9971107150762277], [0.9971107133006577], [0.9971107079745546], [0.9971106990997399], [0.9971106866792493], [0.9971106707173312], [0.9971106512194445], [0.9971106281922593], [0.9971106016436517], [0.9971105715827043], [0.9971105380197011], [0.9971105009661249], [0.997110460434654], [0.9971104164391579], [0.9971103689946924], [0.9971103181174963], [0.9971102638249837], [0.9971102061357409], [0.9971101450695184], [0.9971100806472272], [0.9971100128909292], [0.9971099418238314], [0.9971098674702791], [0.997109789855747], [0.9971097090068318], [0.9971096249512434], [0.9971095377177955], [0.9971094473363967], [0.9971093538380414], [0.9971092572547988], [0.9971091576198036], [0.997109054967244], [0.9971089493323521], [0.9971088407513916], [0.9971087292616462], [0.997108614901407], [0.997108497709962], [0.9971083777275804], [0.9971082549955026], [0.9971081295559238], [0.9971080014519826], [0.9971078707277455], [0.9971077374281937], [0.997107601599207], [0.9971074632875496], [0.9971073225408552], [0.9971071794076101], [0.997107033937138], [0.9971068861795839], [0.9971067361858978], [0.9971065840078173], [0.9971064296978496], [0.9971062733092566], [0.9971061148960353], [0.9971059545129002], [0.997105792215266], [0.9971056280592275], [0.9971054621015427], [0.9971052943996129], [0.9971051250114633], [0.9971049539957244], [0.9971047814116116], [0.9971046073189055], [0.9971044317779322], [0.9971042548495422], [0.997104076595091], [0.997103897076417], [0.9971037163558214], [0.9971035344960476], [0.9971033515602581], [0.9971031676120155], [0.9971029827152581], [0.9971027969342807], [0.9971026103337105], [0.9971024229784867], [0.9971022349338367], [0.997102046265255], [0.9971018570384798], [0.9971016673194706], [0.9971014771743859], [0.9971012866695593], [0.9971010958714779], [0.9971009048467578], [0.9971007136621218], [0.9971005223843767], [0.9971003310803884], [0.9971001398170599], [0.9970999486613077], [0.9970997576800382], [0.9970995669401236], [0.9970993765083792], [0.9970991864515404], [0.9970989968362377], [0.9970988077289741], [0.9970986191961011], [0.9970984313037962], [0.9970982441180378], [0.9970980577045835], [0.9970978721289453], [0.9970976874563671], [0.9970975037518004], [0.9970973210798829], [0.9970971395049132], [0.9970969590908291], [0.9970967799011842], [0.9970966019991251], [0.9970964254473684], [0.9970962503081793], [0.9970960766433463], [0.9970959045141619], [0.9970957339813991], [0.9970955651052885], [0.9970953979454984], [0.9970952325611103], [0.9970950690106006], [0.9970949073518163], [0.9970947476419562], [0.9970945899375483], [0.9970944342944297], [0.9970942807677265], [0.9970941294118327], [0.9970939802803912], [0.9970938334262727], [0.9970936889015573], [0.9970935467575154], [0.9970934070445877], [0.9970932698123672], [0.9970931351095806], [0.997093002984071], [0.9970928734827785], [0.9970927466517244], [0.9970926225359932], [0.9970925011797159], [0.9970923826260534], [0.9970922669171811], [0.9970921540942724], [0.9970920441974835], [0.9970919372659384], [0.9970918333377141], [0.9970917324498267], [0.9970916346382174], [0.9970915399377381], [0.99709144838214], [0.9970913600040593], [0.9970912748350056], [0.9970911929053504], [0.9970911142443146], [0.9970910388799588], [0.9970909668391713], [0.9970908981476589], [0.9970908328299374], [0.9970907709093214], [0.9970907124079152], [0.9970906573466065], [0.9970906057450565], [0.997090557621693], [0.9970905129937035], [0.9970904718770293], [0.9970904342863572], [0.9970904002351176], [0.9970903697354762], [0.9970903427983301], [0.9970903194333055], [0.9970902996487513], [0.997090283451738], [0.9970902708480541], [0.9970902618422035], [0.9970902564374057], [0.9970902546355916]], "form_factor": [[1.0920913803699537], [1.0920913817381297], [1.092091385842192], [1.0920913926807403], [1.0920914022514425], [1.0920914145510345], [1.0920914295753212], [1.0920914473191783], [1.0920914677765532], [1.0920914909404669], [1.0920915168030179], [1.0920915453553823], [1.0920915765878176], [1.0920916104896665], [1.0920916470493593], [1.0920916862544174], [1.0920917280914586], [1.0920917725462], [1.0920918196034621], [1.092091869247176], [1.0920919214603857], [1.0920919762252552], [1.0920920335230735], [1.0920920933342615], [1.0920921556383756], [1.0920922204141177], [1.0920922876393393], [1.0920923572910501], [1.092092429345425], [1.0920925037778106], [1.0920925805627342], [1.092092659673912], [1.092092741084257], [1.0920928247658879], [1.0920929106901376], [1.0920929988275634], [1.0920930891479554], [1.0920931816203472], [1.0920932762130247], [1.0920933728935371], [1.0920934716287078], [1.0920935723846439], [1.092093675126748], [1.0920937798197299], [1.0920938864276166], [1.0920939949137654], [1.0920941052408746], [1.092094217370997], [1.0920943312655516], [1.0920944468853353], [1.092094564190538], [1.0920946831407536], [1.0920948036949936], [1.0920949258117019], [1.0920950494487667], [1.092095174563536], [1.0920953011128307], [1.0920954290529592], [1.0920955583397318], [1.0920956889284756], [1.0920958207740492], [1.0920959538308577], [1.092096088052868], [1.0920962233936247], [1.0920963598062645], [1.0920964972435332], [1.0920966356578008], [1.092096775001078], [1.0920969152250313], [1.0920970562810013], [1.092097198120018], [1.092097340692817], [1.0920974839498567], [1.0920976278413366], [1.0920977723172112], [1.0920979173272103], [1.0920980628208539], [1.0920982087474702], [1.0920983550562153], [1.0920985016960858], [1.0920986486159416], [1.0920987957645196], [1.0920989430904544], [1.092099090542294], [1.092099238068519], [1.09209938561756], [1.0920995331378156], [1.0920996805776706], [1.0920998278855139], [1.0920999750097566], [1.0921001218988513], [1.092100268501308], [1.0921004147657136], [1.0921005606407506], [1.0921007060752141], [1.0921008510180314], [1.0921009954182785], [1.0921011392251987], [1.0921012823882221], [1.0921014248569818], [1.0921015665813332], [1.0921017075113708], [1.0921018475974478], [1.0921019867901918], [1.0921021250405258], [1.0921022622996817], [1.0921023985192215], [1.0921025336510535], [1.092102667647449], [1.0921028004610613], [1.0921029320449418], [1.0921030623525572], [1.0921031913378065], [1.0921033189550393], [1.0921034451590697], [1.0921035699051953], [1.092103693149213], [1.0921038148474345], [1.0921039349567034], [1.0921040534344109], [1.0921041702385108], [1.092104285327536], [1.0921043986606138], [1.0921045101974804], [1.0921046198984965], [1.0921047277246614], [1.0921048336376284], [1.0921049375997187], [1.0921050395739353], [1.092105139523977], [1.0921052374142521], [1.0921053332098918], [1.092105426876763], [1.0921055183814807], [1.0921056076914224], [1.092105694774738], [1.092105779600364], [1.0921058621380333], [1.0921059423582875], [1.092106020232489], [1.09210609573283], [1.0921061688323443], [1.0921062395049173], [1.0921063077252953], [1.0921063734690963], [1.0921064367128182], [1.092106497433848], [1.0921065556104705], [1.092106611221877], [1.0921066642481723], [1.0921067146703836], [1.092106762470466], [1.092106807631311], [1.0921068501367521], [1.0921068899715722], [1.0921069271215071], [1.092106961573253], [1.0921069933144716], [1.092107022333793], [1.0921070486208224], [1.0921070721661423], [1.092107092961317], [1.0921071109988953], [1.0921071262724145], [1.0921071387764008], [1.0921071485063738], [1.0921071554588462], [1.0921071596313268], [1.0921071610223194]]}, "fuselage": {"wetted_area": 385.51, "reference_area": 12.57, "parasite_drag_coefficient": [[0.005947892065136904], [0.005947893967973562], [0.005947899675830517], [0.005947909186748914], [0.0059479224974647174], [0.00594793960340974], [0.00594796049871314], [0.005947985176203318], [0.0059480136274102265], [0.005948045842568131], [0.005948081810618754], [0.005948121519214867], [0.0059481649547242915], [0.005948212102234308], [0.005948262945556489], [0.00594831746723198], [0.0059483756485370996], [0.005948437469489465], [0.005948502908854474], [0.005948571944152196], [0.005948644551664644], [0.005948720706443543], [0.005948800382318398], [0.005948883551905031], [0.005948970186614484], [0.005949060256662358], [0.005949153731078497], [0.005949250577717092], [0.005949350763267192], [0.005949454253263573], [0.005949561012098001], [0.005949671003030899], [0.005949784188203336], [0.005949900528649473], [0.0059500199843093154], [0.005950142514041869], [0.00595026807563864], [0.005950396625837536], [0.005950528120337061], [0.005950662513810945], [0.005950799759923065], [0.005950939811342724], [0.005951082619760308], [0.0059512281359032455], [0.005951376309552294], [0.00595152708955822], [0.005951680423858723], [0.005951836259495732], [0.005951994542633007], [0.005952155218574055], [0.005952318231780345], [0.005952483525889823], [0.005952651043735726], [0.005952820727365707], [0.005952992518061207], [0.005953166356357144], [0.005953342182061847], [0.005953519934277276], [0.005953699551419508], [0.005953880971239445], [0.005954064130843838], [0.005954248966716486], [0.005954435414739709], [0.005954623410216043], [0.005954812887890177], [0.005955003781971089], [0.0059551960261543775], [0.005955389553644844], [0.005955584297179229], [0.005955780189049173], [0.005955977161124322], [0.005956175144875649], [0.005956374071398921], [0.005956573871438315], [0.005956774475410238], [0.005956975813427215], [0.0059571778153219915], [0.005957380410671718], [0.005957583528822273], [0.005957787098912702], [0.005957991049899738], [0.005958195310582476], [0.0059583998096270595], [0.005958604475591521], [0.005958809236950638], [0.005959014022120899], [0.0059592187594854785], [0.0059594233774193095], [0.00595962780431415], [0.00595983196860369], [0.0059600357987887], [0.0059602392234621784], [0.005960442171334481], [0.005960644571258462], [0.005960846352254624], [0.005961047443536166], [0.005961247774534111], [0.005961447274922284], [0.005961645874642298], [0.005961843503928453], [0.005962040093332572], [0.005962235573748785], [0.005962429876438157], [0.005962622933053274], [0.0059628146756627145], [0.005963005036775369], [0.005963193949364669], [0.005963381346892671], [0.00596356716333398], [0.005963751333199542], [0.005963933791560235], [0.005964114474070351], [0.005964293316990808], [0.005964470257212261], [0.005964645232277947], [0.005964818180406351], [0.0059649890405136284], [0.005965157752235849], [0.005965324255950924], [0.005965488492800389], [0.005965650404710818], [0.005965809934415089], [0.00596596702547327], [0.00596612162229332], [0.00596627367015144], [0.005966423115212122], [0.005966569904547941], [0.0059667139861589915], [0.005966855308992025], [0.005966993822959232], [0.005967129478956705], [0.005967262228882552], [0.005967392025654678], [0.005967518823228117], [0.005967642576612134], [0.005967763241886835], [0.005967880776219455], [0.005967995137880216], [0.005968106286257822], [0.005968214181874548], [0.00596831878640088], [0.005968420062669793], [0.005968517974690557], [0.005968612487662162], [0.0059687035679862575], [0.005968791183279697], [0.005968875302386601], [0.005968955895389999], [0.005969032933622988], [0.005969106389679459], [0.005969176237424321], [0.005969242452003296], [0.005969305009852204], [0.00596936388870579], [0.00596941906760606], [0.005969470526910134], [0.00596951824829759], [0.005969562214777384], [0.005969602410694142], [0.005969638821734109], [0.005969671434930479], [0.00596970023866825], [0.005969725222688636], [0.005969746378092859], [0.005969763697345532], [0.00596977717427747], [0.005969786804088011], [0.005969792583346831], [0.005969794509995215]], "skin_friction_coefficient": [[0.0018995379388788518], [0.0018995385487218033], [0.0018995403780413835], [0.0018995434262098335], [0.001899547692181122], [0.0018995531744912732], [0.0018995598712588456], [0.0018995677801855397], [0.0018995768985569433], [0.0018995872232434085], [0.0018995987507010614], [0.001899611476972959], [0.0018996253976903612], [0.0018996405080741502], [0.0018996568029363778], [0.0018996742766819517], [0.0018996929233104432], [0.0018997127364180349], [0.0018997337091996055], [0.0018997558344509336], [0.0018997791045710353], [0.0018998035115646427], [0.0018998290470447954], [0.0018998557022355746], [0.0018998834679749576], [0.0018999123347178026], [0.00189994229253896], [0.0018999733311365057], [0.001900005439835109], [0.0019000386075895149], [0.0019000728229881549], [0.00190010807425688], [0.0019001443492628095], [0.0019001816355183148], [0.0019002199201851025], [0.0019002591900784344], [0.0019002994316714523], [0.0019003406310996263], [0.0019003827741653156], [0.0019004258463424402], [0.001900469832781274], [0.0019005147183133364], [0.001900560487456408], [0.001900607124419644], [0.0019006546131087982], [0.0019007029371315562], [0.0019007520798029714], [0.0019008020241509996], [0.001900852752922141], [0.0019009042485871798], [0.001900956493347021], [0.0019010094691386255], [0.0019010631576410367], [0.0019011175402815087], [0.001901172598241714], [0.0019012283124640542], [0.001901284663658045], [0.0019013416323067972], [0.0019013991986735804], [0.0019014573428084607], [0.0019015160445550363], [0.0019015752835572271], [0.0019016350392661648], [0.0019016952909471372], [0.0019017560176866205], [0.0019018171983993702], [0.001901878811835585], [0.0019019408365881347], [0.0019020032510998547], [0.0019020660336708918], [0.001902129162466126], [0.001902192615522627], [0.001902256370757186], [0.001902320405973881], [0.0019023846988717062], [0.0019024492270522347], [0.0019025139680273384], [0.0019025788992269388], [0.001902643998006801], [0.0019027092416563688], [0.0019027746074066253], [0.0019028400724379901], [0.0019029056138882457], [0.0019029712088604852], [0.0019030368344310892], [0.0019031024676577182], [0.0019031680855873246], [0.001903233665264184], [0.0019032991837379277], [0.001903364618071595], [0.00190342994534969], [0.0019034951426862385], [0.0019035601872328491], [0.001903625056186765], [0.0019036897267989267], [0.0019037541763820048], [0.0019038183823184463], [0.0019038823220684832], [0.001903945973178144], [0.0019040093132872296], [0.0019040723201372786], [0.0019041349715795061], [0.0019041972455827029], [0.0019042591202411115], [0.0019043205737822714], [0.0019043815845748166], [0.0019044421311362374], [0.0019045021921406046], [0.001904561746426234], [0.0019046207730033136], [0.0019046792510614718], [0.0019047371599772917], [0.0019047944793217652], [0.00190485118886769], [0.0019049072685969996], [0.0019049626987080238], [0.0019050174596226838], [0.0019050715319936119], [0.0019051248967111893], [0.0019051775349105235], [0.0019052294279783169], [0.001905280557559678], [0.0019053309055648221], [0.0019053804541757043], [0.0019054291858525418], [0.0019054770833402462], [0.0019055241296747625], [0.0019055703081893036], [0.001905615602520482], [0.0019056599966143315], [0.0019057034747322304], [0.001905746021456701], [0.0019057876216971126], [0.0019058282606952421], [0.0019058679240307507], [0.001905906597626509], [0.0019059442677538205], [0.0019059809210375067], [0.0019060165444608726], [0.001906051125370542], [0.0019060846514811537], [0.001906117110879939], [0.0019061484920311464], [0.0019061787837803407], [0.0019062079753585635], [0.0019062360563863428], [0.0019062630168775654], [0.001906288847243208], [0.0019063135382949166], [0.0019063370812484426], [0.0019063594677269215], [0.0019063806897640114], [0.0019064007398068746], [0.0019064196107190007], [0.0019064372957828858], [0.0019064537887025447], [0.0019064690836058708], [0.0019064831750468436], [0.0019064960580075627], [0.001906507727900138], [0.0019065181805684116], [0.001906527412289508], [0.0019065354197752471], [0.0019065422001733638], [0.0019065477510685923], [0.0019065520704835649], [0.0019065551568795565], [0.001906557009157069], [0.001906557626656234]], "compressibility_factor": [[0.9930381414204288], [0.9930381365780058], [0.9930381220523903], [0.9930380978485405], [0.9930380639747204], [0.9930380204424947], [0.9930379672667257], [0.9930379044655699], [0.9930378320604705], [0.993037750076152], [0.9930376585406114], [0.99303755748511], [0.9930374469441628], [0.993037326955529], [0.9930371975601975], [0.9930370588023771], [0.9930369107294795], [0.9930367533921058], [0.993036586844031], [0.9930364111421853], [0.9930362263466366], [0.9930360325205726], [0.9930358297302784], [0.9930356180451178], [0.9930353975375088], [0.9930351682829031], [0.9930349303597596], [0.9930346838495204], [0.9930344288365852], [0.9930341654082833], [0.9930338936548463], [0.9930336136693787], [0.9930333255478283], [0.9930330293889559], [0.9930327252943016], [0.9930324133681543], [0.9930320937175174], [0.9930317664520729], [0.9930314316841484], [0.9930310895286781], [0.9930307401031675], [0.9930303835276548], [0.9930300199246715], [0.9930296494192029], [0.9930292721386468], [0.9930288882127727], [0.9930284977736799], [0.9930281009557522], [0.9930276978956162], [0.9930272887320949], [0.9930268736061637], [0.9930264526609018], [0.9930260260414472], [0.9930255938949475], [0.9930251563705121], [0.9930247136191622], [0.9930242657937811], [0.9930238130490631], [0.9930233555414633], [0.9930228934291431], [0.9930224268719197], [0.9930219560312121], [0.9930214810699863], [0.9930210021527013], [0.9930205194452537], [0.9930200331149229], [0.9930195433303123], [0.9930190502612946], [0.9930185540789547], [0.9930180549555284], [0.9930175530643485], [0.9930170485797825], [0.9930165416771748], [0.993016032532786], [0.9930155213237345], [0.9930150082279324], [0.9930144934240289], [0.993013977091345], [0.9930134594098141], [0.9930129405599193], [0.9930124207226317], [0.9930119000793458], [0.9930113788118196], [0.9930108571021085], [0.9930103351325046], [0.9930098130854712], [0.99300929114358], [0.9930087694894477], [0.993008248305671], [0.9930077277747628], [0.9930072080790882], [0.9930066894008012], [0.9930061719217786], [0.993005655823557], [0.9930051412872685], [0.9930046284935748], [0.9930041176226064], [0.9930036088538952], [0.9930031023663118], [0.993002598338002], [0.9930020969463217], [0.9930015983677759], [0.9930011027779526], [0.9930006103514613], [0.9930001212618693], [0.99299963568164], [0.9929991537820694], [0.9929986757332253], [0.992998201703885], [0.9929977318614741], [0.9929972663720056], [0.99299680540002], [0.9929963491085246], [0.9929958976589339], [0.9929954512110113], [0.9929950099228095], [0.9929945739506141], [0.992994143448885], [0.9929937185701989], [0.9929932994651954], [0.9929928862825189], [0.9929924791687657], [0.9929920782684278], [0.9929916837238412], [0.9929912956751326], [0.9929909142601667], [0.992990539614495], [0.9929901718713062], [0.9929898111613766], [0.9929894576130193], [0.9929891113520387], [0.992988772501682], [0.9929884411825944], [0.9929881175127714], [0.9929878016075177], [0.9929874935794006], [0.9929871935382111], [0.9929869015909192], [0.9929866178416359], [0.9929863423915736], [0.9929860753390068], [0.9929858167792365], [0.9929855668045521], [0.9929853255041988], [0.9929850929643423], [0.9929848692680373], [0.9929846544951932], [0.9929844487225485], [0.9929842520236372], [0.9929840644687632], [0.9929838861249727], [0.9929837170560291], [0.9929835573223886], [0.9929834069811774], [0.9929832660861689], [0.9929831346877649], [0.9929830128329751], [0.9929829005653988], [0.9929827979252097], [0.9929827049491396], [0.9929826216704646], [0.992982548118992], [0.9929824843210495], [0.9929824302994749], [0.9929823860736068], [0.9929823516592792], [0.9929823270688113], [0.9929823123110084], [0.9929823073911536]], "reynolds_factor": [[0.9971107150762277], [0.9971107133006576], [0.9971107079745546], [0.9971106990997398], [0.9971106866792494], [0.9971106707173311], [0.9971106512194445], [0.9971106281922592], [0.9971106016436517], [0.9971105715827043], [0.997110538019701], [0.9971105009661249], [0.9971104604346539], [0.9971104164391579], [0.9971103689946925], [0.9971103181174963], [0.9971102638249837], [0.9971102061357408], [0.9971101450695186], [0.9971100806472273], [0.997110012890929], [0.9971099418238314], [0.997109867470279], [0.997109789855747], [0.9971097090068319], [0.9971096249512434], [0.9971095377177955], [0.9971094473363967], [0.9971093538380414], [0.9971092572547988], [0.9971091576198036], [0.997109054967244], [0.9971089493323521], [0.9971088407513916], [0.9971087292616461], [0.9971086149014071], [0.997108497709962], [0.9971083777275805], [0.9971082549955026], [0.9971081295559239], [0.9971080014519825], [0.9971078707277455], [0.9971077374281937], [0.9971076015992071], [0.9971074632875497], [0.9971073225408552], [0.99710717940761], [0.9971070339371378], [0.997106886179584], [0.9971067361858978], [0.9971065840078172], [0.9971064296978496], [0.9971062733092566], [0.9971061148960353], [0.9971059545129003], [0.997105792215266], [0.9971056280592275], [0.9971054621015427], [0.9971052943996129], [0.9971051250114633], [0.9971049539957244], [0.9971047814116115], [0.9971046073189055], [0.9971044317779322], [0.9971042548495422], [0.997104076595091], [0.9971038970764169], [0.9971037163558214], [0.9971035344960476], [0.9971033515602582], [0.9971031676120155], [0.9971029827152581], [0.9971027969342807], [0.9971026103337105], [0.9971024229784867], [0.9971022349338367], [0.997102046265255], [0.9971018570384798], [0.9971016673194706], [0.9971014771743858], [0.9971012866695593], [0.9971010958714779], [0.9971009048467577], [0.9971007136621218], [0.9971005223843767], [0.9971003310803884], [0.9971001398170599], [0.9970999486613078], [0.9970997576800382], [0.9970995669401236], [0.9970993765083792], [0.9970991864515404], [0.9970989968362377], [0.997098807728974], [0.9970986191961011], [0.997098431303796], [0.9970982441180378], [0.9970980577045835], [0.9970978721289453], [0.9970976874563672], [0.9970975037518005], [0.9970973210798829], [0.9970971395049133], [0.9970969590908291], [0.9970967799011841], [0.9970966019991251], [0.9970964254473685], [0.9970962503081792], [0.9970960766433462], [0.997095904514162], [0.997095733981399], [0.9970955651052886], [0.9970953979454983], [0.9970952325611103], [0.9970950690106006], [0.9970949073518164], [0.9970947476419562], [0.9970945899375484], [0.9970944342944298], [0.9970942807677265], [0.9970941294118328], [0.9970939802803912], [0.9970938334262727], [0.9970936889015574], [0.9970935467575155], [0.9970934070445877], [0.9970932698123671], [0.9970931351095806], [0.997093002984071], [0.9970928734827785], [0.9970927466517244], [0.9970926225359932], [0.9970925011797158], [0.9970923826260533], [0.9970922669171812], [0.9970921540942724], [0.9970920441974835], [0.9970919372659384], [0.9970918333377141], [0.9970917324498267], [0.9970916346382174], [0.9970915399377382], [0.9970914483821401], [0.9970913600040594], [0.9970912748350056], [0.9970911929053505], [0.9970911142443146], [0.9970910388799588], [0.9970909668391713], [0.997090898147659], [0.9970908328299375], [0.9970907709093212], [0.9970907124079152], [0.9970906573466065], [0.9970906057450566], [0.9970905576216931], [0.9970905129937037], [0.9970904718770291], [0.9970904342863574], [0.9970904002351176], [0.997090369735476], [0.9970903427983301], [0.9970903194333055], [0.9970902996487514], [0.9970902834517379], [0.997090270848054], [0.9970902618422036], [0.9970902564374057], [0.9970902546355916]], "form_factor": [[1.0932626690730534], [1.093262667837414], [1.0932626641309187], [1.0932626579548312], [1.0932626493112587], [1.0932626382031485], [1.0932626246342911], [1.0932626086093162], [1.0932625901336894], [1.0932625692137152], [1.0932625458565326], [1.093262520070111], [1.0932624918632508], [1.0932624612455795], [1.0932624282275472], [1.093262392820427], [1.0932623550363065], [1.0932623148880873], [1.0932622723894811], [1.0932622275550037], [1.09326218039997], [1.0932621309404926], [1.0932620791934726], [1.0932620251765959], [1.0932619689083276], [1.0932619104079075], [1.0932618496953417], [1.0932617867913967], [1.0932617217175937], [1.093261654496202], [1.0932615851502294], [1.0932615137034185], [1.0932614401802367], [1.0932613646058666], [1.0932612870062035], [1.0932612074078418], [1.0932611258380682], [1.0932610423248557], [1.0932609568968479], [1.0932608695833572], [1.093260780414351], [1.0932606894204422], [1.0932605966328803], [1.0932605020835424], [1.093260405804919], [1.0932603078301086], [1.0932602081928025], [1.093260106927276], [1.0932600040683766], [1.0932598996515128], [1.0932597937126425], [1.0932596862882615], [1.0932595774153901], [1.0932594671315627], [1.093259355474815], [1.0932592424836691], [1.0932591281971258], [1.093259012654646], [1.0932588958961422], [1.0932587779619616], [1.093258658892875], [1.0932585387300637], [1.0932584175151023], [1.0932582952899483], [1.0932581720969266], [1.0932580479787166], [1.0932579229783344], [1.0932577971391226], [1.0932576705047314], [1.0932575431191105], [1.0932574150264833], [1.0932572862713446], [1.0932571568984355], [1.0932570269527329], [1.0932568964794338], [1.0932567655239382], [1.0932566341318348], [1.0932565023488847], [1.093256370221008], [1.093256237794264], [1.0932561051148368], [1.093255972229023], [1.0932558391832081], [1.0932557060238592], [1.0932555727975009], [1.0932554395507053], [1.0932553063300707], [1.0932551731822093], [1.09325504015373], [1.0932549072912188], [1.0932547746412264], [1.093254642250251], [1.0932545101647193], [1.0932543784309745], [1.0932542470952553], [1.0932541162036822], [1.09325398580224], [1.0932538559367637], [1.0932537266529179], [1.0932535979961853], [1.0932534700118461], [1.0932533427449658], [1.0932532162403743], [1.0932530905426543], [1.0932529656961232], [1.0932528417448164], [1.0932527187324734], [1.093252596702519], [1.0932524756980515], [1.0932523557618237], [1.0932522369362276], [1.0932521192632816], [1.0932520027846118], [1.0932518875414396], [1.0932517735745644], [1.0932516609243512], [1.0932515496307116], [1.093251439733094], [1.093251331270465], [1.0932512242812984], [1.0932511188035579], [1.093251014874685], [1.093250912531585], [1.093250811810612], [1.0932507127475581], [1.093250615377636], [1.0932505197354696], [1.093250425855079], [1.0932503337698682], [1.0932502435126148], [1.093250155115453], [1.0932500686098658], [1.0932499840266727], [1.0932499013960142], [1.0932498207473458], [1.0932497421094238], [1.093249665510296], [1.0932495909772884], [1.093249518536998], [1.0932494482152817], [1.0932493800372456], [1.0932493140272364], [1.0932492502088318], [1.0932491886048334], [1.0932491292372535], [1.093249072127312], [1.0932490172954241], [1.0932489647611963], [1.0932489145434148], [1.0932488666600424], [1.0932488211282088], [1.0932487779642057], [1.0932487371834787], [1.0932486988006245], [1.0932486628293816], [1.093248629282628], [1.0932485981723739], [1.0932485695097605], [1.0932485433050516], [1.093248519567633], [1.0932484983060067], [1.0932484795277884], [1.0932484632397055], [1.0932484494475936], [1.0932484381563932], [1.09324842937015], [1.0932484230920123], [1.0932484193242296], [1.0932484180681523]]}, "turbofan": {"wetted_area": 20.92832112776126, "reference_area": 2.7844449567252743, "parasite_drag_coefficient": [[0.0010157797784096402], [0.0010157801537328712], [0.0010157812795739255], [0.0010157831555469199], [0.0010157857810088578], [0.001015789155059834], [0.0010157932765433217], [0.0010157981440465484], [0.0010158037559009475], [0.0010158101101826994], [0.0010158172047133463], [0.0010158250370604993], [0.0010158336045386156], [0.0010158429042098718], [0.001015852932885103], [0.0010158636871248391], [0.0010158751632404078], [0.0010158873572951293], [0.001015900265105587], [0.0010159138822429786], [0.0010159282040345457], [0.0010159432255650888], [0.001015958941678555], [0.0010159753469797088], [0.001015992435835877], [0.001016010202378781], [0.001016028640506434], [0.0010160477438851232], [0.00101606750595147], [0.0010160879199145622], [0.0010161089787581626], [0.0010161306752429925], [0.0010161530019090937], [0.0010161759510782609], [0.0010161995148565432], [0.0010162236851368309], [0.0010162484536015005], [0.0010162738117251372], [0.001016299750777335], [0.0010163262618255503], [0.001016353335738039], [0.00101638096318686], [0.0010164091346509386], [0.0010164378404192034], [0.0010164670705937898], [0.0010164968150933034], [0.0010165270636561545], [0.001016557805843949], [0.001016589031044947], [0.0010166207284775814], [0.0010166528871940364], [0.001016685496083886], [0.0010167185438777907], [0.0010167520191512545], [0.0010167859103284332], [0.001016820205686004], [0.0010168548933570843], [0.0010168899613352059], [0.001016925397478346], [0.0010169611895129963], [0.0010169973250382972], [0.00101703379153021], [0.0010170705763457414], [0.0010171076667272083], [0.0010171450498065557], [0.0010171827126097131], [0.0010172206420609902], [0.00101725882498752], [0.0010172972481237378], [0.0010173358981158942], [0.001017374761526617], [0.0010174138248394912], [0.001017453074463687], [0.001017492496738615], [0.0010175320779386096], [0.0010175718042776442], [0.0010176116619140772], [0.0010176516369554164], [0.0010176917154631148], [0.0010177318834573893], [0.0010177721269220544], [0.0010178124318093846], [0.001017852784044987], [0.0010178931695326958], [0.001017933574159481], [0.001017973983800366], [0.0010180143843233624], [0.0010180547615944132], [0.0010180951014823383], [0.001018135389863797], [0.0010181756126282436], [0.0010182157556828972], [0.001018255804957702], [0.001018295746410293], [0.001018335566030959], [0.0010183752498475985], [0.0010184147839306735], [0.0010184541543981494], [0.0010184933474204328], [0.0010185323492252893], [0.0010185711461027556], [0.001018609724410031], [0.0010186480705763556], [0.0010186861711078646], [0.001018724012592427], [0.0010187615817044597], [0.0010187988652097142], [0.0010188358499700419], [0.0010188725229481283], [0.0010189088712121966], [0.0010189448819406801], [0.0010189805424268648], [0.0010190158400834853], [0.0010190507624472974], [0.0010190852971836022], [0.001019119432090729], [0.0010191531551044831], [0.0010191864543025388], [0.0010192193179087922], [0.0010192517342976653], [0.0010192836919983585], [0.0010193151796990506], [0.001019346186251047], [0.0010193767006728737], [0.0010194067121543113], [0.0010194362100603726], [0.0010194651839352175], [0.0010194936235060096], [0.0010195215186867073], [0.0010195488595817874], [0.0010195756364899061], [0.0010196018399074897], [0.0010196274605322555], [0.0010196524892666585], [0.0010196769172212729], [0.0010197007357180897], [0.0010197239362937467], [0.001019746510702675], [0.001019768450920172], [0.0010197897491453914], [0.0010198103978042528], [0.0010198303895522693], [0.0010198497172772907], [0.0010198683741021622], [0.0010198863533872975], [0.0010199036487331641], [0.001019920253982678], [0.001019936163223516], [0.0010199513707903282], [0.0010199658712668654], [0.0010199796594880122], [0.0010199927305417288], [0.0010200050797708941], [0.0010200167027750596], [0.0010200275954121002], [0.001020037753799777], [0.001020047174317199], [0.0010200558536061814], [0.0010200637885725153], [0.001020070976387133], [0.0010200774144871725], [0.0010200831005769465], [0.0010200880326288035], [0.0010200922088838985], [0.0010200956278528515], [0.0010200982883163136], [0.0010201001893254227], [0.0010201013302021656], [0.0010201017105396309]], "skin_friction_coefficient": [[0.0027110162546011393], [0.0027110172563019038], [0.002711020261060871], [0.0027110252678481574], [0.0027110322749476696], [0.0027110412799576477], [0.002711052279791437], [0.0027110652706784843], [0.0027110802481655517], [0.0027110972071181533], [0.0027111161417222], [0.0027111370454858843], [0.0027111599112417577], [0.002711184731149058], [0.002711211496696219], [0.0027112401987036327], [0.0027112708273265953], [0.0027113033720584973], [0.0027113378217342105], [0.0027113741645336973], [0.002711412387985826], [0.0027114524789724134], [0.00271149442373246], [0.0027115382078666144], [0.0027115838163418267], [0.002711631233496238], [0.002711680443044247], [0.002711731428081796], [0.0027117841710918755], [0.0027118386539502076], [0.002711894857931146], [0.0027119527637137694], [0.0027120123513881826], [0.0027120736004620123], [0.002712136489867079], [0.002712200997966305], [0.0027122671025607737], [0.0027123347808969906], [0.0027124040096743614], [0.0027124747650528057], [0.002712547022660599], [0.002712620757602384], [0.0027126959444673483], [0.0027127725573375993], [0.0027128505697967095], [0.0027129299549384306], [0.0027130106853755893], [0.0027130927332491388], [0.0027131760702373896], [0.0027132606675654], [0.0027133464960145282], [0.0027134335259321398], [0.002713521727241478], [0.0027136110694516856], [0.0027137015216679747], [0.0027137930526019505], [0.0027138856305820715], [0.0027139792235642557], [0.0027140737991426392], [0.002714169324560436], [0.0027142657667209727], [0.002714363092198823], [0.0027144612672510807], [0.002714560257828747], [0.0027146600295882483], [0.002714760547903068], [0.0027148617778754752], [0.0027149636843483843], [0.0027150662319173095], [0.0027151693849424077], [0.0027152731075606546], [0.002715377363698068], [0.002715482117082063], [0.0027155873312538696], [0.0027156929695810374], [0.002715798995270018], [0.002715905371378833], [0.0027160120608297872], [0.002716119026422271], [0.002716226230845618], [0.0027163336366920116], [0.0027164412064694513], [0.0027165489026147707], [0.0027166566875066888], [0.002716764523478918], [0.0027168723728332868], [0.0027169801978529076], [0.002717087960815374], [0.002717195624005957], [0.0027173031497308513], [0.002717410500330398], [0.0027175176381923523], [0.0027176245257651203], [0.002717731125571011], [0.002717837400219486], [0.0027179433124203786], [0.0027180488249971256], [0.002718153900899941], [0.002718258503219003], [0.0027183625951975716], [0.0027184661402451047], [0.0027185691019503107], [0.0027186714440941657], [0.002718773130662874], [0.002718874125860778], [0.002718974394123207], [0.0027190739001292544], [0.0027191726088144955], [0.0027192704853836193], [0.0027193674953229887], [0.0027194636044131026], [0.0027195587787409914], [0.002719652984712484], [0.002719746189064408], [0.002719838358876665], [0.002719929461584198], [0.0027200194649888575], [0.002720108337271131], [0.0027201960470017547], [0.002720282563153207], [0.00272036785511105], [0.0027204518926851494], [0.0027205346461207348], [0.0027206160861093327], [0.0027206961837995328], [0.002720774910807599], [0.002720852239227925], [0.0027209281416433204], [0.0027210025911351336], [0.002721075561293186], [0.002721147026225547], [0.0027212169605681136], [0.0027212853394940084], [0.0027213521387227787], [0.0027214173345294235], [0.002721480903753189], [0.002721542823806196], [0.0027216030726818314], [0.002721661628962955], [0.002721718471829874], [0.0027217735810681157], [0.002721826937075966], [0.0027218785208717954], [0.0027219283141011554], [0.002721976299043644], [0.0027220224586195383], [0.0027220667763961873], [0.0027221092365941816], [0.002722149824093261], [0.002722188524437988], [0.00272222532384318], [0.002722260209199084], [0.002722293168076305], [0.0027223241887304747], [0.002722353260106673], [0.0027223803718435854], [0.002722405514277408], [0.0027224286784454784], [0.002722449856089657], [0.00272246903965944], [0.0027224862223148025], [0.0027225013979287785], [0.002722514561089768], [0.0027225257071035857], [0.002722534831995224], [0.002722541932510359], [0.0027225470061165713], [0.0027225500510043125], [0.0027225510660875744]], "compressibility_factor": [[0.9930381414204288], [0.9930381365780058], [0.9930381220523903], [0.9930380978485405], [0.9930380639747204], [0.9930380204424947], [0.9930379672667257], [0.9930379044655699], [0.9930378320604705], [0.993037750076152], [0.9930376585406114], [0.99303755748511], [0.9930374469441628], [0.993037326955529], [0.9930371975601975], [0.9930370588023771], [0.9930369107294795], [0.9930367533921058], [0.993036586844031], [0.9930364111421853], [0.9930362263466366], [0.9930360325205726], [0.9930358297302784], [0.9930356180451178], [0.9930353975375088], [0.9930351682829031], [0.9930349303597596], [0.9930346838495204], [0.9930344288365852], [0.9930341654082833], [0.9930338936548463], [0.9930336136693787], [0.9930333255478283], [0.9930330293889559], [0.9930327252943016], [0.9930324133681543], [0.9930320937175174], [0.9930317664520729], [0.9930314316841484], [0.9930310895286781], [0.9930307401031675], [0.9930303835276548], [0.9930300199246715], [0.9930296494192029], [0.9930292721386468], [0.9930288882127727], [0.9930284977736799], [0.9930281009557522], [0.9930276978956162], [0.9930272887320949], [0.9930268736061637], [0.9930264526609018], [0.9930260260414472], [0.9930255938949475], [0.9930251563705121], [0.9930247136191622], [0.9930242657937811], [0.9930238130490631], [0.9930233555414633], [0.9930228934291431], [0.9930224268719197], [0.9930219560312121], [0.9930214810699863], [0.9930210021527013], [0.9930205194452537], [0.9930200331149229], [0.9930195433303123], [0.9930190502612946], [0.9930185540789547], [0.9930180549555284], [0.9930175530643485], [0.9930170485797825], [0.9930165416771748], [0.993016032532786], [0.9930155213237345], [0.9930150082279324], [0.9930144934240289], [0.993013977091345], [0.9930134594098141], [0.9930129405599193], [0.9930124207226317], [0.9930119000793458], [0.9930113788118196], [0.9930108571021085], [0.9930103351325046], [0.9930098130854712], [0.99300929114358], [0.9930087694894477], [0.993008248305671], [0.9930077277747628], [0.9930072080790882], [0.9930066894008012], [0.9930061719217786], [0.993005655823557], [0.9930051412872685], [0.9930046284935748], [0.9930041176226064], [0.9930036088538952], [0.9930031023663118], [0.993002598338002], [0.9930020969463217], [0.9930015983677759], [0.9930011027779526], [0.9930006103514613], [0.9930001212618693], [0.99299963568164], [0.9929991537820694], [0.9929986757332253], [0.992998201703885], [0.9929977318614741], [0.9929972663720056], [0.99299680540002], [0.9929963491085246], [0.9929958976589339], [0.9929954512110113], [0.9929950099228095], [0.9929945739506141], [0.992994143448885], [0.9929937185701989], [0.9929932994651954], [0.9929928862825189], [0.9929924791687657], [0.9929920782684278], [0.9929916837238412], [0.9929912956751326], [0.9929909142601667], [0.992990539614495], [0.9929901718713062], [0.9929898111613766], [0.9929894576130193], [0.9929891113520387], [0.992988772501682], [0.9929884411825944], [0.9929881175127714], [0.9929878016075177], [0.9929874935794006], [0.9929871935382111], [0.9929869015909192], [0.9929866178416359], [0.9929863423915736], [0.9929860753390068], [0.9929858167792365], [0.9929855668045521], [0.9929853255041988], [0.9929850929643423], [0.9929848692680373], [0.9929846544951932], [0.9929844487225485], [0.9929842520236372], [0.9929840644687632], [0.9929838861249727], [0.9929837170560291], [0.9929835573223886], [0.9929834069811774], [0.9929832660861689], [0.9929831346877649], [0.9929830128329751], [0.9929829005653988], [0.9929827979252097], [0.9929827049491396], [0.9929826216704646], [0.992982548118992], [0.9929824843210495], [0.9929824302994749], [0.9929823860736068], [0.9929823516592792], [0.9929823270688113], [0.9929823123110084], [0.9929823073911536]], "reynolds_factor": [[0.9971107150762277], [0.9971107133006576], [0.9971107079745546], [0.9971106990997398], [0.9971106866792494], [0.9971106707173311], [0.9971106512194445], [0.9971106281922592], [0.9971106016436517], [0.9971105715827043], [0.997110538019701], [0.9971105009661249], [0.9971104604346539], [0.9971104164391579], [0.9971103689946926], [0.9971103181174963], [0.9971102638249837], [0.9971102061357408], [0.9971101450695186], [0.9971100806472274], [0.997110012890929], [0.9971099418238314], [0.997109867470279], [0.997109789855747], [0.9971097090068319], [0.9971096249512434], [0.9971095377177955], [0.9971094473363967], [0.9971093538380414], [0.9971092572547988], [0.9971091576198036], [0.997109054967244], [0.9971089493323521], [0.9971088407513916], [0.9971087292616461], [0.997108614901407], [0.997108497709962], [0.9971083777275805], [0.9971082549955026], [0.9971081295559239], [0.9971080014519825], [0.9971078707277455], [0.9971077374281937], [0.9971076015992071], [0.9971074632875497], [0.9971073225408552], [0.99710717940761], [0.9971070339371378], [0.997106886179584], [0.9971067361858978], [0.9971065840078172], [0.9971064296978496], [0.9971062733092566], [0.9971061148960353], [0.9971059545129003], [0.997105792215266], [0.9971056280592275], [0.9971054621015427], [0.9971052943996129], [0.9971051250114634], [0.9971049539957244], [0.9971047814116115], [0.9971046073189055], [0.9971044317779322], [0.9971042548495422], [0.997104076595091], [0.997103897076417], [0.9971037163558214], [0.9971035344960476], [0.9971033515602582], [0.9971031676120155], [0.9971029827152582], [0.9971027969342807], [0.9971026103337105], [0.9971024229784867], [0.9971022349338367], [0.997102046265255], [0.9971018570384798], [0.9971016673194706], [0.9971014771743858], [0.9971012866695593], [0.9971010958714779], [0.9971009048467577], [0.9971007136621218], [0.9971005223843767], [0.9971003310803884], [0.9971001398170599], [0.9970999486613078], [0.9970997576800381], [0.9970995669401236], [0.9970993765083792], [0.9970991864515404], [0.9970989968362377], [0.997098807728974], [0.9970986191961011], [0.997098431303796], [0.9970982441180378], [0.9970980577045835], [0.9970978721289453], [0.9970976874563672], [0.9970975037518005], [0.9970973210798829], [0.9970971395049132], [0.9970969590908291], [0.9970967799011841], [0.997096601999125], [0.9970964254473685], [0.9970962503081792], [0.9970960766433462], [0.997095904514162], [0.997095733981399], [0.9970955651052886], [0.9970953979454983], [0.9970952325611103], [0.9970950690106006], [0.9970949073518164], [0.9970947476419562], [0.9970945899375484], [0.9970944342944298], [0.9970942807677265], [0.9970941294118328], [0.9970939802803912], [0.9970938334262727], [0.9970936889015574], [0.9970935467575155], [0.9970934070445877], [0.9970932698123672], [0.9970931351095806], [0.997093002984071], [0.9970928734827785], [0.9970927466517244], [0.9970926225359931], [0.9970925011797158], [0.9970923826260533], [0.9970922669171812], [0.9970921540942724], [0.9970920441974835], [0.9970919372659384], [0.9970918333377141], [0.9970917324498267], [0.9970916346382174], [0.9970915399377382], [0.9970914483821401], [0.9970913600040594], [0.9970912748350057], [0.9970911929053505], [0.9970911142443146], [0.9970910388799588], [0.9970909668391713], [0.9970908981476592], [0.9970908328299375], [0.9970907709093213], [0.9970907124079151], [0.9970906573466066], [0.9970906057450566], [0.9970905576216931], [0.9970905129937037], [0.997090471877029], [0.9970904342863574], [0.9970904002351176], [0.997090369735476], [0.9970903427983302], [0.9970903194333055], [0.9970902996487514], [0.997090283451738], [0.9970902708480541], [0.9970902618422036], [0.9970902564374057], [0.9970902546355916]], "form_factor": 1.204891983794575}, "pylon": {"wetted_area": 8.371328451104505, "reference_area": 134.6, "parasite_drag_coefficient": [[0.00020315595568192802], [0.00020315603074657425], [0.0002031562559147851], [0.00020315663110938395], [0.00020315715620177155], [0.00020315783101196677], [0.00020315865530866432], [0.00020315962880930965], [0.0002031607511801895], [0.00020316202203653986], [0.00020316344094266928], [0.00020316500741209985], [0.0002031667209077231], [0.00020316858084197436], [0.00020317058657702057], [0.00020317273742496782], [0.00020317503264808155], [0.00020317747145902584], [0.0002031800530211174], [0.00020318277644859573], [0.00020318564080690912], [0.00020318864511301773], [0.00020319178833571097], [0.00020319506939594172], [0.00020319848716717536], [0.0002032020404757562], [0.00020320572810128676], [0.00020320954877702462], [0.000203213501190294], [0.00020321758398291243], [0.0002032217957516325], [0.0002032261350485985], [0.00020323060038181871], [0.0002032351902156522], [0.00020323990297130864], [0.00020324473702736613], [0.0002032496907203001], [0.00020325476234502748], [0.00020325995015546704], [0.00020326525236511006], [0.00020327066714760777], [0.00020327619263737202], [0.00020328182693018772], [0.00020328756808384073], [0.00020329341411875796], [0.00020329936301866067], [0.0002033054127312309], [0.00020331156116878981], [0.0002033178062089894], [0.0002033241456955163], [0.00020333057743880727], [0.00020333709921677718], [0.00020334370877555814], [0.0002033504038302509], [0.00020335718206568665], [0.00020336404113720078], [0.00020337097867141686], [0.00020337799226704119], [0.00020338507949566918], [0.00020339223790259925], [0.00020339946500765946], [0.000203406758306042], [0.00020341411526914827], [0.00020342153334544167], [0.00020342900996131113], [0.00020343654252194266], [0.00020344412841219803], [0.00020345176499750398], [0.00020345944962474755], [0.0002034671796231788], [0.00020347495230532342], [0.00020348276496789822], [0.0002034906148927374], [0.00020349849934772298], [0.0002035064155877219], [0.00020351436085552882], [0.00020352233238281542], [0.00020353032739108326], [0.00020353834309262299], [0.00020354637669147785], [0.00020355442538441088], [0.0002035624863618769], [0.0002035705568089974], [0.00020357863390653913], [0.0002035867148318962], [0.0002035947967600732], [0.0002036028768646725], [0.00020361095231888264], [0.00020361902029646765], [0.00020362707797275941], [0.00020363512252564875], [0.00020364315113657942], [0.00020365116099154042], [0.00020365914928205858], [0.00020366711320619183], [0.00020367504996951968], [0.00020368295678613473], [0.0002036908308796299], [0.00020369866948408656], [0.00020370646984505786], [0.00020371422922055114], [0.00020372194488200624], [0.0002037296141152711], [0.00020373723422157291], [0.00020374480251848537], [0.00020375231634089193], [0.00020375977304194282], [0.00020376716999400836], [0.00020377450458962563], [0.0002037817742424393], [0.00020378897638813597], [0.00020379610848537293], [0.00020380316801669709], [0.0002038101524894595], [0.00020381705943672043], [0.00020382388641814578], [0.00020383063102089662], [0.00020383729086050778], [0.00020384386358175845], [0.00020385034685953306], [0.00020385673839967166], [0.00020386303593981014], [0.0002038692372502094], [0.00020387534013457473], [0.00020388134243086228], [0.00020388724201207448], [0.00020389303678704354], [0.00020389872470120193], [0.00020390430373734146], [0.00020390977191635747], [0.0002039151272979812], [0.0002039203679814979], [0.0002039254921064511], [0.00020393049785333167], [0.0002039353834442546], [0.00020394014714361796], [0.00020394478725874936], [0.00020394930214053498], [0.0002039536901840344], [0.00020395794982907826], [0.00020396207956085053], [0.00020396607791045386], [0.00020396994345545812], [0.00020397367482043242], [0.0002039772706774595], [0.0002039807297466328], [0.00020398405079653567], [0.00020398723264470318], [0.00020399027415806567], [0.00020399317425337304], [0.0002039959318976025], [0.00020399854610834574], [0.00020400101595417886], [0.0002040033405550119], [0.00020400551908242003], [0.00020400755075995544], [0.00020400943486343978], [0.00020401117072123626], [0.00020401275771450306], [0.00020401419527742656], [0.0002040154828974345], [0.00020401662011538927], [0.00020401760652576068], [0.00020401844177677967], [0.0002040191255705703], [0.00020401965766326274], [0.0002040200378650845], [0.0002040202660404331], [0.00020402034210792618]], "skin_friction_coefficient": [[0.0027110162546011393], [0.0027110172563019038], [0.002711020261060871], [0.0027110252678481574], [0.0027110322749476696], [0.0027110412799576477], [0.002711052279791437], [0.0027110652706784843], [0.0027110802481655517], [0.0027110972071181533], [0.0027111161417222], [0.0027111370454858843], [0.0027111599112417577], [0.002711184731149058], [0.002711211496696219], [0.0027112401987036327], [0.0027112708273265953], [0.0027113033720584973], [0.0027113378217342105], [0.0027113741645336973], [0.002711412387985826], [0.0027114524789724134], [0.00271149442373246], [0.0027115382078666144], [0.0027115838163418267], [0.002711631233496238], [0.002711680443044247], [0.002711731428081796], [0.0027117841710918755], [0.0027118386539502076], [0.002711894857931146], [0.0027119527637137694], [0.0027120123513881826], [0.0027120736004620123], [0.002712136489867079], [0.002712200997966305], [0.0027122671025607737], [0.0027123347808969906], [0.0027124040096743614], [0.0027124747650528057], [0.002712547022660599], [0.002712620757602384], [0.0027126959444673483], [0.0027127725573375993], [0.0027128505697967095], [0.0027129299549384306], [0.0027130106853755893], [0.0027130927332491388], [0.0027131760702373896], [0.0027132606675654], [0.0027133464960145282], [0.0027134335259321398], [0.002713521727241478], [0.0027136110694516856], [0.0027137015216679747], [0.0027137930526019505], [0.0027138856305820715], [0.0027139792235642557], [0.0027140737991426392], [0.002714169324560436], [0.0027142657667209727], [0.002714363092198823], [0.0027144612672510807], [0.002714560257828747], [0.0027146600295882483], [0.002714760547903068], [0.0027148617778754752], [0.0027149636843483843], [0.0027150662319173095], [0.0027151693849424077], [0.0027152731075606546], [0.002715377363698068], [0.002715482117082063], [0.0027155873312538696], [0.0027156929695810374], [0.002715798995270018], [0.002715905371378833], [0.0027160120608297872], [0.002716119026422271], [0.002716226230845618], [0.0027163336366920116], [0.0027164412064694513], [0.0027165489026147707], [0.0027166566875066888], [0.002716764523478918], [0.0027168723728332868], [0.0027169801978529076], [0.002717087960815374], [0.002717195624005957], [0.0027173031497308513], [0.002717410500330398], [0.0027175176381923523], [0.0027176245257651203], [0.002717731125571011], [0.002717837400219486], [0.0027179433124203786], [0.0027180488249971256], [0.002718153900899941], [0.002718258503219003], [0.0027183625951975716], [0.0027184661402451047], [0.0027185691019503107], [0.0027186714440941657], [0.002718773130662874], [0.002718874125860778], [0.002718974394123207], [0.0027190739001292544], [0.0027191726088144955], [0.0027192704853836193], [0.0027193674953229887], [0.0027194636044131026], [0.0027195587787409914], [0.002719652984712484], [0.002719746189064408], [0.002719838358876665], [0.002719929461584198], [0.0027200194649888575], [0.002720108337271131], [0.0027201960470017547], [0.002720282563153207], [0.00272036785511105], [0.0027204518926851494], [0.0027205346461207348], [0.0027206160861093327], [0.0027206961837995328], [0.002720774910807599], [0.002720852239227925], [0.0027209281416433204], [0.0027210025911351336], [0.002721075561293186], [0.002721147026225547], [0.0027212169605681136], [0.0027212853394940084], [0.0027213521387227787], [0.0027214173345294235], [0.002721480903753189], [0.002721542823806196], [0.0027216030726818314], [0.002721661628962955], [0.002721718471829874], [0.0027217735810681157], [0.002721826937075966], [0.0027218785208717954], [0.0027219283141011554], [0.002721976299043644], [0.0027220224586195383], [0.0027220667763961873], [0.0027221092365941816], [0.002722149824093261], [0.002722188524437988], [0.00272222532384318], [0.002722260209199084], [0.002722293168076305], [0.0027223241887304747], [0.002722353260106673], [0.0027223803718435854], [0.002722405514277408], [0.0027224286784454784], [0.002722449856089657], [0.00272246903965944], [0.0027224862223148025], [0.0027225013979287785], [0.002722514561089768], [0.0027225257071035857], [0.002722534831995224], [0.002722541932510359], [0.0027225470061165713], [0.0027225500510043125], [0.0027225510660875744]], "compressibility_factor": [[0.9930381414204288], [0.9930381365780058], [0.9930381220523903], [0.9930380978485405], [0.9930380639747204], [0.9930380204424947], [0.9930379672667257], [0.9930379044655699], [0.9930378320604705], [0.993037750076152], [0.9930376585406114], [0.99303755748511], [0.9930374469441628], [0.993037326955529], [0.9930371975601975], [0.9930370588023771], [0.9930369107294795], [0.9930367533921058], [0.993036586844031], [0.9930364111421853], [0.9930362263466366], [0.9930360325205726], [0.9930358297302784], [0.9930356180451178], [0.9930353975375088], [0.9930351682829031], [0.9930349303597596], [0.9930346838495204], [0.9930344288365852], [0.9930341654082833], [0.9930338936548463], [0.9930336136693787], [0.9930333255478283], [0.9930330293889559], [0.9930327252943016], [0.9930324133681543], [0.9930320937175174], [0.9930317664520729], [0.9930314316841484], [0.9930310895286781], [0.9930307401031675], [0.9930303835276548], [0.9930300199246715], [0.9930296494192029], [0.9930292721386468], [0.9930288882127727], [0.9930284977736799], [0.9930281009557522], [0.9930276978956162], [0.9930272887320949], [0.9930268736061637], [0.9930264526609018], [0.9930260260414472], [0.9930255938949475], [0.9930251563705121], [0.9930247136191622], [0.9930242657937811], [0.9930238130490631], [0.9930233555414633], [0.9930228934291431], [0.9930224268719197], [0.9930219560312121], [0.9930214810699863], [0.9930210021527013], [0.9930205194452537], [0.9930200331149229], [0.9930195433303123], [0.9930190502612946], [0.9930185540789547], [0.9930180549555284], [0.9930175530643485], [0.9930170485797825], [0.9930165416771748], [0.993016032532786], [0.9930155213237345], [0.9930150082279324], [0.9930144934240289], [0.993013977091345], [0.9930134594098141], [0.9930129405599193], [0.9930124207226317], [0.9930119000793458], [0.9930113788118196], [0.9930108571021085], [0.9930103351325046], [0.9930098130854712], [0.99300929114358], [0.9930087694894477], [0.993008248305671], [0.9930077277747628], [0.9930072080790882], [0.9930066894008012], [0.9930061719217786], [0.993005655823557], [0.9930051412872685], [0.9930046284935748], [0.9930041176226064], [0.9930036088538952], [0.9930031023663118], [0.993002598338002], [0.9930020969463217], [0.9930015983677759], [0.9930011027779526], [0.9930006103514613], [0.9930001212618693], [0.99299963568164], [0.9929991537820694], [0.9929986757332253], [0.992998201703885], [0.9929977318614741], [0.9929972663720056], [0.99299680540002], [0.9929963491085246], [0.9929958976589339], [0.9929954512110113], [0.9929950099228095], [0.9929945739506141], [0.992994143448885], [0.9929937185701989], [0.9929932994651954], [0.9929928862825189], [0.9929924791687657], [0.9929920782684278], [0.9929916837238412], [0.9929912956751326], [0.9929909142601667], [0.992990539614495], [0.9929901718713062], [0.9929898111613766], [0.9929894576130193], [0.9929891113520387], [0.992988772501682], [0.9929884411825944], [0.9929881175127714], [0.9929878016075177], [0.9929874935794006], [0.9929871935382111], [0.9929869015909192], [0.9929866178416359], [0.9929863423915736], [0.9929860753390068], [0.9929858167792365], [0.9929855668045521], [0.9929853255041988], [0.9929850929643423], [0.9929848692680373], [0.9929846544951932], [0.9929844487225485], [0.9929842520236372], [0.9929840644687632], [0.9929838861249727], [0.9929837170560291], [0.9929835573223886], [0.9929834069811774], [0.9929832660861689], [0.9929831346877649], [0.9929830128329751], [0.9929829005653988], [0.9929827979252097], [0.9929827049491396], [0.9929826216704646], [0.992982548118992], [0.9929824843210495], [0.9929824302994749], [0.9929823860736068], [0.9929823516592792], [0.9929823270688113], [0.9929823123110084], [0.9929823073911536]], "reynolds_factor": [[0.9971107150762277], [0.9971107133006576], [0.9971107079745546], [0.9971106990997398], [0.9971106866792494], [0.9971106707173311], [0.9971106512194445], [0.9971106281922592], [0.9971106016436517], [0.9971105715827043], [0.997110538019701], [0.9971105009661249], [0.9971104604346539], [0.9971104164391579], [0.9971103689946926], [0.9971103181174963], [0.9971102638249837], [0.9971102061357408], [0.9971101450695186], [0.9971100806472274], [0.997110012890929], [0.9971099418238314], [0.997109867470279], [0.997109789855747], [0.9971097090068319], [0.9971096249512434], [0.9971095377177955], [0.9971094473363967], [0.9971093538380414], [0.9971092572547988], [0.9971091576198036], [0.997109054967244], [0.9971089493323521], [0.9971088407513916], [0.9971087292616461], [0.997108614901407], [0.997108497709962], [0.9971083777275805], [0.9971082549955026], [0.9971081295559239], [0.9971080014519825], [0.9971078707277455], [0.9971077374281937], [0.9971076015992071], [0.9971074632875497], [0.9971073225408552], [0.99710717940761], [0.9971070339371378], [0.997106886179584], [0.9971067361858978], [0.9971065840078172], [0.9971064296978496], [0.9971062733092566], [0.9971061148960353], [0.9971059545129003], [0.997105792215266], [0.9971056280592275], [0.9971054621015427], [0.9971052943996129], [0.9971051250114634], [0.9971049539957244], [0.9971047814116115], [0.9971046073189055], [0.9971044317779322], [0.9971042548495422], [0.997104076595091], [0.997103897076417], [0.9971037163558214], [0.9971035344960476], [0.9971033515602582], [0.9971031676120155], [0.9971029827152582], [0.9971027969342807], [0.9971026103337105], [0.9971024229784867], [0.9971022349338367], [0.997102046265255], [0.9971018570384798], [0.9971016673194706], [0.9971014771743858], [0.9971012866695593], [0.9971010958714779], [0.9971009048467577], [0.9971007136621218], [0.9971005223843767], [0.9971003310803884], [0.9971001398170599], [0.9970999486613078], [0.9970997576800381], [0.9970995669401236], [0.9970993765083792], [0.9970991864515404], [0.9970989968362377], [0.997098807728974], [0.9970986191961011], [0.997098431303796], [0.9970982441180378], [0.9970980577045835], [0.9970978721289453], [0.9970976874563672], [0.9970975037518005], [0.9970973210798829], [0.9970971395049132], [0.9970969590908291], [0.9970967799011841], [0.997096601999125], [0.9970964254473685], [0.9970962503081792], [0.9970960766433462], [0.997095904514162], [0.997095733981399], [0.9970955651052886], [0.9970953979454983], [0.9970952325611103], [0.9970950690106006], [0.9970949073518164], [0.9970947476419562], [0.9970945899375484], [0.9970944342944298], [0.9970942807677265], [0.9970941294118328], [0.9970939802803912], [0.9970938334262727], [0.9970936889015574], [0.9970935467575155], [0.9970934070445877], [0.9970932698123672], [0.9970931351095806], [0.997093002984071], [0.9970928734827785], [0.9970927466517244], [0.9970926225359931], [0.9970925011797158], [0.9970923826260533], [0.9970922669171812], [0.9970921540942724], [0.9970920441974835], [0.9970919372659384], [0.9970918333377141], [0.9970917324498267], [0.9970916346382174], [0.9970915399377382], [0.9970914483821401], [0.9970913600040594], [0.9970912748350057], [0.9970911929053505], [0.9970911142443146], [0.9970910388799588], [0.9970909668391713], [0.9970908981476592], [0.9970908328299375], [0.9970907709093213], [0.9970907124079151], [0.9970906573466066], [0.9970906057450566], [0.9970905576216931], [0.9970905129937037], [0.997090471877029], [0.9970904342863574], [0.9970904002351176], [0.997090369735476], [0.9970903427983302], [0.9970903194333055], [0.9970902996487514], [0.997090283451738], [0.9970902708480541], [0.9970902618422036], [0.9970902564374057], [0.9970902546355916]], "form_factor": 1.204891983794575}, "total": [[0.016207166074316968], [0.016207171785034558], [0.01620718891522933], [0.01620721745902788], [0.016207257406643368], [0.016207308744378583], [0.016207371454630408], [0.016207445515895494], [0.016207530902777163], [0.016207627585993648], [0.016207735532387465], [0.016207854704936183], [0.016207985062764323], [0.01620812656115658], [0.01620827915157221], [0.016208442781660806], [0.016208617395279096], [0.016208802932509172], [0.016208999329677832], [0.01620920651937722], [0.016209424430486546], [0.01620965298819527], [0.016209892114027197], [0.016210141725866028], [0.01621040173798191], [0.016210672061059358], [0.0162109526022262], [0.016211243265083764], [0.016211543949738283], [0.016211854552833364], [0.016212174967583686], [0.01621250508380981], [0.016212844787974082], [0.016213193963217794], [0.01621355248939928], [0.016213920243133298], [0.01621429709783137], [0.01621468292374328], [0.016215077587999643], [0.016215480954655522], [0.016215892884735093], [0.016216313236277397], [0.01621674186438304], [0.016217178621262027], [0.016217623356282452], [0.016218075916020345], [0.01621853614431037], [0.016219003882297515], [0.016219478968489798], [0.01621996123881182], [0.016220450526659325], [0.016220946662954573], [0.016221449476202663], [0.016221958792548778], [0.016222474435836146], [0.016222996227665012], [0.016223523987452273], [0.016224057532492075], [0.016224596678017105], [0.01622514123726063], [0.01622569102151943], [0.01622624584021731], [0.016226805500969423], [0.016227369809647264], [0.016227938570444335], [0.01622851158594252], [0.016229088657178987], [0.016229669583713843], [0.016230254163698315], [0.01623084219394346], [0.016231433469989558], [0.016232027786175933], [0.016232624935711308], [0.016233224710744672], [0.016233826902436622], [0.01623443130103106], [0.016235037695927462], [0.016235645875753376], [0.01623625562843743], [0.016236866741282618], [0.016237479001039893], [0.016238092193982135], [0.016238706105978322], [0.016239320522567977], [0.01623993522903586], [0.01624055001048681], [0.016241164651920784], [0.016241778938308107], [0.0162423926546647], [0.01624300558612752], [0.016243617518030027], [0.016244228235977723], [0.016244837525923636], [0.01624544517424384], [0.016246050967812946], [0.016246654694079453], [0.016247256141141152], [0.016247855097820216], [0.01624845135373828], [0.016249044699391264], [0.016249634926224044], [0.016250221826704894], [0.016250805194399556], [0.016251384824045163], [0.016251960511623767], [0.016252532054435526], [0.016253099251171497], [0.016253661901986096], [0.016254219808569063], [0.01625477277421696], [0.016255320603904253], [0.016255863104353806], [0.016256400084106826], [0.016256931353592338], [0.01625745672519594], [0.016257976013328002], [0.016258489034491185], [0.016258995607347306], [0.016259495552783415], [0.016259988693977306], [0.016260474856462013], [0.016260953868189803], [0.01626142555959509], [0.01626188976365671], [0.016262346315959235], [0.01626279505475338], [0.016263235821015513], [0.01626366845850628], [0.016264092813828183], [0.016264508736482174], [0.016264916078923292], [0.016265314696615185], [0.016265704448083666], [0.016266085194969027], [0.01626645680207744], [0.01626681913743108], [0.01626717207231716], [0.016267515481335752], [0.016267849242446467], [0.016268173237013905], [0.01626848734985183], [0.016268791469266127], [0.01626908548709648], [0.016269369298756785], [0.0162696428032742], [0.01626990590332693], [0.016270158505280564], [0.016270400519223256], [0.016270631858999265], [0.01627085244224136], [0.01627106219040162], [0.016271261028780955], [0.016271448886557117], [0.01627162569681132], [0.01627179139655335], [0.016271945926745267], [0.016272089232323574], [0.016272221262219968], [0.01627234196938049], [0.01627245131078331], [0.016272549247454866], [0.01627263574448455], [0.016272710771037882], [0.016272774300368102], [0.016272826309826245], [0.016272866780869713], [0.01627289569906919], [0.016272913054114182], [0.016272918839816807]]}, "compressible": {"main_wing": {"compressibility_drag": [[1.1041086540784264e-10], [1.1041177614794015e-10], [1.104145080822443e-10], [1.1041906035290318e-10], [1.1042543153031196e-10], [1.1043361961340837e-10], [1.1044362203003517e-10], [1.1045543563741527e-10], [1.1046905672274757e-10], [1.1048448100389391e-10], [1.1050170363018662e-10], [1.1052071918333987e-10], [1.105415216784731e-10], [1.1056410456524315e-10], [1.1058846072909256e-10], [1.1061458249260856e-10], [1.1064246161699457e-10], [1.1067208930366246e-10], [1.1070345619593604e-10], [1.1073655238087892e-10], [1.1077136739123608e-10], [1.108078902075016e-10], [1.1084610926010667e-10], [1.1088601243173718e-10], [1.1092758705976717e-10], [1.109708199388339e-10], [1.1101569732353509e-10], [1.1106220493125533e-10], [1.1111032794513827e-10], [1.1116005101718033e-10], [1.1121135827147272e-10], [1.112642333075775e-10], [1.1131865920404949e-10], [1.1137461852209875e-10], [1.1143209330939978e-10], [1.1149106510405125e-10], [1.115515149386799e-10], [1.1161342334470397e-10], [1.1167677035674346e-10], [1.1174153551719094e-10], [1.1180769788093892e-10], [1.1187523602026491e-10], [1.119441280298817e-10], [1.1201435153214875e-10], [1.1208588368244912e-10], [1.1215870117473382e-10], [1.1223278024723575e-10], [1.1230809668834976e-10], [1.1238462584268826e-10], [1.1246234261731057e-10], [1.125412214881211e-10], [1.1262123650644904e-10], [1.1270236130580264e-10], [1.1278456910879904e-10], [1.12867832734277e-10], [1.1295212460458292e-10], [1.1303741675304482e-10], [1.1312368083161838e-10], [1.1321088811872281e-10], [1.1329900952724807e-10], [1.1338801561275235e-10], [1.1347787658183542e-10], [1.1356856230069412e-10], [1.1366004230386193e-10], [1.1375228580312159e-10], [1.1384526169660603e-10], [1.1393893857807211e-10], [1.140332847463526e-10], [1.1412826821498748e-10], [1.1422385672202854e-10], [1.1432001774001713e-10], [1.14416718486135e-10], [1.1451392593252478e-10], [1.1461160681677937e-10], [1.147097276525963e-10], [1.148082547405921e-10], [1.1490715417928515e-10], [1.1500639187622698e-10], [1.1510593355929631e-10], [1.1520574478813918e-10], [1.1530579096575977e-10], [1.1540603735025431e-10], [1.155064490666881e-10], [1.1560699111910683e-10], [1.15707628402682e-10], [1.1580832571598294e-10], [1.1590904777337677e-10], [1.1600975921754115e-10], [1.1611042463209792e-10], [1.1621100855434993e-10], [1.1631147548812892e-10], [1.164117899167339e-10], [1.1651191631596982e-10], [1.1661181916726974e-10], [1.1671146297090025e-10], [1.1681081225924188e-10], [1.1690983161013915e-10], [1.1700848566031428e-10], [1.1710673911883919e-10], [1.1720455678065492e-10], [1.1730190354013565e-10], [1.17398744404693e-10], [1.1749504450840717e-10], [1.1759076912568162e-10], [1.1768588368491373e-10], [1.1778035378217767e-10], [1.1787414519490504e-10], [1.1796722389556396e-10], [1.1805955606531832e-10], [1.1815110810767807e-10], [1.1824184666210921e-10], [1.1833173861761787e-10], [1.1842075112628827e-10], [1.1850885161676846e-10], [1.1859600780769972e-10], [1.1868218772108263e-10], [1.1876735969556307e-10], [1.1885149239964488e-10], [1.1893455484480835e-10], [1.1901651639853577e-10], [1.1909734679722914e-10], [1.191770161590212e-10], [1.1925549499646287e-10], [1.1933275422908655e-10], [1.194087651958355e-10], [1.1948349966734918e-10], [1.195569298581025e-10], [1.196290284383873e-10], [1.196997685461293e-10], [1.1976912379853895e-10], [1.1983706830357648e-10], [1.199035766712434e-10], [1.1996862402467245e-10], [1.2003218601102203e-10], [1.2009423881217142e-10], [1.2015475915519783e-10], [1.2021372432263523e-10], [1.2027111216251732e-10], [1.203269010981792e-10], [1.2038107013783123e-10], [1.2043359888388735e-10], [1.2048446754204293e-10], [1.2053365693010611e-10], [1.2058114848656188e-10], [1.2062692427887858e-10], [1.2067096701154106e-10], [1.2071326003381066e-10], [1.20753787347208e-10], [1.2079253361270885e-10], [1.208294841576531e-10], [1.208646249823643e-10], [1.20897942766466e-10], [1.20929424874906e-10], [1.2095905936367e-10], [1.2098683498518939e-10], [1.210127411934426e-10], [1.21036768148733e-10], [1.210589067221595e-10], [1.210791484997645e-10], [1.2109748578635205e-10], [1.2111391160899443e-10], [1.211284197202017e-10], [1.211410046007683e-10], [1.2115166146228106e-10], [1.2116038624931012e-10], [1.2116717564125071e-10], [1.2117202705383565e-10], [1.2117493864032124e-10], [1.2117590929232165e-10]], "thickness_to_chord": 0.15015527441765908, "wing_sweep": 0.6108652381980153, "crest_critical": [[0.7392663054402282], [0.7392661478502089], [0.7392656751422872], [0.7392648875028149], [0.7392637852422889], [0.7392623687951845], [0.7392606387197461], [0.7392585956977145], [0.7392562405339861], [0.73925357415622], [0.7392505976143806], [0.7392473120802208], [0.739243718846705], [0.7392398193273763], [0.739235615055659], [0.7392311076841082], [0.7392262989835989], [0.7392211908424582], [0.7392157852655408], [0.7392100843732484], [0.739204090400494], [0.7391978056956109], [0.7391912327192085], [0.7391843740429725], [0.7391772323484169], [0.73916981042558], [0.7391621111716715], [0.7391541375896709], [0.7391458927868743], [0.739137379973396], [0.7391286024606206], [0.739119563659612], [0.7391102670794737], [0.7391007163256698], [0.7390909150982997], [0.7390808671903334], [0.7390705764858054], [0.73906004695797], [0.7390492826674185], [0.7390382877601601], [0.7390270664656666], [0.7390156230948844], [0.7390039620382122], [0.7389920877634484], [0.738980004813708], [0.7389677178053109], [0.7389552314256431], [0.7389425504309917], [0.7389296796443556], [0.7389166239532339], [0.7389033883073911], [0.7388899777166041], [0.7388763972483893], [0.7388626520257128], [0.7388487472246859], [0.738834688072245], [0.7388204798438197], [0.73880612786099], [0.7387916374891327], [0.738777014135061], [0.738762263244657], [0.7387473903004981], [0.7387324008194814], [0.7387173003504446], [0.7387020944717867], [0.7386867887890901], [0.7386713889327425], [0.7386559005555671], [0.7386403293304526], [0.7386246809479936], [0.7386089611141373], [0.7385931755478402], [0.7385773299787346], [0.7385614301448082], [0.7385454817900968], [0.7385294906623912], [0.7385134625109602], [0.7384974030842926], [0.7384813181278538], [0.7384652133818664], [0.7384490945791087], [0.7384329674427363], [0.7384168376841264], [0.7384007110007469], [0.7383845930740492], [0.7383684895673897], [0.7383524061239751], [0.7383363483648393], [0.7383203218868462], [0.7383043322607247], [0.7382883850291325], [0.7382724857047525], [0.7382566397684209], [0.7382408526672881], [0.7382251298130122], [0.7382094765799889], [0.738193898303613], [0.7381784002785775], [0.738162987757206], [0.7381476659478232], [0.7381324400131607], [0.738117315068799], [0.7381022961816471], [0.7380873883684598], [0.738072596594391], [0.7380579257715854], [0.7380433807578077], [0.7380289663551091], [0.7380146873085325], [0.7380005483048533], [0.7379865539713604], [0.7379727088746719], [0.7379590175195905], [0.7379454843479936], [0.7379321137377625], [0.7379189100017461], [0.7379058773867628], [0.7378930200726358], [0.7378803421712659], [0.7378678477257381], [0.7378555407094635], [0.7378434250253542], [0.7378315045050327], [0.7378197829080736], [0.7378082639212773], [0.7377969511579766], [0.7377858481573727], [0.7377749583839032], [0.7377642852266381], [0.7377538319987058], [0.7377436019367485], [0.7377335982004012], [0.7377238238718015], [0.737714281955124], [0.7377049753761383], [0.7376959069817938], [0.7376870795398258], [0.7376784957383861], [0.7376701581856945], [0.7376620694097115], [0.7376542318578317], [0.7376466478965964], [0.7376393198114244], [0.7376322498063618], [0.7376254400038474], [0.7376188924444962], [0.7376126090868962], [0.7376065918074216], [0.7376008424000599], [0.7375953625762512], [0.7375901539647411], [0.7375852181114453], [0.7375805564793243], [0.7375761704482713], [0.737572061315007], [0.7375682302929853], [0.7375646785123089], [0.7375614070196507], [0.7375584167781841], [0.7375557086675228], [0.7375532834836632], [0.7375511419389368], [0.7375492846619669], [0.7375477121976336], [0.7375464250070389], [0.737545423467484], [0.7375447078724471], [0.7375442784315664], [0.7375441352706298]], "divergence_mach": [[0.7647472155542244], [0.7647470525324181], [0.7647465635312771], [0.7647457487435763], [0.7647446084905146], [0.7647431432215431], [0.7647413535141475], [0.7647392400735665], [0.7647368037324399], [0.764734045450401], [0.7647309663136044], [0.7647275675341905], [0.7647238504496895], [0.7647198165223663], [0.764715467338499], [0.7647108046076028], [0.7647058301615908], [0.7647005459538766], [0.764694954058418], [0.7646890566687025], [0.7646828560966754], [0.7646763547716122], [0.7646695552389342], [0.7646624601589674], [0.7646550723056519], [0.7646473945651925], [0.7646394299346594], [0.7646311815205383], [0.7646226525372273], [0.7646138463054863], [0.7646047662508361], [0.7645954159019125], [0.7645857988887704], [0.7645759189411463], [0.7645657798866742], [0.7645553856490593], [0.7645447402462107], [0.7645338477883319], [0.7645227124759741], [0.7645113385980504], [0.7644997305298135], [0.7644878927307986], [0.7644758297427321], [0.7644635461874077], [0.7644510467645317], [0.7644383362495387], [0.7644254194913787], [0.7644123014102774], [0.7643989869954725], [0.7643854813029244], [0.7643717894530052], [0.7643579166281682], [0.764343868070596], [0.7643296490798321], [0.7643152650103975], [0.7643007212693895], [0.7642860233140706], [0.7642711766494439], [0.7642561868258192], [0.7642410594363709], [0.7642258001146889], [0.7642104145323231], [0.7641949083963262], [0.7641792874467921], [0.7641635574543955], [0.7641477242179309], [0.7641317935618532], [0.7641157713338262], [0.7640996634022712], [0.7640834756539248], [0.764067213991406], [0.7640508843307913], [0.7640344925992012], [0.7640180447323994], [0.764001546672406], [0.7639850043651258], [0.7639684237579927], [0.7639518107976331], [0.7639351714275463], [0.7639185115858081], [0.763901837202793], [0.7638851541989217], [0.7638684684824298], [0.7638517859471651], [0.7638351124704059], [0.7638184539107125], [0.7638018161058007], [0.7637852048704491], [0.7637686259944335], [0.7637520852404939], [0.7637355883423312], [0.7637191410026386], [0.7637027488911652], [0.7636864176428123], [0.7636701528557667], [0.7636539600896675], [0.7636378448638091], [0.7636218126553813], [0.7636058688977438], [0.763590018978741], [0.7635742682390526], [0.7635586219705822], [0.7635430854148842], [0.7635276637616301], [0.7635123621471117], [0.7634971856527849], [0.7634821393038511], [0.7634672280678777], [0.7634524568534589], [0.7634378305089132], [0.7634233538210221], [0.7634090315138053], [0.763394868247336], [0.7633808686165938], [0.7633670371503559], [0.763353378310126], [0.7633398964891008], [0.7633265960111731], [0.7633134811299722], [0.7633005560279393], [0.7632878248154406], [0.7632752915299128], [0.7632629601350464], [0.7632508345200003], [0.7632389184986509], [0.763227215808875], [0.7632157301118621], [0.7632044649914614], [0.7631934239535573], [0.7631826104254742], [0.7631720277554144], [0.7631616792119187], [0.7631515679833594], [0.7631416971774584], [0.7631320698208303], [0.7631226888585525], [0.7631135571537585], [0.7631046774872545], [0.7630960525571603], [0.7630876849785696], [0.7630795772832334], [0.7630717319192625], [0.7630641512508493], [0.7630568375580083], [0.7630497930363347], [0.7630430197967786], [0.7630365198654364], [0.763030295183357], [0.7630243476063625], [0.7630186789048831], [0.7630132907638033], [0.7630081847823232], [0.7630033624738287], [0.7629988252657747], [0.762994574499577], [0.7629906114305148], [0.7629869372276429], [0.7629835529737108], [0.7629804596650904], [0.7629776582117137], [0.7629751494370135], [0.7629729340778736], [0.7629710127845849], [0.7629693861208081], [0.7629680545635386], [0.762967018503082], [0.7629662782430324], [0.7629658340002538], [0.7629656859048694]]}, "horizontal_stabilizer": {"compressibility_drag": [[2.0463190885301815e-11], [2.0463413621107968e-11], [2.0464081767477362e-11], [2.0465195141283447e-11], [2.046675343730575e-11], [2.0468756228241517e-11], [2.047120296470291e-11], [2.047409297521875e-11], [2.0477425466240084e-11], [2.048119952214111e-11], [2.0485414105227042e-11], [2.0490068055740608e-11], [2.049516009187138e-11], [2.0500688809767507e-11], [2.050665268355134e-11], [2.0513050065337913e-11], [2.0519879185256735e-11], [2.0527138151480172e-11], [2.0534824950255648e-11], [2.0542937445943582e-11], [2.055147338106441e-11], [2.056043037634976e-11], [2.0569805930804194e-11], [2.0579597421775783e-11], [2.058980210503535e-11], [2.0600417114868155e-11], [2.061143946417681e-11], [2.062286604459578e-11], [2.0634693626622203e-11], [2.064691885975908e-11], [2.065953827267572e-11], [2.0672548273384784e-11], [2.0685945149437028e-11], [2.0699725068136676e-11], [2.0713884076775378e-11], [2.0728418102889313e-11], [2.0743322954537992e-11], [2.075859432060876e-11], [2.0774227771144558e-11], [2.0790218757700827e-11], [2.08065626137274e-11], [2.0823254554983112e-11], [2.0840289679978e-11], [2.085766297044924e-11], [2.0875369291869805e-11], [2.089340339399187e-11], [2.091175991142643e-11], [2.093043336425962e-11], [2.0949418158708765e-11], [2.0968708587818018e-11], [2.0988298832195243e-11], [2.1008182960792122e-11], [2.1028354931728872e-11], [2.1048808593163134e-11], [2.106953768420734e-11], [2.10905358358931e-11], [2.111179657218569e-11], [2.113331331104876e-11], [2.1155079365561376e-11], [2.1177087945088837e-11], [2.119933215650626e-11], [2.122180500548013e-11], [2.1244499397804106e-11], [2.126740814079488e-11], [2.1290523944745382e-11], [2.1313839424439195e-11], [2.1337347100724524e-11], [2.1361039402151442e-11], [2.13849086666714e-11], [2.1408947143399524e-11], [2.1433146994443138e-11], [2.145750029679408e-11], [2.1481999044286333e-11], [2.1506635149622844e-11], [2.1531400446466017e-11], [2.1556286691597793e-11], [2.1581285567147404e-11], [2.1606388682886954e-11], [2.1631587578595396e-11], [2.165687372649259e-11], [2.1682238533740493e-11], [2.1707673345014632e-11], [2.173316944514385e-11], [2.1758718061819473e-11], [2.1784310368372295e-11], [2.1809937486618253e-11], [2.1835590489772687e-11], [2.186126040543091e-11], [2.1886938218616344e-11], [2.1912614874895303e-11], [2.1938281283556865e-11], [2.196392832085681e-11], [2.198954683332704e-11], [2.201512764114594e-11], [2.20406615415714e-11], [2.2066139312433816e-11], [2.2091551715688248e-11], [2.211688950102411e-11], [2.214214340953104e-11], [2.2167304177419327e-11], [2.2192362539792338e-11], [2.2217309234470932e-11], [2.2242135005866278e-11], [2.2266830608899446e-11], [2.2291386812965698e-11], [2.2315794405942894e-11], [2.234004419823766e-11], [2.236412702687171e-11], [2.2388033759602285e-11], [2.2411755299075902e-11], [2.2435282587012388e-11], [2.2458606608415686e-11], [2.248171839580969e-11], [2.2504609033495866e-11], [2.252726966182868e-11], [2.254969148150785e-11], [2.2571865757881308e-11], [2.2593783825259226e-11], [2.2615437091232145e-11], [2.2636817040993556e-11], [2.2657915241659266e-11], [2.267872334658492e-11], [2.269923309967403e-11], [2.2719436339675228e-11], [2.273932500446469e-11], [2.2758891135309517e-11], [2.2778126881109575e-11], [2.2797024502612976e-11], [2.2815576376600926e-11], [2.2833775000042055e-11], [2.285161299420591e-11], [2.286908310873874e-11], [2.2886178225692584e-11], [2.290289136350737e-11], [2.2919215680939632e-11], [2.2935144480936982e-11], [2.2950671214450986e-11], [2.2965789484189165e-11], [2.2980493048297875e-11], [2.299477582397632e-11], [2.3008631891016087e-11], [2.3022055495262112e-11], [2.3035041051994588e-11], [2.3047583149224043e-11], [2.3059676550900736e-11], [2.3071316200031386e-11], [2.308249722170203e-11], [2.3093214926004315e-11], [2.310346481086018e-11], [2.3113242564742676e-11], [2.3122544069292708e-11], [2.3131365401823954e-11], [2.31397028377181e-11], [2.3147552852704706e-11], [2.3154912125024327e-11], [2.316177753747388e-11], [2.3168146179328267e-11], [2.317401534814166e-11], [2.317938255142116e-11], [2.3184245508174108e-11], [2.318860215032672e-11], [2.319245062401289e-11], [2.3195789290730194e-11], [2.3198616728362224e-11], [2.320093173207035e-11], [2.3202733315045503e-11], [2.320402070912684e-11], [2.3204793365284282e-11], [2.3205050953961505e-11]], "thickness_to_chord": 0.09079588711195336, "wing_sweep": 0.49261918137539956, "crest_critical": [[0.8419518208417534], [0.8419514897732461], [0.84195049667905], [0.8419488418930534], [0.8419465259716563], [0.8419435496935758], [0.8419399140596296], [0.8419356202924434], [0.8419306698360831], [0.841925064355638], [0.8419188057367257], [0.841911896084938], [0.8419043377252191], [0.841896133201183], [0.8418872852743583], [0.8418777969233742], [0.8418676713430814], [0.8418569119436035], [0.8418455223493273], [0.8418335063978308], [0.8418208681387385], [0.841807611832521], [0.8417937419492262], [0.8417792631671455], [0.8417641803714191], [0.8417484986525744], [0.8417322233050021], [0.8417153598253702], [0.8416979139109709], [0.8416798914580087], [0.8416612985598224], [0.8416421415050458], [0.8416224267757066], [0.8416021610452609], [0.8415813511765676], [0.8415600042198019], [0.8415381274103052], [0.8415157281663739], [0.8414928140869915], [0.8414693929494942], [0.8414454727071834], [0.8414210614868709], [0.841396167586372], [0.8413707994719358], [0.8413449657756173], [0.8413186752925934], [0.8412919369784194], [0.8412647599462303], [0.8412371534638843], [0.8412091269510509], [0.8411806899762447], [0.8411518522538022], [0.8411226236408064], [0.8410930141339569], [0.841063033866388], [0.8410326931044328], [0.8410020022443382], [0.8409709718089268], [0.8409396124442114], [0.8409079349159564], [0.8408759501061961], [0.8408436690096988], [0.8408111027303907], [0.8407782624777294], [0.8407451595630336], [0.84071180539577], [0.8406782114797947], [0.8406443894095558], [0.8406103508662506], [0.8405761076139475], [0.8405416714956645], [0.8405070544294128], [0.8404722684042034], [0.8404373254760151], [0.8404022377637332], [0.8403670174450496], [0.8403316767523348], [0.8402962279684768], [0.8402606834226929], [0.8402250554863105], [0.8401893565685236], [0.8401535991121223], [0.8401177955891992], [0.8400819584968329], [0.8400461003527495], [0.840010233690967], [0.8399743710574172], [0.8399385250055555], [0.8399027080919529], [0.8398669328718749], [0.8398312118948476], [0.8397955577002164], [0.8397599828126924], [0.8397244997378938], [0.8396891209578803], [0.8396538589266868], [0.8396187260658506], [0.839583734759943], [0.8395488973520977], [0.8395142261395465], [0.8394797333691576], [0.8394454312329813], [0.8394113318638033], [0.8393774473307107], [0.8393437896346682], [0.8393103707041069], [0.8392772023905339], [0.8392442964641543], [0.8392116646095157], [0.8391793184211735], [0.8391472693993787], [0.8391155289457916], [0.8390841083592231], [0.8390530188314029], [0.839022271442781], [0.8389918771583587], [0.838961846823558], [0.8389321911601235], [0.8389029207620652], [0.8388740460916393], [0.8388455774753736], [0.8388175251001332], [0.8387898990092351], [0.8387627090986076], [0.8387359651130003], [0.8387096766422452], [0.8386838531175691], [0.8386585038079618], [0.838633637816601], [0.8386092640773328], [0.838585391351215], [0.8385620282231185], [0.8385391830983953], [0.8385168641996066], [0.8384950795633225], [0.8384738370369843], [0.8384531442758402], [0.8384330087399486], [0.8384134376912576], [0.8383944381907541], [0.8383760170956909], [0.8383581810568904], [0.8383409365161248], [0.8383242897035775], [0.8383082466353828], [0.8382928131112505], [0.8382779947121712], [0.8382637967982068], [0.8382502245063657], [0.8382372827485671], [0.8382249762096885], [0.8382133093457061], [0.8382022863819214], [0.8381919113112809], [0.8381821878927852], [0.8381731196499905], [0.8381647098696058], [0.838156961600178], [0.8381498776508775], [0.8381434605903757], [0.8381377127458179], [0.838132636201893], [0.8381282327999995], [0.8381245041375115], [0.838121451567134], [0.8381190761963673], [0.8381173788870604], [0.8381163602550661], [0.8381160206699952]], "divergence_mach": [[0.8667996929894876], [0.8667993521504118], [0.8667983297477957], [0.8667966261253813], [0.8667942418559893], [0.8667911777413184], [0.8667874348117227], [0.8667830143259103], [0.8667779177705647], [0.8667721468599155], [0.8667657035352295], [0.8667585899642389], [0.8667508085405022], [0.8667423618827012], [0.8667332528338633], [0.8667234844605235], [0.86671306005182], [0.8667019831185165], [0.8666902573919637], [0.866677886822995], [0.866664875580748], [0.8666512280514298], [0.866636948837009], [0.866622042753844], [0.8666065148312463], [0.866590370309976], [0.8665736146406731], [0.8665562534822245], [0.8665382927000624], [0.8665197383644011], [0.8665005967484075], [0.8664808743263069], [0.8664605777714263], [0.8664397139541701], [0.8664182899399356], [0.8663963129869643], [0.8663737905441286], [0.8663507302486553], [0.866327139923791], [0.8663030275763981], [0.866278401394498], [0.8662532697447425], [0.8662276411698341], [0.8662015243858796], [0.8661749282796852], [0.866147861905993], [0.8661203344846569], [0.8660923553977605], [0.8660639341866773], [0.8660350805490721], [0.8660058043358478], [0.8659761155480326], [0.8659460243336137], [0.8659155409843158], [0.8658846759323245], [0.8658534397469553], [0.8658218431312712], [0.8657898969186469], [0.865757612069283], [0.8657249996666652], [0.8656920709139809], [0.8656588371304785], [0.8656253097477861], [0.8655915003061767], [0.8655574204507919], [0.8655230819278166], [0.8654884965806117], [0.8654536763458028], [0.8654186332493259], [0.8653833794024328], [0.8653479269976555], [0.8653122883047322], [0.8652764756664965], [0.8652405014947255], [0.8652043782659602], [0.865168118517283], [0.8651317348420692], [0.8650952398857019], [0.8650586463412612], [0.8650219669451799], [0.8649852144728747], [0.8649484017343503], [0.8649115415697787], [0.8648746468450547], [0.8648377304473307], [0.8648008052805313], [0.8647638842608468], [0.8647269803122128], [0.8646901063617728], [0.8646532753353261], [0.8646165001527633], [0.8645797937234938], [0.8645431689418606], [0.8645066386825507], [0.8644702157959973], [0.8644339131037813], [0.8643977433940274], [0.864361719416803], [0.8643258538795152], [0.8642901594423147], [0.8642546487135018], [0.8642193342449414], [0.8641842285274847], [0.8641493439864044], [0.8641146929768404], [0.8640802877792584], [0.8640461405949299], [0.8640122635414248], [0.8639786686481278], [0.8639453678517753], [0.8639123729920165], [0.863879695807], [0.8638473479289898], [0.8638153408800082], [0.8637836860675142], [0.8637523947801107], [0.8637214781832921], [0.8636909473152258], [0.8636608130825743], [0.8636310862563583], [0.8636017774678646], [0.8635728972045953], [0.8635444558062679], [0.8635164634608619], [0.8634889302007157], [0.8634618658986789], [0.8634352802643147], [0.8634091828401614], [0.863383582998052], [0.8633584899354898], [0.8633339126720913], [0.8633098600460858], [0.8632863407108861], [0.8632633631317194], [0.863240935582333], [0.8632190661417635], [0.8631977626911825], [0.8631770329108116], [0.8631568842769148], [0.8631373240588646], [0.8631183593162867], [0.8630999968962839], [0.8630822434307395], [0.8630651053337034], [0.8630485887988596], [0.86303269979708], [0.8630174440740629], [0.8630028271480574], [0.8629888543076765], [0.8629755306098011], [0.8629628608775698], [0.8629508496984646], [0.862939501422485], [0.8629288201604183], [0.8629188097822016], [0.862909473915379], [0.8629008159436576], [0.8628928390055539], [0.8628855459931429], [0.8628789395509034], [0.8628730220746599], [0.862867795710625], [0.862863262354541], [0.8628594236509242], [0.8628562809924009], [0.862853835519156], [0.8628520881184738], [0.8628510394243821], [0.8628506898174001]]}, "vertical_stabilizer": {"compressibility_drag": [[2.936483713396748e-12], [2.936498770481598e-12], [2.936543936996534e-12], [2.9366191987237395e-12], [2.936724531970035e-12], [2.9368599035716334e-12], [2.93702527090091e-12], [2.9372205818749616e-12], [2.9374457749662283e-12], [2.9377007792148713e-12], [2.9379855142433178e-12], [2.9382998902725616e-12], [2.9386438081404854e-12], [2.939017159322193e-12], [2.93941982595223e-12], [2.93985168084889e-12], [2.940312587540464e-12], [2.940802400293486e-12], [2.9413209641430767e-12], [2.941868114925281e-12], [2.942443679311494e-12], [2.9430474748449204e-12], [2.9436793099792138e-12], [2.944338984119169e-12], [2.9450262876635018e-12], [2.945741002049931e-12], [2.946482899802318e-12], [2.947251744579951e-12], [2.9480472912292685e-12], [2.948869285837556e-12], [2.9497174657890553e-12], [2.9505915598233667e-12], [2.9514912880960268e-12], [2.95241636224158e-12], [2.953366485438869e-12], [2.954341352478796e-12], [2.9553406498343597e-12], [2.956364055733256e-12], [2.9574112402328314e-12], [2.95848186529749e-12], [2.959575584878662e-12], [2.960692044997227e-12], [2.9618308838284387e-12], [2.962991731789529e-12], [2.964174211629718e-12], [2.965377938522954e-12], [2.9666025201632344e-12], [2.9678475568624514e-12], [2.9691126416511017e-12], [2.970397360381432e-12], [2.9717012918334828e-12], [2.9730240078236177e-12], [2.974365073316006e-12], [2.975724046536586e-12], [2.9771004790899984e-12], [2.9784939160790724e-12], [2.9799038962272224e-12], [2.981329952003535e-12], [2.9827716097506232e-12], [2.984228389815328e-12], [2.9856998066821003e-12], [2.9871853691093e-12], [2.988684580268106e-12], [2.990196937884407e-12], [2.9917219343832683e-12], [2.9932590570363666e-12], [2.994807788111949e-12], [2.996367605027867e-12], [2.997937980507012e-12], [2.9995183827356707e-12], [3.001108275524604e-12], [3.002707118472702e-12], [3.0043143671333745e-12], [3.00592947318359e-12], [3.0075518845955337e-12], [3.0091810458107754e-12], [3.010816397917109e-12], [3.0124573788278784e-12], [3.0141034234636855e-12], [3.0157539639367277e-12], [3.0174084297373713e-12], [3.0190662479231973e-12], [3.0207268433102733e-12], [3.0223896386667906e-12], [3.0240540549087605e-12], [3.0257195112980212e-12], [3.027385425642225e-12], [3.0290512144969002e-12], [3.0307162933694653e-12], [3.032380076925174e-12], [3.034041979194842e-12], [3.0357014137843503e-12], [3.0373577940858374e-12], [3.0390105334904963e-12], [3.0406590456028423e-12], [3.042302744456513e-12], [3.043941044731311e-12], [3.0455733619715623e-12], [3.0471991128056494e-12], [3.0488177151666257e-12], [3.050428588513714e-12], [3.052031154054819e-12], [3.0536248349697272e-12], [3.055209056633995e-12], [3.056783246843377e-12], [3.0583468360388004e-12], [3.0598992575315367e-12], [3.061439947728738e-12], [3.0629683463590127e-12], [3.0644838966980377e-12], [3.065986045794005e-12], [3.0674742446928844e-12], [3.068947948663269e-12], [3.0704066174207615e-12], [3.071849715351745e-12], [3.0732767117363977e-12], [3.074687080970876e-12], [3.076080302788453e-12], [3.0774558624795407e-12], [3.078813251110531e-12], [3.080151965741109e-12], [3.0814715096401614e-12], [3.0827713924999936e-12], [3.0840511306487e-12], [3.0853102472607462e-12], [3.086548272565373e-12], [3.0877647440528393e-12], [3.0889592066784516e-12], [3.090131213063908e-12], [3.0912803236963613e-12], [3.0924061071244645e-12], [3.093508140151822e-12], [3.094586008027254e-12], [3.095639304632077e-12], [3.0966676326641255e-12], [3.097670603818431e-12], [3.098647838964253e-12], [3.099598968318795e-12], [3.1005236316168943e-12], [3.101421478277027e-12], [3.102292167563319e-12], [3.103135368743358e-12], [3.103950761241989e-12], [3.1047380347906564e-12], [3.1054968895723325e-12], [3.106227036362025e-12], [3.1069281966625057e-12], [3.1076001028354486e-12], [3.10824249822763e-12], [3.1088551372922966e-12], [3.109437785705441e-12], [3.1099902204770276e-12], [3.1105122300570352e-12], [3.1110036144362376e-12], [3.111464185241578e-12], [3.1118937658262864e-12], [3.1122921913542884e-12], [3.112659308879331e-12], [3.112994977418296e-12], [3.1132990680189542e-12], [3.113571463821948e-12], [3.1138120601171164e-12], [3.1140207643938992e-12], [3.1141974963859073e-12], [3.114342188109755e-12], [3.114454783897811e-12], [3.114535240425067e-12], [3.11458352673018e-12], [3.1145996242303075e-12]], "thickness_to_chord": 0.09352740548802943, "wing_sweep": 0.5445427266222308, "crest_critical": [[0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869], [0.9555151117608869]], "divergence_mach": [[0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929], [0.9856815448054929]]}, "total": [[1.3381054000654122e-10], [1.338116885395297e-10], [1.3381513378671818e-10], [1.3382087469291036e-10], [1.3382890949958773e-10], [1.3383923574522152e-10], [1.3385185026563898e-10], [1.33866749194509e-10], [1.3388392796395387e-10], [1.339033813052499e-10], [1.3392510324965696e-10], [1.3394908712935304e-10], [1.3397532557848496e-10], [1.3400381053433284e-10], [1.340345332385961e-10], [1.3406748423879536e-10], [1.3410265338979176e-10], [1.3414002985543612e-10], [1.3417960211033476e-10], [1.3422135794174777e-10], [1.3426528445161198e-10], [1.3431136805869628e-10], [1.3435959450089007e-10], [1.3440994883763212e-10], [1.34462415452466e-10], [1.34516978055752e-10], [1.345736196875142e-10], [1.3463232272043108e-10], [1.3469306886298974e-10], [1.3475583916277696e-10], [1.348206140099375e-10], [1.3488737314078564e-10], [1.3495609564158255e-10], [1.35026759952477e-10], [1.3509934387161403e-10], [1.3517382455941935e-10], [1.3525017854305225e-10], [1.35328381721046e-10], [1.3540840936812087e-10], [1.3549023614018925e-10], [1.35573836079545e-10], [1.3565918262024526e-10], [1.3574624859368816e-10], [1.3583500623438754e-10], [1.3592542718594864e-10], [1.3601748250724865e-10], [1.3611114267882542e-10], [1.3620637760947183e-10], [1.3630315664304814e-10], [1.3640144856551e-10], [1.3650122161214984e-10], [1.3660244347506479e-10], [1.3670508131084753e-10], [1.3680910174849876e-10], [1.3691447089757433e-10], [1.370211543565551e-10], [1.3712911722145773e-10], [1.372383240946707e-10], [1.3734873909403482e-10], [1.3746032586215224e-10], [1.3757304757594071e-10], [1.3768686695642485e-10], [1.3780174627876632e-10], [1.3791764738254122e-10], [1.3803453168225022e-10], [1.3815236017808157e-10], [1.3827109346690857e-10], [1.383906917535319e-10], [1.3851111486216589e-10], [1.3863232224816375e-10], [1.387542730099849e-10], [1.3887692590140176e-10], [1.390002393439445e-10], [1.3912417143958582e-10], [1.3924867998365786e-10], [1.3937372247800066e-10], [1.3949925614434965e-10], [1.3962523793794183e-10], [1.3975162456135538e-10], [1.398783724785685e-10], [1.4000543792923763e-10], [1.4013277694319214e-10], [1.4026034535514222e-10], [1.4038809881959309e-10], [1.4051599282596306e-10], [1.4064398271389921e-10], [1.4077202368879167e-10], [1.4090007083746896e-10], [1.4102807914408373e-10], [1.411560035061704e-10], [1.4128379875088063e-10], [1.4141141965137506e-10], [1.4153882094338269e-10], [1.416659573419062e-10], [1.417927835580745e-10], [1.419192543161322e-10], [1.420453243705587e-10], [1.4217094852330994e-10], [1.4229608164117586e-10], [1.4242067867324088e-10], [1.425446946684417e-10], [1.4266808479321874e-10], [1.4279080434924318e-10], [1.4291280879121505e-10], [1.430340537447228e-10], [1.4315449502415934e-10], [1.4327408865067422e-10], [1.433927908701644e-10], [1.4351055817127964e-10], [1.43627347303452e-10], [1.4374311529491562e-10], [1.4385781947072646e-10], [1.439714174707612e-10], [1.4408386726768508e-10], [1.4419512718488013e-10], [1.4430515591432687e-10], [1.4441391253441524e-10], [1.4452135652769255e-10], [1.4462744779852005e-10], [1.4473214669063986e-10], [1.4483541400462951e-10], [1.449372110152463e-10], [1.450374994886369e-10], [1.4513624169941047e-10], [1.4523340044756096e-10], [1.4532893907522408e-10], [1.454228214832649e-10], [1.4551501214767875e-10], [1.4560547613579413e-10], [1.4569417912227736e-10], [1.4578108740490685e-10], [1.4586616792013397e-10], [1.4594938825839228e-10], [1.460307166791615e-10], [1.4611012212577517e-10], [1.4618757423995325e-10], [1.4626304337605047e-10], [1.4633650061502528e-10], [1.4640791777809395e-10], [1.4647726744008457e-10], [1.4654452294246674e-10], [1.466096584060484e-10], [1.466726487433427e-10], [1.4673346967057658e-10], [1.4679209771935163e-10], [1.4684851024793448e-10], [1.469026854521752e-10], [1.4695460237604776e-10], [1.4700424092179666e-10], [1.470515818596881e-10], [1.4709660683736244e-10], [1.47139298388767e-10], [1.4717963994268114e-10], [1.4721761583081094e-10], [1.472532112954553e-10], [1.4728641249674275e-10], [1.4731720651941555e-10], [1.473455813791805e-10], [1.4737152602860395e-10], [1.473950303625451e-10], [1.474160852231431e-10], [1.474346824043317e-10], [1.474508146558924e-10], [1.4746447568702918e-10], [1.4747566016949023e-10], [1.4748436374019405e-10], [1.4749058300338757e-10], [1.474943155323357e-10], [1.4749555987051346e-10]]}, "induced": {"inviscid_wings": {"main_wing": [[0.04418383300661964], [0.04418405797571514], [0.044184732812240904], [0.04418585730396776], [0.04418743109720833], [0.0441894536969088], [0.04419192446674001], [0.04419484262922386], [0.04419820726589497], [0.044202017317480906], [0.04420627158411789], [0.044210968725593526], [0.04421610726161815], [0.04422168557212411], [0.04422770189759806], [0.04423415433943973], [0.044241040860349495], [0.04424835928474977], [0.044256107299233835], [0.04426428245304348], [0.04427288215858237], [0.04428190369195506], [0.04429134419353939], [0.04430120066859162], [0.044311469987880256], [0.044322148888354666], [0.044333233973844435], [0.044344721715791895], [0.04435660845401763], [0.04436889039751938], [0.04438156362530467], [0.044394624087256605], [0.04440806760503534], [0.04442188987301345], [0.044436086459246134], [0.04445065280647762], [0.044465584233182455], [0.04448087593464384], [0.04449652298406727], [0.04451252033373254], [0.04452886281618054], [0.04454554514544084], [0.04456256191829384], [0.044579907615573136], [0.04459757660350577], [0.044615563135091234], [0.04463386135151971], [0.04465246528362922], [0.044671368853403615], [0.04469056587550925], [0.044710050058872276], [0.04472981500829737], [0.044749854226124965], [0.044770161113931894], [0.0447907289742708], [0.044811551012453016], [0.04483262033837014], [0.04485392996836031], [0.04487547282711266], [0.04489724174961676], [0.04491922948315116], [0.044941428689315076], [0.044963831946101644], [0.0449864317500126], [0.0450092205182152], [0.045032190590739755], [0.04505533423272016], [0.04507864363667381], [0.04510211092482471], [0.045125728151465816], [0.04514948730536339], [0.04517338031220056], [0.0451973990370619], [0.04522153528695771], [0.04524578081338645], [0.04527012731493785], [0.04529456643993305], [0.0453190897891032], [0.04534368891830558], [0.045368355341276034], [0.04539308053241812], [0.045417855929627084], [0.04544267293714937], [0.045467522928475126], [0.0454923972492651], [0.04551728722030896], [0.04554218414051576], [0.04556707928993421], [0.04559196393280335], [0.045616829320631026], [0.045641666695300925], [0.045666467292205], [0.04569122234340153], [0.04571592308079775], [0.045740560739355056], [0.04576512656031501], [0.0457896117944481], [0.04581400770531792], [0.0458383055725665], [0.045862496695214035], [0.04588657239497275], [0.04591052401957542], [0.04593434294611569], [0.045958020584396714], [0.04598154838029], [0.04600491781910142], [0.04602812042894046], [0.046051147784095206], [0.04607399150840797], [0.0460966432786511], [0.04611909482790143], [0.04614133794891079], [0.0461633644974714], [0.04618516639577392], [0.04620673563575632], [0.046228064282442284], [0.04624914447726531], [0.046269968441380066], [0.04629052847895448], [0.04631081698044543], [0.04633082642585164], [0.046350549387945576], [0.046369978535479126], [0.04638910663636347], [0.04640792656082023], [0.046426431284501156], [0.04644461389157622], [0.04646246757778578], [0.04647998565345711], [0.046497161546481494], [0.046513988805250726], [0.046530461101551866], [0.04654657223341585], [0.04656231612792103], [0.046577686843947495], [0.0465926785748811], [0.04660728565126572], [0.04662150254340107], [0.04663532386388396], [0.046648744370094176], [0.04666175896661765], [0.04667436270761124], [0.046686550799102916], [0.04669831860122803], [0.04670966163039967], [0.04672057556141045], [0.04673105622946534], [0.04674109963214463], [0.04675070193129285], [0.046759859454835066], [0.046768568698518614], [0.046776826327577174], [0.04678462917831882], [0.04679197425963334], [0.04679885875442211], [0.04680528002094438], [0.04681123559408337], [0.0468167231865291], [0.04682174068987645], [0.04682628617563881], [0.0468303578961772], [0.04683395428554159], [0.04683707396022735], [0.046839715719840164], [0.04684187854768055], [0.04684356161123012], [0.04684476426255692], [0.046845486038628696], [0.04684572666153603]], "horizontal_stabilizer": [[0.008766337772672966], [0.00876641130003561], [0.008766631859768203], [0.008766999384820765], [0.008767513763448238], [0.00876817483923418], [0.008768982411111681], [0.008769936233393366], [0.008771036015810403], [0.008772281423555087], [0.00877367207733265], [0.008775207553419354], [0.008776887383727654], [0.008778711055878035], [0.008780678013279322], [0.008782787655215382], [0.008785039336938893], [0.008787432369774015], [0.00878996602122581], [0.008792639515096979], [0.008795452031614127], [0.008798402707560472], [0.00880149063641741], [0.008804714868514897], [0.008808074411189396], [0.008811568228951286], [0.008815195243660734], [0.008818954334712631], [0.008822844339230793], [0.008826864052271517], [0.00883101222703676], [0.008835287575096759], [0.00883968876662304], [0.008844214430631306], [0.008848863155234591], [0.008853633487907195], [0.008858523935759092], [0.008863532965821581], [0.008868659005343678], [0.008873900442100418], [0.00887925562471186], [0.008884722862975048], [0.008890300428206729], [0.008895986553599041], [0.008901779434587271], [0.00890767722923023], [0.00891367805860345], [0.008919780007205115], [0.008925981123375594], [0.008932279419729891], [0.00893867287360372], [0.008945159427513638], [0.008951736989630366], [0.008958403434266925], [0.008965156602380269], [0.008971994302088015], [0.008978914309198753], [0.008985914367758112], [0.008992992190608411], [0.009000145459964326], [0.009007371828002693], [0.009014668917467883], [0.009022034322292278], [0.009029465608231976], [0.009036960313517986], [0.009044515949522578], [0.009052130001441509], [0.009059799928991195], [0.009067523167121979], [0.009075297126746488], [0.009083119195483803], [0.009090986738418875], [0.009098897098877633], [0.00910684759921755], [0.009114835541633146], [0.009122858208977402], [0.00913091286559789], [0.009138996758188115], [0.009147107116653928], [0.009155241154994533], [0.009163396072198366], [0.009171569053153247], [0.009179757269570996], [0.00918795788092584], [0.009196168035407038], [0.009204384870884758], [0.00921260551588952], [0.009220827090604414], [0.009229046707870303], [0.009237261474203269], [0.009245468490824306], [0.009253664854700633], [0.009261847659598229], [0.009270013997145643], [0.009278160957908156], [0.009286285632471789], [0.00929438511253783], [0.009302456492025362], [0.009310496868183605], [0.009318503342712094], [0.009326473022888122], [0.009334403022702041], [0.00934229046399907], [0.009350132477626723], [0.009357926204588111], [0.009365668797200345], [0.00937335742025651], [0.009380989252192036], [0.009388561486253706], [0.00939607133167104], [0.009403516014829586], [0.009410892780445011], [0.009418198892737683], [0.009425431636606809], [0.009432588318803519], [0.009439666269102337], [0.009446662841469606], [0.00945357541522945], [0.009460401396224843], [0.009467138217974756], [0.009473783342825098], [0.00948033426309386], [0.009486788502208843], [0.0094931436158378], [0.009499397193009908], [0.00950554685722772], [0.00951159026756923], [0.009517525119778636], [0.009523349147345725], [0.009529060122572472], [0.009534655857626412], [0.009540134205580244], [0.009545493061436051], [0.00955073036313443], [0.009555844092547026], [0.009560832276451894], [0.009565692987491275], [0.009570424345110518], [0.00957502451647756], [0.009579491717383076], [0.009583824213118854], [0.009588020319335607], [0.009592078402878169], [0.009595996882598013], [0.009599774230142568], [0.00960340897072004], [0.009606899683839761], [0.009610245004027507], [0.009613443621514358], [0.00961649428289944], [0.009619395791785819], [0.009622147009388467], [0.009624746855114635], [0.009627194307115181], [0.009629488402807607], [0.009631628239368938], [0.009633612974199315], [0.009635441825355294], [0.00963711407195229], [0.00963862905453614], [0.009639986175423818], [0.009641184899012055], [0.009642224752054843], [0.009643105323907528], [0.009643826266741207], [0.009644387295721419], [0.009644788189156853], [0.009645028788614413], [0.009645108999001178]], "vertical_stabilizer": [[0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0]]}, "inviscid": [[0.04118022713873802], [0.04118044572039748], [0.04118110139686208], [0.04118219396264149], [0.04118372307527769], [0.04118568825543216], [0.04118808888697163], [0.04119092421708743], [0.04119419335644839], [0.04119789527937068], [0.04120202882402192], [0.041206592692650285], [0.041211585451840914], [0.041217005532798785], [0.04122285123166275], [0.04122912070984472], [0.041235811994396146], [0.041242922978406565], [0.04125045142142825], [0.041258394949928154], [0.04126675105777384], [0.04127551710674392], [0.041284690327069974], [0.041294267818010086], [0.04130424654844946], [0.04131462335753417], [0.04132539495533462], [0.041336557923540254], [0.0413481087161863], [0.041360043660412016], [0.041372358957251734], [0.04138505068245732], [0.041398114787355084], [0.04141154709973526], [0.04142534332477494], [0.04143949904599583], [0.041454009726255736], [0.04146887070877561], [0.041484077218200854], [0.041499624361699426], [0.041515507130093825], [0.04153172039903254], [0.041548258930194606], [0.041565117372533704], [0.04158229026355852], [0.04159977203065095], [0.04161755699242245], [0.041635639360108063], [0.04165401323900033], [0.04167267262992083], [0.041691611430731246], [0.04171082343788485], [0.04173030234801581], [0.04175004175957048], [0.04177003517447685], [0.041790275999856574], [0.0418107575497747], [0.04183147304703324], [0.04185241562500227], [0.04187357832949499], [0.04189495412068133], [0.0419165358750439], [0.04193831638737469], [0.041960288372812675], [0.041982444468922894], [0.042004777237815635], [0.04202727916830789], [0.04204994267812378], [0.04207276011613744], [0.04209572376465497], [0.04211882584173754], [0.04214205850356349], [0.04216541384683107], [0.042188883911200396], [0.0422124606817732], [0.04223613609161303], [0.04225990202430228], [0.04228375031653708], [0.04230767276075997], [0.04233166110782829], [0.042355707069719355], [0.04237980232227037], [0.04240393850795351], [0.042428107238684336], [0.042452300098664214], [0.04247650864725449], [0.04250072442188247], [0.04252493894097777], [0.04254914370693863], [0.04257333020912667], [0.04259748992688987], [0.042621614332611774], [0.04264569489478583], [0.04266972308111515], [0.04269369036163488], [0.042717588211855666], [0.042741408115930316], [0.042765141569836386], [0.042788780084579876], [0.04281231518941446], [0.042835738435074676], [0.042859041397024684], [0.042882215678719124], [0.042905252914873106], [0.04292814477474266], [0.04295088296541327], [0.042973459235092125], [0.042995865376406844], [0.043018093229705456], [0.04304013468635745], [0.04306198169205398], [0.04308362625010519], [0.043105060424732916], [0.043126276344357097], [0.04314726620487371], [0.04316802227292328], [0.04318853688914576], [0.0432088024714237], [0.043228811518107146], [0.043248556611222934], [0.04326803041966237], [0.04328722570234868], [0.04330613531137939], [0.043324752195144055], [0.043343069401414025], [0.043361080080402105], [0.04337877748779152], [0.04339615498773015], [0.04341320605579027], [0.04342992428188996], [0.043446303373175024], [0.04346233715686045], [0.04347801958302689], [0.04349334472737308], [0.04350830679392063], [0.04352290011766928], [0.04353711916720207], [0.043550958547237], [0.04356441300112359], [0.04357747741328517], [0.04359014681159992], [0.043602416369724575], [0.04361428140935529], [0.04362573740242521], [0.04363677997323816], [0.04364740490053458], [0.04365760811949015], [0.04366738572364571], [0.04367673396676461], [0.043685649264618744], [0.043694128196701355], [0.04370216750786361], [0.043709764109876474], [0.04371691508291339], [0.043723617676956594], [0.04372986931312165], [0.04373566758490274], [0.04374101025933649], [0.043745895278082154], [0.04375032075841903], [0.04375428499416043], [0.043757786456481686], [0.04376082379466428], [0.04376339583675031], [0.043765501590117446], [0.043767140241957554], [0.04376831115967557], [0.043769013891197694], [0.04376924816519102]], "total": [[0.04222714759869074], [0.0422273721068501], [0.04222804556097015], [0.042229167750029335], [0.04223073832235152], [0.042232756785695436], [0.04223522250734267], [0.042238134714220006], [0.04224149249305619], [0.042245294790556276], [0.04224954041361071], [0.04225422802953046], [0.042259356166309985], [0.04226492321291717], [0.04227092741961559], [0.0422773668983123], [0.04228423962293361], [0.04229154342983401], [0.04229927601823154], [0.04230743495067139], [0.04231601765352435], [0.042325021417510204], [0.04233444339825378], [0.042344280616872995], [0.042354529960595064], [0.04236518818340655], [0.042376251906733824], [0.04238771762015582], [0.042399581682149384], [0.042411840320867235], [0.04242448963494927], [0.04243752559436644], [0.042450944041299794], [0.04246474069105297], [0.042478911132999043], [0.042493450831563216], [0.04250835512723994], [0.04252361923764672], [0.042539238258612985], [0.04255520716530689], [0.04257152081339667], [0.042588173940252654], [0.04260516116618345], [0.04262247699571233], [0.042640115818891176], [0.042658071912653264], [0.04267633944220504], [0.04269491246245682], [0.042713784919494284], [0.04273295065208869], [0.04275240339324775], [0.04277213677180795], [0.042792144314065646], [0.04281241944545151], [0.04283295549224405], [0.042853745683326804], [0.0428747831519844], [0.04289606093774364], [0.04291757198825311], [0.04293930916120799], [0.042961265226314466], [0.04298343286729756], [0.04300580468395115], [0.0430283731942296], [0.04305113083638237], [0.04307406997112968], [0.04309718288388163], [0.04312046178699743], [0.0431438988220883], [0.04316748606236036], [0.04319121551500005], [0.04321507912359958], [0.04323906877062401], [0.04326317627991878], [0.04328739341925625], [0.04331171190292347], [0.04333612339434805], [0.04336061950876312], [0.04338519181591067], [0.043409831842782215], [0.043434531076396755], [0.043459280966614784], [0.043484072928988496], [0.04350889834764598], [0.043533748578210754], [0.043558614950753666], [0.04358348877277782], [0.04360836133223434], [0.043633223900569514], [0.0436580677358006], [0.043682884085621265], [0.043707664190533395], [0.04373239928700545], [0.043757080610656404], [0.04378169939946329], [0.04380624689699042], [0.04383071435564236], [0.04385509303993343], [0.043879374229779014], [0.04390354922380259], [0.04392760934265749], [0.0439515459323645], [0.04397535036766203], [0.043999014055365576], [0.04402252843773821], [0.04404588499586923], [0.0440690752530567], [0.04409209077819677], [0.04411492318917432], [0.0441375641562546], [0.044160005405474274], [0.04418223872202932], [0.04420425595365845], [0.044226049014019886], [0.044247609886059705], [0.04426893062537018], [0.04429000336353461], [0.044310820311459796], [0.04433137376268994], [0.044351656096704516], [0.04437165978219388], [0.04439137738031434], [0.04441080154791732], [0.044429925040753146], [0.04444874071664642], [0.044467241538640186], [0.044485420578108746], [0.04450327101783485], [0.04452078615505125], [0.04453795940444309], [0.04455478430110972], [0.04457125450348487], [0.04458736379621057], [0.044603106092966076], [0.044618475439247504], [0.04463346601509694], [0.044648072137779764], [0.04466228826440721], [0.04467610899450227], [0.044689529072509775], [0.044702543390243606], [0.04471514698927505], [0.04472733506325626], [0.04473910296017926], [0.044750446184568665], [0.04476136039960527], [0.04477184142918016], [0.044781885259878376], [0.04479148804288791], [0.04480064609583551], [0.04480935590454705], [0.0448176141247298], [0.044825417583577755], [0.044832763281295485], [0.04483964839254379], [0.04484607026780099], [0.04485202643464302], [0.04485751459893958], [0.044862532645964515], [0.044867078641420886], [0.044871150832380614], [0.04487474764813536], [0.04487786770096155], [0.04488050978679293], [0.04488267288581172], [0.04488435616294047], [0.04488555896825203], [0.04488628083728648], [0.044886521491276726]], "viscous": [[0.0010469204599527608], [0.0010469263864526421], [0.0010469441641081001], [0.0010469737873878705], [0.0010470152470738487], [0.0010470685302633035], [0.0010471336203710688], [0.0010472104971325934], [0.001047299136607837], [0.0010473995111856176], [0.0010475115895888104], [0.001047635336880212], [0.0010477707144690895], [0.0010479176801184123], [0.0010480761879528807], [0.0010482461884676094], [0.0010484276285375061], [0.0010486204514274786], [0.0010488245968033145], [0.001049040000743269], [0.0010492665957505323], [0.0010495043107663288], [0.0010497530711838375], [0.001050012798862932], [0.0010502834121456257], [0.001050564825872387], [0.001050856951399224], [0.0010511596966155871], [0.0010514729659631254], [0.0010517966604552448], [0.0010521306776975611], [0.0010524749119091526], [0.0010528292539447428], [0.0010531935913177383], [0.0010535678082241441], [0.0010539517855674217], [0.0010543454009842345], [0.001054748528871132], [0.0010551610404121716], [0.0010555828036075032], [0.0010560136833028659], [0.0010564535412201591], [0.0010569022359888823], [0.0010573596231786486], [0.0010578255553326825], [0.001058299882002332], [0.0010587824497826114], [0.0010592731023487756], [0.0010597716804939654], [0.0010602780221678823], [0.001060791962516544], [0.0010613133339231295], [0.0010618419660498686], [0.0010623776858810783], [0.001062920317767241], [0.0010634696834702557], [0.0010640256022097195], [0.0010645878907104209], [0.0010651563632508717], [0.0010657308317130391], [0.0010663111056331553], [0.0010668969922536969], [0.0010674882965764916], [0.0010680848214169605], [0.001068686367459517], [0.0010692927333140825], [0.001069903715573775], [0.001070519108873692], [0.0010711387059508836], [0.0010717622977054037], [0.001072389673262539], [0.0010730206200361147], [0.001073654923792951], [0.0010742923687184238], [0.0010749327374830915], [0.001075575811310464], [0.0010762213700458141], [0.0010768691922260635], [0.0010775190551507404], [0.0010781707349539547], [0.0010788240066774161], [0.0010794786443444502], [0.0010801344210350154], [0.0010807911089616795], [0.0010814484795465661], [0.0010821063034992125], [0.001082764350895359], [0.0010834223912565995], [0.001084080193630904], [0.001084737526673975], [0.0010853941587314125], [0.0010860498579216534], [0.0010867043922196506], [0.0010873575295412827], [0.0010880090378284516], [0.0010886586851347926], [0.0010893062397120767], [0.0010899514700970947], [0.0010905941451991742], [0.001091234034388159], [0.0010918709075828405], [0.001092504535339849], [0.001093134688942925], [0.0010937611404924965], [0.0010943836629955877], [0.001095002030455995], [0.001095616017964612], [0.001096225401789979], [0.0010968299594689094], [0.0010974294698971926], [0.0010980237134203172], [0.0010986124719241526], [0.0010991955289255564], [0.0010997726696628325], [0.001100343681186019], [0.0011009083524469306], [0.001101466474388886], [0.001102017840036138], [0.0011025622445828347], [0.001103099485481601], [0.0011036293625315335], [0.0011041516779657012], [0.0011046662365379568], [0.0011051728456091218], [0.0011056713152324182], [0.0011061614582381014], [0.0011066430903172667], [0.0011071160301047364], [0.0011075800992610078], [0.001108035122553166], [0.0011084809279347408], [0.0011089173466244443], [0.0011093442131837104], [0.0011097613655930158], [0.0011101686453269114], [0.0011105658974276994], [0.0011109529705777316], [0.001111329717170249], [0.0011116959933787152], [0.001112051659224641], [0.0011123965786437391], [0.0011127306195504957], [0.0011130536539010081], [0.0011133655577540776], [0.0011136662113305422], [0.0011139554990707292], [0.0011142333096900508], [0.0011144995362327003], [0.001114754076123335], [0.0011149968312167827], [0.0011152277078457199], [0.001115446616866234], [0.001115653473701313], [0.0011158481983821317], [0.0011160307155872239], [0.0011162009546793735], [0.0011163588497403096], [0.0011165043396031249], [0.0011166373678823793], [0.0011167578830018955], [0.0011168658382202242], [0.0011169611916537244], [0.0011170439062973014], [0.00111711395004266], [0.001117171295694311], [0.0011172159209829372], [0.0011172478085764964], [0.0011172669460888227], [0.0011172733260857435]], "oswald_efficiency_factor": [[0.5150341748150146], [0.515034327056509], [0.5150347837262506], [0.5150355446600624], [0.515036609584377], [0.5150379781163532], [0.5150396497640228], [0.5150416239264816], [0.5150438998941269], [0.5150464768489309], [0.5150493538647621], [0.515052529907746], [0.5150560038366692], [0.5150597744034209], [0.5150638402534833], [0.515068199926456], [0.5150728518566261], [0.5150777943735739], [0.5150830257028274], [0.5150885439665472], [0.5150943471842556], [0.5151004332736075], [0.5151068000511942], [0.515113445233391], [0.51512036643724], [0.51512756118137], [0.5151350268869582], [0.5151427608787196], [0.5151507603859438], [0.5151590225435566], [0.5151675443932264], [0.515176322884499], [0.5151853548759645], [0.5151946371364675], [0.5152041663463398], [0.5152139390986699], [0.5152239519006053], [0.5152342011746829], [0.5152446832601921], [0.5152553944145671], [0.5152663308148053], [0.5152774885589217], [0.5152888636674219], [0.5153004520848077], [0.5153122496811097], [0.5153242522534416], [0.5153364555275828], [0.5153488551595824], [0.5153614467373909], [0.5153742257825111], [0.5153871877516703], [0.515400328038519], [0.515413641975343], [0.5154271248348025], [0.5154407718316847], [0.5154545781246775], [0.5154685388181598], [0.515482648964009], [0.5154969035634235], [0.5155112975687627], [0.5155258258853971], [0.5155404833735794], [0.515555264850319], [0.5155701650912766], [0.5155851788326674], [0.5156003007731732], [0.515615525575867], [0.5156308478701442], [0.5156462622536663], [0.5156617632943049], [0.515677345532102], [0.5156930034812265], [0.515708731631945], [0.51572452445259], [0.5157403763915351], [0.5157562818791748], [0.5157722353299039], [0.5157882311440986], [0.5158042637101014], [0.5158203274062017], [0.5158364166026211], [0.5158525256634932], [0.5158686489488424], [0.5158847808165636], [0.515900915624393], [0.5159170477318782], [0.515933171502344], [0.5159492813048536], [0.5159653715161582], [0.5159814365226487], [0.5159974707222927], [0.5160134685265682], [0.5160294243623865], [0.5160453326740073], [0.5160611879249433], [0.5160769845998546], [0.5160927172064326], [0.5161083802772739], [0.516123968371736], [0.516139476077791], [0.516154898013854], [0.5161702288306096], [0.5161854632128133], [0.516200595881086], [0.5162156215936914], [0.5162305351482929], [0.5162453313837004], [0.5162600051815993], [0.5162745514682561], [0.5162889652162146], [0.5163032414459686], [0.5163173752276174], [0.5163313616825017], [0.5163451959848208], [0.5163588733632279], [0.5163723891024077], [0.5163857385446292], [0.5163989170912823], [0.5164119202043863], [0.516424743408084], [0.5164373822901045], [0.5164498325032114], [0.5164620897666202], [0.5164741498674008], [0.5164860086618445], [0.5164976620768187], [0.5165091061110897], [0.5165203368366194], [0.5165313503998431], [0.5165421430229157], [0.5165527110049352], [0.5165630507231374], [0.5165731586340666], [0.5165830312747182], [0.516592665263654], [0.5166020573020891], [0.5166112041749553], [0.5166201027519306], [0.5166287499884444], [0.5166371429266547], [0.5166452786963945], [0.5166531545160884], [0.5166607676936458], [0.5166681156273158], [0.5166751958065229], [0.5166820058126642], [0.5166885433198808], [0.5166948060958003], [0.5167007920022452], [0.5167064989959136], [0.5167119251290301], [0.5167170685499629], [0.5167219275038123], [0.5167265003329673], [0.5167307854776328], [0.5167347814763228], [0.5167384869663229], [0.5167419006841243], [0.5167450214658215], [0.5167478482474835], [0.5167503800654859], [0.5167526160568219], [0.5167545554593691], [0.5167561976121363], [0.5167575419554667], [0.5167585880312203], [0.5167593354829136], [0.5167597840558366], [0.5167599335971299]], "viscous_wings_drag": {"main_wing": [[0.0011841089096778533], [0.0011841155544917114], [0.0011841354868638893], [0.0011841687005876521], [0.0011842151853192016], [0.0011842749265801706], [0.0011843479057601011], [0.001184434100119888], [0.0011845334827961756], [0.0011846460228062711], [0.0011847716850540107], [0.0011849104303363832], [0.001185062215350922], [0.001185226992703872], [0.001185404710919252], [0.0011855953144486568], [0.0011857987436818445], [0.0011860149349582575], [0.0011862438205793016], [0.0011864853288214236], [0.0011867393839501816], [0.0011870059062350246], [0.0011872848119650007], [0.0011875760134653867], [0.0011878794191151122], [0.0011881949333651634], [0.0011885224567578549], [0.0011888618859470185], [0.0011892131137191566], [0.0011895760290154972], [0.0011899505169550518], [0.0011903364588585783], [0.0011907337322735847], [0.0011911422110002976], [0.001191561765118616], [0.0011919922610161226], [0.0011924335614170948], [0.0011928855254125681], [0.0011933480084914546], [0.00119382086257274], [0.0011943039360387065], [0.001194797073769361], [0.001195300117177836], [0.001195812904247], [0.0011963352695671674], [0.001196867044374946], [0.0011974080565932456], [0.0011979581308724345], [0.0011985170886327041], [0.0011990847481075837], [0.0011996609243886656], [0.0012002454294715522], [0.0012008380723029731], [0.001201438658829185], [0.0012020469920455401], [0.0012026628720473664], [0.0012032860960820009], [0.0012039164586021803], [0.001204553751320593], [0.0012051977632657732], [0.0012058482808392026], [0.0012065050878737175], [0.0012071679656931794], [0.0012078366931734118], [0.0012085110468044338], [0.00120919080075394], [0.00120987572693209], [0.0012105655950575246], [0.001211260172724707], [0.0012119592254724717], [0.001212662516853888], [0.0012133698085073248], [0.0012140808602288018], [0.0012147954300455732], [0.0012155132742909006], [0.001216234147680102], [0.0012169578033877615], [0.0012176839931261412], [0.0012184124672247872], [0.0012191429747112684], [0.0012198752633930817], [0.0012206090799406683], [0.0012213441699715456], [0.001222080278135509], [0.001222817148200913], [0.0012235545231419726], [0.0012242921452270945], [0.0012250297561081742], [0.0012257670969108608], [0.0012265039083257504], [0.0012272399307004796], [0.0012279749041326795], [0.0012287085685637547], [0.0012294406638734717], [0.0012301709299753138], [0.0012308991069125154], [0.0012316249349548652], [0.0012323481546960453], [0.0012330685071516685], [0.0012337857338578341], [0.0012344995769701776], [0.0012352097793634352], [0.0012359160847314238], [0.0012366182376873612], [0.0012373159838645498], [0.001238009070017355], [0.0012386972441223451], [0.0012393802554796773], [0.0012400578548145643], [0.0012407297943788204], [0.0012413958280524287], [0.001242055711445052], [0.0012427092019974596], [0.001243356059082782], [0.0012439960441075677], [0.0012446289206125628], [0.0012452544543731343], [0.0012458724134993553], [0.0012464825685355604], [0.0012470846925594743], [0.001247678561280678], [0.0012482639531385207], [0.0012488406493992524], [0.0012494084342524565], [0.0012499670949066342], [0.001250516421683892], [0.0012510562081136994], [0.0012515862510256192], [0.0012521063506409798], [0.00125261631066339], [0.0012531159383680672], [0.0012536050446899118], [0.0012540834443102397], [0.0012545509557421479], [0.0012550074014144375], [0.001255452607754017], [0.0012558864052667623], [0.0012563086286167453], [0.0012567191167037733], [0.0012571177127392392], [0.0012575042643201062], [0.0012578786235011151], [0.0012582406468650558], [0.0012585901955910821], [0.001258927135521061], [0.0012592513372238147], [0.0012595626760572875], [0.0012598610322285876], [0.0012601462908517734], [0.0012604183420034346], [0.0012606770807759996], [0.001260922407328679], [0.0012611542269360904], [0.0012613724500344188], [0.0012615769922652126], [0.00126176777451663], [0.0012619447229622284], [0.0012621077690972084], [0.0012622568497720691], [0.0012623919072236856], [0.0012625128891037756], [0.0012626197485047046], [0.0012627124439826703], [0.0012627909395781076], [0.0012628552048335837], [0.0012629052148087423], [0.0012629409500927132], [0.0012629623968137297], [0.0012629695466459681]], "horizontal_stabilizer": [[5.101334964655539e-05], [5.101380312185023e-05], [5.1015163411391805e-05], [5.101743010624499e-05], [5.102060252487507e-05], [5.102467971327991e-05], [5.102966044510286e-05], [5.103554322179623e-05], [5.104232627283476e-05], [5.1050007555947574e-05], [5.105858475740155e-05], [5.1068055292319e-05], [5.107841630503427e-05], [5.1089664669487226e-05], [5.1101796989663966e-05], [5.111480960007285e-05], [5.112869856625981e-05], [5.1143459685373826e-05], [5.1159088486770384e-05], [5.1175580232655174e-05], [5.11929299187833e-05], [5.1211132275193696e-05], [5.123018176699422e-05], [5.125007259519803e-05], [5.1270798697601995e-05], [5.129235374972095e-05], [5.131473116576967e-05], [5.1337924099698164e-05], [5.13619254462808e-05], [5.138672784225971e-05], [5.141232366754497e-05], [5.143870504647025e-05], [5.146586384910953e-05], [5.149379169265279e-05], [5.152247994284184e-05], [5.155191971547163e-05], [5.158210187795295e-05], [5.161301705094335e-05], [5.1644655610042325e-05], [5.167700768755842e-05], [5.1710063174341116e-05], [5.174381172169127e-05], [5.177824274333693e-05], [5.181334541748835e-05], [5.1849108688966726e-05], [5.188552127141058e-05], [5.192257164956031e-05], [5.1960248081621994e-05], [5.199853860171438e-05], [5.203743102239645e-05], [5.207691293727936e-05], [5.211697172372538e-05], [5.2157594545629446e-05], [5.219876835629328e-05], [5.224047990138356e-05], [5.228271572198492e-05], [5.232546215773825e-05], [5.236870535007829e-05], [5.241243124555689e-05], [5.245662559926693e-05], [5.250127397835669e-05], [5.254636176564206e-05], [5.2591874163315266e-05], [5.2637796196749946e-05], [5.268411271840584e-05], [5.273080841182951e-05], [5.277786779575672e-05], [5.282527522831102e-05], [5.2873014911305447e-05], [5.292107089464065e-05], [5.296942708080631e-05], [5.30180672294792e-05], [5.3066974962223954e-05], [5.311613376729327e-05], [5.3165527004525296e-05], [5.321513791034402e-05], [5.3264949602855825e-05], [5.331494508704466e-05], [5.336510726006614e-05], [5.341541891663705e-05], [5.346586275452187e-05], [5.351642138011316e-05], [5.3567077314107614e-05], [5.3617812997272204e-05], [5.3668610796304846e-05], [5.371945300978203e-05], [5.377032187419705e-05], [5.382119957008316e-05], [5.387206822822242e-05], [5.392290993593713e-05], [5.3973706743463e-05], [5.4024440670399886e-05], [5.407509371223858e-05], [5.412564784696356e-05], [5.417608504172559e-05], [5.422638725958206e-05], [5.427653646630773e-05], [5.43265146372618e-05], [5.43763037643219e-05], [5.442588586287156e-05], [5.447524297884022e-05], [5.4524357195796645e-05], [5.4573210642088964e-05], [5.4621785498024966e-05], [5.46700640030949e-05], [5.4718028463231386e-05], [5.476566125809645e-05], [5.48129448484018e-05], [5.485986178324982e-05], [5.490639470749593e-05], [5.4952526369125754e-05], [5.499823962664373e-05], [5.50435174564684e-05], [5.508834296033006e-05], [5.5132699372665805e-05], [5.517657006800895e-05], [5.5219938568363506e-05], [5.526278855056707e-05], [5.5305103853626904e-05], [5.5346868486035545e-05], [5.538806663305004e-05], [5.542868266393979e-05], [5.546870113918912e-05], [5.5508106817657114e-05], [5.554688466368492e-05], [5.5585019854146224e-05], [5.5622497785438144e-05], [5.565930408040384e-05], [5.5695424595185415e-05], [5.573084542599898e-05], [5.576555291582776e-05], [5.579953366103107e-05], [5.5832774517857784e-05], [5.5865262608865705e-05], [5.589698532923885e-05], [5.592793035299653e-05], [5.595808563909286e-05], [5.5987439437398766e-05], [5.6015980294561514e-05], [5.604369705974257e-05], [5.6070578890219306e-05], [5.609661525685605e-05], [5.612179594943341e-05], [5.6146111081833504e-05], [5.616955109707889e-05], [5.619210677221654e-05], [5.621376922304577e-05], [5.6234529908688575e-05], [5.625438063599107e-05], [5.627331356375907e-05], [5.629132120682353e-05], [5.6308396439926985e-05], [5.63245325014357e-05], [5.633972299686538e-05], [5.635396190222731e-05], [5.636724356718192e-05], [5.637956271800514e-05], [5.639091446036122e-05], [5.640129428187898e-05], [5.641069805453022e-05], [5.641912203681056e-05], [5.6426562875716257e-05], [5.643301760852001e-05], [5.6438483664335285e-05], [5.644295886548786e-05], [5.644644142866187e-05], [5.64489299658509e-05], [5.6450423485095864e-05], [5.645092139100924e-05]], "vertical_stabilizer": [[0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0]]}}, "miscellaneous": {"total_wetted_area": 882.8533112433041, "reference_area": 134.6, "total": [[0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712], [0.001023425308934712]], "trim_correction_factor": 1.02}, "untrimmed": [[0.05945773911575296], [0.05945796933463106], [0.05945865991894933], [0.05945981065181281], [0.059461421171758504], [0.05946349097284797], [0.059466019404759644], [0.059469005672916964], [0.05947244883865199], [0.059476347819388015], [0.059480701388857984], [0.05948550817735044], [0.059490766671984344], [0.05949647521701227], [0.05950263201415704], [0.059509235122975304], [0.05951628246125007], [0.05952377180541792], [0.059531700791023684], [0.059540066913204674], [0.05954886752721089], [0.05955809984895156], [0.059567760955575276], [0.05957784778608369], [0.0595883571419741], [0.05959928568791761], [0.05961062995246836], [0.05962238632880662], [0.05963455107551545], [0.05964712031739115], [0.059660090046288285], [0.059673456121998335], [0.05968721427316469], [0.05970136009823224], [0.05971588906643238], [0.05973079651880505], [0.0597460776692562], [0.0597617276056531], [0.05977774129095575], [0.059794113564387366], [0.059810839142640314], [0.05982791262112395], [0.05984532847524745], [0.059863081061744074], [0.059881164620033775], [0.0598995732736258], [0.05991830103156126], [0.059937341789895425], [0.05995668933322195], [0.05997633733623666], [0.059996279365343005], [0.060016508880299684], [0.06003701923590811], [0.0600578036837441], [0.06007885537392938], [0.060100167356947676], [0.060121732585500506], [0.06014354391640875], [0.060165594112553664], [0.06018787584486367], [0.060210381694341654], [0.06023310415413645], [0.06025603563165703], [0.060279168450729226], [0.06030249485379595], [0.06032600700415927], [0.06034969698826643], [0.06037355681803668], [0.06039757843323244], [0.06042175370387085], [0.06044607443267859], [0.06047053235758715], [0.06049511915427027], [0.06051982643872234], [0.06054464576987626], [0.06056956865226296], [0.060594586538709486], [0.060619690833076445], [0.060644872893034434], [0.06067012403287792], [0.0606954355263768], [0.060720798609664416], [0.060746204484161875], [0.060771644319536765], [0.06079710925669732], [0.06082259041081917], [0.06084807887440534], [0.06087356572037723], [0.060899042005197], [0.06092449877201884], [0.0609499270538698], [0.06097531787685725], [0.06100066226340262], [0.06102595123550091], [0.06105117581800373], [0.06107632704192384], [0.06110139594776355], [0.061126373588859306], [0.06115125103474809], [0.061176019374549244], [0.06120066972036094], [0.06122519321067219], [0.0612495810137871], [0.061273824331258255], [0.06129791440133075], [0.06132184250239396], [0.06134559995643699], [0.061369178132510374], [0.06139256845018866], [0.06141576238303361], [0.06143875146205636], [0.06146152727917566], [0.06148408149067141], [0.061506405820630806], [0.06152849206438549], [0.061550332091938054], [0.06157191785137441], [0.061593241372263165], [0.061614294769035516], [0.06163507024434868], [0.06165556009242602], [0.06167575670237606], [0.061695652561484626], [0.06171524025848081], [0.06173451248677377], [0.061753462047657214], [0.06177208185348179], [0.06179036493079085], [0.06180830442341963], [0.06182589359555416], [0.06184312583474881], [0.061859994654900934], [0.06187649369917834], [0.06189261674290053], [0.061908357696369785], [0.061923710607650305], [0.061938669665294675], [0.061953229201014176], [0.06196738369229137], [0.06198112776493566], [0.06199445619557467], [0.062007363914085546], [0.062019846005960104], [0.06203189771460423], [0.062043514443569675], [0.062054691758715426], [0.06206542539029813], [0.06207571123499094], [0.06208554535782613], [0.06209492399406317], [0.06210384355097999], [0.062112300609584774], [0.062120291926249224], [0.062127814434259125], [0.06213486524528506], [0.06214144165076738], [0.06214754112321851], [0.062153161317439844], [0.06215830007165124], [0.06216295540853394], [0.06216712553618628], [0.062170808848989303], [0.06217400392838496], [0.06217670954356022], [0.06217892465204834], [0.06218064840022926], [0.06218188012374652], [0.06218261934782969], [0.06218286578752381]], "trim_corrected_drag": [[0.060646893898068016], [0.06064712872132368], [0.06064783311732832], [0.060649006864849066], [0.06065064959519367], [0.06065276079230493], [0.06065533979285484], [0.06065838578637531], [0.06066189781542503], [0.06066587477577578], [0.060670315416635145], [0.06067521834089745], [0.06068058200542403], [0.06068640472135252], [0.060692684654440186], [0.06069941982543481], [0.06070660811047507], [0.060714247241526284], [0.06072233480684416], [0.06073086825146877], [0.06073984487775511], [0.06074926184593059], [0.06075911617468678], [0.06076940474180536], [0.06078012428481358], [0.06079127140167596], [0.06080284255151773], [0.06081483405538275], [0.06082724209702576], [0.06084006272373898], [0.06085329184721405], [0.060866925244438305], [0.06088095855862798], [0.06089538730019688], [0.06091020684776103], [0.06092541244918115], [0.060940999222641325], [0.06095696215776616], [0.060973296116774864], [0.06098999583567512], [0.061007055925493124], [0.06102447087354643], [0.061042235044752396], [0.061060342682978955], [0.06107878791243445], [0.06109756473909832], [0.061116667052192486], [0.061136088625693336], [0.06115582311988639], [0.0611758640829614], [0.061196204952649866], [0.061216839057905675], [0.061237759620626275], [0.06125895975741898], [0.06128043248140797], [0.06130217070408663], [0.06132416723721052], [0.061346414794736924], [0.06136890599480474], [0.06139163336176094], [0.061414589328228485], [0.06143776623721918], [0.061461156344290176], [0.06148475181974381], [0.06150854475087187], [0.061532527144242455], [0.06155669092803176], [0.06158102795439742], [0.06160553000189709], [0.06163018877794827], [0.06165499592133216], [0.06167994300473889], [0.06170502153735568], [0.06173022296749679], [0.06175553868527379], [0.061780960025308224], [0.061806478269483676], [0.061832084649737974], [0.061857770350895125], [0.06188352651353548], [0.06190934423690434], [0.0619352145818577], [0.061961128573845115], [0.0619870772059275], [0.062013051441831266], [0.062039042219035556], [0.06206504045189345], [0.062091037034784774], [0.06211702284530094], [0.062142988747459216], [0.062168925594947196], [0.062194824234394396], [0.06222067550867068], [0.062246470260210934], [0.06227219933436381], [0.06229785358276232], [0.062323423866718825], [0.062348901060636494], [0.06237427605544305], [0.062399539762040226], [0.062424683114768155], [0.06244969707488564], [0.06247457263406284], [0.06249930081788342], [0.06252387268935737], [0.06254827935244184], [0.06257251195556573], [0.06259656169516058], [0.06262041981919243], [0.06264407763069428], [0.06266752649129749], [0.06269075782475918], [0.06271376312048484], [0.06273653393704343], [0.0627590619056732], [0.06278133873377681], [0.0628033562084019], [0.06282510619970844], [0.06284658066441623], [0.06286777164923565], [0.06288867129427454], [0.06290927183642359], [0.06292956561271432], [0.06294954506365043], [0.06296920273650924], [0.06298853128861036], [0.06300752349055143], [0.06302617222940667], [0.06304447051188802], [0.06306241146746525], [0.0630799883514438], [0.06309719454799895], [0.06311402357316191], [0.06313046907775854], [0.06314652485029718], [0.06316218481980332], [0.06317744305860057], [0.06319229378503446], [0.0632067313661372], [0.06322075032023437], [0.06323434531948617], [0.06324751119236725], [0.0632602429260793], [0.06327253566889632], [0.06328438473244107], [0.06329578559388974], [0.0633067338981041], [0.06331722545969076], [0.06332725626498266], [0.06333682247394443], [0.06334592042199959], [0.06335454662177648], [0.06336269776477421], [0.06337037072294431], [0.06337756255019077], [0.06338427048378273], [0.06339049194568289], [0.06339622454378864], [0.06340146607308426], [0.06340621451670463], [0.06341046804691], [0.06341422502596909], [0.06341748400695266], [0.06342024373443143], [0.0634225031450893], [0.06342426136823384], [0.06342551772622146], [0.06342627173478628], [0.06342652310327429]], "spoiler_drag": 0.0, "drag_coefficient_increment": 0.0, "total": [[0.060646893898068016], [0.06064712872132368], [0.06064783311732832], [0.060649006864849066], [0.06065064959519367], [0.06065276079230493], [0.06065533979285484], [0.06065838578637531], [0.06066189781542503], [0.06066587477577578], [0.060670315416635145], [0.06067521834089745], [0.06068058200542403], [0.06068640472135252], [0.060692684654440186], [0.06069941982543481], [0.06070660811047507], [0.060714247241526284], [0.06072233480684416], [0.06073086825146877], [0.06073984487775511], [0.06074926184593059], [0.06075911617468678], [0.06076940474180536], [0.06078012428481358], [0.06079127140167596], [0.06080284255151773], [0.06081483405538275], [0.06082724209702576], [0.06084006272373898], [0.06085329184721405], [0.060866925244438305], [0.06088095855862798], [0.06089538730019688], [0.06091020684776103], [0.06092541244918115], [0.060940999222641325], [0.06095696215776616], [0.060973296116774864], [0.06098999583567512], [0.061007055925493124], [0.06102447087354643], [0.061042235044752396], [0.061060342682978955], [0.06107878791243445], [0.06109756473909832], [0.061116667052192486], [0.061136088625693336], [0.06115582311988639], [0.0611758640829614], [0.061196204952649866], [0.061216839057905675], [0.061237759620626275], [0.06125895975741898], [0.06128043248140797], [0.06130217070408663], [0.06132416723721052], [0.061346414794736924], [0.06136890599480474], [0.06139163336176094], [0.061414589328228485], [0.06143776623721918], [0.061461156344290176], [0.06148475181974381], [0.06150854475087187], [0.061532527144242455], [0.06155669092803176], [0.06158102795439742], [0.06160553000189709], [0.06163018877794827], [0.06165499592133216], [0.06167994300473889], [0.06170502153735568], [0.06173022296749679], [0.06175553868527379], [0.061780960025308224], [0.061806478269483676], [0.061832084649737974], [0.061857770350895125], [0.06188352651353548], [0.06190934423690434], [0.0619352145818577], [0.061961128573845115], [0.0619870772059275], [0.062013051441831266], [0.062039042219035556], [0.06206504045189345], [0.062091037034784774], [0.06211702284530094], [0.062142988747459216], [0.062168925594947196], [0.062194824234394396], [0.06222067550867068], [0.062246470260210934], [0.06227219933436381], [0.06229785358276232], [0.062323423866718825], [0.062348901060636494], [0.06237427605544305], [0.062399539762040226], [0.062424683114768155], [0.06244969707488564], [0.06247457263406284], [0.06249930081788342], [0.06252387268935737], [0.06254827935244184], [0.06257251195556573], [0.06259656169516058], [0.06262041981919243], [0.06264407763069428], [0.06266752649129749], [0.06269075782475918], [0.06271376312048484], [0.06273653393704343], [0.0627590619056732], [0.06278133873377681], [0.0628033562084019], [0.06282510619970844], [0.06284658066441623], [0.06286777164923565], [0.06288867129427454], [0.06290927183642359], [0.06292956561271432], [0.06294954506365043], [0.06296920273650924], [0.06298853128861036], [0.06300752349055143], [0.06302617222940667], [0.06304447051188802], [0.06306241146746525], [0.0630799883514438], [0.06309719454799895], [0.06311402357316191], [0.06313046907775854], [0.06314652485029718], [0.06316218481980332], [0.06317744305860057], [0.06319229378503446], [0.0632067313661372], [0.06322075032023437], [0.06323434531948617], [0.06324751119236725], [0.0632602429260793], [0.06327253566889632], [0.06328438473244107], [0.06329578559388974], [0.0633067338981041], [0.06331722545969076], [0.06332725626498266], [0.06333682247394443], [0.06334592042199959], [0.06335454662177648], [0.06336269776477421], [0.06337037072294431], [0.06337756255019077], [0.06338427048378273], [0.06339049194568289], [0.06339622454378864], [0.06340146607308426], [0.06340621451670463], [0.06341046804691], [0.06341422502596909], [0.06341748400695266], [0.06342024373443143], [0.0634225031450893], [0.06342426136823384], [0.06342551772622146], [0.06342627173478628], [0.06342652310327429]]}}, "stability": {"static": {"Cm_alpha": [[-15.685562161238497], [-15.685562250523226], [-15.685562518346956], [-15.68556296461827], [-15.68556358918486], [-15.685564391833559], [-15.685565372290405], [-15.685566530220726], [-15.685567865229274], [-15.685569376860315], [-15.685571064597777], [-15.68557292786544], [-15.685574966027083], [-15.685577178386723], [-15.685579564188803], [-15.685582122618435], [-15.68558485280169], [-15.685587753805834], [-15.685590824639647], [-15.685594064253735], [-15.685597471540849], [-15.68560104533627], [-15.685604784418139], [-15.685608687507877], [-15.685612753270568], [-15.685616980315412], [-15.685621367196138], [-15.685625912411485], [-15.685630614405689], [-15.685635471568954], [-15.685640482237993], [-15.685645644696546], [-15.68565095717593], [-15.685656417855629], [-15.685662024863845], [-15.685667776278127], [-15.685673670125976], [-15.685679704385485], [-15.685685876986007], [-15.685692185808797], [-15.68569862868771], [-15.68570520340992], [-15.685711907716602], [-15.685718739303706], [-15.685725695822672], [-15.685732774881227], [-15.685739974044132], [-15.685747290834009], [-15.685754722732131], [-15.685762267179253], [-15.685769921576462], [-15.685777683286009], [-15.6857855496322], [-15.685793517902269], [-15.68580158534727], [-15.685809749182983], [-15.685818006590857], [-15.685826354718927], [-15.685834790682748], [-15.685843311566394], [-15.685851914423406], [-15.68586059627776], [-15.685869354124904], [-15.685878184932726], [-15.685887085642598], [-15.685896053170381], [-15.68590508440749], [-15.685914176221928], [-15.685923325459328], [-15.685932528944065], [-15.685941783480281], [-15.68595108585302], [-15.68596043282928], [-15.685969821159144], [-15.685979247576881], [-15.685988708802054], [-15.685998201540666], [-15.686007722486266], [-15.686017268321105], [-15.686026835717275], [-15.686036421337853], [-15.686046021838067], [-15.686055633866427], [-15.686065254065937], [-15.686074879075218], [-15.686084505529688], [-15.686094130062763], [-15.686103749307001], [-15.686113359895298], [-15.686122958462075], [-15.686132541644447], [-15.686142106083413], [-15.686151648425042], [-15.686161165321671], [-15.68617065343306], [-15.686180109427603], [-15.686189529983515], [-15.686198911789987], [-15.686208251548386], [-15.686217545973435], [-15.686226791794383], [-15.68623598575617], [-15.686245124620616], [-15.686254205167565], [-15.686263224196047], [-15.686272178525453], [-15.686281064996656], [-15.686289880473183], [-15.686298621842326], [-15.686307286016284], [-15.6863158699333], [-15.686324370558744], [-15.686332784886254], [-15.68634110993882], [-15.686349342769862], [-15.686357480464327], [-15.68636552013976], [-15.686373458947344], [-15.686381294072973], [-15.686389022738265], [-15.686396642201615], [-15.686404149759191], [-15.686411542745926], [-15.686418818536538], [-15.686425974546463], [-15.68643300823286], [-15.686439917095505], [-15.686446698677784], [-15.686453350567554], [-15.686459870398078], [-15.686466255848888], [-15.686472504646684], [-15.686478614566141], [-15.686484583430804], [-15.686490409113834], [-15.686496089538867], [-15.686501622680765], [-15.686507006566394], [-15.686512239275359], [-15.68651731894072], [-15.686522243749732], [-15.686527011944477], [-15.686531621822592], [-15.686536071737859], [-15.686540360100853], [-15.68654448537955], [-15.686548446099899], [-15.6865522408464], [-15.686555868262595], [-15.686559327051647], [-15.68656261597679], [-15.686565733861816], [-15.686568679591517], [-15.686571452112126], [-15.686574050431695], [-15.686576473620487], [-15.686578720811333], [-15.686580791199972], [-15.686582684045323], [-15.686584398669815], [-15.6865859344596], [-15.686587290864846], [-15.68658846739988], [-15.686589463643418], [-15.686590279238725], [-15.686590913893724], [-15.686591367381144], [-15.686591639538577], [-15.686591730268546]], "Cm0": [[0.5640200132060655], [0.5640200163226932], [0.5640200256715124], [0.5640200412493326], [0.5640200630508369], [0.5640200910685843], [0.564020125293012], [0.5640201657124378], [0.5640202123130648], [0.5640202650789844], [0.5640203239921832], [0.5640203890325465], [0.5640204601778664], [0.5640205374038482], [0.5640206206841182], [0.5640207099902315], [0.564020805291682], [0.5640209065559112], [0.564021013748319], [0.5640211268322743], [0.5640212457691274], [0.5640213705182213], [0.5640215010369054], [0.5640216372805485], [0.5640217792025539], [0.5640219267543726], [0.5640220798855207], [0.5640222385435942], [0.5640224026742866], [0.5640225722214053], [0.5640227471268907], [0.5640229273308339], [0.5640231127714963], [0.5640233033853298], [0.5640234991069962], [0.5640236998693892], [0.5640239056036556], [0.5640241162392177], [0.5640243317037958], [0.564024551923432], [0.5640247768225135], [0.5640250063237977], [0.5640252403484373], [0.5640254788160051], [0.5640257216445211], [0.5640259687504791], [0.5640262200488734], [0.5640264754532266], [0.5640267348756189], [0.5640269982267156], [0.5640272654157976], [0.5640275363507898], [0.5640278109382928], [0.5640280890836133], [0.5640283706907948], [0.5640286556626495], [0.5640289439007915], [0.5640292353056681], [0.5640295297765934], [0.5640298272117823], [0.5640301275083837], [0.5640304305625148], [0.5640307362692967], [0.5640310445228889], [0.564031355216525], [0.564031668242548], [0.5640319834924479], [0.564032300856897], [0.5640326202257873], [0.5640329414882683], [0.5640332645327838], [0.5640335892471102], [0.5640339155183944], [0.5640342432331931], [0.5640345722775102], [0.5640349025368372], [0.5640352338961914], [0.5640355662401563], [0.5640358994529202], [0.564036233418317], [0.5640365680198663], [0.5640369031408132], [0.5640372386641689], [0.5640375744727515], [0.5640379104492269], [0.5640382464761492], [0.5640385824360021], [0.5640389182112395], [0.5640392536843275], [0.5640395887377849], [0.5640399232542247], [0.5640402571163958], [0.5640405902072237], [0.5640409224098528], [0.5640412536076869], [0.5640415836844306], [0.5640419125241316], [0.5640422400112208], [0.5640425660305545], [0.5640428904674543], [0.5640432132077495], [0.5640435341378173], [0.5640438531446235], [0.5640441701157632], [0.5640444849395018], [0.5640447975048146], [0.5640451077014275], [0.5640454154198566], [0.564045720551448], [0.564046022988417], [0.5640463226238879], [0.5640466193519321], [0.5640469130676078], [0.5640472036669975], [0.5640474910472463], [0.5640477751065993], [0.5640480557444397], [0.5640483328613254], [0.5640486063590251], [0.5640488761405551], [0.564049142110215], [0.5640494041736234], [0.5640496622377519], [0.5640499162109605], [0.5640501660030312], [0.5640504115252014], [0.5640506526901976], [0.5640508894122671], [0.5640511216072105], [0.5640513491924128], [0.5640515720868744], [0.5640517902112422], [0.5640520034878376], [0.5640522118406875], [0.5640524151955517], [0.5640526134799514], [0.5640528066231956], [0.5640529945564088], [0.5640531772125568], [0.5640533545264709], [0.5640535264348742], [0.564053692876404], [0.5640538537916362], [0.5640540091231074], [0.5640541588153358], [0.5640543028148437], [0.564054441070177], [0.5640545735319253], [0.5640547001527396], [0.5640548208873513], [0.5640549356925891], [0.564055044527396], [0.5640551473528432], [0.5640552441321478], [0.564055334830684], [0.5640554194159979], [0.5640554978578198], [0.5640555701280752], [0.5640556362008957], [0.5640556960526297], [0.5640557496618499], [0.5640557970093631], [0.5640558380782164], [0.5640558728537044], [0.5640559013233744], [0.5640559234770309], [0.5640559393067409], [0.5640559488068351], [0.564055951973911]], "CM": [[-1.2089688844592297], [-1.208974853334597], [-1.208992757995321], [-1.2090225925468108], [-1.2090643471659748], [-1.2091180081043809], [-1.2091835576916838], [-1.2092609743402805], [-1.2093502325511905], [-1.2094513029207032], [-1.2095641521482556], [-1.2096887430453025], [-1.2098250345452222], [-1.2099729817142366], [-1.2101325357634707], [-1.2103036440619848], [-1.210486250150827], [-1.2106802937582375], [-1.2108857108158326], [-1.2111024334757963], [-1.2113303901292534], [-1.2115695054255666], [-1.2118197002927305], [-1.2120808919588626], [-1.2123529939746667], [-1.2126359162370193], [-1.2129295650135716], [-1.2132338429684189], [-1.2135486491888272], [-1.213873879213017], [-1.2142094250590048], [-1.2145551752544799], [-1.214911014867772], [-1.2152768255398572], [-1.2156524855174098], [-1.216037869686934], [-1.2164328496099275], [-1.2168372935591232], [-1.2172510665557548], [-1.2176740304079137], [-1.2181060437498947], [-1.2185469620826805], [-1.2189966378153785], [-1.2194549203077678], [-1.2199216559138608], [-1.22039668802651], [-1.2208798571230526], [-1.2213710008119705], [-1.2218699538806166], [-1.2223765483439253], [-1.2228906134941546], [-1.2234119759516713], [-1.2239404597166894], [-1.2244758862220704], [-1.2250180743870684], [-1.2255668406721183], [-1.226121999134541], [-1.2266833614853052], [-1.2272507371466597], [-1.2278239333108225], [-1.2284027549995387], [-1.228987005124616], [-1.2295764845493877], [-1.2301709921510762], [-1.2307703248840842], [-1.2313742778441492], [-1.2319826443334205], [-1.2325952159263536], [-1.2332117825365034], [-1.2338321324841317], [-1.234456052564643], [-1.235083328117829], [-1.2357137430979046], [-1.2363470801443308], [-1.2369831206533597], [-1.2376216448503605], [-1.2382624318628392], [-1.2389052597941554], [-1.2395499057979382], [-1.2401961461531377], [-1.2408437563397294], [-1.2414925111150212], [-1.24214218459056], [-1.242792550309591], [-1.2434433813250805], [-1.2440944502782387], [-1.2447455294775462], [-1.2453963909782289], [-1.2460468066621884], [-1.2466965483183294], [-1.2473453877232865], [-1.2479930967224846], [-1.2486394473115277], [-1.249284211717894], [-1.249927162482884], [-1.2505680725437769], [-1.251206715316252], [-1.2518428647768831], [-1.2524762955458493], [-1.25310678296972], [-1.253734103204264], [-1.2543580332973492], [-1.254978351271822], [-1.255594836208321], [-1.2562072683280365], [-1.256815429075381], [-1.2574191012004545], [-1.2580180688413798], [-1.258612117606388], [-1.259201034655643], [-1.2597846087827842], [-1.260362630496112], [-1.2609348920994143], [-1.2615011877723696], [-1.2620613136504995], [-1.2626150679046415], [-1.2631622508198563], [-1.2637026648738154], [-1.2642361148145238], [-1.2647624077374433], [-1.2652813531618907], [-1.265792763106731], [-1.2662964521652835], [-1.2667922375794383], [-1.2672799393129188], [-1.267759380123659], [-1.2682303856352621], [-1.268692784407489], [-1.2691464080057568], [-1.2695910910695891], [-1.2700266713799861], [-1.2704529899257127], [-1.2708698909683847], [-1.2712772221064155], [-1.27167483433771], [-1.2720625821211096], [-1.2724403234365538], [-1.272807919843898], [-1.2731652365403567], [-1.2735121424166103], [-1.2738485101114012], [-1.2741742160647385], [-1.2744891405695744], [-1.274793167821965], [-1.2750861859697005], [-1.2753680871593205], [-1.2756387675815413], [-1.2758981275150665], [-1.276146071368688], [-1.2763825077217343], [-1.2766073493628105], [-1.276820513326774], [-1.2770219209299907], [-1.2772114978037639], [-1.2773891739260201], [-1.2775548836511197], [-1.2777085657378688], [-1.2778501633756754], [-1.2779796242088057], [-1.278096900358768], [-1.2782019484448213], [-1.278294729602532], [-1.2783752095004535], [-1.278443358354772], [-1.2784991509422041], [-1.278542566610684], [-1.278573589288301], [-1.2785922074901968], [-1.2785984143234723]], "Cn_beta": [[0.16361467263890994], [0.16361470582009932], [0.16361480535220244], [0.16361497120082974], [0.16361520330867707], [0.16361550159554616], [0.16361586595837016], [0.1636162962712484], [0.16361679238548896], [0.1636173541296568], [0.16361798130963232], [0.16361867370867533], [0.16361943108749716], [0.1636202531843406], [0.16362113971506734], [0.16362209037325257], [0.1636231048302868], [0.16362418273548648], [0.16362532371620986], [0.1636265273779822], [0.1636277933046269], [0.16362912105840496], [0.1636305101801608], [0.16363196018947626], [0.16363347058483024], [0.16363504084376798], [0.16363667042307398], [0.16363835875895527], [0.1636401052672296], [0.16364190934352096], [0.16364377036346267], [0.1636456876829062], [0.16364766063813727], [0.16364968854609926], [0.1636517707046214], [0.1636539063926558], [0.16365609487051935], [0.16365833538014193], [0.16366062714532267], [0.16366296937199018], [0.16366536124847064], [0.16366780194576125], [0.16367029061781005], [0.16367282640180109], [0.1636754084184457], [0.16367803577228085], [0.16368070755196992], [0.16368342283061285], [0.16368618066605936], [0.1636889801012279], [0.1636918201644305], [0.16369469986970261], [0.16369761821713766], [0.1637005741932269], [0.16370356677120393], [0.16370659491139455], [0.16370965756157074], [0.16371275365730867], [0.16371588212235294], [0.16371904186898276], [0.16372223179838447], [0.1637254508010271], [0.16372869775704169], [0.16373197153660501], [0.16373527100032734], [0.16373859499964216], [0.16374194237720197], [0.16374531196727476], [0.1637487025961456], [0.1637521130825204], [0.16375554223793298], [0.16375898886715476], [0.16376245176860746], [0.16376592973477774], [0.1637694215526351], [0.16377292600405144], [0.1637764418662225], [0.16377996791209257], [0.16378350291077937], [0.16378704562800206], [0.1637905948265096], [0.16379414926651192], [0.163797707706111], [0.16380126890173363], [0.16380483160856557], [0.16380839458098578], [0.16381195657300196], [0.16381551633868602], [0.16381907263261006], [0.1638226242102834], [0.16382616982858847], [0.16382970824621682], [0.16383323822410623], [0.1638367585258753], [0.16384026791825895], [0.16384376517154306], [0.1638472490599976], [0.1638507183623093], [0.16385417186201298], [0.16385760834792173], [0.16386102661455462], [0.16386442546256416], [0.1638678036991618], [0.16387116013853947], [0.16387449360229184], [0.16387780291983448], [0.16388108692882017], [0.16388434447555217], [0.16388757441539584], [0.1638907756131854], [0.16389394694363066], [0.1638970872917168], [0.1639001955531042], [0.16390327063452248], [0.16390631145416198], [0.16390931694206184], [0.16391228604049174], [0.16391521770433298], [0.16391811090145295], [0.1639209646130755], [0.16392377783414763], [0.1639265495737006], [0.163929278855207], [0.16393196471693236], [0.16393460621228112], [0.16393720241013957], [0.16393975239521005], [0.1639422552683429], [0.16394471014686066], [0.16394711616487737], [0.16394947247361202], [0.1639517782416958], [0.16395403265547293], [0.16395623491929595], [0.16395838425581422], [0.16396047990625534], [0.1639625211307017], [0.16396450720835834], [0.1639664374378153], [0.16396831113730245], [0.16397012764493743], [0.16397188631896703], [0.16397358653800018], [0.16397522770123463], [0.16397680922867613], [0.16397833056134897], [0.163979791161501], [0.16398119051279883], [0.16398252812051714], [0.16398380351171848], [0.16398501623542633], [0.16398616586279036], [0.16398725198724204], [0.1639882742246443], [0.16398923221343154], [0.16399012561474174], [0.16399095411254075], [0.16399171741373755], [0.16399241524829208], [0.16399304736931336], [0.1639936135531502], [0.16399411359947372], [0.1639945473313497], [0.16399491459530402], [0.1639952152613784], [0.16399544922317857], [0.16399561639791307], [0.16399571672642319], [0.16399575017320533]], "static_margin": [[3.502083812106401], [3.502083785211825], [3.5020837045372706], [3.5020835701102517], [3.502083381976623], [3.5020831402005563], [3.5020828448645243], [3.502082496069271], [3.502082093933788], [3.5020816385952704], [3.502081130209071], [3.502080568948661], [3.502079955005565], [3.50207928858931], [3.5020785699273493], [3.502077799264998], [3.502076976865356], [3.5020761030092165], [3.502075177994987], [3.502074202138588], [3.5020731757733565], [3.502072099249941], [3.5020709729361847], [3.5020697972170156], [3.50206857249432], [3.502067299186817], [3.5020659777299215], [3.50206460857561], [3.5020631921922765], [3.502061729064577], [3.5020602196932824], [3.502058664595114], [3.5020570643025777], [3.502055419363796], [3.5020537303423316], [3.502051997817004], [3.502050222381706], [3.502048404645212], [3.5020465452309812], [3.502044644776956], [3.50204270393536], [3.5020407233724797], [3.5020387037684535], [3.502036645817053], [3.502034550225452], [3.502032417714002], [3.502030249015992], [3.502028044877414], [3.502025806056719], [3.5020235333245657], [3.5020212274635716], [3.502018889268053], [3.502016519543765], [3.50201411910764], [3.5020116887875106], [3.502009229421844], [3.5020067418594594], [3.502004226959252], [3.5020016855898994], [3.5019991186295827], [3.501996526965691], [3.5019939114945156], [3.501991273120969], [3.501988612758266], [3.501985931327625], [3.5019832297579576], [3.501980508985555], [3.501977769953774], [3.5019750136127152], [3.5019722409189074], [3.5019694528349747], [3.501966650329319], [3.501963834375787], [3.5019610059533344], [3.501958166045698], [3.501955315641055], [3.5019524557316886], [3.5019495873136393], [3.5019467113863723], [3.501943828952427], [3.501940941017072], [3.5019380485879603], [3.501935152674775], [3.5019322542888838], [3.5019293544429853], [3.5019264541507518], [3.5019235544264884], [3.50192065628476], [3.5019177607400525], [3.5019148688064075], [3.5019119814970665], [3.50190909982412], [3.50190622479814], [3.5019033574278335], [3.501900498719678], [3.501897649677566], [3.5018948113024524], [3.5018919845919925], [3.5018891705401836], [3.501886370137021], [3.5018835843681346], [3.501880814214437], [3.501878060651773], [3.5018753246505656], [3.5018726071754678], [3.501869909185019], [3.501867231631286], [3.5018645754595314], [3.5018619416078636], [3.501859331006895], [3.501856744579409], [3.5018541832400163], [3.5018516478948243], [3.5018491394411106], [3.5018466587669845], [3.501844206751066], [3.501841784262166], [3.50183939215896], [3.5018370312896767], [3.5018347024917826], [3.501832406591675], [3.5018301444043733], [3.5018279167332125], [3.501825724369559], [3.5018235680925014], [3.5018214486685686], [3.5018193668514423], [3.501817323381677], [3.501815318986419], [3.5018133543791405], [3.5018114302593673], [3.5018095473124204], [3.501807706209156], [3.5018059076057155], [3.5018041521432743], [3.501802440447804], [3.5018007731298413], [3.501799150784244], [3.5017975739899803], [3.5017960433099], [3.5017945592905284], [3.501793122461855], [3.5017917333371322], [3.5017903924126847], [3.5017891001677155], [3.501787857064129], [3.5017866635463495], [3.5017855200411603], [3.501784426957531], [3.501783384686468], [3.501782393600868], [3.5017814540553642], [3.501780566386204], [3.501779730911113], [3.501778947929176], [3.5017782177207204], [3.501777540547209], [3.5017769166511465], [3.501776346255975], [3.5017758295659998], [3.501775366766301], [3.5017749580226742], [3.5017746034815525], [3.5017743032699626], [3.501774057495471], [3.5017738662461424], [3.501773729590507], [3.5017736475775325], [3.501773620236608]], "neutral_point": [[31.340522519034277, 16.030644029034278, 15.550404639034278], [31.340522395925465, 16.030643905925466, 15.550404515925466], [31.340522026641022, 16.030643536641023, 15.550404146641023], [31.340521411306895, 16.030642921306896, 15.550403531306896], [31.34052055013298, 16.03064206013298, 15.55040267013298], [31.34051944341302, 16.03064095341302, 15.55040156341302], [31.340518091524526, 16.030639601524527, 15.550400211524527], [31.34051649492866, 16.03063800492866, 15.550398614928662], [31.340514654170093, 16.030636164170094, 15.550396774170094], [31.340512569876832, 16.030634079876833, 15.550394689876834], [31.340510242759997, 16.030631752759998, 15.550392362759998], [31.340507673613647, 16.030629183613648, 15.550389793613649], [31.34050486331448, 16.03062637331448, 15.55038698331448], [31.340501812821593, 16.030623322821594, 15.550383932821594], [31.340498523176144, 16.030620033176145, 15.550380643176146], [31.340494995501057, 16.030616505501058, 15.550377115501059], [31.34049123100066, 16.03061274100066, 15.55037335100066], [31.340487230960267, 16.030608740960268, 15.550369350960269], [31.340482996745827, 16.030604506745828, 15.550365116745828], [31.340478529803462, 16.030600039803463, 15.550360649803464], [31.340473831659, 16.030595341659, 15.550355951659002], [31.340468903917518, 16.03059041391752, 15.55035102391752], [31.340463748262813, 16.030585258262814, 15.550345868262815], [31.34045836645687, 16.03057987645687, 15.55034048645687], [31.340452760339303, 16.030574270339304, 15.550334880339305], [31.34044693182679, 16.03056844182679, 15.550329051826791], [31.34044088291242, 16.030562392912422, 15.550323002912423], [31.340434615665103, 16.030556125665104, 15.550316735665104], [31.340428132228883, 16.030549642228884, 15.550310252228885], [31.34042143482226, 16.030542944822262, 15.550303554822262], [31.34041452573749, 16.03053603573749, 15.550296645737491], [31.340407407339843, 16.030528917339844, 15.550289527339844], [31.340400082066843, 16.030521592066844, 15.550282202066844], [31.3403925524275, 16.0305140624275, 15.5502746724275], [31.340384821001493, 16.030506331001494, 15.550266941001494], [31.340376890438353, 16.030498400438354, 15.550259010438355], [31.340368763456596, 16.030490273456596, 15.550250883456597], [31.340360442842858, 16.03048195284286, 15.55024256284286], [31.340351931451004, 16.030473441451004, 15.550234051451005], [31.34034323220118, 16.030464742201183, 15.550225352201183], [31.340334348078926, 16.030455858078927, 15.550216468078927], [31.340325282134128, 16.03044679213413, 15.550207402134129], [31.3403160374801, 16.0304375474801, 15.550198157480102], [31.340306617292548, 16.03042812729255, 15.55018873729255], [31.340297024808535, 16.030418534808536, 15.550179144808537], [31.340287263325433, 16.030408773325433, 15.550169383325434], [31.34027733619985, 16.03039884619985, 15.550159456199852], [31.340267246846533, 16.030388756846534, 15.550149366846535], [31.340256998737253, 16.030378508737254, 15.550139118737254], [31.340246595399677, 16.030368105399678, 15.550128715399678], [31.340236040416197, 16.0303575504162, 15.550118160416199], [31.34022533742277, 16.03034684742277, 15.55010745742277], [31.3402144901077, 16.030336000107702, 15.550096610107703], [31.340203502210468, 16.03032501221047, 15.550085622210469], [31.340192377520435, 16.030313887520435, 15.550074497520436], [31.340181119875655, 16.030302629875656, 15.550063239875657], [31.340169733161567, 16.030291243161567, 15.550051853161568], [31.340158221309725, 16.030279731309726, 15.550040341309726], [31.34014658829646, 16.03026809829646, 15.55002870829646], [31.340134838141612, 16.030256348141613, 15.550016958141613], [31.340122974907175, 16.030244484907175, 15.550005094907176], [31.340111002695874, 16.030232512695875, 15.549993122695875], [31.34009892564992, 16.03022043564992, 15.54998104564992], [31.340086747949506, 16.030208257949507, 15.549968867949508], [31.34007447381148, 16.03019598381148, 15.549956593811482], [31.340062107487892, 16.030183617487893, 15.549944227487893], [31.340049653264575, 16.030171163264576, 15.549931773264577], [31.340037115459708, 16.03015862545971, 15.54991923545971], [31.340024498422334, 16.030146008422335, 15.549906618422336], [31.34001180653093, 16.030133316530932, 15.549893926530933], [31.339999044191863, 16.030120554191864, 15.549881164191865], [31.339986215837957, 16.030107725837958, 15.549868335837958], [31.33997332592695, 16.030094835926953, 15.549855445926953], [31.339960378939974, 16.030081888939975, 15.549842498939975], [31.339947379380046, 16.030068889380047, 15.549829499380047], [31.339934331770504, 16.030055841770505, 15.549816451770505], [31.339921240653478, 16.03004275065348, 15.54980336065348], [31.33990811058831, 16.030029620588312, 15.549790230588313], [31.33989494615001, 16.030016456150012, 15.549777066150012], [31.339881751927656, 16.030003261927657, 15.549763871927658], [31.33986853252283, 16.02999004252283, 15.54975065252283], [31.339855292548016, 16.029976802548017, 15.549737412548017], [31.339842036624997, 16.029963546624998, 15.549724156624999], [31.33982876938327, 16.02995027938327, 15.549710889383272], [31.33981549545842, 16.02993700545842, 15.549697615458422], [31.339802219490494, 16.029923729490495, 15.549684339490495], [31.33978894612242, 16.029910456122423, 15.549671066122423], [31.339775679998343, 16.029897189998344, 15.549657799998345], [31.339762425762018, 16.02988393576202, 15.54964454576202], [31.33974918805518, 16.02987069805518, 15.549631308055181], [31.339735971515907, 16.029857481515908, 15.549618091515908], [31.339722780776995, 16.029844290776996, 15.549604900776997], [31.339709620464298, 16.0298311304643, 15.5495917404643], [31.339696495195128, 16.02981800519513, 15.549578615195129], [31.3396834095766, 16.029804919576602, 15.549565529576602], [31.339670368203986, 16.029791878203987, 15.549552488203988], [31.339657375659115, 16.029778885659116, 15.549539495659117], [31.339644436508717, 16.029765946508718, 15.549526556508718], [31.33963155530277, 16.02975306530277, 15.549513675302771], [31.339618736572934, 16.029740246572935, 15.549500856572935], [31.3396059848309, 16.0297274948309, 15.549488104830901], [31.339593304566744, 16.029714814566745, 15.549475424566745], [31.33958070024736, 16.02970221024736, 15.549462820247362], [31.339568176314817, 16.029689686314818, 15.549450296314818], [31.339555737184778, 16.02967724718478, 15.54943785718478], [31.339543387244913, 16.029664897244913, 15.549425507244914], [31.33953113085327, 16.02965264085327, 15.549413250853272], [31.339518972336755, 16.029640482336756, 15.549401092336756], [31.33950691598951, 16.02962842598951, 15.549389035989511], [31.33949496607138, 16.029616476071382, 15.549377086071383], [31.339483126806375, 16.029604636806376, 15.549365246806376], [31.339471402381076, 16.029592912381077, 15.549353522381077], [31.33945979694316, 16.02958130694316, 15.549341916943161], [31.339448314599874, 16.029569824599875, 15.549330434599876], [31.339436959416503, 16.029558469416504, 15.549319079416504], [31.339425735414892, 16.029547245414893, 15.549307855414893], [31.339414646571992, 16.029536156571993, 15.549296766571993], [31.339403696818348, 16.02952520681835, 15.54928581681835], [31.3393928900367, 16.0295144000367, 15.5492750100367], [31.339382230060508, 16.02950374006051, 15.54926435006051], [31.339371720672574, 16.029493230672575, 15.549253840672575], [31.339361365603622, 16.029482875603623, 15.549243485603624], [31.339351168530875, 16.029472678530876, 15.549233288530877], [31.339341133076786, 16.029462643076787, 15.549223253076788], [31.3393312628076, 16.029452772807602, 15.549213382807602], [31.339321561232072, 16.029443071232073, 15.549203681232074], [31.339312031800144, 16.029433541800145, 15.549194151800146], [31.33930267790168, 16.029424187901682, 15.549184797901683], [31.33929350286516, 16.02941501286516, 15.549175622865162], [31.339284509956475, 16.029406019956475, 15.549166629956476], [31.33927570237767, 16.02939721237767, 15.549157822377671], [31.339267083265778, 16.02938859326578, 15.54914920326578], [31.339258655691612, 16.029380165691613, 15.549140775691614], [31.33925042265864, 16.02937193265864, 15.549132542658642], [31.33924238710181, 16.02936389710181, 15.54912450710181], [31.339234551886477, 16.029356061886478, 15.549116671886479], [31.339226919807356, 16.029348429807357, 15.549109039807357], [31.33921949358738, 16.02934100358738, 15.54910161358738], [31.339212275876754, 16.029333785876755, 15.549094395876756], [31.339205269251895, 16.029326779251896, 15.549087389251897], [31.339198476214506, 16.029319986214507, 15.549080596214507], [31.33919189919059, 16.02931340919059, 15.54907401919059], [31.339185540529535, 16.029307050529535, 15.549067660529536], [31.33917940250325, 16.029300912503253, 15.549061522503253], [31.339173487305267, 16.029294997305268, 15.549055607305268], [31.33916779704994, 16.02928930704994, 15.54904991704994], [31.339162333771586, 16.029283843771587, 15.549044453771588], [31.339157099423804, 16.029278609423805, 15.549039219423806], [31.33915209587863, 16.029273605878632, 15.549034215878633], [31.339147324925882, 16.029268834925883, 15.549029444925884], [31.339142788272476, 16.029264298272476, 15.549024908272477], [31.33913848754173, 16.029259997541732, 15.549020607541733], [31.339134424272807, 16.029255934272808, 15.549016544272808], [31.33913059992008, 16.02925210992008, 15.54901271992008], [31.339127015852597, 16.029248525852598, 15.549009135852598], [31.339123673353548, 16.02924518335355, 15.54900579335355], [31.339120573619763, 16.029242083619764, 15.549002693619764], [31.3391177177613, 16.029239227761302, 15.548999837761302], [31.339115106800957, 16.029236616800958, 15.548997226800958], [31.339112741673933, 16.029234251673934, 15.548994861673934], [31.339110623227423, 16.029232133227424, 15.548992743227425], [31.33910875222035, 16.029230262220352, 15.548990872220353], [31.339107129323008, 16.02922863932301, 15.548989249323009], [31.33910575511685, 16.02922726511685, 15.548987875116852], [31.33910463009427, 16.02922614009427, 15.54898675009427], [31.339103754658364, 16.029225264658365, 15.548985874658365], [31.339103129122837, 16.029224639122837, 15.548985249122838], [31.33910275371183, 16.029224263711832, 15.548984873711833], [31.33910262855988, 16.02922413855988, 15.54898474855988]], "Cn_r": [[-1.8742457331137516], [-1.874245745720528], [-1.8742457835365531], [-1.8742458465489245], [-1.8742459347361355], [-1.8742460480680916], [-1.8742461865061149], [-1.8742463500029551], [-1.874246538502809], [-1.8742467519413346], [-1.8742469902456715], [-1.8742472533344676], [-1.8742475411178998], [-1.874247853497704], [-1.8742481903672095], [-1.874248551611369], [-1.8742489371067947], [-1.8742493467218027], [-1.8742497803164464], [-1.87425023774257], [-1.874250718843847], [-1.8742512234558368], [-1.8742517514060322], [-1.874252302513917], [-1.8742528765910234], [-1.8742534734409892], [-1.8742540928596239], [-1.8742547346349725], [-1.8742553985473827], [-1.874256084369575], [-1.8742567918667175], [-1.874257520796498], [-1.8742582709092046], [-1.874259041947804], [-1.8742598336480243], [-1.8742606457384416], [-1.8742614779405644], [-1.8742623299689265], [-1.8742632015311778], [-1.874264092328179], [-1.8742650020540967], [-1.8742659303965057], [-1.8742668770364888], [-1.8742678416487384], [-1.8742688239016658], [-1.8742698234575084], [-1.8742708399724364], [-1.8742718730966699], [-1.8742729224745913], [-1.8742739877448609], [-1.874275068540536], [-1.8742761644891932], [-1.8742772752130483], [-1.8742784003290824], [-1.8742795394491685], [-1.8742806921801973], [-1.8742818581242127], [-1.874283036878537], [-1.8742842280359115], [-1.874285431184625], [-1.8742866459086582], [-1.8742878717878166], [-1.874289108397874], [-1.874290355310715], [-1.8742916120944777], [-1.8742928783136983], [-1.8742941535294586], [-1.8742954372995337], [-1.8742967291785428], [-1.8742980287180973], [-1.874299335466954], [-1.8743006489711707], [-1.874301968774257], [-1.8743032944173323], [-1.8743046254392814], [-1.874305961376914], [-1.8743073017651206], [-1.8743086461370344], [-1.8743099940241914], [-1.8743113449566917], [-1.874312698463363], [-1.8743140540719194], [-1.8743154113091316], [-1.8743167697009857], [-1.8743181287728496], [-1.8743194880496397], [-1.8743208470559862], [-1.8743222053163981], [-1.8743235623554306], [-1.8743249176978523], [-1.8743262708688122], [-1.8743276213940057], [-1.8743289687998443], [-1.8743303126136208], [-1.8743316523636777], [-1.8743329875795744], [-1.874334317792254], [-1.8743356425342108], [-1.8743369613396577], [-1.8743382737446903], [-1.8743395792874555], [-1.8743408775083141], [-1.8743421679500103], [-1.874343450157831], [-1.8743447236797726], [-1.8743459880667046], [-1.8743472428725294], [-1.8743484876543464], [-1.8743497219726117], [-1.8743509453912952], [-1.874352157478046], [-1.8743533578043405], [-1.8743545459456479], [-1.8743557214815785], [-1.8743568839960414], [-1.874358033077397], [-1.8743591683186047], [-1.8743602893173767], [-1.8743613956763245], [-1.8743624870031041], [-1.8743635629105633], [-1.874364623016882], [-1.8743656669457176], [-1.8743666943263406], [-1.8743677047937732], [-1.8743686979889274], [-1.8743696735587354], [-1.874370631156283], [-1.8743715704409392], [-1.8743724910784811], [-1.8743733927412234], [-1.8743742751081358], [-1.8743751378649685], [-1.8743759807043645], [-1.8743768033259813], [-1.8743776054365988], [-1.8743783867502326], [-1.8743791469882403], [-1.874379885879426], [-1.8743806031601473], [-1.8743812985744077], [-1.874381971873959], [-1.8743826228183926], [-1.8743832511752339], [-1.8743838567200253], [-1.8743844392364142], [-1.874384998516237], [-1.874385534359596], [-1.8743860465749345], [-1.8743865349791113], [-1.874386999397471], [-1.87438743966391], [-1.8743878556209375], [-1.8743882471197393], [-1.8743886140202333], [-1.8743889561911213], [-1.8743892735099414], [-1.8743895658631136], [-1.8743898331459836], [-1.874390075262863], [-1.8743902921270645], [-1.8743904836609393], [-1.8743906497959], [-1.8743907904724542], [-1.8743909056402208], [-1.8743909952579545], [-1.8743910592935582], [-1.874391097724097], [-1.874391110535806]], "Cl_p": [[-0.44110600880225637], [-0.44110601470061667], [-0.4411060323936863], [-0.44110606187543044], [-0.44110610313579296], [-0.44110615616070037], [-0.44110622093206525], [-0.4411062974277927], [-0.44110638562178706], [-0.4411064854839599], [-0.44110659698023985], [-0.4411067200725829], [-0.4411068547189851], [-0.44110700087349497], [-0.44110715848622906], [-0.44110732750338644], [-0.4411075078672667], [-0.441107699516288], [-0.44110790238500597], [-0.4411081164041354], [-0.44110834150057093], [-0.4411085775974118], [-0.4411088246139849], [-0.4411090824658708], [-0.441109351064931], [-0.4411096303193353], [-0.4411099201335914], [-0.4411102204085753], [-0.4411105310415626], [-0.44111085192626187], [-0.44111118295284796], [-0.4411115240079973], [-0.4411118749749245], [-0.4411122357334196], [-0.44111260615988623], [-0.44111298612738165], [-0.44111337550565777], [-0.4411137741612024], [-0.44111418195728336], [-0.4411145987539913], [-0.4411150244082855], [-0.44111545877404085], [-0.4411159017020938], [-0.4411163530402916], [-0.44111681263354174], [-0.441117280323862], [-0.4411177559504321], [-0.4411182393496465], [-0.441118730355167], [-0.4411192287979778], [-0.44111973450644104], [-0.4411202473063521], [-0.4411207670209984], [-0.441121293471216], [-0.44112182647545], [-0.4411223658498132], [-0.44112291140814835], [-0.4411234629620884], [-0.44112402032112], [-0.44112458329264653], [-0.4411251516820519], [-0.4411257252927664], [-0.44112630392633095], [-0.44112688738246475], [-0.44112747545913206], [-0.4411280679526096], [-0.4411286646575559], [-0.44112926536707997], [-0.44112986987281094], [-0.4411304779649693], [-0.44113108943243745], [-0.44113170406283164], [-0.44113232164257354], [-0.4411329419569641], [-0.4411335647902561], [-0.44113418992572806], [-0.4411348171457585], [-0.4411354462319007], [-0.44113607696495816], [-0.44113670912505926], [-0.441137342491734], [-0.4411379768439897], [-0.4411386119603877], [-0.4411392476191209], [-0.4411398835980893], [-0.4411405196749794], [-0.44114115562733974], [-0.4411417912326607], [-0.4411424262684505], [-0.441143060512315], [-0.4411436937420349], [-0.4411443257356438], [-0.44114495627150774], [-0.44114558512840246], [-0.44114621208559196], [-0.44114683692290724], [-0.441147459420824], [-0.4411480793605413], [-0.4411486965240597], [-0.4411493106942584], [-0.4411499216549735], [-0.4411505291910758], [-0.4411511330885473], [-0.4411517331345594], [-0.4411523291175481], [-0.4411529208272915], [-0.44115350805498577], [-0.4411540905933203], [-0.44115466823655314], [-0.441155240780586], [-0.4411558080230381], [-0.4411563697633207], [-0.44115692580270977], [-0.44115747594441845], [-0.44115801999367016], [-0.44115855775776897], [-0.44115908904617107], [-0.44115961367055495], [-0.4411601314448902], [-0.4411606421855069], [-0.4411611457111628], [-0.44116164184311113], [-0.4411621304051667], [-0.4411626112237706], [-0.44116308412805555], [-0.4411635489499095], [-0.4411640055240371], [-0.44116445368802315], [-0.44116489328239206], [-0.4411653241506677], [-0.4411657461394322], [-0.44116615909838364], [-0.4411665628803918], [-0.4411669573415545], [-0.44116734234125055], [-0.44116771774219415], [-0.4411680834104845], [-0.44116843921565907], [-0.44116878503074064], [-0.4411691207322865], [-0.44116944620043463], [-0.4411697613189493], [-0.4411700659752656], [-0.44117036006053123], [-0.4411706434696486], [-0.4411709161013143], [-0.4411711778580585], [-0.4411714286462808], [-0.4411716683762865], [-0.4411718969623215], [-0.44117211432260356], [-0.441172320379355], [-0.44117251505883126], [-0.4411726982913497], [-0.44117287001131594], [-0.4411730301572494], [-0.4411731786718063], [-0.441173315501802], [-0.44117344059823116], [-0.44117355391628654], [-0.44117365541537623], [-0.4411737450591395], [-0.44117382281546014], [-0.4411738886564792], [-0.4411739425586057], [-0.44117398450252543], [-0.44117401447320853], [-0.4411740324599156], [-0.44117403845620085]], "Cl_beta": [[-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0], [-0.0]], "Cy_beta": 0, "Cm_q": [[34.05554277220465], [34.05554322758694], [34.05554459357851], [34.05554686971344], [34.05555005521537], [34.05555414899774], [34.05555914966412], [34.055565055508666], [34.055571864516686], [34.055579574365176], [34.055588182423676], [34.05559768575501], [34.05560808111626], [34.055619364959746], [34.055631533434216], [34.05564458238598], [34.055658507360285], [34.05567330360271], [34.055688966060636], [34.05570548938489], [34.055722867931394], [34.05574109576303], [34.05576016665144], [34.05578007407904], [34.05580081124107], [34.05582237104784], [34.05584474612684], [34.055867928825215], [34.055891911212164], [34.05591668508144], [34.05594224195402], [34.05596857308077], [34.055995669445274], [34.05602352176675], [34.05605212050293], [34.05608145585325], [34.056111517761884], [34.05614229592107], [34.056173779774376], [34.056205958520145], [34.05623882111493], [34.05627235627715], [34.05630655249064], [34.056341398008485], [34.056376880856774], [34.05641298883849], [34.05644970953756], [34.05648703032279], [34.0565249383521], [34.0565634205766], [34.05660246374504], [34.05664205440795], [34.05668217892227], [34.05672282345566], [34.056763973991195], [34.05680561633188], [34.05684773610546], [34.056890318769085], [34.05693334961419], [34.05697681377138], [34.05702069621532], [34.05706498176989], [34.05710965511306], [34.05715470078219], [34.057200103179106], [34.0572458465754], [34.05729191511769], [34.05733829283298], [34.05738496363402], [34.05743191132482], [34.05747911960606], [34.05752657208065], [34.05757425225933], [34.05762214356627], [34.05767022934473], [34.05771849286274], [34.05776691731888], [34.05781548584798], [34.05786418152699], [34.05791298738076], [34.057961886387915], [34.05801086148675], [34.0580598955811], [34.058108971546396], [34.058158072235415], [34.05820718048446], [34.058256279119206], [34.0583053509608], [34.058354378831815], [34.05840334556232], [34.058452233995894], [34.05850102699565], [34.05854970745036], [34.058598258280426], [34.058646662443955], [34.05869490294282], [34.058742962828674], [34.058790825208995], [34.05883847325318], [34.05888589019844], [34.05893305935585], [34.058979964116396], [34.05902658795683], [34.05907291444575], [34.059118927249386], [34.059164610137564], [34.05920994698962], [34.05925492180014], [34.05929951868485], [34.05934372188638], [34.059387515779925], [34.05943088487905], [34.059473813841294], [34.05951628747375], [34.05955829073869], [34.059599808759096], [34.05964082682401], [34.0596813303941], [34.059721305106905], [34.059760736782216], [34.05979961142724], [34.05983791524186], [34.05987563462371], [34.05991275617319], [34.0599492666985], [34.059985153220595], [34.06002040297784], [34.060055003431], [34.060088942267775], [34.06012220740744], [34.06015478700539], [34.06018666945758], [34.06021784340482], [34.060248297737175], [34.06027802159801], [34.060307004388164], [34.06033523576987], [34.06036270567074], [34.06038940428756], [34.060415322089916], [34.060440449823886], [34.06046477851549], [34.06048829947418], [34.06051100429602], [34.06053288486696], [34.06055393336589], [34.06057414226765], [34.060593504345825], [34.06061201267558], [34.06062966063624], [34.06064644191384], [34.06066235050355], [34.06067738071193], [34.060691527159136], [34.06070478478098], [34.06071714883083], [34.0607286148815], [34.06073917882686], [34.06074883688344], [34.06075758559192], [34.06076542181842], [34.06077234275567], [34.06077834592419], [34.06078342917311], [34.06078759068109], [34.06079082895697], [34.060793142840396], [34.06079453150221], [34.06079499444478]], "Cm_alpha_dot": [[-55.65560718954572], [-55.655608194429746], [-55.655611208739174], [-55.6556162314457], [-55.65562326083604], [-55.65563229451239], [-55.655643329393016], [-55.65565636171338], [-55.655671387027375], [-55.65568840020856], [-55.655707395451856], [-55.65572836627541], [-55.65575130552263], [-55.655776205364425], [-55.65580305730163], [-55.65583185216778], [-55.655862580131966], [-55.65589523070195], [-55.65592979272748], [-55.65596625440384], [-55.656004603275505], [-55.65604482624029], [-55.656086909553224], [-55.65613083883122], [-55.65617659905735], [-55.65622417458588], [-55.6562735491471], [-55.65632470585248], [-55.65637762720021], [-55.65643229508064], [-55.65648869078216], [-55.65654679499708], [-55.656606587827895], [-55.65666804879366], [-55.6567311568366], [-55.65679589032866], [-55.65686222707874], [-55.65693014433967], [-55.656999618815576], [-55.657070626669466], [-55.65714314353077], [-55.65721714450341], [-55.65729260417374], [-55.65736949661886], [-55.657447795415], [-55.65752747364615], [-55.65760850391271], [-55.65769085834066], [-55.657774508590435], [-55.657859425866306], [-55.65794558092585], [-55.65803294408945], [-55.6581214852501], [-55.65821117388333], [-55.658301979057306], [-55.658393869442875], [-55.6584868133242], [-55.65858077860902], [-55.65867573283941], [-55.658771643202606], [-55.658868476541876], [-55.65896619936753], [-55.65906477786829], [-55.659164177922406], [-55.6592643651092], [-55.65936530472064], [-55.659466961772935], [-55.65956930101845], [-55.659672286957516], [-55.65977588385045], [-55.65988005572969], [-55.659984766411995], [-55.66008997951081], [-55.66019565844854], [-55.66030176646918], [-55.66040826665075], [-55.660515121918074], [-55.66062229505537], [-55.66072974871922], [-55.66083744545131], [-55.660945347691346], [-55.661053417790114], [-55.6611616180225], [-55.661269910600645], [-55.661378257686934], [-55.66148662140731], [-55.66159496386444], [-55.66170324715104], [-55.66181143336294], [-55.66191948461274], [-55.662027363042846], [-55.66213503083883], [-55.66224245024291], [-55.66234958356724], [-55.66245639320718], [-55.66256284165475], [-55.662668891511956], [-55.66277450550395], [-55.662879646492556], [-55.662984277489365], [-55.663088361669054], [-55.66319186238261], [-55.663294743170404], [-55.663396967775434], [-55.66349850015622], [-55.663599304500075], [-55.66369934523577], [-55.66379858704666], [-55.663896994883345], [-55.66399453397642], [-55.66409116984926], [-55.664186868330454], [-55.664281595566344], [-55.66437531803337], [-55.66446800255044], [-55.66455961629098], [-55.66465012679512], [-55.664739501981494], [-55.664827710159216], [-55.66491472003946], [-55.66500050074713], [-55.6650850218322], [-55.66516825328098], [-55.6652501655274], [-55.66533072946381], [-55.66540991645202], [-55.66548769833366], [-55.6655640474411], [-55.66563893660746], [-55.66571233917684], [-55.66578422901443], [-55.66585458051617], [-55.66592336861836], [-55.66599056880724], [-55.66605615712798], [-55.666120110193944], [-55.666182405195215], [-55.66624301990753], [-55.66630193270038], [-55.66635912254541], [-55.66641456902426], [-55.66646825233631], [-55.66652015330626], [-55.66657025339127], [-55.6666185346881], [-55.66666497993995], [-55.666709572542935], [-55.66675229655247], [-55.666793136689265], [-55.6668320783452], [-55.66686910758898], [-55.66690421117128], [-55.66693737652987], [-55.66696859179459], [-55.66699784579157], [-55.66702512804775], [-55.667050428794774], [-55.66707373897282], [-55.66709505023394], [-55.667114354945404], [-55.66713164619245], [-55.667146917781174], [-55.66716016424071], [-55.667171380825316], [-55.667180563516396], [-55.667187709023786], [-55.66719281478728], [-55.66719587897737], [-55.66719690049604]], "Cz_alpha": [[-4.539569444813287], [-4.539569739527586], [-4.539570623576298], [-4.539572096676912], [-4.53957415835863], [-4.539576807962494], [-4.539580044641518], [-4.539583867360887], [-4.539588274898187], [-4.539593265843677], [-4.539598838600609], [-4.539604991385586], [-4.539611722228965], [-4.539619028975302], [-4.539626909283844], [-4.539635360629052], [-4.539644380301184], [-4.539653965406912], [-4.539664112869982], [-4.53967481943192], [-4.539686081652784], [-4.539697895911958], [-4.539710258408995], [-4.539723165164494], [-4.539736612021037], [-4.5397505946441585], [-4.53976510852337], [-4.539780148973224], [-4.539795711134431], [-4.539811789975014], [-4.5398283802915165], [-4.539845476710258], [-4.539863073688632], [-4.539881165516459], [-4.539899746317375], [-4.539918810050288], [-4.539938350510859], [-4.539958361333053], [-4.53997883599073], [-4.53999976779928], [-4.540021149917315], [-4.540042975348423], [-4.540065236942936], [-4.540087927399787], [-4.540111039268397], [-4.540134564950621], [-4.540158496702735], [-4.54018282663749], [-4.540207546726198], [-4.540232648800891], [-4.540258124556513], [-4.540283965553174], [-4.540310163218456], [-4.540336708849766], [-4.540363593616747], [-4.540390808563729], [-4.540418344612256], [-4.540446192563635], [-4.540474343101562], [-4.540502786794788], [-4.540531514099833], [-4.5405605153637705], [-4.540589780827036], [-4.540619300626309], [-4.540649064797444], [-4.540679063278433], [-4.540709285912446], [-4.540739722450902], [-4.540770362556593], [-4.540801195806868], [-4.540832211696851], [-4.540863399642722], [-4.540894748985026], [-4.540926248992056], [-4.54095788886326], [-4.540989657732701], [-4.54102154467257], [-4.541053538696731], [-4.541085628764317], [-4.541117803783369], [-4.541150052614512], [-4.541182364074677], [-4.54121472694086], [-4.541247129953924], [-4.5412795618224315], [-4.54131201122652], [-4.541344466821806], [-4.54137691724334], [-4.541409351109568], [-4.541441757026351], [-4.541474123590994], [-4.541506439396317], [-4.54153869303475], [-4.541570873102453], [-4.541602968203453], [-4.541634966953821], [-4.541666857985856], [-4.541698629952288], [-4.541730271530511], [-4.541761771426819], [-4.541793118380654], [-4.541824301168886], [-4.541855308610082], [-4.541886129568795], [-4.541916752959847], [-4.5419471677526335], [-4.541977362975421], [-4.542007327719644], [-4.542037051144194], [-4.542066522479722], [-4.542095731032917], [-4.5421246661907855], [-4.542153317424923], [-4.542181674295755], [-4.542209726456786], [-4.542237463658816], [-4.54226487575414], [-4.542291952700729], [-4.542318684566379], [-4.542345061532845], [-4.542371073899928], [-4.542396712089553], [-4.542421966649792], [-4.542446828258861], [-4.542471287729074], [-4.542495336010769], [-4.54251896419616], [-4.542542163523181], [-4.542564925379254], [-4.542587241305014], [-4.542609102997987], [-4.542630502316203], [-4.542651431281756], [-4.542671882084312], [-4.5426918470845346], [-4.542711318817467], [-4.542730289995829], [-4.542748753513266], [-4.542766702447505], [-4.542784130063452], [-4.542801029816208], [-4.542817395354007], [-4.542833220521084], [-4.542848499360445], [-4.542863226116566], [-4.542877395238005], [-4.542891001379929], [-4.542904039406542], [-4.542916504393431], [-4.542928391629825], [-4.542939696620745], [-4.5429504150890745], [-4.542960542977523], [-4.542970076450496], [-4.542979011895861], [-4.5429873459266235], [-4.5429950753824855], [-4.543002197331318], [-4.5430087090705085], [-4.54301460812823], [-4.543019892264577], [-4.543024559472617], [-4.543028607979318], [-4.543032036246375], [-4.543034842970933], [-4.543037027086185], [-4.543038587761878], [-4.5430395244046995], [-4.5430398366585445]], "Cy_phi": [[0.8103325292795724], [0.8103348031808028], [0.8103416241357123], [0.8103529898985485], [0.8103688967268592], [0.8103893393826933], [0.8104143111339108], [0.8104438037559563], [0.8104778075340983], [0.8105163112659635], [0.8105593022645401], [0.8106067663615569], [0.8106586879112598], [0.8107150497945712], [0.8107758334236893], [0.8108410187470521], [0.8109105842546942], [0.8109845069840403], [0.8110627625260745], [0.8111453250318905], [0.8112321672196948], [0.8113232603821597], [0.8114185743941966], [0.8115180777211459], [0.811621737427338], [0.8117295191850802], [0.8118413872840361], [0.8119573046410038], [0.8120772328101051], [0.8122011319933701], [0.8123289610517312], [0.8124606775164088], [0.8125962376007094], [0.8127355962122268], [0.8128787069654348], [0.813025522194695], [0.8131759929676579], [0.8133300690990718], [0.8134876991649861], [0.8136488305173669], [0.8138134092990895], [0.813981380459369], [0.8141526877695477], [0.8143272738393088], [0.8145050801332779], [0.814686046988019], [0.8148701136294293], [0.8150572181905179], [0.8152472977295938], [0.8154402882488261], [0.8156361247131988], [0.8158347410698631], [0.8160360702678494], [0.8162400442781905], [0.8164465941143979], [0.8166556498533402], [0.8168671406564669], [0.8170809947914377], [0.8172971396540833], [0.8175155017907658], [0.8177360069210722], [0.8179585799608826], [0.8181831450457852], [0.81840962555484], [0.8186379441346943], [0.8188680227240259], [0.8190997825783382], [0.8193331442950657], [0.8195680278390264], [0.819804352568174], [0.8200420372596804], [0.8202810001363099], [0.8205211588931086], [0.8207624307243844], [0.8210047323509653], [0.8212479800477566], [0.8214920896715585], [0.8217369766891525], [0.8219825562056514], [0.8222287429930925], [0.8224754515192799], [0.8227225959768546], [0.8229700903125942], [0.8232178482569227], [0.8234657833536342], [0.8237138089898064], [0.8239618384259075], [0.8242097848260737], [0.8244575612885567], [0.8247050808763272], [0.8249522566478259], [0.8251990016878447], [0.8254452291385305], [0.8256908522305064], [0.8259357843140893], [0.826179938890587], [0.8264232296436935], [0.8266655704709166], [0.8269068755150827], [0.8271470591958723], [0.8273860362413651], [0.8276237217196178], [0.8278600310702353], [0.8280948801359131], [0.8283281851939668], [0.8285598629878178], [0.828789830758407], [0.8290180062755585], [0.8292443078692436], [0.829468654460751], [0.8296909655937443], [0.8299111614651875], [0.8301291629561302], [0.830344891662334], [0.8305582699247253], [0.8307692208596653], [0.830977668389006], [0.831183537269947], [0.8313867531246377], [0.8315872424695555], [0.8317849327445989], [0.8319797523419238], [0.832171630634469], [0.832360498004188], [0.8325462858699515], [0.8327289267151137], [0.8329083541147316], [0.8330845027624069], [0.8332573084967603], [0.8334267083274993], [0.8335926404610791], [0.8337550443259464], [0.8339138605973306], [0.834069031221597], [0.8342204994401264], [0.8343682098127143], [0.8345121082404852], [0.8346521419882923], [0.834788259706597], [0.8349204114528355], [0.8350485487122126], [0.8351726244179631], [0.8352925929710354], [0.835408410259192], [0.8355200336755317], [0.8356274221363961], [0.8357305360986673], [0.8358293375764555], [0.8359237901571317], [0.8360138590167321], [0.8360995109347115], [0.8361807143080262], [0.8362574391645594], [0.8363296571758523], [0.836397341669173], [0.8364604676388683], [0.83651901175703], [0.8365729523834584], [0.8366222695748986], [0.836666945093567], [0.8367069624149576], [0.8367423067349136], [0.8367729649759755], [0.8367989257929639], [0.8368201795778833], [0.8368367184640009], [0.8368485363292438], [0.8368556287988294], [0.8368579932471318]], "Cl_r": [[0.2025831323198931], [0.2025837007952007], [0.20258540603392808], [0.20258824747463713], [0.2025922241817148], [0.20259733484567333], [0.2026035777834777], [0.20261095093898907], [0.20261945188352457], [0.20262907781649087], [0.20263982556613502], [0.20265169159038923], [0.20266467197781496], [0.2026787624486428], [0.20269395835592233], [0.20271025468676301], [0.20272764606367355], [0.20274612674601009], [0.2027656906315186], [0.20278633125797263], [0.2028080418049237], [0.20283081509553993], [0.20285464359854916], [0.20287951943028648], [0.2029054343568345], [0.20293237979627005], [0.20296034682100902], [0.20298932616025095], [0.20301930820252628], [0.20305028299834252], [0.2030822402629328], [0.2031151693791022], [0.20314905940017736], [0.2031838990530567], [0.2032196767413587], [0.20325638054867376], [0.20329399824191446], [0.20333251727476795], [0.20337192479124652], [0.20341220762934173], [0.20345335232477238], [0.20349534511484224], [0.20353817194238694], [0.2035818184598272], [0.20362627003331948], [0.20367151174700476], [0.20371752840735732], [0.20376430454762948], [0.20381182443239845], [0.20386007206220652], [0.2039090311782997], [0.20395868526746577], [0.20400901756696235], [0.20406001106954763], [0.20411164852859948], [0.20416391246333504], [0.20421678516411673], [0.20427024869785942], [0.20432428491352084], [0.20437887544769145], [0.20443400173026804], [0.20448964499022065], [0.2045457862614463], [0.20460240638871], [0.20465948603367357], [0.20471700568100648], [0.20477494564458454], [0.2048332860737664], [0.2048920069597566], [0.2049510881420435], [0.2050105093149201], [0.20507025003407747], [0.20513028972327715], [0.2051906076810961], [0.20525118308774132], [0.20531199501193914], [0.20537302241788963], [0.20543424417228812], [0.20549563905141285], [0.2055571857482731], [0.20561886287981998], [0.20568064899421365], [0.20574252257814854], [0.20580446206423067], [0.20586644583840855], [0.2059284522474516], [0.20599045960647688], [0.2060524462065184], [0.20611439032213918], [0.2061762702190818], [0.20623806416195647], [0.20629975042196116], [0.20636130728463262], [0.2064227130576266], [0.20648394607852233], [0.20654498472264676], [0.20660580741092338], [0.20666639261772915], [0.20672671887877067], [0.20678676479896807], [0.20684650906034127], [0.20690593042990446], [0.20696500776755883], [0.2070237200339783], [0.2070820462984917], [0.20713996574695445], [0.20719745768960174], [0.20725450156888964], [0.2073110769673109], [0.20736716361518776], [0.20742274139843608], [0.20747779036629688], [0.20753229073903254], [0.2075862229155835], [0.20763956748118131], [0.20769230521491633], [0.2077444170972515], [0.20779588431748675], [0.20784668828115943], [0.20789681061738888], [0.20794623318614971], [0.20799493808548095], [0.20804290765861724], [0.208090124501047], [0.20813657146748787], [0.20818223167877842], [0.2082270885286829], [0.20827112569060172], [0.20831432712419007], [0.20835667708187483], [0.20839816011526976], [0.2084387610814866], [0.20847846514933266], [0.20851725780539926], [0.2085551248600316], [0.20859205245317858], [0.2086280270601213], [0.20866303549707307], [0.20869706492664925], [0.20873010286320887], [0.20876213717805314], [0.20879315610449078], [0.20882314824275885], [0.208852102564798], [0.20888000841888293], [0.20890685553409902], [0.20893263402466683], [0.20895733439411387], [0.20898094753928292], [0.20900346475418302], [0.20902487773367787], [0.20904517857700655], [0.20906435979113985], [0.20908241429396307], [0.20909933541729325], [0.20911511690971707], [0.2091297529392575], [0.2091432380958646], [0.20915556739372465], [0.20916673627339175], [0.2091767406037394], [0.2091855766837284], [0.20919324124399388], [0.20919973144824097], [0.20920504489447084], [0.20920917961600022], [0.20921213408231096], [0.20921390719970734], [0.20921449831178296]]}, "dynamic": {"dutchRollFreqHz": [[0.7598792306008341], [0.7598781750567244], [0.7598750087978251], [0.7598697329442914], [0.7598623493625918], [0.7598528606648276], [0.759841270207774], [0.7598275820916552], [0.7598118011586442], [0.7597939329910883], [0.7597739839094724], [0.7597519609701039], [0.7597278719625344], [0.7597017254067109], [0.7596735305498629], [0.7596432973631216], [0.7596110365378768], [0.7595767594818732], [0.7595404783150415], [0.7595022058650738], [0.7594619556627414], [0.7594197419369563], [0.7593755796095802], [0.7593294842899821], [0.7592814722693463], [0.7592315605147355], [0.7591797666629063], [0.7591261090138883], [0.7590706065243178], [0.7590132788005398], [0.758954146091475], [0.758893229281255], [0.75883054988163], [0.7587661300241547], [0.7586999924521469], [0.758632160512434], [0.7585626581468806], [0.7584915098837041], [0.7584187408285853], [0.758344376655571], [0.7582684435977785], [0.7581909684379], [0.7581119784985166], [0.7580315016322191], [0.7579495662115445], [0.7578662011187347], [0.7577814357353081], [0.7576952999314671], [0.757607824055332], [0.7575190389220063], [0.7574289758024885], [0.7573376664124193], [0.7572451429006837], [0.7571514378378583], [0.7570565842045203], [0.756960615379415], [0.7568635651274908], [0.7567654675878005], [0.7566663572612835], [0.7565662689984212], [0.7564652379867812], [0.7563632997384492], [0.7562604900773519], [0.7561568451264832], [0.7560524012950305], [0.7559471952654084], [0.7558412639802097], [0.7557346446290684], [0.7556273746354509], [0.7555194916433721], [0.7554110335040432], [0.7553020382624605], [0.7551925441439334], [0.7550825895405612], [0.7549722129976632], [0.754861453200163], [0.7547503489589393], [0.7546389391971406], [0.7545272629364743], [0.7544153592834703], [0.7543032674157295], [0.7541910265681581], [0.7540786760191931], [0.7539662550770245], [0.7538538030658215], [0.7537413593119614], [0.7536289631302739], [0.7535166538102981], [0.7534044706025612], [0.7532924527048859], [0.7531806392487248], [0.7530690692855296], [0.752957781773165], [0.7528468155623603], [0.7527362093832162], [0.7526260018317623], [0.7525162313565728], [0.7524069362454464], [0.7522981546121529], [0.7521899243832516], [0.7520822832849842], [0.7519752688302529], [0.7518689183056778], [0.751763268758747], [0.7516583569850585], [0.7515542195156605], [0.751450892604494], [0.7513484122159381], [0.7512468140124693], [0.7511461333424313], [0.7510464052279254], [0.7509476643528182], [0.7508499450508814], [0.7507532812940534], [0.7506577066808392], [0.7505632544248466], [0.7504699573434576], [0.7503778478466511], [0.7502869579259661], [0.7501973191436215], [0.7501089626217848], [0.7500219190320014], [0.7499362185847849], [0.7498518910193689], [0.7497689655936269], [0.7496874710741657], [0.7496074357265841], [0.7495288873059175], [0.749451853047252], [0.7493763596565282], [0.7493024333015244], [0.7492300996030296], [0.749159383626205], [0.7490903098721403], [0.7490229022696017], [0.7489571841669777], [0.7488931783244311], [0.7488309069062425], [0.7487703914733675], [0.7487116529761939], [0.7486547117475125], [0.7485995874956951], [0.748546299298087], [0.7484948655946144], [0.7484453041816054], [0.7483976322058329], [0.7483518661587762], [0.7483080218711019], [0.748266114507372], [0.748226158560973], [0.7481881678492729], [0.7481521555090076], [0.7481181339918903], [0.7480861150604579], [0.7480561097841435], [0.7480281285355846], [0.7480021809871618], [0.7479782761077745], [0.7479564221598507], [0.7479366266965911], [0.747918896559454], [0.7479032378758764], [0.7478896560572295], [0.7478781557970188], [0.7478687410693198], [0.7478614151274547], [0.7478561805029101], [0.7478530390044918], [0.7478519917177255]], "dutchRollDamping": [[0.9349323704896285], [0.9349308884640505], [0.9349264429136407], [0.9349190354171751], [0.9349086686052955], [0.9348953461595327], [0.9348790728109415], [0.9348598543383437], [0.9348376975661828], [0.9348126103619937], [0.9347846016334819], [0.9347536813252199], [0.9347198604149588], [0.934683150909558], [0.9346435658405334], [0.9346011192592273], [0.9345558262316018], [0.9345077028326583], [0.9344567661404832], [0.9344030342299267], [0.9343465261659113], [0.9342872619963811], [0.9342252627448862], [0.9341605504028097], [0.9340931479212449], [0.9340230792025115], [0.9339503690913383], [0.9338750433656902], [0.9337971287272605], [0.9337166527916284], [0.9336336440780817], [0.933548131999115], [0.9334601468496051], [0.9333697197956637], [0.9332768828631831], [0.9331816689260677], [0.9330841116941626], [0.9329842457008872], [0.9328821062905682], [0.9327777296054903], [0.9326711525726591], [0.9325624128902902], [0.9324515490140222], [0.9323386001428674], [0.9322236062048975], [0.9321066078426775], [0.9319876463984499], [0.9318667638990747], [0.9317440030407348], [0.9316194071734089], [0.9314930202851206], [0.9313648869859699], [0.9312350524919536], [0.9311035626085776], [0.9309704637142768], [0.9308358027436329], [0.9306996271704197], [0.9305619849904576], [0.9304229247043049], [0.9302824952997784], [0.9301407462343202], [0.929997727417208], [0.9298534891916259], [0.9297080823165962], [0.9295615579487763], [0.9294139676241397], [0.929265363239533], [0.9291157970341283], [0.928965321570772], [0.928813989717236], [0.928661854627382], [0.9285089697222475], [0.9283553886710505], [0.9282011653721343], [0.9280463539338477], [0.9278910086553738], [0.9277351840075136], [0.927578934613427], [0.9274223152293486], [0.9272653807252701], [0.9271081860656144], [0.9269507862898869], [0.9267932364933364], [0.9266355918076078], [0.926477907381409], [0.9263202383611949], [0.9261626398718746], [0.9260051669975459], [0.9258478747622716], [0.9256908181108933], [0.925534051889902], [0.9253776308283594], [0.9252216095188865], [0.9250660423987191], [0.9249109837308427], [0.9247564875852068], [0.9246026078200286], [0.9244493980631944], [0.9242969116937583], [0.9241452018235498], [0.9239943212788974], [0.9238443225824677], [0.9236952579352294], [0.923547179198555], [0.9234001378764499], [0.9232541850979312], [0.9231093715995515], [0.9229657477080793], [0.9228233633233321], [0.9226822679011845], [0.9225425104367346], [0.9224041394476543], [0.922267202957717], [0.9221317484805086], [0.9219978230033329], [0.9218654729713064], [0.921734744271662], [0.9216056822182489], [0.9214783315362445], [0.9213527363470849], [0.9212289401536073], [0.9211069858254188], [0.9209869155844931], [0.9208687709909952], [0.9207525929293467], [0.9206384215945238], [0.9205262964786081], [0.9204162563575748], [0.9203083392783394], [0.9202025825460562], [0.9200990227116764], [0.9199976955597658], [0.9198986360965925], [0.9198018785384781], [0.9197074563004256], [0.9196154019850178], [0.9195257473715994], [0.9194385234057334], [0.9193537601889482], [0.9192714869687695], [0.9191917321290383], [0.9191145231805244], [0.9190398867518356], [0.9189678485806229], [0.9188984335050812], [0.9188316654557593], [0.9187675674476696], [0.918706161572702], [0.9186474689923495], [0.9185915099307428], [0.9185383036679972], [0.9184878685338695], [0.9184402219017359], [0.9183953801828815], [0.9183533588211116], [0.9183141722876808], [0.9182778340765431], [0.9182443566999268], [0.9182137516842279], [0.9181860295662327], [0.9181611998896636], [0.9181392712020507], [0.9181202510519312], [0.9181041459863771], [0.9180909615488521], [0.9180807022773929], [0.9180733717031262], [0.9180689723491114], [0.9180675057295138]], "rollSubsistenceTimeConstant": [[-2.9903965997875854], [-2.9904054741618253], [-2.9904320943759473], [-2.990476451704923], [-2.9905385316095505], [-2.990618313740217], [-2.990715771942186], [-2.990830874262363], [-2.990963582957596], [-2.9911138545044813], [-2.9912816396106647], [-2.991466883227673], [-2.9916695245652494], [-2.9918894971071963], [-2.9921267286287523], [-2.9923811412154713], [-2.9926526512836262], [-2.992941169602129], [-2.9932466013159837], [-2.9935688459712573], [-2.9939077975415764], [-2.9942633444561544], [-2.9946353696293464], [-2.995023750491749], [-2.9954283590228163], [-2.9958490617850315], [-2.9962857199596042], [-2.9967381893837097], [-2.997206320589281], [-2.997689958843337], [-2.998188944189856], [-2.9987031114932043], [-2.999232290483105], [-2.9997763058011566], [-3.0003349770489263], [-3.0009081188375553], [-3.001495540838943], [-3.002097047838492], [-3.002712439789374], [-3.0033415118683835], [-3.0039840545333165], [-3.004639853581913], [-3.005308690212353], [-3.0059903410852815], [-3.00668457838741], [-3.007391169896621], [-3.0081098790486545], [-3.0088404650052945], [-3.009582682724113], [-3.0103362830297278], [-3.011101012686587], [-3.0118766144732763], [-3.0126628272583065], [-3.0134593860774643], [-3.0142660222125746], [-3.015082463271843], [-3.0159084332715786], [-3.0167436527194784], [-3.0175878386992894], [-3.018440704956971], [-3.0193019619882557], [-3.0201713171276494], [-3.021048474638837], [-3.0219331358064614], [-3.022824999029302], [-3.0237237599147977], [-3.0246291113749137], [-3.025540743723337], [-3.02645834477397], [-3.027381599940708], [-3.028310192338487], [-3.0292438028855586], [-3.0301821104069986], [-3.0311247917393898], [-3.032071521836688], [-3.033021973877218], [-3.0339758193717956], [-3.0349327282729193], [-3.0358923690850244], [-3.0368544089757803], [-3.037818513888344], [-3.0387843486546164], [-3.0397515771093913], [-3.04071986220542], [-3.041688866129326], [-3.0426582504183344], [-3.043627676077793], [-3.0445968036994295], [-3.0455652935803164], [-3.046532805842496], [-3.047499000553219], [-3.0484635378457887], [-3.04942607804089], [-3.0503862817684553], [-3.051343810089943], [-3.0522983246210136], [-3.0532494876545777], [-3.0541969622841028], [-3.0551404125272055], [-3.0560795034494252], [-3.057013901288151], [-3.0579432735766234], [-3.058867289268028], [-3.0597856188595074], [-3.0606979345161807], [-3.0616039101949895], [-3.0625032217683854], [-3.0633955471477896], [-3.0642805664067643], [-3.0651579619038163], [-3.0660274184048286], [-3.066888623205001], [-3.0677412662502737], [-3.0685850402581925], [-3.069419640838097], [-3.0702447666106445], [-3.0710601193265386], [-3.0718654039844595], [-3.072660328948125], [-3.0734446060623593], [-3.0742179507682246], [-3.0749800822170377], [-3.0757307233832862], [-3.0764696011763695], [-3.0771964465510657], [-3.0779109946167256], [-3.0786129847450874], [-3.0793021606766597], [-3.0799782706256478], [-3.0806410673833104], [-3.081290308419734], [-3.081925755983939], [-3.0825471772022865], [-3.0831543441750853], [-3.0837470340714095], [-3.0843250292220055], [-3.0848881172102645], [-3.085436090961225], [-3.085968748828505], [-3.086485894679156], [-3.0869873379763737], [-3.087472893860007], [-3.08794238322482], [-3.0883956327964652], [-3.0888324752051393], [-3.089252749056816], [-3.089656299002088], [-3.090042975802534], [-3.090412636394561], [-3.0907651439507107], [-3.0911003679383793], [-3.091418184175901], [-3.0917184748859894], [-3.0920011287464764], [-3.092266040938327], [-3.092513113190897], [-3.0927422538244227], [-3.092953377789666], [-3.09314640670477], [-3.093321268889224], [-3.0934778993949483], [-3.093616240034483], [-3.0937362394062804], [-3.0938378529170234], [-3.093921042801017], [-3.0939857781366245], [-3.0940320348597097], [-3.094059795774118], [-3.0940690505591637]], "spiralSubsistenceTimeConstant": [[18.87767716883835], [18.877625704965816], [18.877471332034904], [18.877214106079737], [18.876854120474533], [18.87639150588648], [18.875826430226983], [18.87515909858499], [18.87438975314211], [18.873518673077875], [18.87254617445659], [18.871472610100724], [18.87029836944957], [18.869023878403933], [18.86764959915457], [18.866176029997625], [18.8646037051361], [18.862933194465395], [18.861165103345762], [18.8593000723618], [18.857338777065447], [18.8552819277078], [18.853130268956253], [18.850884579597647], [18.848545672229417], [18.846114392936578], [18.843591620956097], [18.840978268328694], [18.83827527953765], [18.835483631135478], [18.832604331357995], [18.829638419727058], [18.826586966640768], [18.82345107295224], [18.820231869537317], [18.816930516850604], [18.813548204470933], [18.81008615063571], [18.806545601765276], [18.8029278319762], [18.799234142585917], [18.795465861605624], [18.791624343225607], [18.787710967290025], [18.783727138763155], [18.779674287186754], [18.77555386612894], [18.771367352625134], [18.767116246610247], [18.762802070344062], [18.75842636782883], [18.753990704219266], [18.74949666522674], [18.744945856515603], [18.740339903094313], [18.735680448699526], [18.73096915517556], [18.726207701847045], [18.72139778488782], [18.71654111668352], [18.711639425190675], [18.706694453290865], [18.701707958140897], [18.6966817105194], [18.691617494169584], [18.6865171051393], [18.681382351117527], [18.676215050769002], [18.671017033065574], [18.665790136616355], [18.66053620899528], [18.655257106067825], [18.649954691315966], [18.644630835162154], [18.639287414293168], [18.63392631098264], [18.62854941241399], [18.623158610003365], [18.617755798722577], [18.612342876423167], [18.60692174316069], [18.601494300520745], [18.596062450945702], [18.590628097063703], [18.58519314101883], [18.579759483803873], [18.574329024594913], [18.568903660089077], [18.563485283844418], [18.55807578562335], [18.55267705073868], [18.547290959403693], [18.541919386085574], [18.536564198862624], [18.531227258785616], [18.52591041924374], [18.52061552533416], [18.51534441323735], [18.510098909596458], [18.504880830901623], [18.49969198288051], [18.49453415989307], [18.489409144332345], [18.484318706031335], [18.479264601675226], [18.474248574219743], [18.469272352316345], [18.464337649742816], [18.45944616484126], [18.45459957996216], [18.44979956091553], [18.445047756429023], [18.44034579761291], [18.435695297432435], [18.431097850187555], [18.42655503099975], [18.422068395307093], [18.41763947836607], [18.413269794762268], [18.408960837927804], [18.40471407966784], [18.40053096969427], [18.396412935168357], [18.39236138025111], [18.388377685662274], [18.384463208247816], [18.380619280555596], [18.376847210420337], [18.3731482805565], [18.369523748160447], [18.365974844521375], [18.362502774640735], [18.359108716861318], [18.355793822504687], [18.352559215518028], [18.349405992130304], [18.346335220516938], [18.343347940474565], [18.340445163104686], [18.33762787050616], [18.334897015478113], [18.332253521231408], [18.329698281109913], [18.32723215832129], [18.324855985677083], [18.322570565342573], [18.320376668596403], [18.31827503559905], [18.31626637517194], [18.31435136458571], [18.312530649357946], [18.310804843061288], [18.30917452714052], [18.307640250740327], [18.306202530541704], [18.30486185060929], [18.303618662247874], [18.30247338386851], [18.301426400865196], [18.300478065501043], [18.29962869680402], [18.29887858047305], [18.298227968793462], [18.29767708056357], [18.29722610102854], [18.296875181827712], [18.296624440949028], [18.29647396269417], [18.29642379765427]], "shortPeriodFreqHz": [[3.5858994605529824], [3.585894326231737], [3.5858789250826004], [3.585853262548723], [3.585817347699813], [3.58577119322884], [3.5857148154473952], [3.5856482342797666], [3.585571473255668], [3.585484559501671], [3.585387523731319], [3.585280400233949], [3.585163226862192], [3.585036045018202], [3.584898899638572], [3.5847518391779816], [3.5845949155915537], [3.5844281843159655], [3.5842517042492594], [3.5840655377294293], [3.5838697505117514], [3.583664411744875], [3.5834495939456907], [3.5832253729729784], [3.5829918279998503], [3.582749041484991], [3.582497099142735], [3.5822360899119423], [3.5819661059237378], [3.581687242468095], [3.5813995979592845], [3.581103273900209], [3.5807983748456236], [3.580485008364281], [3.580163284999981], [3.579833318231578], [3.579495224431933], [3.579149122825841], [3.5787951354469447], [3.5784333870936593], [3.578064005284115], [3.5776871202101406], [3.5773028646903073], [3.5769113741220524], [3.576512786432888], [3.5761072420307367], [3.575694883753398], [3.575275856817163], [3.5748503087646126], [3.5744183894115995], [3.573980250793451], [3.5735360471104047], [3.5730859346723096], [3.5726300718425845], [3.572168618981499], [3.571701738388755], [3.5712295942454326], [3.5707523525552762], [3.5702701810853874], [3.569783249306323], [3.5692917283316183], [3.5687957908567722], [3.5682956110977107], [3.5677913647287536], [3.5672832288200946], [3.5667713817748448], [3.5662560032656385], [3.565737274170837], [3.565215376510348], [3.5646904933810952], [3.5641628088921444], [3.5636325080995284], [3.5630997769407804], [3.5625648021692102], [3.5620277712879385], [3.5614888724837153], [3.560948294560564], [3.560406226873232], [3.559862859260533], [3.5593183819785312], [3.5587729856336816], [3.5582268611158505], [3.557680199531322], [3.5571331921357734], [3.55658603026725], [3.5560389052791623], [3.5554920084733435], [3.554945531033162], [3.5543996639567492], [3.5538545979903255], [3.553310523561689], [3.5527676307138485], [3.552226109038863], [3.551686147611877], [3.5511479349253996], [3.5506116588238363], [3.5500775064382917], [3.5495456641216845], [3.549016317384176], [3.5484896508289427], [3.5479658480883223], [3.5474450917603355], [3.546927563345619], [3.5464134431847993], [3.5459029103962942], [3.545396142814604], [3.5448933169290826], [3.544394607823225], [3.543900189114478], [3.543410232894611], [3.5429249096706465], [3.5424443883063814], [3.5419688359645276], [3.5414984180494544], [3.5410332981506016], [3.5405736379865287], [3.5401195973496757], [3.5396713340517896], [3.539229003870079], [3.538792760494117], [3.5383627554734587], [3.5379391381660534], [3.53752205568742], [3.5371116528606312], [3.5367080721670945], [3.536311453698181], [3.5359219351076776], [3.5355396515651103], [3.535164735709923], [3.5347973176065635], [3.5344375247004427], [3.534085481774828], [3.53374131090865], [3.5334051314352504], [3.533077059902079], [3.5327572100313485], [3.532445692681684], [3.5321426158107245], [3.531848084438751], [3.531562200613307], [3.531285063374844], [3.5310167687233807], [3.530757409586227], [3.5305070757867276], [3.530265854014076], [3.530033827794196], [3.529811077461692], [3.529597680132878], [3.5293937096799035], [3.529199236705975], [3.529014328521681], [3.5288390491224293], [3.5286734591669995], [3.528517615957222], [3.528371573418787], [3.5282353820831918], [3.5281090890708198], [3.527992738075178], [3.5278863693482707], [3.5277900196871346], [3.527703722421537], [3.5276275074028263], [3.527561400993949], [3.527505426060638], [3.527459601963771], [3.5274239445528948], [3.527398466160934], [3.5273831756000633], [3.527378078158764]], "shortPeriodDamp": [[0.16029136185413567], [0.160291130924913], [0.16029043821936412], [0.16028928398381537], [0.1602876686287086], [0.16028559272844867], [0.160283057021188], [0.16028006240855214], [0.16027660995530363], [0.16027270088894457], [0.16026833659925926], [0.16026351863779628], [0.16025824871729014], [0.16025252871102338], [0.16024636065212847], [0.16023974673283106], [0.16023268930363374], [0.16022519087244114], [0.1602172541036271], [0.16020888181704368], [0.16020007698697236], [0.16019084274101922], [0.16018118235895268], [0.16017109927148596], [0.16016059705900315], [0.16014967945023106], [0.16013835032085705], [0.1601266136920916], [0.1601144737291795], [0.16010193473985712], [0.16008900117275876], [0.16007567761577116], [0.16006196879433804], [0.1600478795697143], [0.16003341493717246], [0.16001858002415853], [0.16000338008840315], [0.15998782051598398], [0.159971906819343], [0.15995564463525908], [0.15993903972277543], [0.15992209796108514], [0.15990482534737252], [0.15988722799461477], [0.1598693121293411], [0.15985108408935417], [0.15983255032141078], [0.1598137173788665], [0.1597945919192821], [0.1597751807019951], [0.1597554905856557], [0.15973552852572923], [0.1597153015719661], [0.15969481686583875], [0.1596740816379494], [0.15965310320540632], [0.15963188896917316], [0.15961044641138872], [0.1595887830926621], [0.15956690664934062], [0.15954482479075446], [0.15952254529643717], [0.15950007601332458], [0.1594774248529322], [0.15945459978851215], [0.15943160885219182], [0.15940846013209425], [0.15938516176944195], [0.15936172195564477], [0.1593381489293733], [0.1593144509736191], [0.15929063641274238], [0.15926671360950834], [0.1592426909621136], [0.1592185769012036], [0.15919437988688195], [0.15917010840571316], [0.1591457709677195], [0.15912137610337396], [0.15909693236058808], [0.1590724483016995], [0.15904793250045626], [0.15902339353900255], [0.15899884000486386], [0.15897428048793513], [0.15894972357747095], [0.1589251778590807], [0.15890065191172847], [0.15887615430473861], [0.15885169359480916], [0.15882727832303348], [0.15880291701193006], [0.15877861816248426], [0.1587543902512], [0.15873024172716396], [0.15870618100912365], [0.158682216482579], [0.15865835649688925], [0.1586346093623961], [0.15861098334756418], [0.15858748667613892], [0.15856412752432428], [0.15854091401797907], [0.15851785422983544], [0.15849495617673773], [0.158472227816905], [0.15844967704721588], [0.15842731170051885], [0.158405139542966], [0.15838316827137444], [0.15836140551061345], [0.158339858811019], [0.15831853564583764], [0.15829744340869809], [0.15827658941111394], [0.15825598088001613], [0.15823562495531754], [0.15821552868750863], [0.15819569903528674], [0.158176142863219], [0.15815686693943837], [0.15813787793337564], [0.1581191824135261], [0.15810078684525314], [0.15808269758862775], [0.15806492089630628], [0.15804746291144503], [0.1580303296656553], [0.15801352707699517], [0.15799706094800298], [0.15798093696377002], [0.1579651606900543], [0.15794973757143574], [0.15793467292951283], [0.1579199719611419], [0.157905639736719], [0.1578916811985047], [0.15787810115899367], [0.1578649042993265], [0.1578520951677484], [0.1578396781781106], [0.15782765760841844], [0.15781603759942484], [0.15780482215327], [0.15779401513216665], [0.15778362025713374], [0.15777364110677577], [0.15776408111611], [0.15775494357544162], [0.15774623162928625], [0.15773794827534227], [0.15773009636350943], [0.15772267859495798], [0.15771569752124656], [0.1577091555434883], [0.15770305491156783], [0.1576973977234066], [0.15769218592427955], [0.15768742130617983], [0.1576831055072354], [0.15767924001117514], [0.15767582614684558], [0.1576728650877781], [0.15767035785180644], [0.15766830530073622], [0.1576667081400635], [0.15766556691874595], [0.15766488202902365], [0.15766465370629162]], "phugoidFreqHz": [[0.16565000459478874], [0.16565000299033034], [0.16564999817751622], [0.16564999015802986], [0.16564997893467617], [0.16564996451138064], [0.16564994689318802], [0.1656499260862606], [0.16564990209787583], [0.16564987493642405], [0.16564984461140542], [0.16564981113342644], [0.16564977451419652], [0.16564973476652375], [0.1656496919043104], [0.16564964594254794], [0.16564959689731218], [0.1656495447857573], [0.16564948962610984], [0.16564943143766245], [0.16564937024076712], [0.16564930605682818], [0.16564923890829436], [0.1656491688186516], [0.1656490958124142], [0.16564901991511652], [0.16564894115330428], [0.16564885955452488], [0.1656487751473177], [0.16564868796120463], [0.16564859802667933], [0.16564850537519657], [0.16564841003916128], [0.16564831205191738], [0.16564821144773592], [0.165648108261803], [0.16564800253020764], [0.16564789428992935], [0.16564778357882443], [0.16564767043561374], [0.16564755489986824], [0.16564743701199575], [0.1656473168132266], [0.1656471943455992], [0.16564706965194514], [0.16564694277587463], [0.1656468137617609], [0.16564668265472474], [0.16564654950061877], [0.16564641434601157], [0.1656462772381708], [0.16564613822504734], [0.16564599735525817], [0.1656458546780694], [0.16564571024337899], [0.16564556410169948], [0.16564541630413995], [0.16564526690238876], [0.16564511594869452], [0.165644963495849], [0.16564480959716762], [0.16564465430647132], [0.16564449767806763], [0.16564433976673162], [0.16564418062768685], [0.16564402031658595], [0.16564385888949126], [0.16564369640285498], [0.16564353291349979], [0.16564336847859862], [0.16564320315565487], [0.1656430370024822], [0.1656428700771844], [0.16564270243813495], [0.16564253414395672], [0.16564236525350134], [0.16564219582582873], [0.16564202592018634], [0.16564185559598857], [0.16564168491279593], [0.1656415139302941], [0.16564134270827316], [0.16564117130660666], [0.16564099978523075], [0.16564082820412318], [0.16564065662328212], [0.16564048510270565], [0.16564031370237034], [0.16564014248221037], [0.16563997150209672], [0.16563980082181623], [0.16563963050105052], [0.16563946059935516], [0.16563929117613901], [0.16563912229064348], [0.16563895400192138], [0.16563878636881685], [0.1656386194499443], [0.1656384533036683], [0.165638287988083], [0.1656381235609917], [0.16563796007988696], [0.16563779760193023], [0.16563763618393185], [0.1656374758823315], [0.16563731675317814], [0.16563715885211056], [0.1656370022343379], [0.16563684695462041], [0.16563669306725037], [0.16563654062603284], [0.16563638968426697], [0.16563624029472773], [0.16563609250964675], [0.165635946380695], [0.16563580195896369], [0.16563565929494722], [0.16563551843852523], [0.16563537943894505], [0.16563524234480462], [0.1656351072040357], [0.16563497406388686], [0.16563484297090683], [0.16563471397092877], [0.1656345871090536], [0.16563446242963467], [0.16563433997626237], [0.1656342197917484], [0.1656341019181111], [0.16563398639656102], [0.16563387326748585], [0.16563376257043716], [0.16563365434411587], [0.16563354862635893], [0.16563344545412645], [0.16563334486348819], [0.1656332468896114], [0.16563315156674843], [0.16563305892822472], [0.16563296900642716], [0.16563288183279273], [0.16563279743779757], [0.1656327158509464], [0.1656326371007621], [0.16563256121477585], [0.1656324882195173], [0.16563241814050556], [0.16563235100224022], [0.1656322868281926], [0.1656322256407978], [0.16563216746144677], [0.16563211231047878], [0.16563206020717433], [0.16563201116974854], [0.16563196521534462], [0.16563192236002788], [0.16563188261878034], [0.1656318460054953], [0.1656318125329725], [0.16563178221291366], [0.16563175505591837], [0.16563173107148066], [0.16563171026798523], [0.16563169265270475], [0.16563167823179745], [0.1656316670103047], [0.16563165899214952], [0.16563165418013487], [0.16563165257594303]], "phugoidDamp": [[0.05292127414822022], [0.052921330553752706], [0.05292149975298668], [0.05292178169384337], [0.052922176289529756], [0.05292268341855767], [0.052923302924761516], [0.052924034617323625], [0.0529248782708067], [0.05292583362518985], [0.052926900385911746], [0.05292807822391955], [0.05292936677572335], [0.05293076564345658], [0.05293227439494305], [0.052933892563769805], [0.05293561964936542], [0.05293745511708614], [0.052939398398307136], [0.052941448890520375], [0.05294360595744003], [0.05294586892911333], [0.052948237102038845], [0.05295070973929187], [0.05295328607065619], [0.052955965292763744], [0.05295874656924081], [0.052961629030862344], [0.052964611775713266], [0.05296769386935783], [0.05297087434501656], [0.0529741522037511], [0.052977526414657666], [0.052980995915068045], [0.052984559610759395], [0.05298821637617269], [0.05299196505463938], [0.05299580445861742], [0.052999733369935895], [0.05300375054004905], [0.0530078546902992], [0.05301204451218964], [0.0530163186676665], [0.05302067578941088], [0.05302511448114019], [0.05302963331792015], [0.05303423084648639], [0.05303890558557651], [0.053043656026272465], [0.053048480632353436], [0.05305337784065937], [0.053058346061465145], [0.05306338367886554], [0.05306848905117137], [0.05307366051131622], [0.053078896367274885], [0.05308419490249227], [0.053089554376324344], [0.05309497302448976], [0.05310044905953339], [0.05310598067130101], [0.05311156602742547], [0.053117203273824715], [0.05312289053521097], [0.05312862591561184], [0.05313440749890274], [0.053140233349351154], [0.05314610151217217], [0.05315201001409587], [0.053157956863946136], [0.05316394005323079], [0.0531699575567434], [0.05317600733317618], [0.05318208732574452], [0.053188195462822316], [0.053194329658588724], [0.05320048781368564], [0.05320666781588619], [0.05321286754077395], [0.05321908485243267], [0.053225317604146366], [0.053231563639109754], [0.053237820791148804], [0.05324408688545075], [0.053250359739304365], [0.05325663716284915], [0.05326291695983396], [0.053269196928384305], [0.05327547486177883], [0.053281748549233475], [0.0532880157766945], [0.05329427432763884], [0.05330052198388202], [0.05330675652639344], [0.05331297573611851], [0.05331917739480684], [0.05332535928584749], [0.053331519195108715], [0.05333765491178456], [0.05334376422924533], [0.05334984494589312], [0.053355894866021464], [0.05336191180067908], [0.05336789356853638], [0.053373837996755144], [0.05337974292186106], [0.05338560619061751], [0.05339142566090135], [0.05339719920257984], [0.05340292469838767], [0.05340860004480464], [0.05341422315293239], [0.053419791949370604], [0.05342530437709164], [0.05343075839631315], [0.05343615198536848], [0.05344148314157364], [0.05344674988209139], [0.05345195024479051], [0.05345708228910136], [0.05346214409686547], [0.05346713377318024], [0.05347204944723688], [0.0534768892731517], [0.053481651430790714], [0.05348633412658538], [0.05349093559434091], [0.05349545409603529], [0.05349988792260881], [0.053504235394743756], [0.053508494863633495], [0.05351266471174074], [0.053516743353543984], [0.0535207292362719], [0.05352462084062545], [0.053528416681486515], [0.05353211530861306], [0.05353571530732041], [0.053539215299147395], [0.05354261394250826], [0.05354590993332811], [0.0535491020056632], [0.053552188932304005], [0.053555169525362115], [0.05355804263683924], [0.053560807159178804], [0.053563462025799084], [0.05356600621160828], [0.05356843873350011], [0.0535707586508303], [0.05357296506587361], [0.05357505712426046], [0.05357703401539359], [0.05357889497284372], [0.053580639274724506], [0.05358226624404604], [0.053583775249046985], [0.05358516570350496], [0.05358643706702474], [0.05358758884530417], [0.053588620590378146], [0.05358953190083917], [0.053590322422036096], [0.05359099184624836], [0.05359153991283965], [0.0535919664083853], [0.05359227116677878], [0.053592454069313844], [0.05359251504474315]]}}, "propulsion": {"throttle": [[0.31069358012570697], [0.3106946372952503], [0.31069780847547446], [0.31070309266928864], [0.31071048822048025], [0.3107199928082137], [0.31073160345005396], [0.31074531650236553], [0.3107611276600246], [0.3107790319583496], [0.3107990237735626], [0.310821096823849], [0.3108452441707475], [0.31087145822065143], [0.31089973072604593], [0.31093005278715585], [0.31096241485413667], [0.31099680672859253], [0.31103321756552893], [0.3110716358762297], [0.31111204952978533], [0.3111544457560563], [0.31119881114825354], [0.31124513166552775], [0.3112933926360982], [0.3113435787601644], [0.31139567411324615], [0.31144966214948533], [0.3115055257051547], [0.31156324700241006], [0.3116228076530097], [0.3116841886625217], [0.31174737043418826], [0.31181233277347326], [0.31187905489249695], [0.31194751541457516], [0.31201769237916066], [0.3120895632467442], [0.31216310490410454], [0.3122382936694512], [0.3123151052982158], [0.31239351498843965], [0.31247349738682767], [0.31255502659465834], [0.3126380761741229], [0.312722619154639], [0.3128086280394291], [0.3128960748124159], [0.3129849309449937], [0.31307516740337665], [0.3131667546558154], [0.3132596626800986], [0.3133538609714234], [0.31344931855020447], [0.3135460039702129], [0.31364388532683746], [0.3137429302657464], [0.31384310599136356], [0.3139443792760238], [0.3140467164688114], [0.31415008350507284], [0.3142544459158191], [0.3143597688374006], [0.3144660170214586], [0.31457315484500187], [0.31468114632068694], [0.3147899551072887], [0.31489954452044494], [0.31500987754348975], [0.3151209168385706], [0.31523262475785896], [0.31534496335507983], [0.3154578943971966], [0.31557137937610735], [0.31568537952086123], [0.31579985580978925], [0.31591476898285603], [0.31603007955439305], [0.31614574782571186], [0.3162617338981625], [0.3163779976861375], [0.31649449893045606], [0.3166111972117203], [0.31672805196406295], [0.31684502248872437], [0.316962067968173], [0.3170791474799901], [0.3171962200113026], [0.3173132444729326], [0.317430179714123], [0.3175469845369257], [0.31766361771115237], [0.31778003798919907], [0.31789620412101577], [0.3180120748691923], [0.31812760902430265], [0.3182427654199946], [0.31835750294859255], [0.31847178057650716], [0.31858555735969546], [0.3186987924594981], [0.31881144515814924], [0.31892347487464734], [0.31903484118046327], [0.31914550381556556], [0.31925542270396434], [0.31936455797004437], [0.319472869954054], [0.3195803192284173], [0.31968686661339357], [0.3197924731931256], [0.31989710033156316], [0.3200007096882399], [0.3201032632342523], [0.3202047232680022], [0.32030505243093677], [0.3204042137233244], [0.3205021705197288], [0.3205988865848226], [0.32069432608850795], [0.32078845362159936], [0.3208812342108559], [0.3209726333342087], [0.3210626169357895], [0.32115115144078316], [0.3212382037701718], [0.32132374135528546], [0.3214077321522484], [0.321490144656239], [0.3215709479154772], [0.3216501115452034], [0.3217276057412262], [0.32180340129347745], [0.3218774695991606], [0.3219497826758526], [0.32202031317423924], [0.3220890343905391], [0.3221559202789236], [0.3222209454635427], [0.3222840852500003], [0.3223453156371348], [0.3224046133279054], [0.3224619557405068], [0.3225173210186958], [0.32257068804218586], [0.32262203643657444], [0.32267134658288193], [0.3227185996267977], [0.32276377748769897], [0.32280686286722304], [0.3228478392573493], [0.32288669094844685], [0.3229234030365884], [0.32295796143087574], [0.3229903528600099], [0.3230205648787507], [0.3230485858739208], [0.3230744050697993], [0.3230980125335472], [0.3231193991799258], [0.32313855677559905], [0.3231554779431764], [0.32317015616462835], [0.3231825857850358], [0.3231927620141752], [0.32320068093003645], [0.32320633948015165], [0.32320973548326704], [0.32321086762998347]], "battery_energy": [[0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0]], "battery_voltage": [[0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0]], "voltage_under_load": [[0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0]], "voltage_open_circuit": [[0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0]], "state_of_charge": [[0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0]], "thrust_breakdown": {}, "acoustic_outputs": {"fan": {"exit_static_temperature": [[289.60992146453344], [289.60971863794464], [289.6091102291131], [289.6080964508188], [289.6066776576126], [289.60485434569165], [289.6026271527263], [289.59999685763665], [289.5969643803199], [289.59353078132926], [289.5896972615019], [289.585465161539], [289.5808359615376], [289.57581128047116], [289.57039287562446], [289.564582641978], [289.55838261154514], [289.55179495266145], [289.54482196922544], [289.53746609989304], [289.52972991722373], [289.5216161267815], [289.5131275661867], [289.50426720412474], [289.49503813930653], [289.48544359938467], [289.47548693982367], [289.4651716427268], [289.4545013156171], [289.44347969017554], [289.4321106209354], [289.42039808393395], [289.4083461753206], [289.3959591099246], [289.3832412197804], [289.3701969526116], [289.35683087027513], [289.3431476471656], [289.3291520685794], [289.31484902904134], [289.3002435305913], [289.2853406810351], [289.2701456921577], [289.25466387789913], [289.23890065249645], [289.2228615285888], [289.2065521152899], [289.189978116225], [289.1731453275357], [289.1560596358534], [289.13872701623865], [289.1211535300918], [289.1033453230327], [289.08530862275086], [289.06704973682633], [289.04857505052456], [289.0298910245618], [289.0110041928458], [288.99192116019], [288.9726486000036], [288.95319325195703], [288.9335619196245], [288.91376146810467], [288.8937988216194], [288.8736809610913], [288.8534149217027], [288.83300779043503], [288.8124667035898], [288.7917988442924], [288.7710114399806], [288.75011175987646], [288.72910711244367], [288.70800484283194], [288.6868123303078], [288.66553698567446], [288.6441862486793], [288.62276758541265], [288.60128848569616], [288.57975646046464], [288.55817903913794], [288.536563766989], [288.5149182025049], [288.49324991474344], [288.4715664806868], [288.4498754825915], [288.4281845053374], [288.406501133775], [288.3848329500735], [288.36318753106946], [288.3415724456173], [288.319995251943], [288.2984634950009], [288.27698470383604], [288.2555663889512], [288.2342160396811], [288.2129411215738], [288.19174907378016], [288.1706473064532], [288.14964319815715], [288.12874409328765], [288.10795729950394], [288.08729008517395], [288.0667496768336], [288.04634325665927], [288.0260779599582], [288.00596087267274], [287.9859990289039], [287.96619940845176], [287.94656893437565], [287.92711447057377], [287.90784281938403], [287.8887607192055], [287.86987484214274], [287.8511917916745], [287.83271810034404], [287.8144602274762], [287.79642455691925], [287.77861739481335], [287.76104496738657], [287.74371341877793], [287.72662880888987], [287.7097971112702], [287.69322421102385], [287.67691590275604], [287.6608778885464], [287.6451157759567], [287.62963507606963], [287.61444120156364], [287.5995394648204], [287.5849350760685], [287.5706331415615], [287.55663866179407], [287.542956529754], [287.529591529212], [287.51654833304934], [287.5038315016252], [287.49144548118255], [287.47939460229435], [287.4676830783495], [287.4563150040809], [287.44529435413403], [287.4346249816779], [287.4243106170582], [287.414354866494], [287.4047612108172], [287.3955330042556], [287.38667347326145], [287.37818571538344], [287.37007269818395], [287.3623372582022], [287.3549820999634], [287.34800979503257], [287.34142278111653], [287.3352233612118], [287.32941370280014], [287.3239958370903], [287.3189716583089], [287.3143429230379], [287.3101112496012], [287.30627811749895], [287.3028448668903], [287.29981269812544], [287.2971826713253], [287.2949557060122], [287.2931325807882], [287.29171393306206], [287.29070025882777], [287.2900919124905], [287.28988910674286]], "exit_static_pressure": [[97971.29090546048], [97970.93023141337], [97969.84834186258], [97968.04563452388], [97965.52277207188], [97962.28068186218], [97958.32055554284], [97953.64384855566], [97948.25227952638], [97942.14782954555], [97935.33274133972], [97927.80951833332], [97919.5809236024], [97910.6499787205], [97901.0199624969], [97890.69440960887], [97879.67710912807], [97867.97210294216], [97855.5836840726], [97842.51639488916], [97828.77502522324], [97814.36461037981], [97799.29042905013], [97783.55800112561], [97767.17308541492], [97750.14167726494], [97732.47000608734], [97714.16453279217], [97695.23194712939], [97675.67916494065], [97655.51332532242], [97634.741787702], [97613.37212882821], [97591.4121396785], [97568.86982228386], [97545.75338647388], [97522.07124654304], [97497.83201784072], [97473.04451328614], [97447.71773981085], [97421.86089473011], [97395.48336204533], [97368.59470867949], [97341.20468064795], [97313.32319916553], [97284.96035669385], [97256.12641292873], [97226.83179073165], [97197.08707200612], [97166.90299352193], [97136.29044268871], [97105.26045328127], [97073.82420111947], [97041.99299970311], [97009.77829580636], [96977.19166503132], [96944.24480732552], [96910.94954246294], [96877.31780549315], [96843.3616421587], [96809.09320428452], [96774.5247451403], [96739.66861477883], [96704.53725535217], [96669.14319640746], [96633.49905016525], [96597.61750678172], [96561.51132959733], [96525.1933503739], [96488.67646452229], [96451.97362632223], [96415.09784413729], [96378.06217562594], [96340.87972295162], [96303.56362799321], [96266.12706755787], [96228.58324859879], [96190.94540343872], [96153.2267850025], [96115.44066205865], [96077.60031447414], [96039.71902848153], [96001.81009196282], [95963.88678974951], [95925.96239894214], [95888.05018425024], [95850.1633933545], [95812.3152522926], [95774.51896087077], [95736.78768810189], [95699.13456767234], [95661.57269343841], [95624.11511495443], [95586.77483303327], [95549.56479534107], [95512.49789202763], [95475.58695139288], [95438.8447355922], [95402.28393638012], [95365.91717089474], [95329.75697748385], [95293.81581157353], [95258.10604158012], [95222.63994486774], [95187.42970375091], [95152.48740154403], [95117.82501865897], [95083.45442875086], [95049.3873949132], [95015.63556592407], [94982.21047254234], [94949.12352385672], [94916.38600368699], [94884.00906703858], [94852.00373661132], [94820.38089936269], [94789.15130312653], [94758.32555328756], [94727.91410951197], [94697.92728253594], [94668.37523101036], [94639.26795840448], [94610.61530996769], [94582.42696974972], [94554.71245768073], [94527.48112671047], [94500.74216000774], [94474.50456821997], [94448.77718679328], [94423.56867335392], [94398.88750515021], [94374.74197655641], [94351.14019663802], [94328.09008677902], [94305.59937837101], [94283.67561056459], [94262.32612808365], [94241.55807910116], [94221.37841317899], [94201.79387926919], [94182.81102377929], [94164.43618869987], [94146.67550979555], [94129.53491485945], [94113.02012203005], [94097.13663817238], [94081.88975732187], [94067.28455919179], [94053.32590774418], [94040.0184498243], [94027.36661385847], [94015.37460861546], [94004.04642203137], [93993.38582009806], [93983.39634581521], [93974.08131820582], [93965.44383139524], [93957.48675375401], [93950.21272710373], [93943.62416598697], [93937.72325700046], [93932.51195819199], [93927.99199852039], [93924.1648773796], [93921.03186418608], [93918.59399802919], [93916.852087386], [93915.80670989877], [93915.4582122163]], "exit_stagnation_temperature": [[338.28730746571597], [338.2870738633191], [338.28637313781326], [338.28520553422356], [338.28357146083073], [338.28147148902735], [338.2789063531189], [338.27587695006605], [338.27238433917205], [338.26842974171194], [338.26401454050523], [338.25914027943224], [338.2538086628957], [338.2480215552226], [338.24178098001414], [338.23508911943713], [338.2279483134614], [338.2203610590417], [338.212330009244], [338.20385797231876], [338.19494791071793], [338.1856029400602], [338.17582632804044], [338.1656214932881], [338.1549920041716], [338.14394157755015], [338.1324740774745], [338.12059351383584], [338.10830404096356], [338.0956099561728], [338.0825156982615], [338.06902584595895], [338.0551451163239], [338.04087836309594], [338.02623057499824], [338.01120687399276], [337.9958125134891], [337.9800528765089], [337.96393347380206], [337.9474599419207], [337.9306380412477], [337.9134736539831], [337.89597278208703], [337.8781415451806], [337.85998617840715], [337.8415130302505], [337.82272856031705], [337.8036393370749], [337.78425203555867], [337.76457343503523], [337.7446104166323], [337.72436996093336], [337.70385914553646], [337.68308514257916], [337.66205521623067], [337.640776720152], [337.6192570949249], [337.5975038654493], [337.57552463831274], [337.5533270991305], [337.5309190098579], [337.5083082060761], [337.48550259425275], [337.46251014897706], [337.4393389101707], [337.4159969802776], [337.39249252143], [337.3688337525943], [337.3450289466973], [337.3210864277338], [337.29701456785546], [337.27282178444267], [337.24851653716274], [337.22410732501027], [337.1996026833363], [337.17501118086295], [337.1503414166877], [337.125602017276], [337.1008016334455], [337.0759489373401], [337.0510526193985], [337.02612138531435], [337.0011639529931], [336.97618904950264], [336.95120540802213], [336.92622176478824], [336.9012468560396], [336.87628941496286], [336.85135816863846], [336.82646183498844], [336.80160911972894], [336.77680871332484], [336.75206928795234], [336.7273994944648], [336.702807959369], [336.67830328180804], [336.6538940305542], [336.629588741013], [336.6053959122385], [336.5813240039611], [336.5573814336292], [336.53357657346606], [336.50991774754254], [336.48641322886516], [336.46307123648415], [336.4398999326193], [336.41690741980494], [336.39410173805794], [336.3714908620648], [336.3490826983941], [336.32688508273156], [336.3049057771393], [336.283152467342], [336.26163276003984], [336.2403541802476], [336.2193241686639], [336.1985500790689], [336.17803917575327], [336.1577986309775], [336.1378355224641], [336.11815683092254], [336.09876943760804], [336.0796801219157], [336.0608955590093], [336.0424223174873], [336.02426685708645], [336.00643552642174], [335.9889345607673], [335.9717700798756], [335.95494808583794], [335.9384744609845], [335.9223549658283], [335.9065952370508], [335.89120078553066], [335.876176994416], [335.8615291172431], [335.8472622760983], [335.8333814598278], [335.81989152229215], [335.8067971806695], [335.7941030138061], [335.7818134606147], [335.7699328185229], [335.7584652419695], [335.747414740953], [335.736785179628], [335.72658027495487], [335.7168035953995], [335.7074585596859], [335.69854843560006], [335.6900763388479], [335.6820452319653], [335.67445792328215], [335.6673170659406], [335.66062515696717], [335.6543845363993], [335.6485973864673], [335.64326573083144], [335.6383914338735], [335.63397620004605], [335.6300215732755], [335.6265289364223], [335.6234995107974], [335.62093435573564], [335.618834368225], [335.6172002825924], [335.6160326702479], [335.6153319394841], [335.6150983353339]], "exit_stagnation_pressure": [[97971.29090546048], [97970.93023141337], [97969.84834186258], [97968.04563452388], [97965.52277207188], [97962.28068186218], [97958.32055554284], [97953.64384855566], [97948.25227952638], [97942.14782954555], [97935.33274133972], [97927.80951833332], [97919.5809236024], [97910.6499787205], [97901.0199624969], [97890.69440960887], [97879.67710912807], [97867.97210294216], [97855.5836840726], [97842.51639488916], [97828.77502522324], [97814.36461037981], [97799.29042905013], [97783.55800112561], [97767.17308541492], [97750.14167726494], [97732.47000608734], [97714.16453279217], [97695.23194712939], [97675.67916494065], [97655.51332532242], [97634.741787702], [97613.37212882821], [97591.4121396785], [97568.86982228386], [97545.75338647388], [97522.07124654304], [97497.83201784072], [97473.04451328614], [97447.71773981085], [97421.86089473011], [97395.48336204533], [97368.59470867949], [97341.20468064795], [97313.32319916553], [97284.96035669385], [97256.12641292873], [97226.83179073165], [97197.08707200612], [97166.90299352193], [97136.29044268871], [97105.26045328127], [97073.82420111947], [97041.99299970311], [97009.77829580636], [96977.19166503132], [96944.24480732552], [96910.94954246294], [96877.31780549315], [96843.3616421587], [96809.09320428452], [96774.5247451403], [96739.66861477883], [96704.53725535217], [96669.14319640746], [96633.49905016525], [96597.61750678172], [96561.51132959733], [96525.1933503739], [96488.67646452229], [96451.97362632223], [96415.09784413729], [96378.06217562594], [96340.87972295162], [96303.56362799321], [96266.12706755787], [96228.58324859879], [96190.94540343872], [96153.2267850025], [96115.44066205865], [96077.60031447414], [96039.71902848153], [96001.81009196282], [95963.88678974951], [95925.96239894214], [95888.05018425024], [95850.1633933545], [95812.3152522926], [95774.51896087077], [95736.78768810189], [95699.13456767234], [95661.57269343841], [95624.11511495443], [95586.77483303327], [95549.56479534107], [95512.49789202763], [95475.58695139288], [95438.8447355922], [95402.28393638012], [95365.91717089474], [95329.75697748385], [95293.81581157353], [95258.10604158012], [95222.63994486774], [95187.42970375091], [95152.48740154403], [95117.82501865897], [95083.45442875086], [95049.3873949132], [95015.63556592407], [94982.21047254234], [94949.12352385672], [94916.38600368699], [94884.00906703858], [94852.00373661132], [94820.38089936269], [94789.15130312653], [94758.32555328756], [94727.91410951197], [94697.92728253594], [94668.37523101036], [94639.26795840448], [94610.61530996769], [94582.42696974972], [94554.71245768073], [94527.48112671047], [94500.74216000774], [94474.50456821997], [94448.77718679328], [94423.56867335392], [94398.88750515021], [94374.74197655641], [94351.14019663802], [94328.09008677902], [94305.59937837101], [94283.67561056459], [94262.32612808365], [94241.55807910116], [94221.37841317899], [94201.79387926919], [94182.81102377929], [94164.43618869987], [94146.67550979555], [94129.53491485945], [94113.02012203005], [94097.13663817238], [94081.88975732187], [94067.28455919179], [94053.32590774418], [94040.0184498243], [94027.36661385847], [94015.37460861546], [94004.04642203137], [93993.38582009806], [93983.39634581521], [93974.08131820582], [93965.44383139524], [93957.48675375401], [93950.21272710373], [93943.62416598697], [93937.72325700046], [93932.51195819199], [93927.99199852039], [93924.1648773796], [93921.03186418608], [93918.59399802919], [93916.852087386], [93915.80670989877], [93915.4582122163]], "exit_velocity": [[312.75609088383135], [312.7559916503828], [312.75569398456406], [312.755197989941], [312.7545038390846], [312.7536117735114], [312.7525221036015], [312.7512352084899], [312.74975153593994], [312.74807160218694], [312.74619599176265], [312.74412535729414], [312.7418604192812], [312.739401965848], [312.7367508524742], [312.73390800170046], [312.7308744028128], [312.72765111150267], [312.72423924950556], [312.7206400042168], [312.71685462828236], [312.7128844391702], [312.7087308187185], [312.7043952126602], [312.69987913012926], [312.6951841431388], [312.69031188604515], [312.6852640549835], [312.6800424072881], [312.67464876088644], [312.6690849936758], [312.6633530428766], [312.6574549043688], [312.65139263200365], [312.64516833689885], [312.63878418671175], [312.63224240489245], [312.6255452699223], [312.61869511452653], [312.61169432487196], [312.6045453397458], [312.5972506497167], [312.58981279627454], [312.58223437095603], [312.5745180144519], [312.5666664156952], [312.5586823109359], [312.5505684827938], [312.54232775930325], [312.5339630129316], [312.5254771595915], [312.5168731576329], [312.5081540068205], [312.499322747297], [312.4903824585337], [312.4813362582631], [312.4721873014045], [312.4629387789685], [312.45359391695484], [312.44415597523465], [312.4346282464225], [312.42501405473456], [312.4153167548376], [312.4055397306848], [312.3956863943429], [312.3857601848095], [312.37576456681813], [312.3657030296359], [312.3555790858519], [312.34539627015783], [312.3351581381184], [312.32486826493414], [312.3145302442021], [312.304147686661], [312.2937242189382], [312.2832634822847], [312.2727691313084], [312.26224483270016], [312.2516942639557], [312.24112111209394], [312.23052907237116], [312.21992184698973], [312.20930314380934], [312.1986766750483], [312.1880461559904], [312.1774153036833], [312.1667878356414], [312.15616746854545], [312.14555791694187], [312.13496289194234], [312.12438609992574], [312.11383124123813], [312.103302008899], [312.09280208730377], [312.0823351509346], [312.0719048630701], [312.06151487449955], [312.0511688222423], [312.0408703282717], [312.03062299823927], [312.0204304202113], [312.01029616340526], [312.00022377693637], [311.99021678856735], [311.98027870346726], [311.9704130029791], [311.96062314339116], [311.9509125547235], [311.94128463951324], [311.93174277162154], [311.92229029503864], [311.91293052270663], [311.9036667353509], [311.89450218031976], [311.8854400704399], [311.87648358288004], [311.8676358580294], [311.8588999983867], [311.8502790674637], [311.8417760887014], [311.8333940444011], [311.8251358746673], [311.81700447636956], [311.80900270211316], [311.80113335923187], [311.7933992087916], [311.7858029646123], [311.77834729230574], [311.77103480832966], [311.7638680790614], [311.7568496198855], [311.7499818943011], [311.74326731305], [311.73670823325716], [311.73030695759604], [311.7240657334696], [311.7179867522116], [311.71207214830866], [311.7063239986404], [311.70074432174255], [311.695335077087], [311.6900981643865], [311.68503542291916], [311.68014863087126], [311.67543950470827], [311.6709096985606], [311.66656080363634], [311.66239434765345], [311.6584117942985], [311.6546145427019], [311.6510039269407], [311.6475812155643], [311.64434761114126], [311.64130424983136], [311.63845220097994], [311.63579246673794], [311.6333259817024], [311.6310536125873], [311.62897615790854], [311.62709434770557], [311.62540884327666], [311.6239202369445], [311.6226290518453], [311.6215357417417], [311.6206406908605], [311.6199442137565], [311.6194465552], [311.61914789008915], [311.6190483233884]]}, "core": {"exit_static_temperature": [[701.33484633774], [701.3348051750949], [701.3346817017175], [701.3344759612767], [701.3341880265358], [701.333817999327], [701.3333660105135], [701.332832219941], [701.3322168163804], [701.331520017458], [701.3307420695766], [701.3298832478255], [701.3289438558787], [701.3279242258862], [701.3268247183505], [701.325645721996], [701.3243876536282], [701.3230509579781], [701.3216361075444], [701.3201436024177], [701.3185739700995], [701.3169277653096], [701.3152055697842], [701.3134079920633], [701.3115356672694], [701.3095892568766], [701.307569448468], [701.3054769554883], [701.303312516982], [701.301076897325], [701.2987708859476], [701.2963952970468], [701.2939509692915], [701.2914387655167], [701.2888595724114], [701.2862143001964], [701.2835038822955], [701.2807292749951], [701.2778914570994], [701.274991429577], [701.2720302151956], [701.2690088581555], [701.2659284237102], [701.2627899977819], [701.25959468657], [701.256343616152], [701.2530379320771], [701.2496787989529], [701.2462674000275], [701.2428049367622], [701.2392926284001], [701.2357317115273], [701.2321234396293], [701.2284690826406], [701.2247699264897], [701.2210272726377], [701.2172424376115], [701.2134167525338], [701.2095515626462], [701.2056482268285], [701.2017081171131], [701.1977326181951], [701.1937231269394], [701.1896810518818], [701.1856078127282], [701.1815048398489], [701.177373573769], [701.17321546466], [701.1690319718205], [701.1648245631616], [701.1605947146853], [701.1563439099633], [701.1520736396095], [701.1477854007547], [701.1434806965177], [701.1391610354739], [701.1348279311228], [701.1304829013566], [701.1261274679243], [701.1217631558952], [701.1173914931253], [701.1130140097193], [701.1086322374927], [701.1042477094362], [701.0998619591786], [701.0954765204486], [701.0910929265403], [701.0867127097748], [701.0823374009678], [701.0779685288938], [701.0736076197545], [701.0692561966456], [701.0649157790288], [701.0605878822023], [701.056274016774], [701.0519756881388], [701.0476943959552], [701.0434316336259], [701.0391888877809], [701.0349676377641], [701.0307693551205], [701.0265955030881], [701.0224475360953], [701.0183268992561], [701.014235027875], [701.0101733469515], [701.0061432706905], [701.0021462020163], [700.9981835320905], [700.994256639835], [700.9903668914599], [700.9865156399941], [700.9827042248228], [700.97893397123], [700.9752061899446], [700.9715221766938], [700.9678832117596], [700.9642905595423], [700.9607454681318], [700.95724916888], [700.9538028759831], [700.9504077860681], [700.9470650777865], [700.943775911415], [700.9405414284595], [700.9373627512705], [700.934240982661], [700.9311772055336], [700.928172482514], [700.9252278555915], [700.9223443457669], [700.9195229527074], [700.9167646544086], [700.9140704068659], [700.9114411437503], [700.908877776095], [700.9063811919874], [700.9039522562714], [700.901591810255], [700.8993006714277], [700.8970796331864], [700.894929464568], [700.8928509099906], [700.8908446890053], [700.8889114960522], [700.8870520002299], [700.8852668450694], [700.8835566483198], [700.8819220017391], [700.8803634708986], [700.8788815949915], [700.8774768866539], [700.8761498317921], [700.8749008894196], [700.8737304915061], [700.8726390428301], [700.8716269208452], [700.8706944755534], [700.8698420293895], [700.8690698771104], [700.8683782856998], [700.867767494277], [700.8672377140184], [700.866789128086], [700.8664218915663], [700.8661361314194], [700.8659319464359], [700.865809407204], [700.8657685560859]], "exit_static_pressure": [[97971.29090546048], [97970.93023141337], [97969.84834186258], [97968.04563452388], [97965.52277207188], [97962.28068186218], [97958.32055554284], [97953.64384855566], [97948.25227952638], [97942.14782954555], [97935.33274133972], [97927.80951833332], [97919.5809236024], [97910.6499787205], [97901.0199624969], [97890.69440960887], [97879.67710912807], [97867.97210294216], [97855.5836840726], [97842.51639488916], [97828.77502522324], [97814.36461037981], [97799.29042905013], [97783.55800112561], [97767.17308541492], [97750.14167726494], [97732.47000608734], [97714.16453279217], [97695.23194712939], [97675.67916494065], [97655.51332532242], [97634.741787702], [97613.37212882821], [97591.4121396785], [97568.86982228386], [97545.75338647388], [97522.07124654304], [97497.83201784072], [97473.04451328614], [97447.71773981085], [97421.86089473011], [97395.48336204533], [97368.59470867949], [97341.20468064795], [97313.32319916553], [97284.96035669385], [97256.12641292873], [97226.83179073165], [97197.08707200612], [97166.90299352193], [97136.29044268871], [97105.26045328127], [97073.82420111947], [97041.99299970311], [97009.77829580636], [96977.19166503132], [96944.24480732552], [96910.94954246294], [96877.31780549315], [96843.3616421587], [96809.09320428452], [96774.5247451403], [96739.66861477883], [96704.53725535217], [96669.14319640746], [96633.49905016525], [96597.61750678172], [96561.51132959733], [96525.1933503739], [96488.67646452229], [96451.97362632223], [96415.09784413729], [96378.06217562594], [96340.87972295162], [96303.56362799321], [96266.12706755787], [96228.58324859879], [96190.94540343872], [96153.2267850025], [96115.44066205865], [96077.60031447414], [96039.71902848153], [96001.81009196282], [95963.88678974951], [95925.96239894214], [95888.05018425024], [95850.1633933545], [95812.3152522926], [95774.51896087077], [95736.78768810189], [95699.13456767234], [95661.57269343841], [95624.11511495443], [95586.77483303327], [95549.56479534107], [95512.49789202763], [95475.58695139288], [95438.8447355922], [95402.28393638012], [95365.91717089474], [95329.75697748385], [95293.81581157353], [95258.10604158012], [95222.63994486774], [95187.42970375091], [95152.48740154403], [95117.82501865897], [95083.45442875086], [95049.3873949132], [95015.63556592407], [94982.21047254234], [94949.12352385672], [94916.38600368699], [94884.00906703858], [94852.00373661132], [94820.38089936269], [94789.15130312653], [94758.32555328756], [94727.91410951197], [94697.92728253594], [94668.37523101036], [94639.26795840448], [94610.61530996769], [94582.42696974972], [94554.71245768073], [94527.48112671047], [94500.74216000774], [94474.50456821997], [94448.77718679328], [94423.56867335392], [94398.88750515021], [94374.74197655641], [94351.14019663802], [94328.09008677902], [94305.59937837101], [94283.67561056459], [94262.32612808365], [94241.55807910116], [94221.37841317899], [94201.79387926919], [94182.81102377929], [94164.43618869987], [94146.67550979555], [94129.53491485945], [94113.02012203005], [94097.13663817238], [94081.88975732187], [94067.28455919179], [94053.32590774418], [94040.0184498243], [94027.36661385847], [94015.37460861546], [94004.04642203137], [93993.38582009806], [93983.39634581521], [93974.08131820582], [93965.44383139524], [93957.48675375401], [93950.21272710373], [93943.62416598697], [93937.72325700046], [93932.51195819199], [93927.99199852039], [93924.1648773796], [93921.03186418608], [93918.59399802919], [93916.852087386], [93915.80670989877], [93915.4582122163]], "exit_stagnation_temperature": [[786.2812344770404], [786.2816909294279], [786.2830601271249], [786.2853415917887], [786.2885345263651], [786.2926378153697], [786.2976500252717], [786.3035694049976], [786.3103938865404], [786.3181210856761], [786.326748302801], [786.3362725238667], [786.3466904214309], [786.3579983558221], [786.3701923764], [786.3832682229375], [786.397221327104], [786.4120468140536], [786.4277395041294], [786.4442939146651], [786.4617042618936], [786.4799644629666], [786.4990681380742], [786.5190086126624], [786.5397789197659], [786.5613718024327], [786.5837797162545], [786.6069948319939], [786.6310090383165], [786.6558139446147], [786.681400883937], [786.7077609160024], [786.7348848303236], [786.762763149412], [786.791386132088], [786.820743776868], [786.8508258254631], [786.8816217663439], [786.9131208384141], [786.9453120347579], [786.9781841064814], [787.0117255666335], [787.0459246942099], [787.0807695382464], [787.1162479219806], [787.1523474471037], [787.1890554980819], [787.2263592465602], [787.2642456558349], [787.3027014854015], [787.341713295576], [787.3812674521814], [787.4213501313076], [787.4619473241324], [787.5030448418137], [787.5446283204361], [787.5866832260269], [787.62919485963], [787.6721483624324], [787.7155287209539], [787.7593207722883], [787.8035092093928], [787.8480785864381], [787.8930133241953], [787.9382977154804], [787.9839159306372], [788.0298520230612], [788.076089934778], [788.122613502043], [788.1694064609918], [788.2164524533171], [788.2637350319895], [788.3112376669965], [788.358943751122], [788.4068366057461], [788.4548994866758], [788.5031155899931], [788.5514680579296], [788.5999399847561], [788.6485144226938], [788.6971743878371], [788.7459028660874], [788.7946828191077], [788.8434971902719], [788.8923289106348], [788.941160904894], [788.9899760973678], [789.0387574179588], [789.0874878081315], [789.1361502268719], [789.184727656652], [789.2332031093813], [789.2815596323488], [789.3297803141544], [789.3778482906268], [789.4257467507204], [789.4734589424022], [789.5209681785117], [789.5682578425989], [789.6153113947437], [789.6621123773403], [789.7086444208627], [789.7548912495895], [789.8008366873066], [789.8464646629664], [789.8917592163158], [789.9367045034854], [789.9812848025358], [790.0254845189647], [790.0692881911657], [790.1126804958436], [790.1556462533838], [790.1981704331674], [790.2402381588344], [790.2818347134979], [790.3229455448968], [790.3635562704967], [790.4036526825273], [790.4432207529607], [790.4822466384255], [790.5207166850603], [790.5586174332963], [790.5959356225754], [790.6326581959972], [790.6687723048952], [790.704265313339], [790.7391248025655], [790.7733385753306], [790.8068946601862], [790.8397813156745], [790.8719870344484], [790.9035005473023], [790.9343108271246], [790.9644070927627], [790.9937788128067], [791.0224157092784], [791.050307761239], [791.0774452082975], [791.1038185540423], [791.1294185693642], [791.1542362956959], [791.178263048153], [791.2014904185828], [791.2239102785123], [791.2455147819954], [791.2662963683723], [791.2862477649147], [791.3053619893823], [791.3236323524692], [791.3410524601496], [791.3576162159264], [791.3733178229625], [791.388151786121], [791.4021129138883], [791.4151963201995], [791.4273974261492], [791.438711961601], [791.4491359666833], [791.4586657931812], [791.4672981058148], [791.4750298834085], [791.4818584199543], [791.4877813255592], [791.4927965272831], [791.4969022698683], [791.500097116353], [791.5023799485788], [791.5037499675789], [791.5042066938616]], "exit_stagnation_pressure": [[97971.29090546048], [97970.93023141337], [97969.84834186258], [97968.04563452388], [97965.52277207188], [97962.28068186218], [97958.32055554284], [97953.64384855566], [97948.25227952638], [97942.14782954555], [97935.33274133972], [97927.80951833332], [97919.5809236024], [97910.6499787205], [97901.0199624969], [97890.69440960887], [97879.67710912807], [97867.97210294216], [97855.5836840726], [97842.51639488916], [97828.77502522324], [97814.36461037981], [97799.29042905013], [97783.55800112561], [97767.17308541492], [97750.14167726494], [97732.47000608734], [97714.16453279217], [97695.23194712939], [97675.67916494065], [97655.51332532242], [97634.741787702], [97613.37212882821], [97591.4121396785], [97568.86982228386], [97545.75338647388], [97522.07124654304], [97497.83201784072], [97473.04451328614], [97447.71773981085], [97421.86089473011], [97395.48336204533], [97368.59470867949], [97341.20468064795], [97313.32319916553], [97284.96035669385], [97256.12641292873], [97226.83179073165], [97197.08707200612], [97166.90299352193], [97136.29044268871], [97105.26045328127], [97073.82420111947], [97041.99299970311], [97009.77829580636], [96977.19166503132], [96944.24480732552], [96910.94954246294], [96877.31780549315], [96843.3616421587], [96809.09320428452], [96774.5247451403], [96739.66861477883], [96704.53725535217], [96669.14319640746], [96633.49905016525], [96597.61750678172], [96561.51132959733], [96525.1933503739], [96488.67646452229], [96451.97362632223], [96415.09784413729], [96378.06217562594], [96340.87972295162], [96303.56362799321], [96266.12706755787], [96228.58324859879], [96190.94540343872], [96153.2267850025], [96115.44066205865], [96077.60031447414], [96039.71902848153], [96001.81009196282], [95963.88678974951], [95925.96239894214], [95888.05018425024], [95850.1633933545], [95812.3152522926], [95774.51896087077], [95736.78768810189], [95699.13456767234], [95661.57269343841], [95624.11511495443], [95586.77483303327], [95549.56479534107], [95512.49789202763], [95475.58695139288], [95438.8447355922], [95402.28393638012], [95365.91717089474], [95329.75697748385], [95293.81581157353], [95258.10604158012], [95222.63994486774], [95187.42970375091], [95152.48740154403], [95117.82501865897], [95083.45442875086], [95049.3873949132], [95015.63556592407], [94982.21047254234], [94949.12352385672], [94916.38600368699], [94884.00906703858], [94852.00373661132], [94820.38089936269], [94789.15130312653], [94758.32555328756], [94727.91410951197], [94697.92728253594], [94668.37523101036], [94639.26795840448], [94610.61530996769], [94582.42696974972], [94554.71245768073], [94527.48112671047], [94500.74216000774], [94474.50456821997], [94448.77718679328], [94423.56867335392], [94398.88750515021], [94374.74197655641], [94351.14019663802], [94328.09008677902], [94305.59937837101], [94283.67561056459], [94262.32612808365], [94241.55807910116], [94221.37841317899], [94201.79387926919], [94182.81102377929], [94164.43618869987], [94146.67550979555], [94129.53491485945], [94113.02012203005], [94097.13663817238], [94081.88975732187], [94067.28455919179], [94053.32590774418], [94040.0184498243], [94027.36661385847], [94015.37460861546], [94004.04642203137], [93993.38582009806], [93983.39634581521], [93974.08131820582], [93965.44383139524], [93957.48675375401], [93950.21272710373], [93943.62416598697], [93937.72325700046], [93932.51195819199], [93927.99199852039], [93924.1648773796], [93921.03186418608], [93918.59399802919], [93916.852087386], [93915.80670989877], [93915.4582122163]], "exit_velocity": [[413.15652021053995], [413.15772985993596], [413.16135836387855], [413.167404389815], [413.17586571744613], [413.186739239664], [413.20002096384974], [413.2157060135666], [413.2337886306023], [413.25426217738266], [413.27711913977475], [413.3023511302265], [413.32994889129253], [413.3599022995209], [413.3922003696853], [413.4268312593904], [413.46378227402397], [413.503039872059], [413.5445896707136], [413.58841645194735], [413.63450416879476], [413.6828359520531], [413.73339411729347], [413.78616017218525], [413.8411148241808], [413.8982379884895], [413.9575087963869], [414.01890560381383], [414.08240600030774], [414.1479868182123], [414.21562414219756], [414.28529331905037], [414.35696896777483], [414.4306249899444], [414.5062345803531], [414.58377023789785], [414.6632037767656], [414.7445063378283], [414.82764840032235], [414.9125997937407], [414.9993297099866], [415.0878067157288], [415.17799876499066], [415.2698732119613], [415.3633968239933], [415.45853579482076], [415.5552557579566], [415.6535218002915], [415.7532984758537], [415.8545498197517], [415.9572393622864], [416.0613301432087], [416.16678472613995], [416.27356521312856], [416.38163325934875], [416.49095008791613], [416.6014765048444], [416.71317291410446], [416.82599933278726], [416.9399154063811], [417.05488042413486], [417.17085333449825], [417.287792760666], [417.4056570161636], [417.524404120526], [417.6439918150178], [417.76437757840404], [417.8855186427848], [418.00737200944354], [418.1298944647444], [418.25304259603826], [418.37677280760903], [418.5010413366078], [418.6258042690097], [418.751017555558], [418.8766370277107], [419.002618413567], [419.12891735377434], [419.25548941741005], [419.38229011784216], [419.5092749285357], [419.63639929881856], [419.7636186696258], [419.89088848914287], [420.0181642284345], [420.1454013969767], [420.27255555814185], [420.3995823445889], [420.5264374735926], [420.6530767622678], [420.7794561427218], [420.90553167710465], [421.0312595725543], [421.15659619604907], [421.2814980891538], [421.4059219826307], [421.5298248109683], [421.6531637267669], [421.7758961149992], [421.8979796071584], [422.01937209525653], [422.140031745708], [422.2599170130428], [422.37898665352], [422.4971997385495], [422.6145156679991], [422.7308941833362], [422.8462953806093], [422.9606797232862], [423.0740080549107], [423.1862416116094], [423.29734203443587], [423.40727138153505], [423.51599214013254], [423.6234672383681], [423.7296600569301], [423.83453444053276], [423.9380547091996], [424.0401856693601], [424.1408926247728], [424.2401413872593], [424.3378982872422], [424.4341301841011], [424.52880447632816], [424.62188911149786], [424.7133525960322], [424.8031640047792], [424.89129299038433], [424.97770979246786], [425.06238524659324], [425.14529079304816], [425.22639848540143], [425.305680998873], [425.38311163848135], [425.45866434700656], [425.53231371272045], [425.60403497692835], [425.67380404127556], [425.74159747488324], [425.8073925212311], [425.8711671048469], [425.9328998377849], [425.9925700258905], [426.0501576748416], [426.1056434959767], [426.1590089119214], [426.210236061976], [426.2593078073066], [426.30620773590937], [426.3509201673498], [426.3934301573094], [426.4337235018754], [426.4717867416515], [426.5076071656189], [426.54117281479415], [426.5724724856607], [426.6014957333837], [426.62823287479904], [426.6526749911879], [426.67481393082966], [426.6946423113213], [426.7121535216987], [426.72734172431655], [426.7402018565101], [426.75072963204764], [426.7589215423421], [426.76477485745966], [426.76828762688916], [426.7694586801023]]}}}, "lift_curve_slope": [[4.478922550915219], [4.478922610806262], [4.478922790458969], [4.4789230898120636], [4.478923508763437], [4.478924047170189], [4.478924704848663], [4.478925481574511], [4.478926377082762], [4.478927391067901], [4.478928523183974], [4.478929773044689], [4.478931140223541], [4.478932624253949], [4.478934224629404], [4.478935940803617], [4.478937772190709], [4.478939718165386], [4.478941778063138], [4.478943951180452], [4.478946236775029], [4.478948634066028], [4.478951142234308], [4.478953760422689], [4.478956487736223], [4.478959323242482], [4.478962265971852], [4.478965314917842], [4.478968469037405], [4.478971727251275], [4.478975088444303], [4.478978551465819], [4.4789821151300035], [4.478985778216262], [4.478989539469614], [4.478993397601107], [4.478997351288218], [4.479001399175287], [4.479005539873954], [4.479009771963605], [4.479014093991823], [4.479018504474877], [4.479023001898184], [4.479027584716808], [4.479032251355963], [4.479037000211522], [4.4790418296505425], [4.479046738011796], [4.479051723606312], [4.47905678471793], [4.479061919603863], [4.479067126495268], [4.47907240359783], [4.4790777490923475], [4.479083161135339], [4.479088637859642], [4.479094177375045], [4.479099777768898], [4.479105437106758], [4.479111153433027], [4.4791169247716045], [4.479122749126551], [4.479128624482746], [4.479134548806566], [4.479140520046572], [4.4791465361341904], [4.479152594984415], [4.479158694496505], [4.479164832554696], [4.47917100702892], [4.479177215775519], [4.479183456637983], [4.47918972744767], [4.479196026024559], [4.479202350177986], [4.479208697707393], [4.4792150664030865], [4.479221454046993], [4.479227858413422], [4.479234277269833], [4.479240708377607], [4.479247149492819], [4.4792535983670145], [4.479260052747997], [4.4792665103806], [4.479272969007484], [4.479279426369912], [4.479285880208555], [4.479292328264267], [4.479298768278891], [4.479305197996047], [4.479311615161922], [4.479318017526079], [4.479324402842241], [4.479330768869088], [4.479337113371058], [4.479343434119137], [4.479349728891651], [4.479355995475069], [4.479362231664778], [4.479368435265886], [4.479374604094001], [4.47938073597602], [4.479386828750911], [4.479392880270489], [4.479398888400191], [4.479404851019856], [4.4794107660244835], [4.479416631325002], [4.479422444849027], [4.479428204541619], [4.479433908366026], [4.479439554304438], [4.479445140358711], [4.479450664551113], [4.479456124925039], [4.479461519545738], [4.47946684650102], [4.479472103901963], [4.479477289883609], [4.479482402605654], [4.479487440253129], [4.479492401037078], [4.47949728319521], [4.479502084992565], [4.479506804722159], [4.4795114407056085], [4.479515991293774], [4.479520454867366], [4.479524829837549], [4.479529114646543], [4.479533307768204], [4.4795374077085945], [4.479541413006554], [4.479545322234237], [4.479549133997664], [4.479552846937228], [4.479556459728231], [4.479559971081367], [4.479563379743217], [4.479566684496722], [4.47956988416164], [4.479572977595005], [4.479575963691548], [4.479578841384125], [4.479581609644115], [4.479584267481825], [4.4795868139468515], [4.479589248128448], [4.479591569155881], [4.479593776198745], [4.479595868467298], [4.479597845212749], [4.479599705727551], [4.479601449345671], [4.47960307544284], [4.479604583436803], [4.479605972787529], [4.4796072429974245], [4.479608393611525], [4.479609424217667], [4.479610334446647], [4.479611123972365], [4.479611792511943], [4.479612339825843], [4.479612765717951], [4.479613070035657], [4.479613252669913], [4.47961331355527]]}}}}
\ No newline at end of file
@@ -0,0 +1,146 @@
+# noise_footprint.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" computes the noise footprint of the sideline takeoff of the B737 on a grid of ground microphones, and checks
+    it against the certification noise tools at single microphones
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units, Data
+from SUAVE.Methods.Geometry.Two_Dimensional.Planform import wing_planform
+from SUAVE.Methods.Noise.Fidelity_One import noise_footprint
+from SUAVE.Methods.Noise.Fidelity_One.Engine import noise_SAE
+from SUAVE.Methods.Noise.Fidelity_One.Airframe import noise_airframe_Fink
+from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import pnl_noise, noise_tone_correction, epnl_noise, noise_grid_geometric, \
+     senel_noise
+
+import numpy as np
+import copy
+import time
+
+import sys
+sys.path.append('../Vehicles')
+
+from Boeing_737 import vehicle_setup, configs_setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    vehicle = vehicle_setup()
+    for wing in vehicle.wings:
+        wing_planform(wing)
+    configs  = configs_setup(vehicle)
+    config   = configs.takeoff
+    analyses = analyses_setup()
+    results  = SUAVE.Input_Output.SUAVE.load('sideline.res')
+
+    # a grid of microphones around the takeoff
+    x = np.linspace(-500.,6000.,27)
+    y = np.linspace(-2000.,2000.,17)
+    X, Y = np.meshgrid(x,y)
+    microphones = np.stack([X,Y,np.zeros_like(X)],axis=-1)
+
+    tic       = time.perf_counter()
+    footprint = noise_footprint(results,config,analyses,microphones)
+    toc       = time.perf_counter() - tic
+    print('Footprint of ' + str(X.size) + ' microphones and ' + str(len(footprint.time)) + ' time steps: ' + str(toc) + ' s')
+
+    for name in ['EPNL','SENEL','PNLT_max','SPL_dBA_max','SPL_max']:
+        assert np.shape(footprint[name]) == np.shape(X)
+        assert np.all(np.isfinite(footprint[name]))
+
+    # the takeoff is along the x axis, so the footprint is symmetric
+    assert np.max(np.abs(footprint.EPNL - footprint.EPNL[::-1])) < 1e-10
+
+    # the tiles and the pool of processes give the same footprint
+    tiles = noise_footprint(results,config,analyses,microphones,memory_budget=1e5)
+    pool  = noise_footprint(results,config,analyses,microphones,processes=2)
+    assert np.all(tiles.EPNL == footprint.EPNL)
+    assert np.all(pool.EPNL  == footprint.EPNL)
+
+    # the certification tools at single microphones, along a flight at the mean angle of attack that they use
+    mean_results = copy.deepcopy(results)
+    segment      = mean_results.segments.climb
+    segment.conditions.aerodynamics.angle_of_attack[:] = np.mean(segment.conditions.aerodynamics.angle_of_attack)
+    for microphone in [[1500.,0.,0.],[2500.,450.,0.],[4000.,-1000.,0.]]:
+        microphone = np.array(microphone)
+        EPNL       = noise_footprint(mean_results,config,analyses,microphone).EPNL
+        EPNL_cert  = certification_EPNL(segment,config,analyses,microphone)
+        print('EPNL at ' + str(microphone) + ': ' + str(EPNL) + ', certification tools: ' + str(EPNL_cert))
+        assert np.abs(EPNL - EPNL_cert) < 0.05
+
+    # regression values, the last ones at the microphone under the flight path 2000 m from the start
+    actual = Data()
+    actual.EPNL_max    = 112.44895901862398
+    actual.EPNL_mean   = 74.42577964211533
+    actual.SENEL_max   = 105.14341299409023
+    actual.EPNL_2000   = 92.02128502649339
+    actual.SENEL_2000  = 86.59172120066758
+
+    computed = Data()
+    computed.EPNL_max    = np.max(footprint.EPNL)
+    computed.EPNL_mean   = np.mean(footprint.EPNL)
+    computed.SENEL_max   = np.max(footprint.SENEL)
+    computed.EPNL_2000   = footprint.EPNL[8,10]
+    computed.SENEL_2000  = footprint.SENEL[8,10]
+
+    for key in actual.keys():
+        error = np.abs(computed[key] - actual[key])/actual[key]
+        print(key + ': ' + str(computed[key]) + ', error: ' + str(error))
+        assert error < 1e-6
+
+    history_start_check()
+
+    return
+
+def history_start_check():
+    """ a history that starts within 10 dB of its maximum is summed up to where it falls 10 dB under it, without
+    the last time step """
+
+    history = np.array([95.,100.,92.,80.,89.9])
+    sumation = 10.**9.5 + 10.**10. + 10.**9.2
+    assert np.abs(epnl_noise(history) - (10.*np.log10(sumation) - 13.)) < 1e-10
+    assert np.abs(senel_noise(history) - 10.*np.log10(sumation)) < 1e-10
+
+    # the quieter time steps after it do not change the sum, also for many histories at once
+    both = np.stack([history,np.concatenate([history[:-1],[70.]])])
+    assert np.all(np.abs(epnl_noise(both) - epnl_noise(history)) < 1e-10)
+    assert np.all(np.abs(senel_noise(both) - senel_noise(history)) < 1e-10)
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+def analyses_setup():
+
+    analyses = SUAVE.Analyses.Vehicle()
+    atmosphere = SUAVE.Analyses.Atmospheric.US_Standard_1976()
+    analyses.append(atmosphere)
+
+    return analyses
+
+def certification_EPNL(segment,config,analyses,microphone):
+
+    dist, theta, phi = noise_grid_geometric(segment.conditions.frames.inertial.position_vector,microphone[None,:])
+    segment.dist  = dist[0]
+    segment.theta = theta[0]
+    segment.phi   = phi[0]
+
+    airframe = noise_airframe_Fink(config,analyses,segment)
+    engine   = noise_SAE(config.propulsors['turbofan'],segment,config,analyses)
+
+    SPL  = 10.*np.log10(10.**(0.1*airframe[1])+10.**(0.1*engine[1]))
+    PNLT = pnl_noise(SPL) + noise_tone_correction(SPL)
+
+    return epnl_noise(PNLT)
+
+if __name__ == '__main__':
+    main()
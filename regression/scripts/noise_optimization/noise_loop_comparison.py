@@ -0,0 +1,624 @@
+# noise_loop_comparison.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" checks that noise_SAE and noise_airframe_Fink, which compute the whole trajectory at once, match the loops over
+    the time steps and frequency bands of the original models on the sideline takeoff of the B737
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units, Data
+from SUAVE.Methods.Geometry.Two_Dimensional.Planform import wing_planform
+from SUAVE.Methods.Noise.Fidelity_One.Engine import noise_SAE
+from SUAVE.Methods.Noise.Fidelity_One.Airframe import noise_airframe_Fink
+from SUAVE.Methods.Noise.Fidelity_One.Engine.angle_of_attack_effect import angle_of_attack_effect
+from SUAVE.Methods.Noise.Fidelity_One.Engine.external_plug_effect import external_plug_effect
+from SUAVE.Methods.Noise.Fidelity_One.Engine.ground_proximity_effect import ground_proximity_effect
+from SUAVE.Methods.Noise.Fidelity_One.Engine.jet_installation_effect import jet_installation_effect
+from SUAVE.Methods.Noise.Fidelity_One.Engine.mixed_noise_component import mixed_noise_component
+from SUAVE.Methods.Noise.Fidelity_One.Engine.secondary_noise_component import secondary_noise_component
+from SUAVE.Methods.Noise.Fidelity_One.Airframe.noise_clean_wing import noise_clean_wing
+from SUAVE.Methods.Noise.Fidelity_One.Airframe.noise_landing_gear import noise_landing_gear
+from SUAVE.Methods.Noise.Fidelity_One.Airframe.noise_leading_edge_slat import noise_leading_edge_slat
+from SUAVE.Methods.Noise.Fidelity_One.Airframe.noise_trailing_edge_flap import noise_trailing_edge_flap
+from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import epnl_noise, senel_noise, dbA_noise, atmospheric_attenuation
+
+import numpy as np
+
+import sys
+sys.path.append('../Vehicles')
+
+from Boeing_737 import vehicle_setup, configs_setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    vehicle = vehicle_setup()
+    for wing in vehicle.wings:
+        wing_planform(wing)
+    configs  = configs_setup(vehicle)
+    config   = configs.takeoff
+    turbofan = config.propulsors['turbofan']
+    analyses = analyses_setup()
+    results  = SUAVE.Input_Output.SUAVE.load('sideline.res')
+
+    # a sideline microphone abeam of the point where the aircraft climbs through 1000 ft
+    segment = results.segments.climb
+    sideline_geometry(segment)
+
+    engine        = noise_SAE(turbofan,segment,config,analyses)
+    engine_loop   = noise_SAE_loop(turbofan,segment,config,analyses)
+    airframe      = noise_airframe_Fink(config,analyses,segment)
+    airframe_loop = noise_airframe_Fink_loop(config,analyses,segment)
+
+    for name, computed, loop in [['engine',engine,engine_loop],['airframe',airframe,airframe_loop]]:
+        EPNL, SPL, SENEL = computed
+        print(name + ' EPNL: ' + str(EPNL) + ', loops: ' + str(loop[0]))
+        print(name + ' SENEL: ' + str(SENEL) + ', loops: ' + str(loop[2]))
+
+        assert np.shape(SPL) == np.shape(loop[1])
+        assert np.max(np.abs(SPL - loop[1])) < 1e-9
+        assert np.abs(EPNL  - loop[0]) < 1e-9
+        assert np.abs(SENEL - loop[2]) < 1e-9
+
+    # regression values, as the loops above have the same corrections of the original models
+    actual = Data()
+    actual.engine_EPNL        = 89.2448525296383
+    actual.engine_SENEL       = 83.00297035604788
+    actual.engine_SPL_10kHz   = 31.87963193850401  # highest level of the 10 kHz band over the climb
+    actual.airframe_EPNL      = 77.96329388589318
+    actual.airframe_SPL_last  = 44.42800918074691  # highest band at the last position of the aircraft
+
+    computed = Data()
+    computed.engine_EPNL        = engine[0]
+    computed.engine_SENEL       = engine[2]
+    computed.engine_SPL_10kHz   = np.max(engine[1][:,23])
+    computed.airframe_EPNL      = airframe[0]
+    computed.airframe_SPL_last  = np.max(airframe[1][-1])
+
+    for key in actual.keys():
+        error = np.abs(computed[key] - actual[key])/actual[key]
+        print(key + ': ' + str(computed[key]) + ', error: ' + str(error))
+        assert error < 1e-6
+
+    return
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+def analyses_setup():
+
+    analyses = SUAVE.Analyses.Vehicle()
+    atmosphere = SUAVE.Analyses.Atmospheric.US_Standard_1976()
+    analyses.append(atmosphere)
+
+    return analyses
+
+def sideline_geometry(segment,z0=450.):
+    """ distance, polar and azimuthal angles from the aircraft to a microphone z0 to the side of the runway, as in
+        the sideline case of noise_geometric"""
+
+    position_vector = segment.conditions.frames.inertial.position_vector
+    altitude        = -position_vector[:,2]
+    s               = position_vector[:,0]
+    x0              = np.interp(304.8,altitude,s)
+
+    phi   = np.arctan(z0/altitude)
+    dist  = np.sqrt((z0/np.sin(phi))**2+(s-x0)**2)
+    theta = np.where(s-x0 < 0.,np.arccos(np.abs((x0-s)/dist)),np.pi-np.arccos(np.abs((x0-s)/dist)))
+
+    segment.dist  = dist
+    segment.theta = theta
+    segment.phi   = phi
+
+    return
+
+# ----------------------------------------------------------------------
+#   Loops over the time steps and frequency bands
+# ----------------------------------------------------------------------
+
+def noise_SAE_loop(turbofan,noise_segment,config,analyses):
+    """ the engine noise of noise_SAE, one time step and frequency band at a time"""
+
+    Velocity_primary_1      = float(turbofan.core_nozzle.noise_speed * 0.92*(turbofan.design_thrust/52700.))
+    Temperature_primary     = noise_segment.conditions.propulsion.acoustic_outputs.core.exit_stagnation_temperature[:,0]
+    Pressure_primary        = noise_segment.conditions.propulsion.acoustic_outputs.core.exit_stagnation_pressure[:,0]
+    Velocity_secondary_1    = float(turbofan.fan_nozzle.noise_speed * (turbofan.design_thrust/52700.))
+    Temperature_secondary   = noise_segment.conditions.propulsion.acoustic_outputs.fan.exit_stagnation_temperature[:,0]
+    Pressure_secondary      = noise_segment.conditions.propulsion.acoustic_outputs.fan.exit_stagnation_pressure[:,0]
+    N1                      = float(turbofan.fan.rotation * 0.92*(turbofan.design_thrust/52700.))
+    Diameter_primary        = turbofan.core_nozzle_diameter
+    Diameter_secondary      = turbofan.fan_nozzle_diameter
+    engine_height           = turbofan.engine_height
+    EXA                     = turbofan.exa
+    Plug_diameter           = turbofan.plug_diameter
+    Xe                      = turbofan.geometry_xe
+    Ye                      = turbofan.geometry_ye
+    Ce                      = turbofan.geometry_Ce
+    Velocity_aircraft       = float(noise_segment.conditions.freestream.velocity[0,0])
+    Altitude                = noise_segment.conditions.freestream.altitude[:,0]
+    AOA                     = np.mean(noise_segment.conditions.aerodynamics.angle_of_attack / Units.deg)
+    time                    = noise_segment.conditions.frames.inertial.time[:,0]
+
+    noise_time = np.arange(0.,time[-1],.5)
+
+    Temperature_primary   = np.interp(noise_time,time,Temperature_primary)
+    Pressure_primary      = np.interp(noise_time,time,Pressure_primary)
+    Temperature_secondary = np.interp(noise_time,time,Temperature_secondary)
+    Pressure_secondary    = np.interp(noise_time,time,Pressure_secondary)
+    Altitude              = np.interp(noise_time,time,Altitude)
+    distance_microphone   = np.interp(noise_time,time,noise_segment.dist)
+    angles                = np.interp(noise_time,time,noise_segment.theta)
+
+    nsteps = len(noise_time)
+
+    sound_ambient       = np.zeros(nsteps)
+    density_ambient     = np.zeros(nsteps)
+    temperature_ambient = np.zeros(nsteps)
+    pressure_amb        = np.zeros(nsteps)
+    Mach_aircraft       = np.zeros(nsteps)
+
+    Velocity_primary   = np.ones(nsteps)*Velocity_primary_1
+    Velocity_secondary = np.ones(nsteps)*Velocity_secondary_1
+
+    for id in range (0,nsteps):
+        atmo_data = analyses.atmosphere.compute_values(Altitude[id])
+
+        sound_ambient[id]       = float(atmo_data.speed_of_sound)
+        density_ambient[id]     = float(atmo_data.density)
+        temperature_ambient[id] = float(atmo_data.temperature)
+        pressure_amb[id]        = float(atmo_data.pressure)
+
+    pressure_isa = 101325
+    R_gas        = 287.1
+    gama_primary = 1.37
+    gama         = 1.4
+
+    Area_primary   = np.pi*(Diameter_primary/2)**2
+    Area_secondary = np.pi*(Diameter_secondary/2)**2
+
+    Xo = 0
+
+    frequency = np.array((50, 63, 80, 100, 125, 160, 200, 250, 315, 400, 500, 630, 800, 1000, 1250, 1600, \
+            2000, 2500, 3150, 4000, 5000, 6300, 8000, 10000))
+
+    B       = np.zeros(24)
+    exc     = np.zeros(24)
+    EX_m    = np.zeros(24)
+
+    SPL_total_history     = np.zeros((nsteps,24))
+    SPL_primary_history   = np.zeros((nsteps,24))
+    SPL_secondary_history = np.zeros((nsteps,24))
+    SPL_mixed_history     = np.zeros((nsteps,24))
+    SPLt_dBA_max          = np.zeros(nsteps)
+
+    for id in range(0,nsteps):
+
+        Cpp = R_gas/(1-1/gama_primary)
+        Cp  = R_gas/(1-1/gama)
+
+        density_primary   = Pressure_primary[id]/(R_gas*Temperature_primary[id]-(0.5*R_gas*Velocity_primary[id]**2/Cpp))
+        density_secondary = Pressure_secondary[id]/(R_gas*Temperature_secondary[id]-(0.5*R_gas*Velocity_secondary[id]**2/Cp))
+
+        mass_flow_primary   = Area_primary*Velocity_primary[id]*density_primary
+        mass_flow_secondary = Area_secondary*Velocity_secondary[id]*density_secondary
+
+        Mach_aircraft[id] = Velocity_aircraft/sound_ambient[id]
+
+        Velocity_mixed = (mass_flow_primary*Velocity_primary[id]+mass_flow_secondary*Velocity_secondary[id])/ \
+                (mass_flow_primary+mass_flow_secondary)
+        Temperature_mixed =(mass_flow_primary*Temperature_primary[id]+mass_flow_secondary*Temperature_secondary[id])/ \
+                (mass_flow_primary+mass_flow_secondary)
+        density_mixed = pressure_amb[id]/(R_gas*Temperature_mixed-(0.5*R_gas*Velocity_mixed**2/Cp))
+        Area_mixed = Area_primary*density_primary*Velocity_primary[id]*(1+(mass_flow_secondary/mass_flow_primary))/ \
+                (density_mixed*Velocity_mixed)
+        Diameter_mixed = (4*Area_mixed/np.pi)**0.5
+
+        XBPR = mass_flow_secondary/mass_flow_primary - 5.5
+        if XBPR<0:
+            XBPR=0
+        elif XBPR>4:
+            XBPR=4
+
+        DVPS = np.abs((Velocity_primary[id] - (Velocity_secondary[id]*Area_secondary+Velocity_aircraft*Area_primary)/(Area_secondary+Area_primary)))
+        if DVPS<0.3:
+            DVPS=0.3
+
+        Str_p = frequency*Diameter_primary/(DVPS)
+        Str_s = frequency*Diameter_mixed/(Velocity_secondary[id]-Velocity_aircraft)
+        Str_m = frequency*Diameter_mixed/(Velocity_mixed-Velocity_aircraft)
+
+        excitation_Strouhal = (N1/60)*(Diameter_mixed/Velocity_mixed)
+        if (excitation_Strouhal > 0.25 and excitation_Strouhal < 0.5):
+            SX = 0.0
+        else:
+            SX = 50*(excitation_Strouhal-0.25)*(excitation_Strouhal-0.5)
+
+        exps = np.exp(-SX)
+        exs  = 5*exps*np.exp(-(np.log10(Str_m/(2*excitation_Strouhal+0.00001)))**2)
+        exd  = np.exp(0.6-(EXA)**0.5)
+        zk   = 1-0.4*(exd)*(exps)
+
+        theta = angles[id]
+
+        theta_p = np.ones(24)*np.pi/2
+        theta_s = np.ones(24)*np.pi/2
+        theta_m = np.ones(24)*np.pi/2
+        noise_source_location_loop(B,Xo,zk,Diameter_primary,theta_p,Area_primary,Area_secondary,distance_microphone[id],Diameter_secondary,theta,theta_s,theta_m,Diameter_mixed,Velocity_primary[id],Velocity_secondary[id],Velocity_mixed,Velocity_aircraft,sound_ambient[id],Str_m,Str_s)
+
+        for i in range(0,24):
+            if (theta_m[i] <=1.4):
+                exc[i] = sound_ambient[id]/Velocity_mixed
+            elif (theta_m[i]>1.4):
+                exc[i] =(sound_ambient[id]/Velocity_mixed)*(1-(1.8/np.pi)*(theta_m[i]-1.4))
+            EX_m[i] = exd*exs[i]*exc[i]
+
+        EX_p = +5*exd*exps
+        EX_s = 2*sound_ambient[id]/(Velocity_secondary[id]*(zk))
+
+        distance = distance_microphone[id]
+
+        dspl_ambient_pressure = 20*np.log10(pressure_amb[id]/pressure_isa)
+
+        dspl_density_p = 20*np.log10((density_primary+density_secondary)/(2*density_ambient[id]))
+        dspl_density_s = 20*np.log10((density_secondary+density_ambient[id])/(2*density_ambient[id]))
+        dspl_density_m = 20*np.log10((density_mixed+density_ambient[id])/(2*density_ambient[id]))
+
+        dspl_spherical_p = 20*np.log10(Diameter_primary/distance)
+        dspl_spherical_s = 20*np.log10(Diameter_mixed/distance)
+        dspl_spherical_m = 20*np.log10(Diameter_mixed/distance)
+
+        dspl_attenuation = -atmospheric_attenuation(distance)
+
+        DSPL_p = dspl_ambient_pressure+dspl_density_p+dspl_attenuation+dspl_spherical_p
+        DSPL_s = dspl_ambient_pressure+dspl_density_s+dspl_attenuation+dspl_spherical_s
+        DSPL_m = dspl_ambient_pressure+dspl_density_m+dspl_attenuation+dspl_spherical_m
+
+        ATK_m   = angle_of_attack_effect(AOA,Mach_aircraft[id],theta_m)
+        INST_s  = jet_installation_effect(Xe,Ye,Ce,theta_s,Diameter_mixed)
+        Plug    = external_plug_effect(Velocity_primary[id],Velocity_secondary[id], Velocity_mixed, Diameter_primary,Diameter_secondary,Diameter_mixed, Plug_diameter, sound_ambient[id], theta_p,theta_s,theta_m)
+        GPROX_m = ground_proximity_effect(Velocity_mixed,sound_ambient[id],theta_m,engine_height,Diameter_mixed,frequency)
+
+        SPL_p = primary_noise_component_loop(np.zeros(24),Velocity_primary[id],Temperature_primary[id],R_gas,theta_p,DVPS,sound_ambient[id],Velocity_secondary[id],Velocity_aircraft,Area_primary,Area_secondary,DSPL_p,EX_p,Str_p) + Plug[0]
+        SPL_s = secondary_noise_component(None,Velocity_primary[id],theta_s,sound_ambient[id],Velocity_secondary[id],Velocity_aircraft,Area_primary,Area_secondary,DSPL_s,EX_s,Str_s) + Plug[1] + INST_s
+        SPL_m = mixed_noise_component(None,Velocity_primary[id],theta_m,sound_ambient[id],Velocity_secondary[id],Velocity_aircraft,Area_primary,Area_secondary,DSPL_m,EX_m,Str_m,Velocity_mixed,XBPR) + Plug[2] + ATK_m + GPROX_m
+
+        SPL_total = 10 * np.log10(10**(0.1*SPL_p)+10**(0.1*SPL_s)+10**(0.1*SPL_m))
+
+        SPL_total_history[id][:]     = SPL_total[:]
+        SPL_primary_history[id][:]   = SPL_p[:]
+        SPL_secondary_history[id][:] = SPL_s[:]
+        SPL_mixed_history[id][:]     = SPL_m[:]
+
+        SPLt_dBA_max[id] = max(dbA_noise(SPL_total))
+
+    PNLT_total  = pnl_noise_loop(SPL_total_history) + noise_tone_correction_loop(SPL_total_history)
+    EPNL_total  = epnl_noise(PNLT_total)
+    SENEL_total = senel_noise(SPLt_dBA_max)
+
+    return (EPNL_total,SPL_total_history,SENEL_total)
+
+def noise_source_location_loop(B,Xo,zk,Diameter_primary,theta_p,Area_primary,Area_secondary,distance_microphone,Diameter_secondary,theta,theta_s,theta_m,Diameter_mixed,Velocity_primary,Velocity_secondary,Velocity_mixed,Velocity_aircraft,sound_ambient,Str_m,Str_s):
+    """ the source angles of noise_source_location, one frequency band at a time, updated in place"""
+
+    def primary_location(theta_j):
+        return (zk*Diameter_primary)*(4.+4.*np.arctan((18.*theta_j/np.pi)-9.)+(Area_secondary/Area_primary))
+
+    def secondary_location(theta_j,Diameter,i):
+        return (zk*Diameter)*(2.+1.6*np.arctan((4.5*theta_j/np.pi)-2.25))*(1.+0.5/np.sqrt(Str_s[i])) \
+            *  np.sqrt(1.+(0.7*Velocity_secondary/sound_ambient))*(Velocity_secondary/(Velocity_secondary-Velocity_aircraft))
+
+    def mixed_location(theta_j,i):
+        return (zk*Diameter_mixed)*(3.+np.exp(-Str_m[i])+(2.+1.1*np.arctan((18.*theta_j/np.pi)-13.))+ \
+            (1.+0.5/np.sqrt(Str_m[i])))*np.sqrt(0.5+0.5*Velocity_mixed/sound_ambient) * \
+            (Velocity_mixed/(Velocity_mixed-Velocity_aircraft))
+
+    def observer_angle(XJ):
+        B = (1./np.sin(theta))*(((Xo+XJ)/distance_microphone)+np.cos(theta))
+        if B>=0.:
+            return np.arcsin(((B)**2.+1.)**(-0.5))
+        else:
+            return np.pi-np.arcsin(((B)**2.+1.)**(-0.5))
+
+    def iterate(theta_j,first_location,location,tolerance):
+        theta_j  = observer_angle(first_location(theta_j))
+        XJ       = location(theta_j)
+        residual = 2*tolerance
+        while residual>tolerance:
+            XJ_old   = XJ
+            theta_j  = (theta_j+observer_angle(XJ))/2.
+            XJ       = location(theta_j)
+            residual = np.abs(XJ_old-XJ)
+        return theta_j
+
+    for i in range(24):
+        theta_p[i] = iterate(theta_p[i],primary_location,primary_location,Diameter_primary/2000.)
+        theta_s[i] = iterate(theta_s[i],lambda t: secondary_location(t,Diameter_secondary,i), \
+                             lambda t: secondary_location(t,Diameter_mixed,i),Diameter_mixed/2000.)
+        theta_m[i] = iterate(theta_m[i],lambda t: mixed_location(t,i),lambda t: mixed_location(t,i),Diameter_mixed/2000.)
+
+    return (theta_p,theta_s,theta_m)
+
+def primary_noise_component_loop(SPL_p,Velocity_primary,Temperature_primary,R_gas,theta_p,DVPS,sound_ambient,Velocity_secondary,Velocity_aircraft,Area_primary,Area_secondary,DSPL_p,EX_p,Str_p):
+    """ the primary jet component of primary_noise_component, one frequency band at a time"""
+
+    SPL_p = np.array(SPL_p)
+
+    sound_primary    = float(np.sqrt(1.4*R_gas*Temperature_primary))
+    Mach_primary_jet = float(Velocity_primary/sound_primary)
+
+    for i in range (0,24):
+        if theta_p[i] <= 2.2:
+            velocity_exponent = 1.56
+        elif theta_p[i] > 2.2:
+            velocity_exponent = 1.5*np.exp(-10*(theta_p[i] - 2.2)**2)
+
+        FV = Mach_primary_jet*(float(DVPS)/sound_ambient)**0.6*(float((Velocity_primary+Velocity_secondary))/sound_ambient)**0.4* \
+        (float(np.abs(Velocity_primary-Velocity_aircraft)/Velocity_primary))**velocity_exponent
+
+        Z1 = -18*((1.8*theta_p[i]/np.pi)-0.6)**2
+        Z2 = -18-18*((1.8*theta_p[i]/np.pi)-0.6)**2
+        Z3 = 0.0
+        Z4 = -0.1 - 0.75*((Velocity_primary-Velocity_secondary-Velocity_aircraft)/sound_ambient) * \
+            ((1.8*theta_p[i]/np.pi)-0.6)**3. + 0.8*(0.6-np.log10(1+Area_secondary/Area_primary))
+        Z5 = 50 + 20*np.exp(-(theta_p[i]-2.6)**2.)
+        Z6 = 94 + 46*np.exp(-(theta_p[i]-2.5)**2.) - 26.*(0.6-np.log10(1+Area_secondary/Area_primary))/ \
+            np.exp(5*(theta_p[i]-2.3)**2) + DSPL_p[i] + EX_p
+
+        SPL_p[i] = (Z1*np.log10(FV)+Z2) * (np.log10(Str_p[i])-Z3*np.log10(FV)-Z4)**2 + Z5*np.log10(FV) + Z6
+
+    return SPL_p
+
+def noise_airframe_Fink_loop(config,analyses,noise_segment):
+    """ the airframe noise of noise_airframe_Fink, one time step at a time"""
+
+    wing     = config.wings
+    flap     = wing.main_wing.control_surfaces.flap
+
+    Sw       = wing.main_wing.areas.reference  / (Units.ft)**2
+    bw       = wing.main_wing.spans.projected / Units.ft
+    Sht      = wing.horizontal_stabilizer.areas.reference / (Units.ft)**2
+    bht      = wing.horizontal_stabilizer.spans.projected / Units.ft
+    Svt      = wing.vertical_stabilizer.areas.reference / (Units.ft)**2
+    bvt      = wing.vertical_stabilizer.spans.projected  / Units.ft
+    deltaf   = flap.deflection
+    Sf       = flap.area  / (Units.ft)**2
+    cf       = flap.chord_dimensional  / Units.ft
+    Dp       = config.landing_gear.main_tire_diameter  / Units.ft
+    Hp       = config.landing_gear.nose_tire_diameter  / Units.ft
+    Dn       = config.landing_gear.main_strut_length   / Units.ft
+    Hn       = config.landing_gear.nose_strut_length   / Units.ft
+    gear     = config.landing_gear.gear_condition
+
+    nose_wheels    = config.landing_gear.nose_wheels
+    main_wheels    = config.landing_gear.main_wheels
+    main_units     = config.landing_gear.main_units
+    velocity       = float(noise_segment.conditions.freestream.velocity[0,0])
+    altitude       = noise_segment.conditions.freestream.altitude[:,0]
+    time           = noise_segment.conditions.frames.inertial.time[:,0]
+
+    noise_time = np.arange(0.,time[-1],.5)
+    altitude   = np.interp(noise_time,time,altitude)
+
+    if flap.configuration_type   == 'single_slotted':
+        slots = 1
+    elif flap.configuration_type == 'double_slotted':
+        slots = 2
+    elif flap.configuration_type == 'triple_slotted':
+        slots = 3
+
+    distance_vector = np.interp(noise_time,time,noise_segment.dist)
+    angle           = np.interp(noise_time,time,noise_segment.theta)
+    phi             = np.interp(noise_time,time,noise_segment.phi)
+
+    nsteps    = len(noise_time)
+    viscosity = np.zeros(nsteps)
+    M         = np.zeros(nsteps)
+    deltaw    = np.zeros(nsteps)
+
+    for id in range (0,nsteps):
+        atmo_data = analyses.atmosphere.compute_values(altitude[id])
+
+        viscosity[id] = float(atmo_data.dynamic_viscosity*10.7639)
+        M[id]         = velocity/np.sqrt(1.4*287*float(atmo_data.temperature))
+        deltaw[id]    = 0.37*(Sw/bw)*((velocity/Units.ft)*Sw/(bw*viscosity[id]))**(-0.2)
+
+    frequency = np.array((50, 63, 80, 100, 125, 160, 200, 250, 315, 400, 500, 630, 800, 1000, 1250, 1600, \
+            2000, 2500, 3150, 4000, 5000, 6300, 8000, 10000))
+
+    nrange = len(angle)
+    SPL_total_history = np.zeros((nrange,24))
+    SPLt_dBA_max      = np.zeros(nrange)
+
+    for i in range(0,nrange):
+        theta    = angle[i]
+        distance = distance_vector[i]
+
+        delta_atmo = atmospheric_attenuation(distance)
+
+        SPL_wing = noise_clean_wing(Sw,bw,0,1,deltaw[i],velocity,viscosity[i],M[i],phi[i],theta,distance,frequency) - delta_atmo
+        SPLht    = noise_clean_wing(Sht,bht,0,1,deltaw[i],velocity,viscosity[i],M[i],phi[i],theta,distance,frequency) - delta_atmo
+        SPL_slat = noise_leading_edge_slat(SPL_wing,Sw,bw,velocity,deltaw[i],viscosity[i],M[i],phi[i],theta,distance,frequency) - delta_atmo
+
+        if (deltaf==0):
+            SPL_flap = np.zeros(24)
+        else:
+            SPL_flap = noise_trailing_edge_flap(Sf,cf,deltaf,slots,velocity,M[i],phi[i],theta,distance,frequency) - delta_atmo
+
+        if gear=='up':
+            SPL_main_landing_gear = np.zeros(24)
+            SPL_nose_landing_gear = np.zeros(24)
+        else:
+            SPL_main_landing_gear = noise_landing_gear(Dp,Hp,main_wheels,M[i],velocity,phi[i],theta,distance,frequency) - delta_atmo
+            SPL_nose_landing_gear = noise_landing_gear(Dn,Hn,nose_wheels,M[i],velocity,phi[i],theta,distance,frequency) - delta_atmo
+        if main_units>1:
+            SPL_main_landing_gear = SPL_main_landing_gear+3*(main_units-1)
+
+        SPL_total = 10.*np.log10(10.0**(0.1*SPL_wing)+10.0**(0.1*SPLht)+10**(0.1*SPL_flap)+ \
+             10.0**(0.1*SPL_slat)+10.0**(0.1*SPL_main_landing_gear)+10.0**(0.1*SPL_nose_landing_gear))
+
+        SPL_total_history[i][:] = SPL_total[:]
+        SPLt_dBA_max[i]         = max(dbA_noise(SPL_total))
+
+    PNLT_total  = pnl_noise_loop(SPL_total_history) + noise_tone_correction_loop(SPL_total_history)
+    EPNL_total  = epnl_noise(PNLT_total)
+    SENEL_total = senel_noise(SPLt_dBA_max)
+
+    return (EPNL_total,SPL_total_history,SENEL_total)
+
+def pnl_noise_loop(SPL):
+    """ the perceived noise level of pnl_noise, one time step and frequency band at a time"""
+
+    noy = [[1, 50, 91, 64, 52, 49, 55, 0.043478, 0.030103, 0.07952, 0.058098],
+            [2,	63, 85.9, 60, 51, 44, 51, 0.04057, 0.030103, 0.06816, 0.058098],
+            [3,	80, 87.3, 56, 49, 39,	46,	0.036831, 0.030103, 0.06816, 0.052288],
+            [4,	100, 	79.9,	53,	47,	34,	42,	0.036831, 0.030103, 0.05964, 0.047534],
+            [5,	125, 	79.8,	51,	46,	30,	39,	0.035336, 0.030103, 0.053013, 0.043573],
+            [6,	160, 	76,  	48,	45,	27,	36,	0.033333, 0.030103, 0.053013, 0.043573],
+            [7,	200, 	74,  	46,	43,	24,	33,	0.033333, 0.030103, 0.053013, 0.040221],
+            [8,	250, 	74.9,	44,	42,	21,	30,	0.032051, 0.030103, 0.053013, 0.037349],
+            [9,	315, 	94.6,	42,	41,	18,	27,	0.030675, 0.030103, 0.053013, 0.034859],
+            [10, 400, 9999999, 40, 40, 16, 25, 0.030103, 0, 0.053013, 0.034859],
+            [11, 500,  9999999,	40,	40,	16,	25,	0.030103, 0, 0.053013, 0.034859],
+            [12, 630,  9999999,	40,	40,	16,	25,	0.030103, 0, 0.053013, 0.034859],
+            [13, 800 , 9999999,	40,	40,	16,	25,	0.030103, 0, 0.053013, 0.034859],
+            [14, 1000, 9999999,	40,	40,	16,	25,	0.030103, 0, 0.053013, 0.034859],
+            [15, 1250, 9999999,	38,	38,	15,	23,	0.030103, 0, 0.05964, 0.034859],
+            [16, 1600, 9999999,	34,	34,	12,	21,	0.02996, 0, 0.053013, 0.040221],
+            [17, 2000, 9999999,	32,	32,	9,	18,	0.02996, 0, 0.053013, 0.037349],
+            [18, 2500, 9999999,	30,	30,	5,	15,	0.02996, 0, 0.047712, 0.034859],
+            [19, 3150, 9999999,	29,	29,	4,	14,	0.02996, 0, 0.047712, 0.034859],
+            [20, 4000, 9999999,	29,	29,	5,	14,	0.02996, 0, 0.053013, 0.034859],
+            [21, 5000, 9999999,	30,	30,	6,	15,	0.02996, 0, 0.053013, 0.034859],
+            [22, 6300, 9999999, 31,	31,	10,	17,	0.02996, 0, 0.06816, 0.037349],
+            [23, 8000, 44.3, 37, 34, 17, 23, 0.042285, 0.02996, 0.07952, 0.037349],
+            [24, 10000, 50.7, 41, 37, 21, 29, 0.042285,	0.02996, 0.05964, 0.043573]]
+
+    nsteps  = len(SPL)
+    SPL_noy = np.zeros((nsteps,24))
+    PNL     = np.zeros(nsteps)
+
+    for j in range(0,nsteps):
+
+        for i in range(0,23):
+            if SPL[j][i]>=noy[1][2]:
+                SPL_noy[j][i] = 10**(noy[i][8]*(SPL[j][i]-noy[i][4]))
+            if SPL[j][i]>=noy[i][3] and SPL[j][i]<noy[i][2]:
+                SPL_noy[j][i] = 10**(noy[i][7]*(SPL[j][i]-noy[i][3]))
+            if SPL[j][i]>=noy[i][6] and SPL[j][i]<noy[i][3]:
+                SPL_noy[j][i] = 0.3*(10**(noy[i][10]*(SPL[j][i]-noy[i][6])))
+            if SPL[j][i]>=noy[i][5] and SPL[j][i]<noy[i][6]:
+                SPL_noy[j][i] = 0.1*(10**(noy[i][9]*(SPL[j][i]-noy[i][5])))
+
+        max_noy = np.max(SPL_noy[j][:])
+        Perceived_noisinees = 0.85*max_noy+0.15*np.sum(SPL_noy[j][:])
+
+        if Perceived_noisinees==0:
+            Perceived_noisinees = 0.0625
+        PNL[j] = 40+(10/np.log10(2))*np.log10(Perceived_noisinees)
+
+    return PNL
+
+def noise_tone_correction_loop(SPL):
+    """ the tone correction of noise_tone_correction, one time step and frequency band at a time"""
+
+    nsteps              = len(SPL)
+    slope               = np.zeros(23)
+    aux_ds              = np.zeros(23)
+    delta_slope         = np.zeros(23)
+    tone_correction_max = np.zeros(nsteps)
+
+    for j in range(0,nsteps):
+
+        for i in range(3,23):
+            slope[i] = SPL[j][i]-SPL[j][i-1]
+
+        for i in range(3,23):
+            aux_ds[i] = np.abs(slope[i]-slope[i-1])
+            if aux_ds[i]>5:
+                delta_slope[i]=1
+            else:
+                delta_slope[i]=0
+
+        step3a = np.zeros(23)
+        step3b = np.zeros(23)
+        for i in range(3,23):
+            if delta_slope[i]==1 and slope[i]>0 and slope[i]>slope[i-1]:
+                step3a[i] = 1
+            if delta_slope[i]==1 and slope[i]<=0 and slope[i-1]>0:
+                step3b[i] = 1
+        step3 = step3a + step3b
+
+        step4 = np.zeros(23)
+        for i in range(1,23):
+            if step3[i]!=0:
+                step4[i] = (SPL[j][i-1]+SPL[j][i+1])/2
+            else:
+                step4[i] = SPL[j][i]
+
+        step5 = np.zeros(25)
+        for i in range(3,23):
+            step5[i]=step4[i]-step4[i-1]
+        step5[2]  = step5[3]
+        step5[24] = step5[23]
+
+        step6 = np.zeros(23)
+        for i in range(2,22):
+            step6[i] = (step5[i]+step5[i+1]+step5[i+2])/3.
+
+        step7 = np.zeros(24)
+        step7[2]=SPL[j][2]
+        for i in range(3,23):
+            step7[i] = step7[i-1]+step6[i-1]
+
+        step8     = np.zeros(24)
+        step8_aux = np.zeros(24)
+        for i in range(2,16):
+            step8_aux[i] = SPL[j][i]-step7[i]
+            if step8_aux[i]>=1.5:
+                step8[i] = step8_aux[i]
+        for i in range(17,22):
+            step8_aux[i] = SPL[j][i]-step7[i]
+            if step8_aux[i]>=1.5 and SPL[j][i]>0 and SPL[j][i+1]>0 and SPL[j][i-1]>0:
+                step8[i] = step8_aux[i]
+        step8_aux[23] = SPL[j][23]-step7[23]
+        if step8_aux[23]>=1.5 and SPL[j][23]>0 and SPL[j][22]>0:
+            step8[23] = step8_aux[23]
+
+        tone_correction = np.zeros(23)
+        for i in range(2,9):
+            if step8[i]>=1.5 and step8[i]<3:
+                tone_correction = (step8[i]/3)-0.5
+            if step8[i]>=3 and step8[i]<20:
+                tone_correction = step8[i]/6.
+            if step8[i]>20:
+                tone_correction = 3+(1/3)
+        for i in range(10,20):
+            if step8[i]>=1.5 and step8[i]<3:
+                tone_correction = (2/3)*(step8[i])-1
+            if step8[i]>=3 and step8[i]<20:
+                tone_correction = step8[i]/3.
+            if step8[i]>20:
+                tone_correction = 6+(2/3)
+        for i in range(21,23):
+            if step8[i]>=1.5 and step8[i]<3:
+                tone_correction = (step8[i]/3)-(1/2)
+            if step8[i]>=3 and step8[i]<20:
+                tone_correction = step8[i]/6.
+            if step8[i]>20:
+                tone_correction = 3+(1/3)
+
+        tone_correction_max[j] = np.max(tone_correction)
+
+    return tone_correction_max
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+# noise_results.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" writes flyover.res and approach.res, the results of the takeoff and landing missions that Noise_Test loads, by
+    flying the noise missions of Noise_Test at its design point
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Data
+from SUAVE.Analyses.Process import Process
+import numpy as np
+
+import Noise_Test
+import Procedure
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    nexus = Noise_Test.setup()
+
+    # the procedure of Noise_Test up to the noise missions, which are flown and archived instead of loaded
+    nexus.procedure.noise = Process()
+    nexus.procedure.noise.takeoff_init = Procedure.noise_takeoff_init
+    nexus.procedure.noise.archive      = archive_noise_missions
+    del nexus.procedure.post_process
+
+    # the design point of Noise_Test
+    var = [134.6,9.6105641082,35.0,0.123,49200.0,70000.0,0.75,6.6,30.0,70000.0,70000.0,11.5,283.0]
+    nexus.evaluate(var / nexus.optimization_problem.inputs[:,3])
+
+    return
+
+# ----------------------------------------------------------------------
+#   Noise missions
+# ----------------------------------------------------------------------
+
+def archive_noise_missions(nexus):
+
+    results = nexus.results
+
+    nexus.analyses.takeoff.noise.settings.flyover  = 1
+    nexus.analyses.takeoff.noise.settings.sideline = 0
+    results.flyover = nexus.missions.takeoff.evaluate()
+    SUAVE.Input_Output.SUAVE.archive(segment_conditions(results.flyover),'flyover.res')
+
+    nexus.analyses.landing.noise.settings.approach = 1
+    results.approach = nexus.missions.landing.evaluate()
+    SUAVE.Input_Output.SUAVE.archive(segment_conditions(results.approach),'approach.res')
+
+    return nexus
+
+def segment_conditions(results):
+    """ the conditions of each segment, which are what the noise and certification limit tools read """
+
+    output = Data()
+    output.segments = Data()
+    for segment in results.segments:
+        output.segments[segment.tag] = Data()
+        output.segments[segment.tag].conditions = segment.conditions
+
+    return output
+
+if __name__ == '__main__':
+    main()
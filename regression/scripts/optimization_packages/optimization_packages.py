@@ -2,6 +2,7 @@
 # Created: Sep. 2019, M. Clarke
 #          Mar 2020, M. Clarke
 #          Jul 2020, M. Clarke
+#          Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------        
 #   Imports
@@ -51,9 +52,79 @@ def main():
     
     # test writing output function 
     filename = 'optimization_output.txt'
-    write_optimization_outputs(problem,filename)  
+    write_optimization_outputs(problem,filename)
     os.remove('optimization_output.txt')
-    
+
+    # ------------------------------------------------------------------
+    #   Evaluation Cache
+    # ------------------------------------------------------------------
+    print('\n\n Checking the evaluation cache...')
+    evaluations = []
+    filename    = 'evaluation_cache.txt'
+    for size in [0,32,32]:
+        problem = setup(solver_name)
+        problem.optimization_problem.constraints = np.array([
+            [ 'x1' , '>', -10., 1., 1*Units.less],
+            [ 'x1' , '=',   0., 1., 1*Units.less],
+            [ 'x2' , '>',   1., 1., 1*Units.less],
+            [ 'x2' , '<',   2., 1., 1*Units.less],
+        ],dtype=object)
+        problem.evaluation_cache_size = size
+        problem.evaluation_cache_file = filename if size else None
+        sys.stdout = open(os.devnull,'w')
+        cached_outputs = scipy_setup.SciPy_Solve(problem, solver='SLSQP' , sense_step = 1.4901161193847656e-08, pop_size =  10 , prob_seed = seed )
+        sys.stdout = sys.__stdout__
+        evaluations.append(problem.evaluation_count)
+        assert( np.all(cached_outputs == outputs) )
+    os.remove(filename)
+    print('Procedure evaluations without a cache, with a cache, restarted from the cache file: ' + str(evaluations))
+
+    #   Check Results
+    assert( evaluations[1] < evaluations[0] )
+    assert( evaluations[2] == 0 )
+
+    # on a hit the nexus follows the requested point
+    problem = setup(solver_name)
+    problem.evaluation_cache_size = 32
+    for x in [[1.,0.],[2.,0.],[1.,0.]]:
+        obj = problem.objective(np.array(x))
+    assert( problem.evaluation_count == 2 )
+    assert( problem.vehicle_configurations.base.x1 == 1. )
+    assert( np.isclose(problem.objective(), 1., atol=1e-12) )
+    assert( np.isclose(problem.obj, 1., atol=1e-12) )
+
+    # ------------------------------------------------------------------
+    #   Finite Differences
+    # ------------------------------------------------------------------
+    print('\n\n Checking finite differences on a pool of processes...')
+    problem       = setup(solver_name)
+    x             = np.array([0.3,1.2])
+    grad, jac     = problem.finite_difference(x)
+    grad_p, jac_p = problem.finite_difference(x,processes=2)
+    grad_c, jac_c = problem.finite_difference(x,diff_interval=np.array([1e-6,1e-7]),central=True,processes=2)
+    print(grad_c)
+    print(jac_c)
+
+    #   Check Results
+    assert( np.all(grad_p == grad) and np.all(jac_p == jac) )
+    assert( np.allclose(grad_c, [0.6,2.4], atol=1e-8) )
+    assert( np.allclose(jac_c , [[1.,0.],[0.,1.]], atol=1e-8) )
+
+    # ------------------------------------------------------------------
+    #   Batch Evaluation
+    # ------------------------------------------------------------------
+    print('\n\n Checking batch evaluation on threads and processes...')
+    X        = np.array([[0.,1.],[0.5,1.5],[-1.,2.],[1.,-1.]])
+    obj, con = problem.evaluate_batch(X)
+    print(obj)
+
+    #   Check Results
+    assert( np.allclose(obj[:,0], X[:,0]**2 + X[:,1]**2) )
+    assert( np.all(con == X) )
+    for executor in ['thread','process']:
+        obj_e, con_e = problem.evaluate_batch(X,executor=executor,processes=2)
+        assert( np.all(obj_e == obj) and np.all(con_e == con) )
+
     # ------------------------------------------------------------------
     #   Differential Evolution 
     # ------------------------------------------------------------------  
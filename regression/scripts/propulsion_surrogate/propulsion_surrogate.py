@@ -2,6 +2,7 @@
 #
 # Created:  Jun 2017, E. Botero
 # Modified: Jan 2020, T. MacDonald
+#           Oct 2026, SUAVE Team
 
 #----------------------------------------------------------------------
 #   Imports
@@ -12,6 +13,7 @@ from SUAVE.Components.Energy.Networks.Propulsor_Surrogate import Propulsor_Surro
 from SUAVE.Core import Data
 
 import numpy as np
+import os
 
 #----------------------------------------------------------------------
 #   The regression script
@@ -54,6 +56,19 @@ def main():
     F_gaussian = results_gaussian.thrust_force_vector[:,0]
     mdot_gaussian = results_gaussian.vehicle_mass_rate[:,0]  
     
+    # Surrogates that predict flat arrays, as the gaussian process of newer sklearn versions, give the same results
+    for use_extended_surrogate in [True,False]:
+        propulsion.use_extended_surrogate = use_extended_surrogate
+        results_column = propulsion.evaluate_thrust(state)
+        surrogates     = [propulsion.sfc_surrogate,propulsion.thrust_surrogate]
+        propulsion.sfc_surrogate    = Flat_Surrogate(surrogates[0])
+        propulsion.thrust_surrogate = Flat_Surrogate(surrogates[1])
+        results_flat = propulsion.evaluate_thrust(state)
+        propulsion.sfc_surrogate, propulsion.thrust_surrogate = surrogates
+        assert(np.all(results_flat.thrust_force_vector == results_column.thrust_force_vector))
+        assert(np.all(results_flat.vehicle_mass_rate == results_column.vehicle_mass_rate))
+    propulsion.use_extended_surrogate = True
+    
     # Truth values
     F_linear_true = np.array([ 4707.93176445,  7965.14481619, 12770.34030835, 14350.57238295, 17607.78543469])
     mdot_linear_true = np.array([0.068364353 , 0.1231387392, 0.2151082426, 0.2482609107, 0.3211364166])
@@ -72,11 +87,65 @@ def main():
     
     for k,v in list(error.items()):
         assert(np.abs(v)<1e-6)
+    
+    # Gridded deck, interpolated directly
+    grid_deck_check(state)
      
     return
 
+def grid_deck_check(state):
+    
+    # Write a deck on a full altitude, Mach and throttle grid from a thrust and sfc model
+    altitudes = np.linspace(0.,10000.,11)
+    machs     = np.array([0.,0.2,0.4,0.5,0.6,0.7,0.8,0.9])
+    throttles = np.linspace(0.,1.,6)
+    alt,mach,eta = [x.ravel() for x in np.meshgrid(altitudes,machs,throttles,indexing='ij')]
+    thrust    = (5000. + 15000.*eta)*(1. - alt/20000.)*(1. - 0.3*mach) 
+    sfc       = 1.4e-5 + 0.2e-5*mach + 0.1e-5*eta
+    deck      = np.vstack([alt,mach,eta,thrust,sfc]).T
+    np.savetxt('grid_deck.csv',deck,delimiter=',',header='Altitude(m),Mach,Throttle,Thrust(N),SFC(kg/N/s)',comments='')
+    
+    results = Data()
+    for surrogate_type in ['grid','grid_cubic']:
+        propulsion = Propulsor_Surrogate()
+        propulsion.input_file = 'grid_deck.csv'
+        propulsion.number_of_engines = 2.
+        propulsion.surrogate_type = surrogate_type
+        propulsion.build_surrogate()
+        results[surrogate_type] = propulsion.evaluate_thrust(state) 
+    
+    os.remove('grid_deck.csv')
+    
+    # Thrust is linear in throttle at a deck altitude and Mach number, and constant beyond the deck
+    throttle = np.clip(state.conditions.propulsion.throttle[:,0],0.,1.)
+    F_true   = 2.*(5000. + 15000.*throttle)*(1. - 2500./20000.)*(1. - 0.3*0.4)
+    print('Grid deck thrust:')
+    print(results.grid.thrust_force_vector[:,0])
+    assert(np.allclose(results.grid.thrust_force_vector[:,0],F_true,rtol=1e-12))
+    assert(np.allclose(results.grid_cubic.thrust_force_vector[:,0],F_true,rtol=1e-12))
+    
+    # a deck that is not a grid is not interpolated
+    propulsion = Propulsor_Surrogate()
+    propulsion.input_file = 'deck.csv'
+    propulsion.surrogate_type = 'grid'
+    try:
+        propulsion.build_surrogate()
+        raise AssertionError('deck.csv is not a grid')
+    except ValueError:
+        pass
+    
+    return
 
 
+
+class Flat_Surrogate():
+    
+    def __init__(self,surrogate):
+        self.surrogate = surrogate
+        
+    def predict(self,cond):
+        return self.surrogate.predict(cond).ravel()
+
 # ----------------------------------------------------------------------        
 #   Call Main
 # ----------------------------------------------------------------------    
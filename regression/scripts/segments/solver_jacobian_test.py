@@ -0,0 +1,99 @@
+# solver_jacobian_test.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" regression for the structured jacobian modes of converge_root with a Boeing 737 mission"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units, Data
+
+import numpy as np
+
+import sys
+sys.path.append('../Vehicles')
+sys.path.append('../B737')
+
+import mission_B737
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    # reference solution with the default finite differences in fsolve
+    truth, truth_iterations = solve('none')
+
+    for solver_jacobian in ['block','colored']:
+        results, iterations = solve(solver_jacobian)
+
+        error = Data()
+        for tag, segment in results.segments.items():
+            throttle       = segment.conditions.propulsion.throttle
+            mass           = segment.conditions.weights.total_mass
+            throttle_truth = truth.segments[tag].conditions.propulsion.throttle
+            mass_truth     = truth.segments[tag].conditions.weights.total_mass
+
+            assert segment.converged
+            error[tag + '_throttle'] = np.max(np.abs(throttle - throttle_truth))
+            error[tag + '_mass']     = np.max(np.abs((mass - mass_truth)/mass_truth))
+
+        print('Errors, solver jacobian = ' + solver_jacobian)
+        print(error)
+        print('Iterations: ' + str(iterations) + ', with the finite differences in fsolve: ' + str(truth_iterations))
+
+        for k,v in list(error.items()):
+            assert(np.abs(v)<1e-6)
+
+        # the block jacobian needs fewer evaluations of the segments than the finite differences in fsolve
+        if solver_jacobian == 'block':
+            assert iterations < truth_iterations
+
+    return
+
+# ----------------------------------------------------------------------
+#   Solve
+# ----------------------------------------------------------------------
+
+def solve(solver_jacobian):
+
+    configs, analyses = mission_B737.full_setup()
+    mission_B737.simple_sizing(configs, analyses)
+    configs.finalize()
+    analyses.finalize()
+
+    mission = analyses.missions.base
+    for segment in mission.segments:
+        segment.state.numerics.solver_jacobian = solver_jacobian
+        segment.process.iterate.count = count_iteration
+
+    counter.iterations = 0
+    results    = mission.evaluate()
+    iterations = counter.iterations
+
+    # a second solve reuses the sparsity pattern of the colored jacobian
+    if solver_jacobian == 'colored':
+        for segment in mission.segments:
+            assert segment.state.numerics.jacobian_pattern.colors is not None
+        results = mission.evaluate()
+
+    return results, iterations
+
+# ----------------------------------------------------------------------
+#   Iteration Counter
+# ----------------------------------------------------------------------
+
+counter = Data()
+counter.iterations = 0
+
+def count_iteration(segment):
+    counter.iterations += 1
+
+    return
+
+if __name__ == '__main__':
+    main()
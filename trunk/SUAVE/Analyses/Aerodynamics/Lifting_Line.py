@@ -3,6 +3,7 @@
 # 
 # Created:  Aug 2017, E. Botero
 #           Apr 2020, M. Clarke
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -11,6 +12,7 @@
 import numpy as np
 from SUAVE.Core import Data, Units
 from SUAVE.Methods.Aerodynamics.Lifting_Line import lifting_line as LL
+from SUAVE.Methods.Utilities.surrogate_training_cache import training_fingerprint, load_training, save_training
 from .Aerodynamics import Aerodynamics
 
 # ----------------------------------------------------------------------
@@ -59,6 +61,10 @@ class Lifting_Line(Aerodynamics):
         # vortex lattice configurations
         self.settings.number_of_stations  = 100
         
+        # training data kept on disk between runs, off unless a directory is given
+        self.settings.training_cache_directory = None
+        self.settings.training_cache_size      = 1e9 # [bytes]
+        
         # conditions table, used for surrogate model training
         self.training = Data()        
         self.training.angle_of_attack  = np.array([-10.,-5.,0.,5.,10.]) * Units.deg
@@ -94,8 +100,13 @@ class Lifting_Line(Aerodynamics):
         if n_sw is not None:
             settings.number_of_stations  = n_sw
             
-        # sample training data
-        self.sample_training()
+        # sample training data, unless the same vehicle was sampled before
+        training    = self.training
+        directory   = settings.training_cache_directory
+        fingerprint = training_fingerprint('Lifting_Line',self.geometry,settings,[training.angle_of_attack])
+        if not load_training(directory,fingerprint,training):
+            self.sample_training()
+            save_training(directory,fingerprint,training,settings.training_cache_size)
                     
         # build surrogate
         self.build_surrogate()
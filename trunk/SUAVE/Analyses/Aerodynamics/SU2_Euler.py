@@ -5,6 +5,7 @@
 # Modified: Jan 2017, T. MacDonald
 #           Apr 2019, T. MacDonald
 #           Mar 2020, M. Clarke
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -24,6 +25,7 @@ from SUAVE.Input_Output.GMSH.mesh_geo_file import mesh_geo_file
 from SUAVE.Methods.Aerodynamics.Common import Fidelity_Zero as Common
 from .Process_Geometry import Process_Geometry
 from SUAVE.Analyses.Aerodynamics.SU2_inviscid import SU2_inviscid
+from SUAVE.Methods.Utilities.surrogate_training_cache import training_fingerprint, load_training, save_training
 
 # ----------------------------------------------------------------------
 #  Analysis
@@ -75,6 +77,10 @@ class SU2_Euler(Markup):
         settings.vsp_mesh_growth_ratio              = 1.3
         settings.vsp_mesh_growth_limiting_flag      = False
         
+        # training data kept on disk between runs, off unless a directory is given
+        settings.training_cache_directory           = None
+        settings.training_cache_size                = 1e9 # [bytes]
+        
         # Build the evaluation process
         compute = self.process.compute
         compute.lift = Process()
@@ -129,9 +135,21 @@ class SU2_Euler(Markup):
           half_mesh_flag                <boolean> Determines if a symmetry plane is used
           vsp_mesh_growth_ratio         [-] Determines how the mesh grows
           vsp_mesh_growth_limiting_flag <boolean> Determines if 3D growth limiting is used
+          training_cache_directory      <string> (optional - directory of the training cache)
+          training_cache_size           [bytes]
         """         
         super(SU2_Euler, self).initialize()
-        self.process.compute.lift.inviscid.geometry = self.geometry
+        inviscid          = self.process.compute.lift.inviscid
+        inviscid.geometry = self.geometry
+        
+        # Reload the training data if the same vehicle was run before, so no mesh or SU2 runs are needed
+        training    = inviscid.training
+        directory   = None if inviscid.training_file else self.settings.training_cache_directory
+        fingerprint = training_fingerprint('SU2_Euler',self.geometry,[self.settings,inviscid.settings],
+                                           [training.angle_of_attack,training.Mach],['parallel','processors'])
+        if load_training(directory,fingerprint,training):
+            inviscid.build_surrogate()
+            return
         
         tag = self.geometry.tag
         # Mesh the geometry in prepartion for CFD if no training file exists
@@ -141,6 +159,7 @@ class SU2_Euler(Markup):
             mesh_geo_file(tag)
         
         # Generate the surrogate
-        self.process.compute.lift.inviscid.initialize()
+        inviscid.initialize()
+        save_training(directory,fingerprint,training,self.settings.training_cache_size)
         
     finalize = initialize
\ No newline at end of file
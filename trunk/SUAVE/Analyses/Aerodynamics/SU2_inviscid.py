@@ -4,6 +4,7 @@
 # Created:  Sep 2016, E. Botero
 # Modified: Jan 2017, T. MacDonald
 #           Apr 2020, M. Clarke
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -17,16 +18,10 @@ from SUAVE.Core import Data, Units
 from .Aerodynamics import Aerodynamics
 from SUAVE.Input_Output.SU2.call_SU2_CFD import call_SU2_CFD
 from SUAVE.Input_Output.SU2.write_SU2_cfg import write_SU2_cfg
-from sklearn.gaussian_process.kernels import ExpSineSquared
 
 # Package imports
 import numpy as np
 import time
-import matplotlib.pyplot as plt  
-import sklearn
-from sklearn import gaussian_process
-from sklearn import neighbors
-from sklearn import svm
 
 # ----------------------------------------------------------------------
 #  Class
@@ -268,6 +263,11 @@ class SU2_inviscid(Aerodynamics):
         xy        = training.grid_points 
         
               
+        # the surrogate packages are imported here to keep them out of the SUAVE import
+        import matplotlib.pyplot as plt
+        from sklearn import gaussian_process
+        from sklearn.gaussian_process.kernels import ExpSineSquared
+        
         # Gaussian Process New
         gp_kernel_ES = ExpSineSquared(length_scale=1.0, periodicity=1.0, length_scale_bounds=(1e-5,1e5), periodicity_bounds=(1e-5,1e5))
         regr_cl = gaussian_process.GaussianProcessRegressor(kernel=gp_kernel_ES)
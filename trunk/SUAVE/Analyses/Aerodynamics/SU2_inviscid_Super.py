@@ -3,6 +3,7 @@
 #
 # Created:  Sep 2016, E. Botero
 # Modified: Jan 2017, T. MacDonald
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -20,11 +21,6 @@ from SUAVE.Input_Output.SU2.write_SU2_cfg import write_SU2_cfg
 # Package imports
 import numpy as np
 import time
-import pylab as plt
-import sklearn
-from sklearn import gaussian_process
-from sklearn import neighbors
-from sklearn import svm
 
 # ----------------------------------------------------------------------
 #  Class
@@ -261,6 +257,8 @@ class SU2_inviscid_Super(Aerodynamics):
         CD_data   = training.coefficients[:,1]
         xy        = training.grid_points 
         
+        import pylab as plt
+        from sklearn import gaussian_process
         import pyKriging
         
         # Gaussian Process New
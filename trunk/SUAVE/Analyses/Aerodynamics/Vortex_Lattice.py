@@ -10,6 +10,7 @@
 #           Apr 2020, M. Clarke
 #           Jun 2020, E. Botero
 #           Sep 2020, M. Clarke 
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -22,6 +23,7 @@ from SUAVE.Core import Data
 from SUAVE.Core import Units
 
 from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.VLM import VLM
+from SUAVE.Methods.Utilities.surrogate_training_cache import training_fingerprint, load_training, save_training
 # local imports
 from .Aerodynamics import Aerodynamics
 from SUAVE.Methods.Aerodynamics.Supersonic_Zero.Drag.Cubic_Spline_Blender import Cubic_Spline_Blender
@@ -70,6 +72,24 @@ class Vortex_Lattice(Aerodynamics):
         self.settings.vortex_distribution            = Data()   
         self.settings.initial_timestep_offset        = 0
         self.settings.wake_development_time          = 0.05
+        
+        # vortex distribution and influence matrices kept between evaluations, off unless turned on
+        self.settings.cache_influence_matrices       = False
+        self.settings.influence_cache_size           = 5e8 # [bytes]
+        self.settings.influence_cache                = Data()
+        
+        # working memory of the vortex lattice, the conditions and control points are done in blocks that fit
+        self.settings.memory_budget                  = 1e9 # [bytes]
+        
+        # above this number of panels the vortex strengths are solved with GMRES and a tree code of the
+        # horseshoe vortices instead of the dense influence matrices, None to always use the dense matrices
+        self.settings.iterative_solve_threshold      = None
+        self.settings.iterative_solve_tolerance      = 1e-8
+        self.settings.tree_opening_angle             = 0.2
+        
+        # training data kept on disk between runs, off unless a directory is given
+        self.settings.training_cache_directory       = None
+        self.settings.training_cache_size            = 1e9 # [bytes]
 
         # conditions table, used for surrogate model training
         self.training                                = Data()    
@@ -141,8 +161,14 @@ class Vortex_Lattice(Aerodynamics):
                 
         # If we are using the surrogate
         if use_surrogate == True: 
-            # sample training data
-            self.sample_training()
+            # sample training data, unless the same vehicle was sampled before
+            training    = self.training
+            directory   = settings.training_cache_directory
+            fingerprint = training_fingerprint('Vortex_Lattice',geometry,settings,[training.angle_of_attack,training.Mach],
+                                               ['vortex_distribution','influence_cache'])
+            if not load_training(directory,fingerprint,training):
+                self.sample_training()
+                save_training(directory,fingerprint,training,settings.training_cache_size)
                         
             # build surrogate
             self.build_surrogate()        
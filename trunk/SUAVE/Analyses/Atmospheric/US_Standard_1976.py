@@ -4,6 +4,7 @@
 # Created: 
 # Modified: Feb 2016, Andrew Wendorff
 #           Jan 2018, W. Maier
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -21,7 +22,7 @@ from SUAVE.Attributes.Planets import Earth
 
 from SUAVE.Analyses.Mission.Segments.Conditions import Conditions
 
-from SUAVE.Core import Units
+from SUAVE.Core import Units, Data
 from SUAVE.Core.Arrays import atleast_2d_col
 
 
@@ -62,6 +63,324 @@ class US_Standard_1976(Atmospheric):
         
         atmo_data = SUAVE.Attributes.Atmospheres.Earth.US_Standard_1976()
         self.update(atmo_data)        
+        
+        self.tabulated           = False
+        self.table_tolerance     = 1e-8   # relative pressure error
+        self.table               = None
+        self.table_key           = None
+        self.layers              = None
+        self.layers_key          = None
+        self.properties_checked  = None
+        self.check_properties()
+    
+    def check_properties(self):
+        """Warns if the fluid properties or the planet are not the ones of the standard. This is done once
+        for the objects that are set, not on every call of compute_values.
+
+        Assumptions:
+        The fluid properties and the planet are not changed in place after they are set
+
+        Source:
+        N/A
+
+        Inputs:
+        None
+
+        Output:
+        None
+
+        Properties Used:
+        self.
+          fluid_properties
+          planet
+        """
+        
+        checked = (id(self.fluid_properties),id(self.planet))
+        if self.properties_checked == checked:
+            return
+        
+        if not self.fluid_properties == Air():
+            warn('US Standard Atmosphere not using Air fluid properties')
+        if not self.planet == Earth():
+            warn('US Standard Atmosphere not using Earth planet properties')  
+            
+        self.properties_checked = checked
+        
+    def constants_key(self):
+        """The values the layer constants are computed from, to tell when they have to be computed again.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        None
+
+        Output:
+        key                                      <tuple>
+
+        Properties Used:
+        self.
+          fluid_properties.gas_specific_constant [J/(kg*K)]
+          planet.sea_level_gravity               [m/s^2]
+          breaks.
+            altitude                             [m]
+            temperature                          [K]
+            pressure                             [Pa]
+        """
+        
+        breaks = self.breaks
+        
+        return (self.planet.sea_level_gravity, self.fluid_properties.gas_specific_constant, 
+                np.asarray(breaks.altitude,dtype=float).tobytes(), 
+                np.asarray(breaks.temperature,dtype=float).tobytes(), 
+                np.asarray(breaks.pressure,dtype=float).tobytes())
+    
+    def get_layers(self):
+        """The layer constants, computed again only when the breaks, the gravity or the gas constant change.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        None
+
+        Output:
+        layers, see layer_constants
+
+        Properties Used:
+        self.
+          layers
+          layers_key
+        """
+        
+        key = self.constants_key()
+        if self.layers is None or self.layers_key != key:
+            self.layers     = self.layer_constants()
+            self.layers_key = key
+            
+        return self.layers
+    
+    def get_table(self):
+        """The table of the standard atmosphere, built again only when the layer constants or table_tolerance
+        change.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        None
+
+        Output:
+        table, see build_table
+
+        Properties Used:
+        self.
+          table
+          table_key
+          table_tolerance                        [-]
+        """
+        
+        key = (self.table_tolerance,) + self.constants_key()
+        if self.table is None or self.table_key != key:
+            self.table     = self.build_table()
+            self.table_key = key
+            
+        return self.table
+        
+    def layer_constants(self):
+        """The base altitude, temperature and pressure, the lapse rate and the pressure exponent of each
+        layer between the breaks.
+
+        Assumptions:
+        None
+
+        Source:
+        U.S. Standard Atmosphere, 1976, U.S. Government Printing Office, Washington, D.C., 1976
+
+        Inputs:
+        None
+
+        Output:
+        layers.
+          altitude                               [m]
+          temperature                            [K]
+          pressure                               [Pa]
+          lapse_rate                             [K/m]
+          exponent                               [-]
+
+        Properties Used:
+        self.
+          fluid_properties.gas_specific_constant [J/(kg*K)]
+          planet.sea_level_gravity               [m/s^2]
+          breaks.
+            altitude                             [m]
+            temperature                          [K]
+            pressure                             [Pa]
+        """
+        
+        grav   = self.planet.sea_level_gravity
+        R      = self.fluid_properties.gas_specific_constant
+        breaks = self.breaks
+        
+        alpha    = -(breaks.temperature[1:] - breaks.temperature[:-1])/(breaks.altitude[1:] - breaks.altitude[:-1])
+        exponent = np.zeros_like(alpha)
+        exponent[alpha != 0.] = 1.*grav/(alpha[alpha != 0.]*R)
+        
+        layers = Data()
+        layers.altitude    = breaks.altitude[:-1]
+        layers.temperature = breaks.temperature[:-1]
+        layers.pressure    = breaks.pressure[:-1]
+        layers.lapse_rate  = alpha
+        layers.exponent    = exponent
+        
+        return layers
+    
+    def build_table(self):
+        """Tabulates the temperature and the log of the pressure against geopotential altitude. The breaks
+        are nodes of the table, so the temperature is exact, and the nodes in between are spaced so that
+        linear interpolation of the log of the pressure is within table_tolerance. Both ends of each
+        interval are evaluated in the layer of the interval, as the pressure of the breaks is not exactly
+        continuous with the layer below.
+
+        Assumptions:
+        The interpolation error of the log of the pressure is below h^2/8 max|d2(ln p)/dz2|
+
+        Source:
+        U.S. Standard Atmosphere, 1976, U.S. Government Printing Office, Washington, D.C., 1976
+
+        Inputs:
+        None
+
+        Output:
+        table.
+          altitude                               [m]
+          temperature                            [K]
+          temperature_change                     [K]
+          log_pressure                           [-]
+          log_pressure_change                    [-]
+
+        Properties Used:
+        self.
+          table_tolerance                        [-]
+          fluid_properties.gas_specific_constant [J/(kg*K)]
+          planet.sea_level_gravity               [m/s^2]
+          breaks.altitude                        [m]
+        """
+        
+        grav   = self.planet.sea_level_gravity
+        R      = self.fluid_properties.gas_specific_constant
+        layers = self.get_layers()
+        z      = self.breaks.altitude
+        T      = self.breaks.temperature
+        
+        nodes = [z[:1]]
+        for i in range(len(z)-1):
+            alpha = layers.lapse_rate[i]
+            if alpha == 0.:
+                n = 1
+            else:
+                # d2(ln p)/dz2 = -g*alpha/(R*T^2), largest at the coldest end of the layer
+                T_min = min(T[i],T[i+1])
+                h     = np.sqrt(8.*self.table_tolerance*R*T_min*T_min/(grav*abs(alpha)))
+                n     = int(np.ceil((z[i+1]-z[i])/h))
+            nodes.append(np.linspace(z[i],z[i+1],n+1)[1:])
+        zs = np.concatenate(nodes)
+        
+        i_layer = self.layer_index(zs[:-1],layers)
+        T_lower, p_lower = self.compute_temperature_pressure(zs[:-1],layers,i_layer)
+        T_upper, p_upper = self.compute_temperature_pressure(zs[1:] ,layers,i_layer)
+        
+        table = Data()
+        table.altitude            = zs
+        table.temperature         = T_lower
+        table.temperature_change  = T_upper - T_lower
+        table.log_pressure        = np.log(p_lower)
+        table.log_pressure_change = np.log(p_upper) - table.log_pressure
+        
+        return table
+    
+    def layer_index(self,zs,layers):
+        """Finds the layer of geopotential altitudes inside the breaks. A break belongs to the layer above
+        it, except for the top one.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        zs                                       [m]
+        layers, see layer_constants
+
+        Output:
+        i_layer                                  [-]
+
+        Properties Used:
+        self.breaks.altitude                     [m]
+        """
+        
+        n_layers = len(layers.lapse_rate)
+        i_layer  = np.searchsorted(self.breaks.altitude,zs,side='right') - 1
+        
+        return np.minimum(np.maximum(i_layer,0),n_layers-1)
+    
+    def compute_temperature_pressure(self,zs,layers,i_layer=None):
+        """Computes the standard temperature and pressure at geopotential altitudes inside the breaks.
+
+        Assumptions:
+        None
+
+        Source:
+        U.S. Standard Atmosphere, 1976, U.S. Government Printing Office, Washington, D.C., 1976
+
+        Inputs:
+        zs                                       [m]
+        layers, see layer_constants
+        i_layer, the layer of each altitude, see layer_index
+
+        Output:
+        T                                        [K]
+        p                                        [Pa]
+
+        Properties Used:
+        self.
+          fluid_properties.gas_specific_constant [J/(kg*K)]
+          planet.sea_level_gravity               [m/s^2]
+          breaks.altitude                        [m]
+        """
+        
+        grav = self.planet.sea_level_gravity
+        R    = self.fluid_properties.gas_specific_constant
+        
+        if i_layer is None:
+            i_layer = self.layer_index(zs,layers)
+        
+        z0    = layers.altitude[i_layer]
+        T0    = layers.temperature[i_layer]
+        p0    = layers.pressure[i_layer]
+        alpha = layers.lapse_rate[i_layer]
+        
+        # interpolate the breaks
+        dz      = zs-z0
+        p       = np.empty_like(zs)
+        i_isoth = (alpha == 0.)
+        i_adiab = ~i_isoth
+        p[i_isoth] = p0[i_isoth] * np.exp(-1.*dz[i_isoth]*grav/(R*T0[i_isoth]))
+        p[i_adiab] = p0[i_adiab] * ( (1.-alpha[i_adiab]*dz[i_adiab]/T0[i_adiab]) **layers.exponent[i_layer[i_adiab]] )
+        
+        T = T0 - dz*alpha
+        
+        return T, p
     
     def compute_values(self,altitude,temperature_deviation=0.0,var_gamma=False):
 
@@ -86,6 +405,7 @@ class US_Standard_1976(Atmospheric):
 
         Properties Used:
         self.
+          tabulated                              [boolean]
           fluid_properties.gas_specific_constant [J/(kg*K)]
           planet.sea_level_gravity               [m/s^2]
           planet.mean_radius                     [m]
@@ -98,17 +418,11 @@ class US_Standard_1976(Atmospheric):
         # unpack
         zs        = altitude
         gas       = self.fluid_properties
-        planet    = self.planet
-        grav      = self.planet.sea_level_gravity        
         Rad       = self.planet.mean_radius
-        R         = gas.gas_specific_constant
         delta_isa = temperature_deviation
         
         # check properties
-        if not gas == Air():
-            warn('US Standard Atmosphere not using Air fluid properties')
-        if not planet == Earth():
-            warn('US Standard Atmosphere not using Earth planet properties')          
+        self.check_properties()
         
         # convert input if necessary
         zs = atleast_2d_col(zs)
@@ -128,36 +442,18 @@ class US_Standard_1976(Atmospheric):
             print("Warning: altitude requested above maximum for this atmospheric model; returning values for h = 86.0 km")   
             zs[zs > zmax] = zmax        
 
-        # initialize return data
-        zeros = np.zeros_like(zs)
-        p     = zeros * 0.0
-        T     = zeros * 0.0
-        rho   = zeros * 0.0
-        a     = zeros * 0.0
-        mu    = zeros * 0.0
-        z0    = zeros * 0.0
-        T0    = zeros * 0.0
-        p0    = zeros * 0.0
-        alpha = zeros * 0.0
-        
-        # populate the altitude breaks
-        # this uses >= and <= to capture both edges and because values should be the same at the edges
-        for i in range( len(self.breaks.altitude)-1 ): 
-            i_inside = (zs >= self.breaks.altitude[i]) & (zs <= self.breaks.altitude[i+1])
-            z0[ i_inside ]    = self.breaks.altitude[i]
-            T0[ i_inside ]    = self.breaks.temperature[i]
-            p0[ i_inside ]    = self.breaks.pressure[i]
-            alpha[ i_inside ] = -(self.breaks.temperature[i+1] - self.breaks.temperature[i])/ \
-                                 (self.breaks.altitude[i+1]    - self.breaks.altitude[i])
-        
-        # interpolate the breaks
-        dz = zs-z0
-        i_isoth = (alpha == 0.)
-        i_adiab = (alpha != 0.)
-        p[i_isoth] = p0[i_isoth] * np.exp(-1.*dz[i_isoth]*grav/(R*T0[i_isoth]))
-        p[i_adiab] = p0[i_adiab] * ( (1.-alpha[i_adiab]*dz[i_adiab]/T0[i_adiab]) **(1.*grav/(alpha[i_adiab]*R)) )
+        # the standard temperature and pressure, from the table or from the layers
+        if self.tabulated:
+            table = self.get_table()
+            i     = np.searchsorted(table.altitude,zs,side='right') - 1
+            i     = np.minimum(np.maximum(i,0),len(table.temperature)-1)
+            w     = (zs - table.altitude[i])/(table.altitude[i+1] - table.altitude[i])
+            T     = table.temperature[i] + w*table.temperature_change[i]
+            p     = np.exp(table.log_pressure[i] + w*table.log_pressure_change[i])
+        else:
+            T, p = self.compute_temperature_pressure(zs,self.get_layers())
         
-        T   = T0 - dz*alpha + delta_isa
+        T   = T + delta_isa
         rho = gas.compute_density(T,p)
         a   = gas.compute_speed_of_sound(T,p,var_gamma)
         mu  = gas.compute_absolute_viscosity(T)
@@ -5,6 +5,7 @@
 # Modified: Feb 2016, A. Wendorff
 #           Jun 2017, E. Botero
 #           Jan 2020, M. Clarke
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -12,9 +13,13 @@
 
 # python imports
 import numpy as np
+import keyword
 
 # SUAVE imports
 from SUAVE.Core                    import Data
+from SUAVE.Core.Arrays             import array_type, matrix_type
+
+dictgetitem = dict.__getitem__
 
 # ----------------------------------------------------------------------
 #  Conditions
@@ -33,7 +38,9 @@ class Conditions(Data):
         None   
     """ 
 
-    _size = 1
+    _size       = 1
+    _contiguous = False
+    _layout     = None
     
     def ones_row(self,cols):
         """ returns a row vector of ones with given number of columns 
@@ -96,18 +103,19 @@ class Conditions(Data):
         return np.ones([self._size-2,cols])
     
     
-    def expand_rows(self,rows):
+    def expand_rows(self,rows,contiguous=False):
         """ Makes a 1-D array the right size. Often used after a mission is initialized to size out the vectors to the
             right size.
         
             Assumptions:
-            None
+            If contiguous, all the float arrays are stored as views into one buffer
     
             Source:
             N/A
     
             Inputs:
-            rows   [int]
+            rows        [int]
+            contiguous  [boolean]
     
             Outputs:
             None
@@ -116,8 +124,14 @@ class Conditions(Data):
             None
         """           
         
+        if contiguous:
+            self.expand_rows_contiguous(rows)
+            return
+        
         # store
-        self._size = rows
+        self._size       = rows
+        self._contiguous = False
+        self._layout     = None
         
         # recursively initialize condition and unknown arrays 
         # to have given row length
@@ -137,7 +151,217 @@ class Conditions(Data):
         #: for each key,value
         
         return
-
+    
+    def expand_rows_contiguous(self,rows,skip=()):
+        """ Does the same as expand_rows, but all the float arrays are put in one preallocated buffer.
+            Each array is a column major view into the buffer, in the same order as pack_array, so packing
+            and unpacking the unknowns and residuals become single slices of the buffer.
+        
+            Assumptions:
+            Arrays that are not float are expanded on their own
+    
+            Source:
+            N/A
+    
+            Inputs:
+            rows   [int]
+            skip   [list] keys of self that are not expanded
+    
+            Outputs:
+            None
+    
+            Properties Used:
+            None
+        """ 
+        
+        leaves = []
+        
+        # find everything that expand_rows would expand
+        def do_gather(D,skip):
+            D._size       = rows
+            D._contiguous = True
+            D._layout     = None
+            for k,v in D.items():
+                if k in skip:
+                    continue
+                try:
+                    rank = v.ndim
+                except:
+                    rank = 0
+                if isinstance(v,Conditions):
+                    do_gather(v,())
+                elif rank == 2:
+                    if v.dtype == np.float64:
+                        leaves.append((D,k,v))
+                    else:
+                        D[k] = np.resize(v,[rows,v.shape[1]])
+        
+        do_gather(self,skip)
+        
+        # one allocation for the whole tree
+        buffer = np.empty(rows*sum([v.shape[1] for D,k,v in leaves]))
+        
+        index = 0
+        for D,k,v in leaves:
+            cols = v.shape[1]
+            view = buffer[index:index+rows*cols].reshape((rows,cols),order='F')
+            if v.shape[0] == rows or v.shape[0] == 1:
+                view[:,:] = v
+            else:
+                view[:,:] = np.resize(v,[rows,cols])
+            D[k]   = view
+            index += rows*cols
+            
+        return
+    
+    def pack_array(self,output='vector'):
+        """ maps the data dict to a 1D vector or 2D column array. If the arrays were expanded into a contiguous buffer
+            the vector is a single copy out of the buffer, otherwise see Data.pack_array.
+        
+            Assumptions:
+            N/A
+    
+            Source:
+            N/A
+    
+            Inputs:
+            output - either 'vector' (default), or 'array'
+    
+            Outputs:
+            array - the packed array
+    
+            Properties Used:
+            None
+        """   
+        
+        if self._contiguous and output == 'vector':
+            run = self.contiguous_run()
+            if run is not None:
+                return run.copy()
+        
+        return Data.pack_array(self,output)
+    
+    def unpack_array(self,M):
+        """ unpacks an input 1d vector or 2d column array into the data dictionary. If the arrays were expanded into a
+            contiguous buffer the vector is copied into the buffer in one slice, otherwise see Data.unpack_array.
+        
+            Assumptions:
+            N/A
+    
+            Source:
+            N/A
+    
+            Inputs:
+            M - either a 1D vector or 2D column array
+    
+            Outputs:
+            a reference to self, updates self in place
+    
+            Properties Used:
+            None
+        """   
+        
+        if self._contiguous and M.ndim == 1:
+            run = self.contiguous_run()
+            if run is not None and run.shape == M.shape:
+                run[:] = M
+                return self
+        
+        return Data.unpack_array(self,M)
+    
+    def contiguous_run(self):
+        """ Finds the part of the contiguous buffer that holds everything pack_array would pack, in order.
+            The result is kept until the arrays are replaced or keys are added or removed, also when there
+            is no such part.
+        
+            Assumptions:
+            N/A
+    
+            Source:
+            N/A
+    
+            Inputs:
+            None
+    
+            Outputs:
+            run - 1D view into the buffer, None if the packed values are not one contiguous run
+    
+            Properties Used:
+            None
+        """         
+        
+        layout = self._layout
+        
+        # check that nothing was replaced since the run was looked for
+        if layout is not None:
+            for D,n in layout['nodes']:
+                if len(D) != n:
+                    layout = None
+                    break
+            else:
+                for D,k,v in layout['leaves']:
+                    if not dictgetitem(D,k) is v:
+                        layout = None
+                        break
+                else:
+                    # copies of the state do not share the buffer
+                    base = layout['base']
+                    if layout['run'] is not None:
+                        for v in layout['arrays']:
+                            if not v.base is base:
+                                layout = None
+                                break
+        
+        if layout is None:
+            layout = find_contiguous_run(self)
+            self._layout = layout
+        
+        return layout['run']
+    
+    def freeze(self):
+        """ Copies the tree into fixed schema objects that store the values as plain attributes. This is meant for
+            the iterations of a solve, where the keys of the conditions stay the same but they are read and written
+            many times. The values themselves are shared, not copied.
+        
+            Assumptions:
+            Only Conditions and plain Data branches are frozen, other Data subclasses are kept as they are
+    
+            Source:
+            N/A
+    
+            Inputs:
+            None
+    
+            Outputs:
+            frozen   [Frozen_Conditions], self if the keys can not be attribute names
+    
+            Properties Used:
+            None
+        """
+        
+        return freeze_data(self)
+    
+    def unfreeze(self):
+        """ The counterpart of freeze, Conditions that are not frozen are returned as they are.
+        
+            Assumptions:
+            None
+    
+            Source:
+            N/A
+    
+            Inputs:
+            None
+    
+            Outputs:
+            self
+    
+            Properties Used:
+            None
+        """
+        
+        return self
+    
     def compile(self):
         """ This is a call to expand_rows above...
         
@@ -156,4 +380,376 @@ class Conditions(Data):
             Properties Used:
             None
         """          
-        self.expand_rows()
\ No newline at end of file
+        self.expand_rows()
+
+# ----------------------------------------------------------------------
+#  Frozen Conditions
+# ----------------------------------------------------------------------
+
+## @ingroup Analyses-Mission-Segments-Conditions
+class Frozen_Conditions(object):
+    """ A fixed schema copy of a Conditions tree, made by Conditions.freeze(). Every key is a slot of a class that is
+        generated for the set of keys, so reading and writing a value is a plain attribute access. The dict style
+        interface of Data is kept, and unfreeze() writes everything back into the original Conditions.
+    
+        Assumptions:
+        New keys still work, but are stored in a regular dictionary
+        
+        Source:
+        None   
+    """ 
+    
+    __slots__ = ('_original','_size','__dict__')
+    
+    _keys = ()
+    
+    def keys(self):
+        """ The keys, in the order of the original Conditions followed by any new keys
+        
+            Assumptions:
+            None
+    
+            Source:
+            N/A
+    
+            Inputs:
+            None
+    
+            Outputs:
+            keys   [list]
+    
+            Properties Used:
+            None
+        """
+        
+        keys = []
+        for k in self._keys:
+            try:
+                getattr(self,k)
+            except AttributeError:
+                continue
+            keys.append(k)
+        keys.extend(self.__dict__.keys())
+        
+        return keys
+    
+    def values(self):
+        """ The values, in the order of keys()
+        
+            Assumptions:
+            None
+    
+            Source:
+            N/A
+    
+            Inputs:
+            None
+    
+            Outputs:
+            values   [list]
+    
+            Properties Used:
+            None
+        """
+        
+        return [getattr(self,k) for k in self.keys()]
+    
+    def items(self):
+        """ The keys and values, in the order of keys()
+        
+            Assumptions:
+            None
+    
+            Source:
+            N/A
+    
+            Inputs:
+            None
+    
+            Outputs:
+            items   [list]
+    
+            Properties Used:
+            None
+        """
+        
+        return [(k,getattr(self,k)) for k in self.keys()]
+    
+    def get(self,k,default=None):
+        """ Returns the value of k, or the default if there is no key k
+        
+            Assumptions:
+            None
+    
+            Source:
+            N/A
+    
+            Inputs:
+            k         [key]
+            default
+    
+            Outputs:
+            value
+    
+            Properties Used:
+            None
+        """
+        
+        if k in self:
+            return getattr(self,k)
+        return default
+    
+    def update(self,other):
+        """ Updates the values with the values of another dictionary, the same way as Data.update
+        
+            Assumptions:
+            None
+    
+            Source:
+            N/A
+    
+            Inputs:
+            other   [dict]
+    
+            Outputs:
+            None
+    
+            Properties Used:
+            None
+        """
+        
+        if not isinstance(other,(dict,Frozen_Conditions)):
+            raise TypeError('input is not a dictionary type')
+        for k,v in other.items():
+            if k.startswith('_'):
+                continue
+            try:
+                self[k].update(v)
+            except:
+                self[k] = v
+        return
+    
+    def __getitem__(self,k):
+        if not k in self:
+            raise KeyError(k)
+        return getattr(self,k)
+    
+    def __setitem__(self,k,v):
+        setattr(self,k,v)
+        
+    def __delitem__(self,k):
+        if not k in self:
+            raise KeyError(k)
+        delattr(self,k)
+    
+    def __contains__(self,k):
+        if k in self._keys:
+            try:
+                getattr(self,k)
+            except AttributeError:
+                return False
+            return True
+        return k in self.__dict__
+    
+    def __iter__(self):
+        return iter(self.keys())
+    
+    def __len__(self):
+        return len(self.keys())
+    
+    def __repr__(self):
+        return "<frozen data object '" + self._original.typestring() + "'>"
+    
+    def ones_row(self,cols):
+        """ See Conditions.ones_row """
+        return np.ones([self._size,cols])
+    
+    def ones_row_m1(self,cols):
+        """ See Conditions.ones_row_m1 """
+        return np.ones([self._size-1,cols])
+    
+    def ones_row_m2(self,cols):
+        """ See Conditions.ones_row_m2 """
+        return np.ones([self._size-2,cols])
+    
+    def freeze(self):
+        """ Already frozen, returns self """
+        return self
+    
+    def unfreeze(self):
+        """ Writes all the keys and values back into the original Conditions, in order, and returns it
+        
+            Assumptions:
+            None
+    
+            Source:
+            N/A
+    
+            Inputs:
+            None
+    
+            Outputs:
+            original   [Conditions]
+    
+            Properties Used:
+            None
+        """
+        
+        original = self._original
+        items    = [(k,v.unfreeze() if isinstance(v,Frozen_Conditions) else v) for k,v in self.items()]
+        
+        dict.clear(original)
+        for k,v in items:
+            dict.__setitem__(original,k,v)
+        
+        return original
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+# frozen classes by the class and the keys they are made from
+frozen_classes = {}
+
+## @ingroup Analyses-Mission-Segments-Conditions
+def frozen_class(klass, keys):
+    """ Generates the fixed schema class for a Data class and its keys, each combination is only made once.
+    
+        Assumptions:
+        Keys have to be valid attribute names that are not used by Frozen_Conditions
+
+        Source:
+        N/A
+
+        Inputs:
+        klass   [class]
+        keys    [tuple]
+
+        Outputs:
+        frozen  [class], None if the keys can not be slots
+
+        Properties Used:
+        None
+    """
+    
+    try:
+        return frozen_classes[(klass,keys)]
+    except KeyError:
+        pass
+    
+    reserved = dir(Frozen_Conditions)
+    frozen   = None
+    for k in keys:
+        if not isinstance(k,str) or not k.isidentifier() or keyword.iskeyword(k) \
+           or k.startswith('__') or k in reserved:
+            break
+    else:
+        frozen = type('Frozen_' + klass.__name__,(Frozen_Conditions,),dict(__slots__=keys,_keys=keys))
+        
+    frozen_classes[(klass,keys)] = frozen
+    
+    return frozen
+
+## @ingroup Analyses-Mission-Segments-Conditions
+def freeze_data(data):
+    """ Makes the Frozen_Conditions copy of a Conditions or Data tree, see Conditions.freeze.
+    
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        data    [Data]
+
+        Outputs:
+        frozen  [Frozen_Conditions], data if the keys can not be slots
+
+        Properties Used:
+        None
+    """
+    
+    klass = frozen_class(type(data),tuple(dict.keys(data)))
+    if klass is None:
+        return data
+    
+    frozen = object.__new__(klass)
+    frozen._original = data
+    frozen._size     = getattr(data,'_size',1)
+    
+    for k,v in dict.items(data):
+        if type(v) is Data or isinstance(v,Conditions):
+            v = freeze_data(v)
+        setattr(frozen,k,v)
+        
+    return frozen
+
+## @ingroup Analyses-Mission-Segments-Conditions
+def find_contiguous_run(data):
+    """ Checks if the values pack_array would pack are views into one buffer, back to back in packing order.
+    
+        Assumptions:
+        Follows the packing order and type rules of Data.pack_array
+
+        Source:
+        N/A
+
+        Inputs:
+        data    [Data]
+
+        Outputs:
+        layout  [dict] the dicts, leaves, buffer and 1D view of the run, the run is None if there is no single run
+
+        Properties Used:
+        None
+    """
+    
+    nodes  = []
+    leaves = []
+    
+    valid_types = ( int, float,
+                    array_type,
+                    matrix_type )
+    
+    def do_walk(D):
+        nodes.append((D,len(D)))
+        for k,v in D.items():
+            if isinstance(v,dict):
+                do_walk(v)
+                continue
+            elif not isinstance(v,valid_types): continue
+            leaves.append((D,k,v))
+    
+    do_walk(data)
+    
+    # every value must be a column major float array with the same base
+    arrays = [v for D,k,v in leaves if not (isinstance(v,array_type) and v.ndim > 2)]
+    layout = dict(nodes=nodes, leaves=leaves, arrays=arrays, base=None, run=None)
+    if not arrays:
+        return layout
+    base = arrays[0].base
+    for v in arrays:
+        if not isinstance(v,array_type) or v.ndim != 2 or v.dtype != np.float64 \
+           or not v.flags.f_contiguous or v.base is not base or base is None:
+            return layout
+    
+    # and they must follow each other in memory
+    start = arrays[0].__array_interface__['data'][0]
+    end   = start
+    for v in arrays:
+        if v.__array_interface__['data'][0] != end:
+            return layout
+        end += v.nbytes
+    
+    base_start = base.__array_interface__['data'][0]
+    if base.ndim != 1 or base.dtype != np.float64 or not base.flags.c_contiguous:
+        return layout
+    
+    first = (start - base_start)//base.itemsize
+    last  = (end   - base_start)//base.itemsize
+    
+    layout['base'] = base
+    layout['run']  = base[first:last]
+    
+    return layout
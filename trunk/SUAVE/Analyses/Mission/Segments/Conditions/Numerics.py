@@ -3,6 +3,7 @@
 #
 # Created:  
 # Modified: Feb 2016, Andrew Wendorff
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -10,6 +11,8 @@
 
 from .Conditions import Conditions
 
+from SUAVE.Core import Data
+
 from SUAVE.Methods.Utilities.Chebyshev  import chebyshev_data
 
 import numpy as np
@@ -52,11 +55,27 @@ class Numerics(Conditions):
         self.number_control_points = 16
         self.discretization_method = chebyshev_data
         
-        self.solver_jacobian                  = "none"
+        self.solver_jacobian                  = "none" # "none", "block" or "colored", see Methods.Missions.Segments.converge_root
         self.tolerance_solution               = 1e-8
         self.converged                        = None
         self.max_evaluations                  = 0.
         self.step_size                        = None
+        self.contiguous_state                 = False # store the state arrays in one buffer, see Conditions.expand_rows
+        self.freeze_conditions                = False # fixed schema conditions while solving, see Conditions.freeze
+        self.reuse_merged_state               = False # update the merged sub segment states in place, see Segment.merged
+        self.sparsity_tolerance               = 1e-3
+        
+        # sparsity pattern of the residual jacobian, kept between solves
+        self.jacobian_pattern         = Data()
+        self.jacobian_pattern.pattern = None
+        self.jacobian_pattern.colors  = None
+        
+        # converged unknowns of previous solves by segment tag, used as the next initial guess once enabled
+        self.warm_start              = Data()
+        self.warm_start.enabled      = False
+        self.warm_start.extrapolate  = False
+        self.warm_start.history_size = 2
+        self.warm_start.history      = Data()
         
         self.dimensionless = Conditions()
         self.dimensionless.control_points = np.empty([0,0])
@@ -4,6 +4,7 @@
 # Created:  
 # Modified: Feb 2016, Andrew Wendorff
 #           Jan 2020, M. Clarke
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -64,18 +65,20 @@ class State(Conditions):
         self.numerics   = Numerics()
         self.initials   = Conditions()
         
-    def expand_rows(self,rows):
+    def expand_rows(self,rows,contiguous=False):
         """ Makes a 1-D array the right size. Often used after a mission is initialized to size out the vectors to the
             right size.
         
             Assumptions:
             Doesn't expand initials or numerics
+            If contiguous, all the float arrays are stored as views into one buffer
     
             Source:
             N/A
     
             Inputs:
-            rows   [int]
+            rows        [int]
+            contiguous  [boolean]
     
             Outputs:
             None
@@ -84,8 +87,14 @@ class State(Conditions):
             None
         """         
         
+        if contiguous:
+            self.expand_rows_contiguous(rows,skip=('initials','numerics'))
+            return
+        
         # store
-        self._size = rows
+        self._size       = rows
+        self._contiguous = False
+        self._layout     = None
         
         for k,v in self.items(): 
             try:
@@ -105,6 +114,52 @@ class State(Conditions):
             #: if type
         #: for each key,value        
         
+    
+    def freeze(self):
+        """ Freezes the conditions for the iterations of a solve, see Conditions.freeze.
+        
+            Assumptions:
+            The unknowns, residuals, numerics and initials are not frozen
+    
+            Source:
+            N/A
+    
+            Inputs:
+            None
+    
+            Outputs:
+            self
+    
+            Properties Used:
+            None
+        """
+        
+        self.conditions = self.conditions.freeze()
+        
+        return self
+    
+    def unfreeze(self):
+        """ Puts the original conditions back after a solve, with the latest values.
+        
+            Assumptions:
+            None
+    
+            Source:
+            N/A
+    
+            Inputs:
+            None
+    
+            Outputs:
+            self
+    
+            Properties Used:
+            None
+        """
+        
+        self.conditions = self.conditions.unfreeze()
+        
+        return self
         
 ## @ingroup Analyses-Mission-Segments-Conditions        
 class Container(State):
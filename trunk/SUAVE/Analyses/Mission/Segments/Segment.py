@@ -3,6 +3,7 @@
 #
 # Created:  
 # Modified: Sep 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -13,6 +14,7 @@
 from SUAVE.Analyses import Analysis, Settings, Process
 from .Conditions import State
 from SUAVE.Core.Arrays import array_type
+from SUAVE.Core import Data
 import numpy as np
 
 # ----------------------------------------------------------------------
@@ -30,6 +32,9 @@ class Segment(Analysis):
         None
     """    
     
+    # layout of the last merged state, see merged
+    _merged = None
+    
     def __defaults__(self):
         """This sets the default values.
     
@@ -200,17 +205,18 @@ class Segment(Analysis):
         return self
     
     
-    def merged(self):
+    def merged(self,reuse=False):
         """ Combines the states of multiple segments
     
             Assumptions:
-            None
+            Every array is stacked once from all the sub segments. With reuse, the arrays of the last merge are
+            updated in place if the sub segment states still have the same layout.
     
             Source:
             N/A
     
             Inputs:
-            None
+            reuse     [boolean]
     
             Outputs:
             state_out [State()]
@@ -219,29 +225,18 @@ class Segment(Analysis):
             None
         """              
         
-        state_out = State()
+        sub_states = [sub_seg.state for sub_seg in self.segments.values()]
         
-        for i,(tag,sub_seg) in enumerate(self.segments.items()):
-            sub_state = sub_seg.state
-            for key in ['unknowns','conditions','residuals']:
-                if i == 0:
-                    state_out[key].update(sub_state[key])
-                else:
-
-                    # Update existing items
-                    state_out[key] = state_out[key].do_recursive(append_array,sub_state[key])
-                    
-                    # Check if all the states exist, if not add them
-                    existing_keys = list(state_out[key].keys())
-                    new_keys      = list(sub_state[key].keys())
-                    diff_list     = np.setdiff1d(new_keys,existing_keys).tolist()                    
-                    
-                    # Do an update for the remainder
-                    for update_key in diff_list:
-                        state_out[key][update_key] = sub_state[key][update_key]
-                                        
+        if reuse and self._merged is not None:
+            if update_merged_states(self._merged,sub_states):
+                return self._merged.state_out
             
-        return state_out
+        merged = merge_states(sub_states)
+        
+        if reuse:
+            self._merged = merged
+        
+        return merged.state_out
 
     
     
@@ -330,4 +325,262 @@ def append_array(A,B=None):
     if isinstance(A,array_type) and isinstance(B,array_type):
         return np.vstack([A,B])
     else:
-        return None
\ No newline at end of file
+        return None
+
+
+## @ingroup Analyses-Mission-Segments
+def merge_states(sub_states):
+    """ Stacks the unknowns, conditions and residuals of several states into one state.
+        Gives the same result as appending the states one after another with Data.do_recursive and append_array,
+        but the stacked arrays are only built once at the end, so the cost is linear in the number of states.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        sub_states [list of State()]
+
+        Outputs:
+        merged     [Data] the merged state_out and what is needed to update it in place
+
+        Properties Used:
+        None
+    """
+    
+    state_out  = State()
+    stacks     = []
+    references = []
+    
+    for key in ['unknowns','conditions','residuals']:
+        out   = state_out[key]
+        first = sub_states[0][key]
+        out.update(first)
+        
+        if len(sub_states) == 1:
+            continue
+        
+        klass    = out.__class__
+        defaults = klass()
+        owned    = set([id(out)])
+        
+        # where every value of an owned node came from
+        sources  = dict()
+        for k in out.keys():
+            if k in first:
+                sources[(id(out),k)] = (first,k)
+        
+        def drop(A,k):
+            sources.pop((id(A),k),None)
+            if k in defaults:
+                A[k] = defaults[k]
+            else:
+                del A[k]
+        
+        def do_merge(A,B,B_source):
+            for k in list(A.keys()):
+                a = A[k]
+                if isinstance(B,Data):
+                    if k in B:
+                        b        = B[k]
+                        b_source = (B,k)
+                    else: 
+                        continue
+                else:
+                    b        = B
+                    b_source = B_source
+                
+                # arrays already being stacked
+                if isinstance(a,Stack):
+                    if isinstance(b,array_type):
+                        a.append(b,b_source)
+                    else:
+                        drop(A,k)
+                        
+                # recursion
+                elif isinstance(a,Data):
+                    if not id(a) in owned:
+                        c = klass()
+                        owned.add(id(c))
+                        for kk,vv in a.items():
+                            c[kk] = vv
+                            sources[(id(c),kk)] = (a,kk)
+                        sources.pop((id(A),k),None)
+                        A[k] = c
+                        a    = c
+                    do_merge(a,b,b_source)
+                    
+                # start stacking
+                elif isinstance(a,array_type) and isinstance(b,array_type):
+                    stack = Stack()
+                    stack.append(a,sources.pop((id(A),k),None))
+                    stack.append(b,b_source)
+                    A[k] = stack
+                    
+                else:
+                    drop(A,k)
+                    
+        for B in sub_states[1:]:
+            B = B[key]
+            do_merge(out,B,None)
+            
+            # Check if all the states exist, if not add them
+            existing_keys = list(out.keys())
+            new_keys      = list(B.keys())
+            diff_list     = np.setdiff1d(new_keys,existing_keys).tolist()                    
+            for update_key in diff_list:
+                out[update_key] = B[update_key]
+                sources[(id(out),update_key)] = (B,update_key)
+                
+        # stack everything once
+        def do_stack(A):
+            for k,a in A.items():
+                if isinstance(a,Stack):
+                    A[k] = np.vstack(a.arrays)
+                    rows = np.cumsum([0] + [np.atleast_2d(v).shape[0] for v in a.arrays])
+                    stacks.append((A[k],rows,a.sources))
+                elif isinstance(a,Data) and id(a) in owned:
+                    do_stack(a)
+                elif (id(A),k) in sources:
+                    references.append((A,k) + sources[(id(A),k)])
+        do_stack(out)
+        
+    merged = Data()
+    merged.state_out  = state_out
+    merged.stacks     = stacks
+    merged.references = references
+    merged.layout     = state_layout(sub_states)
+    
+    return merged
+
+## @ingroup Analyses-Mission-Segments
+def update_merged_states(merged,sub_states):
+    """ Copies the current values of the sub states into the arrays of a previous merge
+
+        Assumptions:
+        Only done if the sub states have exactly the same layout as in the previous merge
+
+        Source:
+        N/A
+
+        Inputs:
+        merged     [Data] from merge_states
+        sub_states [list of State()]
+
+        Outputs:
+        updated    [boolean] False if the layout changed and nothing was done
+
+        Properties Used:
+        None
+    """
+    
+    if state_layout(sub_states) != merged.layout:
+        return False
+    
+    for out,rows,sources in merged.stacks:
+        for i,source in enumerate(sources):
+            if source is not None:
+                node,key = source
+                out[rows[i]:rows[i+1]] = np.atleast_2d(node[key])
+            
+    for A,k,node,key in merged.references:
+        A[k] = node[key]
+        
+    return True
+
+## @ingroup Analyses-Mission-Segments
+def state_layout(sub_states):
+    """ Lists the nodes, keys, array shapes and types of the unknowns, conditions and residuals of the states.
+        Two equal layouts merge into the same structure.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        sub_states [list of State()]
+
+        Outputs:
+        layout     [list]
+
+        Properties Used:
+        None
+    """
+    
+    layout = []
+    
+    def do_layout(D):
+        layout.append(id(D))
+        for k,v in D.items():
+            if isinstance(v,Data):
+                layout.append(k)
+                do_layout(v)
+            elif isinstance(v,array_type):
+                layout.append((k,v.shape,v.dtype))
+            else:
+                layout.append((k,type(v)))
+        layout.append(None)
+                
+    for sub_state in sub_states:
+        for key in ['unknowns','conditions','residuals']:
+            do_layout(sub_state[key])
+            
+    return layout
+
+## @ingroup Analyses-Mission-Segments
+class Stack(object):
+    """ Arrays waiting to be stacked by merge_states, and where they came from
+    
+        Assumptions:
+        None
+        
+        Source:
+        None
+    """
+    
+    def __init__(self):
+        """ Starts an empty stack
+    
+            Assumptions:
+            None
+    
+            Source:
+            N/A
+    
+            Inputs:
+            None
+    
+            Outputs:
+            None
+    
+            Properties Used:
+            None
+        """
+        self.arrays  = []
+        self.sources = []
+        
+    def append(self,array,source):
+        """ Adds an array to the stack
+    
+            Assumptions:
+            None
+    
+            Source:
+            N/A
+    
+            Inputs:
+            array   [array]
+            source  [tuple] the Data and key the array came from
+    
+            Outputs:
+            None
+    
+            Properties Used:
+            None
+        """
+        self.arrays.append(array)
+        self.sources.append(source)
@@ -3,6 +3,7 @@
 #
 # Created:  
 # Modified: Feb 2016, Andrew Wendorff
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -27,7 +28,10 @@ class Process(ContainerOrdered):
             N/A
     """    
     
-    verbose = False
+    verbose  = False
+    
+    # set by a Process_Profiler while it profiles
+    profiler = None
     
     def evaluate(self,*args,**kwarg):
         """This is used to execute the evaluate functions of the analyses
@@ -49,6 +53,9 @@ class Process(ContainerOrdered):
                 N/A
             """        
         
+        if self.profiler is not None:
+            return self.profiler.evaluate(self,*args,**kwarg)
+        
         results = Data()
         
         if self.verbose:
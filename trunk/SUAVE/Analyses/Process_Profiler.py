@@ -0,0 +1,412 @@
+## @ingroup Analyses
+# Process_Profiler.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+from SUAVE.Core import Data
+from .Process import Process
+
+import json
+import time
+import tracemalloc
+
+# ----------------------------------------------------------------------
+#  Process Profiler
+# ----------------------------------------------------------------------
+
+## @ingroup Analyses
+class Process_Profiler(object):
+    """ SUAVE.Analyses.Process_Profiler()
+
+        Records the number of calls, the cumulative and self wall time and optionally the memory allocated by
+        every step of every process, by the path of the step through the processes. The records add up over
+        all the iterations of the solvers, e.g.
+
+            profiler = SUAVE.Analyses.Process_Profiler()
+            profiler.start()
+            mission.evaluate()
+            profiler.stop()
+            print(profiler.summary())
+
+        Assumptions:
+        A process that a segment owns is named after the segment, e.g. cruise.process.iterate, other
+        processes are named by the steps that lead to them
+
+        Source:
+        Collapsed stacks of flame graphs, http://www.brendangregg.com/flamegraphs.html
+    """
+
+    def __init__(self,track_memory=False):
+        """This sets up an empty profile.
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            track_memory  <boolean> record the memory allocated by each step, with tracemalloc
+
+            Outputs:
+            None
+
+            Properties Used:
+            N/A
+        """
+        self.track_memory = track_memory
+        self.records      = dict()
+        self.stack        = []
+        self.previous     = None
+        self.tracing      = False
+
+    def start(self):
+        """Starts profiling every process that is evaluated.
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            None
+
+            Outputs:
+            None
+
+            Properties Used:
+            N/A
+        """
+        self.previous    = Process.profiler
+        Process.profiler = self
+        if self.track_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.tracing = True
+
+    def stop(self):
+        """Stops profiling, the records are kept.
+
+            Assumptions:
+            tracemalloc is only stopped if start() started it
+
+            Source:
+            N/A
+
+            Inputs:
+            None
+
+            Outputs:
+            None
+
+            Properties Used:
+            N/A
+        """
+        Process.profiler = self.previous
+        self.previous    = None
+        if self.tracing:
+            tracemalloc.stop()
+            self.tracing = False
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self,*args):
+        self.stop()
+
+    def evaluate(self,process,*args,**kwarg):
+        """Evaluates the steps of a process like Process.evaluate, recording each step.
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            process  [Process()]
+
+            Outputs:
+            Results of the Evaluate Functions
+
+            Properties Used:
+            N/A
+        """
+
+        # a process that is not a step of the process above it gets a frame of its own
+        label = None
+        if not self.stack or self.stack[-1][1] is not process:
+            label = self.process_label(process,args)
+        if label is not None:
+            self.enter(label,process)
+
+        results = Data()
+
+        if process.verbose:
+            print('process start')
+
+        try:
+            for tag,step in process.items():
+
+                if process.verbose:
+                    print('step :' , tag)
+
+                self.enter(tag,step)
+                try:
+                    if hasattr(step,'evaluate'):
+                        result = step.evaluate(*args,**kwarg)
+                    else:
+                        result = step(*args,**kwarg)
+                finally:
+                    self.exit()
+                results[tag] = result
+        finally:
+            if label is not None:
+                self.exit()
+
+        if process.verbose:
+            print('process end')
+
+        return results
+
+    def process_label(self,process,args):
+        """Names a process after the segment that owns it.
+
+            Assumptions:
+            The segment is the first argument of its processes
+
+            Source:
+            N/A
+
+            Inputs:
+            process  [Process()]
+            args     [list]
+
+            Outputs:
+            label    [string], None if no segment owns the process
+
+            Properties Used:
+            N/A
+        """
+        if not args or not isinstance(getattr(args[0],'process',None),Process):
+            return None
+
+        owner = args[0]
+        if owner.process is process:
+            return owner.tag + '.process'
+        for key,value in owner.process.items():
+            if value is process:
+                return owner.tag + '.process.' + key
+
+        return None
+
+    def enter(self,label,step):
+        """Opens the frame of a step.
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            label    [string]
+            step     [Process() or function]
+
+            Outputs:
+            None
+
+            Properties Used:
+            N/A
+        """
+        path   = self.stack[-1][0] + (label,) if self.stack else (label,)
+        memory = tracemalloc.get_traced_memory()[0] if self.track_memory else 0
+        self.stack.append([path,step,time.perf_counter(),0.,memory])
+
+    def exit(self):
+        """Closes the frame of a step and adds it to the records of its path.
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            None
+
+            Outputs:
+            None
+
+            Properties Used:
+            N/A
+        """
+        path, step, tic, child_time, memory = self.stack.pop()
+        elapsed = time.perf_counter() - tic
+
+        if self.stack:
+            self.stack[-1][3] += elapsed
+
+        record = self.records.get(path)
+        if record is None:
+            record = self.records[path] = [0,0.,0.,0]
+        record[0] += 1
+        record[1] += elapsed
+        record[2] += elapsed - child_time
+        if self.track_memory:
+            record[3] += tracemalloc.get_traced_memory()[0] - memory
+
+    def reset(self):
+        """Clears the records.
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            None
+
+            Outputs:
+            None
+
+            Properties Used:
+            N/A
+        """
+        self.records = dict()
+
+    def results(self):
+        """The records of every path, by descending cumulative time.
+
+            Assumptions:
+            The allocated memory is what a step allocated and did not free, zero without track_memory
+
+            Source:
+            N/A
+
+            Inputs:
+            None
+
+            Outputs:
+            results   [list] of dicts of path, calls, cumulative_time [s], self_time [s], allocated [bytes]
+
+            Properties Used:
+            N/A
+        """
+        results = []
+        for path,record in self.records.items():
+            results.append(dict(path            = '.'.join(path),
+                                calls           = record[0],
+                                cumulative_time = record[1],
+                                self_time       = record[2],
+                                allocated       = record[3]))
+        results.sort(key=lambda result: -result['cumulative_time'])
+
+        return results
+
+    def step_totals(self):
+        """The records added up by step, over every path that ends with the step, e.g. the aerodynamics of
+        all the segments and all the iterations.
+
+            Assumptions:
+            A step inside a step of the same name is counted once, by the outer step
+
+            Source:
+            N/A
+
+            Inputs:
+            None
+
+            Outputs:
+            totals    [dict] of step: dicts of calls, cumulative_time [s], self_time [s], allocated [bytes]
+
+            Properties Used:
+            N/A
+        """
+        totals = dict()
+        for path,record in self.records.items():
+            step = path[-1]
+            if step in path[:-1]:
+                continue
+            total = totals.setdefault(step,dict(calls=0,cumulative_time=0.,self_time=0.,allocated=0))
+            total['calls']           += record[0]
+            total['cumulative_time'] += record[1]
+            total['self_time']       += record[2]
+            total['allocated']       += record[3]
+
+        return totals
+
+    def summary(self,number_of_paths=30):
+        """A table of the paths that take the most time.
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            number_of_paths  [int]
+
+            Outputs:
+            summary          [string]
+
+            Properties Used:
+            N/A
+        """
+        lines = ['%10s %14s %14s %14s  %s' % ('calls','cumulative [s]','self [s]','allocated [B]','path')]
+        for result in self.results()[:number_of_paths]:
+            lines.append('%10i %14.4f %14.4f %14i  %s' % (result['calls'],result['cumulative_time'],result['self_time'],
+                                                          result['allocated'],result['path']))
+
+        return '\n'.join(lines)
+
+    def write_json(self,filename):
+        """Writes the records of every path to a JSON file.
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            filename  [string]
+
+            Outputs:
+            None
+
+            Properties Used:
+            N/A
+        """
+        with open(filename,'w') as f:
+            json.dump(self.results(),f,indent=1)
+
+    def write_stacks(self,filename):
+        """Writes the self time of every path as collapsed stacks, one 'step;step;step microseconds' line per path,
+        the input of flame graph tools.
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            filename  [string]
+
+            Outputs:
+            None
+
+            Properties Used:
+            N/A
+        """
+        with open(filename,'w') as f:
+            for path,record in self.records.items():
+                f.write(';'.join(path) + ' ' + str(int(round(record[2]*1e6))) + '\n')
@@ -3,6 +3,7 @@
 #
 # Created:  Apr 2017, M. Clarke 
 # Modified: Apr 2020, M. Clarke
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -28,6 +29,7 @@ from SUAVE.Methods.Aerodynamics.AVL.Data.Cases               import Run_Case
 from SUAVE.Methods.Geometry.Two_Dimensional.Planform.populate_control_sections import populate_control_sections  
 from SUAVE.Methods.Flight_Dynamics.Dynamic_Stability.compute_dynamic_flight_modes import  compute_dynamic_flight_modes
 from SUAVE.Components.Wings.Control_Surfaces import Aileron , Elevator , Slat , Flap , Rudder 
+from SUAVE.Methods.Utilities.surrogate_training_cache import training_fingerprint, load_training, save_training
 
 # local imports 
 from .Stability import Stability
@@ -88,6 +90,10 @@ class AVL(Stability):
         self.settings.number_spanwise_vortices      = 20
         self.settings.number_chordwise_vortices     = 10
         self.settings.trim_aircraft                 = False 
+        
+        # training data kept on disk between runs, off unless a directory is given
+        self.settings.training_cache_directory      = None
+        self.settings.training_cache_size           = 1e9 # [bytes]
                                                     
         # Conditions table, used for surrogate model training
         self.training                               = Data()   
@@ -135,12 +141,21 @@ class AVL(Stability):
 
         Properties Used:
         self.geometry.tag
+        self.settings.
+          training_cache_directory     <string> (optional - directory of the training cache)
+          training_cache_size          [bytes]
         """          
         geometry                       = self.geometry
+        settings                       = self.settings
+        training                       = self.training
         self.tag                       = 'avl_analysis_of_{}'.format(geometry.tag) 
             
-        # Sample training data
-        self.sample_training()
+        # Sample training data, unless the same vehicle was sampled before and no training file is given
+        directory   = None if self.training_file else settings.training_cache_directory
+        fingerprint = training_fingerprint('AVL',geometry,settings,[training.angle_of_attack,training.Mach],['filenames','run_cases'])
+        if not load_training(directory,fingerprint,training):
+            self.sample_training()
+            save_training(directory,fingerprint,training,settings.training_cache_size)
         
         # Build surrogate
         self.build_surrogate()
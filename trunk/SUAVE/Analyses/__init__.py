@@ -6,6 +6,7 @@
 from .Analysis  import Analysis
 from .Sizing    import Sizing
 from .Process   import Process
+from .Process_Profiler import Process_Profiler
 from .Settings  import Settings
 from .Vehicle   import Vehicle
 
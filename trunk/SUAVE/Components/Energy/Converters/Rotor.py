@@ -6,6 +6,7 @@
 #           Feb 2019, M. Vegh            
 #           Mar 2020, M. Clarke
 #           Sep 2020, M. Clarke 
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -14,6 +15,7 @@ from SUAVE.Components.Energy.Energy_Component import Energy_Component
 from SUAVE.Core import Data
 from SUAVE.Methods.Geometry.Three_Dimensional \
      import  orientation_product, orientation_transpose
+from SUAVE.Methods.Propulsion.bemt_calculations import compute_inflow_and_tip_loss, compute_airfoil_aerodynamics, compute_dR_dpsi
 
 # package imports
 import numpy as np
@@ -169,8 +171,6 @@ class Rotor(Energy_Component):
         pitch_c = self.pitch_command
         theta   = self.thrust_angle 
         Na      = self.number_azimuthal_stations 
-        BB      = B*B    
-        BBB     = BB*B
     
         # calculate total blade pitch
         total_blade_pitch = beta_0 + pitch_c  
@@ -210,7 +210,6 @@ class Rotor(Energy_Component):
         omega          = np.abs(omega)        
         r              = chi*R                              # Radial coordinate 
         pi             = np.pi        
-        pi2            = pi*pi       
         n              = omega/(2.*pi)                      # Cycles per second  
         nu             = mu/rho         
     
@@ -243,92 +242,70 @@ class Rotor(Energy_Component):
         broke  = False
         tol    = 1e-6  # Convergence tolerance
         
+        # Every station is solved on its own, the stations whose step is down to round off are not updated
+        # any more. The stations are flattened, with the airfoil of each station packed into one array.
+        tol_station   = 1e-14
+        active        = np.ones(size,dtype=bool)
+        dpsi          = np.zeros(size)
+        ones          = np.ones(size)
+        r_stations    = r*ones
+        c_stations    = c*ones
+        beta_stations = beta*ones
+        a_stations    = a*ones
+        nu_stations   = nu*ones
+        if a_loc != None:
+            airfoil_index = (np.array(a_loc)*ones).astype(int)
+        else:
+            airfoil_index = None
+        
+        Wa     = np.zeros(size)
+        Wt     = np.zeros(size)
+        va     = np.zeros(size)
+        vt     = np.zeros(size)
+        Ma     = np.zeros(size)
+        Gamma  = np.zeros(size)
+        Cl     = np.zeros(size)
+        Cdval  = np.zeros(size)
+        
         while (diff>tol):
-            sin_psi      = np.sin(PSI)
-            cos_psi      = np.cos(PSI)
-            Wa           = 0.5*Ua + 0.5*U*sin_psi
-            Wt           = 0.5*Ut + 0.5*U*cos_psi   
-            va           = Wa - Ua
-            vt           = Ut - Wt
-            alpha        = beta - np.arctan2(Wa,Wt)
-            W            = (Wa*Wa + Wt*Wt)**0.5
-            Ma           = (W)/a        # a is the speed of sound  
-            lamdaw       = r*Wa/(R*Wt) 
+            # unpack the stations that are still being solved, all of them are taken as is
+            locs   = Ellipsis if active.all() else active
+            PSI_i  = PSI[locs]
+            Ua_i   = Ua[locs]
+            Ut_i   = Ut[locs]
+            U_i    = U[locs]
+            r_i    = r_stations[locs]
+            c_i    = c_stations[locs]
+            beta_i = beta_stations[locs]
             
-            # Limiter to keep from Nan-ing
-            lamdaw[lamdaw<0.] = 0. 
-            f            = (B/2.)*(1.-r/R)/lamdaw
-            f[f<0.]      = 0.
-            piece        = np.exp(-f)
-            arccos_piece = np.arccos(piece)
-            F            = 2.*arccos_piece/pi
-            Gamma        = vt*(4.*pi*r/B)*F*(1.+(4.*lamdaw*R/(pi*B*r))*(4.*lamdaw*R/(pi*B*r)))**0.5 
-            Re           = (W*c)/nu  
-            
-            # If rotor airfoils are defined, using airfoil surrogate 
-            if a_loc != None:
-                # Compute blade Cl and Cd distribution from the airfoil data  
-                Cl      = np.zeros((ctrl_pts,Nr))              
-                Cdval   = np.zeros((ctrl_pts,Nr))  
-                dim_sur = len(cl_sur)
-                for jj in range(dim_sur):                 
-                    Cl_af         = cl_sur[a_geo[jj]](Re,alpha,grid=False)  
-                    Cdval_af      = cd_sur[a_geo[jj]](Re,alpha,grid=False)  
-                    locs          = np.where(np.array(a_loc) == jj )
-                    Cl[:,locs]    = Cl_af[:,locs]
-                    Cdval[:,locs] = Cdval_af[:,locs]        
-                     
-            else:
-                # Estimate Cl max 
-                Cl_max_ref = -0.0009*tc**3 + 0.0217*tc**2 - 0.0442*tc + 0.7005
-                Re_ref     = 9.*10**6      
-                Cl1maxp    = Cl_max_ref * ( Re / Re_ref ) **0.1
-                
-                # If not airfoil polar provided, use 2*pi as lift curve slope
-                Cl = 2.*pi*alpha
+            sin_psi, cos_psi, Wa_i, Wt_i, va_i, vt_i, alpha_i, W_i, Ma_i, Re_i, piece, arccos_piece, Gamma_i = \
+                compute_inflow_and_tip_loss(PSI_i,Ua_i,Ut_i,U_i,beta_i,r_i,c_i,a_stations[locs],nu_stations[locs],R,B)
             
-                # By 90 deg, it's totally stalled.
-                Cl[Cl>Cl1maxp]  = Cl1maxp[Cl>Cl1maxp] # This line of code is what changed the regression testing
-                Cl[alpha>=pi/2] = 0.
-                
-                # Scale for Mach, this is Karmen_Tsien
-                Cl[Ma[:,:]<1.] = Cl[Ma[:,:]<1.]/((1-Ma[Ma[:,:]<1.]*Ma[Ma[:,:]<1.])**0.5+((Ma[Ma[:,:]<1.]*Ma[Ma[:,:]<1.])/(1+(1-Ma[Ma[:,:]<1.]*Ma[Ma[:,:]<1.])**0.5))*Cl[Ma<1.]/2)
-                
-                # If the blade segments are supersonic, don't scale
-                Cl[Ma[:,:]>=1.] = Cl[Ma[:,:]>=1.]  
-                
-                #This is an atrocious fit of DAE51 data at RE=50k for Cd
-                Cdval = (0.108*(Cl*Cl*Cl*Cl)-0.2612*(Cl*Cl*Cl)+0.181*(Cl*Cl)-0.0139*Cl+0.0278)*((50000./Re)**0.2)
-                Cdval[alpha>=pi/2] = 2.                
+            # Compute blade Cl and Cd distribution from the airfoil data, or from a 2 pi lift curve slope
+            stations_i     = None if airfoil_index is None else airfoil_index[locs]
+            Cl_i, Cdval_i  = compute_airfoil_aerodynamics(alpha_i,Re_i,Ma_i,stations_i,a_geo,cl_sur,cd_sur,tc)
 
-            Rsquiggly   = Gamma - 0.5*W*c*Cl
+            Rsquiggly   = Gamma_i - 0.5*W_i*c_i*Cl_i
         
-            # An analytical derivative for dR_dpsi, this is derived by taking a derivative of the above equations
-            # This was solved symbolically in Matlab and exported        
-            f_wt_2      = 4*Wt*Wt
-            f_wa_2      = 4*Wa*Wa
-            Ucospsi     = U*cos_psi
-            Usinpsi     = U*sin_psi
-            Utcospsi    = Ut*cos_psi
-            Uasinpsi    = Ua*sin_psi 
-            UapUsinpsi  = (Ua + Usinpsi)
-            utpUcospsi  = (Ut + Ucospsi) 
-            utpUcospsi2 = utpUcospsi*utpUcospsi
-            UapUsinpsi2 = UapUsinpsi*UapUsinpsi 
-            dR_dpsi     = ((4.*U*r*arccos_piece*sin_psi*((16.*UapUsinpsi2)/(BB*pi2*f_wt_2) + 1.)**(0.5))/B - 
-                           (pi*U*(Ua*cos_psi - Ut*sin_psi)*(beta - np.arctan((Wa+Wa)/(Wt+Wt))))/(2.*(f_wt_2 + f_wa_2)**(0.5))
-                           + (pi*U*(f_wt_2 +f_wa_2)**(0.5)*(U + Utcospsi  +  Uasinpsi))/(2.*(f_wa_2/(f_wt_2) + 1.)*utpUcospsi2)
-                           - (4.*U*piece*((16.*UapUsinpsi2)/(BB*pi2*f_wt_2) + 1.)**(0.5)*(R - r)*(Ut/2. - 
-                            (Ucospsi)/2.)*(U + Utcospsi + Uasinpsi ))/(f_wa_2*(1. - np.exp(-(B*(Wt+Wt)*(R - 
-                            r))/(r*(Wa+Wa))))**(0.5)) + (128.*U*r*arccos_piece*(Wa+Wa)*(Ut/2. - (Ucospsi)/2.)*(U + 
-                            Utcospsi  + Uasinpsi ))/(BBB*pi2*utpUcospsi*utpUcospsi2*((16.*f_wa_2)/(BB*pi2*f_wt_2) + 1.)**(0.5))) 
+            # An analytical derivative for dR_dpsi
+            dR_dpsi     = compute_dR_dpsi((sin_psi,cos_psi,Wa_i,Wt_i,piece,arccos_piece),Ua_i,Ut_i,U_i,beta_i,r_i,R,B)
         
-            dR_dpsi[np.isnan(dR_dpsi)] = 0.1
-        
-            dpsi        = -Rsquiggly/dR_dpsi
-            PSI         = PSI + dpsi
-            diff        = np.max(abs(PSIold-PSI))
-            PSIold      = PSI
+            dpsi_i      = -Rsquiggly/dR_dpsi
+            
+            # pack the stations
+            Wa[locs]      = Wa_i
+            Wt[locs]      = Wt_i
+            va[locs]      = va_i
+            vt[locs]      = vt_i
+            Ma[locs]      = Ma_i
+            Gamma[locs]   = Gamma_i
+            Cl[locs]      = Cl_i
+            Cdval[locs]   = Cdval_i
+            dpsi[locs]    = dpsi_i
+            PSI[locs]     = PSI_i + dpsi_i
+            diff          = np.max(abs(PSIold-PSI))
+            PSIold        = PSI.copy()
+            active[locs]  = abs(dpsi_i) > tol_station
         
             # omega = 0, do not run BEMT convergence loop 
             if all(omega[:,0]) == 0. :
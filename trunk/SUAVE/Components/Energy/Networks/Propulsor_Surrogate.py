@@ -3,6 +3,7 @@
 #
 # Created:  Mar 2017, E. Botero
 # Modified: Jan 2020, T. MacDonald
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -16,13 +17,9 @@ import numpy as np
 from copy import deepcopy
 from SUAVE.Components.Propulsors.Propulsor import Propulsor
 from SUAVE.Methods.Utilities.Cubic_Spline_Blender import Cubic_Spline_Blender
+from SUAVE.Methods.Utilities.Grid_Interpolator import Grid_Interpolator
 
 from SUAVE.Core import Data
-import sklearn
-from sklearn import gaussian_process
-from sklearn.gaussian_process.kernels import RationalQuadratic, ConstantKernel, RBF, Matern
-from sklearn import neighbors
-from sklearn import svm, linear_model
 
 # ----------------------------------------------------------------------
 #  Network
@@ -35,6 +32,9 @@ class Propulsor_Surrogate(Propulsor):
         
         You need to use build surrogate first when setting up the vehicle to make this work.
         
+        Decks that are a full altitude, Mach and throttle grid can be interpolated directly with the
+        grid surrogate types.
+        
         Assumptions:
         The input format for this should be Altitude, Mach, Throttle, Thrust, SFC
         
@@ -120,8 +120,8 @@ class Propulsor_Surrogate(Propulsor):
             sfc = self.extended_sfc_surrogate(sfc_surrogate, cond, lo_blender, hi_blender)
             thr = self.extended_thrust_surrogate(thr_surrogate, cond, lo_blender, hi_blender)
         else:
-            sfc = sfc_surrogate.predict(cond)
-            thr = thr_surrogate.predict(cond)
+            sfc = self.surrogate_predict(sfc_surrogate,cond)
+            thr = self.surrogate_predict(thr_surrogate,cond)
 
         sfc = sfc*self.sfc_input_scale*self.sfc_anchor_scale
         thr = thr*self.thrust_input_scale*self.thrust_anchor_scale
@@ -136,11 +136,35 @@ class Propulsor_Surrogate(Propulsor):
    
         return results          
     
+    def surrogate_predict(self, surrogate, cond):
+        """ Evaluates a surrogate as a column, whatever the shape of the predictions of its type
+        
+            Assumptions:
+            None
+            
+            Source:
+            N/A
+            
+            Inputs:
+            surrogate         - Trained surrogate that outputs a scaled value
+            cond              - nx3 numpy array with input conditions for the surrogate
+            
+            Outputs:
+            values            - nx1 numpy array [nondim]
+            
+            Properties Used:
+            None
+        """
+        
+        return np.reshape(surrogate.predict(cond),(-1,1))
+    
     def build_surrogate(self):
         """ Build a surrogate. Multiple options for models are available including:
             -Gaussian Processes
             -KNN
             -SVR
+            -Linear regression
+            -Linear or cubic interpolation of a gridded deck
             
             Assumptions:
             None
@@ -189,6 +213,11 @@ class Propulsor_Surrogate(Propulsor):
         sfc     /= self.sfc_input_scale
        
        
+        # sklearn is imported here to keep it out of the SUAVE import, the grid surrogates do not need it
+        if not self.surrogate_type in ['grid','grid_cubic']:
+            from sklearn import gaussian_process, neighbors, svm, linear_model
+            from sklearn.gaussian_process.kernels import Matern
+        
         # Pick the type of process
         if self.surrogate_type  == 'gaussian':
             gp_kernel = Matern()
@@ -215,6 +244,10 @@ class Propulsor_Surrogate(Propulsor):
             sfc_surrogate  = regr_sfc.fit(xy, sfc)
             thr_surrogate  = regr_thr.fit(xy, thr)
             
+        elif self.surrogate_type in ['grid','grid_cubic']:
+            method = 'cubic' if self.surrogate_type == 'grid_cubic' else 'linear'
+            thr_surrogate, sfc_surrogate = self.build_grid_surrogate(xy, thr, sfc, method)
+            
         else:
             raise NotImplementedError('Selected surrogate method has not been implemented')
        
@@ -222,19 +255,58 @@ class Propulsor_Surrogate(Propulsor):
         if self.thrust_anchor is not None:
             cons = deepcopy(self.thrust_anchor_conditions)
             cons[0,0] /= self.altitude_input_scale
-            base_thrust_at_anchor = thr_surrogate.predict(cons)
+            base_thrust_at_anchor = self.surrogate_predict(thr_surrogate,cons)
             self.thrust_anchor_scale = self.thrust_anchor/(base_thrust_at_anchor*self.thrust_input_scale)
             
         if self.sfc_anchor is not None:
             cons = deepcopy(self.sfc_anchor_conditions)
             cons[0,0] /= self.altitude_input_scale
-            base_sfc_at_anchor = sfc_surrogate.predict(cons)
+            base_sfc_at_anchor = self.surrogate_predict(sfc_surrogate,cons)
             self.sfc_anchor_scale = self.sfc_anchor/(base_sfc_at_anchor*self.sfc_input_scale)
        
         # Save the output
         self.sfc_surrogate    = sfc_surrogate
         self.thrust_surrogate = thr_surrogate   
         
+    def build_grid_surrogate(self, xy, thr, sfc, method):
+        """ Arranges a deck that is a full altitude, Mach and throttle grid into grid interpolators
+            
+            Assumptions:
+            None
+            
+            Source:
+            N/A
+            
+            Inputs:
+            xy                - nx3 numpy array of the normalized altitude, Mach and throttle of the deck
+            thr               - nx1 numpy array of the normalized thrust
+            sfc               - nx1 numpy array of the normalized sfc
+            method            - 'linear' or 'cubic'
+            
+            Outputs:
+            thr_surrogate     - Grid interpolator that outputs a scaled thrust value
+            sfc_surrogate     - Grid interpolator that outputs a scaled sfc value
+            
+            Properties Used:
+            None
+        """
+        grid    = [np.unique(xy[:,i]) for i in range(3)]
+        shape   = tuple([len(axis) for axis in grid])
+        indices = np.ravel_multi_index([np.searchsorted(grid[i],xy[:,i]) for i in range(3)],shape)
+        
+        if len(indices) != np.prod(shape) or len(np.unique(indices)) != len(indices):
+            raise ValueError('The engine deck is not a full altitude, Mach and throttle grid, use another surrogate type')
+        
+        thr_grid = np.zeros(len(indices))
+        sfc_grid = np.zeros(len(indices))
+        thr_grid[indices] = thr[:,0]
+        sfc_grid[indices] = sfc[:,0]
+        
+        thr_surrogate = Grid_Interpolator(grid, thr_grid.reshape(shape), method)
+        sfc_surrogate = Grid_Interpolator(grid, sfc_grid.reshape(shape), method)
+        
+        return thr_surrogate, sfc_surrogate
+        
     def extended_thrust_surrogate(self, thr_surrogate, cond, lo_blender, hi_blender):
         """ Fixes thrust values outside of the standard throttle range in order to provide
             reasonable values outside of the typical surrogate coverage area. 
@@ -263,8 +335,8 @@ class Propulsor_Surrogate(Propulsor):
         cond_zero_eta[:,2] = 0
         cond_one_eta[:,2]  = 1
         
-        min_thrs = thr_surrogate.predict(cond_zero_eta)
-        max_thrs = thr_surrogate.predict(cond_one_eta)
+        min_thrs = self.surrogate_predict(thr_surrogate,cond_zero_eta)
+        max_thrs = self.surrogate_predict(thr_surrogate,cond_one_eta)
         dTdetas  = max_thrs - min_thrs
         
         etas          = cond[:,2]
@@ -283,14 +355,14 @@ class Propulsor_Surrogate(Propulsor):
         if np.sum(mask_lo_blend) > 0:
             lo_weight = lo_blender.compute(etas[mask_lo_blend])
             T[mask_lo_blend] = (min_thrs[mask_lo_blend] + etas[mask_lo_blend]*dTdetas[mask_lo_blend])*lo_weight + \
-                               thr_surrogate.predict(cond[mask_lo_blend])*(1-lo_weight)
+                               self.surrogate_predict(thr_surrogate,cond[mask_lo_blend])*(1-lo_weight)
         
         if np.sum(mask_mid) > 0:
-            T[mask_mid] = thr_surrogate.predict(cond[mask_mid])
+            T[mask_mid] = self.surrogate_predict(thr_surrogate,cond[mask_mid])
         
         if np.sum(mask_hi_blend) > 0:
             hi_weight = hi_blender.compute(etas[mask_hi_blend])
-            T[mask_hi_blend] = thr_surrogate.predict(cond[mask_hi_blend])*hi_weight + \
+            T[mask_hi_blend] = self.surrogate_predict(thr_surrogate,cond[mask_hi_blend])*hi_weight + \
                                (max_thrs[mask_hi_blend] + (etas[mask_hi_blend]-1)*dTdetas[mask_hi_blend])*(1-hi_weight)
         
         T[mask_high] = max_thrs[mask_high] + (etas[mask_high]-1)*dTdetas[mask_high]
@@ -337,22 +409,22 @@ class Propulsor_Surrogate(Propulsor):
         
         # compute sfc
         if np.sum(mask_low) > 0:
-            sfcs[mask_low] = sfc_surrogate.predict(cond_zero_eta[mask_low])
+            sfcs[mask_low] = self.surrogate_predict(sfc_surrogate,cond_zero_eta[mask_low])
         
         if np.sum(mask_lo_blend) > 0:
             lo_weight = lo_blender.compute(etas[mask_lo_blend])
-            sfcs[mask_lo_blend] = sfc_surrogate.predict(cond_zero_eta[mask_lo_blend])*lo_weight + \
-                               sfc_surrogate.predict(cond[mask_lo_blend])*(1-lo_weight)
+            sfcs[mask_lo_blend] = self.surrogate_predict(sfc_surrogate,cond_zero_eta[mask_lo_blend])*lo_weight + \
+                               self.surrogate_predict(sfc_surrogate,cond[mask_lo_blend])*(1-lo_weight)
         
         if np.sum(mask_mid) > 0:
-            sfcs[mask_mid] = sfc_surrogate.predict(cond[mask_mid])
+            sfcs[mask_mid] = self.surrogate_predict(sfc_surrogate,cond[mask_mid])
         
         if np.sum(mask_hi_blend) > 0:
             hi_weight = hi_blender.compute(etas[mask_hi_blend])
-            sfcs[mask_hi_blend] = sfc_surrogate.predict(cond[mask_hi_blend])*hi_weight + \
-                               sfc_surrogate.predict(cond_one_eta[mask_hi_blend])*(1-hi_weight)
+            sfcs[mask_hi_blend] = self.surrogate_predict(sfc_surrogate,cond[mask_hi_blend])*hi_weight + \
+                               self.surrogate_predict(sfc_surrogate,cond_one_eta[mask_hi_blend])*(1-hi_weight)
         
         if np.sum(mask_high) > 0:
-            sfcs[mask_high] = sfc_surrogate.predict(cond_one_eta[mask_high])
+            sfcs[mask_high] = self.surrogate_predict(sfc_surrogate,cond_one_eta[mask_high])
             
         return sfcs   
\ No newline at end of file
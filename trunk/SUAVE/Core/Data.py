@@ -4,6 +4,7 @@
 # Created:  Jun 2016, E. Botero
 # Modified: Jan 2020, M. Clarke
 #           May 2020, E. Botero
+#           Oct 2026, SUAVE Team
 
 
 # ----------------------------------------------------------------------
@@ -18,8 +19,41 @@ t_table = str.maketrans( chars          + string.ascii_uppercase ,
                             '_'*len(chars) + string.ascii_lowercase )
 
 dictgetitem = dict.__getitem__
+dictget = dict.get
 objgetattrib = object.__getattribute__
 
+# marks a key that is not in the dict
+missing = object()
+
+# names that resolve as object attributes, cached per class
+class_attributes = {}
+
+def get_class_attributes(klass):
+    """ Returns the names of all the attributes and methods of a class and its bases.
+        These are the names that object.__getattribute__ finds on an instance.
+
+        Assumptions:
+        Attributes are not added to a class after instances of it are used
+
+        Source:
+        N/A
+
+        Inputs:
+        klass
+
+        Outputs:
+        names       [frozenset]
+
+        Properties Used:
+        N/A
+        """
+    try:
+        return class_attributes[klass]
+    except KeyError:
+        names = frozenset(dir(klass))
+        class_attributes[klass] = names
+        return names
+
 # ----------------------------------------------------------------------
 #   Data
 # ----------------------------------------------------------------------        
@@ -41,7 +75,7 @@ class Data(dict):
         """ Retrieves an attribute set by a key k
     
             Assumptions:
-            Does a try if it is a dict, but if that fails treats it as an object
+            Looks for k in the dict first, if it is not there treats it as an object
     
             Source:
             N/A
@@ -55,16 +89,16 @@ class Data(dict):
             Properties Used:
             N/A
             """         
-        try:
-            return dictgetitem(self,k)
-        except:
+        v = dictget(self,k,missing)
+        if v is missing:
             return objgetattrib(self,k)
+        return v
 
     def __setattr__(self, k, v):
         """ An override of the standard __setattr_ in Python.
             
             Assumptions:
-            This one tries to treat k as an object, if that fails it treats it as a key.
+            This one treats k as an object if the class has an attribute k, otherwise it treats it as a key.
     
             Source:
             N/A
@@ -79,18 +113,16 @@ class Data(dict):
             Properties Used:
             N/A    
         """
-        try:
-            objgetattrib(self, k)
-        except:
-            self[k] = v
-        else:          
+        if k in get_class_attributes(type(self)):
             object.__setattr__(self, k, v) 
+        else:          
+            self[k] = v
             
     def __delattr__(self, k):
         """ An override of the standard __delattr_ in Python. This deletes whatever is called by k
             
             Assumptions:
-            This one tries to treat k as an object, if that fails it treats it as a key.
+            This one treats k as an object if the class has an attribute k, otherwise it treats it as a key.
     
             Source:
             N/A
@@ -104,12 +136,10 @@ class Data(dict):
             Properties Used:
             N/A    
         """        
-        try:
-            objgetattrib(self, k)
-        except:
-            del self[k]
-        else:
+        if k in get_class_attributes(type(self)):
             object.__delattr__(self, k)
+        else:
+            del self[k]
     
     def __defaults__(self):
         """ A stub for all classes that come later
@@ -3,9 +3,12 @@
 #
 # Created:  Feb 2014, T. Lukacyzk
 # Modified: Feb 2016, T. MacDonald
+#           Oct 2026, SUAVE Team
 
 """ Implements base unit conversion style programming
-    by monkey patching Pint
+    by monkey patching Pint, with the conversion factors of
+    multiplicative units cached as floats and the Pint
+    definitions loaded on first use
 """
 
 
@@ -13,10 +16,172 @@
 #   Imports
 # ------------------------------------------------------------
 
+from threading import RLock
+
 from SUAVE.Plugins.pint import UnitRegistry
 from SUAVE.Plugins.pint.quantity import _Quantity
 
-Units = UnitRegistry()
+
+# ------------------------------------------------------------
+#   Unit Registry
+# ------------------------------------------------------------
+
+## @ingroup Core
+class Unit_Registry(UnitRegistry):
+    """ A Pint unit registry that resolves each unit, or unit expression, to
+        a float conversion factor to the base units the first time it is used.
+        The Pint definitions are only loaded when the first unit is requested.
+
+        Assumptions:
+        Units with an offset, like degF, are returned as Pint quantities
+
+        Source:
+        N/A
+    """
+    
+    _built = False
+    
+    def __init__(self,*args,**kwargs):
+        """ Stores the arguments of the Pint registry and starts an empty cache 
+            of conversion factors
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            Same as the Pint UnitRegistry
+
+            Outputs:
+            N/A
+
+            Properties Used:
+            N/A    
+        """           
+        self._conversion_factors = dict()
+        self._registry_arguments = (args,kwargs)
+        self._building           = False
+        self._build_lock         = RLock()
+        
+    def build(self):
+        """ Loads the Pint unit definitions and patches the quantities, once
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            N/A
+
+            Outputs:
+            N/A
+
+            Properties Used:
+            N/A    
+        """          
+        with self._build_lock:
+            if self._built or self._building:
+                return
+            self._building = True
+            try:
+                args, kwargs = self._registry_arguments
+                UnitRegistry.__init__(self,*args,**kwargs)
+                patch_quantity(self.__dict__['Quantity'])
+                self._built = True
+            finally:
+                self._building = False
+    
+    def __getattr__(self,item):
+        """ Returns the conversion factor of a unit, ie Units.ft
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            item  - unit name
+
+            Outputs:
+            float conversion factor to the base units, or a Pint quantity for units with an offset
+
+            Properties Used:
+            N/A    
+        """           
+        factor = self._conversion_factors.get(item)
+        if factor is not None:
+            return factor
+        
+        # the attributes of the Pint registry appear once it is built
+        self.build()
+        if item in self.__dict__:
+            return self.__dict__[item]
+        if item.startswith('_'):
+            raise AttributeError(item)
+        
+        return self.conversion_factor(item,self.Quantity(1,item))
+    
+    def __getitem__(self,item):
+        """ Returns the conversion factor of a unit expression, ie Units['miles/hour']
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            item  - unit expression
+
+            Outputs:
+            float conversion factor to the base units, or a Pint quantity for units with an offset
+
+            Properties Used:
+            N/A    
+        """            
+        factor = self._conversion_factors.get(item)
+        if factor is None:
+            self.build()
+            factor = self.conversion_factor(item,self.parse_expression(item))
+        return factor
+        
+    def conversion_factor(self,item,quantity):
+        """ Computes the conversion factor of a quantity with Pint and caches it
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            item      - unit name or expression, the key of the cache
+            quantity  - Pint quantity of the unit
+
+            Outputs:
+            float conversion factor to the base units, or the quantity for units with an offset
+
+            Properties Used:
+            N/A    
+        """           
+        if not isinstance(quantity,_Quantity):
+            return quantity
+        
+        factor, units = self.get_base_units(quantity._units)
+        if factor is None:
+            return quantity
+        
+        factor = float(factor * quantity.magnitude)
+        self._conversion_factors[item] = factor
+        
+        return factor
+
+Units = Unit_Registry()
 
 
 # ------------------------------------------------------------
@@ -80,15 +245,34 @@ def __rdiv__(self,other):
         return self.magnitude
 
 # yay monkey patching!
-Units.Quantity.__mul__      = __rmul__
-Units.Quantity.__rmul__     = __rmul__
-Units.Quantity.__div__      = __rdiv__
-Units.Quantity.__truediv__  = __rdiv__
-Units.Quantity.__rdiv__     = __rdiv__
-Units.Quantity.__rtruediv__ = __rdiv__
-Units.Quantity.__getattr__  = getattr
-Units.Quantity.__array_prepare__ = None
-Units.Quantity.__array_wrap__    = None
+## @ingroup Core
+def patch_quantity(Quantity):
+    """ Patches the quantity class of a unit registry with the conversions above
+
+        Assumptions:
+        N/A
+
+        Source:
+        N/A
+
+        Inputs:
+        Quantity - class of the registry
+
+        Outputs:
+        N/A
+
+        Properties Used:
+        N/A    
+    """      
+    Quantity.__mul__      = __rmul__
+    Quantity.__rmul__     = __rmul__
+    Quantity.__div__      = __rdiv__
+    Quantity.__truediv__  = __rdiv__
+    Quantity.__rdiv__     = __rdiv__
+    Quantity.__rtruediv__ = __rdiv__
+    Quantity.__getattr__  = getattr
+    Quantity.__array_prepare__ = None
+    Quantity.__array_wrap__    = None
 
 # doc string
 Units.__doc__ = \
@@ -112,6 +296,10 @@ Units.__doc__ = \
       to meters.  Thus the * (multiplication) operation converts 
       from the current units to the base units and / (division) 
       operation converts from the base units to the desired units.
+      
+      The ratio is a float, computed by Pint once per unit or 
+      expression. Units with an offset (ie Units.degF) are Pint 
+      quantities that convert the value on * and /.
      
     Base Units:
       mass        : kilogram
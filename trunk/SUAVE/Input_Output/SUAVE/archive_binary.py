@@ -0,0 +1,141 @@
+## @ingroup Input_Output-SUAVE
+# archive_binary.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+from SUAVE.Core import Data
+import numpy as np
+import types
+import json
+import zipfile
+from collections import OrderedDict
+
+# ----------------------------------------------------------------------
+#  Method
+# ----------------------------------------------------------------------
+## @ingroup Input_Output-SUAVE
+def archive_binary(data,filename,compress=False):
+    """Stores a SUAVE data structure in a binary archive. The structure is kept as JSON, as in archive, while every
+    numpy array is stored in binary as its own .npy member of a zip file, so that load_binary can map or read the
+    arrays one at a time. The archive can also be opened with numpy.load.
+
+    Assumptions:
+    Data must be numpy arrays, strings, booleans, floats, ints, or lists.
+    Functions are ignored and all other data raises an error.
+    Arrays of objects are stored as JSON lists, as in archive.
+
+    Source:
+    N/A
+
+    Inputs:
+    data       SUAVE data structure
+    filename   <string> - file to be output
+    compress   <boolean> - compress each array on its own, the arrays are then read instead of memory mapped
+
+    Outputs:
+    filename   File as specified, a zip of tree.json and one .npy file per array
+
+    Properties Used:
+    N/A
+    """
+
+    compression = zipfile.ZIP_DEFLATED if compress else zipfile.ZIP_STORED
+
+    # Build the structure, collecting the arrays along the way
+    arrays   = []
+    res_dict = build_binary_dict_base(data,arrays)
+
+    with zipfile.ZipFile(filename,'w',compression=compression,allowZip64=True) as f:
+        f.writestr('tree.json',json.dumps(res_dict))
+        for i, v in enumerate(arrays):
+            with f.open(str(i) + '.npy','w',force_zip64=True) as member:
+                np.lib.format.write_array(member,v,allow_pickle=False)
+
+## @ingroup Input_Output-SUAVE
+def build_binary_dict_base(base,arrays):
+    """Builds a dictionary based on a SUAVE data structure, with references to the arrays. This is initial case.
+
+    Assumptions:
+    See archive_binary
+
+    Source:
+    N/A
+
+    Inputs:
+    base       SUAVE data structure
+    arrays     <list> - arrays of the structure, appended to
+
+    Outputs:
+    base_dict  Dictionary built on the data structure.
+
+    Properties Used:
+    N/A
+    """
+
+    keys = base.keys() # keys from top level
+    base_dict = OrderedDict() # initialize dictionary
+
+    # Assign all values
+    for k in keys:
+        v = base[k]
+        base_dict[k] = build_binary_dict_r(v,arrays) # recursive function
+    return base_dict
+
+## @ingroup Input_Output-SUAVE
+def build_binary_dict_r(v,arrays):
+    """Builds a dictionary based on a SUAVE data structure, with references to the arrays. This the recursive step.
+
+    Assumptions:
+    See archive_binary
+
+    Source:
+    N/A
+
+    Inputs:
+    v          value in a data structure
+    arrays     <list> - arrays of the structure, appended to
+
+    Outputs:
+    ret        value based on type of v, an array is replaced by {'__array__': its index in arrays}
+
+    Properties Used:
+    N/A
+    """
+    tv = type(v) # Get value type
+
+    # Transform to basic python data type as appropriate
+    if (tv == np.ndarray) and not v.dtype.hasobject:
+        ret = OrderedDict(__array__=len(arrays))
+        arrays.append(v)
+    elif (tv == np.ndarray) or (tv == np.float64):
+        ret = v.tolist()
+    elif (tv == str) or (tv == bool):
+        ret = v
+    elif tv == type(None):
+        ret = None
+    elif (tv == float) or (tv == int):
+        ret = v
+    elif tv == types.FunctionType: # Functions cannot be stored
+        ret = None
+    elif tv == list:
+        ret = v
+
+    else:
+        # Assume other data types are SUAVE data types and check
+        try:
+            keys = v.keys()
+        except:
+            if callable(tv):
+                return None
+            else:
+                raise TypeError('Unexpected data type in SUAVE data structure')
+        # Recursively assign values
+        ret = OrderedDict()
+        for k in keys:
+            ret[k] = build_binary_dict_r(v[k],arrays)
+
+    return ret
@@ -0,0 +1,268 @@
+## @ingroup Input_Output-SUAVE
+# load_binary.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import json
+import struct
+import zipfile
+from SUAVE.Core import Data, DataOrdered
+import numpy as np
+from collections import OrderedDict
+
+# ----------------------------------------------------------------------
+#  Method
+# ----------------------------------------------------------------------
+
+## @ingroup Input_Output-SUAVE
+def load_binary(filename,keys=None,mmap_mode='c'):
+    """Converts a binary archive into a SUAVE data structure. Only the structure is parsed: the arrays that are not
+    compressed are views of a single memory map of the file, so their values are only read from the disk when they
+    are used, and keys picks the branches to load so that the other arrays are never touched.
+
+    Assumptions:
+    The file was written by archive_binary.
+
+    Source:
+    N/A
+
+    Inputs:
+    filename   <string> - file to be loaded
+    keys       <string> or list of strings - dotted paths of the branches to load, such as
+               'segments.*.conditions.weights.total_mass', where * matches every key. None loads everything.
+    mmap_mode  <string> - 'c' maps the arrays copy on write, 'r' read only, None reads them into memory
+
+    Outputs:
+    data       SUAVE data structure
+
+    Properties Used:
+    N/A
+    """
+
+    with zipfile.ZipFile(filename) as f:
+
+        # Get the structure
+        res_dict = json.loads(f.read('tree.json').decode(),object_pairs_hook=OrderedDict)
+
+        # Keep the requested branches
+        if keys is not None:
+            if isinstance(keys,str):
+                keys = [keys]
+            res_dict = select_keys(res_dict,[key.split('.') for key in keys])
+
+        # Convert to SUAVE data structure, the arrays from the file
+        reader     = Binary_Reader(f,filename,mmap_mode)
+        SUAVE_data = read_SUAVE_binary_dict(res_dict,reader)
+
+    return SUAVE_data
+
+## @ingroup Input_Output-SUAVE
+def select_keys(res_dict,paths):
+    """Keeps the branches of a dictionary from a binary archive that are on the paths.
+
+    Assumptions:
+    A * in a path matches every key at its level.
+
+    Source:
+    N/A
+
+    Inputs:
+    res_dict    Dictionary based on the SUAVE data structure
+    paths       <list> - paths, each a list of keys
+
+    Outputs:
+    selected    Dictionary with only the branches on the paths
+
+    Properties Used:
+    N/A
+    """
+
+    selected = OrderedDict()
+
+    for k in res_dict.keys():
+        v    = res_dict[k]
+        rest = [path[1:] for path in paths if path[0] in (k,'*')]
+        if not rest:
+            continue
+        if any(len(path) == 0 for path in rest):
+            selected[k] = v
+        elif type(v) == OrderedDict and '__array__' not in v:
+            branch = select_keys(v,rest)
+            if branch:
+                selected[k] = branch
+
+    return selected
+
+## @ingroup Input_Output-SUAVE
+def read_SUAVE_binary_dict(res_dict,reader):
+    """Builds a SUAVE data structure based on a dictionary from a binary archive. This is initial case.
+
+    Assumptions:
+    Dictionary was created based on a previously saved SUAVE data structure.
+
+    Source:
+    N/A
+
+    Inputs:
+    res_dict    Dictionary based on the SUAVE data structure
+    reader      Binary_Reader of the archive
+
+    Outputs:
+    SUAVE_data  SUAVE data structure
+
+    Properties Used:
+    N/A
+    """
+    keys = res_dict.keys() # keys from top level
+    SUAVE_data = Data() # initialize SUAVE data structure
+
+    # Assign all values
+    for k in keys:
+        k = str(k)
+        v = res_dict[k]
+        SUAVE_data[k] = build_binary_data_r(v,reader) # recursive function
+    return SUAVE_data
+
+## @ingroup Input_Output-SUAVE
+def build_binary_data_r(v,reader):
+    """Builds a SUAVE data structure based on a dictionary from a binary archive. This is recursive step.
+
+    Assumptions:
+    Dictionary was created based on a previously saved SUAVE data structure.
+
+    Source:
+    N/A
+
+    Inputs:
+    v        generic value
+    reader   Binary_Reader of the archive
+
+    Outputs:
+    ret      value converted to needed format
+
+    Properties Used:
+    N/A
+    """
+    tv = type(v) # Get value type
+
+    # Transform to SUAVE data structure with appropriate types
+    if tv == OrderedDict and '__array__' in v:
+        ret = reader.array(v['__array__'])
+    elif tv == OrderedDict:
+        keys = v.keys()
+        # Recursively assign values
+        ret = DataOrdered()
+        for k in keys:
+            k = str(k)
+            ret[k] = build_binary_data_r(v[k],reader)
+    elif tv == list:
+        ret = np.array(v)
+    elif (tv == str):
+        ret = str(v)
+    elif (tv == bool):
+        ret = v
+    elif tv == type(None):
+        ret = None
+    elif (tv == float) or (tv == int):
+        ret = v
+    else:
+        raise TypeError('Data type not expected in SUAVE binary structure')
+
+    return ret
+
+# ----------------------------------------------------------------------
+#  Binary Reader
+# ----------------------------------------------------------------------
+
+## @ingroup Input_Output-SUAVE
+class Binary_Reader(object):
+    """Reads the arrays of a binary archive, mapping the file to memory once for all the arrays that are stored
+    without compression.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+    """
+
+    def __init__(self,zip_file,filename,mmap_mode):
+        """Sets up the reader.
+
+        Assumptions:
+        N/A
+
+        Source:
+        N/A
+
+        Inputs:
+        zip_file   <zipfile.ZipFile> - the open archive
+        filename   <string> - file of the archive
+        mmap_mode  <string> - see load_binary
+
+        Outputs:
+        None
+
+        Properties Used:
+        N/A
+        """
+
+        self.zip_file  = zip_file
+        self.filename  = filename
+        self.mmap_mode = mmap_mode
+        self.mmap      = None
+
+    def array(self,index):
+        """Reads or maps one array of the archive.
+
+        Assumptions:
+        N/A
+
+        Source:
+        N/A
+
+        Inputs:
+        index      <int> - index of the array in the archive
+
+        Outputs:
+        array      numpy array, a view of the memory map when it is stored without compression
+
+        Properties Used:
+        N/A
+        """
+
+        info = self.zip_file.getinfo(str(index) + '.npy')
+
+        if self.mmap_mode is None or info.compress_type != zipfile.ZIP_STORED:
+            with self.zip_file.open(info) as member:
+                return np.lib.format.read_array(member,allow_pickle=False)
+
+        # The .npy file starts after the local header of the member, of variable length
+        fp = self.zip_file.fp
+        fp.seek(info.header_offset)
+        header = fp.read(30)
+        name_length, extra_length = struct.unpack('<HH',header[26:30])
+        fp.seek(info.header_offset + 30 + name_length + extra_length)
+
+        version = np.lib.format.read_magic(fp)
+        if version == (1,0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(fp)
+        elif version == (2,0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(fp)
+        else:
+            with self.zip_file.open(info) as member:
+                return np.lib.format.read_array(member,allow_pickle=False)
+        offset = fp.tell()
+
+        # Empty arrays can't be mapped
+        if int(np.prod(shape)) == 0:
+            return np.zeros(shape,dtype=dtype,order='F' if fortran_order else 'C')
+
+        if self.mmap is None:
+            self.mmap = np.memmap(self.filename,dtype=np.uint8,mode=self.mmap_mode)
+
+        return np.ndarray(shape,dtype=dtype,buffer=self.mmap,offset=offset,order='F' if fortran_order else 'C')
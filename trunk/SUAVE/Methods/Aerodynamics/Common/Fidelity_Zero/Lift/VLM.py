@@ -4,6 +4,7 @@
 # Created:  May 2019, M. Clarke
 #           Jul 2020, E. Botero
 #           Sep 2020, M. Clarke 
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -11,10 +12,17 @@
 
 # package imports 
 import numpy as np 
+import hashlib
 from SUAVE.Core import Data
-from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.compute_wing_induced_velocity      import compute_wing_induced_velocity
+from SUAVE.Methods.Utilities.surrogate_training_cache import hash_value
+from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.compute_wing_induced_velocity      import compute_wing_induced_velocity_components
 from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.generate_wing_vortex_distribution  import generate_wing_vortex_distribution
 from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.compute_RHS_matrix                 import compute_RHS_matrix 
+from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.hierarchical_vortex_lattice        import solve_hierarchical_vortex_lattice
+
+# approximate peak memory per condition and matrix entry, and per control point and panel, in bytes
+condition_bytes     = 32
+control_point_bytes = 360
 
 # ----------------------------------------------------------------------
 #  Vortex Lattice
@@ -72,6 +80,12 @@ def VLM(conditions,settings,geometry):
        settings.number_chordwise_vortices        [Unitless]
        settings.use_surrogate                  [Unitless]
        settings.propeller_wake_model           [Unitless]
+       settings.cache_influence_matrices       [Boolean]
+       settings.influence_cache_size           [bytes]
+       settings.memory_budget                  [bytes]
+       settings.iterative_solve_threshold      [Unitless]
+       settings.iterative_solve_tolerance      [Unitless]
+       settings.tree_opening_angle             [Unitless]
        conditions.aerodynamics.angle_of_attack [radians]
        conditions.freestream.mach_number       [Unitless]
        
@@ -116,16 +130,14 @@ def VLM(conditions,settings,geometry):
     mach = conditions.freestream.mach_number         # mach number
     ones = np.atleast_2d(np.ones_like(aoa)) 
    
-    # generate vortex distribution 
-    VD   = generate_wing_vortex_distribution(geometry,settings)   
+    # generate vortex distribution, reused while the wings, fuselages and panel counts are the same
+    VD   = get_vortex_distribution(geometry,settings)
     
     # pack vortex distribution 
     geometry.vortex_distribution = VD
     
-    # Build induced velocity matrix, C_mn
-    C_mn, DW_mn = compute_wing_induced_velocity(VD,n_sw,n_cw,aoa,mach) 
-     
     # Compute flow tangency conditions   
+    mach[mach==1]           = 1.001 
     inv_root_beta           = np.zeros_like(mach)
     inv_root_beta[mach<1]   = 1/np.sqrt(1-mach[mach<1]**2)     
     inv_root_beta[mach>1]   = 1/np.sqrt(mach[mach>1]**2-1)   
@@ -133,27 +145,56 @@ def VLM(conditions,settings,geometry):
     
     phi   = np.arctan((VD.ZBC - VD.ZAC)/(VD.YBC - VD.YAC))*ones          # dihedral angle 
     delta = np.arctan((VD.ZC - VD.ZCH)/((VD.XC - VD.XCH)*inv_root_beta)) # mean camber surface angle 
-   
-    # Build Aerodynamic Influence Coefficient Matrix
-    A =   np.multiply(C_mn[:,:,:,0],np.atleast_3d(np.sin(delta)*np.cos(phi))) \
-        + np.multiply(C_mn[:,:,:,1],np.atleast_3d(np.cos(delta)*np.sin(phi))) \
-        - np.multiply(C_mn[:,:,:,2],np.atleast_3d(np.cos(phi)*np.cos(delta)))   # valdiated from book eqn 7.42  
-   
+    
+    # large lattices are solved iteratively with a tree of the vortex segments, the propeller wake included
+    n_cp      = VD.n_cp  
+    threshold = settings.get('iterative_solve_threshold',None)
+    iterative = threshold is not None and n_cp > threshold
+    wake_tree = settings.get('tree_opening_angle',0.2) if iterative else None
+    
     # Build the vector
     RHS  ,Vx_ind_total , Vz_ind_total , V_distribution , dt = compute_RHS_matrix(n_sw,n_cw,delta,phi,conditions,geometry,\
-                                                                                 pwm,ito,wdt )
+                                                                                 pwm,ito,wdt,wake_tree)
     
-    # Spersonic Vortex Lattice - Validated from NASA CR, page 3 
-    locs = np.where(mach>1)[0]
-    DW_mn[locs]  = DW_mn[locs]*2
-    C_mn[locs]   = C_mn[locs]*2
-    
-    # Compute vortex strength  
-    n_cp     = VD.n_cp  
-    gamma    = np.linalg.solve(A,RHS)
-    gamma_3d = np.repeat(np.atleast_3d(gamma), n_cp ,axis = 2 )
-    u        = np.sum(C_mn[:,:,:,0]*gamma_3d, axis = 2)  
-    w_ind    = -np.sum(DW_mn[:,:,:,2]*gamma_3d, axis = 2) 
+    # Solve for the vortex strengths iteratively on large lattices, without the influence matrices
+    if iterative:
+        gamma, u, w_ind = solve_hierarchical_vortex_lattice(VD,settings,RHS,aoa,mach)
+    else:
+        # Build Aerodynamic Influence Coefficient Matrix, the induced velocities only depend on the mach number 
+        # apart from the trailing legs that follow the freestream. The conditions are solved in blocks that fit
+        # in the memory budget, sorted by mach so that each mach number is only set up once
+        n_cond   = len(aoa)
+        n_block  = block_size(settings,condition_bytes*n_cp**2,n_cond)
+        order    = np.argsort(mach[:,0],kind='stable')
+        sin_aoa  = np.sin(aoa)
+        cos_aoa  = np.cos(aoa)
+        gamma    = np.zeros((n_cond,n_cp))
+        u        = np.zeros((n_cond,n_cp))
+        w_ind    = np.zeros((n_cond,n_cp))
+        last     = Data(mach=None,influence=None)
+    
+        for start in range(0,n_cond,n_block):
+            locs           = order[start:start+n_block]
+            A              = np.zeros((len(locs),n_cp,n_cp))
+            u_coef         = np.zeros((len(locs),n_cp))
+            w_coef         = np.zeros((len(locs),n_cp))
+            machs, indices = np.unique(mach[locs,0],return_inverse=True)
+            for i, mach_i in enumerate(machs):
+                if last.mach != mach_i:
+                    last.mach      = mach_i
+                    last.influence = get_influence_matrices(VD,settings,mach_i)
+                influence     = last.influence
+                block         = indices == i
+                conds         = locs[block]
+                A[block]      = influence.A_0 + np.atleast_3d(sin_aoa[conds])*influence.A_sin + np.atleast_3d(cos_aoa[conds])*influence.A_cos  # valdiated from book eqn 7.42  
+                u_coef[block] = influence.u_0 + sin_aoa[conds]*influence.u_sin
+                w_coef[block] = influence.w_0 + cos_aoa[conds]*influence.w_cos
+    
+            # Compute vortex strength  
+            gamma[locs]  = np.linalg.solve(A,RHS[locs])
+            u[locs]      = u_coef*gamma[locs]
+            w_ind[locs]  = -w_coef*gamma[locs]
+            del A
      
     # ---------------------------------------------------------------------------------------
     # STEP 10: Compute aerodynamic coefficients 
@@ -225,4 +266,219 @@ def VLM(conditions,settings,geometry):
     Velocity_Profile.V        = V_distribution 
     Velocity_Profile.dt       = dt 
     
-    return CL, CDi, CM, CL_wing, CDi_wing, cl_y , cdi_y , CP ,Velocity_Profile
\ No newline at end of file
+    return CL, CDi, CM, CL_wing, CDi_wing, cl_y , cdi_y , CP ,Velocity_Profile
+
+# ----------------------------------------------------------------------
+#  Cached Vortex Lattice
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift 
+def get_vortex_distribution(geometry,settings):
+    """Returns the vortex distribution of the vehicle. The distribution is kept in the settings and only
+    regenerated when the wings, the fuselages or the number of vortices change.
+
+    Assumptions:
+    The vortex distribution only depends on the wings, the fuselages and the number of vortices
+
+    Source:
+    N/A
+
+    Inputs:
+    geometry.
+      wings                                    [Data]
+      fuselages                                [Data]
+    settings.
+      number_spanwise_vortices                 [Unitless]
+      number_chordwise_vortices                [Unitless]
+      cache_influence_matrices                 [Boolean]
+      influence_cache                          [Data]
+
+    Outputs:
+    VD                                         [Data]
+
+    Properties Used:
+    N/A
+    """     
+    
+    if not settings.get('cache_influence_matrices',False):
+        return generate_wing_vortex_distribution(geometry,settings)
+    
+    cache       = settings.influence_cache
+    fingerprint = geometry_fingerprint(geometry,settings)
+    
+    if cache.get('fingerprint',None) != fingerprint:
+        VD                        = generate_wing_vortex_distribution(geometry,settings)
+        cache.fingerprint         = geometry_fingerprint(geometry,settings)
+        cache.vortex_distribution = VD
+        cache.matrices            = dict()
+        cache.size                = 0
+        
+    return cache.vortex_distribution
+
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift 
+def get_influence_matrices(VD,settings,mach):
+    """Returns the parts of the aerodynamic influence coefficient matrix and of the induced velocities for one 
+    mach number. For the angle of attack aoa, the matrix of the vortex strengths is
+    
+    A = A_0 + sin(aoa)*A_sin + cos(aoa)*A_cos
+    
+    and the induced velocities on each panel are u = (u_0 + sin(aoa)*u_sin)*gamma and 
+    w = -(w_0 + cos(aoa)*w_cos)*gamma. The parts are kept in the settings until the vortex distribution changes,
+    with the oldest mach numbers dropped first when they take more than the size of the cache.
+
+    Assumptions:
+    Trailing vortex legs infinity are alligned to freestream
+
+    Source:
+    1. Low-Speed Aerodynamics, Second Edition by Joseph katz, Allen Plotkin
+    Pgs. 331-338(Literature), 579-586 (Fortran Code implementation)
+    
+    2. Miranda, Luis R., Robert D. Elliot, and William M. Baker. "A generalized vortex 
+    lattice method for subsonic and supersonic flow applications." (1977). (NASA CR)
+
+    Inputs:
+    VD                                         [Data]
+    settings.
+      number_spanwise_vortices                 [Unitless]
+      number_chordwise_vortices                [Unitless]
+      cache_influence_matrices                 [Boolean]
+      influence_cache_size                     [bytes]
+      influence_cache                          [Data]
+      memory_budget                            [bytes]
+    mach                                       [Unitless]
+
+    Outputs:
+    influence.
+      A_0, A_sin, A_cos                        [Unitless]
+      u_0, u_sin                               [Unitless]
+      w_0, w_cos                               [Unitless]
+
+    Properties Used:
+    N/A
+    """   
+    
+    use_cache = settings.get('cache_influence_matrices',False)
+    if use_cache:
+        cache = settings.influence_cache
+        if mach in cache.matrices:
+            return cache.matrices[mach]
+    
+    # unpack
+    n_sw = settings.number_spanwise_vortices    
+    n_cw = settings.number_chordwise_vortices   
+    n_cp = VD.n_cp
+    
+    # flow tangency
+    if mach < 1:
+        inv_root_beta = 1/np.sqrt(1-mach**2)
+    elif mach > 1:
+        inv_root_beta = 1/np.sqrt(mach**2-1)
+    else:
+        inv_root_beta = 0.
+        
+    phi   = np.arctan((VD.ZBC - VD.ZAC)/(VD.YBC - VD.YAC))                # dihedral angle 
+    delta = np.arctan((VD.ZC - VD.ZCH)/((VD.XC - VD.XCH)*inv_root_beta)) # mean camber surface angle 
+    
+    S_x = np.atleast_2d(np.sin(delta)*np.cos(phi)).T
+    S_y = np.atleast_2d(np.cos(delta)*np.sin(phi)).T
+    S_z = np.atleast_2d(np.cos(phi)*np.cos(delta)).T
+    
+    # Spersonic Vortex Lattice - Validated from NASA CR, page 3 
+    factor = 2. if mach > 1 else 1.
+    
+    influence       = Data()
+    influence.A_0   = np.zeros((n_cp,n_cp))
+    influence.A_sin = np.zeros((n_cp,n_cp))
+    influence.A_cos = np.zeros((n_cp,n_cp))
+    influence.u_0   = np.zeros(n_cp)
+    influence.u_sin = np.zeros(n_cp)
+    influence.w_0   = np.zeros(n_cp)
+    influence.w_cos = np.zeros(n_cp)
+    
+    # Build induced velocity matrix, C_mn, for blocks of control points that fit in the memory budget
+    n_rows = block_size(settings,control_point_bytes*n_cp,n_cp)
+    for start in range(0,n_cp,n_rows):
+        rows = slice(start,min(start+n_rows,n_cp))
+        C_mn_0, DW_mn_0, C_mn_sin, C_mn_cos = compute_wing_induced_velocity_components(VD,n_sw,n_cw,np.array([[mach]]),rows)
+    
+        # the velocities are only multiplied by the vortex strength of their control point
+        influence.A_0[rows]   = C_mn_0[0,:,:,0]*S_x[rows] + C_mn_0[0,:,:,1]*S_y[rows] - C_mn_0[0,:,:,2]*S_z[rows]
+        influence.A_sin[rows] = C_mn_sin[0]*S_x[rows]
+        influence.A_cos[rows] = -C_mn_cos[0]*S_z[rows]
+        influence.u_0[rows]   = factor*np.sum(C_mn_0[0,:,:,0],axis=1)
+        influence.u_sin[rows] = factor*np.sum(C_mn_sin[0],axis=1)
+        influence.w_0[rows]   = factor*np.sum(DW_mn_0[0,:,:,2],axis=1)
+        influence.w_cos[rows] = factor*np.sum(C_mn_cos[0],axis=1)
+        del C_mn_0, DW_mn_0, C_mn_sin, C_mn_cos
+    
+    if use_cache:
+        size = sum([v.nbytes for v in influence.values()])
+        if size <= settings.influence_cache_size:
+            while cache.size + size > settings.influence_cache_size:
+                oldest      = next(iter(cache.matrices))
+                cache.size -= sum([v.nbytes for v in cache.matrices.pop(oldest).values()])
+            cache.matrices[mach] = influence
+            cache.size          += size
+    
+    return influence
+
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift 
+def block_size(settings,item_bytes,n_items):
+    """Returns how many items of a given size are worked on at once to stay within the memory budget.
+
+    Assumptions:
+    At least one item is done at a time, all of them if there is no budget
+
+    Source:
+    N/A
+
+    Inputs:
+    settings.memory_budget                     [bytes]
+    item_bytes                                 [bytes]
+    n_items                                    [Unitless]
+
+    Outputs:
+    n_block                                    [Unitless]
+
+    Properties Used:
+    N/A
+    """   
+    
+    n_items = max(int(n_items),1)
+    budget  = settings.get('memory_budget',None)
+    if budget is None:
+        return n_items
+    
+    return int(min(max(budget//item_bytes,1),n_items))
+
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift 
+def geometry_fingerprint(geometry,settings):
+    """Hashes everything that the vortex distribution is generated from.
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    geometry.
+      wings                                    [Data]
+      fuselages                                [Data]
+    settings.
+      number_spanwise_vortices                 [Unitless]
+      number_chordwise_vortices                [Unitless]
+
+    Outputs:
+    fingerprint                                [string]
+
+    Properties Used:
+    N/A
+    """   
+    
+    sha = hashlib.sha1()
+    hash_value(sha,(settings.number_spanwise_vortices,settings.number_chordwise_vortices),set())
+    hash_value(sha,geometry.wings,set(),['vortex_distribution'])
+    hash_value(sha,geometry.fuselages,set(),['vortex_distribution'])
+    
+    return sha.hexdigest()
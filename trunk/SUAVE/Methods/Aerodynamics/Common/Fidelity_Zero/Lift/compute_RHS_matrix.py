@@ -3,6 +3,7 @@
 # 
 # Created:  Aug 2018, M. Clarke
 #           Apr 2020, M. Clarke
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -14,7 +15,8 @@ from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.generate_propeller_wak
 from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.compute_wake_induced_velocity import compute_wake_induced_velocity
 
 ## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift 
-def compute_RHS_matrix(n_sw,n_cw,delta,phi,conditions,geometry,propeller_wake_model,initial_timestep_offset,wake_development_time):     
+def compute_RHS_matrix(n_sw,n_cw,delta,phi,conditions,geometry,propeller_wake_model,initial_timestep_offset,wake_development_time,
+                       wake_opening_angle=None):     
     """ This computes the right hand side matrix for the VLM. In this
     function, induced velocites from propeller wake are also included 
     when relevent and where specified     
@@ -34,6 +36,8 @@ def compute_RHS_matrix(n_sw,n_cw,delta,phi,conditions,geometry,propeller_wake_mo
     sur_flag    - use_surrogate flag             [Unitless]
     slipstream  - propeller_wake_model flag      [Unitless] 
     delta, phi  - flow tangency angles           [radians]
+    wake_opening_angle - tree opening angle of   [Unitless]
+                  the wake, None to add up every wake panel
        
     Outputs:                                   
     RHS                                        [Unitless] 
@@ -66,7 +70,8 @@ def compute_RHS_matrix(n_sw,n_cw,delta,phi,conditions,geometry,propeller_wake_mo
                                                                                                                             VD,initial_timestep_offset,wake_development_time)
 
                     # compute the induced velocity
-                    prop_V_wake_ind = compute_wake_induced_velocity(wake_distribution,VD,num_ctrl_pts)
+                    prop_V_wake_ind = compute_wake_induced_velocity(wake_distribution,VD,num_ctrl_pts,
+                                                                    opening_angle=wake_opening_angle)
 
                 if 'rotor' in propulsor.keys():
 
@@ -78,7 +83,8 @@ def compute_RHS_matrix(n_sw,n_cw,delta,phi,conditions,geometry,propeller_wake_mo
                                                                                                                             VD,initial_timestep_offset,wake_development_time)
 
                     # compute the induced velocity
-                    rot_V_wake_ind = compute_wake_induced_velocity(wake_distribution,VD,num_ctrl_pts)
+                    rot_V_wake_ind = compute_wake_induced_velocity(wake_distribution,VD,num_ctrl_pts,
+                                                                    opening_angle=wake_opening_angle)
 
 
                 # update the total induced velocity distribution
@@ -1,84 +1,143 @@
 ## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
 # compute_wake_induced_velocity.py
-# 
-# Created:  Sep 2020, M. Clarke 
+#
+# Created:  Sep 2020, M. Clarke
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
 # ----------------------------------------------------------------------
-from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.compute_wing_induced_velocity import vortex 
+from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.compute_wing_induced_velocity import vortex_segment
+from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.vortex_segment_tree import build_vortex_segment_tree, \
+     vortex_segment_tree_interactions, vortex_segment_tree_induced_velocity
 
 # package imports
-import numpy as np 
+import numpy as np
 
-## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift 
-def compute_wake_induced_velocity(WD,VD,cpts):  
+# number of conditions times control points times wake panels in a tile, small enough for the tiles to stay in cache
+tile_entries = 2**15
+
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+def compute_wake_induced_velocity(WD,VD,cpts,tile_size=tile_entries,opening_angle=None):
     """ This computes the velocity induced by the fixed helical wake
-    on lifting surface control points
+    on lifting surface control points. The wake panels and the control points
+    are broadcast against each other in tiles, and the velocities of each tile
+    are added up as they are computed, so the memory does not grow with the
+    number of wake panels and control points. With an opening angle the
+    wake segments of each condition are instead grouped in a tree, and the
+    groups far from a control point are evaluated by their multipole moments.
+
+    Assumptions:
+
+    Source:
 
-    Assumptions:  
-    
-    Source:   
-    
-    Inputs: 
-    WD     - helical wake distribution points               [Unitless] 
-    VD     - vortex distribution points on lifting surfaces [Unitless] 
-    cpts   - control points in segemnt                     [Unitless] 
+    Inputs:
+    WD         - helical wake distribution points               [Unitless]
+    VD         - vortex distribution points on lifting surfaces [Unitless]
+    cpts       - control points in segemnt                     [Unitless]
+    tile_size  - conditions x control points x wake panels     [Unitless]
+    opening_angle - size over distance of the far groups, None  [Unitless]
+                    to add up every wake panel
+
+    Outputs:
+    V_ind      - induced velocities                            [Unitless]
 
     Properties Used:
     N/A
-    """    
-    
-    # control point, time step , blade number , location on blade 
-    num_v_cpts = len(WD.XA1[0,:])  
+    """
+
+    # control point, time step , blade number , location on blade
+    num_v_cpts = len(WD.XA1[0,:])
     num_w_cpts = VD.n_cp
-    ones       = np.ones((cpts,1,1))    
-    
-    WXA1  = np.repeat(np.atleast_3d(WD.XA1), num_w_cpts , axis = 2)    
-    WYA1  = np.repeat(np.atleast_3d(WD.YA1), num_w_cpts , axis = 2)     
-    WZA1  = np.repeat(np.atleast_3d(WD.ZA1), num_w_cpts , axis = 2)     
-    WXA2  = np.repeat(np.atleast_3d(WD.XA2), num_w_cpts , axis = 2)     
-    WYA2  = np.repeat(np.atleast_3d(WD.YA2), num_w_cpts , axis = 2)     
-    WZA2  = np.repeat(np.atleast_3d(WD.ZA2), num_w_cpts , axis = 2)     
-                           
-    WXB1  = np.repeat(np.atleast_3d(WD.XB1), num_w_cpts , axis = 2)     
-    WYB1  = np.repeat(np.atleast_3d(WD.YB1), num_w_cpts , axis = 2)     
-    WZB1  = np.repeat(np.atleast_3d(WD.ZB1), num_w_cpts , axis = 2)     
-    WXB2  = np.repeat(np.atleast_3d(WD.XB2), num_w_cpts , axis = 2)     
-    WYB2  = np.repeat(np.atleast_3d(WD.YB2), num_w_cpts , axis = 2)     
-    WZB2  = np.repeat(np.atleast_3d(WD.ZB2), num_w_cpts , axis = 2)       
-    GAMMA = np.repeat(np.atleast_3d(WD.GAMMA), num_w_cpts , axis = 2)   
-    
-    XC    = np.repeat(np.atleast_2d(VD.XC*ones), num_v_cpts , axis = 1)   
-    YC    = np.repeat(np.atleast_2d(VD.YC*ones), num_v_cpts , axis = 1) 
-    ZC    = np.repeat(np.atleast_2d(VD.ZC*ones), num_v_cpts , axis = 1)
-    
+
+    if opening_angle is not None:
+        return tree_wake_induced_velocity(WD,VD,cpts,opening_angle)
+
+    # tiles of wake panels, and of wing control points if all the wake panels do not fit
+    n_cols = int(min(max(tile_size//cpts,1),num_v_cpts))
+    n_rows = int(min(max(tile_size//(cpts*n_cols),1),num_w_cpts))
+
     # -------------------------------------------------------------------------------------------
     # Compute velocity induced by horseshoe vortex segments on every control point by every panel
-    # -------------------------------------------------------------------------------------------     
+    # -------------------------------------------------------------------------------------------
     # Create empty data structure
+    V_ind = np.zeros((cpts,num_w_cpts,3))
+
+    for start in range(0,num_v_cpts,n_cols):
+        # wake panels along the last axis
+        cols  = slice(start,start+n_cols)
+        WXA1  = WD.XA1[:,None,cols]
+        WYA1  = WD.YA1[:,None,cols]
+        WZA1  = WD.ZA1[:,None,cols]
+        WXA2  = WD.XA2[:,None,cols]
+        WYA2  = WD.YA2[:,None,cols]
+        WZA2  = WD.ZA2[:,None,cols]
+        WXB1  = WD.XB1[:,None,cols]
+        WYB1  = WD.YB1[:,None,cols]
+        WZB1  = WD.ZB1[:,None,cols]
+        WXB2  = WD.XB2[:,None,cols]
+        WYB2  = WD.YB2[:,None,cols]
+        WZB2  = WD.ZB2[:,None,cols]
+        GAMMA = WD.GAMMA[:,None,cols]
+
+        for row in range(0,num_w_cpts,n_rows):
+            # wing control points along the middle axis
+            rows = slice(row,row+n_rows)
+            XC   = VD.XC[None,rows,None]
+            YC   = VD.YC[None,rows,None]
+            ZC   = VD.ZC[None,rows,None]
+
+            # compute influence of bound vortices
+            C = vortex_segment(XC, YC, ZC, WXA1, WYA1, WZA1, WXB1, WYB1, WZB1, GAMMA)
+
+            # compute influence of 3/4 left legs
+            vortex_segment(XC, YC, ZC, WXB1, WYB1, WZB1, WXB2, WYB2, WZB2, GAMMA, C)
+
+            # compute influence of whole panel left legs
+            vortex_segment(XC, YC, ZC, WXB2, WYB2, WZB2, WXA2, WYA2, WZA2, GAMMA, C)
+
+            # compute influence of 3/4 right legs
+            vortex_segment(XC, YC, ZC, WXA2, WYA2, WZA2, WXA1, WYA1, WZA1, GAMMA, C)
+
+            # Add all the influences together
+            V_ind[:,rows] += np.sum(C, axis = 2)
+            del C
+
+    return V_ind
+
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+def tree_wake_induced_velocity(WD,VD,cpts,opening_angle):
+    """ This computes the velocity induced by the fixed helical wake with a
+    tree of the four segments of every wake panel, built for each condition.
+
+    Assumptions:
+    The wake segments far from a control point are approximated to second order
+
+    Source:
+    Barnes, J. and Hut, P., "A hierarchical O(N log N) force-calculation algorithm",
+    Nature 324, 1986
+
+    Inputs:
+    WD            - helical wake distribution points               [Unitless]
+    VD            - vortex distribution points on lifting surfaces [Unitless]
+    cpts          - control points in segemnt                     [Unitless]
+    opening_angle - size over distance of the far groups          [Unitless]
+
+    Outputs:
+    V_ind         - induced velocities                            [Unitless]
+
+    Properties Used:
+    N/A
+    """
+
     V_ind = np.zeros((cpts,VD.n_cp,3))
-     
-    #compute vortex strengths for every control point on wing 
-    # this loop finds the strength of one ring only on entire control points on wing 
-    # compute influence of bound vortices 
-    _ , res_C_AB = vortex(XC, YC, ZC, WXA1, WYA1, WZA1, WXB1, WYB1, WZB1,GAMMA) 
-    C_AB         = np.transpose(res_C_AB,axes=[1,2,3,0]) 
-    
-    # compute influence of 3/4 left legs 
-    _ , res_C_BC = vortex(XC, YC, ZC, WXB1, WYB1, WZB1, WXB2, WYB2, WZB2,GAMMA) 
-    C_BC         = np.transpose(res_C_BC,axes=[1,2,3,0]) 
-    
-    # compute influence of whole panel left legs  
-    _ , res_C_CD = vortex(XC, YC, ZC, WXB2, WYB2, WZB2, WXA2, WYA2, WZA2,GAMMA) 
-    C_CD         = np.transpose(res_C_CD,axes=[1,2,3,0])
-    
-    # compute influence of 3/4 right legs  
-    _ , res_C_DA = vortex(XC, YC, ZC, WXA2, WYA2, WZA2, WXA1, WYA1, WZA1,GAMMA) 
-    C_DA         = np.transpose(res_C_DA,axes=[1,2,3,0]) 
-    
-    # Add all the influences together
-    V_ind =  np.sum(C_AB +  C_BC  + C_CD + C_DA, axis = 1)
-    
+    for i in range(cpts):
+        # the segments A1-B1, B1-B2, B2-A2 and A2-A1 of every panel, one after the other
+        P1 = [np.concatenate([WD[x + a][i] for a in ['A1','B1','B2','A2']]) for x in ['X','Y','Z']]
+        P2 = [np.concatenate([WD[x + b][i] for b in ['B1','B2','A2','A1']]) for x in ['X','Y','Z']]
+
+        tree         = build_vortex_segment_tree(*P1,*P2)
+        interactions = vortex_segment_tree_interactions(tree,VD.XC,VD.YC,VD.ZC,opening_angle)
+        V_ind[i]     = vortex_segment_tree_induced_velocity(tree,interactions,np.tile(WD.GAMMA[i],4))
+
     return V_ind
-  
\ No newline at end of file
@@ -4,6 +4,7 @@
 # Created:  May 2018, M. Clarke
 #           Apr 2020, M. Clarke
 #           Jun 2020, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -34,11 +35,62 @@ def compute_wing_induced_velocity(VD,n_sw,n_cw,theta_w,mach):
     C_mn     - total induced velocity matrix    [Unitless] 
     DW_mn    - induced downwash velocity matrix [Unitless] 
 
+    Properties Used:
+    N/A
+    """
+    
+    C_mn_0, DW_mn_0, C_mn_sin, C_mn_cos = compute_wing_induced_velocity_components(VD,n_sw,n_cw,mach)
+    
+    # wake model, use theta_w if setting to freestream, use 0 if setting to airfoil chord like
+    sin_theta_w = np.atleast_3d(np.sin(theta_w))
+    cos_theta_w = np.atleast_3d(np.cos(theta_w))
+    
+    # the trailing legs to infinity follow the wake
+    C_mn  = C_mn_0
+    DW_mn = DW_mn_0
+    C_mn[:,:,:,0]  += sin_theta_w*C_mn_sin
+    C_mn[:,:,:,2]  += cos_theta_w*C_mn_cos
+    DW_mn[:,:,:,0] += sin_theta_w*C_mn_sin
+    DW_mn[:,:,:,2] += cos_theta_w*C_mn_cos
+    
+    return C_mn, DW_mn
+
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+def compute_wing_induced_velocity_components(VD,n_sw,n_cw,mach,control_points=slice(None)):
+    """ This computes the induced velocitys are each control point of the vehicle vortex lattice, split
+    by their dependence on the wake angle. Only the legs of the horseshoe vortices that go to infinity follow
+    the wake, so the matrices of compute_wing_induced_velocity are
+    
+    C_mn  = C_mn_0  + sin(theta_w)*C_mn_sin [x] + cos(theta_w)*C_mn_cos [z]
+    DW_mn = DW_mn_0 + sin(theta_w)*C_mn_sin [x] + cos(theta_w)*C_mn_cos [z]
+    
+    where the parts only depend on the geometry and the Mach number. The control points can be limited to a
+    slice, which gives the same rows of the matrices with a fraction of the memory.
+
+    Assumptions: 
+    Trailing vortex legs infinity are alligned to freestream
+
+    Source:  
+    None
+
+    Inputs: 
+    VD       - vehicle vortex distribution      [Unitless] 
+    n_sw     - number_spanwise_vortices         [Unitless]
+    n_cw     - number_chordwise_vortices        [Unitless] 
+    mach                                        [Unitless] 
+    control_points                              [slice] 
+    
+    Outputs:                                
+    C_mn_0   - total induced velocity matrix without the wake angle terms    [Unitless] 
+    DW_mn_0  - induced downwash velocity matrix without the wake angle terms [Unitless] 
+    C_mn_sin - x velocity per sine of the wake angle                        [Unitless] 
+    C_mn_cos - z velocity per cosine of the wake angle                      [Unitless] 
+
     Properties Used:
     N/A
     """
     # unpack  
-    ones     = np.atleast_3d(np.ones_like(theta_w))
+    ones     = np.atleast_3d(np.ones_like(mach))
  
     # Prandtl Glauret Transformation for subsonic
     inv_root_beta = np.zeros_like(mach)
@@ -68,9 +120,9 @@ def compute_wing_induced_velocity(VD,n_sw,n_cw,theta_w,mach):
     YB2   = np.atleast_3d(VD.YB2*ones)
     ZB2   = np.atleast_3d(VD.ZB2*ones) 
     
-    XC_TE   = np.atleast_3d(VD.XC_TE*inv_root_beta)
-    YC_TE   = np.atleast_3d(VD.YC_TE*ones)
-    ZC_TE   = np.atleast_3d(VD.ZC_TE*ones)    
+    XC_TE   = np.atleast_3d(VD.XC_TE[control_points]*inv_root_beta)
+    YC_TE   = np.atleast_3d(VD.YC_TE[control_points]*ones)
+    ZC_TE   = np.atleast_3d(VD.ZC_TE[control_points]*ones)    
     XA_TE   = np.atleast_3d(VD.XA_TE*inv_root_beta)
     YA_TE   = np.atleast_3d(VD.YA_TE*ones)
     ZA_TE   = np.atleast_3d(VD.ZA_TE*ones)
@@ -78,12 +130,10 @@ def compute_wing_induced_velocity(VD,n_sw,n_cw,theta_w,mach):
     YB_TE   = np.atleast_3d(VD.YB_TE*ones)
     ZB_TE   = np.atleast_3d(VD.ZB_TE*ones) 
     
-    XC    = np.atleast_3d(VD.XC*inv_root_beta)
-    YC    = np.atleast_3d(VD.YC*ones) 
-    ZC    = np.atleast_3d(VD.ZC*ones)  
+    XC    = np.atleast_3d(VD.XC[control_points]*inv_root_beta)
+    YC    = np.atleast_3d(VD.YC[control_points]*ones) 
+    ZC    = np.atleast_3d(VD.ZC[control_points]*ones)  
     n_w   = VD.n_w
-
-    theta_w = np.atleast_3d(theta_w)   # wake model, use theta_w if setting to freestream, use 0 if setting to airfoil chord like
     
     # -------------------------------------------------------------------------------------------
     # Compute velocity induced by horseshoe vortex segments on every control point by every panel
@@ -113,30 +163,25 @@ def compute_wing_induced_velocity(VD,n_sw,n_cw,theta_w,mach):
     ZC_TE = np.swapaxes(ZC_TE,1,2)     
     
     # compute influence of bound vortices 
-    res_C_AB_bv , _   = vortex(XC, YC, ZC, XAH, YAH, ZAH, XBH, YBH, ZBH)
-    C_AB_bv           = np.transpose(res_C_AB_bv,axes=[1,2,3,0])
+    C_AB_bv    = vortex_segment(XC, YC, ZC, XAH, YAH, ZAH, XBH, YBH, ZBH)
     
     # compute influence of 3/4 left legs 
-    res_C_AB_34_ll,_ = vortex(XC, YC, ZC, XA2, YA2, ZA2, XAH, YAH, ZAH) 
-    C_AB_34_ll       = np.transpose(res_C_AB_34_ll,axes=[1,2,3,0])  
+    C_AB_34_ll = vortex_segment(XC, YC, ZC, XA2, YA2, ZA2, XAH, YAH, ZAH) 
 
     # compute influence of whole panel left legs  
-    res_C_AB_ll,_    = vortex(XC, YC, ZC, XA2, YA2, ZA2, XA1, YA1, ZA1) 
-    C_AB_ll          =  np.transpose(res_C_AB_ll,axes=[1,2,3,0])  
+    C_AB_ll    = vortex_segment(XC, YC, ZC, XA2, YA2, ZA2, XA1, YA1, ZA1) 
 
     # compute influence of 3/4 right legs  
-    res_C_AB_34_rl,_ = vortex(XC, YC, ZC, XBH, YBH, ZBH, XB2, YB2, ZB2)   
-    C_AB_34_rl       = np.transpose(res_C_AB_34_rl,axes=[1,2,3,0])  
+    C_AB_34_rl = vortex_segment(XC, YC, ZC, XBH, YBH, ZBH, XB2, YB2, ZB2)   
 
     # compute influence of whole right legs   
-    res_C_AB_rl, _   = vortex(XC, YC, ZC, XB1, YB1, ZB1, XB2, YB2, ZB2)  
-    C_AB_rl          = np.transpose(res_C_AB_rl,axes=[1,2,3,0])  
+    C_AB_rl    = vortex_segment(XC, YC, ZC, XB1, YB1, ZB1, XB2, YB2, ZB2)  
 
-    # velocity induced by left leg of vortex (A to inf)
-    C_Ainf           = np.transpose(vortex_leg_from_A_to_inf(XC, YC, ZC, XA_TE, YA_TE, ZA_TE,theta_w),axes=[1,2,3,0])
+    # velocity induced by left leg of vortex (A to inf), split by the wake angle terms
+    C_Ainf_sin, C_Ainf_y, C_Ainf_cos = vortex_leg_to_inf_components(XC, YC, ZC, XA_TE, YA_TE, ZA_TE)
 
-    # velocity induced by right leg of vortex (B to inf)
-    C_Binf           = np.transpose(vortex_leg_from_B_to_inf(XC, YC, ZC, XB_TE, YB_TE, ZB_TE,theta_w),axes=[1,2,3,0])
+    # velocity induced by right leg of vortex (B to inf), the opposite direction of the left leg
+    C_Binf_sin, C_Binf_y, C_Binf_cos = vortex_leg_to_inf_components(XC, YC, ZC, XB_TE, YB_TE, ZB_TE)
 
     # the follow block of text adds up all the trailing legs of the vortices which are on the wing for the downwind panels   
     C_AB_ll_on_wing  = np.zeros_like(C_AB_ll)
@@ -153,20 +198,26 @@ def compute_wing_induced_velocity(VD,n_sw,n_cw,theta_w,mach):
             C_AB_rl_on_wing[:,:,n,:] = np.sum(C_AB_rl[:,:,start:end,:],axis=2)                
 
     # Add all the influences together
-    C_AB_ll_tot = C_AB_ll_on_wing + C_AB_34_ll + C_Ainf  # verified from book using example 7.4 pg 399-404
-    C_AB_rl_tot = C_AB_rl_on_wing + C_AB_34_rl + C_Binf  # verified from book using example 7.4 pg 399-404
-    C_mn        = C_AB_bv + C_AB_ll_tot  + C_AB_rl_tot   # verified from book using example 7.4 pg 399-404 
-    DW_mn       = C_AB_ll_tot + C_AB_rl_tot              # summation of trailing vortices for semi infinite 
+    C_AB_ll_tot = C_AB_ll_on_wing + C_AB_34_ll   # verified from book using example 7.4 pg 399-404
+    C_AB_rl_tot = C_AB_rl_on_wing + C_AB_34_rl   # verified from book using example 7.4 pg 399-404
+    DW_mn_0     = C_AB_ll_tot + C_AB_rl_tot      # summation of trailing vortices for semi infinite 
+    DW_mn_0[:,:,:,1] += C_Ainf_y - C_Binf_y
+    C_mn_0      = C_AB_bv + DW_mn_0              # verified from book using example 7.4 pg 399-404 
+    C_mn_sin    = C_Ainf_sin - C_Binf_sin
+    C_mn_cos    = C_Ainf_cos - C_Binf_cos
     
-    return C_mn, DW_mn
+    return C_mn_0, DW_mn_0, C_mn_sin, C_mn_cos
 
 # -------------------------------------------------------------------------------
 # vortex strength computation
 # -------------------------------------------------------------------------------
 ## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
-def vortex(X,Y,Z,X1,Y1,Z1,X2,Y2,Z2, GAMMA = 1):
-    """ This computes the velocity induced on a control point by a segment
-    of a horseshoe vortex from point 1 to point 2 
+def vortex_segment(X,Y,Z,X1,Y1,Z1,X2,Y2,Z2, GAMMA = 1, V_IND = None):
+    """ This computes the velocity induced on control points by segments of 
+    horseshoe vortices from point 1 to point 2. The inputs are broadcast 
+    against each other, so the control points and the segments can be given along 
+    different axes without repeating them, and the velocities are returned with their
+    components along a last axis. Given V_IND, the velocities are added to it.
 
     Assumptions:  
     None 
@@ -176,10 +227,14 @@ def vortex(X,Y,Z,X1,Y1,Z1,X2,Y2,Z2, GAMMA = 1):
     Pgs. 584(Literature), 579-586 (Fortran Code implementation)
     
     Inputs:
-    GAMMA       - propeller/rotor circulation
+    GAMMA       - circulation of the segments, 1 for the influence coefficients
     [X,Y,Z]     - location of control point  
     [X1,Y1,Z1]  - location of point 1 
     [X2,Y2,Z2]  - location of point 2
+    V_IND       - induced velocities to add to, None for new ones
+
+    Outputs:
+    V_IND       - induced velocities, [..., 3]
 
     Properties Used:
     N/A
@@ -206,16 +261,26 @@ def vortex(X,Y,Z,X1,Y1,Z1,X2,Y2,Z2, GAMMA = 1):
     R2     = np.sqrt(np.square(X_X2) + np.square(Y_Y2) + np.square(Z_Z2)) 
     R0R1   = X2_X1*X_X1 + Y2_Y1*Y_Y1 + Z2_Z1*Z_Z1
     R0R2   = X2_X1*X_X2 + Y2_Y1*Y_Y2 + Z2_Z1*Z_Z2
-    RVEC   = np.array([R1R2X,R1R2Y,R1R2Z])
-    COEF   = (1/(4*np.pi))*(RVEC/SQUARE) * (R0R1/R1 - R0R2/R2)    
-    V_IND  = GAMMA * COEF
+    COEF   = (GAMMA/(4*np.pi))*(R0R1/R1 - R0R2/R2)/SQUARE
     
-    return COEF , V_IND
+    if V_IND is None:
+        V_IND = np.empty(COEF.shape + (3,))
+        np.multiply(R1R2X,COEF,out=V_IND[...,0])
+        np.multiply(R1R2Y,COEF,out=V_IND[...,1])
+        np.multiply(R1R2Z,COEF,out=V_IND[...,2])
+    else:
+        V_IND[...,0] += R1R2X*COEF
+        V_IND[...,1] += R1R2Y*COEF
+        V_IND[...,2] += R1R2Z*COEF
+    
+    return V_IND
 
 ## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
-def vortex_leg_from_A_to_inf(X,Y,Z,X1,Y1,Z1,tw): 
-    """ This computes the velocity induced on a control point the left leg of a 
-    a semi-infinite horseshoe vortex from point 1 to infinity
+def vortex_leg_to_inf_components(X,Y,Z,X1,Y1,Z1):
+    """ This computes the velocity induced on a control point by the left leg of a semi-infinite 
+    horseshoe vortex from point 1 to infinity, split by the wake angle tw. The velocity of the 
+    left leg is [sin(tw)*COEF_sin, COEF_y, cos(tw)*COEF_cos], the one of the right leg is the 
+    negative of that.
 
     Assumptions:  
     None 
@@ -240,48 +305,11 @@ def vortex_leg_from_A_to_inf(X,Y,Z,X1,Y1,Z1,tw):
 
     DENUM =  np.square(Z_Z1) + np.square(Y1_Y)
     DENUM[DENUM==0] = 1e-12  
-    XVEC  = -Y1_Y*np.sin(tw)/DENUM
-    YVEC  = (Z_Z1)/DENUM
-    ZVEC  = Y1_Y*np.cos(tw)/DENUM 
-    RVEC  = np.array([XVEC, YVEC, ZVEC])
     BRAC  = 1 + (X_X1 / (np.sqrt(np.square(X_X1) + np.square(Y_Y1) + np.square(Z_Z1))))    
-    COEF  = (1/(4*np.pi))*RVEC*BRAC   
-
-    return COEF
-
-## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
-def vortex_leg_from_B_to_inf(X,Y,Z,X1,Y1,Z1,tw):
-    """ This computes the velocity induced on a control point the right leg of a 
-    a semi-infinite horseshoe vortex from point 1 to infinity
-
-    Assumptions:  
-    None 
+    COEF  = (1/(4*np.pi))*BRAC/DENUM
     
-    Source:  
-    Low-Speed Aerodynamics, Second Edition by Joseph katz, Allen Plotkin
-    Pgs. 584(Literature), 579-586 (Fortran Code implementation)
-    
-    Inputs:
-    [X,Y,Z]     - location of control point  
-    [X1,Y1,Z1]  - location of point 1  
+    COEF_sin = -Y1_Y*COEF
+    COEF_y   = Z_Z1*COEF
+    COEF_cos = Y1_Y*COEF
 
-    Properties Used:
-    N/A
-    
-    """      
-    # Take all the differences
-    X_X1  = X-X1    
-    Y_Y1  = Y-Y1
-    Y1_Y  = Y1-Y
-    Z_Z1  = Z-Z1    
-
-    DENUM =  np.square(Z_Z1) + np.square(Y1_Y)
-    DENUM[DENUM==0] = 1e-12  
-    XVEC  = -Y1_Y*np.sin(tw)/DENUM
-    YVEC  = Z_Z1/DENUM
-    ZVEC  = Y1_Y*np.cos(tw)/DENUM 
-    RVEC  = np.array([XVEC, YVEC, ZVEC])
-    BRAC  = 1 + (X_X1 / (np.sqrt(np.square(X_X1)+ np.square(Y_Y1)+ np.square(Z_Z1))))    
-    COEF  = -(1/(4*np.pi))*RVEC*BRAC      
-
-    return COEF
\ No newline at end of file
+    return COEF_sin, COEF_y, COEF_cos
@@ -0,0 +1,334 @@
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+# hierarchical_vortex_lattice.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+from SUAVE.Core import Data
+from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.compute_wing_induced_velocity import compute_wing_induced_velocity_components, \
+     vortex_leg_to_inf_components
+from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.vortex_segment_tree import build_vortex_segment_tree, \
+     vortex_segment_tree_interactions, vortex_segment_tree_induced_velocity
+
+# package imports
+import numpy as np
+import scipy.linalg
+from scipy.sparse.linalg import LinearOperator, gmres
+import inspect
+
+# number of panels, in whole strips, of the diagonal blocks of the near field preconditioner
+preconditioner_block_panels = 256
+
+# number of control points of the legs to infinity computed at once
+leg_block_rows = 1024
+
+# name of the relative tolerance of gmres, tol before scipy 1.12
+if 'rtol' in inspect.signature(gmres).parameters:
+    gmres_tolerance = 'rtol'
+else:
+    gmres_tolerance = 'tol'
+
+# ----------------------------------------------------------------------
+#  Hierarchical Vortex Lattice
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+def solve_hierarchical_vortex_lattice(VD,settings,RHS,aoa,mach):
+    """Solves the vortex lattice for the vortex strengths without building the aerodynamic influence
+    coefficient matrix. The velocities induced by the horseshoe vortices are evaluated with a tree of
+    their segments, and the vortex strengths are found with GMRES, preconditioned by the dense influence
+    matrices of blocks of neighboring strips. The memory grows with the number of panels times the number
+    of strips instead of the square of the number of panels.
+
+    Assumptions:
+    Trailing vortex legs infinity are alligned to freestream
+    The panels of a strip share their trailing edge
+
+    Source:
+    1. Low-Speed Aerodynamics, Second Edition by Joseph katz, Allen Plotkin
+    Pgs. 331-338(Literature), 579-586 (Fortran Code implementation)
+
+    2. Saad, Y. and Schultz, M., "GMRES: A generalized minimal residual algorithm for solving nonsymmetric
+    linear systems", SIAM Journal on Scientific and Statistical Computing 7, 1986
+
+    Inputs:
+    VD                                         [Data]
+    settings.
+      number_chordwise_vortices                [Unitless]
+      tree_opening_angle                       [Unitless]
+      iterative_solve_tolerance                [Unitless]
+    RHS                                        [Unitless]
+    aoa                                        [radians]
+    mach                                       [Unitless]
+
+    Outputs:
+    gamma                                      [Unitless]
+    u                                          [Unitless]
+    w_ind                                      [Unitless]
+
+    Properties Used:
+    N/A
+    """
+
+    tolerance = settings.get('iterative_solve_tolerance',1e-8)
+    n_cond    = len(aoa)
+    n_cp      = VD.n_cp
+    gamma     = np.zeros((n_cond,n_cp))
+    u         = np.zeros((n_cond,n_cp))
+    w_ind     = np.zeros((n_cond,n_cp))
+    last      = Data(mach=None,influence=None)
+
+    for i in np.argsort(mach[:,0],kind='stable'):
+        if last.mach != mach[i,0]:
+            last.mach      = mach[i,0]
+            last.influence = get_hierarchical_influence(VD,settings,mach[i,0])
+        influence = last.influence
+        sin_aoa   = np.sin(aoa[i,0])
+        cos_aoa   = np.cos(aoa[i,0])
+
+        # the near field blocks, factored for this angle of attack
+        factors = [scipy.linalg.lu_factor(block.A_0 + sin_aoa*block.A_sin + cos_aoa*block.A_cos) for block in influence.blocks]
+
+        def matvec(g):
+            return influence_product(influence,np.ravel(g),sin_aoa,cos_aoa)
+
+        def preconditioner(r):
+            r = np.ravel(r)
+            x = np.empty_like(r)
+            for block, factor in zip(influence.blocks,factors):
+                x[block.rows] = scipy.linalg.lu_solve(factor,r[block.rows])
+            return x
+
+        A = LinearOperator((n_cp,n_cp),matvec=matvec,dtype=float)
+        M = LinearOperator((n_cp,n_cp),matvec=preconditioner,dtype=float)
+        gamma[i], info = gmres(A,RHS[i],M=M,atol=0.,restart=100,maxiter=20,**{gmres_tolerance:tolerance})
+        if info != 0:
+            print('Vortex lattice did not converge to the iterative solve tolerance, Mach: ' + str(mach[i,0]))
+
+        u[i]     = (influence.u_0 + sin_aoa*influence.u_sin)*gamma[i]
+        w_ind[i] = -(influence.w_0 + cos_aoa*influence.w_cos)*gamma[i]
+
+    return gamma, u, w_ind
+
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+def get_hierarchical_influence(VD,settings,mach):
+    """Sets up the evaluation of the velocities induced by the horseshoe vortices for one mach number. The
+    horseshoe vortex of a panel is made of its bound vortex, its 3/4 legs, the legs of the panels behind it on
+    its strip and the legs to infinity of the strip. The finite segments go into a tree, and as the legs to
+    infinity are shared by the panels of a strip, they are only computed for the strips.
+
+    Assumptions:
+    Trailing vortex legs infinity are alligned to freestream
+    The panels of a strip share their trailing edge
+
+    Source:
+    Low-Speed Aerodynamics, Second Edition by Joseph katz, Allen Plotkin
+    Pgs. 331-338(Literature), 579-586 (Fortran Code implementation)
+
+    Inputs:
+    VD                                         [Data]
+    settings.
+      number_spanwise_vortices                 [Unitless]
+      number_chordwise_vortices                [Unitless]
+      tree_opening_angle                       [Unitless]
+    mach                                       [Unitless]
+
+    Outputs:
+    influence.
+      tree, interactions                       [Data]
+      XC, YC, ZC                               [m]
+      S_x, S_y, S_z                            [Unitless]
+      C_inf_sin, C_inf_y, C_inf_cos            [Unitless]
+      u_0, u_sin, w_0, w_cos                   [Unitless]
+      blocks                                   [list]
+
+    Properties Used:
+    N/A
+    """
+
+    n_sw  = settings.number_spanwise_vortices
+    n_cw  = settings.number_chordwise_vortices
+    n_cp  = VD.n_cp
+
+    # flow tangency
+    if mach < 1:
+        inv_root_beta = 1/np.sqrt(1-mach**2)
+    elif mach > 1:
+        inv_root_beta = 1/np.sqrt(mach**2-1)
+    else:
+        inv_root_beta = 0.
+
+    phi   = np.arctan((VD.ZBC - VD.ZAC)/(VD.YBC - VD.YAC))                # dihedral angle
+    delta = np.arctan((VD.ZC - VD.ZCH)/((VD.XC - VD.XCH)*inv_root_beta)) # mean camber surface angle
+
+    influence               = Data()
+    influence.n_cw          = n_cw
+    influence.S_x           = np.sin(delta)*np.cos(phi)
+    influence.S_y           = np.cos(delta)*np.sin(phi)
+    influence.S_z           = np.cos(phi)*np.cos(delta)
+    influence.XC            = VD.XC*inv_root_beta
+    influence.YC            = VD.YC
+    influence.ZC            = VD.ZC
+
+    # end points in the Prandtl Glauert coordinates, with A and B flipped on the negative side of the airplane
+    flip = VD.YBH < 0.
+    P    = Data()
+    for point in ['A1','A2','AH','B1','B2','BH','A_TE','B_TE']:
+        P['X' + point] = VD['X' + point]*inv_root_beta
+        P['Y' + point] = VD['Y' + point]
+        P['Z' + point] = VD['Z' + point]
+    for point_A, point_B in [('A1','B1'),('A2','B2'),('AH','BH'),('A_TE','B_TE')]:
+        for axis in ['X','Y','Z']:
+            A = P[axis + point_A].copy()
+            B = P[axis + point_B]
+            P[axis + point_A] = np.where(flip,B,A)
+            P[axis + point_B] = np.where(flip,A,B)
+
+    # the finite segments: bound vortices, 3/4 legs and whole legs
+    segments = [('AH','BH'),('A2','AH'),('BH','B2'),('A2','A1'),('B1','B2')]
+    ends     = [np.concatenate([P[axis + segment[side]] for segment in segments]) for side in [0,1] for axis in ['X','Y','Z']]
+    influence.tree         = build_vortex_segment_tree(*ends)
+    influence.interactions = vortex_segment_tree_interactions(influence.tree,influence.XC,influence.YC,influence.ZC,
+                                                              settings.get('tree_opening_angle',0.2))
+
+    # the legs to infinity of each strip
+    strips               = np.arange(0,n_cp,n_cw)
+    influence.C_inf_sin  = np.zeros((n_cp,len(strips)))
+    influence.C_inf_y    = np.zeros((n_cp,len(strips)))
+    influence.C_inf_cos  = np.zeros((n_cp,len(strips)))
+    for start in range(0,n_cp,leg_block_rows):
+        rows = slice(start,min(start+leg_block_rows,n_cp))
+        XC   = influence.XC[rows,None]
+        YC   = influence.YC[rows,None]
+        ZC   = influence.ZC[rows,None]
+        C_Ainf_sin, C_Ainf_y, C_Ainf_cos = vortex_leg_to_inf_components(XC,YC,ZC,P.XA_TE[strips],P.YA_TE[strips],P.ZA_TE[strips])
+        C_Binf_sin, C_Binf_y, C_Binf_cos = vortex_leg_to_inf_components(XC,YC,ZC,P.XB_TE[strips],P.YB_TE[strips],P.ZB_TE[strips])
+        influence.C_inf_sin[rows] = C_Ainf_sin - C_Binf_sin
+        influence.C_inf_y[rows]   = C_Ainf_y   - C_Binf_y
+        influence.C_inf_cos[rows] = C_Ainf_cos - C_Binf_cos
+
+    # the sums of the induced velocities over the horseshoe vortices, for the velocities on each panel
+    factor     = 2. if mach > 1 else 1.
+    ones       = np.ones(n_cp)
+    V_all      = induced_velocity(influence,segment_strengths(ones,n_cw))
+    V_trailing = induced_velocity(influence,segment_strengths(ones,n_cw,bound=False))
+    influence.u_0   = factor*V_all[:,0]
+    influence.u_sin = factor*n_cw*np.sum(influence.C_inf_sin,axis=1)
+    influence.w_0   = factor*V_trailing[:,2]
+    influence.w_cos = factor*n_cw*np.sum(influence.C_inf_cos,axis=1)
+
+    # dense influence matrices of blocks of whole strips, each block on its own
+    n_strips        = max(preconditioner_block_panels//n_cw,1)
+    influence.blocks = []
+    for start in range(0,n_cp,n_strips*n_cw):
+        rows     = slice(start,min(start+n_strips*n_cw,n_cp))
+        VD_block = Data()
+        for key in ['XAH','YAH','ZAH','XBH','YBH','ZBH','XA1','YA1','ZA1','XA2','YA2','ZA2','XB1','YB1','ZB1',
+                    'XB2','YB2','ZB2','XC_TE','YC_TE','ZC_TE','XA_TE','YA_TE','ZA_TE','XB_TE','YB_TE','ZB_TE','XC','YC','ZC']:
+            VD_block[key] = VD[key][rows]
+        VD_block.n_w = 1
+        n_sw_block   = (rows.stop - rows.start)//n_cw
+
+        C_mn_0, DW_mn_0, C_mn_sin, C_mn_cos = compute_wing_induced_velocity_components(VD_block,n_sw_block,n_cw,np.array([[mach]]))
+        S_x = influence.S_x[rows,None]
+        S_y = influence.S_y[rows,None]
+        S_z = influence.S_z[rows,None]
+
+        block       = Data()
+        block.rows  = rows
+        block.A_0   = C_mn_0[0,:,:,0]*S_x + C_mn_0[0,:,:,1]*S_y - C_mn_0[0,:,:,2]*S_z
+        block.A_sin = C_mn_sin[0]*S_x
+        block.A_cos = -C_mn_cos[0]*S_z
+        influence.blocks.append(block)
+
+    return influence
+
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+def influence_product(influence,gamma,sin_aoa,cos_aoa):
+    """Multiplies the aerodynamic influence coefficient matrix by vortex strengths, without the matrix.
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    influence                                  [Data]
+    gamma                                      [Unitless]
+    sin_aoa, cos_aoa                           [Unitless]
+
+    Outputs:
+    A_gamma                                    [Unitless]
+
+    Properties Used:
+    N/A
+    """
+
+    n_cw     = influence.n_cw
+    V        = induced_velocity(influence,segment_strengths(gamma,n_cw))
+    strips   = np.sum(gamma.reshape(-1,n_cw),axis=1)
+    V[:,0]  += sin_aoa*np.dot(influence.C_inf_sin,strips)
+    V[:,1]  += np.dot(influence.C_inf_y,strips)
+    V[:,2]  += cos_aoa*np.dot(influence.C_inf_cos,strips)
+
+    return V[:,0]*influence.S_x + V[:,1]*influence.S_y - V[:,2]*influence.S_z
+
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+def induced_velocity(influence,strengths):
+    """The velocities induced on the control points by the finite segments of the horseshoe vortices.
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    influence                                  [Data]
+    strengths                                  [Unitless]
+
+    Outputs:
+    V                                          [Unitless]
+
+    Properties Used:
+    N/A
+    """
+
+    return vortex_segment_tree_induced_velocity(influence.tree,influence.interactions,strengths)
+
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+def segment_strengths(gamma,n_cw,bound=True):
+    """The circulation of the finite segments of the horseshoe vortices, in the order of the tree. The bound
+    vortex and 3/4 legs of a panel carry its own vortex strength, and the whole legs of a panel carry the
+    vortex strengths of the panels ahead of it on its strip. The legs of the last panel of a strip are not
+    part of any horseshoe vortex.
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    gamma                                      [Unitless]
+    n_cw                                       [Unitless]
+    bound                                      [Boolean]
+
+    Outputs:
+    strengths                                  [Unitless]
+
+    Properties Used:
+    N/A
+    """
+
+    strips        = gamma.reshape(-1,n_cw)
+    ahead         = np.cumsum(strips,axis=1) - strips
+    ahead[:,-1]   = 0.
+    ahead         = ahead.ravel()
+    bound_vortex  = gamma if bound else np.zeros_like(gamma)
+
+    return np.concatenate([bound_vortex,gamma,gamma,ahead,ahead])
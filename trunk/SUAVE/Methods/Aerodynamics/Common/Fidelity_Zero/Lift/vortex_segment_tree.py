@@ -0,0 +1,333 @@
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+# vortex_segment_tree.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+from SUAVE.Core import Data
+from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.compute_wing_induced_velocity import vortex_segment
+
+# package imports
+import numpy as np
+from scipy.sparse import csr_matrix
+
+# number of far cluster and control point pairs expanded at once
+far_block_pairs = 2**16
+
+# ----------------------------------------------------------------------
+#  Build Tree
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+def build_vortex_segment_tree(X1,Y1,Z1,X2,Y2,Z2,leaf_size=32):
+    """ This sorts straight vortex segments from point 1 to point 2 into a binary tree of
+    clusters, each split in half along its longest side, for the evaluation of their induced
+    velocities with vortex_segment_tree_induced_velocity. The tree only depends on the
+    geometry, so it is reused for any vortex strengths.
+
+    Assumptions:
+    None
+
+    Source:
+    Barnes, J. and Hut, P., "A hierarchical O(N log N) force-calculation algorithm",
+    Nature 324, 1986
+
+    Inputs:
+    [X1,Y1,Z1]  - location of point 1 of the segments
+    [X2,Y2,Z2]  - location of point 2 of the segments
+    leaf_size   - largest number of segments in a cluster that is not split
+
+    Outputs:
+    tree.
+      order          - segment of each position in the tree
+      P1, P2         - segment end points, in the order of the tree
+      L              - segment vectors
+      D              - segment midpoints relative to the center of their leaf
+      DD             - second moments of the segments about the center of their leaf
+      start, end     - range of positions of each cluster
+      left, right    - child clusters, -1 for the leaves
+      center, radius - center of the midpoints of a cluster and the distance to its farthest end point
+      levels         - clusters with children by depth, the deepest last
+
+    Properties Used:
+    N/A
+    """
+
+    P1  = np.array([np.ravel(X1),np.ravel(Y1),np.ravel(Z1)],dtype=float).T
+    P2  = np.array([np.ravel(X2),np.ravel(Y2),np.ravel(Z2)],dtype=float).T
+    mid = 0.5*(P1 + P2)
+
+    tree        = Data()
+    tree.order  = np.arange(len(P1))
+    start       = []
+    end         = []
+    left        = []
+    right       = []
+    depth       = []
+
+    # split the clusters from the top down, the children of a cluster come after it
+    stack = [(0,len(P1),-1,0)]
+    while stack:
+        i_start, i_end, parent, level = stack.pop()
+        node = len(start)
+        start.append(i_start)
+        end.append(i_end)
+        left.append(-1)
+        right.append(-1)
+        depth.append(level)
+        if parent >= 0:
+            if left[parent] < 0:
+                left[parent]  = node
+            else:
+                right[parent] = node
+
+        if i_end - i_start > leaf_size:
+            indices = tree.order[i_start:i_end]
+            points  = mid[indices]
+            axis    = np.argmax(np.max(points,axis=0) - np.min(points,axis=0))
+            half    = (i_end - i_start)//2
+            tree.order[i_start:i_end] = indices[np.argpartition(points[:,axis],half)]
+            stack.append((i_start + half,i_end,node,level+1))
+            stack.append((i_start,i_start + half,node,level+1))
+
+    tree.start  = np.array(start)
+    tree.end    = np.array(end)
+    tree.left   = np.array(left)
+    tree.right  = np.array(right)
+    tree.P1     = P1[tree.order]
+    tree.P2     = P2[tree.order]
+    tree.L      = tree.P2 - tree.P1
+    mid         = mid[tree.order]
+
+    # centers and sizes of the clusters
+    n_nodes     = len(start)
+    tree.center = np.zeros((n_nodes,3))
+    tree.radius = np.zeros(n_nodes)
+    for node in range(n_nodes):
+        s = slice(start[node],end[node])
+        c = np.mean(mid[s],axis=0)
+        tree.center[node] = c
+        tree.radius[node] = np.sqrt(max(np.max(np.sum((tree.P1[s] - c)**2,axis=1)),np.max(np.sum((tree.P2[s] - c)**2,axis=1))))
+
+    # the leaves partition the segments, in the order of their positions
+    tree.leaves = np.where(tree.left < 0)[0]
+    tree.leaves = tree.leaves[np.argsort(tree.start[tree.leaves])]
+    leaf_of     = np.repeat(tree.leaves,tree.end[tree.leaves] - tree.start[tree.leaves])
+    tree.D      = mid - tree.center[leaf_of]
+    tree.DD     = (tree.D[:,:,None]*tree.D[:,None,:] + tree.L[:,:,None]*tree.L[:,None,:]/12.).reshape(-1,9)
+
+    # the clusters with children, deepest first so that the children are done before their parents
+    depth       = np.array(depth)
+    parents     = np.where(tree.left >= 0)[0]
+    tree.levels = [parents[depth[parents] == level] for level in range(np.max(depth),-1,-1)]
+    tree.levels = [level for level in tree.levels if len(level)]
+
+    return tree
+
+# ----------------------------------------------------------------------
+#  Interactions
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+def vortex_segment_tree_interactions(tree,X,Y,Z,opening_angle=0.2):
+    """ This walks down a tree of vortex segments with a set of control points, and finds the
+    clusters that are far enough from each control point to be expanded about their centers. A
+    cluster that is seen under less than the opening angle is far, the segments of the leaves
+    that are not far are near and are added up one by one. As neither depends on the vortex
+    strengths, the velocities induced by the near segments are kept in a sparse matrix, and the
+    offsets of the far clusters are kept for their expansions.
+
+    Assumptions:
+    None
+
+    Source:
+    Barnes, J. and Hut, P., "A hierarchical O(N log N) force-calculation algorithm",
+    Nature 324, 1986
+
+    Inputs:
+    tree           - from build_vortex_segment_tree
+    [X,Y,Z]        - location of the control points
+    opening_angle  - cluster radius over distance below which a cluster is far [Unitless]
+
+    Outputs:
+    interactions.
+      n_points                 - number of control points
+      near_x, near_y, near_z   - sparse velocities induced by the near segments, in the order of the tree
+      far_points, far_nodes    - the control points and the clusters expanded for them
+      far_r                    - offset of the control points from the centers of the clusters
+
+    Properties Used:
+    N/A
+    """
+
+    T       = np.array([np.ravel(X),np.ravel(Y),np.ravel(Z)],dtype=float).T
+    theta_2 = opening_angle**2
+
+    far_points = []
+    far_nodes  = []
+    near_rows  = []
+    near_cols  = []
+    near_V     = [[],[],[]]
+
+    # walk down the tree with the control points that are too near to expand each cluster for
+    stack = [(0,np.arange(len(T)))]
+    while stack:
+        node, targets = stack.pop()
+        r   = T[targets] - tree.center[node]
+        far = np.sum(r*r,axis=1)*theta_2 > tree.radius[node]**2
+
+        if np.any(far):
+            far_points.append(targets[far])
+            far_nodes.append(np.full(np.count_nonzero(far),node))
+
+        targets = targets[~far]
+        if len(targets) == 0:
+            continue
+        if tree.left[node] >= 0:
+            stack.append((tree.left[node],targets))
+            stack.append((tree.right[node],targets))
+        else:
+            s  = slice(tree.start[node],tree.end[node])
+            P1 = tree.P1[s]
+            P2 = tree.P2[s]
+            V  = vortex_segment(T[targets,0,None],T[targets,1,None],T[targets,2,None],P1[:,0],P1[:,1],P1[:,2],
+                                P2[:,0],P2[:,1],P2[:,2])
+            near_rows.append(np.repeat(targets.astype(np.int32),len(P1)))
+            near_cols.append(np.tile(np.arange(tree.start[node],tree.end[node],dtype=np.int32),len(targets)))
+            for axis in range(3):
+                near_V[axis].append(V[:,:,axis].ravel())
+
+    # the near velocities as sparse matrices sorted by control point, the components share their indices
+    interactions          = Data()
+    interactions.n_points = len(T)
+    shape                 = (len(T),len(tree.P1))
+    rows   = np.concatenate(near_rows + [np.zeros(0,dtype=np.int32)])
+    order  = np.argsort(rows,kind='stable')
+    indptr = np.zeros(len(T)+1,dtype=np.int32)
+    indptr[1:] = np.cumsum(np.bincount(rows,minlength=len(T)))
+    del near_rows, rows
+    cols   = np.concatenate(near_cols + [np.zeros(0,dtype=np.int32)])[order]
+    del near_cols
+    for axis, key in enumerate(['near_x','near_y','near_z']):
+        V = np.concatenate(near_V[axis] + [np.zeros(0)])[order]
+        near_V[axis] = None
+        interactions[key] = csr_matrix((V,cols,indptr),shape=shape)
+        del V
+
+    if far_points:
+        interactions.far_points = np.concatenate(far_points)
+        interactions.far_nodes  = np.concatenate(far_nodes)
+    else:
+        interactions.far_points = np.zeros(0,dtype=int)
+        interactions.far_nodes  = np.zeros(0,dtype=int)
+    interactions.far_r = T[interactions.far_points] - tree.center[interactions.far_nodes]
+
+    return interactions
+
+# ----------------------------------------------------------------------
+#  Evaluate Tree
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+def vortex_segment_tree_induced_velocity(tree,interactions,GAMMA):
+    """ This computes the velocity induced on control points by the vortex segments of a
+    tree, with circulations GAMMA. The near segments are added up from the sparse matrices of
+    the interactions, and each far cluster is replaced by the expansion of its segments about
+    its center, to the second order in the size of the cluster over the distance,
+
+    V = 1/(4 pi) [ M x r/|r|^3 - w/|r|^3 + 3 (D r) x r/|r|^5
+                   - 3 v/|r|^5 - 3/2 q x r/|r|^5 + 15/2 (Q:rr) x r/|r|^7 ]
+
+    where M is the sum of GAMMA*L over the segments, D the sum of GAMMA*L*d^T with d the
+    offsets of the midpoints from the center, w the vector of the antisymmetric part of D,
+    Q the sum of GAMMA*L*(d*d^T + L*L^T/12), q its trace over the last two indices and v the
+    vector of the antisymmetric part of Q r. With an opening angle of zero every segment is
+    near, and the velocities are the ones of vortex_segment.
+
+    Assumptions:
+    The segments are short compared to the distance from a cluster to the control points
+    that it is expanded for
+
+    Source:
+    Barnes, J. and Hut, P., "A hierarchical O(N log N) force-calculation algorithm",
+    Nature 324, 1986
+
+    Low-Speed Aerodynamics, Second Edition by Joseph katz, Allen Plotkin
+    Pgs. 584(Literature), 579-586 (Fortran Code implementation)
+
+    Inputs:
+    tree           - from build_vortex_segment_tree
+    interactions   - from vortex_segment_tree_interactions
+    GAMMA          - circulation of the segments, in their original order
+
+    Outputs:
+    V_IND          - induced velocities, [n_control_points, 3]
+
+    Properties Used:
+    N/A
+    """
+
+    G       = np.asarray(GAMMA,dtype=float)[tree.order]
+    n_nodes = len(tree.start)
+    n       = interactions.n_points
+
+    # the near segments
+    V_IND       = np.empty((n,3))
+    V_IND[:,0]  = interactions.near_x.dot(G)
+    V_IND[:,1]  = interactions.near_y.dot(G)
+    V_IND[:,2]  = interactions.near_z.dot(G)
+
+    # moments of the leaves about their centers
+    GL      = G[:,None]*tree.L
+    starts  = tree.start[tree.leaves]
+    M       = np.zeros((n_nodes,3))
+    D       = np.zeros((n_nodes,3,3))
+    Q       = np.zeros((n_nodes,3,3,3))
+    M[tree.leaves] = np.add.reduceat(GL,starts,axis=0)
+    D[tree.leaves] = np.add.reduceat(GL[:,:,None]*tree.D[:,None,:],starts,axis=0)
+    Q[tree.leaves] = np.add.reduceat((GL[:,:,None]*tree.DD[:,None,:]).reshape(-1,3,3,3),starts,axis=0)
+
+    # moments of the other clusters from their children, moved to the center of the cluster
+    for level in tree.levels:
+        for child in [tree.left[level],tree.right[level]]:
+            o         = (tree.center[child] - tree.center[level])[:,None,:]
+            MO        = M[child][:,:,None]*o
+            Q[level] += Q[child] + D[child][:,:,:,None]*o[:,None,:,:] + D[child][:,:,None,:]*o[:,:,:,None] \
+                        + MO[:,:,:,None]*o[:,None,:,:]
+            D[level] += D[child] + MO
+            M[level] += M[child]
+    W = np.array([D[:,1,2] - D[:,2,1],D[:,2,0] - D[:,0,2],D[:,0,1] - D[:,1,0]]).T
+    q = np.einsum('ijkk->ij',Q)
+
+    # the far clusters, a block of pairs at a time
+    n_pairs = len(interactions.far_nodes)
+    for start in range(0,n_pairs,far_block_pairs):
+        pairs = slice(start,start+far_block_pairs)
+        nodes = interactions.far_nodes[pairs]
+        r     = interactions.far_r[pairs]
+        r_2   = np.sum(r*r,axis=1)
+        i_r3  = (1/(4*np.pi))/(r_2*np.sqrt(r_2))
+        i_r5  = i_r3/r_2
+        Dr    = np.einsum('ijk,ik->ij',D[nodes],r)
+        Qr    = np.einsum('ijkl,il->ijk',Q[nodes],r)
+        Qrr   = np.einsum('ijk,ik->ij',Qr,r)
+        v     = np.array([Qr[:,1,2] - Qr[:,2,1],Qr[:,2,0] - Qr[:,0,2],Qr[:,0,1] - Qr[:,1,0]]).T
+        V_far = (cross(M[nodes],r) - W[nodes])*i_r3[:,None] + (3*cross(Dr,r) - 3*v - 1.5*cross(q[nodes],r))*i_r5[:,None] \
+                + 7.5*cross(Qrr,r)*(i_r5/r_2)[:,None]
+        for axis in range(3):
+            V_IND[:,axis] += np.bincount(interactions.far_points[pairs],V_far[:,axis],minlength=n)
+
+    return V_IND
+
+def cross(a,b):
+    """ The cross products of two arrays of vectors, [n, 3]. """
+
+    c       = np.empty_like(a)
+    c[:,0]  = a[:,1]*b[:,2] - a[:,2]*b[:,1]
+    c[:,1]  = a[:,2]*b[:,0] - a[:,0]*b[:,2]
+    c[:,2]  = a[:,0]*b[:,1] - a[:,1]*b[:,0]
+
+    return c
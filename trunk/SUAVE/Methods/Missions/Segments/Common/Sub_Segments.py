@@ -5,6 +5,7 @@
 # Modified: Jan 2016, E. Botero
 #           Mar 2016, E. Botero
 #           Jul 2017, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -141,7 +142,7 @@ def merge_sub_segment_states(segment):
     """ Merges all of the sub segment states back into the main state
     
         Assumptions:
-        N/A
+        The merged arrays are only updated in place if segment.state.numerics.reuse_merged_state is set
         
         Inputs:
         N/A
@@ -154,7 +155,7 @@ def merge_sub_segment_states(segment):
                                 
     """       
 
-    segment.state.update(segment.merged())
+    segment.state.update(segment.merged(reuse=segment.state.numerics.reuse_merged_state))
 
 # ----------------------------------------------------------------------
 #  Sequential Sub Segments
@@ -5,6 +5,7 @@
 from .converge_root import converge_root
 from .expand_state  import expand_state
 from .optimize      import converge_opt
+from .jacobian      import block_jacobian, colored_jacobian
 
 from . import Common
 from . import Cruise
@@ -3,6 +3,7 @@
 # 
 # Created:  Jul 2014, SUAVE Team
 # Modified: Jan 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -12,6 +13,7 @@ import scipy.optimize
 import numpy as np
 
 from SUAVE.Core.Arrays import array_type
+from .jacobian import block_jacobian, colored_jacobian
 
 # ----------------------------------------------------------------------
 #  Converge Root
@@ -31,10 +33,14 @@ def converge_root(segment):
     segment                            [Data]
     segment.settings.root_finder       [Data]
     state.numerics.tolerance_solution  [Unitless]
+    state.numerics.solver_jacobian     [string] "none", "block" or "colored"
+    state.numerics.warm_start          [Data]
+    state.numerics.freeze_conditions   [boolean]
 
     Outputs:
     state.unknowns                     [Any]
     segment.state.numerics.converged   [Unitless]
+    state.numerics.warm_start.history  [Data]
 
     Properties Used:
     N/A
@@ -46,14 +52,39 @@ def converge_root(segment):
         root_finder = segment.settings.root_finder
     except AttributeError:
         root_finder = scipy.optimize.fsolve 
+        
+    options = dict( args        = segment,
+                    xtol        = segment.state.numerics.tolerance_solution,
+                    maxfev      = segment.state.numerics.max_evaluations,
+                    epsfcn      = segment.state.numerics.step_size,
+                    full_output = 1)
+        
+    # only hand a jacobian to the root finder if one is requested
+    solver_jacobian = segment.state.numerics.solver_jacobian
+    if solver_jacobian == "block":
+        options['fprime'] = block_jacobian
+    elif solver_jacobian == "colored":
+        options['fprime'] = colored_jacobian
+    elif solver_jacobian not in ("none", None):
+        raise ValueError('unknown solver_jacobian "%s"' % solver_jacobian)
+    
+    # start from the last converged solution if there is one
+    guess = warm_start_guess(segment,unknowns)
     
-    unknowns,infodict,ier,msg = root_finder( iterate,
-                                         unknowns,
-                                         args = segment,
-                                         xtol = segment.state.numerics.tolerance_solution,
-                                         maxfev = segment.state.numerics.max_evaluations,
-                                         epsfcn = segment.state.numerics.step_size,
-                                         full_output = 1)
+    try:
+        if guess is None:
+            unknowns,infodict,ier,msg = root_finder( iterate, unknowns, **options)
+        else:
+            unknowns_cold = unknowns
+            unknowns,infodict,ier,msg = root_finder( iterate, guess, **options)
+            
+            # a warm start that fails gets a second chance from the regular initial guess
+            if ier!=1:
+                unknowns,infodict,ier,msg = root_finder( iterate, unknowns_cold, **options)
+    finally:
+        # the conditions go back to regular Data for the rest of the mission, even if the solver raised
+        if segment.state.numerics.freeze_conditions:
+            segment.state.unfreeze()
     
     if ier!=1:
         print("Segment did not converge. Segment Tag: " + segment.tag)
@@ -63,6 +94,7 @@ def converge_root(segment):
     else:
         segment.state.numerics.converged = True
         segment.converged = True
+        store_warm_start(segment,unknowns)
                             
     return
     
@@ -82,11 +114,12 @@ def iterate(unknowns, segment):
     N/A
 
     Inputs:
-    state.unknowns                [Data]
-    segment.process.iterate       [Data]
+    state.unknowns                    [Data]
+    segment.process.iterate           [Data]
+    state.numerics.freeze_conditions  [boolean]
 
     Outputs:
-    residuals                     [Unitless]
+    residuals                         [Unitless]
 
     Properties Used:
     N/A
@@ -98,6 +131,86 @@ def iterate(unknowns, segment):
         
     segment.process.iterate(segment)
     
+    # all the keys of the conditions exist after the first iteration
+    if segment.state.numerics.freeze_conditions:
+        segment.state.freeze()
+    
     residuals = segment.state.residuals.pack_array()
         
-    return residuals 
\ No newline at end of file
+    return residuals 
+
+## @ingroup Methods-Missions-Segments
+def warm_start_guess(segment, unknowns):
+    """Makes an initial guess for the solver from the unknowns of previous converged solves of this segment.
+
+    Assumptions:
+    The last solution is reused as is, or extrapolated linearly from the last two solutions.
+    Solutions with a different number of unknowns are ignored.
+
+    Source:
+    N/A
+
+    Inputs:
+    unknowns                                 [array]
+    state.numerics.warm_start.enabled        [boolean]
+    state.numerics.warm_start.extrapolate    [boolean]
+    state.numerics.warm_start.history        [Data] unknowns by segment tag, one row per solve
+
+    Outputs:
+    guess                                    [array] or None if there is no usable history
+
+    Properties Used:
+    N/A
+    """
+    
+    warm_start = segment.state.numerics.warm_start
+    if not warm_start.enabled:
+        return None
+    
+    history = warm_start.history.get(segment.tag,None)
+    if history is None or np.ndim(history) != 2 or np.shape(history)[1] != np.size(unknowns):
+        return None
+    
+    guess = np.array(history[-1])
+    if warm_start.extrapolate and len(history) > 1:
+        guess = guess + (history[-1] - history[-2])
+        
+    return guess
+
+## @ingroup Methods-Missions-Segments
+def store_warm_start(segment, unknowns):
+    """Keeps the unknowns of a converged solve for the next solve of this segment.
+
+    Assumptions:
+    Only the most recent history_size solutions are kept
+
+    Source:
+    N/A
+
+    Inputs:
+    unknowns                                 [array]
+    state.numerics.warm_start.enabled        [boolean]
+    state.numerics.warm_start.history_size   [int]
+
+    Outputs:
+    state.numerics.warm_start.history        [Data] unknowns by segment tag, one row per solve
+
+    Properties Used:
+    N/A
+    """
+    
+    warm_start = segment.state.numerics.warm_start
+    if not warm_start.enabled:
+        return
+    
+    # kept as an array so the results can still be archived
+    unknowns = np.atleast_2d(np.array(unknowns,dtype=float))
+    history  = warm_start.history.get(segment.tag,None)
+    if history is None or np.shape(history)[1] != unknowns.shape[1]:
+        history = unknowns
+    else:
+        history = np.vstack([history,unknowns])
+    
+    warm_start.history[segment.tag] = history[-max(warm_start.history_size,1):]
+        
+    return
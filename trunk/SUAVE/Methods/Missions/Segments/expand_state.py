@@ -21,6 +21,7 @@ def expand_state(segment):
 
     Inputs:
     state.numerics.number_control_points  [Unitless]
+    state.numerics.contiguous_state       [boolean]
 
     Outputs:
     N/A
@@ -31,7 +32,7 @@ def expand_state(segment):
 
     n_points = segment.state.numerics.number_control_points
     
-    segment.state.expand_rows(n_points)
+    segment.state.expand_rows(n_points,contiguous=segment.state.numerics.contiguous_state)
     
     return
     
\ No newline at end of file
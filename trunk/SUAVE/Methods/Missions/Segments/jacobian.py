@@ -0,0 +1,364 @@
+## @ingroup Methods-Missions-Segments
+# jacobian.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+
+from SUAVE.Core.Arrays import array_type, matrix_type
+
+# ----------------------------------------------------------------------
+#  Block Jacobian
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments
+def block_jacobian(unknowns, segment):
+    """Builds the residual Jacobian of a segment from its control point block structure.
+
+    Every column of a control point unknown (e.g. throttle or body angle) is perturbed at
+    all control points at once, so one residual evaluation fills the whole block diagonal
+    for that column. Unknowns that are not defined per control point (e.g. time or a
+    cruise distance) are perturbed one at a time and fill a dense column.
+
+    Assumptions:
+    The residual at a control point only depends on the unknowns at the same control point.
+    Coupling through the integration and differentiation operators is left to the quasi-Newton
+    updates of the root finder. Residuals that are not defined per control point are only
+    driven by the unknowns that are not defined per control point.
+
+    Source:
+    Curtis, Powell and Reid, "On the estimation of sparse Jacobian matrices", 1974
+
+    Inputs:
+    unknowns                           [array]
+    segment.state.unknowns             [Data]
+    segment.state.residuals            [Data]
+    segment.state.numerics.step_size   [Unitless]
+
+    Outputs:
+    jacobian                           [array]
+
+    Properties Used:
+    N/A
+    """
+
+    unknowns = np.array(unknowns,dtype=float)
+    state    = segment.state
+
+    # the residuals at the point of linearization
+    residuals = evaluate_residuals(unknowns,segment)
+
+    # find which packed entries belong to which control point
+    n_points                    = control_point_rows(state.unknowns)
+    unknown_points, unknown_ids = packed_layout(state.unknowns,n_points)
+    residual_points, _          = packed_layout(state.residuals,n_points)
+
+    local_residuals  = residual_points >= 0
+
+    steps    = step_sizes(unknowns,segment)
+    jacobian = np.zeros((len(residuals),len(unknowns)))
+
+    # one evaluation per column of each control point unknown
+    for group in np.unique(unknown_ids[unknown_ids>=0]):
+        columns  = np.where(unknown_ids==group)[0]
+
+        x_pert           = unknowns.copy()
+        x_pert[columns] += steps[columns]
+        dR               = evaluate_residuals(x_pert,segment) - residuals
+
+        # match each residual to the column at its control point
+        point_to_column = np.full(n_points,-1)
+        point_to_column[unknown_points[columns]] = columns
+        rows = np.where(local_residuals)[0]
+        cols = point_to_column[residual_points[rows]]
+        mask = cols >= 0
+        rows = rows[mask]
+        cols = cols[mask]
+        jacobian[rows,cols] = dR[rows]/steps[cols]
+
+    # one evaluation per global unknown
+    for column in np.where(unknown_ids<0)[0]:
+        x_pert          = unknowns.copy()
+        x_pert[column] += steps[column]
+        jacobian[:,column] = (evaluate_residuals(x_pert,segment) - residuals)/steps[column]
+
+    return jacobian
+
+# ----------------------------------------------------------------------
+#  Colored Jacobian
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments
+def colored_jacobian(unknowns, segment):
+    """Builds the residual Jacobian of a segment with graph colored finite differences.
+
+    The first time a segment is solved every unknown is perturbed on its own to find the
+    sparsity pattern of the Jacobian. The columns are then grouped into colors that share no
+    nonzero rows, and every later Jacobian costs one residual evaluation per color. The pattern
+    and colors are kept in the segment numerics, so a mission that is evaluated again (e.g. in a
+    sizing loop) reuses them as long as the unknowns and residuals keep their layout.
+
+    Assumptions:
+    Entries smaller than the sparsity tolerance times the largest entry in their row are not
+    part of the pattern. They are left to the quasi-Newton updates of the root finder.
+
+    Source:
+    Curtis, Powell and Reid, "On the estimation of sparse Jacobian matrices", 1974
+    Coleman and More, "Estimation of sparse Jacobian matrices and graph coloring problems", 1983
+
+    Inputs:
+    unknowns                                    [array]
+    segment.state.numerics.sparsity_tolerance   [Unitless]
+    segment.state.numerics.step_size            [Unitless]
+    segment.state.numerics.jacobian_pattern     [Data]
+
+    Outputs:
+    jacobian                                    [array]
+    segment.state.numerics.jacobian_pattern     [Data]
+
+    Properties Used:
+    N/A
+    """
+
+    unknowns = np.array(unknowns,dtype=float)
+    numerics = segment.state.numerics
+    cache    = numerics.jacobian_pattern
+
+    # the residuals at the point of linearization
+    residuals = evaluate_residuals(unknowns,segment)
+    steps     = step_sizes(unknowns,segment)
+    shape     = (len(residuals),len(unknowns))
+
+    # detect the pattern once, the full jacobian is the first estimate
+    if cache.pattern is None or cache.pattern.shape != shape:
+        jacobian = np.zeros(shape)
+        for column in range(len(unknowns)):
+            x_pert          = unknowns.copy()
+            x_pert[column] += steps[column]
+            jacobian[:,column] = (evaluate_residuals(x_pert,segment) - residuals)/steps[column]
+
+        row_max       = np.max(np.abs(jacobian),axis=1,keepdims=True)
+        cache.pattern = np.abs(jacobian) > numerics.sparsity_tolerance*row_max
+        cache.colors  = color_columns(cache.pattern)
+
+        return jacobian
+
+    # one evaluation per color
+    pattern  = cache.pattern
+    colors   = cache.colors
+    jacobian = np.zeros(shape)
+    for color in range(np.max(colors)+1):
+        columns = np.where(colors==color)[0]
+
+        x_pert           = unknowns.copy()
+        x_pert[columns] += steps[columns]
+        dR               = evaluate_residuals(x_pert,segment) - residuals
+
+        # no two columns of a color share a row
+        for column in columns:
+            rows = pattern[:,column]
+            jacobian[rows,column] = dR[rows]/steps[column]
+
+    return jacobian
+
+## @ingroup Methods-Missions-Segments
+def color_columns(pattern):
+    """Groups the columns of a sparsity pattern so that no two columns in a group share a nonzero row.
+
+    Assumptions:
+    Greedy coloring of the column intersection graph, largest degree first
+
+    Source:
+    Coleman and More, "Estimation of sparse Jacobian matrices and graph coloring problems", 1983
+
+    Inputs:
+    pattern    [array] boolean, residuals by unknowns
+
+    Outputs:
+    colors     [array] color of each column
+
+    Properties Used:
+    N/A
+    """
+
+    pattern   = np.asarray(pattern,dtype=bool)
+    n_columns = pattern.shape[1]
+
+    # two columns are adjacent if they share a nonzero row
+    P         = pattern.astype(float)
+    adjacency = np.dot(P.T,P) > 0.
+    np.fill_diagonal(adjacency,False)
+
+    order  = np.argsort(-np.sum(adjacency,axis=0),kind='stable')
+    colors = -np.ones(n_columns,dtype=int)
+    for column in order:
+        used  = set(colors[adjacency[column]])
+        color = 0
+        while color in used:
+            color += 1
+        colors[column] = color
+
+    return colors
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments
+def evaluate_residuals(unknowns, segment):
+    """Runs one iteration of all analyses for the mission and returns a copy of the residuals.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    unknowns                      [array]
+    segment.process.iterate       [Data]
+
+    Outputs:
+    residuals                     [array]
+
+    Properties Used:
+    N/A
+    """
+
+    segment.state.unknowns.unpack_array(unknowns)
+    segment.process.iterate(segment)
+
+    return np.array(segment.state.residuals.pack_array(),dtype=float)
+
+## @ingroup Methods-Missions-Segments
+def step_sizes(unknowns, segment):
+    """Finite difference steps, chosen the same way as the MINPACK forward differences in fsolve.
+
+    Assumptions:
+    N/A
+
+    Source:
+    More, Garbow and Hillstrom, "User Guide for MINPACK-1", 1980
+
+    Inputs:
+    unknowns                           [array]
+    segment.state.numerics.step_size   [Unitless]
+
+    Outputs:
+    steps                              [array]
+
+    Properties Used:
+    N/A
+    """
+
+    epsfcn = segment.state.numerics.step_size
+    if epsfcn is None:
+        epsfcn = 0.
+    eps   = np.sqrt(max(epsfcn,np.finfo(float).eps))
+    steps = eps*np.abs(unknowns)
+    steps[steps==0.] = eps
+
+    return steps
+
+## @ingroup Methods-Missions-Segments
+def control_point_rows(data):
+    """Finds the number of rows of the control point arrays in a packable data structure.
+
+    Assumptions:
+    The control point arrays are the two dimensional arrays with the most rows
+
+    Source:
+    N/A
+
+    Inputs:
+    data      [Data]
+
+    Outputs:
+    n_rows    [int]
+
+    Properties Used:
+    N/A
+    """
+
+    rows = [0]
+
+    def do_search(D):
+        for v in D.values():
+            if isinstance(v,dict):
+                do_search(v)
+            elif isinstance(v,(array_type,matrix_type)) and v.ndim == 2:
+                rows.append(v.shape[0])
+
+    do_search(data)
+
+    return max(rows)
+
+## @ingroup Methods-Missions-Segments
+def packed_layout(data, n_rows):
+    """Labels every entry of data.pack_array() with its control point and array column.
+
+    Assumptions:
+    Follows the packing order and type rules of Data.pack_array. Only two dimensional arrays
+    with n_rows rows are treated as control point arrays.
+
+    Source:
+    N/A
+
+    Inputs:
+    data      [Data]
+    n_rows    [int]
+
+    Outputs:
+    points    [array] control point of each entry, -1 if not a control point array
+    ids       [array] unique id of the array column of each entry, -1 if not a control point array
+
+    Properties Used:
+    N/A
+    """
+
+    points = []
+    ids    = []
+    count  = [0]
+
+    valid_types = ( int, float,
+                    array_type,
+                    matrix_type )
+
+    def do_layout(D):
+        for v in D.values():
+            try:
+                rank = v.ndim
+            except:
+                rank = 0
+
+            if isinstance(v,dict):
+                do_layout(v)
+                continue
+            elif not isinstance(v,valid_types): continue
+            elif rank > 2: continue
+
+            size = int(np.size(v))
+            if rank == 2 and v.shape[0] == n_rows:
+                # column major, the same as pack_array
+                n_cols = v.shape[1]
+                points.append(np.tile(np.arange(n_rows),n_cols))
+                ids.append(np.repeat(np.arange(n_cols),n_rows) + count[0])
+                count[0] += n_cols
+            else:
+                points.append(-np.ones(size,dtype=int))
+                ids.append(-np.ones(size,dtype=int))
+
+    do_layout(data)
+
+    if points:
+        points = np.hstack(points).astype(int)
+        ids    = np.hstack(ids).astype(int)
+    else:
+        points = np.array([],dtype=int)
+        ids    = np.array([],dtype=int)
+
+    return points, ids
@@ -3,6 +3,7 @@
 # 
 # Created:  Jun 2015, Carlos Ilario
 # Modified: Jan 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -12,20 +13,17 @@
 from SUAVE.Core            import Data
 from SUAVE.Core            import Units
 
-from .noise_clean_wing import noise_clean_wing
-from .noise_landing_gear import noise_landing_gear
-from .noise_leading_edge_slat import noise_leading_edge_slat
-from .noise_trailing_edge_flap import noise_trailing_edge_flap
+from .noise_airframe_Fink_spectra import noise_airframe_Fink_spectra
 
 from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import pnl_noise
 from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import noise_tone_correction
 from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import epnl_noise
-from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import atmospheric_attenuation
 from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import dbA_noise
 from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import noise_geometric
 
 from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import noise_counterplot
 from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import senel_noise
+from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import print_airframe_output
 
 import numpy as np
 
@@ -86,27 +84,6 @@ def noise_airframe_Fink(config, analyses, noise_segment,ioprint = 0, filename=0)
     # ==============================================
         # Unpack
     # ==============================================
-    wing     = config.wings
-    flap     = wing.main_wing.control_surfaces.flap
-    
-    Sw       = wing.main_wing.areas.reference  / (Units.ft)**2              #wing area, sq.ft
-    bw       = wing.main_wing.spans.projected / Units.ft                    #wing span, ft
-    Sht      = wing.horizontal_stabilizer.areas.reference / (Units.ft)**2   #horizontal tail area, sq.ft
-    bht      = wing.horizontal_stabilizer.spans.projected / Units.ft        #horizontal tail span, ft
-    Svt      = wing.vertical_stabilizer.areas.reference / (Units.ft)**2     #vertical tail area, sq.ft
-    bvt      = wing.vertical_stabilizer.spans.projected  / Units.ft         #vertical tail span, ft
-    deltaf   = flap.deflection                                              #flap delection, rad
-    Sf       = flap.area  / (Units.ft)**2                                   #flap area, sq.ft        
-    cf       = flap.chord_dimensional  / Units.ft                           #flap chord, ft
-    Dp       = config.landing_gear.main_tire_diameter  / Units.ft           #MLG tyre diameter, ft
-    Hp       = config.landing_gear.nose_tire_diameter  / Units.ft           #MLG strut length, ft
-    Dn       = config.landing_gear.main_strut_length   / Units.ft           #NLG tyre diameter, ft
-    Hn       = config.landing_gear.nose_strut_length   / Units.ft           #NLG strut length, ft
-    gear     = config.landing_gear.gear_condition                           #Gear up or gear down
-    
-    nose_wheels    =   config.landing_gear.nose_wheels                           #Number of wheels   
-    main_wheels    =   config.landing_gear.main_wheels                           #Number of wheels   
-    main_units     =   config.landing_gear.main_units                            #Number of main units   
     velocity       =   np.float(noise_segment.conditions.freestream.velocity[0,0]) #aircraft velocity 
     altitude       =   noise_segment.conditions.freestream.altitude[:,0]           #aircraft altitude
     time           =   noise_segment.conditions.frames.inertial.time[:,0]          #time discretization
@@ -114,14 +91,6 @@ def noise_airframe_Fink(config, analyses, noise_segment,ioprint = 0, filename=0)
     noise_time = np.arange(0.,time[-1],.5)  
     altitude = np.interp(noise_time,time,altitude)
 
-    # determining flap slot number
-    if wing.main_wing.control_surfaces.flap.configuration_type   == 'single_slotted':
-        slots = 1
-    elif wing.main_wing.control_surfaces.flap.configuration_type == 'double_slotted':
-        slots = 2
-    elif wing.main_wing.control_surfaces.flap.configuration_type == 'triple_slotted':
-        slots = 3  
-
     # Geometric information from the source to observer position
     distance_vector = noise_segment.dist    
     angle = noise_segment.theta 
@@ -130,115 +99,22 @@ def noise_airframe_Fink(config, analyses, noise_segment,ioprint = 0, filename=0)
     distance_vector = np.interp(noise_time,time,distance_vector)
     angle = np.interp(noise_time,time,angle)
     phi   = np.interp(noise_time,time,phi)
-        
-    # Number of points on the discretize segment   
-    nsteps=len(noise_time)
-    
-    # Preparing matrix for noise calculation
-    sound_speed = np.zeros(nsteps)
-    density     = np.zeros(nsteps)
-    viscosity   = np.zeros(nsteps)
-    temperature = np.zeros(nsteps)
-    M           = np.zeros(nsteps)
-    deltaw      = np.zeros(nsteps)
-    
-    # ==============================================
-    #         Computing atmospheric conditions
-    # ==============================================
-    
-    for id in range (0,nsteps):
-        atmo_data = analyses.atmosphere.compute_values(altitude[id])
-        
-        #unpack    
-        sound_speed[id] =    np.float(atmo_data.speed_of_sound)
-        density[id]     =    np.float(atmo_data.density)
-        viscosity[id]   =    np.float(atmo_data.dynamic_viscosity*10.7639) #units converstion - m2 to ft2
-        temperature[id] =    np.float(atmo_data.temperature)
-        
-        #Mach number
-        M[id] = velocity/np.sqrt(1.4*287*temperature[id])
-    
-        #Wing Turbulent Boundary Layer thickness, ft
-        deltaw[id] = 0.37*(Sw/bw)*((velocity/Units.ft)*Sw/(bw*viscosity[id]))**(-0.2)
-    
-
-    #Units conversion - knots to ft/s
-    kt2fts = 1.6878098571 
-
-    #Generate array with the One Third Octave Band Center Frequencies
-    frequency = np.array((50, 63, 80, 100, 125, 160, 200, 250, 315, 400, 500, 630, 800, 1000, 1250, 1600, \
-            2000, 2500, 3150, 4000, 5000, 6300, 8000, 10000))
-
-
-    # Velocity in fts
-    velocity_fst = velocity * Units.knot
-    
-    #number of positions of the aircraft to calculate the noise
-    nrange = len(angle) 
-    i=0
-    SPL_wing_history = np.zeros((nrange,24))
-    SPLht_history    = np.zeros((nrange,24))
-    SPLvt_history    = np.zeros((nrange,24))
-    SPL_flap_history = np.zeros((nrange,24))
-    SPL_slat_history = np.zeros((nrange,24))
-    SPL_main_landing_gear_history = np.zeros((nrange,24))
-    SPL_nose_landing_gear_history = np.zeros((nrange,24))
-    SPL_total_history = np.zeros((nrange,24))
-    
-    #Noise history in dBA
-    SPLt_dBA_history = np.zeros((nrange,24))  
-    SPLt_dBA_max = np.zeros(nrange)    
     
-    #START LOOP FOR EACH POSITION OF AIRCRAFT   
-    for i in range(0,nrange-1):
-        #Emission angle theta   
-        theta = angle[i] 
-        #Distance from airplane to observer, evaluated at retarded time
-        distance = distance_vector[i]    
-       
-         #Atmospheric attenuation
-        delta_atmo=atmospheric_attenuation(distance)
-
-        #Call each noise source model
-        SPL_wing = noise_clean_wing(Sw,bw,0,1,deltaw[i],velocity,viscosity[i],M[i],phi[i],theta,distance,frequency) - delta_atmo    #Wing Noise
-        SPLht    = noise_clean_wing(Sht,bht,0,1,deltaw[i],velocity,viscosity[i],M[i],phi[i],theta,distance,frequency)  -delta_atmo    #Horizontal Tail Noise
-        SPLvt    = noise_clean_wing(Svt,bvt,0,0,deltaw[i],velocity,viscosity[i],M[i],phi[i],theta,distance,frequency)  -delta_atmo    #Vertical Tail Noise
- 
-        SPL_slat = noise_leading_edge_slat(SPL_wing,Sw,bw,velocity,deltaw[i],viscosity[i],M[i],phi[i],theta,distance,frequency) -delta_atmo        #Slat leading edge
- 
-        if (deltaf==0):
-            SPL_flap = np.zeros(24)
-        else:
-            SPL_flap = noise_trailing_edge_flap(Sf,cf,deltaf,slots,velocity,M[i],phi[i],theta,distance,frequency) - delta_atmo #Trailing Edge Flaps Noise
- 
-        if gear=='up': #0
-            SPL_main_landing_gear = np.zeros(24)
-            SPL_nose_landing_gear = np.zeros(24)
-        else:
-            SPL_main_landing_gear = noise_landing_gear(Dp,Hp,main_wheels,M[i],velocity,phi[i],theta,distance,frequency)  - delta_atmo     #Main Landing Gear Noise
-            SPL_nose_landing_gear = noise_landing_gear(Dn,Hn,nose_wheels,M[i],velocity,phi[i],theta,distance,frequency)  - delta_atmo     #Nose Landing Gear Noise
-        if main_units>1: #Incoherent summation of each main landing gear unit
-            SPL_main_landing_gear = SPL_main_landing_gear+3*(main_units-1)
- 
- 
-         #Total Airframe Noise
-        SPL_total = 10.*np.log10(10.0**(0.1*SPL_wing)+10.0**(0.1*SPLht)+10**(0.1*SPL_flap)+ \
-             10.0**(0.1*SPL_slat)+10.0**(0.1*SPL_main_landing_gear)+10.0**(0.1*SPL_nose_landing_gear))
-            
-        SPL_total_history[i][:] = SPL_total[:]
-        SPL_wing_history[i][:]  = SPL_wing[:]
-        SPLvt_history[i][:]     = SPLvt[:]
-        SPLht_history[i][:]     = SPLht[:]
-        SPL_flap_history[i][:]  = SPL_flap[:]
-        SPL_slat_history[i][:]  = SPL_slat[:]
-        SPL_nose_landing_gear_history[i][:] = SPL_nose_landing_gear[:]
-        SPL_main_landing_gear_history[i][:] = SPL_main_landing_gear[:]
+    #Call each noise source model
+    spectra = noise_airframe_Fink_spectra(config,analyses,velocity,altitude,distance_vector,angle,phi)
+    
+    SPL_wing_history              = spectra.SPL_wing_history
+    SPLht_history                 = spectra.SPLht_history
+    SPLvt_history                 = spectra.SPLvt_history
+    SPL_flap_history              = spectra.SPL_flap_history
+    SPL_slat_history              = spectra.SPL_slat_history
+    SPL_main_landing_gear_history = spectra.SPL_main_landing_gear_history
+    SPL_nose_landing_gear_history = spectra.SPL_nose_landing_gear_history
+    SPL_total_history             = spectra.SPL_total_history
         
-        
-        #Calculation of dBA based on the sound pressure time history
-        SPLt_dBA = dbA_noise(SPL_total)
-        SPLt_dBA_history[i][:] = SPLt_dBA[:]
-        SPLt_dBA_max[i] = max(SPLt_dBA)        
+    #Calculation of dBA based on the sound pressure time history
+    SPLt_dBA_history = dbA_noise(SPL_total_history)
+    SPLt_dBA_max     = np.max(SPLt_dBA_history,axis=1)
        
        
    #Calculation of dBA based on the sound pressure time history
@@ -289,86 +165,42 @@ def noise_airframe_Fink(config, analyses, noise_segment,ioprint = 0, filename=0)
     SENEL_total = senel_noise(SPLt_dBA_max)
     
     if ioprint:
-        # write header of file
+        # Pack the results and print them
         if not filename:            
             filename = ('Noise_' + str(config.tag) + '.dat')
-            
-        fid = open(filename,'w')   # Open output file    
-        
-        fid.write('Reference speed =  ')
-        fid.write(str('%2.2f' % (velocity/Units.kts))+'  kts')
-        fid.write('\n')
-        fid.write('PNLT history')
-        fid.write('\n')
-        fid.write('time       altitude      Mach    Polar_angle    Azim_angle   distance        wing  	   ht 	        vt 	   flap   	 slat         nose        main         total         dBA')
-        fid.write('\n')
-        
-        for id in range (0,nsteps):
-            fid.write(str('%2.2f' % time[id])+'        ')
-            fid.write(str('%2.2f' % altitude[id])+'        ')
-            fid.write(str('%2.2f' % M[id])+'        ')
-            fid.write(str('%2.2f' % (angle[id]*180/np.pi))+'        ')
-            fid.write(str('%2.2f' % (phi[id]*180/np.pi))+'        ')
-            fid.write(str('%2.2f' % distance_vector[id])+'        ')
-            fid.write(str('%2.2f' % PNLT_wing[id])+'        ')
-            fid.write(str('%2.2f' % PNLT_ht[id])+'        ')
-            fid.write(str('%2.2f' % PNLT_vt[id])+'        ')
-            fid.write(str('%2.2f' % PNLT_flap[id])+'        ')
-            fid.write(str('%2.2f' % PNLT_slat[id])+'        ')
-            fid.write(str('%2.2f' % PNLT_nose_landing_gear[id])+'        ')
-            fid.write(str('%2.2f' % PNLT_main_landing_gear[id])+'        ')
-            fid.write(str('%2.2f' % PNLT_total[id])+'        ')
-            fid.write(str('%2.2f' % SPLt_dBA_max[id])+'        ')
-            fid.write('\n')
-        fid.write('\n')
-        fid.write('PNLT max =  ')
-        fid.write(str('%2.2f' % (np.max(PNLT_total)))+'  dB')
-        fid.write('\n')
-        fid.write('dBA max =  ')
-        fid.write(str('%2.2f' % (np.max(SPLt_dBA_max)))+'  dBA')        
-        fid.write('\n')
-        fid.write('\n')
-        fid.write('EPNdB')
-        fid.write('\n')
-        fid.write('wing	       ht          vt         flap         slat    	nose        main	total')
-        fid.write('\n')
-        fid.write(str('%2.2f' % EPNL_wing)+'        ')
-        fid.write(str('%2.2f' % EPNL_ht)+'        ')
-        fid.write(str('%2.2f' % EPNL_vt)+'        ')
-        fid.write(str('%2.2f' % EPNL_flap)+'        ')
-        fid.write(str('%2.2f' % EPNL_slat)+'        ')
-        fid.write(str('%2.2f' % EPNL_nose_landing_gear)+'        ')
-        fid.write(str('%2.2f' % EPNL_main_landing_gear)+'        ')
-        fid.write(str('%2.2f' % EPNL_total)+'        ')
-        fid.write('\n')
-        fid.write('SENEL = ')
-        fid.write(str('%2.2f' % SENEL_total)+'        ')       
-        fid.close 
-        
-        
-    
-        filename1 = ('History_Noise_' + str(config.tag) + '.dat')
-        fid = open(filename1,'w')   # Open output file
-        fid.write('Reference speed =  ')
-        fid.write(str('%2.2f' % (velocity/Units.kts))+'  kts')
-        fid.write('\n')
-        fid.write('Sound Pressure Level for the Total Aircraft Noise')
-        fid.write('\n')
-        
-        for nid in range (0,nrange):
-            fid.write('Polar angle = ' + str('%2.2f' % (angle[nid]*(180/np.pi))) + '  degrees' + '\n')
-            fid.write('f		total SPL(dB)    total SPL(dBA)' + '\n')
-            for id in range(0,24):
-                fid.write(str((frequency[id])) + '           ')
-                fid.write(str('%3.2f' % SPL_total_history[nid][id]) + '          ')
-                fid.write(str('%3.2f' % SPLt_dBA_history[nid][id]))
-                fid.write('\n')
-            fid.write('SPLmax (dB) =  ')
-            fid.write(str('%3.2f' % (np.max(SPL_total_history[nid][:])))+'  dB' + '\n')
-            fid.write('SPLmax (dBA) =  ')
-            fid.write(str('%3.2f' % (np.max(SPLt_dBA_history[nid][:])))+'  dB')
-            fid.write('\n')
-    
-        fid.close
+
+        Fink_Airframe_Noise_Outputs = Data(
+            filename                      = filename,
+            history_filename              = 'History_Noise_' + str(config.tag) + '.dat',
+            EPNL_total                    = EPNL_total,
+            EPNL_wing                     = EPNL_wing,
+            EPNL_ht                       = EPNL_ht,
+            EPNL_vt                       = EPNL_vt,
+            EPNL_flap                     = EPNL_flap,
+            EPNL_slat                     = EPNL_slat,
+            EPNL_nose_landing_gear        = EPNL_nose_landing_gear,
+            EPNL_main_landing_gear        = EPNL_main_landing_gear,
+            SENEL_total                   = SENEL_total,
+            PNLT_total                    = PNLT_total,
+            PNLT_wing                     = PNLT_wing,
+            PNLT_ht                       = PNLT_ht,
+            PNLT_vt                       = PNLT_vt,
+            PNLT_flap                     = PNLT_flap,
+            PNLT_slat                     = PNLT_slat,
+            PNLT_nose_landing_gear        = PNLT_nose_landing_gear,
+            PNLT_main_landing_gear        = PNLT_main_landing_gear,
+            SPLt_dBA_max                  = SPLt_dBA_max,
+            SPL_total_history             = SPL_total_history,
+            SPLt_dBA_history              = SPLt_dBA_history,
+            frequency                     = spectra.frequency,
+            time                          = noise_time,
+            altitude                      = altitude,
+            mach                          = spectra.mach,
+            velocity                      = velocity,
+            angle                         = angle,
+            phi                           = phi,
+            distance_vector               = distance_vector)
+
+        print_airframe_output(Fink_Airframe_Noise_Outputs)
     
     return (EPNL_total,SPL_total_history,SENEL_total)
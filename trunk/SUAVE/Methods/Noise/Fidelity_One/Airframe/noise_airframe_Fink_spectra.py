@@ -0,0 +1,165 @@
+## @ingroupMethods-Noise-Fidelity_One-Airframe
+# noise_airframe_Fink_spectra.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+# SUAVE Imports
+from SUAVE.Core            import Data
+from SUAVE.Core            import Units
+
+from .noise_clean_wing import noise_clean_wing
+from .noise_landing_gear import noise_landing_gear
+from .noise_leading_edge_slat import noise_leading_edge_slat
+from .noise_trailing_edge_flap import noise_trailing_edge_flap
+
+from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import atmospheric_attenuation
+
+import numpy as np
+
+# ----------------------------------------------------------------------
+#  Noise Airframe Fink Spectra
+# ----------------------------------------------------------------------
+
+## @ingroupMethods-Noise-Fidelity_One-Airframe
+def noise_airframe_Fink_spectra(config,analyses,velocity,altitude,distance_vector,angle,phi):
+
+    """ SUAVE.Methods.Noise.Fidelity_One.Airframe.noise_airframe_Fink_spectra(config,analyses,velocity,altitude,distance_vector,angle,phi):
+            Computes the 1/3 octave band SPL of the airframe components at every time step of a flight path, for one
+            microphone or for many at once. It holds the airframe noise model of noise_airframe_Fink.
+
+            Inputs:
+                config                          - SUAVE type vehicle, with the fields used by noise_airframe_Fink
+                analyses                        - analyses holding the atmosphere
+                velocity                        - aircraft velocity [m/s], one for all or one per time step
+                altitude                        - aircraft altitude [m], one per time step
+                distance_vector                 - distance from the source location to observer [m], [nsteps] or [..., nsteps]
+                angle                           - polar angle from the source to the observer [rad], same shape as distance_vector
+                phi                             - azimuthal angle from the source to the observer [rad], same shape as distance_vector
+
+            Outputs: One Third Octave Band SPL [dB], with the frequency bands along the last axis
+                SPL_wing_history                 - Sound Pressure Level of the clean wing
+                SPLht_history                    - Sound Pressure Level of the horizontal tail
+                SPLvt_history                    - Sound Pressure Level of the vertical tail
+                SPL_flap_history                 - Sound Pressure Level of the flaps trailing edge
+                SPL_slat_history                 - Sound Pressure Level of the slat leading edge
+                SPL_main_landing_gear_history    - Sound Pressure Level og the main landing gear
+                SPL_nose_landing_gear_history    - Sound Pressure Level of the nose landing gear
+                SPL_total_history                - Sound Pressure Level of the whole airframe
+                frequency                        - 1/3 octave band center frequencies [Hz]
+                mach                             - aircraft Mach number at every time step
+
+            Assumptions:
+                Correlation based. The flight conditions only vary along the time steps, the microphones share them."""
+
+
+    # ==============================================
+        # Unpack
+    # ==============================================
+    wing     = config.wings
+    flap     = wing.main_wing.control_surfaces.flap
+
+    Sw       = wing.main_wing.areas.reference  / (Units.ft)**2              #wing area, sq.ft
+    bw       = wing.main_wing.spans.projected / Units.ft                    #wing span, ft
+    Sht      = wing.horizontal_stabilizer.areas.reference / (Units.ft)**2   #horizontal tail area, sq.ft
+    bht      = wing.horizontal_stabilizer.spans.projected / Units.ft        #horizontal tail span, ft
+    Svt      = wing.vertical_stabilizer.areas.reference / (Units.ft)**2     #vertical tail area, sq.ft
+    bvt      = wing.vertical_stabilizer.spans.projected  / Units.ft         #vertical tail span, ft
+    deltaf   = flap.deflection                                              #flap delection, rad
+    Sf       = flap.area  / (Units.ft)**2                                   #flap area, sq.ft
+    cf       = flap.chord_dimensional  / Units.ft                           #flap chord, ft
+    Dp       = config.landing_gear.main_tire_diameter  / Units.ft           #MLG tyre diameter, ft
+    Hp       = config.landing_gear.nose_tire_diameter  / Units.ft           #MLG strut length, ft
+    Dn       = config.landing_gear.main_strut_length   / Units.ft           #NLG tyre diameter, ft
+    Hn       = config.landing_gear.nose_strut_length   / Units.ft           #NLG strut length, ft
+    gear     = config.landing_gear.gear_condition                           #Gear up or gear down
+
+    nose_wheels    =   config.landing_gear.nose_wheels                           #Number of wheels
+    main_wheels    =   config.landing_gear.main_wheels                           #Number of wheels
+    main_units     =   config.landing_gear.main_units                            #Number of main units
+
+    # determining flap slot number
+    if wing.main_wing.control_surfaces.flap.configuration_type   == 'single_slotted':
+        slots = 1
+    elif wing.main_wing.control_surfaces.flap.configuration_type == 'double_slotted':
+        slots = 2
+    elif wing.main_wing.control_surfaces.flap.configuration_type == 'triple_slotted':
+        slots = 3
+
+    # ==============================================
+    #         Computing atmospheric conditions
+    # ==============================================
+
+    atmo_data = analyses.atmosphere.compute_values(altitude)
+
+    #unpack
+    sound_speed =    atmo_data.speed_of_sound
+    density     =    atmo_data.density
+    viscosity   =    atmo_data.dynamic_viscosity*10.7639 #units converstion - m2 to ft2
+    temperature =    atmo_data.temperature
+
+    #The time steps along the first axis
+    velocity = np.atleast_1d(velocity)[:,None]
+
+    #Mach number
+    M = velocity/np.sqrt(1.4*287*temperature)
+
+    #Wing Turbulent Boundary Layer thickness, ft
+    deltaw = 0.37*(Sw/bw)*((velocity/Units.ft)*Sw/(bw*viscosity))**(-0.2)
+
+    #Generate array with the One Third Octave Band Center Frequencies
+    frequency = np.array((50, 63, 80, 100, 125, 160, 200, 250, 315, 400, 500, 630, 800, 1000, 1250, 1600, \
+            2000, 2500, 3150, 4000, 5000, 6300, 8000, 10000))
+
+    #All the positions of the aircraft along the axis before the frequency bands, after any microphone axes
+    #Emission angle theta
+    theta    = np.asarray(angle)[...,None]
+    #Distance from airplane to observer, evaluated at retarded time
+    distance = np.asarray(distance_vector)[...,None]
+    azimuth  = np.asarray(phi)[...,None]
+
+     #Atmospheric attenuation
+    delta_atmo=atmospheric_attenuation(distance)
+
+    #Call each noise source model
+    SPL_wing_history = noise_clean_wing(Sw,bw,0,1,deltaw,velocity,viscosity,M,azimuth,theta,distance,frequency) - delta_atmo    #Wing Noise
+    SPLht_history    = noise_clean_wing(Sht,bht,0,1,deltaw,velocity,viscosity,M,azimuth,theta,distance,frequency)  -delta_atmo    #Horizontal Tail Noise
+    SPLvt_history    = noise_clean_wing(Svt,bvt,0,0,deltaw,velocity,viscosity,M,azimuth,theta,distance,frequency)  -delta_atmo    #Vertical Tail Noise
+
+    SPL_slat_history = noise_leading_edge_slat(SPL_wing_history,Sw,bw,velocity,deltaw,viscosity,M,azimuth,theta,distance,frequency) -delta_atmo        #Slat leading edge
+
+    if (deltaf==0):
+        SPL_flap_history = np.zeros_like(SPL_wing_history)
+    else:
+        SPL_flap_history = noise_trailing_edge_flap(Sf,cf,deltaf,slots,velocity,M,azimuth,theta,distance,frequency) - delta_atmo #Trailing Edge Flaps Noise
+
+    if gear=='up': #0
+        SPL_main_landing_gear_history = np.zeros_like(SPL_wing_history)
+        SPL_nose_landing_gear_history = np.zeros_like(SPL_wing_history)
+    else:
+        SPL_main_landing_gear_history = noise_landing_gear(Dp,Hp,main_wheels,M,velocity,azimuth,theta,distance,frequency)  - delta_atmo     #Main Landing Gear Noise
+        SPL_nose_landing_gear_history = noise_landing_gear(Dn,Hn,nose_wheels,M,velocity,azimuth,theta,distance,frequency)  - delta_atmo     #Nose Landing Gear Noise
+    if main_units>1: #Incoherent summation of each main landing gear unit
+        SPL_main_landing_gear_history = SPL_main_landing_gear_history+3*(main_units-1)
+
+
+     #Total Airframe Noise
+    SPL_total_history = 10.*np.log10(10.0**(0.1*SPL_wing_history)+10.0**(0.1*SPLht_history)+10**(0.1*SPL_flap_history)+ \
+         10.0**(0.1*SPL_slat_history)+10.0**(0.1*SPL_main_landing_gear_history)+10.0**(0.1*SPL_nose_landing_gear_history))
+
+    Fink_Airframe_Noise_Spectra = Data(
+        SPL_wing_history              = SPL_wing_history,
+        SPLht_history                 = SPLht_history,
+        SPLvt_history                 = SPLvt_history,
+        SPL_flap_history              = SPL_flap_history,
+        SPL_slat_history              = SPL_slat_history,
+        SPL_main_landing_gear_history = SPL_main_landing_gear_history,
+        SPL_nose_landing_gear_history = SPL_nose_landing_gear_history,
+        SPL_total_history             = SPL_total_history,
+        frequency                     = frequency,
+        mach                          = M[:,0])
+
+    return Fink_Airframe_Noise_Spectra
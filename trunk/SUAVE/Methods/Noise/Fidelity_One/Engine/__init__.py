@@ -2,4 +2,5 @@
 # Fidelity One level noise calculations for the engine
 # @ingroup Methods-Noise-Fidelity_One
 
-from .noise_SAE import noise_SAE
\ No newline at end of file
+from .noise_SAE import noise_SAE
+from .noise_SAE_spectra import noise_SAE_spectra
\ No newline at end of file
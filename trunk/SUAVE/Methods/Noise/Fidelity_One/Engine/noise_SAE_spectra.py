@@ -0,0 +1,286 @@
+## @ingroupMethods-Noise-Fidelity_One-Engine
+# noise_SAE_spectra.py
+# 
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------        
+#   Imports
+# ----------------------------------------------------------------------    
+
+import numpy as np
+from SUAVE.Core            import Data
+
+from .angle_of_attack_effect import angle_of_attack_effect
+from .external_plug_effect import external_plug_effect
+from .ground_proximity_effect import ground_proximity_effect
+from .jet_installation_effect import jet_installation_effect
+from .mixed_noise_component import mixed_noise_component
+from .noise_source_location import noise_source_location
+from .primary_noise_component import primary_noise_component
+from .secondary_noise_component import secondary_noise_component
+
+from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import atmospheric_attenuation
+
+# ----------------------------------------------------------------------        
+#   Noise SAE Spectra
+# ----------------------------------------------------------------------    
+
+## @ingroupMethods-Noise-Fidelity_One-Engine
+def noise_SAE_spectra(turbofan,analyses,Temperature_primary,Pressure_primary,Temperature_secondary,Pressure_secondary, \
+                      Velocity_aircraft,Altitude,AOA,distance_microphone,angles):
+
+    #SAE ARP*876D 1994
+    """This method predicts the 1/3 Octave Band SPL of the jet components of a turbofan at every time
+    step of a flight path, for one microphone or for many at once. It holds the jet noise model of noise_SAE.
+
+        Inputs:
+                    turbofan                   - SUAVE type turbofan, with the noise fields used by noise_SAE
+                    analyses                   - analyses holding the atmosphere
+                    Temperature_primary        - Primary jet stagnation temperature [K], one per time step
+                    Pressure_primary           - Primary jet stagnation pressure [Pa], one per time step
+                    Temperature_secondary      - Secondary jet stagnation temperature [K], one per time step
+                    Pressure_secondary         - Secondary jet stagnation pressure [Pa], one per time step
+                    Velocity_aircraft          - Aircraft velocity [m/s], one for all or one per time step
+                    Altitude                   - Altitude [m], one per time step
+                    AOA                        - Angle of attack [deg], one for all or one per time step
+                    distance_microphone        - Distance from the nozzle exhaust to the microphones [m], [nsteps] or [..., nsteps]
+                    angles                     - Polar angles of the microphones [rad], same shape as distance_microphone
+
+        Outputs: One Third Octave Band SPL [dB], with the frequency bands along the last axis
+                    SPL_primary_history        - Sound Pressure Level of the primary jet
+                    SPL_secondary_history      - Sound Pressure Level of the secondary jet
+                    SPL_mixed_history          - Sound Pressure Level of the mixed jet
+                    SPL_total_history          - Sound Pressure Level of the total jet noise
+                    frequency                  - 1/3 octave band center frequencies [Hz]
+                    mach                       - Aircraft Mach number at every time step
+                    velocity_primary           - Primary jet velocity at every time step [m/s]
+                    velocity_secondary         - Secondary jet velocity at every time step [m/s]
+
+        Assumptions:
+                    The flight conditions only vary along the time steps, the microphones share them."""
+
+    #unpack
+    Velocity_primary_1      =       np.float(turbofan.core_nozzle.noise_speed * 0.92*(turbofan.design_thrust/52700.))   
+    Velocity_secondary_1    =       np.float(turbofan.fan_nozzle.noise_speed * (turbofan.design_thrust/52700.)) 
+    N1                      =       np.float(turbofan.fan.rotation * 0.92*(turbofan.design_thrust/52700.))
+    Diameter_primary        =       turbofan.core_nozzle_diameter
+    Diameter_secondary      =       turbofan.fan_nozzle_diameter
+    engine_height           =       turbofan.engine_height
+    EXA                     =       turbofan.exa
+    Plug_diameter           =       turbofan.plug_diameter 
+    Xe                      =       turbofan.geometry_xe
+    Ye                      =       turbofan.geometry_ye
+    Ce                      =       turbofan.geometry_Ce
+
+    #The time steps along the first axis and the frequency bands along the second
+    nsteps                = len(Altitude)
+    Velocity_aircraft     = np.atleast_1d(Velocity_aircraft)[:,None]
+    AOA                   = np.atleast_1d(AOA)[:,None]
+    Temperature_primary   = Temperature_primary[:,None]
+    Pressure_primary      = Pressure_primary[:,None]
+    Temperature_secondary = Temperature_secondary[:,None]
+    Pressure_secondary    = Pressure_secondary[:,None]
+    
+    Velocity_primary   = np.ones((nsteps,1))*Velocity_primary_1
+    Velocity_secondary = np.ones((nsteps,1))*Velocity_secondary_1
+
+    # ==============================================
+    # Computing atmospheric conditions
+    # ==============================================
+    
+    atmo_data = analyses.atmosphere.compute_values(Altitude)
+
+    sound_ambient       =   atmo_data.speed_of_sound
+    density_ambient     =   atmo_data.density
+    temperature_ambient =   atmo_data.temperature
+    pressure_amb        =   atmo_data.pressure
+    
+    #Base parameters necessary input for the noise code
+    pressure_isa = 101325 #[Pa]
+    R_gas        = 287.1  #[J/kg K]
+    gama_primary = 1.37   #Corretion for the primary jet
+    gama         = 1.4
+
+    #Calculation of nozzle areas
+    Area_primary   = np.pi*(Diameter_primary/2)**2 
+    Area_secondary =  np.pi*(Diameter_secondary/2)**2 
+
+    Xo=0 #Acoustic center of reference [m] - Used for wind tunnel acoustic data
+
+    #Flags for definition of near-fiel or wind-tunnel data
+    near_field = 0
+    tunnel     = 0
+
+    """Starting the main program"""
+
+    #Desired frequency range for noise evaluation
+    frequency = np.array((50, 63, 80, 100, 125, 160, 200, 250, 315, 400, 500, 630, 800, 1000, 1250, 1600, \
+            2000, 2500, 3150, 4000, 5000, 6300, 8000, 10000))
+
+    #First guess of the source angles
+    B       = np.zeros((nsteps,24))
+    theta_p = np.ones((nsteps,24))*np.pi/2
+    theta_s = np.ones((nsteps,24))*np.pi/2
+    theta_m = np.ones((nsteps,24))*np.pi/2
+
+    # Jet Flow Parameters
+
+    #Primary and Secondary jets
+    Cpp = R_gas/(1-1/gama_primary)
+    Cp  = R_gas/(1-1/gama)
+    
+    density_primary   = Pressure_primary/(R_gas*Temperature_primary-(0.5*R_gas*Velocity_primary**2/Cpp))
+    density_secondary = Pressure_secondary/(R_gas*Temperature_secondary-(0.5*R_gas*Velocity_secondary**2/Cp))
+
+    mass_flow_primary   = Area_primary*Velocity_primary*density_primary
+    mass_flow_secondary = Area_secondary*Velocity_secondary*density_secondary
+
+    #Mach number of the external flow - based on the aircraft velocity
+    Mach_aircraft = Velocity_aircraft/sound_ambient
+
+    #Calculation Procedure for the Mixed Jet Flow Parameters
+    Velocity_mixed = (mass_flow_primary*Velocity_primary+mass_flow_secondary*Velocity_secondary)/ \
+            (mass_flow_primary+mass_flow_secondary)
+    Temperature_mixed =(mass_flow_primary*Temperature_primary+mass_flow_secondary*Temperature_secondary)/ \
+            (mass_flow_primary+mass_flow_secondary)
+    density_mixed = pressure_amb/(R_gas*Temperature_mixed-(0.5*R_gas*Velocity_mixed**2/Cp))
+    Area_mixed = Area_primary*density_primary*Velocity_primary*(1+(mass_flow_secondary/mass_flow_primary))/ \
+            (density_mixed*Velocity_mixed)
+    Diameter_mixed = (4*Area_mixed/np.pi)**0.5
+
+    #**********************************************
+    # START OF THE NOISE PROCEDURE CALCULATIONS
+    #**********************************************
+
+    XBPR = np.clip(mass_flow_secondary/mass_flow_primary - 5.5,0,4)
+
+    #Auxiliary parameter defined as DVPS
+    DVPS = np.abs((Velocity_primary - (Velocity_secondary*Area_secondary+Velocity_aircraft*Area_primary)/(Area_secondary+Area_primary)))
+    DVPS = np.maximum(DVPS,0.3)
+
+    # Calculation of the Strouhal number for each jet component (p-primary, s-secondary, m-mixed)
+    Str_p = frequency*Diameter_primary/(DVPS)  #Primary jet
+    Str_s = frequency*Diameter_mixed/(Velocity_secondary-Velocity_aircraft) #Secondary jet
+    Str_m = frequency*Diameter_mixed/(Velocity_mixed-Velocity_aircraft) #Mixed jet
+
+    #Calculation of the Excitation adjustment parameter
+    #Excitation Strouhal Number
+    excitation_Strouhal = (N1/60)*(Diameter_mixed/Velocity_mixed)
+    SX = np.where((excitation_Strouhal > 0.25) & (excitation_Strouhal < 0.5), 0.0, \
+                  50*(excitation_Strouhal-0.25)*(excitation_Strouhal-0.5))
+
+    #Effectiveness
+    exps = np.exp(-SX)
+
+    #Spectral Shape Factor
+    exs = 5*exps*np.exp(-(np.log10(Str_m/(2*excitation_Strouhal+0.00001)))**2)
+
+    #Fan Duct Lenght Factor
+    exd = np.exp(0.6-(EXA)**0.5)
+
+    #Excitation source location factor (zk)
+    zk = 1-0.4*(exd)*(exps)    
+
+    #Polar angles of the observer, the microphones along the axes before the time steps
+    theta = np.asarray(angles)[...,None]
+    distance_microphone = np.asarray(distance_microphone)[...,None]
+
+    #Call function noise source location for the calculation of theta
+    thetaj = noise_source_location(B,Xo,zk,Diameter_primary,theta_p,Area_primary,Area_secondary,distance_microphone,Diameter_secondary,theta,theta_s,theta_m,Diameter_mixed,Velocity_primary,Velocity_secondary,Velocity_mixed,Velocity_aircraft,sound_ambient,Str_m,Str_s)
+    theta_p, theta_s, theta_m = thetaj
+
+    #Calculation of the Directivity Factor
+    exc = np.where(theta_m <= 1.4, sound_ambient/Velocity_mixed, \
+                   (sound_ambient/Velocity_mixed)*(1-(1.8/np.pi)*(theta_m-1.4)))
+
+    #Acoustic excitation adjustment (EX)
+    EX_m = exd*exs*exc   #mixed component - dependant of the frequency
+    EX_p = +5*exd*exps   #primary component - no frequency dependance
+    EX_s = 2*sound_ambient/(Velocity_secondary*(zk)) #secondary component - no frequency dependance    
+
+    distance_primary   = distance_microphone 
+    distance_secondary = distance_microphone 
+    distance_mixed     = distance_microphone
+
+    #Noise attenuation due to Ambient Pressure
+    dspl_ambient_pressure = 20*np.log10(pressure_amb/pressure_isa)
+
+    #Noise attenuation due to Density Gradientes
+    dspl_density_p = 20*np.log10((density_primary+density_secondary)/(2*density_ambient))
+    dspl_density_s = 20*np.log10((density_secondary+density_ambient)/(2*density_ambient))
+    dspl_density_m = 20*np.log10((density_mixed+density_ambient)/(2*density_ambient))
+
+    #Noise attenuation due to Spherical divergence
+    dspl_spherical_p = 20*np.log10(Diameter_primary/distance_primary)
+    dspl_spherical_s = 20*np.log10(Diameter_mixed/distance_secondary)
+    dspl_spherical_m = 20*np.log10(Diameter_mixed/distance_mixed)
+
+    #Noise attenuation due to Geometric Near-Field
+    if near_field ==0:
+            dspl_geometric_p = 0.0
+            dspl_geometric_s = 0.0
+            dspl_geometric_m = 0.0
+    elif near_field ==1:
+            dspl_geometric_p = -10*np.log10(1+(2*Diameter_primary+(Diameter_primary*sound_ambient/frequency))/distance_primary)
+            dspl_geometric_s = -10*np.log10(1+(2*Diameter_mixed+(Diameter_mixed*sound_ambient/frequency))/distance_secondary)
+            dspl_geometric_m = -10*np.log10(1+(2*Diameter_mixed+(Diameter_mixed*sound_ambient/frequency))/distance_mixed)
+
+    #Noise attenuation due to Acoustic Near-Field
+    if near_field ==0:
+            dspl_acoustic_p = 0.0;
+            dspl_acoustic_s = 0.0;
+            dspl_acoustic_m = 0.0;
+    elif near_field ==1:
+            dspl_acoustic_p = 10*np.log10(1+0.13*(sound_ambient/(distance_primary*frequency))**2)
+            dspl_acoustic_s = 10*np.log10(1+0.13*(sound_ambient/(distance_secondary*frequency))**2)
+            dspl_acoustic_m = 10*np.log10(1+0.13*(sound_ambient/(distance_mixed*frequency))**2)
+
+    #Atmospheric attenuation
+    if tunnel==0:
+            delta_atmo = atmospheric_attenuation(distance_primary)
+            
+            dspl_attenuation_p = -delta_atmo 
+            dspl_attenuation_s = -delta_atmo 
+            dspl_attenuation_m = -delta_atmo 
+
+    elif tunnel==1: #These corrections are not applicable for jet rigs or static conditions
+            dspl_attenuation_p = np.zeros((nsteps,24))
+            dspl_attenuation_s = np.zeros((nsteps,24))
+            dspl_attenuation_m = np.zeros((nsteps,24))
+            EX_m = np.zeros((nsteps,24))
+            EX_p = 0
+            EX_s = 0
+
+    #Calculation of the total noise attenuation (p-primary, s-secondary, m-mixed components)
+    DSPL_p = dspl_ambient_pressure+dspl_density_p+dspl_geometric_p+dspl_acoustic_p+dspl_attenuation_p+dspl_spherical_p
+    DSPL_s = dspl_ambient_pressure+dspl_density_s+dspl_geometric_s+dspl_acoustic_s+dspl_attenuation_s+dspl_spherical_s
+    DSPL_m = dspl_ambient_pressure+dspl_density_m+dspl_geometric_m+dspl_acoustic_m+dspl_attenuation_m+dspl_spherical_m
+
+
+    #Calculation of interference effects on jet noise
+    ATK_m   = angle_of_attack_effect(AOA,Mach_aircraft,theta_m)
+    INST_s  = jet_installation_effect(Xe,Ye,Ce,theta_s,Diameter_mixed)
+    Plug    = external_plug_effect(Velocity_primary,Velocity_secondary, Velocity_mixed, Diameter_primary,Diameter_secondary,Diameter_mixed, Plug_diameter, sound_ambient, theta_p,theta_s,theta_m)
+    GPROX_m = ground_proximity_effect(Velocity_mixed,sound_ambient,theta_m,engine_height,Diameter_mixed,frequency)
+
+    #Calculation of the sound pressure level for each jet component
+    SPL_primary_history = primary_noise_component(None,Velocity_primary,Temperature_primary,R_gas,theta_p,DVPS,sound_ambient,Velocity_secondary,Velocity_aircraft,Area_primary,Area_secondary,DSPL_p,EX_p,Str_p) + Plug[0]
+    
+    SPL_secondary_history = secondary_noise_component(None,Velocity_primary,theta_s,sound_ambient,Velocity_secondary,Velocity_aircraft,Area_primary,Area_secondary,DSPL_s,EX_s,Str_s) + Plug[1] + INST_s
+    
+    SPL_mixed_history = mixed_noise_component(None,Velocity_primary,theta_m,sound_ambient,Velocity_secondary,Velocity_aircraft,Area_primary,Area_secondary,DSPL_m,EX_m,Str_m,Velocity_mixed,XBPR) + Plug[2] + ATK_m + GPROX_m
+
+    #Sum of the Total Noise
+    SPL_total_history = 10 * np.log10(10**(0.1*SPL_primary_history)+10**(0.1*SPL_secondary_history)+10**(0.1*SPL_mixed_history))
+
+    SAE_Engine_Noise_Spectra = Data(
+        SPL_primary_history   = SPL_primary_history,
+        SPL_secondary_history = SPL_secondary_history,
+        SPL_mixed_history     = SPL_mixed_history,
+        SPL_total_history     = SPL_total_history,
+        frequency             = frequency,
+        mach                  = Mach_aircraft[:,0],
+        velocity_primary      = Velocity_primary[:,0],
+        velocity_secondary    = Velocity_secondary[:,0])
+
+    return SAE_Engine_Noise_Spectra
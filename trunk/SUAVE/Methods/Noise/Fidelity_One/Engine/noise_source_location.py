@@ -3,6 +3,7 @@
 # 
 # Created:  Jul 2015, C. Ilario
 # Modified: Jan 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------        
 #   Imports
@@ -16,103 +17,60 @@ import numpy as np
 
 ## @ingroupMethods-Noise-Fidelity_One-Engine
 def noise_source_location (B,Xo,zk,Diameter_primary,theta_p,Area_primary,Area_secondary,distance_microphone,Diameter_secondary,theta,theta_s,theta_m,Diameter_mixed,Velocity_primary,Velocity_secondary,Velocity_mixed,Velocity_aircraft,sound_ambient,Str_m,Str_s):
-    
+    """This function calculates the polar angles of the primary, secondary and mixed jet noise sources, seen from the
+    observer, by iterating the location of each source along the jet. The frequency bands and the time steps are
+    iterated together, all of them from the angles given, and each one until its location moves less than a
+    two-thousandth of the jet diameter."""
+
     #Primary jet source location
-    XJ = np.zeros(24)
-    
-    for i in range(24):
-        residual = Diameter_primary
-        XJ[i]    = (zk*Diameter_primary)*(4.+4.*np.arctan((18.*theta_p[i]/np.pi)-9.)+(Area_secondary/Area_primary))
-        B[i]     = (1./np.sin(theta))*(((Xo+XJ[i])/distance_microphone)+np.cos(theta))
-        
-        if (B[i]>=0.):
-            theta_p[i]=np.arcsin(((B[i])**2.+1.)**(-0.5))
-        else:
-            theta_p[i]=np.pi-np.arcsin(((B[i])**2.+1.)**(-0.5))
-
-        XJ[i] = (zk*Diameter_primary)*(4.+4.*np.arctan((18.*theta_p[i]/np.pi)-9.)+(Area_secondary/Area_primary))
-        
-        while residual>(Diameter_primary/200.):
-            XJ_old = XJ[i]
-            theta1 = theta_p[i]
-            B[i]   = (1./np.sin(theta))*(((Xo+XJ[i])/distance_microphone)+np.cos(theta))
-            
-            if B[i]>=0.:
-                theta_p[i] = np.arcsin(((B[i])**2.+1.)**(-0.5))
-            else:
-                theta_p[i] = np.pi-np.arcsin(((B[i])**2.+1.)**(-0.5))
-
-            theta2     = theta_p[i]
-            theta_p[i] = (theta1+theta2)/2.
-            XJ[i]      = (zk*Diameter_primary)*(4.+4.*np.arctan((18.*theta_p[i]/np.pi)-9.)+(Area_secondary/Area_primary))
-            residual   = np.abs(XJ_old-XJ[i])
-
-        #Secondary jet source location
-        residual = Diameter_secondary
-        XJ_old   = 0.0
-        XJ[i]    = (zk*Diameter_secondary)*(2.+1.6*np.arctan((4.5*theta_s[i]/np.pi)-2.25))*(1.+0.5/np.sqrt(Str_s[i])) \
+    def primary_location(theta_p):
+        return (zk*Diameter_primary)*(4.+4.*np.arctan((18.*theta_p/np.pi)-9.)+(Area_secondary/Area_primary))
+
+    theta_p = source_angle(primary_location,primary_location,theta_p,Xo,theta,distance_microphone,Diameter_primary/2000.)
+
+    #Secondary jet source location
+    def secondary_location(Diameter):
+        return lambda theta_s: (zk*Diameter)*(2.+1.6*np.arctan((4.5*theta_s/np.pi)-2.25))*(1.+0.5/np.sqrt(Str_s)) \
             *  np.sqrt(1.+(0.7*Velocity_secondary/sound_ambient))*(Velocity_secondary/(Velocity_secondary-Velocity_aircraft))
-        
-        B[i]     = (1./np.sin(theta))*(((Xo+XJ[i])/distance_microphone)+np.cos(theta))
-        
-        if B[i]>=0.:
-            theta_s[i] = np.arcsin(((B[i])**2.+1.)**(-0.5))
-        else:
-            theta_s[i] = np.pi-np.arcsin(((B[i])**2.+1.)**(-0.5))
-            
-        XJ[i] = (zk*Diameter_mixed)*(2.+1.6*np.arctan((4.5*theta_s[i]/np.pi)-2.25))*(1.+0.5/np.sqrt(Str_s[i]))* \
-            np.sqrt(1.+(0.7*Velocity_secondary/sound_ambient))*(Velocity_secondary/(Velocity_secondary-Velocity_aircraft))
-        
-        while residual>(Diameter_mixed/200.):
-            XJ_old = XJ[i]
-            theta1 = theta_s[i]
-            B[i]   = (1/np.sin(theta))*(((Xo+XJ[i])/distance_microphone)+np.cos(theta))
-            
-            if B[i]>=0.:
-                theta_s[i] = np.arcsin((B[i]**2.+1.)**(-0.5))
-            else:
-                theta_s[i] = np.pi-np.arcsin(((B[i])**2.+1.)**(-0.5))
-
-            theta2     = theta_s[i]
-            theta_s[i] = (theta1+theta2)/2.
-            XJ[i]      = (zk*Diameter_mixed)*(2.+1.6*np.arctan((4.5*theta_s[i]/np.pi)-2.25))*(1.+0.5/np.sqrt(Str_s[i]))* \
-                np.sqrt(1.+(0.7*Velocity_secondary/sound_ambient))*(Velocity_secondary/(Velocity_secondary-Velocity_aircraft))
-            
-            residual = np.abs(XJ_old-XJ[i])
-
-        #Mixed jet source location
-        residual = Diameter_mixed
-        XJ_old   = 0.
-        XJ[i] = (zk*Diameter_mixed)*(3.+np.exp(-Str_m[i])+(2.+1.1*np.arctan((18.*theta_m[i]/np.pi)-13.))+ \
-            (1.+0.5/np.sqrt(Str_m[i])))*np.sqrt(0.5+0.5*Velocity_mixed/sound_ambient) * \
+
+    theta_s = source_angle(secondary_location(Diameter_secondary),secondary_location(Diameter_mixed),theta_s,Xo,theta,
+                           distance_microphone,Diameter_mixed/2000.)
+
+    #Mixed jet source location
+    def mixed_location(theta_m):
+        return (zk*Diameter_mixed)*(3.+np.exp(-Str_m)+(2.+1.1*np.arctan((18.*theta_m/np.pi)-13.))+ \
+            (1.+0.5/np.sqrt(Str_m)))*np.sqrt(0.5+0.5*Velocity_mixed/sound_ambient) * \
             (Velocity_mixed/(Velocity_mixed-Velocity_aircraft))
-        
-        B[i] = (1./np.sin(theta))*(((Xo+XJ[i])/distance_microphone)+np.cos(theta))
-        if B[i]>=0.:
-            theta_m[i] = np.arcsin(((B[i])**2.+1.)**(-0.5))
-        else:
-            theta_m[i] = np.pi-np.arcsin(((B[i])**2.+1.)**(-0.5))
-
-        XJ[i]=(zk*Diameter_mixed)*(3.+np.exp(-Str_m[i])+(2.+1.1*np.arctan((18.*theta_m[i]/np.pi)-13.))+\
-            (1.+0.5/np.sqrt(Str_m[i])))*np.sqrt(0.5+0.5*Velocity_mixed/sound_ambient) \
-            *(Velocity_mixed/(Velocity_mixed-Velocity_aircraft))
-        
-        while residual>(Diameter_mixed/200.):
-            XJ_old = XJ[i]
-            theta1 = theta_m[i]
-            B[i]   = (1./np.sin(theta))*(((Xo+XJ[i])/distance_microphone)+np.cos(theta))
-            
-            if B[i]>=0.:
-                theta_m[i] = np.arcsin(((B[i])**2.+1.)**(-0.5))
-            else:
-                theta_m[i] = np.pi-np.arcsin(((B[i])**2.+1.)**(-0.5))
-                
-            theta2     = theta_m[i]
-            theta_m[i] = (theta1+theta2)/2.
-            XJ[i]      = (zk*Diameter_mixed)*(3.+np.exp(-Str_m[i])+(2.+1.1*np.arctan((18.*theta_m[i]/np.pi)-13.))+\
-                (1.+0.5/np.sqrt(Str_m[i])))*np.sqrt(0.5+0.5*Velocity_mixed/sound_ambient) \
-                *(Velocity_mixed/(Velocity_mixed-Velocity_aircraft))
-            
-            residual   = abs(XJ_old-XJ[i])
-
-    return(theta_p,theta_s,theta_m)
\ No newline at end of file
+
+    theta_m = source_angle(mixed_location,mixed_location,theta_m,Xo,theta,distance_microphone,Diameter_mixed/2000.)
+
+    return(theta_p,theta_s,theta_m)
+
+def source_angle(first_location,location,theta_j,Xo,theta,distance_microphone,tolerance):
+    """This function iterates the polar angle of a jet noise source, with the location of the source along the jet
+    given by a function of the angle. The angles stop changing once the location moves less than the tolerance."""
+
+    #First guess of the location
+    XJ      = first_location(theta_j)
+    theta_j = observer_angle(XJ,Xo,theta,distance_microphone)
+    XJ      = location(theta_j)
+
+    #Average the angles of two successive locations until the location converges
+    iterating = np.ones(np.shape(XJ),dtype=bool)
+    while np.any(iterating):
+        theta2    = observer_angle(XJ,Xo,theta,distance_microphone)
+        theta_new = (theta_j+theta2)/2.
+        XJ_new    = location(theta_new)
+        residual  = np.abs(XJ-XJ_new)
+        theta_j   = np.where(iterating,theta_new,theta_j)
+        XJ        = np.where(iterating,XJ_new,XJ)
+        iterating = iterating & (residual>tolerance)
+
+    return theta_j
+
+def observer_angle(XJ,Xo,theta,distance_microphone):
+    """This function calculates the polar angle from the observer to a source at XJ along the jet."""
+
+    #The angle of the triangle between the source, the observer and the jet axis, as arcsin((B**2+1)**-0.5) with
+    #B = (1/sin(theta))*((Xo+XJ)/distance_microphone+cos(theta)), taken from the other side of the observer when B<0
+    return np.arctan2(np.sin(theta),((Xo+XJ)/distance_microphone)+np.cos(theta))
@@ -10,4 +10,7 @@ from .dbA_noise import dbA_noise
 from .noise_geometric import noise_geometric
 from .noise_certification_limits import noise_certification_limits
 from .noise_counterplot import noise_counterplot
+from .noise_grid_geometric import noise_grid_geometric
 from .senel_noise import senel_noise
+from .print_engine_output import print_engine_output
+from .print_airframe_output import print_airframe_output
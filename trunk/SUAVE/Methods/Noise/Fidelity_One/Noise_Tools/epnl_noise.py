@@ -3,6 +3,7 @@
 # 
 # Created:  Jul 2015, C. Ilario
 # Modified: Jan 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------        
 #   Imports
@@ -17,53 +18,47 @@ import numpy as np
 ## @ingroupMethods-Noise-Fidelity_One-Noise_Tools
 def epnl_noise(PNLT):
     """This method calculates de effective perceived noise level (EPNL) based on a time history PNLT
-     (Perceived Noise Level with Tone Correction).
+     (Perceived Noise Level with Tone Correction). The histories of many observers can be given at once,
+     with the time steps along the last axis.
 
         Inputs:
-                    PNLT                     - Perceived Noise Level with Tone Correction
+                    PNLT                     - Perceived Noise Level with Tone Correction [nsteps] or [..., nsteps]
 
                 Outputs: 
-                    EPNL                     - Effective Perceived Noise Level in EPNdB"""
+                    EPNL                     - Effective Perceived Noise Level in EPNdB, one per history"""
                     
                     
+    PNLT = np.asarray(PNLT)
+    
     #Maximum PNLT on the time history data    
-    PNLT_max = np.max(PNLT)
+    PNLT_max = np.max(PNLT,axis=-1)
     
     #Calculates the number of discrete points on the trajectory
-    nsteps   = len(PNLT)    
-    
-    #Exclude sources that are not being calculated or doesn't contribute for the total noise of the aircraft
-    if all(PNLT==0):
-        EPNL = 0
-        return(EPNL)
+    nsteps   = PNLT.shape[-1]
+    steps    = np.arange(nsteps)
 
     #Finding the time duration for the noise history where PNL is higher than the maximum PNLT - 10 dB
-    i = 0
-    while PNLT[i]<=(PNLT_max-10) and i<=nsteps:
-        i = i+1
-    t1 = i #t1 is the first time interval
-    i  = i+1
+    threshold = (PNLT_max-10)[...,None]
+    t1        = np.argmax(PNLT>threshold,axis=-1) #t1 is the first time interval
+
+    #The last time interval is the one before the history falls under PNLTM-10 again
+    below = (PNLT<threshold) & (steps>t1[...,None])
+    t2    = np.argmax(below,axis=-1)-1
 
     #Correction for PNLTM-10 when it falls outside the limit of the data
-    if PNLT[nsteps-1]>=(PNLT_max-10):
-        t2=nsteps-2
-    else:
-        while i<=nsteps and PNLT[i]>=(PNLT_max-10):
-            i = i+1
-        t2 = i-1 #t2 is the last time interval
-                
-    #The time duration where the noise is higher than the maximum PNLT - 10 dB is:
-    time_interval = (t2-t1)*0.5
+    t2 = np.where(PNLT[...,-1]>=threshold[...,0],nsteps-2,t2)
     
     #Calculates the integral of the PNLT which between t1 and t2 points
-    sumation = 0
-    for i in range (t1-1,t2+1):
-        sumation = 10**(PNLT[i]/10)+sumation
+    interval  = (steps>=(t1-1)[...,None]) & (steps<=t2[...,None])
+    sumation  = np.sum(np.where(interval,10**(PNLT/10),0.),axis=-1)
         
-   #Duration Correction calculation
+    #Duration Correction calculation
     duration_correction = 10*np.log10(sumation)-PNLT_max-13
                 
     #Final EPNL calculation
     EPNL = PNLT_max+duration_correction
     
-    return (EPNL)    
\ No newline at end of file
+    #Exclude sources that are not being calculated or doesn't contribute for the total noise of the aircraft
+    EPNL = np.where(np.all(PNLT==0,axis=-1),0.,EPNL)
+    
+    return (EPNL[()])
@@ -0,0 +1,47 @@
+## @ingroupMethods-Noise-Fidelity_One-Noise_Tools
+# noise_grid_geometric.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+
+# ----------------------------------------------------------------------
+#   Noise Grid Geometric
+# ----------------------------------------------------------------------
+
+## @ingroupMethods-Noise-Fidelity_One-Noise_Tools
+def noise_grid_geometric(position_vector,microphone_locations):
+    """ SUAVE.Methods.Noise.Fidelity_One.Noise_Tools.noise_grid_geometric(position_vector,microphone_locations):
+            Computes the geometric parameters for the noise tools for many microphones at once: distance and emission
+            angles for both polar and azimuthal angles from every position of the aircraft to every microphone.
+
+            Inputs:
+                position_vector         - Aircraft position in the inertial frame at every time step [meters], [nsteps,3]
+                microphone_locations    - Microphone positions in the inertial frame [meters], [n_microphones,3]
+
+            Outputs:
+                dist                    - Distance from the aircraft to the microphones, [meters], [n_microphones,nsteps]
+                theta                   - Polar emission angle from the flight direction to the microphones, [rad], [n_microphones,nsteps]
+                phi                     - Azimuthal emission angle from below the aircraft to the microphones, [rad], [n_microphones,nsteps]
+
+            Assumptions:
+                The aircraft flies along the x axis of the inertial frame, with the z axis pointing down."""
+
+    #Vector from the aircraft to each microphone, the microphones along the first axis and the time steps along the second
+    dx = microphone_locations[:,0,None] - position_vector[None,:,0]
+    dy = microphone_locations[:,1,None] - position_vector[None,:,1]
+    dz = microphone_locations[:,2,None] - position_vector[None,:,2]
+
+    dist  = np.sqrt(dx**2+dy**2+dz**2)
+
+    #Polar angle from the flight direction, the lateral offset of the microphone included
+    theta = np.arccos(np.clip(dx/dist,-1.,1.))
+
+    #Azimuthal angle of the microphone seen from the aircraft, from the vertical below it
+    phi   = np.arctan2(np.abs(dy),dz)
+
+    return (dist,theta,phi)
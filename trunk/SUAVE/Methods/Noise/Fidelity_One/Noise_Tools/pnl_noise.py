@@ -3,6 +3,7 @@
 # 
 # Created:  Jul 2015, C. Ilario
 # Modified: Jan 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -51,41 +52,33 @@ def pnl_noise (SPL):
             [24, 10000, 50.7, 41, 37, 21, 29, 0.042285,	0.02996, 0.05964, 0.043573]]
 
     
-    #Defining the necessary arrays for the calculation
+    #Bands of the spectra along the columns, the last band is not counted
+    noy     = np.array(noy)[:23]
+    SPL     = np.atleast_2d(SPL)[:,:23]
     nsteps  = len(SPL)
     SPL_noy = np.zeros((nsteps,24))
-    PNL     = np.zeros(nsteps)
     
     #-------------------------------------------
     #STEP 1 - Convert SPL to Perceived Noisiness
     #-------------------------------------------
-    
-    for j in range(0,nsteps):
-    
-        for i in range(0,23):
-            if SPL[j][i]>=noy[1][2]:
-                SPL_noy[j][i] = 10**(noy[i][8]*(SPL[j][i]-noy[i][4]))
-                
-            if SPL[j][i]>=noy[i][3] and SPL[j][i]<noy[i][2]:
-                SPL_noy[j][i] = 10**(noy[i][7]*(SPL[j][i]-noy[i][3]))
-                
-            if SPL[j][i]>=noy[i][6] and SPL[j][i]<noy[i][3]:
-                SPL_noy[j][i] = 0.3*(10**(noy[i][10]*(SPL[j][i]-noy[i][6])))
-                
-            if SPL[j][i]>=noy[i][5] and SPL[j][i]<noy[i][6]:
-                SPL_noy[j][i] = 0.1*(10**(noy[i][9]*(SPL[j][i]-noy[i][5])))
-            
-        #-------------------------------------------  
-        #STEP 2 - Combine perceived noiseness values  
-        #-------------------------------------------
-        max_noy = np.max(SPL_noy[j][:])            
-        Perceived_noisinees = 0.85*max_noy+0.15*np.sum(SPL_noy[j][:])
-        
-        #-----------------------------------------------------------------
-        #STEP 3 - Convert Perceived Noiseness into Perceived Noise Level
-        #------------------------------------------------------------------    
-        if Perceived_noisinees==0:
-            Perceived_noisinees = 0.0625
-        PNL[j] = 40+(10/np.log10(2))*np.log10(Perceived_noisinees)
+    #Each range overrides the ones before it
+    noisiness = SPL_noy[:,:23]
+    noisiness[:] = np.where(SPL>=noy[1,2], 10**(noy[:,8]*(SPL-noy[:,4])), noisiness)
+    noisiness[:] = np.where((SPL>=noy[:,3]) & (SPL<noy[:,2]), 10**(noy[:,7]*(SPL-noy[:,3])), noisiness)
+    noisiness[:] = np.where((SPL>=noy[:,6]) & (SPL<noy[:,3]), 0.3*(10**(noy[:,10]*(SPL-noy[:,6]))), noisiness)
+    noisiness[:] = np.where((SPL>=noy[:,5]) & (SPL<noy[:,6]), 0.1*(10**(noy[:,9]*(SPL-noy[:,5]))), noisiness)
+
+    #-------------------------------------------  
+    #STEP 2 - Combine perceived noiseness values  
+    #-------------------------------------------
+    max_noy = np.max(SPL_noy,axis=1)
+    Perceived_noisinees = 0.85*max_noy+0.15*np.sum(SPL_noy,axis=1)
+
+    #-----------------------------------------------------------------
+    #STEP 3 - Convert Perceived Noiseness into Perceived Noise Level
+    #------------------------------------------------------------------    
+    Perceived_noisinees[Perceived_noisinees==0] = 0.0625
         
-    return (PNL)
\ No newline at end of file
+    PNL = 40+(10/np.log10(2))*np.log10(Perceived_noisinees)
+    
+    return (PNL)
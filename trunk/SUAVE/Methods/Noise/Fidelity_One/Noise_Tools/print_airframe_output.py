@@ -0,0 +1,129 @@
+## @ingroupMethods-Noise-Fidelity_One-Noise_Tools
+# print_airframe_output.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+from SUAVE.Core import Units
+
+import numpy as np
+
+# ----------------------------------------------------------------------
+#  Print Airframe Output
+# ----------------------------------------------------------------------
+
+## @ingroupMethods-Noise-Fidelity_One-Noise_Tools
+def print_airframe_output(Fink_Airframe_Noise_Outputs):
+    """This prints the results of the Fink airframe noise model to two files, the PNLT
+    of each airframe component at every time step, and the 1/3 octave band SPL of the
+    whole airframe at every time step.
+
+    Assumptions:
+        None
+
+    Source:
+        None
+
+    Inputs:
+        Fink_Airframe_Noise_Outputs - results of noise_airframe_Fink, with the fields:
+            filename                          - name of the PNLT output file
+            history_filename                  - name of the SPL output file
+            EPNL_total, EPNL_wing, ...        - Effective Perceived Noise Level [EPNdB]
+            SENEL_total                       - Single Event Noise Exposure Level [dBA]
+            PNLT_total, PNLT_wing, ...        - Tone corrected Perceived Noise Level history [dB]
+            SPLt_dBA_max                      - Maximum A-weighted SPL history [dBA]
+            SPL_total_history                 - 1/3 octave band SPL history [dB]
+            SPLt_dBA_history                  - 1/3 octave band A-weighted SPL history [dBA]
+            frequency                         - 1/3 octave band center frequencies [Hz]
+            time, altitude, mach, angle, phi,
+            distance_vector                   - trajectory at every time step
+            velocity                          - aircraft velocity [m/s]
+
+    Outputs:
+        None
+
+    Properties Used:
+        N/A
+    """
+
+    # unpack
+    outputs   = Fink_Airframe_Noise_Outputs
+    nsteps    = len(outputs.time)
+    frequency = outputs.frequency
+
+    with open(outputs.filename,'w') as fid:
+
+        fid.write('Reference speed =  ')
+        fid.write(str('%2.2f' % (outputs.velocity/Units.kts))+'  kts')
+        fid.write('\n')
+        fid.write('PNLT history')
+        fid.write('\n')
+        fid.write('time       altitude      Mach    Polar_angle    Azim_angle   distance        wing  	   ht 	        vt 	   flap   	 slat         nose        main         total         dBA')
+        fid.write('\n')
+
+        for id in range (0,nsteps):
+            fid.write(str('%2.2f' % outputs.time[id])+'        ')
+            fid.write(str('%2.2f' % outputs.altitude[id])+'        ')
+            fid.write(str('%2.2f' % outputs.mach[id])+'        ')
+            fid.write(str('%2.2f' % (outputs.angle[id]*180/np.pi))+'        ')
+            fid.write(str('%2.2f' % (outputs.phi[id]*180/np.pi))+'        ')
+            fid.write(str('%2.2f' % outputs.distance_vector[id])+'        ')
+            fid.write(str('%2.2f' % outputs.PNLT_wing[id])+'        ')
+            fid.write(str('%2.2f' % outputs.PNLT_ht[id])+'        ')
+            fid.write(str('%2.2f' % outputs.PNLT_vt[id])+'        ')
+            fid.write(str('%2.2f' % outputs.PNLT_flap[id])+'        ')
+            fid.write(str('%2.2f' % outputs.PNLT_slat[id])+'        ')
+            fid.write(str('%2.2f' % outputs.PNLT_nose_landing_gear[id])+'        ')
+            fid.write(str('%2.2f' % outputs.PNLT_main_landing_gear[id])+'        ')
+            fid.write(str('%2.2f' % outputs.PNLT_total[id])+'        ')
+            fid.write(str('%2.2f' % outputs.SPLt_dBA_max[id])+'        ')
+            fid.write('\n')
+        fid.write('\n')
+        fid.write('PNLT max =  ')
+        fid.write(str('%2.2f' % (np.max(outputs.PNLT_total)))+'  dB')
+        fid.write('\n')
+        fid.write('dBA max =  ')
+        fid.write(str('%2.2f' % (np.max(outputs.SPLt_dBA_max)))+'  dBA')
+        fid.write('\n')
+        fid.write('\n')
+        fid.write('EPNdB')
+        fid.write('\n')
+        fid.write('wing	       ht          vt         flap         slat    	nose        main	total')
+        fid.write('\n')
+        fid.write(str('%2.2f' % outputs.EPNL_wing)+'        ')
+        fid.write(str('%2.2f' % outputs.EPNL_ht)+'        ')
+        fid.write(str('%2.2f' % outputs.EPNL_vt)+'        ')
+        fid.write(str('%2.2f' % outputs.EPNL_flap)+'        ')
+        fid.write(str('%2.2f' % outputs.EPNL_slat)+'        ')
+        fid.write(str('%2.2f' % outputs.EPNL_nose_landing_gear)+'        ')
+        fid.write(str('%2.2f' % outputs.EPNL_main_landing_gear)+'        ')
+        fid.write(str('%2.2f' % outputs.EPNL_total)+'        ')
+        fid.write('\n')
+        fid.write('SENEL = ')
+        fid.write(str('%2.2f' % outputs.SENEL_total)+'        ')
+
+    with open(outputs.history_filename,'w') as fid:
+        fid.write('Reference speed =  ')
+        fid.write(str('%2.2f' % (outputs.velocity/Units.kts))+'  kts')
+        fid.write('\n')
+        fid.write('Sound Pressure Level for the Total Aircraft Noise')
+        fid.write('\n')
+
+        for nid in range (0,nsteps):
+            fid.write('Polar angle = ' + str('%2.2f' % (outputs.angle[nid]*(180/np.pi))) + '  degrees' + '\n')
+            fid.write('f		total SPL(dB)    total SPL(dBA)' + '\n')
+            for id in range(0,24):
+                fid.write(str((frequency[id])) + '           ')
+                fid.write(str('%3.2f' % outputs.SPL_total_history[nid][id]) + '          ')
+                fid.write(str('%3.2f' % outputs.SPLt_dBA_history[nid][id]))
+                fid.write('\n')
+            fid.write('SPLmax (dB) =  ')
+            fid.write(str('%3.2f' % (np.max(outputs.SPL_total_history[nid][:])))+'  dB' + '\n')
+            fid.write('SPLmax (dBA) =  ')
+            fid.write(str('%3.2f' % (np.max(outputs.SPLt_dBA_history[nid][:])))+'  dB')
+            fid.write('\n')
+
+    return
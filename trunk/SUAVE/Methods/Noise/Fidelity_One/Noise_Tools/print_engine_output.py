@@ -0,0 +1,123 @@
+## @ingroupMethods-Noise-Fidelity_One-Noise_Tools
+# print_engine_output.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+from SUAVE.Core import Units
+
+import numpy as np
+
+# ----------------------------------------------------------------------
+#  Print Engine Output
+# ----------------------------------------------------------------------
+
+## @ingroupMethods-Noise-Fidelity_One-Noise_Tools
+def print_engine_output(SAE_Engine_Noise_Outputs):
+    """This prints the results of the SAE engine noise model to a file, the PNLT
+    and the 1/3 octave band SPL of each jet component at every time step.
+
+    Assumptions:
+        None
+
+    Source:
+        None
+
+    Inputs:
+        SAE_Engine_Noise_Outputs - results of noise_SAE, with the fields:
+            filename                          - name of the output file
+            EPNL_total, EPNL_primary,
+            EPNL_secondary, EPNL_mixed        - Effective Perceived Noise Level [EPNdB]
+            SENEL_total                       - Single Event Noise Exposure Level [dBA]
+            PNLT_total, PNLT_primary,
+            PNLT_secondary, PNLT_mixed        - Tone corrected Perceived Noise Level history [dB]
+            SPLt_dBA_max                      - Maximum A-weighted SPL history [dBA]
+            SPL_total_history, ...            - 1/3 octave band SPL history [dB]
+            frequency                         - 1/3 octave band center frequencies [Hz]
+            time, altitude, mach, velocity_primary,
+            velocity_secondary, angles, phi,
+            distance_microphone               - trajectory at every time step
+            velocity                          - aircraft velocity [m/s]
+
+    Outputs:
+        None
+
+    Properties Used:
+        N/A
+    """
+
+    # unpack
+    outputs   = SAE_Engine_Noise_Outputs
+    nsteps    = len(outputs.time)
+    frequency = outputs.frequency
+
+    with open(outputs.filename,'w') as fid:
+
+        fid.write('Engine noise module - SAE Model for Turbofan' + '\n')
+        fid.write('Certification point = FLYOVER' + '\n')
+        fid.write('EPNL = ' + str('%3.2f' % outputs.EPNL_total) + '\n')
+        fid.write('PNLTM = ' + str('%3.2f' % np.max(outputs.PNLT_total)) + '\n')
+
+        fid.write('Reference speed =  ')
+        fid.write(str('%2.2f' % (outputs.velocity/Units.kts))+'  kts')
+        fid.write('\n')
+        fid.write('PNLT history')
+        fid.write('\n')
+        fid.write('time     	altitude     Mach     Core Velocity   Fan Velocity  Polar angle    Azim angle    distance    Primary	  Secondary 	 Mixed        Total')
+        fid.write('\n')
+        for id in range (0,nsteps):
+            fid.write(str('%2.2f' % outputs.time[id])+'        ')
+            fid.write(str('%2.2f' % outputs.altitude[id])+'        ')
+            fid.write(str('%2.2f' % outputs.mach[id])+'        ')
+            fid.write(str('%3.3f' % outputs.velocity_primary[id])+'        ')
+            fid.write(str('%3.3f' % outputs.velocity_secondary[id])+'        ')
+            fid.write(str('%2.2f' % (outputs.angles[id]*180/np.pi))+'        ')
+            fid.write(str('%2.2f' % (outputs.phi[id]*180/np.pi))+'        ')
+            fid.write(str('%2.2f' % outputs.distance_microphone[id])+'        ')
+            fid.write(str('%2.2f' % outputs.PNLT_primary[id])+'        ')
+            fid.write(str('%2.2f' % outputs.PNLT_secondary[id])+'        ')
+            fid.write(str('%2.2f' % outputs.PNLT_mixed[id])+'        ')
+            fid.write(str('%2.2f' % outputs.PNLT_total[id])+'        ')
+            fid.write(str('%2.2f' % outputs.SPLt_dBA_max[id])+'        ')
+            fid.write('\n')
+        fid.write('\n')
+        fid.write('PNLT max =  ')
+        fid.write(str('%2.2f' % (np.max(outputs.PNLT_total)))+'  dB')
+        fid.write('\n')
+        fid.write('dBA max =  ')
+        fid.write(str('%2.2f' % (np.max(outputs.SPLt_dBA_max)))+'  dBA')
+        fid.write('\n')
+        fid.write('EPNdB')
+        fid.write('\n')
+        fid.write('Primary    Secondary  	 Mixed       Total')
+        fid.write('\n')
+        fid.write(str('%2.2f' % outputs.EPNL_primary)+'        ')
+        fid.write(str('%2.2f' % outputs.EPNL_secondary)+'        ')
+        fid.write(str('%2.2f' % outputs.EPNL_mixed)+'        ')
+        fid.write(str('%2.2f' % outputs.EPNL_total)+'        ')
+        fid.write('\n')
+        fid.write('\n')
+        fid.write('SENEL = ')
+        fid.write(str('%2.2f' % outputs.SENEL_total)+'        ')
+
+        for id in range (0,nsteps):
+            fid.write('\n')
+            fid.write('\n')
+            fid.write('Emission angle = ' + str(outputs.angles[id]*180/np.pi) + '\n')
+            fid.write('Altitude = ' + str(outputs.altitude[id]) + '\n')
+            fid.write('Distance = ' + str(outputs.distance_microphone[id]) + '\n')
+            fid.write('Time = ' + str(outputs.time[id]) + '\n')
+            fid.write('f		Primary  Secondary  	Mixed  		Total' + '\n')
+
+            for ijd in range(0,24):
+                fid.write(str((frequency[ijd])) + '       ')
+                fid.write(str('%3.2f' % outputs.SPL_primary_history[id][ijd]) + '       ')
+                fid.write(str('%3.2f' % outputs.SPL_secondary_history[id][ijd]) + '       ')
+                fid.write(str('%3.2f' % outputs.SPL_mixed_history[id][ijd]) + '       ')
+                fid.write(str('%3.2f' % outputs.SPL_total_history[id][ijd]) + '       ')
+                fid.write('\n')
+
+    return
@@ -0,0 +1,309 @@
+## @ingroup Methods-Noise-Fidelity_One
+# noise_footprint.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+from SUAVE.Core import Data, Units
+
+from .Engine import noise_SAE_spectra
+from .Airframe import noise_airframe_Fink_spectra
+from .Noise_Tools import pnl_noise
+from .Noise_Tools import noise_tone_correction
+from .Noise_Tools import epnl_noise
+from .Noise_Tools import senel_noise
+from .Noise_Tools import dbA_noise
+from .Noise_Tools import noise_grid_geometric
+
+import numpy as np
+import multiprocessing
+
+# bytes held per microphone, time step and frequency band while a tile is computed, measured with tracemalloc
+bytes_per_entry = 8*40
+
+# the flight path, vehicle and analyses of the worker processes
+pool_footprint = None
+
+# ----------------------------------------------------------------------
+#  Noise Footprint
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Noise-Fidelity_One
+def noise_footprint(results,config,analyses,microphone_locations,memory_budget=1e8,processes=1):
+    """Computes the noise footprint of a mission on a grid of ground microphones: the EPNL, SENEL, maximum PNLT
+    and maximum SPL at every microphone. The airframe noise of noise_airframe_Fink and the jet noise of noise_SAE
+    are computed for tiles of microphones at a time, which can be run on a pool of processes.
+
+    Assumptions:
+    The airframe noise and the jet noise of config.propulsors['turbofan'], when there is one, are summed
+    The whole mission is flown in the configuration config
+    The mission is sampled every half second, as the time integration of the EPNL expects
+    The velocity and angle of attack are taken at every time step, not once per segment
+    The noise reaches the microphones at the time it is emitted, as in the certification tools
+    Forked processes start from a copy of the inputs, other platforms get a pickled copy
+
+    Source:
+    N/A
+
+    Inputs:
+    results.segments.*.conditions
+      frames.inertial.time                       [s]
+      frames.inertial.position_vector            [m]
+      freestream.altitude                        [m]
+      freestream.velocity                        [m/s]
+      aerodynamics.angle_of_attack               [radians]
+      propulsion.acoustic_outputs                (core and fan exit stagnation temperatures and pressures)
+    config                                       SUAVE type vehicle
+    analyses                                     analyses holding the atmosphere
+    microphone_locations                         microphone positions in the inertial frame [m], [...,3]
+    memory_budget                                memory of a tile, None for all the microphones at once [bytes]
+    processes                                    processes in the pool, 1 to run here, None for all the cores [int]
+
+    Outputs:
+    footprint.
+      microphone_locations                       [m]
+      time                                       time steps of the noise history [s]
+      EPNL                                       Effective Perceived Noise Level [EPNdB], [...]
+      SENEL                                      Single Event Noise Exposure Level [dBA], [...]
+      PNLT_max                                   maximum Tone corrected Perceived Noise Level [dB], [...]
+      SPL_dBA_max                                maximum A-weighted Sound Pressure Level [dBA], [...]
+      SPL_max                                    maximum overall Sound Pressure Level [dB], [...]
+
+    Properties Used:
+    N/A
+    """
+
+    # unpack
+    microphone_locations = np.asarray(microphone_locations,dtype=float)
+    grid_shape           = microphone_locations.shape[:-1]
+    microphones          = microphone_locations.reshape(-1,3)
+    n_microphones        = len(microphones)
+
+    flight = footprint_flight_path(results,config)
+    nsteps = len(flight.time)
+
+    # tiles of microphones that fit in the memory budget
+    if memory_budget is None:
+        tile_size = n_microphones
+    else:
+        tile_size = int(min(max(memory_budget//(bytes_per_entry*nsteps*24),1),n_microphones))
+    tiles = [microphones[start:start+tile_size] for start in range(0,n_microphones,tile_size)]
+
+    values = evaluate_tiles(flight,config,analyses,tiles,processes)
+    values = np.concatenate(values,axis=1)
+
+    # pack
+    footprint = Data()
+    footprint.microphone_locations = microphone_locations
+    footprint.time                 = flight.time
+    footprint.EPNL                 = values[0].reshape(grid_shape)
+    footprint.SENEL                = values[1].reshape(grid_shape)
+    footprint.PNLT_max             = values[2].reshape(grid_shape)
+    footprint.SPL_dBA_max          = values[3].reshape(grid_shape)
+    footprint.SPL_max              = values[4].reshape(grid_shape)
+
+    return footprint
+
+## @ingroup Methods-Noise-Fidelity_One
+def footprint_flight_path(results,config):
+    """Samples the flight conditions of all the segments of a mission every half second.
+
+    Assumptions:
+    The segments follow one another in time
+
+    Source:
+    N/A
+
+    Inputs:
+    results.segments.*.conditions                (see noise_footprint)
+    config.propulsors
+
+    Outputs:
+    flight.
+      time                                       [s]
+      position_vector                            [m]
+      altitude                                   [m]
+      velocity                                   [m/s]
+      angle_of_attack                            [deg]
+      core_temperature, core_pressure,
+      fan_temperature, fan_pressure              jet exit stagnation conditions, with a turbofan [K, Pa]
+
+    Properties Used:
+    N/A
+    """
+
+    segments = list(results.segments.values())
+
+    def stack(value):
+        return np.concatenate([value(segment.conditions) for segment in segments])
+
+    # the last point of a segment is the first point of the next
+    time = stack(lambda conditions: conditions.frames.inertial.time[:,0])
+    keep = np.hstack([True,np.diff(time)>0.])
+    time = time[keep]
+
+    noise_time = np.arange(time[0],time[-1],.5)
+
+    def sample(value):
+        return np.interp(noise_time,time,stack(value)[keep])
+
+    flight                 = Data()
+    flight.time            = noise_time
+    flight.position_vector = np.stack([sample(lambda conditions: conditions.frames.inertial.position_vector[:,ii]) \
+                                       for ii in range(3)],axis=1)
+    flight.altitude        = sample(lambda conditions: conditions.freestream.altitude[:,0])
+    flight.velocity        = sample(lambda conditions: conditions.freestream.velocity[:,0])
+    flight.angle_of_attack = sample(lambda conditions: conditions.aerodynamics.angle_of_attack[:,0]) / Units.deg
+
+    if 'turbofan' in config.propulsors:
+        flight.core_temperature = sample(lambda conditions: conditions.propulsion.acoustic_outputs.core.exit_stagnation_temperature[:,0])
+        flight.core_pressure    = sample(lambda conditions: conditions.propulsion.acoustic_outputs.core.exit_stagnation_pressure[:,0])
+        flight.fan_temperature  = sample(lambda conditions: conditions.propulsion.acoustic_outputs.fan.exit_stagnation_temperature[:,0])
+        flight.fan_pressure     = sample(lambda conditions: conditions.propulsion.acoustic_outputs.fan.exit_stagnation_pressure[:,0])
+
+    return flight
+
+## @ingroup Methods-Noise-Fidelity_One
+def footprint_tile(flight,config,analyses,microphones):
+    """Computes the noise metrics of the footprint for a tile of microphones.
+
+    Assumptions:
+    See noise_footprint
+
+    Source:
+    N/A
+
+    Inputs:
+    flight                                       sampled flight path, from footprint_flight_path
+    config                                       SUAVE type vehicle
+    analyses                                     analyses holding the atmosphere
+    microphones                                  microphone positions in the inertial frame [m], [n_microphones,3]
+
+    Outputs:
+    values                                       EPNL, SENEL, PNLT_max, SPL_dBA_max and SPL_max, one row each [n_metrics,n_microphones]
+
+    Properties Used:
+    N/A
+    """
+
+    # distance and emission angles from every position to every microphone
+    dist, theta, phi = noise_grid_geometric(flight.position_vector,microphones)
+    n_microphones, nsteps = dist.shape
+
+    # spectra of the airframe and of the jet, the microphones along the first axis and the time steps along the second
+    airframe          = noise_airframe_Fink_spectra(config,analyses,flight.velocity,flight.altitude,dist,theta,phi)
+    SPL_total_history = airframe.SPL_total_history
+
+    if 'turbofan' in config.propulsors:
+        engine            = noise_SAE_spectra(config.propulsors['turbofan'],analyses,flight.core_temperature,flight.core_pressure, \
+                                              flight.fan_temperature,flight.fan_pressure,flight.velocity,flight.altitude, \
+                                              flight.angle_of_attack,dist,theta)
+        SPL_total_history = 10.*np.log10(10.**(0.1*SPL_total_history)+10.**(0.1*engine.SPL_total_history))
+
+    # the noise metrics of every history
+    SPL_dBA_history = np.max(dbA_noise(SPL_total_history),axis=-1)
+    SPL_history     = 10.*np.log10(np.sum(10.**(0.1*SPL_total_history),axis=-1))
+
+    SPL_total_history = SPL_total_history.reshape(-1,24)
+    PNLT = pnl_noise(SPL_total_history) + noise_tone_correction(SPL_total_history)
+    PNLT = PNLT.reshape(n_microphones,nsteps)
+
+    values = np.stack([epnl_noise(PNLT),
+                       senel_noise(SPL_dBA_history),
+                       np.max(PNLT,axis=1),
+                       np.max(SPL_dBA_history,axis=1),
+                       np.max(SPL_history,axis=1)])
+
+    return values
+
+## @ingroup Methods-Noise-Fidelity_One
+def evaluate_tiles(flight,config,analyses,tiles,processes):
+    """Computes the tiles of the footprint here or on a pool of processes. Where processes can be forked the
+    workers start from the inputs as they are, otherwise they are pickled to each of them once.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    flight                                       sampled flight path, from footprint_flight_path
+    config                                       SUAVE type vehicle
+    analyses                                     analyses holding the atmosphere
+    tiles                                        microphone positions of each tile [list of arrays]
+    processes                                    1 to run here, None for all the cores [int]
+
+    Outputs:
+    values                                       values of each tile, from footprint_tile [list of arrays]
+
+    Properties Used:
+    N/A
+    """
+
+    global pool_footprint
+
+    if processes == 1:
+        values = [footprint_tile(flight,config,analyses,tile) for tile in tiles]
+    elif 'fork' in multiprocessing.get_all_start_methods():
+        pool_footprint = (flight,config,analyses)
+        try:
+            with multiprocessing.get_context('fork').Pool(processes) as pool:
+                values = pool.map(evaluate_pool_tile,tiles,chunksize=1)
+        finally:
+            pool_footprint = None
+    else:
+        with multiprocessing.Pool(processes,initializer=initialize_pool,initargs=(flight,config,analyses)) as pool:
+            values = pool.map(evaluate_pool_tile,tiles,chunksize=1)
+
+    return values
+
+def initialize_pool(flight,config,analyses):
+    """Sets the flight path, vehicle and analyses of a worker process.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    flight                                       sampled flight path
+    config                                       SUAVE type vehicle
+    analyses                                     analyses holding the atmosphere
+
+    Outputs:
+    None
+
+    Properties Used:
+    N/A
+    """
+
+    global pool_footprint
+    pool_footprint = (flight,config,analyses)
+
+def evaluate_pool_tile(microphones):
+    """Computes a tile of the footprint in a worker process.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    microphones                                  microphone positions in the inertial frame [m], [n_microphones,3]
+
+    Outputs:
+    values                                       see footprint_tile
+
+    Properties Used:
+    N/A
+    """
+
+    flight, config, analyses = pool_footprint
+
+    return footprint_tile(flight,config,analyses,microphones)
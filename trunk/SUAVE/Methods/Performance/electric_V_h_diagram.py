@@ -2,7 +2,7 @@
 # electric_V_h_diagram.py
 #
 # Created: Jan 2021, J. Smart
-# Modified:
+# Modified: Oct 2026, SUAVE Team
 
 #------------------------------------------------------------------------------
 # Imports
@@ -14,7 +14,6 @@ from SUAVE.Core import Units, Data
 from SUAVE.Methods.Performance.propeller_single_point import propeller_single_point
 
 import numpy as np
-import matplotlib.pyplot as plt
 
 #------------------------------------------------------------------------------
 # Flight Envelope Function
@@ -157,6 +156,8 @@ def electric_V_h_diagram(vehicle,
 
     if display_plot:
 
+        import matplotlib.pyplot as plt
+
         # Get Speed and Altitude to Agree with Climb Rate Dimensions
 
         speed_space, alt_space  = np.meshgrid(speed_range, alt_range)
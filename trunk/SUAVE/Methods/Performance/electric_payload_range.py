@@ -2,7 +2,7 @@
 # electric_payload_range.py
 #
 # Created: Jan 2021, J. Smart
-# Modified:
+# Modified: Oct 2026, SUAVE Team
 
 #------------------------------------------------------------------------------
 # Imports
@@ -11,7 +11,6 @@
 from SUAVE.Core import Units, Data
 
 import numpy as np
-import matplotlib.pyplot as plt
 
 #------------------------------------------------------------------------------
 # Electric Payload Range Function
@@ -116,6 +115,7 @@ def electric_payload_range(vehicle,
     payload_range.takeoff_weight    = TOW
 
     if display_plot:
+        import matplotlib.pyplot as plt
 
         plt.plot(R, PLD, 'r')
         plt.xlabel('Range (m)')
@@ -2,7 +2,7 @@
 # propeller_range_endurance_speeds.py
 #
 # Created: Dec 2020, E. Botero
-# Modified: 
+# Modified: Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -11,6 +11,7 @@
 from SUAVE.Core import Data
 import numpy as np
 import scipy as sp
+import scipy.optimize
 
 import SUAVE
 
@@ -2,7 +2,7 @@
 # propeller_single_point.py
 #
 # Created: Jan 2021, J. Smart
-# Modified:
+# Modified: Oct 2026, SUAVE Team
 
 #-------------------------------------------------------------------------------
 # Imports
@@ -10,7 +10,6 @@
 
 from SUAVE.Core import Units, Data
 
-import matplotlib.pyplot as plt
 import numpy as np
 
 # ------------------------------------------------------------------------------
@@ -135,6 +134,8 @@ def propeller_single_point(energy_network,
     # ----------------------------------------------------------------------------
 
     if plots:
+        import matplotlib.pyplot as plt
+
         fig = plt.figure(1)
         plt.plot(r_BEMT, va_BEMT, 'ro-', label='axial BEMT')
         plt.plot(r_BEMT, vt_BEMT, 'bo-', label='tangential BEMT')
@@ -5,12 +5,14 @@
 # Created:  ### 2014, M. Vegh
 # Modified: Sep 2015, M. Vegh
 #           Feb 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
 # ----------------------------------------------------------------------
 
 import scipy as sp
+import scipy.optimize
 from .find_ragone_properties import find_ragone_properties
 
 # ----------------------------------------------------------------------
@@ -3,6 +3,7 @@
 #
 # Created : Apr 2015, M. Vegh 
 # Modified: Feb 2016, E. Botero
+#           Oct 2026, SUAVE Team
   
 # ----------------------------------------------------------------------
 #  Imports
@@ -10,6 +11,7 @@
 
 import numpy as np
 import scipy as sp
+import scipy.optimize
 from SUAVE.Core import Units
 from .find_voltage_larminie import find_voltage_larminie
 from .find_power_diff_larminie import find_power_diff_larminie
@@ -4,12 +4,14 @@
 # Created : Apr 2015, M. Vegh 
 # Modified: Sep 2015, M. Vegh
 #           Feb 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
 # ----------------------------------------------------------------------
 
 import scipy as sp
+import scipy.optimize
 import numpy as np
 from SUAVE.Core import Units
 from SUAVE.Methods.Power.Fuel_Cell.Discharge.find_power_larminie import find_power_larminie
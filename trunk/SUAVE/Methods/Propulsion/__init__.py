@@ -14,5 +14,6 @@ from .fm_id import fm_id
 from .fm_solver import fm_solver
 from .rayleigh import rayleigh
 from .nozzle_calculations import exit_Mach_shock, mach_area, normal_shock, pressure_ratio_isentropic, pressure_ratio_shock_in_nozzle
+from .bemt_calculations import compute_inflow_and_tip_loss, compute_airfoil_aerodynamics, compute_dR_dpsi
 from . import electric_motor_sizing
 from .liquid_rocket_sizing import liquid_rocket_sizing
\ No newline at end of file
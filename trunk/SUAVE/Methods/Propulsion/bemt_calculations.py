@@ -0,0 +1,195 @@
+## @ingroup Methods-Propulsion
+# bemt_calculations.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+
+# ----------------------------------------------------------------------
+#  BEMT calculations
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Propulsion
+def compute_inflow_and_tip_loss(PSI,Ua,Ut,U,beta,r,c,a,nu,R,B):
+    """ Computes the velocities, the Prandtl tip loss and the circulation at blade stations for a
+    given inflow angle PSI. This is the part of the propeller and rotor BEMT Newton iteration before
+    the airfoil lookup. All the arrays are of the same shape, one entry per station.
+
+    Assumptions:
+    None
+
+    Source:
+    Drela, M. "Qprop Formulation", MIT AeroAstro, June 2006
+    http://web.mit.edu/drela/Public/web/qprop/qprop_theory.pdf
+
+    Inputs:
+    PSI      inflow angle                  [radians]
+    Ua       axial velocity                [m/s]
+    Ut       tangential velocity           [m/s]
+    U        total velocity                [m/s]
+    beta     blade pitch                   [radians]
+    r        radial coordinate             [m]
+    c        chord                         [m]
+    a        speed of sound                [m/s]
+    nu       kinematic viscosity           [m^2/s]
+    R        tip radius                    [m]
+    B        number of blades              [-]
+
+    Outputs:
+    sin_psi, cos_psi                       [-]
+    Wa, Wt   velocities at the blade       [m/s]
+    va, vt   induced velocities            [m/s]
+    alpha    angle of attack               [radians]
+    W        total velocity at the blade   [m/s]
+    Ma       Mach number                   [-]
+    Re       Reynolds number               [-]
+    piece, arccos_piece                    [-]
+    Gamma    circulation                   [m^2/s]
+
+    """
+    pi           = np.pi
+    sin_psi      = np.sin(PSI)
+    cos_psi      = np.cos(PSI)
+    Wa           = 0.5*Ua + 0.5*U*sin_psi
+    Wt           = 0.5*Ut + 0.5*U*cos_psi
+    va           = Wa - Ua
+    vt           = Ut - Wt
+    alpha        = beta - np.arctan2(Wa,Wt)
+    W            = (Wa*Wa + Wt*Wt)**0.5
+    Ma           = (W)/a        # a is the speed of sound
+    lamdaw       = r*Wa/(R*Wt)
+
+    # Limiter to keep from Nan-ing
+    lamdaw[lamdaw<0.] = 0.
+    f            = (B/2.)*(1.-r/R)/lamdaw
+    f[f<0.]      = 0.
+    piece        = np.exp(-f)
+    arccos_piece = np.arccos(piece)
+    F            = 2.*arccos_piece/pi
+    Gamma        = vt*(4.*pi*r/B)*F*(1.+(4.*lamdaw*R/(pi*B*r))*(4.*lamdaw*R/(pi*B*r)))**0.5
+    Re           = (W*c)/nu
+
+    return sin_psi, cos_psi, Wa, Wt, va, vt, alpha, W, Ma, Re, piece, arccos_piece, Gamma
+
+## @ingroup Methods-Propulsion
+def compute_airfoil_aerodynamics(alpha,Re,Ma,airfoil_index,a_geo,cl_sur,cd_sur,tc):
+    """ Looks up the lift and drag coefficients of blade stations. When the blade has airfoil polars,
+    airfoil_index holds the airfoil of each station and each airfoil surrogate is evaluated once, on
+    its own stations only. Without polars a 2 pi lift curve slope with a Karman-Tsien correction is used.
+
+    Assumptions:
+    Without polars, DAE51 drag at Re = 50k and total stall by 90 deg
+
+    Source:
+    N/A
+
+    Inputs:
+    alpha          angle of attack                          [radians]
+    Re             Reynolds number                          [-]
+    Ma             Mach number                              [-]
+    airfoil_index  airfoil of each station, None for none   [-]
+    a_geo          airfoil geometry files                   [-]
+    cl_sur         lift coefficient surrogates              [-]
+    cd_sur         drag coefficient surrogates              [-]
+    tc             thickness to chord ratio                 [-]
+
+    Outputs:
+    Cl             lift coefficient                         [-]
+    Cdval          drag coefficient                         [-]
+
+    """
+    pi = np.pi
+
+    # If airfoils are defined, using airfoil surrogate
+    if airfoil_index is not None:
+        Cl    = np.zeros_like(alpha)
+        Cdval = np.zeros_like(alpha)
+        for jj in range(len(cl_sur)):
+            locs = airfoil_index == jj
+            if np.any(locs):
+                Cl[locs]    = cl_sur[a_geo[jj]](Re[locs],alpha[locs],grid=False)
+                Cdval[locs] = cd_sur[a_geo[jj]](Re[locs],alpha[locs],grid=False)
+
+        return Cl, Cdval
+
+    # Estimate Cl max
+    Cl_max_ref = -0.0009*tc**3 + 0.0217*tc**2 - 0.0442*tc + 0.7005
+    Re_ref     = 9.*10**6
+    Cl1maxp    = Cl_max_ref * ( Re / Re_ref ) **0.1
+
+    # If not airfoil polar provided, use 2*pi as lift curve slope
+    Cl = 2.*pi*alpha
+
+    # By 90 deg, it's totally stalled.
+    Cl[Cl>Cl1maxp]  = Cl1maxp[Cl>Cl1maxp] # This line of code is what changed the regression testing
+    Cl[alpha>=pi/2] = 0.
+
+    # Scale for Mach, this is Karmen_Tsien, if the blade segments are supersonic, don't scale
+    sub     = Ma<1.
+    Ma_sub  = Ma[sub]
+    Cl[sub] = Cl[sub]/((1-Ma_sub*Ma_sub)**0.5+((Ma_sub*Ma_sub)/(1+(1-Ma_sub*Ma_sub)**0.5))*Cl[sub]/2)
+
+    #This is an atrocious fit of DAE51 data at RE=50k for Cd
+    Cdval = (0.108*(Cl*Cl*Cl*Cl)-0.2612*(Cl*Cl*Cl)+0.181*(Cl*Cl)-0.0139*Cl+0.0278)*((50000./Re)**0.2)
+    Cdval[alpha>=pi/2] = 2.
+
+    return Cl, Cdval
+
+## @ingroup Methods-Propulsion
+def compute_dR_dpsi(PSI_terms,Ua,Ut,U,beta,r,R,B):
+    """ An analytical derivative of the BEMT residual with respect to the inflow angle, derived by
+    taking a derivative of the equations of compute_inflow_and_tip_loss. This was solved symbolically
+    in Matlab and exported.
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    PSI_terms  (sin_psi, cos_psi, Wa, Wt, piece, arccos_piece) from compute_inflow_and_tip_loss
+    Ua       axial velocity                [m/s]
+    Ut       tangential velocity           [m/s]
+    U        total velocity                [m/s]
+    beta     blade pitch                   [radians]
+    r        radial coordinate             [m]
+    R        tip radius                    [m]
+    B        number of blades              [-]
+
+    Outputs:
+    dR_dpsi                                [m^2/s]
+
+    """
+    sin_psi, cos_psi, Wa, Wt, piece, arccos_piece = PSI_terms
+
+    pi          = np.pi
+    pi2         = pi*pi
+    BB          = B*B
+    BBB         = BB*B
+    f_wt_2      = 4*Wt*Wt
+    f_wa_2      = 4*Wa*Wa
+    Ucospsi     = U*cos_psi
+    Usinpsi     = U*sin_psi
+    Utcospsi    = Ut*cos_psi
+    Uasinpsi    = Ua*sin_psi
+    UapUsinpsi  = (Ua + Usinpsi)
+    utpUcospsi  = (Ut + Ucospsi)
+    utpUcospsi2 = utpUcospsi*utpUcospsi
+    UapUsinpsi2 = UapUsinpsi*UapUsinpsi
+    dR_dpsi     = ((4.*U*r*arccos_piece*sin_psi*((16.*UapUsinpsi2)/(BB*pi2*f_wt_2) + 1.)**(0.5))/B -
+                   (pi*U*(Ua*cos_psi - Ut*sin_psi)*(beta - np.arctan((Wa+Wa)/(Wt+Wt))))/(2.*(f_wt_2 + f_wa_2)**(0.5))
+                   + (pi*U*(f_wt_2 +f_wa_2)**(0.5)*(U + Utcospsi  +  Uasinpsi))/(2.*(f_wa_2/(f_wt_2) + 1.)*utpUcospsi2)
+                   - (4.*U*piece*((16.*UapUsinpsi2)/(BB*pi2*f_wt_2) + 1.)**(0.5)*(R - r)*(Ut/2. -
+                    (Ucospsi)/2.)*(U + Utcospsi + Uasinpsi ))/(f_wa_2*(1. - np.exp(-(B*(Wt+Wt)*(R -
+                    r))/(r*(Wa+Wa))))**(0.5)) + (128.*U*r*arccos_piece*(Wa+Wa)*(Ut/2. - (Ucospsi)/2.)*(U +
+                    Utcospsi  + Uasinpsi ))/(BBB*pi2*utpUcospsi*utpUcospsi2*((16.*f_wa_2)/(BB*pi2*f_wt_2) + 1.)**(0.5)))
+
+    dR_dpsi[np.isnan(dR_dpsi)] = 0.1
+
+    return dR_dpsi
@@ -6,6 +6,7 @@
 #           Jul 2017, M. Clarke
 #           Mar 2020, M. Clarke
 #           Sep 2020, M. Clarke
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -14,6 +15,7 @@
 import SUAVE
 import numpy as np
 import scipy as sp
+import scipy.integrate
 from SUAVE.Core import Units , Data
 from scipy.optimize import root
 from SUAVE.Methods.Geometry.Two_Dimensional.Cross_Section.Airfoil.import_airfoil_geometry \
@@ -0,0 +1,193 @@
+## @ingroup Methods-Utilities
+# Grid_Interpolator.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+
+# ----------------------------------------------------------------------
+#  Interpolator Class
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Utilities
+class Grid_Interpolator():
+    """Interpolates values given on a rectilinear grid of any number of dimensions, linearly or with cubic
+    Hermite splines along each axis. The cost of an evaluation does not grow with the size of the grid.
+
+    Assumptions:
+    Points outside of the grid take the values at its edges
+    The slopes of the cubic splines are central differences, one sided at the ends of an axis
+
+    Source:
+    Information at:
+    https://en.wikipedia.org/wiki/Cubic_Hermite_spline
+    """
+
+    def __init__(self, grid, values, method='linear'):
+        """This sets the grid and precomputes the cell lookup of each axis.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        grid      [list]   increasing coordinates along each axis, at least two per axis
+        values    [-]      array of len(grid[0]) x len(grid[1]) x ... values
+        method    <string> 'linear' or 'cubic'
+
+        Outputs:
+        None
+
+        Properties Used:
+        N/A
+        """
+        if not method in ['linear','cubic']:
+            raise ValueError('Grid interpolation method must be linear or cubic')
+
+        self.grid    = [np.asarray(axis,dtype=float) for axis in grid]
+        self.values  = np.asarray(values,dtype=float)
+        self.method  = method
+        self.shape   = self.values.shape
+
+        if self.shape != tuple([len(axis) for axis in self.grid]):
+            raise ValueError('Grid interpolation values do not match the grid')
+        if min(self.shape) < 2:
+            raise ValueError('Grid interpolation needs at least two points along each axis')
+
+        # evenly spaced axes find their cells by arithmetic instead of a search
+        self.spacing = []
+        for axis in self.grid:
+            steps = np.diff(axis)
+            if np.all(steps == steps[0]):
+                self.spacing.append(steps[0])
+            else:
+                self.spacing.append(None)
+
+        # flat indices of the grid points
+        self.flat_values = self.values.ravel()
+        self.strides     = np.cumprod((self.shape[1:] + (1,))[::-1])[::-1]
+
+    def predict(self, points):
+        """Interpolates the values at a set of points, in the form of the sklearn surrogates.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        points    [-]      n x dimensions array
+
+        Outputs:
+        values    [-]      n x 1 array
+
+        Properties Used:
+        N/A
+        """
+        return self.interpolate(points)
+
+    def interpolate(self, points):
+        """Sums the tensor product of the weights of each axis over the grid points of the cells.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        points    [-]      n x dimensions array
+
+        Outputs:
+        values    [-]      n x 1 array
+
+        Properties Used:
+        N/A
+        """
+        points = np.atleast_2d(points)
+        n      = len(points)
+
+        flat    = np.zeros((n,1),dtype=int)
+        weights = np.ones((n,1))
+        for axis in range(len(self.grid)):
+            indices, axis_weights = self.axis_weights(axis,points[:,axis])
+            flat    = (flat[:,:,None] + self.strides[axis]*indices[:,None,:]).reshape(n,-1)
+            weights = (weights[:,:,None]*axis_weights[:,None,:]).reshape(n,-1)
+
+        values = np.sum(weights*self.flat_values[flat],axis=1)
+
+        return values[:,None]
+
+    def axis_weights(self, axis, x):
+        """Finds the cells of a set of coordinates along an axis, and the weights of the grid points of the cells.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        axis          [-]      index of the axis
+        x             [-]      coordinates along the axis
+
+        Outputs:
+        indices       [-]      n x 2 (linear) or n x 4 (cubic) grid point indices
+        weights       [-]      n x 2 (linear) or n x 4 (cubic) weights
+
+        Properties Used:
+        N/A
+        """
+        grid    = self.grid[axis]
+        spacing = self.spacing[axis]
+        n_grid  = len(grid)
+
+        x = np.minimum(np.maximum(x,grid[0]),grid[-1])
+
+        # cell lookup
+        if spacing is not None:
+            i = np.floor((x - grid[0])/spacing).astype(int)
+        else:
+            i = np.searchsorted(grid,x,side='right') - 1
+        i = np.minimum(np.maximum(i,0),n_grid-2)
+
+        h = grid[i+1] - grid[i]
+        t = (x - grid[i])/h
+
+        if self.method == 'linear':
+            indices      = np.empty((len(x),2),dtype=int)
+            weights      = np.empty((len(x),2))
+            indices[:,0] = i
+            indices[:,1] = i + 1
+            weights[:,0] = 1. - t
+            weights[:,1] = t
+            return indices, weights
+
+        # cubic Hermite spline, with the slopes at both ends of the cell written in terms of the grid points
+        indices      = np.empty((len(x),4),dtype=int)
+        indices[:,0] = np.maximum(i-1,0)
+        indices[:,1] = i
+        indices[:,2] = i + 1
+        indices[:,3] = np.minimum(i+2,n_grid-1)
+        d_0 = grid[i+1] - grid[indices[:,0]]
+        d_1 = grid[indices[:,3]] - grid[i]
+
+        h00 = 2.*t*t*t - 3.*t*t + 1.
+        h01 = 1. - h00
+        h10 = (t*t*t - 2.*t*t + t)*h
+        h11 = (t*t*t - t*t)*h
+
+        weights      = np.empty((len(x),4))
+        weights[:,0] = -h10/d_0
+        weights[:,1] = h00 - h11/d_1
+        weights[:,2] = h01 + h10/d_0
+        weights[:,3] = h11/d_1
+
+        return indices, weights
@@ -6,4 +6,6 @@ from . import Chebyshev
 from . import soft_max
 #import Utilities
 from . import latin_hypercube_sampling
-from . import Cubic_Spline_Blender
\ No newline at end of file
+from . import Cubic_Spline_Blender
+from . import surrogate_training_cache
+from . import Grid_Interpolator
\ No newline at end of file
@@ -0,0 +1,277 @@
+## @ingroup Methods-Utilities
+# surrogate_training_cache.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+from SUAVE.Core import Data
+
+import numpy as np
+import hashlib
+import tempfile
+import zipfile
+import os
+
+# ----------------------------------------------------------------------
+#   Training Fingerprint
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Utilities
+def training_fingerprint(tag,geometry,settings,conditions,ignored_keys=[]):
+    """Hashes everything that the training data of a surrogate is sampled from, so that the same
+    vehicle with the same settings and training conditions gives the same fingerprint in any run.
+
+    Assumptions:
+    Functions are skipped, as are objects without a value based representation beyond their type
+
+    Source:
+    N/A
+
+    Inputs:
+    tag                [string]  name of the analysis that samples the training data
+    geometry           [Data]
+    settings           [Data]
+    conditions         [list]    training conditions, e.g. angles of attack and Mach numbers
+    ignored_keys       [list]    keys that do not change the training data, e.g. caches
+
+    Outputs:
+    fingerprint        [string]
+
+    Properties Used:
+    N/A
+    """
+
+    ignored_keys = list(ignored_keys) + ['training_cache_directory','training_cache_size']
+
+    sha = hashlib.sha1()
+    hash_value(sha,tag,set())
+    hash_value(sha,conditions,set())
+    hash_value(sha,settings,set(),ignored_keys)
+    hash_value(sha,geometry,set(),ignored_keys)
+
+    return sha.hexdigest()
+
+## @ingroup Methods-Utilities
+def hash_value(sha,value,visited,ignored_keys=[]):
+    """Adds a value and everything it holds to a hash.
+
+    Assumptions:
+    Functions and the ignored keys are skipped, objects represented by their address are hashed by type
+
+    Source:
+    N/A
+
+    Inputs:
+    sha                [hashlib object]
+    value              [any]
+    visited            [set]
+    ignored_keys       [list]
+
+    Outputs:
+    None
+
+    Properties Used:
+    N/A
+    """
+
+    if isinstance(value,np.ndarray):
+        sha.update(str((value.dtype,value.shape)).encode())
+        if value.dtype == object:
+            hash_value(sha,value.tolist(),visited,ignored_keys)
+        else:
+            sha.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value,(dict,list,tuple)):
+        if id(value) in visited:
+            return
+        visited.add(id(value))
+        sha.update(type(value).__name__.encode())
+        if isinstance(value,dict):
+            for k,v in value.items():
+                if k in ignored_keys or callable(v):
+                    continue
+                sha.update(str(k).encode())
+                hash_value(sha,v,visited,ignored_keys)
+        else:
+            for v in value:
+                hash_value(sha,v,visited,ignored_keys)
+    elif isinstance(value,(set,frozenset)):
+        for v in sorted(value,key=repr):
+            hash_value(sha,v,visited,ignored_keys)
+    elif not callable(value):
+        text = repr(value)
+        if ' at 0x' in text:
+            text = type(value).__module__ + '.' + type(value).__name__
+        sha.update(text.encode())
+
+    return
+
+# ----------------------------------------------------------------------
+#   Load and Save
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Utilities
+def load_training(directory,fingerprint,training):
+    """Loads training data from the training cache into the training of an analysis. A loaded file is
+    marked as recently used, so that it is the last to be evicted.
+
+    Assumptions:
+    A missing, evicted or partly written file is a cache miss
+
+    Source:
+    N/A
+
+    Inputs:
+    directory          [string]  None turns the cache off
+    fingerprint        [string]
+    training           [Data]
+
+    Outputs:
+    loaded             [boolean]
+    training.*         [array]   the arrays that were saved, nested Data is rebuilt
+
+    Properties Used:
+    N/A
+    """
+
+    if directory is None:
+        return False
+
+    filename = os.path.join(directory,fingerprint + '.npz')
+    try:
+        with np.load(filename) as data:
+            arrays = [(key,data[key]) for key in data.files]
+        os.utime(filename,None)
+    except (IOError,OSError,EOFError,ValueError,zipfile.BadZipFile):
+        return False
+
+    for key,value in arrays:
+        names  = key.split('/')
+        target = training
+        for name in names[:-1]:
+            if not isinstance(target.get(name,None),Data):
+                target[name] = Data()
+            target = target[name]
+        target[names[-1]] = value
+
+    return True
+
+## @ingroup Methods-Utilities
+def save_training(directory,fingerprint,training,size_limit):
+    """Saves the training data of an analysis to the training cache, then evicts the least recently used
+    files until the cache fits in its size.
+
+    Assumptions:
+    Files are written under a temporary name and then renamed, so that analyses running at the same
+    time never read a partly written file
+
+    Source:
+    N/A
+
+    Inputs:
+    directory          [string]  None turns the cache off
+    fingerprint        [string]
+    training           [Data]    arrays and Data of arrays are saved, everything else is skipped
+    size_limit         [bytes]
+
+    Outputs:
+    None
+
+    Properties Used:
+    N/A
+    """
+
+    if directory is None:
+        return
+
+    arrays = dict()
+    flatten_training(training,'',arrays)
+
+    if not os.path.isdir(directory):
+        os.makedirs(directory)
+
+    filename    = os.path.join(directory,fingerprint + '.npz')
+    handle,temp = tempfile.mkstemp(suffix='.tmp',dir=directory)
+    with os.fdopen(handle,'wb') as f:
+        np.savez(f,**arrays)
+    os.replace(temp,filename)
+
+    evict_training(directory,size_limit,filename)
+
+    return
+
+def flatten_training(training,prefix,arrays):
+    """Collects the arrays of the training data, the keys of nested Data joined by a slash.
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    training           [Data]
+    prefix             [string]
+    arrays             [dict]
+
+    Outputs:
+    arrays             [dict]
+
+    Properties Used:
+    N/A
+    """
+
+    for key,value in training.items():
+        if isinstance(value,dict):
+            flatten_training(value,prefix + key + '/',arrays)
+        elif value is not None and not callable(value):
+            value = np.asarray(value)
+            if value.dtype != object:
+                arrays[prefix + key] = value
+
+    return
+
+def evict_training(directory,size_limit,keep):
+    """Removes the least recently used files of the training cache until it fits in its size.
+
+    Assumptions:
+    The file that was just saved is always kept
+
+    Source:
+    N/A
+
+    Inputs:
+    directory          [string]
+    size_limit         [bytes]
+    keep               [string]
+
+    Outputs:
+    None
+
+    Properties Used:
+    N/A
+    """
+
+    files = []
+    for name in os.listdir(directory):
+        if not name.endswith('.npz'):
+            continue
+        filename = os.path.join(directory,name)
+        try:
+            stat = os.stat(filename)
+        except OSError:
+            continue
+        files.append((stat.st_mtime,stat.st_size,filename))
+
+    size = 0
+    for mtime,file_size,filename in sorted(files,reverse=True):
+        size += file_size
+        if size > size_limit and filename != keep:
+            try:
+                os.remove(filename)
+            except OSError:
+                pass
+
+    return
@@ -5,6 +5,7 @@
 # Modified: Feb 2016, M. Vegh
 #           Apr 2017, T. MacDonald
 #           Jul 2020, M. Clarke
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -15,8 +16,15 @@ import SUAVE
 from SUAVE.Core import Data, DataOrdered
 from SUAVE.Analyses import Process
 from copy import deepcopy
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from . import helper_functions as help_fun
 import numpy as np
+import multiprocessing
+import threading
+import json
+import os
 
 # ----------------------------------------------------------------------
 #  Nexus Class
@@ -69,6 +77,14 @@ class Nexus(Data):
         self.last_fidelity          = None
         self.evaluation_count       = 0
         self.force_evaluate         = False
+        self.evaluation_cache_size  = 0
+        self.evaluation_cache_file  = None
+        self.evaluation_cache       = None
+        self.finite_difference_processes = 1
+        self.finite_difference_central   = False
+        self.compiled_aliases            = None
+        self.batch_executor              = 'serial'
+        self.batch_processes             = None
     
     def evaluate(self,x = None):
         """This function runs the problem you setup in SUAVE.
@@ -156,13 +172,9 @@ class Nexus(Data):
             None
         """           
     
-        self.evaluate(x)
-        
-        aliases     = self.optimization_problem.aliases
         objective   = self.optimization_problem.objective
-        results     = self.results
     
-        objective_value  = help_fun.get_values(self,objective,aliases)  
+        objective_value  = self.get_values(x,objective)
         scaled_objective = help_fun.scale_obj_values(objective,objective_value)
         
         return scaled_objective.astype(np.double) 
@@ -186,11 +198,7 @@ class Nexus(Data):
             None
             """           
         
-        self.evaluate(x)
-        
-        aliases     = self.optimization_problem.aliases
         constraints = self.optimization_problem.constraints
-        results     = self.results
         
         # Setup constraints  
         indices = []
@@ -204,7 +212,7 @@ class Nexus(Data):
         else:
 
             # get constaint values 
-            constraint_values = help_fun.get_values(self,iqconstraints,aliases)          
+            constraint_values = self.get_values(x,iqconstraints)
             
             # scale bounds 
             scaled_bnd_constraints  = help_fun.scale_const_bnds(iqconstraints)
@@ -239,11 +247,7 @@ class Nexus(Data):
             None
         """         
     
-        self.evaluate(x)
-
-        aliases     = self.optimization_problem.aliases
         constraints = self.optimization_problem.constraints
-        results     = self.results
         
         # Setup constraints  
         indices = []
@@ -257,7 +261,7 @@ class Nexus(Data):
         if eqconstraints == []:
             scaled_constraints = []
         else:
-            constraint_values  = help_fun.get_values(self,eqconstraints,aliases)
+            constraint_values  = self.get_values(x,eqconstraints)
             scaled_constraints = help_fun.scale_const_values(eqconstraints,constraint_values) - help_fun.scale_const_bnds(eqconstraints)
 
         return scaled_constraints   
@@ -281,18 +285,150 @@ class Nexus(Data):
             None
         """         
         
-        self.evaluate(x)
-        
-        aliases     = self.optimization_problem.aliases
         constraints = self.optimization_problem.constraints
-        results     = self.results
     
-        constraint_values  = help_fun.get_values(self,constraints,aliases) 
+        constraint_values  = self.get_values(x,constraints)
         scaled_constraints = help_fun.scale_const_values(constraints,constraint_values) 
 
         return scaled_constraints     
     
     
+    def get_values(self,x,outputs):
+        """Retrieve the unscaled values of objectives or constraints at the inputs x. Points that were
+            already run are taken from the evaluation cache, without running the procedure again.
+    
+            Assumptions:
+            The procedure gives the same results for the same inputs and fidelity level
+            On a cache hit only the inputs are set, the procedure is run again by the next call that needs the rest of
+            the nexus
+    
+            Source:
+            N/A
+    
+            Inputs:
+            x                  [vector]
+            outputs            [array]
+    
+            Outputs:
+            values             [vector]
+    
+            Properties Used:
+            self.evaluation_cache_size
+            self.force_evaluate
+        """
+        
+        if x is None or self.force_evaluate or not self.evaluation_cache_size:
+            self.evaluate(x)
+            return help_fun.get_compiled_values(self,self.compile_aliases(outputs))
+        
+        key   = (self.fidelity_level,tuple(np.asarray(x,dtype=float).ravel().tolist()))
+        cache = self.load_evaluation_cache()
+        tags  = np.array(outputs)[:,0]
+        entry = cache.get(key)
+        
+        if entry is None or not all([tag in entry for tag in tags]):
+            self.evaluate(x)
+            entry = self.store_evaluation(key,outputs)
+        else:
+            # the vehicle and summary are still those of the last point that was run
+            self.unpack_inputs(x)
+            self.last_inputs = None
+            cache.move_to_end(key)
+        
+        return np.array([entry[tag] for tag in tags])
+    
+    def store_evaluation(self,key,outputs):
+        """Stores the values of the last point that was run in the evaluation cache, dropping the least
+            recently used points past evaluation_cache_size. If there is an evaluation_cache_file the point is
+            appended to it.
+    
+            Assumptions:
+            The objectives and constraints other than the outputs are stored if the summary has them
+    
+            Source:
+            N/A
+    
+            Inputs:
+            key                (fidelity level, scaled inputs) [tuple]
+            outputs            [array]
+    
+            Outputs:
+            entry              output, objective and constraint values by tag [dict]
+    
+            Properties Used:
+            self.evaluation_cache_size
+            self.evaluation_cache_file
+        """
+        
+        problem = self.optimization_problem
+        
+        tags   = np.array(outputs)[:,0]
+        values = help_fun.get_compiled_values(self,self.compile_aliases(outputs))
+        entry  = dict(zip(tags.tolist(),values.tolist()))
+        
+        for others in [problem.objective,problem.constraints]:
+            if len(others):
+                try:
+                    values = help_fun.get_compiled_values(self,self.compile_aliases(others))
+                except (AttributeError,KeyError):
+                    continue
+                entry.update(zip(np.array(others)[:,0].tolist(),values.tolist()))
+        
+        cache      = self.load_evaluation_cache()
+        cache[key] = entry
+        cache.move_to_end(key)
+        while len(cache) > self.evaluation_cache_size:
+            cache.popitem(last=False)
+            
+        if self.evaluation_cache_file is not None:
+            line = json.dumps(dict(fidelity_level=key[0],inputs=list(key[1]),values=entry))
+            with open(self.evaluation_cache_file,'a') as f:
+                f.write(line + '\n')
+        
+        return entry
+    
+    def load_evaluation_cache(self):
+        """Returns the evaluation cache. The first time, the points of the evaluation_cache_file are read
+            in if it exists, so a restarted optimization replays the points it already ran.
+    
+            Assumptions:
+            The file holds one JSON point per line, the last points are kept
+    
+            Source:
+            N/A
+    
+            Inputs:
+            None
+    
+            Outputs:
+            evaluation_cache   [OrderedDict]
+    
+            Properties Used:
+            self.evaluation_cache_size
+            self.evaluation_cache_file
+        """
+        
+        if self.evaluation_cache is not None:
+            return self.evaluation_cache
+        
+        cache    = OrderedDict()
+        filename = self.evaluation_cache_file
+        if filename is not None and os.path.isfile(filename):
+            with open(filename,'r') as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    point = json.loads(line)
+                    key   = (point['fidelity_level'],tuple(point['inputs']))
+                    cache[key] = point['values']
+                    cache.move_to_end(key)
+            while len(cache) > self.evaluation_cache_size:
+                cache.popitem(last=False)
+        
+        self.evaluation_cache = cache
+        
+        return cache
+    
     def unpack_inputs(self,x = None):
         """Put's the values of the problem in the right place.
     
@@ -321,10 +457,46 @@ class Nexus(Data):
         converted_values = help_fun.convert_values(inputs)
         
         # Set the dictionary
-        aliases = self.optimization_problem.aliases
-        vehicle = self.vehicle_configurations
-        
-        self    = help_fun.set_values(self,inputs,converted_values,aliases)     
+        self    = help_fun.set_compiled_values(self,self.compile_aliases(inputs),converted_values)
+    
+    def compile_aliases(self,outputs):
+        """Resolves the aliases of inputs, objectives or constraints into the paths to their values once,
+            and keeps them for the following calls.
+    
+            Assumptions:
+            The aliases are compiled again if the aliases list is replaced, or if the keys under one of
+            their wildcards change, e.g. when configurations are added
+    
+            Source:
+            N/A
+    
+            Inputs:
+            outputs            [array]
+    
+            Outputs:
+            compiled           [list]
+    
+            Properties Used:
+            self.compiled_aliases
+        """
+        
+        aliases  = self.optimization_problem.aliases
+        compiled = self.compiled_aliases
+        if compiled is None or compiled.aliases is not aliases:
+            compiled = Data(aliases=aliases,pointers=dict())
+            self.compiled_aliases = compiled
+            
+        names = tuple(np.array(outputs)[:,0].tolist())
+        entry = compiled.pointers.get(names)
+        if entry is not None and entry[1] and help_fun.wildcard_keys(self,entry[1]) != entry[2]:
+            entry = None
+        if entry is None:
+            parents = help_fun.wildcard_parents(outputs,aliases)
+            keys    = help_fun.wildcard_keys(self,parents)
+            entry   = (help_fun.compile_pointers(self,outputs,aliases),parents,keys)
+            compiled.pointers[names] = entry
+            
+        return entry[0]
     
     def constraints_individual(self,x = None):
         """Put's the values of the problem in the right place.
@@ -346,29 +518,36 @@ class Nexus(Data):
         """           
         pass     
 
-    def finite_difference(self,x,diff_interval=1e-8):
-        """Finite difference gradients and jacobians of the problem.
+    def finite_difference(self,x,diff_interval=1e-8,central=None,processes=None):
+        """Finite difference gradients and jacobians of the problem. The perturbed points can be run
+            at the same time on a pool of processes.
     
             Assumptions:
-            N/A
+            Forked processes start from a copy of the nexus, other platforms get a pickled copy
+            The points run by the pool are not counted or cached in this nexus
     
             Source:
             N/A
     
             Inputs:
             x                  [vector]
-            diff_interval      [float]
+            diff_interval      step, one for all or one per input [float or vector]
+            central            central differences, None for self.finite_difference_central [boolean]
+            processes          processes in the pool, None for self.finite_difference_processes [int]
     
             Outputs:
             grad_obj           [vector]
             jac_con            [array]
     
             Properties Used:
-            None
+            self.finite_difference_central
+            self.finite_difference_processes
         """           
         
-        obj = self.objective(x)
-        con = self.all_constraints(x)
+        if central is None:
+            central = self.finite_difference_central
+        if processes is None:
+            processes = self.finite_difference_processes
         
         inpu  = self.optimization_problem.inputs
         const = self.optimization_problem.constraints
@@ -376,21 +555,45 @@ class Nexus(Data):
         inplen = len(inpu)
         conlen = len(const)
         
-        grad_obj = np.zeros(inplen)
-        jac_con  = np.zeros((inplen,conlen))
-        
-        con2 = (con*np.ones_like(jac_con))
+        x    = np.asarray(x)*1.0
+        step = np.ones(inplen)*diff_interval
         
+        # The points to run, forward differences against the unperturbed point
+        points = []
         for ii in range(0,inplen):
-            newx     = np.asarray(x)*1.0
-            newx[ii] = newx[ii] + diff_interval
-            
-            grad_obj[ii]  = self.objective(newx)
-            jac_con[ii,:] = self.all_constraints(newx)
+            newx     = x*1.0
+            newx[ii] = newx[ii] + step[ii]
+            points.append(newx)
+        if central:
+            for ii in range(0,inplen):
+                newx     = x*1.0
+                newx[ii] = newx[ii] - step[ii]
+                points.append(newx)
+        else:
+            obj = self.objective(x)
+            con = self.all_constraints(x)
         
-        grad_obj = (grad_obj - obj)/diff_interval
+        if processes == 1:
+            values = [evaluate_point(self,newx) for newx in points]
+        else:
+            values = evaluate_points(self,points,processes)
         
-        jac_con = (jac_con - con2).T/diff_interval
+        grad_obj = np.zeros(inplen)
+        jac_con  = np.zeros((inplen,conlen))
+        for ii in range(0,inplen):
+            grad_obj[ii]  = values[ii][0]
+            jac_con[ii,:] = values[ii][1]
+        
+        if central:
+            for ii in range(0,inplen):
+                grad_obj[ii]  = grad_obj[ii]  - values[inplen+ii][0]
+                jac_con[ii,:] = jac_con[ii,:] - values[inplen+ii][1]
+            grad_obj = grad_obj/(2.*step)
+            jac_con  = jac_con.T/(2.*step)
+        else:
+            con2     = (con*np.ones_like(jac_con))
+            grad_obj = (grad_obj - obj)/step
+            jac_con  = (jac_con - con2).T/step
         
         grad_obj = grad_obj.astype(float)
         jac_con  = jac_con.astype(float)
@@ -398,6 +601,54 @@ class Nexus(Data):
         return grad_obj, jac_con
     
     
+    def evaluate_batch(self,X,executor=None,processes=None):
+        """Runs the problem at a set of design points and returns the objective and constraint values
+            of each, as objective and all_constraints do. The points are run one after the other, on
+            threads, on a pool of processes, or by any executor with a map method.
+    
+            Assumptions:
+            Each thread runs its own copy of the nexus
+            Forked processes start from a copy of the nexus, other platforms get a pickled copy
+            Only the serial points are counted and cached in this nexus
+    
+            Source:
+            N/A
+    
+            Inputs:
+            X                  scaled design points, one per row [array]
+            executor           'serial', 'thread', 'process' or an executor, None for self.batch_executor
+            processes          threads or processes, None for self.batch_processes [int]
+    
+            Outputs:
+            obj                scaled objectives, one row per point [array]
+            con                scaled constraints, one row per point [array]
+    
+            Properties Used:
+            self.batch_executor
+            self.batch_processes
+        """
+        
+        if executor is None:
+            executor = self.batch_executor
+        if processes is None:
+            processes = self.batch_processes
+            
+        points = [np.asarray(x)*1.0 for x in np.atleast_2d(np.array(X,dtype=float))]
+        
+        if executor == 'serial':
+            values = [evaluate_point(self,x) for x in points]
+        elif executor == 'thread':
+            values = evaluate_thread_points(self,points,processes)
+        elif executor == 'process':
+            values = evaluate_points(self,points,processes)
+        else:
+            values = list(executor.map(partial(evaluate_point,self),points))
+            
+        obj = np.array([np.atleast_1d(value[0]) for value in values],dtype=float)
+        con = np.array([np.atleast_1d(value[1]) for value in values],dtype=float)
+        
+        return obj, con
+    
     def translate(self,x = None):
         """Make a pretty table view of the problem with objective and constraints at the current inputs
     
@@ -439,7 +690,157 @@ class Nexus(Data):
         print(const_table)
         
         return inpu,const_table
-                               
-        
-    
- 
+
+
+# ----------------------------------------------------------------------
+#  Finite Difference Points
+# ----------------------------------------------------------------------
+
+# the nexus of the worker processes
+pool_nexus = None
+
+## @ingroup Optimization
+def evaluate_point(nexus,x):
+    """Runs a nexus at one point for the finite differences.
+
+        Assumptions:
+        N/A
+
+        Source:
+        N/A
+
+        Inputs:
+        nexus              [Nexus()]
+        x                  [vector]
+
+        Outputs:
+        obj                [vector]
+        con                [vector]
+
+        Properties Used:
+        None
+    """
+
+    obj = nexus.objective(x)
+    con = nexus.all_constraints(x)
+
+    return obj, con
+
+## @ingroup Optimization
+def evaluate_points(nexus,points,processes):
+    """Runs a nexus at many points on a pool of processes. Where processes can be forked the workers
+        start from the nexus as it is, otherwise the nexus is pickled to each of them once.
+
+        Assumptions:
+        N/A
+
+        Source:
+        N/A
+
+        Inputs:
+        nexus              [Nexus()]
+        points             [list of vectors]
+        processes          None for all the cores [int]
+
+        Outputs:
+        values             (obj, con) of each point [list]
+
+        Properties Used:
+        None
+    """
+
+    global pool_nexus
+
+    if 'fork' in multiprocessing.get_all_start_methods():
+        pool_nexus = nexus
+        try:
+            with multiprocessing.get_context('fork').Pool(processes) as pool:
+                values = pool.map(evaluate_pool_point,points,chunksize=1)
+        finally:
+            pool_nexus = None
+    else:
+        with multiprocessing.Pool(processes,initializer=initialize_pool,initargs=(nexus,)) as pool:
+            values = pool.map(evaluate_pool_point,points,chunksize=1)
+
+    return values
+
+## @ingroup Optimization
+def evaluate_thread_points(nexus,points,threads):
+    """Runs a nexus at many points on a pool of threads. Each thread makes its own copy of the nexus
+        the first time, since running a point changes the nexus.
+
+        Assumptions:
+        N/A
+
+        Source:
+        N/A
+
+        Inputs:
+        nexus              [Nexus()]
+        points             [list of vectors]
+        threads            None for the default of ThreadPoolExecutor [int]
+
+        Outputs:
+        values             (obj, con) of each point [list]
+
+        Properties Used:
+        None
+    """
+
+    local = threading.local()
+    lock  = threading.Lock()
+
+    def evaluate_thread_point(x):
+        if not hasattr(local,'nexus'):
+            with lock:
+                local.nexus = deepcopy(nexus)
+        return evaluate_point(local.nexus,x)
+
+    with ThreadPoolExecutor(threads) as pool:
+        values = list(pool.map(evaluate_thread_point,points))
+
+    return values
+
+def initialize_pool(nexus):
+    """Sets the nexus of a worker process.
+
+        Assumptions:
+        N/A
+
+        Source:
+        N/A
+
+        Inputs:
+        nexus              [Nexus()]
+
+        Outputs:
+        None
+
+        Properties Used:
+        None
+    """
+
+    global pool_nexus
+    pool_nexus = nexus
+
+def evaluate_pool_point(x):
+    """Runs the nexus of a worker process at one point.
+
+        Assumptions:
+        N/A
+
+        Source:
+        N/A
+
+        Inputs:
+        x                  [vector]
+
+        Outputs:
+        obj                [vector]
+        con                [vector]
+
+        Properties Used:
+        None
+    """
+
+    return evaluate_point(pool_nexus,x)
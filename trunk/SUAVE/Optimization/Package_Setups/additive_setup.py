@@ -5,6 +5,7 @@
 # Modified: Jun 2017, T. MacDonald
 #           Oct 2019, T. MacDonald
 #           Jun 2020, M. Clarke
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -18,8 +19,6 @@ try:
     import pyOpt.pyALPSO
 except:
     pass
-import sklearn
-from sklearn import gaussian_process
 from SUAVE.Optimization import helper_functions as help_fun
 from SUAVE.Methods.Utilities.latin_hypercube_sampling import latin_hypercube_sampling
 from scipy.stats import norm
@@ -107,6 +106,8 @@ class Additive_Solver():
                 f[level-1,ii]    = res[0]  # objective value
                 g[level-1,ii,:]  = res[1]  # constraints vector
         
+        from sklearn import gaussian_process
+        
         converged = False
         
         for kk in range(max_iterations):
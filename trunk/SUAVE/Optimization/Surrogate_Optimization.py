@@ -3,6 +3,7 @@
 #
 #Created:  Jul 2016, M. Vegh
 #Modified: Feb 2017, M. Vegh
+#          Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -107,12 +108,8 @@ class Surrogate_Optimization(Data):
             npoints = self.number_of_points
             Xsample = self.sample_plan(scaled_bounds,npoints)
     
-            #now run; results will be written to file, which can be read later
-            for i in range(0,npoints):
-        
-                opt_prob.inputs[:,1] = Xsample[i,:]*scl#/base_units
-            
-                problem.objective()
+            #now run, all the points at once; results will be written to file, which can be read later
+            problem.evaluate_batch(Xsample)
         return 
         
         
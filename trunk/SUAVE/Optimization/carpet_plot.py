@@ -3,6 +3,7 @@
 #
 # Created : Feb 2016, M. Vegh 
 # Modified : Feb 2017, M. Vegh
+#            Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -10,7 +11,6 @@
  
 from SUAVE.Core import Data
 import numpy as np
-import matplotlib.pyplot as plt
 
 # ----------------------------------------------------------------------
 #  carpet_plot
@@ -22,7 +22,7 @@ def carpet_plot(problem, number_of_points,  plot_obj=1, plot_const=0, sweep_inde
         sweep_index_0, sweep_index_1 is index of variables you want to run carpet plot (i.e. sweep_index_0=0 means you want to sweep first variable, sweep_index_0 = 4 is the 5th variable)
     
         Assumptions:
-        N/A
+        The points are run with problem.evaluate_batch, see problem.batch_executor
     
         Source:
         N/A
@@ -73,16 +73,21 @@ def carpet_plot(problem, number_of_points,  plot_obj=1, plot_const=0, sweep_inde
     inputs[1,:] = np.linspace(bnd[idx1][0], bnd[idx1][1], number_of_points)
 
     
-    #inputs defined; now run sweep
+    #inputs defined; now run sweep, all the points at once
+    X = np.tile(np.array(base_inputs[:,1]/scl,dtype=float),(number_of_points*number_of_points,1))
     for i in range(0, number_of_points):
         for j in range(0,number_of_points):
-            #problem.optimization_problem.inputs=base_inputs  #overwrite any previous modification
-            opt_prob.inputs[:,1][idx0]= inputs[0,i]
-            opt_prob.inputs[:,1][idx1]= inputs[1,j]
-
-            obj[j,i]             = problem.objective()*obj_scaling
-            constraint_val[:,j,i]= problem.all_constraints().tolist()
+            X[i*number_of_points+j,idx0] = inputs[0,i]/scl[idx0]
+            X[i*number_of_points+j,idx1] = inputs[1,j]/scl[idx1]
+            
+    batch_obj, batch_con = problem.evaluate_batch(X)
+    for i in range(0, number_of_points):
+        for j in range(0,number_of_points):
+            obj[j,i]             = batch_obj[i*number_of_points+j,0]*obj_scaling
+            constraint_val[:,j,i]= batch_con[i*number_of_points+j,:]
   
+    import matplotlib.pyplot as plt
+
     if plot_obj==1:
         plt.figure(0)
         CS = plt.contourf(inputs[0,:],inputs[1,:], obj, linewidths=2)
@@ -3,14 +3,19 @@
 # 
 # Created:  May 2015, E. Botero
 # Modified: Feb 2015, M. Vegh
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------        
 #   Imports
 # ----------------------------------------------------------------------    
 
 import numpy as np
+import re
 from SUAVE.Core import Data
 
+# a path that can be followed without eval, keys and indices at the end
+simple_path = re.compile(r'^[A-Za-z_]\w*(\.[A-Za-z_]\w*)*(\[-?\d+\])*$')
+
 # ----------------------------------------------------------------------        
 #   Set_values
 # ----------------------------------------------------------------------    
@@ -177,6 +182,238 @@ def convert_values(inputs):
     return converted_values
 
 
+# ----------------------------------------------------------------------        
+#   Compiled Pointers
+# ----------------------------------------------------------------------  
+
+## @ingroup Optimization
+def compile_pointers(dictionary,outputs,aliases):
+    """ Resolves the aliases of inputs or outputs once, so their values can be set and retrieved
+        without matching names, splitting strings or eval on every call. Wildcards are expanded
+        with the keys of the dictionary as it is now.
+
+    Assumptions:
+    The pointers are compiled again when the keys under a wildcard change, see wildcard_keys
+
+    Source:
+    N/A
+
+    Inputs:
+    dictionary       [Data()]
+    outputs          [array]
+    aliases          [list of str]
+
+    Outputs:
+    compiled         paths of each output, (keys, indices, path) [list]
+
+    Properties Used:
+    N/A
+    """
+    
+    names = np.array(outputs)[:,0]
+    
+    # Correspond aliases to outputs
+    pointer = []
+    for ii in range(0,len(names)):
+        for jj in range(0,len(aliases)):
+            if names[ii] == aliases[jj][0]:
+                pointer.append(aliases[jj][1])
+    
+    compiled = []
+    for ii in range(0,len(pointer)):
+        pointers = pointer[ii]
+        if isinstance(pointers,str):
+            pointers = [pointers]
+        paths = []
+        for path in pointers:
+            if '*' in path:
+                paths.extend(find_a_star(dictionary,path))
+            else:
+                paths.append(path)
+        compiled.append([compile_path(path) for path in paths])
+        
+    return compiled
+
+## @ingroup Optimization
+def wildcard_parents(outputs,aliases):
+    """ Finds the paths of the dictionaries whose keys the wildcards of the aliases of outputs are expanded
+        with, see find_a_star.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    outputs          [array]
+    aliases          [list of str]
+
+    Outputs:
+    parents          keys of each dictionary [list of tuples of str]
+
+    Properties Used:
+    N/A
+    """
+    
+    names   = np.array(outputs)[:,0]
+    parents = []
+    for alias in aliases:
+        if not alias[0] in names:
+            continue
+        pointers = alias[1]
+        if isinstance(pointers,str):
+            pointers = [pointers]
+        for path in pointers:
+            if '*' in path:
+                splitstring = path.split('.')
+                lastindex   = max([ii for ii in range(len(splitstring)) if '*' in splitstring[ii]])
+                parents.append(tuple(splitstring[0:lastindex]))
+                
+    return parents
+
+## @ingroup Optimization
+def wildcard_keys(dictionary,parents):
+    """ The keys that wildcards are expanded with now, to tell when compiled pointers are out of date.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    dictionary       [Data()]
+    parents          [list], see wildcard_parents
+
+    Outputs:
+    keys             [tuple]
+
+    Properties Used:
+    N/A
+    """
+    
+    keys = []
+    for parent in parents:
+        if any(['[' in k for k in parent]):
+            data = eval('.'.join(('dictionary',) + parent))
+        else:
+            data = dictionary
+            for k in parent:
+                data = data[k]
+        keys.append(tuple(data.keys()))
+        
+    return tuple(keys)
+
+## @ingroup Optimization
+def compile_path(path):
+    """ Splits a path into its keys and the indices at the end, e.g. wings.main_wing.origin[0]. Paths
+        that are not that simple get no keys and are left to deep_set and eval.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    path             [str]
+
+    Outputs:
+    keys             [tuple of str]
+    indices          [tuple of int]
+    path             [str]
+
+    Properties Used:
+    N/A
+    """
+    
+    if not simple_path.match(path):
+        return None, (), path
+    
+    splitkey = path.split('[')
+    keys     = tuple(splitkey[0].split('.'))
+    indices  = tuple([int(index[:-1]) for index in splitkey[1:]])
+    
+    return keys, indices, path
+
+## @ingroup Optimization
+def set_compiled_values(dictionary,compiled,converted_values):
+    """ Sets the values of inputs through pointers from compile_pointers, see set_values.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    dictionary       [Data()]
+    compiled         [list]
+    converted_values [array]
+
+    Outputs:
+    dictionary       [Data()]
+
+    Properties Used:
+    N/A
+    """
+    
+    for ii in range(0,len(compiled)):
+        value = converted_values[ii]
+        for keys, indices, path in compiled[ii]:
+            if keys is None:
+                dictionary.deep_set(path,value)
+                continue
+            data = dictionary
+            for k in keys[:-1]:
+                data = data[k]
+            if indices:
+                thing = data[keys[-1]]
+                for index in indices[:-1]:
+                    thing = thing[index]
+                thing[indices[-1]] = value
+            else:
+                data[keys[-1]] = value
+            
+    return dictionary
+
+## @ingroup Optimization
+def get_compiled_values(dictionary,compiled):
+    """ Retrieves the values of outputs through pointers from compile_pointers, see get_values.
+
+    Assumptions:
+    An output with many paths takes the value of the first
+
+    Source:
+    N/A
+
+    Inputs:
+    dictionary       [Data()]
+    compiled         [list]
+
+    Outputs:
+    values           [array]
+
+    Properties Used:
+    N/A
+    """
+    
+    values = np.zeros(len(compiled))
+    for ii in range(0,len(compiled)):
+        keys, indices, path = compiled[ii][0]
+        if keys is None:
+            values[ii] = eval('dictionary.'+path)
+            continue
+        value = dictionary
+        for k in keys:
+            value = getattr(value,k)
+        for index in indices:
+            value = value[index]
+        values[ii] = value
+        
+    return values
+
 # ----------------------------------------------------------------------        
 #   Get
 # ----------------------------------------------------------------------  
@@ -3,6 +3,7 @@
 #
 # Created  : Oct 2017, M. Vegh 
 # Modified : Nov 2017, M. Vegh
+#            Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -10,7 +11,6 @@
  
 from SUAVE.Core import Data
 import numpy as np
-import matplotlib.pyplot as plt
 
 # ----------------------------------------------------------------------
 #  line_plot
@@ -23,7 +23,7 @@ def line_plot(problem, number_of_points,  plot_obj=1, plot_const=1, sweep_index=
     sweep_index. i.e. sweep_index=0 means you want to sweep the first variable, sweep_index = 4 is the 5th variable)
     
         Assumptions:
-        N/A
+        The points are run with problem.evaluate_batch, see problem.batch_executor
     
         Source:
         N/A
@@ -76,13 +76,16 @@ def line_plot(problem, number_of_points,  plot_obj=1, plot_const=1, sweep_index=
  
 
     
-    #inputs defined; now run sweep
-    for i in range(0, number_of_points):
-        opt_prob.inputs[:,1][idx0]= inputs[0,i]
-   
-        obj[i]             = problem.objective()*obj_scaling
-        constraint_val[:,i]= problem.all_constraints().tolist()
+    #inputs defined; now run sweep, all the points at once
+    X         = np.tile(np.array(base_inputs[:,1]/scl,dtype=float),(number_of_points,1))
+    X[:,idx0] = inputs[0,:]/scl[idx0]
+    
+    batch_obj, batch_con = problem.evaluate_batch(X)
+    obj[:]               = batch_obj[:,0]*obj_scaling
+    constraint_val[:,:]  = batch_con.T
   
+    import matplotlib.pyplot as plt
+
     if plot_obj==1:
         plt.figure(0)
         plt.plot(inputs[0,:], obj, lw = 2)
@@ -4,8 +4,7 @@
 
 
 from .load_plugin import load_plugin
-# these packages are imported by temporarily modifying
-# the python path to account for potential absolute
-# package imports
-
-pint = load_plugin('pint')
\ No newline at end of file
+# pint only uses relative imports, so it is imported as
+# SUAVE.Plugins.pint directly, load_plugin would import
+# a second copy of it as the top level pint package
+from . import pint
\ No newline at end of file
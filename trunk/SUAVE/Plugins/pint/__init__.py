@@ -12,29 +12,21 @@
     :license: BSD, see LICENSE for more details.
 """
 from __future__ import with_statement
-import os
-import subprocess
-import pkg_resources
 from .unit import UnitRegistry, DimensionalityError, UndefinedUnitError
 from .util import formatter, pi_theorem, logger
 from .measurement import Measurement
 from .context import Context
 
-_DEFAULT_REGISTRY = UnitRegistry()
+# the default registry is only needed to unpickle quantities, it is built on first use
+_DEFAULT_REGISTRY = None
 
+# the bundled copy is not versioned on its own, probing git or setuptools here made every import slow
 __version__ = "unknown"
-try:  # try to grab the commit version of our package
-    __version__ = (subprocess.check_output(["git", "describe"],
-                                           stderr=subprocess.STDOUT,
-                                           cwd=os.path.dirname(os.path.abspath(__file__)))).strip()
-except:  # on any error just try to grab the version that is installed on the system
-    try:
-        __version__ = pkg_resources.get_distribution('pint').version
-    except:
-        pass  # we seem to have a local copy without any repository control or installed without setuptools
-              # so the reported version will be __unknown__  
 
 def _build_quantity(value, units):
+    global _DEFAULT_REGISTRY
+    if _DEFAULT_REGISTRY is None:
+        _DEFAULT_REGISTRY = UnitRegistry()
     return _DEFAULT_REGISTRY.Quantity(value, units)
 
 
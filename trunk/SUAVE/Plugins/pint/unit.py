@@ -16,7 +16,6 @@ import copy
 import math
 import itertools
 import functools
-import pkg_resources
 from decimal import Decimal
 from contextlib import contextmanager
 from io import open
@@ -420,7 +419,7 @@ class UnitRegistry(object):
         self.default_to_delta = default_to_delta
 
         if filename == '':
-            data = pkg_resources.resource_filename(__name__, 'default_en.txt')
+            data = os.path.join(os.path.dirname(__file__), 'default_en.txt')
             self.load_definitions(data, True)
         elif filename is not None:
             self.load_definitions(filename)
@@ -643,7 +642,7 @@ class UnitRegistry(object):
                 continue
             if line.startswith('@import'):
                 if is_resource:
-                    path = pkg_resources.resource_filename(__name__, line[7:].strip())
+                    path = os.path.join(os.path.dirname(__file__), line[7:].strip())
                 else:
                     try:
                         path = os.path.dirname(file.name)
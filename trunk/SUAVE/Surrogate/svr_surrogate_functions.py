@@ -2,7 +2,7 @@
 # svr_surrogate_functions.py
 #
 # Created:  May 2016, M. Vegh
-# Modified:
+# Modified: Oct 2026, SUAVE Team
 
 
 # ----------------------------------------------------------------------
@@ -11,7 +11,6 @@
 
 
 from SUAVE.Core import Data
-from sklearn import svm
 from .Surrogate_Problem import Surrogate_Problem
 
 import numpy as np
@@ -44,7 +43,7 @@ def build_svr_models(obj_values, inputs, constraints, kernel = 'rbf', C = 1E5, e
     
     """
     
-    
+    from sklearn import svm
     
     #now build surrogates based on these
     t1=time.time()
@@ -85,6 +84,7 @@ def check_svr_accuracy(x, data_inputs, data_outputs, imin = -1): #set up so you
     output       [float]
     """
     
+    from sklearn import svm
 
    # x is the set of inputs that you have option to optimize over
     #imin is index you want to leave out (default is last entry
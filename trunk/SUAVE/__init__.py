@@ -1,5 +1,6 @@
 # SUAVE/__init__.py
 #
+# Modified: Oct 2026, SUAVE Team
 
 """ SUAVE Package Setup
 """
@@ -8,19 +9,93 @@
 #  IMPORT!!
 # ----------------------------------------------------------------------
 
-# packages
-from . import Plugins
-from . import Core
-from . import Components
-from . import Analyses
-from . import Methods
-from . import Attributes
-from . import Optimization
-from . import Input_Output
-from . import Plots
+import sys
+from importlib import import_module
+from types import ModuleType
 
-# the vehicle class
-from .Vehicle import Vehicle
+# packages, imported on first access
+packages = ['Plugins',
+            'Core',
+            'Components',
+            'Analyses',
+            'Methods',
+            'Attributes',
+            'Optimization',
+            'Input_Output',
+            'Plots']
 
 from warnings import simplefilter
 simplefilter('ignore')
+
+
+# ----------------------------------------------------------------------
+#  Lazy Package
+# ----------------------------------------------------------------------
+
+class Lazy_Package(ModuleType):
+    """ The SUAVE package, which imports its packages and the vehicle class when
+        they are first used, so that import SUAVE only loads what a script needs
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+    """
+
+    def __getattr__(self,name):
+        """ Imports a package, or the vehicle class, on first access
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        name    - package name or Vehicle
+
+        Outputs:
+        package module or the vehicle class
+
+        Properties Used:
+        N/A
+        """
+        if name == 'Vehicle':
+            # the components import the vehicle module through the configs
+            import_module('.Components',self.__name__)
+            return import_module('.Vehicle',self.__name__).Vehicle
+
+        if name in packages:
+            return import_module('.' + name,self.__name__)
+
+        raise AttributeError("module '" + self.__name__ + "' has no attribute '" + name + "'")
+
+    def __setattr__(self,name,value):
+        """ Keeps the vehicle class as SUAVE.Vehicle when the SUAVE.Vehicle module
+        is imported, as the import binds the module to the package
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        name    - attribute name
+        value   - attribute value
+
+        Outputs:
+        None
+
+        Properties Used:
+        N/A
+        """
+        if name == 'Vehicle' and isinstance(value,ModuleType):
+            value = value.Vehicle
+        ModuleType.__setattr__(self,name,value)
+
+    def __dir__(self):
+        return sorted(set(ModuleType.__dir__(self) + packages + ['Vehicle']))
+
+sys.modules[__name__].__class__ = Lazy_Package